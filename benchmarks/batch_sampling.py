@@ -0,0 +1,52 @@
+# batch_sampling.py
+# sample_star_batch（まとめて抽出）の処理速度を計測する
+#
+# 使い方:
+#   python benchmarks/batch_sampling.py --sets 1000000 --count 5
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from story_corpus import load_corpus, sample_star_batch, sample_stars
+
+
+def main():
+    parser = argparse.ArgumentParser(description="まとめて抽出の処理速度を計測")
+    parser.add_argument("--sets", type=int, default=1_000_000)
+    parser.add_argument("--count", type=int, default=5)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    n_stars = corpus.n_stars
+
+    best = None
+    for run in range(args.runs):
+        start = time.perf_counter()
+        star_ids = sample_star_batch(n_stars, args.sets, args.count, seed=run)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # 各行に重複が無いことを確認
+    sorted_ids = np.sort(star_ids, axis=1)
+    assert not (np.diff(sorted_ids, axis=1) == 0).any()
+
+    print(f"sample_star_batch: {args.sets:,}組 × {args.count}個 "
+          f"{best * 1000:.1f} ms ({args.sets / best:,.0f} 組/秒)")
+
+    # 比較用: 1組ずつ抽出した場合
+    loops = 100_000
+    start = time.perf_counter()
+    for _ in range(loops):
+        sample_stars(n_stars, args.count)
+    elapsed = time.perf_counter() - start
+    print(f"sample_stars（1組ずつ）: {loops / elapsed:,.0f} 組/秒")
+
+
+if __name__ == "__main__":
+    main()
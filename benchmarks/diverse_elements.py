@@ -0,0 +1,57 @@
+# diverse_elements.py
+# 似た物語要素を避ける抽出（MMR）の、TF-IDF ベクトルの作成時間・抽出の処理速度・効果を計測する
+#
+# 使い方:
+#   python benchmarks/diverse_elements.py --count 5 --loops 2000
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from story_corpus import SOURCE_PATH, load_corpus, sample_diverse_stars, sample_stars
+from story_corpus.diversity import build_star_vectors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="似た物語要素を避ける抽出の処理速度と効果を計測")
+    parser.add_argument("--count", type=int, default=5, help="1回に抽出する物語要素の数")
+    parser.add_argument("--loops", type=int, default=2000)
+    args = parser.parse_args()
+
+    with open(SOURCE_PATH, "r", encoding="utf-8") as f:
+        story_elements = json.load(f)
+    start = time.perf_counter()
+    offsets, _, values = build_star_vectors(story_elements)
+    elapsed = time.perf_counter() - start
+    print(f"TF-IDF ベクトルの作成: {elapsed * 1000:.0f} ms（{len(offsets) - 1}個の2-gram、非ゼロ {len(values)}個）")
+
+    corpus = load_corpus()
+    start = time.perf_counter()
+    vectors = corpus.star_vectors
+    print(f"ベクトルの読み込み: {(time.perf_counter() - start) * 1000:.1f} ms（{corpus.n_stars}個の★）")
+
+    def max_similarity(star_ids):
+        return max((vectors.similarities(a)[b] for a in star_ids for b in star_ids if a < b), default=0.0)
+
+    for diversity in (0.0, 0.3, 0.5, 0.8):
+        if diversity > 0:
+            def sample(seed):
+                return sample_diverse_stars(vectors, args.count, diversity, seed=seed)
+        else:
+            def sample(seed):
+                return sample_stars(corpus.n_stars, args.count, seed=seed)
+        start = time.perf_counter()
+        draws = [sample(seed) for seed in range(args.loops)]
+        elapsed = (time.perf_counter() - start) / args.loops
+        similarities = [max_similarity(star_ids) for star_ids in draws]
+        same_item = sum(len({corpus.star_item(j) for j in star_ids}) < len(star_ids) for star_ids in draws)
+        print(f"diversity={diversity:.1f}: {elapsed * 1000:.3f} ms/回、"
+              f"組内の最大類似度の平均 {sum(similarities) / len(similarities):.4f}、"
+              f"同じ項目の★を含む組 {same_item}/{args.loops}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# near_duplicates.py
+# ほぼ重複する★のクラスタの作成時間と、「1クラスタから1個まで」の抽出の処理速度を計測する
+#
+# 使い方:
+#   python benchmarks/near_duplicates.py --count 5 --loops 100000
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from story_corpus import (
+    SOURCE_PATH,
+    distribution_table,
+    load_corpus,
+    sample_alias_stars,
+    sample_genre_stars,
+    sample_stars,
+)
+from story_corpus.clusters import build_star_clusters
+
+
+def measure(sample, loops):
+    start = time.perf_counter()
+    for _ in range(loops):
+        sample()
+    return (time.perf_counter() - start) / loops
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ほぼ重複する★のクラスタと抽出の処理速度を計測")
+    parser.add_argument("--count", type=int, default=5, help="1回に抽出する物語要素の数")
+    parser.add_argument("--loops", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with open(SOURCE_PATH, "r", encoding="utf-8") as f:
+        story_elements = json.load(f)
+    start = time.perf_counter()
+    clusters = build_star_clusters(story_elements)
+    elapsed = time.perf_counter() - start
+    sizes = {}
+    for cluster in clusters:
+        sizes[cluster] = sizes.get(cluster, 0) + 1
+    multi = [size for size in sizes.values() if size > 1]
+    print(f"クラスタの作成（MinHash/LSH）: {elapsed * 1000:.0f} ms "
+          f"（{len(multi)}個のクラスタ、{sum(multi)}個の★）")
+
+    corpus = load_corpus()
+    clusters = corpus.star_clusters
+    genre_ids = corpus.genre_star_ids("genre_sf")
+    items_table = distribution_table(corpus, "items")
+    rng = random.Random(1)
+
+    samplers = [
+        ("sample_stars", lambda c: sample_stars(corpus.n_stars, args.count, seed=rng, clusters=c)),
+        ("sample_genre_stars（SF、0.7）",
+         lambda c: sample_genre_stars(corpus.n_stars, genre_ids, args.count, 0.7, seed=rng, clusters=c)),
+        ("sample_alias_stars（items）", lambda c: sample_alias_stars(items_table, args.count, seed=rng, clusters=c)),
+    ]
+    for label, sample in samplers:
+        plain = measure(lambda: sample(None), args.loops)
+        distinct = measure(lambda: sample(clusters), args.loops)
+        print(f"{label}: {plain * 1e6:.2f} µs/回 → 1クラスタから1個まで {distinct * 1e6:.2f} µs/回")
+
+
+if __name__ == "__main__":
+    main()
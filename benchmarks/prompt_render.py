@@ -0,0 +1,77 @@
+# prompt_render.py
+# プロンプト生成（build_*_prompt）の処理速度を計測する
+#
+# Web版は、従来どおり呼び出しのたびに部品を format して連結する方法とも比べる。
+#
+# 使い方:
+#   python benchmarks/prompt_render.py --count 5 --loops 100000
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from story_corpus import (
+    PROMPT_TEXTS,
+    build_desktop_prompt,
+    build_shortshort_prompt,
+    build_web_prompt,
+    load_corpus,
+    sample_elements,
+)
+
+
+def build_web_prompt_format(elements, word_count, story_style, ending_style, lang):
+    """比較用: 呼び出しのたびにテンプレートを format する方法"""
+    t = PROMPT_TEXTS[lang]
+    prompt = t["prompt_header"]
+    prompt += t["prompt_basic_settings"]
+    prompt += t["prompt_word_count"].format(count=word_count)
+    prompt += t["prompt_genre"].format(genre=story_style)
+    prompt += t["prompt_ending"].format(ending=ending_style)
+    prompt += t["prompt_elements_header"]
+    for i, (item, star) in enumerate(elements, 1):
+        prompt += f"{i}. {item} {star}\n"
+    prompt += t["prompt_instructions_header"]
+    prompt += t["prompt_instructions"].format(genre=story_style, ending=ending_style)
+    return prompt
+
+
+def measure(build, loops, runs):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        for _ in range(loops):
+            build()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / loops
+
+
+def main():
+    parser = argparse.ArgumentParser(description="プロンプト生成の処理速度を計測")
+    parser.add_argument("--count", type=int, default=5, help="物語要素の数")
+    parser.add_argument("--loops", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    elements = sample_elements(load_corpus(), args.count, seed=1)
+    t = PROMPT_TEXTS["ja"]
+    genre, ending = t["genre_sf"], t["ending_happy"]
+    assert build_web_prompt(elements, 800, genre, ending, "ja") == \
+        build_web_prompt_format(elements, 800, genre, ending, "ja")
+
+    builders = [
+        ("build_desktop_prompt", lambda: build_desktop_prompt(elements, 1000, ["アキラ", "ミナ"])),
+        ("build_web_prompt", lambda: build_web_prompt(elements, 800, genre, ending, "ja")),
+        ("build_web_prompt（format 方式）", lambda: build_web_prompt_format(elements, 800, genre, ending, "ja")),
+        ("build_shortshort_prompt", lambda: build_shortshort_prompt(elements, 1200)),
+    ]
+    for label, build in builders:
+        per_call = measure(build, args.loops, args.runs)
+        print(f"{label}: {per_call * 1e6:.2f} µs/件 ({1 / per_call:,.0f} 件/秒)")
+
+
+if __name__ == "__main__":
+    main()
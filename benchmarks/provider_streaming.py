@@ -0,0 +1,164 @@
+# provider_streaming.py
+# ストリーミング受信（providers.py の stream()）の確認と、最初の断片が届くまでの時間の計測
+#
+# ローカルに4種類のAPIの Server-Sent Events を模したスタブサーバーを立て、
+#   - 受信した断片をつなげた本文が元の本文と一致すること
+#   - 最初の断片が届くまでの時間（TTFT）と、全文を受け取るまでの時間
+# を表示する。一括受信（complete()）の待ち時間も比較のために表示する。
+#
+# 使い方:
+#   python benchmarks/provider_streaming.py --delay 0.02
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shortshort"))
+import providers
+
+# 断片の区切りでUTF-8の文字が分断される場合も含めて確認する
+STORY_CHUNKS = ["『最後の", "合言葉』\n\n", "扉の前で、", "男は小さく", "つぶやいた。", "😀", "「開け」"]
+STORY = "".join(STORY_CHUNKS)
+
+
+def claude_events(chunk):
+    payload = {"type": "content_block_delta", "index": 0,
+               "delta": {"type": "text_delta", "text": chunk}}
+    return f"event: content_block_delta\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+def chat_events(chunk):
+    payload = {"choices": [{"index": 0, "delta": {"content": chunk}}]}
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+def gemini_events(chunk):
+    payload = {"candidates": [{"content": {"parts": [{"text": chunk}], "role": "model"}}]}
+    # Gemini は CRLF で区切る
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\r\n\r\n"
+
+
+STREAM_FORMATS = {
+    "claude": (
+        "event: message_start\ndata: {\"type\": \"message_start\"}\n\n: ping\n\n",
+        claude_events,
+        "event: message_stop\ndata: {\"type\": \"message_stop\"}\n\n",
+    ),
+    "grok": ("", chat_events, "data: [DONE]\n\n"),
+    "openai": ("data: {\"choices\": [{\"delta\": {\"role\": \"assistant\"}}]}\n\n", chat_events, "data: [DONE]\n\n"),
+    # Gemini は終わりのイベントを送らず、最後の断片に finishReason を付ける
+    "gemini": (
+        "",
+        gemini_events,
+        "data: {\"candidates\": [{\"content\": {\"parts\": [{\"text\": \"\"}]}, \"finishReason\": \"STOP\"}]}\r\n\r\n",
+    ),
+}
+
+FULL_RESPONSES = {
+    "claude": {"content": [{"text": STORY}]},
+    "grok": {"choices": [{"message": {"content": STORY}}]},
+    "openai": {"choices": [{"message": {"content": STORY}}]},
+    "gemini": {"candidates": [{"content": {"parts": [{"text": STORY}]}}]},
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """パスの先頭（/claude/ など）でAPIの種類を切り替えるスタブ"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    delay = 0.02
+
+    def write_chunk(self, text):
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        api_type = self.path.split("/")[1]
+        streaming = body.get("stream") or "alt=sse" in self.path
+
+        if not streaming:
+            # 一括応答：全文の生成が終わるまで待たされる
+            time.sleep(self.delay * len(STORY_CHUNKS))
+            data = json.dumps(FULL_RESPONSES[api_type], ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+
+        head, event_for, tail = STREAM_FORMATS[api_type]
+        self.send_response(200)
+        # 文字コードを指定しない（実際のAPIと同じ）
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        if head:
+            self.write_chunk(head)
+        for chunk in STORY_CHUNKS:
+            time.sleep(self.delay)
+            encoded = event_for(chunk).encode("utf-8")
+            # イベントを途中（文字の途中も含む）で2つのチャンクに分けて送る
+            middle = len(encoded) // 2
+            for part in (encoded[:middle], encoded[middle:]):
+                self.wfile.write(f"{len(part):X}\r\n".encode("ascii") + part + b"\r\n")
+        if tail:
+            self.write_chunk(tail)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_provider(api_type, base_url):
+    provider = type(providers.PROVIDERS[api_type])()
+    if api_type == "gemini":
+        provider.endpoint = f"{base_url}/gemini/models"
+    else:
+        provider.endpoint = f"{base_url}/{api_type}/v1"
+    return provider
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ストリーミング受信の確認と計測")
+    parser.add_argument("--delay", type=float, default=0.02, help="断片ごとの送信間隔（秒）")
+    args = parser.parse_args()
+    StubHandler.delay = args.delay
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    for api_type in providers.PROVIDERS:
+        provider = make_provider(api_type, base_url)
+
+        start = time.perf_counter()
+        first = None
+        chunks = []
+        for chunk in provider.stream("dummy", "プロンプト"):
+            if first is None:
+                first = time.perf_counter() - start
+            chunks.append(chunk)
+        total = time.perf_counter() - start
+        assert "".join(chunks) == STORY, (api_type, chunks)
+
+        start = time.perf_counter()
+        assert provider.complete("dummy", "プロンプト") == STORY
+        blocking = time.perf_counter() - start
+
+        print(f"{provider.name:7s}: 断片 {len(chunks)}個 / 最初の断片 {first * 1000:6.1f} ms / "
+              f"全文 {total * 1000:6.1f} ms（一括受信 {blocking * 1000:6.1f} ms）")
+
+    providers.close_sessions()
+    server.shutdown()
+    print("OK: すべてのAPIで受信した本文が一致しました")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# provider_transport.py
+# ショートショート生成のHTTP接続の使い回し（providers.py）の効果を計測する
+#
+# ローカルに自己署名証明書のHTTPSスタブサーバーを立て、
+# 毎回 requests.post する従来の方法と、共有セッションを使う方法とで
+# 1話あたりの待ち時間と、張られたTCP接続の数を比べる。
+# 証明書の作成に openssl コマンドを使う。
+#
+# 使い方:
+#   python benchmarks/provider_transport.py --stories 200
+
+import argparse
+import json
+import os
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shortshort"))
+import providers
+
+RESPONSE = json.dumps({"content": [{"text": "スタブの物語"}]}, ensure_ascii=False).encode("utf-8")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Claude API と同じ形の応答を返すスタブ"""
+
+    protocol_version = "HTTP/1.1"
+    # ヘッダーと本文を分けて書き込むため、Nagle による遅延を避ける
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        StubHandler.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_certificate(directory):
+    """127.0.0.1 用の自己署名証明書を作成"""
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=localhost", "-addext", "subjectAltName=IP:127.0.0.1",
+         "-keyout", key, "-out", cert],
+        check=True, capture_output=True,
+    )
+    return cert, key
+
+
+def start_server(cert, key):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def measure(label, call, stories):
+    """1話ごとの待ち時間を計測して表示"""
+    StubHandler.connections = 0
+    timings = []
+    for _ in range(stories):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    print(f"{label}: 中央値 {statistics.median(timings) * 1000:.2f} ms / "
+          f"平均 {statistics.mean(timings) * 1000:.2f} ms / "
+          f"TCP接続 {StubHandler.connections} 回")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP接続の使い回しの効果を計測")
+    parser.add_argument("--stories", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        server = start_server(cert, key)
+        url = f"https://127.0.0.1:{server.server_address[1]}/v1/messages"
+        provider = providers.ClaudeProvider(endpoint=url)
+        _, headers, data = provider.build_request("dummy", "プロンプト")
+
+        # 従来の方法：毎回新しい接続を張る
+        def fresh_post():
+            response = requests.post(url, headers=headers, json=data, timeout=60, verify=cert)
+            provider.parse_response(response.json())
+
+        # 共有セッション：最初の1回だけハンドシェイクする
+        # REQUESTS_CA_BUNDLE などの環境変数より自己署名証明書を優先させる
+        session = providers.get_session(url)
+        session.trust_env = False
+        session.verify = cert
+
+        def pooled_post():
+            provider.complete("dummy", "プロンプト")
+
+        measure("requests.post（毎回接続）", fresh_post, args.stories)
+        measure("共有セッション", pooled_post, args.stories)
+
+        providers.close_sessions()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
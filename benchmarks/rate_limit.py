@@ -0,0 +1,139 @@
+# rate_limit.py
+# 送信上限のあるAPIに対する、スケジューラー（scheduler.py）の効果を計測する
+#
+# ローカルのスタブサーバーが毎秒 --limit 件を上限として超過分に 429（Retry-After 付き）を返し、
+# さらに一定の割合で 503 を返す。同時に多数の生成を送ったとき、
+#   - スケジューラーを通さない場合（従来どおり、失敗したらそのままエラー）
+#   - スケジューラーを通す場合
+# の成功件数・失敗件数・所要時間を比べる。
+#
+# 使い方:
+#   python benchmarks/rate_limit.py --requests 100 --limit 10 --workers 20
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shortshort"))
+import providers
+import scheduler
+from providers import ProviderError
+
+RESPONSE = json.dumps({"content": [{"text": "スタブの物語"}]}, ensure_ascii=False).encode("utf-8")
+
+
+class LimitedHandler(BaseHTTPRequestHandler):
+    """毎秒 limit 件（バースト burst 件）まで受け付けるスタブ"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    limit = 10.0
+    burst = 10.0
+    error_rate = 0.05
+    lock = threading.Lock()
+    level = 0.0
+    updated = 0.0
+    counts = {}
+
+    def send_json(self, status, data, headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        cls = LimitedHandler
+        with cls.lock:
+            now = time.monotonic()
+            cls.level = min(cls.burst, cls.level + (now - cls.updated) * cls.limit)
+            cls.updated = now
+            if cls.level < 1:
+                retry_after = math.ceil((1 - cls.level) / cls.limit)
+                status = 429
+            elif random.random() < cls.error_rate:
+                status = 503
+            else:
+                cls.level -= 1
+                status = 200
+            cls.counts[status] = cls.counts.get(status, 0) + 1
+
+        if status == 429:
+            error = json.dumps({"error": {"message": "rate limited"}}).encode("utf-8")
+            self.send_json(429, error, [("Retry-After", str(retry_after))])
+        elif status == 503:
+            error = json.dumps({"error": {"message": "unavailable"}}).encode("utf-8")
+            self.send_json(503, error)
+        else:
+            # 生成にかかる時間の代わり
+            time.sleep(0.05)
+            self.send_json(200, RESPONSE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_batch(label, call, n_requests, workers):
+    LimitedHandler.counts = {}
+    LimitedHandler.level = LimitedHandler.burst
+    LimitedHandler.updated = time.monotonic()
+
+    def one(_):
+        try:
+            call()
+            return True
+        except ProviderError:
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(one, range(n_requests)))
+    elapsed = time.perf_counter() - start
+    counts = LimitedHandler.counts
+    print(f"{label}: 成功 {sum(results)} / 失敗 {len(results) - sum(results)} / "
+          f"{elapsed:.1f} 秒 / サーバー応答 200:{counts.get(200, 0)} "
+          f"429:{counts.get(429, 0)} 503:{counts.get(503, 0)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="送信上限への対応を計測")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--limit", type=float, default=10.0, help="スタブの毎秒の上限")
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    args = parser.parse_args()
+    LimitedHandler.limit = args.limit
+    LimitedHandler.burst = args.limit
+    LimitedHandler.error_rate = args.error_rate
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LimitedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    provider = providers.ClaudeProvider(endpoint=f"http://127.0.0.1:{server.server_address[1]}/v1/messages")
+    providers.configure_transport(pool_size=args.workers)
+    # スタブに合わせて1秒分のバーストを許す
+    shared = scheduler.RequestScheduler(rpm=args.limit * 60, burst_seconds=1.0, max_attempts=8)
+    scheduler.BACKOFF_BASE = 0.1
+
+    run_batch("スケジューラーなし", lambda: provider.complete("dummy", "プロンプト"),
+              args.requests, args.workers)
+    time.sleep(1.5)
+    run_batch("スケジューラーあり",
+              lambda: shared.run(lambda timeout: provider.complete("dummy", "プロンプト", timeout=timeout)),
+              args.requests, args.workers)
+
+    providers.close_sessions()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
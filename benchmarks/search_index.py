@@ -0,0 +1,41 @@
+# search_index.py
+# 物語要素の全文検索（search_stars）の処理速度を計測する
+#
+# 使い方:
+#   python benchmarks/search_index.py --loops 1000
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from story_corpus import load_corpus, search_stars
+
+QUERIES = ["猫", "ろぼっと", "魔法", "時間 旅行", "呪い 動物", "夢", "身代わり", "する"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="全文検索の処理速度を計測")
+    parser.add_argument("--loops", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("queries", nargs="*", default=QUERIES)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    # 初回の検索では照合用のテキストを作るので、別に計測する
+    start = time.perf_counter()
+    search_stars(corpus, args.queries[0], args.limit)
+    print(f"初回の検索: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for query in args.queries:
+        hits = len(corpus.search_index.search(query, None))
+        start = time.perf_counter()
+        for _ in range(args.loops):
+            search_stars(corpus, query, args.limit)
+        elapsed = (time.perf_counter() - start) / args.loops
+        print(f"{query}: {elapsed * 1e6:.0f} µs/回（一致 {hits}件）")
+
+
+if __name__ == "__main__":
+    main()
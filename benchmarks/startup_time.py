@@ -0,0 +1,71 @@
+# startup_time.py
+# デスクトップ版の起動時間（プロセス起動から最初のウィンドウが表示されるまで）を計測する
+#
+# 使い方:
+#   python benchmarks/startup_time.py                          # 現在の story_prompt_builder.py
+#   python benchmarks/startup_time.py old_story_prompt_builder.py --runs 20
+#
+# 子プロセスで対象スクリプトを実行し、ルートウィンドウの最初の <Map> イベントで
+# 終了させる。親プロセスは子プロセスを起動してから通知を受け取るまでの時間を測る。
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import runpy, sys, tkinter as tk
+script = sys.argv[1]
+sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+_Tk = tk.Tk
+class ProbeTk(_Tk):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._probed = False
+        self.bind("<Map>", self._on_map, add="+")
+    def _on_map(self, event):
+        if event.widget is self and not self._probed:
+            self._probed = True
+            sys.stdout.write("mapped\n")
+            sys.stdout.flush()
+            self.after_idle(self.destroy)
+tk.Tk = ProbeTk
+sys.argv = [script]
+runpy.run_path(script, run_name="__main__")
+"""
+
+
+def measure_once(script):
+    """1回分の起動時間（ミリ秒）"""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "import os\n" + PROBE, script],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=REPO_DIR,
+    )
+    line = proc.stdout.readline()
+    elapsed = (time.perf_counter() - start) * 1000
+    _, err = proc.communicate()
+    if line.strip() != "mapped":
+        raise RuntimeError(f"ウィンドウが表示されませんでした:\n{err}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="デスクトップ版の起動時間を計測")
+    parser.add_argument("script", nargs="?", default=os.path.join(REPO_DIR, "story_prompt_builder.py"))
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    measure_once(args.script)  # 1回目は .pyc 作成やディスクキャッシュのため除外
+    samples = [measure_once(args.script) for _ in range(args.runs)]
+    print(f"{os.path.basename(args.script)}: "
+          f"中央値 {statistics.median(samples):.1f} ms / "
+          f"最小 {min(samples):.1f} ms / 最大 {max(samples):.1f} ms ({args.runs}回)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# weighted_sampling.py
+# 物語要素の抽出の分布（stars / items / custom）ごとの処理速度を計測する
+#
+# 使い方:
+#   python benchmarks/weighted_sampling.py --count 5 --loops 100000
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from story_corpus import (
+    AliasTable,
+    distribution_table,
+    load_corpus,
+    sample_alias_stars,
+    sample_stars,
+    star_weights,
+)
+
+
+def measure(sample, loops):
+    start = time.perf_counter()
+    for _ in range(loops):
+        sample()
+    return (time.perf_counter() - start) / loops
+
+
+def main():
+    parser = argparse.ArgumentParser(description="抽出の分布ごとの処理速度を計測")
+    parser.add_argument("--count", type=int, default=5, help="1回に抽出する物語要素の数")
+    parser.add_argument("--loops", type=int, default=100_000)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    rng = random.Random(1)
+
+    start = time.perf_counter()
+    items_table = distribution_table(corpus, "items")
+    print(f"エイリアス表の作成（items）: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    custom_table = AliasTable(star_weights(corpus, "custom", [rng.random() for _ in range(corpus.n_stars)]))
+    start = time.perf_counter()
+    for j in range(10):
+        custom_table.set(j, 5.0)
+    print(f"重み10個の変更（custom）: {(time.perf_counter() - start) * 1e6:.0f} µs")
+
+    samplers = [
+        ("sample_stars（stars）", lambda: sample_stars(corpus.n_stars, args.count, seed=rng)),
+        ("sample_alias_stars（stars）",
+         lambda: sample_alias_stars(distribution_table(corpus, "stars"), args.count, seed=rng)),
+        ("sample_alias_stars（items）", lambda: sample_alias_stars(items_table, args.count, seed=rng)),
+        ("sample_alias_stars（custom）", lambda: sample_alias_stars(custom_table, args.count, seed=rng)),
+    ]
+    for label, sample in samplers:
+        print(f"{label}: {measure(sample, args.loops) * 1e6:.2f} µs/回")
+
+
+if __name__ == "__main__":
+    main()
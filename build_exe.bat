@@ -19,13 +19,32 @@ if errorlevel 1 (
 echo PyInstallerでexeファイルを作成中...
 echo.
 
+REM 内蔵データ（story_elements.bin.gz）を story_corpus\data\story_elements.json から作成
+REM （作成に失敗したときに前回のデータを同梱しないよう、先に削除する）
+echo 内蔵データを作成しています...
+if exist story_elements.bin.gz del /q story_elements.bin.gz
+echo.| python data_integration.py
+if errorlevel 1 (
+    echo エラー: 内蔵データの作成に失敗しました
+    pause
+    exit /b 1
+)
+
+REM exeには story_elements.json を同梱しないので、内蔵データが現在の形式・内容と一致しなければ中止
+python data_integration.py --check
+if errorlevel 1 (
+    echo エラー: 内蔵データが物語要素データと一致しません
+    pause
+    exit /b 1
+)
+
 REM 既存のdist, buildフォルダを削除
 if exist dist rmdir /s /q dist
 if exist build rmdir /s /q build
 if exist *.spec del /q *.spec
 
 REM exe化実行
-pyinstaller --onefile --windowed --name=StoryPromptBuilder --distpath=dist --workpath=build story_prompt_builder.py
+pyinstaller --onefile --windowed --name=StoryPromptBuilder --distpath=dist --workpath=build --add-data "story_elements.bin.gz;." story_prompt_builder.py
 
 if errorlevel 1 (
     echo エラー: exe化に失敗しました
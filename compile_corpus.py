@@ -0,0 +1,52 @@
+# compile_corpus.py
+# story_corpus/data/story_elements.json を mmap で読み込めるバイナリ形式
+# （story_elements.bin）に変換するビルド用スクリプト
+# （アプリは初回読み込み時に自動で変換するので、事前に作っておきたい場合に使う）
+
+import json
+import os
+import sys
+
+from story_corpus import SOURCE_PATH, compiled_path_for, open_compiled, write_compiled
+
+DEFAULT_TARGETS = [SOURCE_PATH]
+
+
+def compile_json(json_path):
+    """JSONファイルをバイナリ形式に変換"""
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        bin_path = compiled_path_for(json_path)
+        write_compiled(data, bin_path)
+
+        # 書き出したファイルを読み戻して確認
+        corpus = open_compiled(bin_path)
+        ok = corpus.to_list() == data
+        print(f"{json_path} → {bin_path}")
+        print(f"  内容ハッシュ: {corpus.content_hash}")
+        print(f"  {corpus.n_items}項目、{corpus.n_stars}個の★要素 "
+              f"({os.path.getsize(json_path):,} → {os.path.getsize(bin_path):,} バイト)")
+        corpus.close()
+        if not ok:
+            print("  エラー: 読み戻したデータが元のJSONと一致しません")
+        return ok
+
+    except FileNotFoundError:
+        print(f"エラー: {json_path} が見つかりません")
+        return False
+    except json.JSONDecodeError:
+        print(f"エラー: {json_path} の形式が正しくありません")
+        return False
+    except Exception as e:
+        print(f"エラー: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    print("物語要素データ コンパイルスクリプト")
+    print("=" * 40)
+    targets = sys.argv[1:] or DEFAULT_TARGETS
+    results = [compile_json(path) for path in targets]
+    sys.exit(0 if all(results) else 1)
@@ -1,41 +1,51 @@
 # data_integration.py
 # 完全版のstory_elements.jsonを読み込んで、
-# Pythonコード内に埋め込むためのコードを生成するスクリプト
+# デスクトップ版に同梱する圧縮済みデータ（story_elements.bin.gz）を生成するスクリプト
 
+import gzip
 import json
+import os
+import sys
+
+from story_corpus import SOURCE_PATH, CompiledCorpus, compile_corpus, content_hash
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_PATH = os.path.join(SCRIPT_DIR, 'story_elements.bin.gz')
 
 def integrate_json_data():
-    """完全版JSONデータをPythonコードに統合"""
+    """完全版JSONデータを圧縮済みバイナリに変換"""
     try:
         # 完全版JSONファイルを読み込み
-        with open('story_elements.json', 'r', encoding='utf-8') as f:
+        source_path = SOURCE_PATH
+        with open(source_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
-        print(f"読み込み完了: {len(data)}項目のデータを検出")
+        print(f"読み込み完了: {len(data)}項目のデータを検出 ({source_path})")
         
-        # Pythonコードとして出力
-        output_code = "        self.story_elements = " + json.dumps(data, ensure_ascii=False, indent=12)
+        # バイナリ形式に変換して圧縮（mtime=0で毎回同じ出力にする）
+        compiled = compile_corpus(data)
+        compressed = gzip.compress(compiled, compresslevel=9, mtime=0)
         
-        # ファイルに保存
-        with open('embedded_data.py', 'w', encoding='utf-8') as f:
-            f.write("# 物語要素データ（内蔵版）\n")
-            f.write("# このコードをstory_prompt_builder.pyのload_story_elements()メソッド内に貼り付けてください\n\n")
-            f.write(output_code)
+        # 展開して元データと一致するか確認
+        if CompiledCorpus(gzip.decompress(compressed)).to_list() != data:
+            print("エラー: 変換後のデータが元のJSONと一致しません")
+            return False
         
-        print("embedded_data.pyに統合用コードを出力しました")
+        with open(OUTPUT_PATH, 'wb') as f:
+            f.write(compressed)
+        
+        print(f"{os.path.basename(OUTPUT_PATH)}を出力しました (内容ハッシュ: {CompiledCorpus(compiled).content_hash[:12]}) "
+              f"({os.path.getsize(source_path):,} → {len(compressed):,} バイト)")
         print()
         print("使用方法:")
-        print("1. embedded_data.pyを開く")
-        print("2. 生成されたコードをコピー")
-        print("3. story_prompt_builder.pyの load_story_elements() メソッド内の")
-        print("   self.story_elements = [...] の部分を置き換える")
-        print("4. build_exe.batを実行してexe化")
+        print("1. story_elements.bin.gz を story_prompt_builder.py と同じフォルダに置く")
+        print("2. build_exe.batを実行してexe化（データはexeに同梱されます）")
         
         return True
         
     except FileNotFoundError:
         print("エラー: story_elements.json が見つかりません")
-        print("完全版のJSONファイルをこのスクリプトと同じフォルダに置いてください")
+        print(f"完全版のJSONファイルを {SOURCE_PATH} に置いてください")
         return False
     except json.JSONDecodeError:
         print("エラー: JSONファイルの形式が正しくありません")
@@ -44,8 +54,34 @@ def integrate_json_data():
         print(f"エラー: {str(e)}")
         return False
 
+def check_bundle():
+    """story_elements.bin.gz が現在の形式で読み込め、完全版JSONと同じ内容か確認（exe化の前に実行）
+
+    exe には story_elements.json を同梱しないので、古いデータを同梱すると exe では物語要素を読み込めない。
+    """
+    try:
+        with open(OUTPUT_PATH, 'rb') as f:
+            corpus = CompiledCorpus(gzip.decompress(f.read()))
+        with open(SOURCE_PATH, 'r', encoding='utf-8') as f:
+            expected = content_hash(json.load(f))
+    except (OSError, ValueError) as e:
+        print(f"エラー: {os.path.basename(OUTPUT_PATH)} を確認できません: {e}")
+        return False
+    
+    if corpus.content_hash != expected:
+        print(f"エラー: {os.path.basename(OUTPUT_PATH)} の内容が story_elements.json と一致しません")
+        print("data_integration.py を実行して作り直してください")
+        return False
+    
+    print(f"{os.path.basename(OUTPUT_PATH)}: 形式・内容ハッシュとも一致 ({expected[:12]})")
+    return True
+
 if __name__ == "__main__":
+    if "--check" in sys.argv[1:]:
+        sys.exit(0 if check_bundle() else 1)
+    
     print("物語要素データ統合スクリプト")
     print("=" * 40)
-    integrate_json_data()
-    input("\nEnterキーを押して終了...")
\ No newline at end of file
+    succeeded = integrate_json_data()
+    input("\nEnterキーを押して終了...")
+    sys.exit(0 if succeeded else 1)
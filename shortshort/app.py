@@ -1,12 +1,37 @@
 import streamlit as st
-import random
-import json
+import io
 import os
-import requests
 import time
 import re
+import sys
 from datetime import datetime
 
+# リポジトリ直下の共通モジュール（story_corpus）を読み込めるようにする
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from story_corpus import (
+    SOURCE_PATH,
+    CompiledCorpus,
+    StarBitset,
+    build_recipe_prompt,
+    build_shortshort_prompt,
+    compile_corpus,
+    decode_recipe,
+    elements_from_ids,
+    encode_recipe,
+    load_corpus,
+    make_rng,
+    sample_diverse_stars,
+    sample_star_batch,
+    sample_stars,
+    search_stars,
+)
+from bandit import RatingBandit
+from batch import run_batch
+from providers import ProviderError, get_provider
+from response_cache import ResponseCache, cache_key
+from scheduler import DEFAULT_DEADLINE, estimate_tokens, get_scheduler
+from story_store import StoryStore
+
 # ページ設定
 st.set_page_config(
     page_title="ショートショート自動生成システム",
@@ -14,237 +39,110 @@ st.set_page_config(
     layout="wide"
 )
 
+# 文字数の入力範囲（レシピコードから復元する文字数もこの範囲に限る）
+MIN_WORD_COUNT = 400
+MAX_WORD_COUNT = 3000
+
 class ShortStoryGenerator:
     """ショートショート生成システム"""
     
-    def __init__(self, api_key, api_type):
+    def __init__(self, api_key, api_type, cache=None):
         self.api_key = api_key
         self.api_type = api_type
+        # プロバイダーとHTTP接続はプロセス全体で共有される（providers.py）
+        self.provider = get_provider(api_type)
+        # 生成結果のキャッシュ（response_cache.py）。None の場合は使わない
+        self.cache = cache
+        
+    def _cache_key(self, prompt):
+        provider = self.provider
+        return cache_key(self.api_type, provider.model, provider.generation_params(), prompt)
+    
+    def _cached_story(self, prompt, fresh):
+        """キャッシュ済みの生成結果を取得（無い場合は None）"""
+        cache = self.cache
+        if cache is None or not cache.enabled:
+            return None
+        story = None if fresh and not cache.replay_only else cache.get(self._cache_key(prompt))
+        if story is None and cache.replay_only:
+            raise ProviderError("キャッシュ再生モード: このプロンプトの生成結果は保存されていません")
+        return story
+    
+    def _store_story(self, prompt, story):
+        """生成結果をキャッシュに保存"""
+        if self.cache is None or not story:
+            return
+        provider = self.provider
+        self.cache.put(self._cache_key(prompt), story, api_type=self.api_type, model=provider.model,
+                       params=provider.generation_params(), prompt=prompt)
+    
+    def fetch_story(self, prompt, fresh=False):
+        """画面表示を行わずにショートショートを生成（一括生成のワーカースレッドから呼ぶ）"""
+        story = self._cached_story(prompt, fresh)
+        if story is not None:
+            return story
+        provider = self.provider
+        story = get_scheduler(self.api_type).run(
+            lambda timeout: provider.complete(self.api_key, prompt, timeout=timeout),
+            tokens=estimate_tokens(provider, prompt),
+        )
+        self._store_story(prompt, story)
+        return story
         
-    def generate_story(self, prompt):
-        """ショートショートを生成"""
-        if self.api_type == "claude":
-            return self._generate_claude_story(prompt)
-        elif self.api_type == "grok":
-            return self._generate_grok_story(prompt)
-        elif self.api_type == "openai":
-            return self._generate_openai_story(prompt)
-        elif self.api_type == "gemini":
-            return self._generate_gemini_story(prompt)
-        else:
-            raise ValueError(f"サポートされていないAPI種類: {self.api_type}")
-    
-    def _generate_claude_story(self, prompt):
-        """Claude API使用"""
-        try:
-            st.info("🧠 Claude APIに接続中...")
-            
-            headers = {
-                "x-api-key": self.api_key,
-                "Content-Type": "application/json",
-                "anthropic-version": "2023-06-01"
-            }
-            
-            data = {
-                "model": "claude-3-haiku-20240307",
-                "max_tokens": 3000,
-                "temperature": 0.9,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            }
-            
-            response = requests.post(
-                "https://api.anthropic.com/v1/messages",
-                headers=headers,
-                json=data,
-                timeout=60
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                story = result["content"][0]["text"]
-                st.success("✅ Claude APIでショートショート生成成功！")
-                return story
-            else:
-                error_msg = f"Claude API エラー: ステータスコード {response.status_code}"
-                try:
-                    error_detail = response.json()
-                    if 'error' in error_detail:
-                        error_msg += f" - {error_detail['error'].get('message', '')}"
-                except:
-                    pass
-                st.error(error_msg)
-                raise Exception(error_msg)
-                
-        except requests.exceptions.Timeout:
-            error_msg = "Claude API 接続タイムアウト"
-            st.error(error_msg)
-            raise Exception(error_msg)
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Claude API 接続エラー: {str(e)}"
-            st.error(error_msg)
-            raise Exception(error_msg)
-        except Exception as e:
-            error_msg = f"Claude API エラー: {str(e)}"
-            st.error(error_msg)
-            raise Exception(error_msg)
-    
-    def _generate_grok_story(self, prompt):
-        """Grok API使用"""
-        try:
-            st.info("🚀 Grok APIに接続中...")
-            
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            data = {
-                "model": "grok-beta",
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": 3000,
-                "temperature": 0.9
-            }
-            
-            response = requests.post(
-                "https://api.x.ai/v1/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=60
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                story = result["choices"][0]["message"]["content"]
-                st.success("✅ Grok APIでショートショート生成成功！")
-                return story
-            else:
-                error_msg = f"Grok API エラー: ステータスコード {response.status_code}"
-                try:
-                    error_detail = response.json()
-                    if 'error' in error_detail:
-                        error_msg += f" - {error_detail['error'].get('message', '')}"
-                except:
-                    pass
-                st.error(error_msg)
-                raise Exception(error_msg)
-                
-        except requests.exceptions.Timeout:
-            error_msg = "Grok API 接続タイムアウト"
-            st.error(error_msg)
-            raise Exception(error_msg)
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Grok API 接続エラー: {str(e)}"
-            st.error(error_msg)
-            raise Exception(error_msg)
-        except Exception as e:
-            error_msg = f"Grok API エラー: {str(e)}"
-            st.error(error_msg)
-            raise Exception(error_msg)
-    
-    def _generate_openai_story(self, prompt):
-        """OpenAI API使用"""
+    def generate_story(self, prompt, placeholder=None, fresh=False):
+        """ショートショートを生成
+
+        placeholder（st.empty()）を渡すとストリーミングで受信し、届いた本文を順次表示する。
+        fresh=True の場合はキャッシュを読まずに生成する（生成結果はキャッシュに保存される）。
+        """
+        provider = self.provider
         try:
-            st.info("🤖 OpenAI APIに接続中...")
-            
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            data = {
-                "model": "gpt-3.5-turbo",
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": 3000,
-                "temperature": 0.9
-            }
-            
-            response = requests.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=60
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                story = result["choices"][0]["message"]["content"]
-                st.success("✅ OpenAI APIでショートショート生成成功！")
-                return story
-            else:
-                error_msg = f"OpenAI API エラー: ステータスコード {response.status_code}"
-                try:
-                    error_detail = response.json()
-                    if 'error' in error_detail:
-                        error_msg += f" - {error_detail['error'].get('message', '')}"
-                except:
-                    pass
-                st.error(error_msg)
-                raise Exception(error_msg)
-                
-        except requests.exceptions.Timeout:
-            error_msg = "OpenAI API 接続タイムアウト"
-            st.error(error_msg)
-            raise Exception(error_msg)
-        except requests.exceptions.RequestException as e:
-            error_msg = f"OpenAI API 接続エラー: {str(e)}"
-            st.error(error_msg)
-            raise Exception(error_msg)
-        except Exception as e:
-            error_msg = f"OpenAI API エラー: {str(e)}"
-            st.error(error_msg)
-            raise Exception(error_msg)
-    
-    def _generate_gemini_story(self, prompt):
-        """Gemini API使用"""
+            story = self._cached_story(prompt, fresh)
+        except ProviderError as e:
+            st.error(str(e))
+            raise
+        if story is not None:
+            if placeholder is not None:
+                placeholder.markdown(story)
+            st.info("💾 同じ条件で生成済みの結果を表示しています（キャッシュ）")
+            return story
+        
+        # ストリーミング受信中も、送信前の待ち・再試行と同じ期限で打ち切る
+        deadline = time.monotonic() + DEFAULT_DEADLINE
+        
+        def request(timeout):
+            if placeholder is None:
+                return provider.complete(self.api_key, prompt, timeout=timeout)
+            # 再試行の場合は最初から表示し直す
+            story = ""
+            for chunk in provider.stream(self.api_key, prompt, timeout=timeout, deadline=deadline):
+                story += chunk
+                placeholder.markdown(story + "▌")
+            placeholder.markdown(story)
+            return story
+        
+        status = st.empty()
+        
+        def show_wait(seconds, reason):
+            status.warning(f"⏳ {reason} のため {seconds:.1f} 秒待ってから送信します")
+        
         try:
-            st.info("✨ Gemini APIに接続中...")
-            
-            headers = {"Content-Type": "application/json"}
-            
-            data = {
-                "contents": [{"parts": [{"text": prompt}]}]
-            }
-            
-            response = requests.post(
-                f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={self.api_key}",
-                headers=headers,
-                json=data,
-                timeout=60
+            st.info(f"{provider.icon} {provider.name} APIに接続中...")
+            # 送信間隔の調整と再試行はプロバイダーごとの共有スケジューラーが行う
+            story = get_scheduler(self.api_type).run(
+                request,
+                tokens=estimate_tokens(provider, prompt),
+                deadline=deadline,
+                on_wait=show_wait,
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                story = result["candidates"][0]["content"]["parts"][0]["text"]
-                st.success("✅ Gemini APIでショートショート生成成功！")
-                return story
-            else:
-                error_msg = f"Gemini API エラー: ステータスコード {response.status_code}"
-                try:
-                    error_detail = response.json()
-                    if 'error' in error_detail:
-                        error_msg += f" - {error_detail['error'].get('message', '')}"
-                except:
-                    pass
-                st.error(error_msg)
-                raise Exception(error_msg)
-                
-        except requests.exceptions.Timeout:
-            error_msg = "Gemini API 接続タイムアウト"
-            st.error(error_msg)
-            raise Exception(error_msg)
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Gemini API 接続エラー: {str(e)}"
-            st.error(error_msg)
-            raise Exception(error_msg)
-        except Exception as e:
-            error_msg = f"Gemini API エラー: {str(e)}"
-            st.error(error_msg)
-            raise Exception(error_msg)
+            status.empty()
+            st.success(f"✅ {provider.name} APIでショートショート生成成功！")
+        except ProviderError as e:
+            st.error(str(e))
+            raise
+        
+        self._store_story(prompt, story)
+        return story
 
 class StoryElementManager:
     """物語要素管理"""
@@ -255,33 +153,20 @@ class StoryElementManager:
         self.load_story_elements()
     
     def load_story_elements(self):
-        """JSONファイル読み込み"""
-        # スクリプトと同じディレクトリを基準にする
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        # スクリプトと同じディレクトリからJSONファイルを検索
-        json_files = [
-            os.path.join(script_dir, "story_elements.json"),
-            os.path.join(script_dir, "story_elements - コピー.json")
-        ]
-        
-        for file_path in json_files:
-            try:
-                if os.path.exists(file_path):
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        self.story_elements = json.load(f)
-                    self.total_stars = sum(len(item["stars"]) for item in self.story_elements)
-                    # 成功時のみシンプルに表示
-                    return
-            except Exception as e:
-                # エラー時のみ表示
-                filename = os.path.basename(file_path)
-                st.error(f"⚠️ {filename} 読み込みエラー: {str(e)}")
-                continue
+        """共通の物語要素データ（story_corpus）を読み込む"""
+        try:
+            self.story_elements = load_corpus()
+            self.total_stars = self.story_elements.total_stars
+            # 成功時のみシンプルに表示
+            return
+        except Exception as e:
+            # エラー時のみ表示
+            filename = os.path.basename(SOURCE_PATH)
+            st.error(f"⚠️ {filename} 読み込みエラー: {str(e)}")
         
         # フォールバック：サンプルデータ
         st.warning("⚠️ JSONファイルが見つかりません。サンプルデータを使用します。")
-        self.story_elements = [
+        self.story_elements = CompiledCorpus(compile_corpus([
             {
                 "item": "【合言葉】",
                 "stars": [
@@ -320,133 +205,129 @@ class StoryElementManager:
                     "★３．機械が壊れると人間も壊れる。"
                 ]
             }
-        ]
-        self.total_stars = sum(len(item["stars"]) for item in self.story_elements)
+        ]))
+        self.total_stars = self.story_elements.total_stars
     
-    def extract_elements(self, count):
-        """要素抽出"""
+    def extract_star_ids(self, count, exclude=(), seed=None, bandit=None, exploration=1.0, diversity=0.0):
+        """要素を★番号で抽出（seed は story_corpus.make_rng と同じ）
+
+        bandit（RatingBandit）を渡すと、探索の割合 exploration 以外は評価に応じた重みで選ぶ。
+        diversity（0～1）を指定すると、exclude の★も含めて内容の似た★を避ける（MMR。評価を使うときは
+        評価の重みを関連度にする）。
+        ほぼ重複する★（同じクラスタの★）は、exclude の★と同じクラスタのものも含めて1個までにする。
+        """
         if not self.story_elements:
             return []
         
-        selected_elements = []
-        used_stars = set()
-        
-        attempts = 0
-        max_attempts = min(count * 10, self.total_stars)
-        
-        while len(selected_elements) < count and attempts < max_attempts:
-            attempts += 1
-            
-            item_data = random.choice(self.story_elements)
-            item_name = item_data["item"]
-            
-            available_stars = [star for star in item_data["stars"] if star not in used_stars]
-            
-            if available_stars:
-                selected_star = random.choice(available_stars)
-                used_stars.add(selected_star)
-                selected_elements.append((item_name, selected_star))
-        
-        return selected_elements
-    
-    def get_replacement_element(self, used_stars):
-        """使用済み要素を除いて新しい要素を1つ取得"""
-        attempts = 0
-        max_attempts = 100
-        
-        while attempts < max_attempts:
-            attempts += 1
-            
-            item_data = random.choice(self.story_elements)
-            item_name = item_data["item"]
-            
-            available_stars = [star for star in item_data["stars"] if star not in used_stars]
-            
-            if available_stars:
-                selected_star = random.choice(available_stars)
-                return (item_name, selected_star)
-        
-        return None
+        clusters = self.story_elements.star_clusters
+        use_bandit = bandit is not None and exploration < 1.0
+        if diversity > 0:
+            if use_bandit:
+                return bandit.sample_diverse(self.story_elements.star_vectors, count, diversity, exclude,
+                                             exploration, seed, clusters)
+            return sample_diverse_stars(self.story_elements.star_vectors, count, diversity, exclude, seed,
+                                        clusters=clusters)
+        if use_bandit:
+            return bandit.sample(count, exclude, exploration, seed, clusters)
+        return sample_stars(self.story_elements.n_stars, count, exclude, seed, clusters)
+    
+    def extract_elements_batch(self, n_sets, count, seed=None, bandit=None, exploration=1.0, diversity=0.0):
+        """要素を n_sets 組まとめて抽出（★番号の行列を返す。ほぼ重複する★は1組に1個まで）
+
+        diversity を指定すると、組ごとに extract_star_ids と同じく似た★を避けて抽出する。
+        """
+        if diversity > 0:
+            rng = make_rng(seed)
+            return [self.extract_star_ids(count, seed=rng, bandit=bandit, exploration=exploration,
+                                          diversity=diversity) for _ in range(n_sets)]
+        if bandit is not None and exploration < 1.0:
+            return bandit.sample_batch(n_sets, count, exploration=exploration, seed=seed,
+                                       clusters=self.story_elements.star_clusters)
+        return sample_star_batch(self.story_elements.n_stars, n_sets, count, seed,
+                                 clusters=self.story_elements.star_clusters)
+    
+    def elements_from_ids(self, star_ids):
+        """★番号の並びを (項目名, ★テキスト) のリストに変換"""
+        return elements_from_ids(self.story_elements, star_ids)
+    
+    def element_text(self, star_id):
+        """★番号の要素の表示用テキスト（項目名＋★テキスト）"""
+        item, star = self.story_elements.element(star_id)
+        return f"{item}{star}"
+    
+    def new_star_set(self, star_ids=()):
+        """使用済みの★番号の集合（StarBitset）を作る"""
+        return StarBitset(self.story_elements.n_stars, star_ids)
+    
+    def get_replacement_star_id(self, used_stars, seed=None, bandit=None, exploration=1.0, diversity=0.0):
+        """使用済み要素（★番号の集合）を除いて新しい要素の★番号を1つ取得"""
+        star_ids = self.extract_star_ids(1, used_stars, seed, bandit, exploration, diversity)
+        return star_ids[0] if star_ids else None
+    
+    def search_elements(self, query, limit=10):
+        """要素を検索（[(★番号, (項目名, ★テキスト)), ...] を関連の高い順に返す）"""
+        if not self.story_elements:
+            return []
+        return [(j, self.story_elements.element(j)) for j in search_stars(self.story_elements, query, limit)]
     
     def generate_shortshort_prompt(self, selected_elements, word_count):
         """ショートショート専用プロンプト生成"""
-        
-        prompt = f"""あなたは星新一のような天才ショートショート作家です。
-
-# 創作ミッション
-読者が最後まで読んだ瞬間に「まさか！」と驚き、「なるほど！」と納得する、記憶に残る傑作ショートショートを創作してください。
-
-# 基本設定
-- 文字数: 約{word_count}文字
-- ジャンル: ショートショート（掌編小説）
-- 必須要件: 意外なオチで読者を驚かせること
-
-# 必須使用要素
-"""
-        
-        for i, (item, star) in enumerate(selected_elements, 1):
-            prompt += f"{i}. {item} {star}\n"
-        
-        prompt += f"""
-# ショートショートの絶対条件
-- 読者の予想を完全に裏切る意外なオチ・どんでん返しで終わる
-- 短い中に完結した物語を構築する（起承転結の巧妙な構成）
-- 無駄のない簡潔で洗練された文章
-- 最後の一行で全てがひっくり返る衝撃的な結末
-- 日常の中に潜む非日常、または予想外の真実の発見
-- 読後に深い余韻と「なるほど感」を残す
-- 一度読んだら忘れられない印象的なストーリー
-
-# 物語要素の使用について
-上記の必須使用要素を参考にしながら創作してください。ただし、物語要素の間に辻褄を持たせるのが困難な場合、いくつかの物語要素を無視しても構いません。構成要素をすべて使い切ることよりも、ショートショートとしての面白さや完成度を優先してください。自然で魅力的なストーリーを作ることが最も重要です。
-
-# 重要指示
-- 冒頭から読者を引き込む魅力的な導入で始める
-- 中盤で読者にある方向の期待を抱かせる
-- 結末で期待を見事に裏切り、全く予想外の真実を明かす
-- オチは論理的でありながら意外性に富んでいること
-- 伏線は subtle に仕込み、読み返した時に「ああ、そういうことか！」と気づかせる
-- 人間の心理、社会の皮肉、科学技術の盲点など、深いテーマを含ませる
-- 星新一のような、ユーモアと哲学が混在した独特の味わいを出す
+        return build_shortshort_prompt(selected_elements, word_count)
+    
+    def generate_element_prompt(self, selected_elements, word_count, star_ids=()):
+        """選択中の要素からプロンプトとレシピコードを生成
+        
+        star_ids は selected_elements と同じ並びの★番号（編集した要素は None）。
+        すべての要素が編集されていなければ、★番号の要素（項目名・★テキスト）でプロンプトを作り、
+        同じプロンプトを再生成できるレシピコードも返す。編集した要素がある場合のレシピコードは None。
+        """
+        star_ids = list(star_ids)
+        if not star_ids or len(star_ids) != len(selected_elements) or None in star_ids:
+            return self.generate_shortshort_prompt(selected_elements, word_count), None
+        prompt = build_shortshort_prompt(self.elements_from_ids(star_ids), word_count)
+        return prompt, encode_recipe(self.story_elements, "shortshort", star_ids, word_count)
+    
+    def restore_recipe(self, code):
+        """レシピコードから (レシピ, プロンプト) を復元（コードが正しくない場合は ValueError）"""
+        recipe = decode_recipe(code)
+        if recipe["template"] != "shortshort":
+            raise ValueError("このレシピコードはショートショート版のものではありません")
+        if not MIN_WORD_COUNT <= recipe["word_count"] <= MAX_WORD_COUNT:
+            raise ValueError(f"レシピコードの文字数（{recipe['word_count']}）が{MIN_WORD_COUNT}～{MAX_WORD_COUNT}の範囲外です")
+        return recipe, build_recipe_prompt(self.story_elements, recipe)
 
-読者が「これは普通の話だな」と思って読み進めているうちに、最後の最後で「え！？そういうことだったの！？」と仰天するような、究極のどんでん返しショートショートを創作してください。
-
-この作品を読んだ読者が、友人に「すごいショートショートを読んだよ！」と興奮して話したくなるような、記憶に焼き付く傑作を生み出してください。"""
-        
-        return prompt
-
-def create_story_group_output(story_group):
-    """作品群のアウトプットテキストを作成（☆評価順）"""
+def iter_story_group_output(sorted_stories, story_count):
+    """作品群のアウトプットテキストを少しずつ作成（☆評価順に並んだ作品を受け取るジェネレーター）"""
     timestamp = datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')
     
-    # ☆評価でソート（降順）
-    sorted_stories = sorted(story_group, key=lambda x: x.get('user_rating', 0), reverse=True)
-    
-    output_text = f"""# ショートショート作品群
+    yield f"""# ショートショート作品群
 生成日時: {timestamp}
-作品数: {len(story_group)}作品
+作品数: {story_count}作品
 
 """
     
     for i, story_data in enumerate(sorted_stories, 1):
         rating_stars = "☆" * story_data.get('user_rating', 0)
-        output_text += f"""## 作品 {i} {rating_stars}
+        yield f"""## 作品 {i} {rating_stars}
 生成時刻: {story_data['timestamp']}
 使用要素数: {len(story_data['elements'])}個
 
 ### 使用した物語要素:
 """
         for j, (item, star) in enumerate(story_data['elements'], 1):
-            output_text += f"{j}. {item} {star}\n"
+            yield f"{j}. {item} {star}\n"
         
-        output_text += f"""
+        yield f"""
 ### ショートショート:
 {story_data['story']}
 
 """
-        output_text += "="*80 + "\n\n"
-    
-    return output_text
+        yield "="*80 + "\n\n"
+
+def write_story_group_output(sorted_stories, story_count, out):
+    """作品群のアウトプットテキストをファイルなどに順次書き出す"""
+    for chunk in iter_story_group_output(sorted_stories, story_count):
+        out.write(chunk)
 
 def extract_story_title(story):
     """ショートショートからタイトルを抽出"""
@@ -474,67 +355,160 @@ def extract_story_title(story):
     
     return "無題"
 
-def display_element_selection_interface(element_manager):
-    """シンプルな物語要素選択インターフェース"""
+def restore_recipe(element_manager):
+    """レシピコードから要素と文字数を復元（ボタンの on_click で、各ウィジェットより前に実行する）"""
+    code = st.session_state.get("recipe_input", "").strip()
+    if not code:
+        return
+    try:
+        recipe, prompt = element_manager.restore_recipe(code)
+    except ValueError as e:
+        st.session_state.recipe_error = f"❌ {e}"
+        return
+    st.session_state.current_star_ids = list(recipe["star_ids"])
+    st.session_state.used_stars = element_manager.new_star_set(recipe["star_ids"])
+    st.session_state.element_texts = [element_manager.element_text(j) for j in recipe["star_ids"]]
+    # 要素の入力欄は入力済みの値を保持するので、復元した要素のテキストで作り直す
+    for key in [key for key in st.session_state if str(key).startswith("element_text_")]:
+        del st.session_state[key]
+    st.session_state.word_count_input = recipe["word_count"]
+    st.session_state.restored_prompt = (prompt, code.upper())
+
+def display_prompt(prompt, recipe_code=None):
+    """生成したプロンプト（とレシピコード）を表示"""
+    st.markdown("---")
+    st.markdown("**📝 生成されたプロンプト**")
+    st.markdown("以下のプロンプトをAIにコピー＆ペーストしてください：")
+    
+    st.code(prompt, language="text")
+    if recipe_code:
+        st.markdown("**レシピコード**（このコードから同じプロンプトを再生成できます）")
+        st.code(recipe_code, language=None)
+    
+    # プロンプトをダウンロード可能にする
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    prompt_filename = f"{timestamp}_ショートショートプロンプト.txt"
+    
+    st.download_button(
+        label="📥 プロンプトをダウンロード",
+        data=prompt,
+        file_name=prompt_filename,
+        mime="text/plain",
+        use_container_width=True
+    )
+
+def current_selection(element_manager):
+    """選択中の要素を (要素のリスト, ★番号のリスト) で返す
+
+    要素は編集後のテキストを擬似的な (項目名, ★テキスト) にしたもの（空の要素は除く）。
+    ★番号は同じ並びで、手動で編集した要素は None（対応する★が無い）。
+    """
+    elements = []
+    star_ids = []
+    for star_id, text in zip(st.session_state.current_star_ids, st.session_state.element_texts):
+        text = text.strip()
+        if not text:
+            continue
+        elements.append(("【編集済み】", text))
+        star_ids.append(star_id if text == element_manager.element_text(star_id).strip() else None)
+    return elements, star_ids
+
+def display_element_selection_interface(element_manager, bandit=None, exploration=1.0, diversity=0.0):
+    """シンプルな物語要素選択インターフェース
+
+    (生成ボタンが押されたか, 要素のリスト, ★番号のリスト) を返す（current_selection を参照）。
+    """
     
     # セッション状態の初期化
-    if 'current_elements' not in st.session_state:
-        st.session_state.current_elements = []
-        st.session_state.used_stars = set()
+    # 要素は★番号で持ち（使用済みの判定は★番号のビット列）、テキストは表示するときに取り出す
+    if 'current_star_ids' not in st.session_state:
+        st.session_state.current_star_ids = []
+        st.session_state.used_stars = element_manager.new_star_set()
     
     if 'element_texts' not in st.session_state:
         st.session_state.element_texts = []
     
     # 初回要素抽出
-    if not st.session_state.current_elements:
-        st.session_state.current_elements = element_manager.extract_elements(5)
-        st.session_state.used_stars = {star for item, star in st.session_state.current_elements}
+    if not st.session_state.current_star_ids:
+        st.session_state.current_star_ids = element_manager.extract_star_ids(
+            5, bandit=bandit, exploration=exploration, diversity=diversity
+        )
+        st.session_state.used_stars = element_manager.new_star_set(st.session_state.current_star_ids)
         # 初期テキストを設定
-        st.session_state.element_texts = [f"{item}{star}" for item, star in st.session_state.current_elements]
+        st.session_state.element_texts = [element_manager.element_text(j) for j in st.session_state.current_star_ids]
     
     # element_textsの長さを現在の要素数に合わせる
-    while len(st.session_state.element_texts) < len(st.session_state.current_elements):
-        item, star = st.session_state.current_elements[len(st.session_state.element_texts)]
-        st.session_state.element_texts.append(f"{item}{star}")
+    while len(st.session_state.element_texts) < len(st.session_state.current_star_ids):
+        star_id = st.session_state.current_star_ids[len(st.session_state.element_texts)]
+        st.session_state.element_texts.append(element_manager.element_text(star_id))
     
     # element_textsが多すぎる場合は削除
-    while len(st.session_state.element_texts) > len(st.session_state.current_elements):
+    while len(st.session_state.element_texts) > len(st.session_state.current_star_ids):
         st.session_state.element_texts.pop()
     
     st.markdown("**🎲 物語要素**")
-    st.markdown(f"**現在の要素数: {len(st.session_state.current_elements)}個**")
+    st.markdown(f"**現在の要素数: {len(st.session_state.current_star_ids)}個**")
     
     # 要素追加ボタンを最初に配置
     col_add, col_refresh = st.columns([1, 1])
     with col_add:
         if st.button("➕ 要素を1個追加", use_container_width=True):
-            new_element = element_manager.get_replacement_element(st.session_state.used_stars)
-            if new_element:
-                st.session_state.current_elements.append(new_element)
-                st.session_state.used_stars.add(new_element[1])
+            new_star_id = element_manager.get_replacement_star_id(
+                st.session_state.used_stars, bandit=bandit, exploration=exploration, diversity=diversity
+            )
+            if new_star_id is not None:
+                st.session_state.current_star_ids.append(new_star_id)
+                st.session_state.used_stars.add(new_star_id)
                 # 新しい要素のテキストを追加
-                st.session_state.element_texts.append(f"{new_element[0]}{new_element[1]}")
+                st.session_state.element_texts.append(element_manager.element_text(new_star_id))
                 st.rerun()
     
     with col_refresh:
         if st.button("🔄 全要素を再抽出", use_container_width=True):
-            st.session_state.current_elements = element_manager.extract_elements(5)
-            st.session_state.used_stars = {star for item, star in st.session_state.current_elements}
+            st.session_state.current_star_ids = element_manager.extract_star_ids(
+                5, bandit=bandit, exploration=exploration, diversity=diversity
+            )
+            st.session_state.used_stars = element_manager.new_star_set(st.session_state.current_star_ids)
             # テキストも再設定
-            st.session_state.element_texts = [f"{item}{star}" for item, star in st.session_state.current_elements]
+            st.session_state.element_texts = [element_manager.element_text(j) for j in st.session_state.current_star_ids]
             st.rerun()
     
+    # 検索して要素を追加
+    search_query = st.text_input("🔍 要素を検索", placeholder="例: 時間 旅行", key="element_search")
+    if search_query.strip():
+        search_results = element_manager.search_elements(search_query)
+        if not search_results:
+            st.caption("一致する要素がありません")
+        for star_index, (item, star) in search_results:
+            col_result, col_add = st.columns([6, 1])
+            with col_result:
+                st.markdown(f"{item}{star}")
+            with col_add:
+                if st.button("➕", key=f"add_element_{star_index}", help="この要素を追加"):
+                    if star_index not in st.session_state.used_stars:
+                        st.session_state.current_star_ids.append(star_index)
+                        st.session_state.used_stars.add(star_index)
+                        st.session_state.element_texts.append(f"{item}{star}")
+                    st.rerun()
+    
+    # レシピコードから復元
+    with st.expander("🔗 レシピコードから復元"):
+        st.text_input("レシピコード", key="recipe_input", placeholder="例: DATMFPM4CLABLK5WP2SJGEXQQWV6NEA")
+        st.button("復元", use_container_width=True, on_click=restore_recipe, args=(element_manager,))
+        if "recipe_error" in st.session_state:
+            st.error(st.session_state.pop("recipe_error"))
+    
     st.markdown("---")
     
     # 要素表示と編集・削除機能
     elements_to_remove = []
     
-    for i in range(len(st.session_state.current_elements)):
+    for i in range(len(st.session_state.current_star_ids)):
         col_element, col_delete = st.columns([6, 1])
         
         with col_element:
             # 編集可能なテキストボックス
-            current_text = st.session_state.element_texts[i] if i < len(st.session_state.element_texts) else f"{st.session_state.current_elements[i][0]}{st.session_state.current_elements[i][1]}"
+            current_text = st.session_state.element_texts[i] if i < len(st.session_state.element_texts) else element_manager.element_text(st.session_state.current_star_ids[i])
             edited_text = st.text_input(
                 f"要素 {i+1}",
                 value=current_text,
@@ -555,50 +529,142 @@ def display_element_selection_interface(element_manager):
     # 削除処理
     if elements_to_remove:
         for i in reversed(elements_to_remove):
-            if i < len(st.session_state.current_elements):
-                removed_item, removed_star = st.session_state.current_elements[i]
-                if removed_star in st.session_state.used_stars:
-                    st.session_state.used_stars.remove(removed_star)
-                st.session_state.current_elements.pop(i)
+            if i < len(st.session_state.current_star_ids):
+                st.session_state.used_stars.discard(st.session_state.current_star_ids.pop(i))
             if i < len(st.session_state.element_texts):
                 st.session_state.element_texts.pop(i)
         st.rerun()
     
     # 生成ボタン
     st.markdown("---")
+    # 要素は★番号と一緒に返す（テキストから★番号を引き直さない）
+    selected_elements, selected_star_ids = current_selection(element_manager)
     if st.button("✅ 生成", type="primary", use_container_width=True):
-        if st.session_state.element_texts:
-            # 編集されたテキストを要素として返す
-            edited_elements = []
-            for i, text in enumerate(st.session_state.element_texts):
-                if text.strip():  # 空でない場合のみ追加
-                    # 編集されたテキストを擬似的な(item, star)形式に変換
-                    edited_elements.append(("【編集済み】", text.strip()))
-            
-            if edited_elements:
-                return True, edited_elements
-            else:
-                st.error("物語要素が1個以上必要です")
-                return False, []
-        else:
-            st.error("物語要素が1個以上必要です")
-            return False, []
-    
-    # 現在の編集済み要素を返す（生成しない場合）
-    current_edited_elements = []
-    for i, text in enumerate(st.session_state.element_texts):
-        if text.strip():
-            current_edited_elements.append(("【編集済み】", text.strip()))
+        if selected_elements:
+            return True, selected_elements, selected_star_ids
+        st.error("物語要素が1個以上必要です")
+        return False, [], []
     
-    return False, current_edited_elements
+    # 現在の要素を返す（生成しない場合）
+    return False, selected_elements, selected_star_ids
+
+def display_batch_generation_interface(element_manager, story_store, group_id, api_type, api_key, word_count, force_fresh,
+                                       bandit=None, exploration=1.0, diversity=0.0):
+    """一括生成インターフェース（要素の組をまとめて抽出し、並列に生成する）"""
+    with st.expander("📚 一括生成（複数の作品をまとめて生成）"):
+        col_count, col_elements, col_workers = st.columns(3)
+        with col_count:
+            n_stories = st.number_input("作品数", value=10, min_value=1, max_value=100, step=1)
+        with col_elements:
+            element_count = st.number_input("1作品の要素数", value=5, min_value=1, max_value=10, step=1)
+        with col_workers:
+            max_workers = st.number_input(
+                "同時実行数", value=4, min_value=1, max_value=16, step=1,
+                help="同時にAPIへ送る生成の数（送信上限を超える分は自動で待ちます）"
+            )
+        
+        if st.button("🚀 一括生成を開始", use_container_width=True):
+            if not api_key:
+                st.error("⚠️ APIキーが必要です")
+                st.stop()
+            
+            story_generator = ShortStoryGenerator(api_key, api_type, cache=get_response_cache())
+            
+            # 作品ごとの物語要素をまとめて抽出
+            jobs = []
+            corpus_hash = element_manager.story_elements.content_hash
+            for star_ids in element_manager.extract_elements_batch(
+                n_stories, element_count, bandit=bandit, exploration=exploration, diversity=diversity
+            ):
+                elements = element_manager.elements_from_ids(star_ids)
+                jobs.append({
+                    "elements": elements,
+                    "star_ids": [int(j) for j in star_ids],
+                    "corpus_hash": corpus_hash,
+                    "prompt": element_manager.generate_shortshort_prompt(elements, word_count),
+                    "word_count": word_count,
+                    "user_rating": 0
+                })
+            
+            progress = st.progress(0.0, text=f"0 / {n_stories} 作品")
+            errors = []
+            results = run_batch(
+                lambda prompt: story_generator.fetch_story(prompt, fresh=force_fresh),
+                jobs, max_workers,
+                # 完成した作品から順に作品群（データベース）に保存
+                save=lambda story_data: story_store.add_story(group_id, story_data)
+            )
+            for done, (index, story_data, error) in enumerate(results, 1):
+                if story_data is None:
+                    errors.append(f"作品 {index + 1}: {error}")
+                progress.progress(done / n_stories,
+                                  text=f"{done} / {n_stories} 作品（失敗 {len(errors)}）")
+            
+            st.success(f"✅ 一括生成完了: {n_stories - len(errors)}作品を作品群に追加しました")
+            for error in errors:
+                st.error(error)
+
+@st.cache_resource(show_spinner=False)
+def get_story_store():
+    """作品群のデータベース（全セッションで共有）"""
+    return StoryStore()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_story_group_export(group_id, group_version):
+    """作品群のダウンロード用ファイル（ファイル名, 本文）を作成
+
+    作品群のバージョンごとにキャッシュし、作品群が変わらない限り作り直さない。
+    作品はデータベースから☆評価順に少しずつ読み込んで書き出す。
+    """
+    story_store = get_story_store()
+    story_count = story_store.count(group_id)
+    
+    # 上位作品のタイトルを取得
+    top_stories = story_store.list_stories(group_id, order="rating", limit=1)
+    top_title = extract_story_title(top_stories[0]['story']) if top_stories else "作品なし"
+    creation_date = datetime.now().strftime('%Y%m%d_%H%M')
+    filename = f"{creation_date}_{top_title}他_{story_count}作品.txt"
+    
+    output = io.StringIO()
+    write_story_group_output(story_store.iter_stories(group_id, order="rating"), story_count, output)
+    return filename, output.getvalue()
+
+@st.cache_resource(show_spinner=False)
+def get_element_manager():
+    """物語要素データはサーバープロセスごとに1回だけ読み込み、全セッションで共有する
+
+    返すインスタンスは読み取り専用として扱い、ユーザーごとの選択状態は
+    st.session_state に保持する。
+    """
+    return StoryElementManager()
+
+@st.cache_resource(show_spinner=False)
+def get_rating_bandit():
+    """評価に応じた要素の抽出（全セッションで共有し、保存済みの評価の累計から始める）"""
+    corpus = get_element_manager().story_elements
+    return RatingBandit(corpus, get_story_store().star_ratings(corpus.content_hash))
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache():
+    """生成結果のキャッシュ（全セッションで共有）"""
+    return ResponseCache()
 
 def main():
-    if 'element_manager' not in st.session_state:
-        st.session_state.element_manager = StoryElementManager()
-    
-    # 現在の作品群を初期化
-    if 'current_story_group' not in st.session_state:
-        st.session_state.current_story_group = []
+    # 物語要素管理（全セッションで共有）
+    element_manager = get_element_manager()
+    bandit = get_rating_bandit()
+    
+    # 現在の作品群（データベースに保存し、URLの ?group= で識別するため再読み込みしても残る）
+    story_store = get_story_store()
+    if 'story_group_id' not in st.session_state:
+        group_key = st.query_params.get("group")
+        group_id = story_store.group_id(group_key) if group_key else None
+        if group_id is None:
+            group_key = story_store.create_group()
+            group_id = story_store.group_id(group_key)
+            st.query_params["group"] = group_key
+        st.session_state.story_group_id = group_id
+    group_id = st.session_state.story_group_id
     
     # 生成結果を初期化
     if 'generation_result' not in st.session_state:
@@ -607,8 +673,8 @@ def main():
     st.markdown("### 📚 ショートショート生成システム")
     st.markdown("**出典**: 『物語要素事典』（2021年4月15日改訂）https://www.lib.agu.ac.jp/yousojiten/")
     
-    if st.session_state.element_manager.story_elements:
-        st.success(f"✅ 物語要素データ: {st.session_state.element_manager.total_stars}個の要素読み込み完了")
+    if element_manager.story_elements:
+        st.success(f"✅ 物語要素データ: {element_manager.total_stars}個の要素読み込み完了")
     else:
         st.warning("⚠️ JSONファイルが読み込まれませんでした。サンプルデータを使用します。")
     
@@ -673,45 +739,60 @@ def main():
                 )
                 if api_key:
                     st.success("✅ Gemini APIキー設定完了")
+            
+            streaming = st.checkbox(
+                "生成中の本文を順次表示する",
+                value=True,
+                help="ストリーミングで受信し、生成された文章から順に表示します"
+            )
+            force_fresh = st.checkbox(
+                "キャッシュを使わずに新しく生成する",
+                value=False,
+                help="同じ物語要素・設定で生成済みの結果があっても、AIに接続して生成し直します"
+            )
         else:
             # プロンプトのみ生成の場合
             api_type = "prompt_only"
             api_key = "prompt_only"
+            streaming = False
+            force_fresh = False
             st.info("📝 プロンプトのみ生成モード")
         
         st.markdown("---")
         
         st.header("⚙️ 設定")
-        word_count = st.number_input("文字数", value=1200, min_value=400, max_value=3000, step=100)
+        # 既定値は session_state に置く（レシピコードからの復元で書き換えるため）
+        st.session_state.setdefault("word_count_input", 1200)
+        word_count = st.number_input("文字数", min_value=MIN_WORD_COUNT, max_value=MAX_WORD_COUNT, step=100,
+                                     key="word_count_input")
+        exploration = st.slider(
+            "探索の割合（%）", min_value=0, max_value=100, value=int(bandit.exploration * 100), step=10,
+            help="評価に関係なく要素を選ぶ割合。低いほど、☆評価の高い作品に使った要素が選ばれやすくなります（100%で評価を使わない）"
+        ) / 100
+        diversity = st.slider(
+            "似た要素を避ける度合い（%）", min_value=0, max_value=100, value=0, step=10,
+            help="高いほど、内容の似た物語要素が一緒に選ばれにくくなります（一括生成にも使います）"
+        ) / 100
     
     # 物語要素選択インターフェース
-    generate_requested, selected_elements = display_element_selection_interface(st.session_state.element_manager)
+    generate_requested, selected_elements, selected_star_ids = display_element_selection_interface(
+        element_manager, bandit, exploration, diversity
+    )
+    
+    # レシピコードから復元したプロンプト
+    restored_prompt = st.session_state.pop("restored_prompt", None)
+    if restored_prompt and not generate_requested:
+        st.success("✅ レシピコードから要素と文字数を復元しました")
+        display_prompt(*restored_prompt)
     
     # ショートショート生成実行
     if generate_requested:
         if connection_mode == "AIへのプロンプトのみ生成":
             # プロンプトのみ生成
-            prompt = st.session_state.element_manager.generate_shortshort_prompt(
-                selected_elements, word_count
-            )
-            
-            st.markdown("---")
-            st.markdown("**📝 生成されたプロンプト**")
-            st.markdown("以下のプロンプトをAIにコピー＆ペーストしてください：")
-            
-            st.code(prompt, language="text")
-            
-            # プロンプトをダウンロード可能にする
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            prompt_filename = f"{timestamp}_ショートショートプロンプト.txt"
-            
-            st.download_button(
-                label="📥 プロンプトをダウンロード",
-                data=prompt,
-                file_name=prompt_filename,
-                mime="text/plain",
-                use_container_width=True
+            prompt, recipe_code = element_manager.generate_element_prompt(
+                selected_elements, word_count, selected_star_ids
             )
+            display_prompt(prompt, recipe_code)
             
         else:
             # API接続での生成
@@ -722,22 +803,31 @@ def main():
             
             try:
                 # 生成システム初期化
-                story_generator = ShortStoryGenerator(api_key, api_type)
+                story_generator = ShortStoryGenerator(api_key, api_type, cache=get_response_cache())
                 
                 # ショートショート特化プロンプト生成
-                prompt = st.session_state.element_manager.generate_shortshort_prompt(
-                    selected_elements, word_count
+                prompt, _ = element_manager.generate_element_prompt(
+                    selected_elements, word_count, selected_star_ids
                 )
                 
                 # ショートショート生成
-                with st.spinner("📖 ショートショート生成中..."):
-                    story = story_generator.generate_story(prompt)
+                if streaming:
+                    st.markdown("**📖 ショートショート生成中...**")
+                    story = story_generator.generate_story(
+                        prompt, placeholder=st.empty(), fresh=force_fresh
+                    )
+                else:
+                    with st.spinner("📖 ショートショート生成中..."):
+                        story = story_generator.generate_story(prompt, fresh=force_fresh)
                 
                 if story:
                     # 結果保存（要素のディープコピーを作成）
                     story_data = {
                         "story": story,
                         "elements": [(item, star) for item, star in selected_elements],  # ディープコピー
+                        # 評価を要素の抽出に反映するため、編集していない要素の★番号を記録
+                        "star_ids": [j for j in selected_star_ids if j is not None] or None,
+                        "corpus_hash": bandit.corpus_hash,
                         "prompt": prompt,
                         "timestamp": datetime.now().strftime("%H:%M:%S"),
                         "word_count": word_count,
@@ -745,7 +835,7 @@ def main():
                     }
                     
                     # 現在の作品群に追加
-                    st.session_state.current_story_group.append(story_data)
+                    story_data = story_store.add_story(group_id, story_data)
                     
                     # 生成結果を更新（前回の結果をクリア）
                     st.session_state.generation_result = story_data
@@ -757,6 +847,13 @@ def main():
                 st.error(f"ショートショート生成エラー: {str(e)}")
                 st.error("APIキーが正しいか、ネットワーク接続を確認してください。")
     
+    # 一括生成
+    if connection_mode == "AIに接続してお話を生成":
+        display_batch_generation_interface(
+            element_manager, story_store, group_id, api_type, api_key, word_count, force_fresh,
+            bandit, exploration, diversity
+        )
+    
     # 生成結果表示
     if st.session_state.generation_result:
         st.markdown("---")
@@ -791,23 +888,22 @@ def main():
             # 評価を保存して要素選択部分に戻る
             if user_rating != story_data.get('user_rating', 0):
                 # 現在の作品群内の該当作品を更新
-                for i, group_story in enumerate(st.session_state.current_story_group):
-                    if group_story['timestamp'] == story_data['timestamp']:
-                        st.session_state.current_story_group[i]['user_rating'] = user_rating
-                        st.session_state.generation_result['user_rating'] = user_rating
-                        break
+                rating_update = story_store.set_rating(story_data['id'], user_rating)
+                # 評価の累計の変化を要素の抽出に反映
+                if rating_update and rating_update[0] == bandit.corpus_hash:
+                    bandit.update(*rating_update[1:])
+                st.session_state.generation_result['user_rating'] = user_rating
                 # 評価後に要素選択部分に戻る
                 st.success(f"評価を保存しました: {'☆' * user_rating if user_rating > 0 else '未評価'}")
                 time.sleep(1)
                 st.rerun()
     
     # 作品群表示とダウンロード
-    if st.session_state.current_story_group:
+    # ☆評価順（降順）の並べ替えはデータベースの索引で行う
+    sorted_stories = story_store.list_stories(group_id, order="rating")
+    if sorted_stories:
         st.markdown("---")
-        st.markdown(f"**📋 現在の作品群 ({len(st.session_state.current_story_group)}作品)**")
-        
-        # ☆評価でソート（降順）
-        sorted_stories = sorted(st.session_state.current_story_group, key=lambda x: x.get('user_rating', 0), reverse=True)
+        st.markdown(f"**📋 現在の作品群 ({len(sorted_stories)}作品)**")
         
         # 作品群の簡易リスト表示
         for i, story_data in enumerate(sorted_stories, 1):
@@ -819,41 +915,37 @@ def main():
                 st.write(story_data['story'])
         
         # ダウンロードとリセット
-        story_group_output = create_story_group_output(st.session_state.current_story_group)
-        creation_date = datetime.now().strftime('%Y%m%d_%H%M')
-        
-        # 上位作品のタイトルを取得
-        if sorted_stories:
-            top_story = sorted_stories[0]
-            top_title = extract_story_title(top_story['story'])
-        else:
-            top_title = "作品なし"
-        
-        filename = f"{creation_date}_{top_title}他_{len(st.session_state.current_story_group)}作品.txt"
-        
+        # ダウンロード用ファイルは求められたときだけ作成する（作品群のバージョンごとにキャッシュ）
+        group_version = story_store.group_version(group_id)
         col_download, col_reset = st.columns([3, 1])
         
         with col_download:
-            # ダウンロード後に作品群をリセット
-            if st.download_button(
-                label="📥 作品群をダウンロード（ダウンロード後にリセット）",
-                data=story_group_output,
-                file_name=filename,
-                mime="text/plain",
-                use_container_width=True,
-                key="download_and_reset"
-            ):
-                # ダウンロードボタンが押された場合、作品群をリセット
-                st.session_state.current_story_group = []
-                st.session_state.generation_result = None
-                st.success("✅ 作品群をダウンロードしました。作品群をリセットしました。")
-                time.sleep(1)
-                st.rerun()
+            if st.session_state.get('export_version') != group_version:
+                if st.button("📦 ダウンロード用のファイルを作成", use_container_width=True):
+                    st.session_state.export_version = group_version
+                    st.rerun()
+            else:
+                filename, story_group_output = build_story_group_export(group_id, group_version)
+                # ダウンロード後に作品群をリセット
+                if st.download_button(
+                    label="📥 作品群をダウンロード（ダウンロード後にリセット）",
+                    data=story_group_output,
+                    file_name=filename,
+                    mime="text/plain",
+                    use_container_width=True,
+                    key="download_and_reset"
+                ):
+                    # ダウンロードボタンが押された場合、作品群をリセット
+                    story_store.clear_group(group_id)
+                    st.session_state.generation_result = None
+                    st.success("✅ 作品群をダウンロードしました。作品群をリセットしました。")
+                    time.sleep(1)
+                    st.rerun()
         
         with col_reset:
             # 手動リセットボタン
             if st.button("🗑️ リセット", use_container_width=True, help="作品群をクリアします"):
-                st.session_state.current_story_group = []
+                story_store.clear_group(group_id)
                 st.session_state.generation_result = None
                 st.success("✅ 作品群をリセットしました。")
                 time.sleep(1)
@@ -0,0 +1,102 @@
+# bandit.py
+# 作品の評価（☆）から学習して、評価の高い物語要素を選びやすくする抽出
+#
+# ★ごとに評価の累計（成功, 失敗）を持ち（story_store.rating_deltas）、
+# ★とその項目それぞれのベータ分布の事後平均（事前分布は Beta(1, 1)）の積を★の重みとする。
+# 評価のない★は重みがそろうので、評価が無いうちは従来どおりの一様な抽出になる。
+# 項目の累計は、その項目の★の累計の和（同じ項目の別の★も少し選ばれやすくなる）。
+#
+# 重みは Fenwick木（story_corpus.weighted）に持つので、
+#   - 評価1件の反映: 作品の★の数 K × 項目内の★の数（最大20程度）の重みの更新
+#   - 抽出: 1要素あたり O(log N)
+# で済み、評価が増えても抽出の手間は変わらない。
+# 探索の割合（exploration）の確率で、重みに関係なく全★から一様に選ぶ。
+# 1.0 なら常に一様（学習を使わない）、0.0 なら常に重みに従う。
+# 似た★を避ける抽出（sample_diverse）では、重みを MMR の関連度に使う（story_corpus.diversity を参照）。
+#
+# 累計はデータベース（story_store.py の star_ratings）に保存し、起動時に読み込む。
+# 物語要素データが変わると（ハッシュが違うと）★番号が変わるので、累計は引き継がない。
+
+import os
+import threading
+
+from story_corpus import FenwickTree, make_rng, sample_diverse_stars, sample_weighted_stars
+
+EXPLORATION = float(os.environ.get("SHORTSHORT_EXPLORATION", "0.3"))
+
+
+class RatingBandit:
+    """評価の累計による★の重み付き抽出（複数のセッション・スレッドから共有できる）"""
+
+    def __init__(self, corpus, counters=None, exploration=EXPLORATION):
+        if not 0.0 <= exploration <= 1.0:
+            raise ValueError(f"探索の割合は0～1で指定してください: {exploration}")
+        self.corpus = corpus
+        self.corpus_hash = corpus.content_hash
+        self.exploration = exploration
+        n_stars = corpus.n_stars
+        self._star_items = [corpus.star_item(j) for j in range(n_stars)]
+        self._successes = [0.0] * n_stars
+        self._failures = [0.0] * n_stars
+        self._item_successes = [0.0] * corpus.n_items
+        self._item_failures = [0.0] * corpus.n_items
+        for star_id, (successes, failures) in (counters or {}).items():
+            if 0 <= star_id < n_stars:
+                self._count(star_id, successes, failures)
+        self._tree = FenwickTree(self._weight(j) for j in range(n_stars))
+        self._lock = threading.Lock()
+
+    def _count(self, star_id, d_successes, d_failures):
+        item = self._star_items[star_id]
+        self._successes[star_id] += d_successes
+        self._failures[star_id] += d_failures
+        self._item_successes[item] += d_successes
+        self._item_failures[item] += d_failures
+
+    def _weight(self, star_id):
+        """★の事後平均 × 項目の事後平均"""
+        item = self._star_items[star_id]
+        star_mean = (1.0 + self._successes[star_id]) / (2.0 + self._successes[star_id] + self._failures[star_id])
+        item_mean = (1.0 + self._item_successes[item]) / (
+            2.0 + self._item_successes[item] + self._item_failures[item]
+        )
+        return star_mean * item_mean
+
+    def weight(self, star_id):
+        """★の現在の重み"""
+        return self._tree.weights[star_id]
+
+    def update(self, star_ids, d_successes, d_failures):
+        """評価の累計の増減（story_store.StoryStore.set_rating の戻り値）を反映"""
+        star_ids = [j for j in star_ids if 0 <= j < len(self._star_items)]
+        with self._lock:
+            for star_id in star_ids:
+                self._count(star_id, d_successes, d_failures)
+            # 項目の平均が変わるので、その項目の★の重みをすべて更新
+            for item in {self._star_items[j] for j in star_ids}:
+                for j in self.corpus.star_range(item):
+                    self._tree.set(j, self._weight(j))
+
+    def sample(self, count, exclude=(), exploration=None, seed=None, clusters=None):
+        """★番号を count 個抽出（exclude の★は除く。clusters は story_corpus.sample_stars と同じ）"""
+        if exploration is None:
+            exploration = self.exploration
+        with self._lock:
+            return sample_weighted_stars(self._tree, count, exclude, exploration, seed, clusters)
+
+    def sample_diverse(self, vectors, count, diversity, exclude=(), exploration=None, seed=None, clusters=None):
+        """重みに従いつつ、似た★を避けて★番号を count 個抽出（story_corpus.sample_diverse_stars、NumPy が必要）"""
+        if exploration is None:
+            exploration = self.exploration
+        with self._lock:
+            weights = list(self._tree.weights)
+        return sample_diverse_stars(vectors, count, diversity, exclude, seed, clusters=clusters,
+                                    weights=weights, exploration=exploration)
+
+    def sample_batch(self, n_sets, count, exploration=None, seed=None, clusters=None):
+        """★番号の組を n_sets 組抽出（組の中では重複なし）"""
+        if exploration is None:
+            exploration = self.exploration
+        rng = make_rng(seed)
+        with self._lock:
+            return [sample_weighted_stars(self._tree, count, (), exploration, rng, clusters) for _ in range(n_sets)]
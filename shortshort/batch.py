@@ -0,0 +1,39 @@
+# batch.py
+# ショートショートの一括生成（同時実行数を制限した並列生成と、1作品ごとの保存）
+#
+# 生成が終わった作品から順に保存する（保存先は呼び出し側が渡す。アプリでは story_store）。
+# 途中でブラウザを閉じたりアプリが止まったりしても、それまでの作品は失われない。
+# このモジュールでは画面表示（st.*）は行わない。
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+
+def run_batch(fetch_story, jobs, max_workers, save=None):
+    """jobs（{"prompt": ..., ...} のリスト）を最大 max_workers 件ずつ並列に生成する
+
+    作品が完成した順に (番号, 作品データ, None) を、失敗した場合は
+    (番号, None, エラーメッセージ) を返すジェネレーター。
+    作品データは job に "story" と "timestamp" を加えたもので、save があれば
+    完成した時点でワーカースレッドから save(作品データ) を呼び、その戻り値を返す。
+    途中で打ち切られた場合は、未着手の生成を取り消す。
+    """
+    def work(job):
+        story = fetch_story(job["prompt"])
+        record = dict(job, story=story, timestamp=datetime.now().strftime("%H:%M:%S"))
+        if save is not None:
+            record = save(record)
+        return record
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(work, job): index for index, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                yield index, future.result(), None
+            except Exception as e:
+                yield index, None, str(e)
+    finally:
+        # 画面の再実行などで打ち切られた場合も、実行中の生成の完了は待たない
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,424 @@
+# providers.py
+# ショートショート生成に使うAI APIプロバイダーの定義
+#
+# HTTPセッションはエンドポイント（スキーム＋ホスト）ごとに1つ作り、
+# サーバープロセスが動いている間は使い回す（keep-alive で接続を再利用する）。
+# Streamlit の再実行ではこのモジュールは読み込み直されないため、
+# ShortStoryGenerator を毎回作り直しても TCP/TLS のハンドシェイクは最初の1回だけで済む。
+#
+# 生成結果は一括で受け取る complete() と、Server-Sent Events で断片ごとに受け取る
+# stream() の2通りで取得できる。
+#
+# このモジュールでは画面表示（st.*）は行わない。失敗は ProviderError で通知する。
+
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 接続設定（環境変数で上書きできる）
+POOL_SIZE = int(os.environ.get("SHORTSHORT_HTTP_POOL_SIZE", "10"))
+CONNECT_TIMEOUT = float(os.environ.get("SHORTSHORT_HTTP_CONNECT_TIMEOUT", "10"))
+READ_TIMEOUT = float(os.environ.get("SHORTSHORT_HTTP_READ_TIMEOUT", "60"))
+
+# 時間をおいて再試行すれば成功する見込みのあるステータスコード
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504, 529}
+
+# Server-Sent Events の行末
+_LINE_BREAK = re.compile(rb"\r\n|\r|\n")
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+class ProviderError(Exception):
+    """AI APIの呼び出しに失敗したときの例外"""
+
+    def __init__(self, message, status_code=None, retry_after=None, retryable=False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        # 再試行してよい失敗か（タイムアウト・接続エラー・429・5xx など）
+        self.retryable = retryable or status_code in RETRYABLE_STATUS
+
+
+def configure_transport(pool_size=None, connect_timeout=None, read_timeout=None):
+    """接続プールの大きさとタイムアウトを変更する
+
+    プールの大きさを変えた場合は、作成済みのセッションを閉じて作り直す。
+    """
+    global POOL_SIZE, CONNECT_TIMEOUT, READ_TIMEOUT
+    if connect_timeout is not None:
+        CONNECT_TIMEOUT = float(connect_timeout)
+    if read_timeout is not None:
+        READ_TIMEOUT = float(read_timeout)
+    if pool_size is not None and int(pool_size) != POOL_SIZE:
+        POOL_SIZE = int(pool_size)
+        close_sessions()
+
+
+def get_session(url):
+    """URLのエンドポイントに対応する共有セッションを取得"""
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}"
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            # 再試行は呼び出し側で制御するため、ここでは行わない
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=0)
+            session.mount(key + "/", adapter)
+            _sessions[key] = session
+    return session
+
+
+def close_sessions():
+    """作成済みのセッションをすべて閉じる"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def iter_response_lines(response, deadline=None):
+    """レスポンスを届いた順に行（bytes、改行を除く）に分ける
+
+    Server-Sent Events と同じく CR LF・LF・CR のいずれも行末とする。
+    requests の iter_lines はチャンクごとに行を分けるため、CR LF がチャンクの境目で分かれると
+    空行が1つ余分にでき、イベントが途中で区切られてしまう。ここでは境目の CR の直後の LF を読み飛ばす。
+    deadline（time.monotonic() 基準）を過ぎてからチャンクが届いた場合は、そこで失敗にする。
+    """
+    pending = b""
+    skip_lf = False
+    # chunk_size=None: チャンク転送では届いたチャンクをそのまま受け取る
+    for chunk in response.iter_content(chunk_size=None):
+        if deadline is not None and time.monotonic() > deadline:
+            raise ProviderError("期限内に生成が完了しませんでした")
+        if not chunk:
+            continue
+        if skip_lf:
+            skip_lf = False
+            if chunk.startswith(b"\n"):
+                chunk = chunk[1:]
+        lines = _LINE_BREAK.split(pending + chunk)
+        pending = lines.pop()
+        # チャンクが CR で終わる場合、次のチャンクの先頭の LF は同じ行末の続き
+        skip_lf = chunk.endswith(b"\r")
+        yield from lines
+    if pending:
+        yield pending
+
+
+def iter_sse_events(response, deadline=None):
+    """Server-Sent Events のレスポンスを (イベント名, データ) の組に分解する
+
+    データが複数行にわたる場合は改行でつなぐ。コメント行（":"で始まる行）は読み飛ばす。
+    deadline は iter_response_lines と同じ。
+    """
+    event = None
+    data_lines = []
+    for raw_line in iter_response_lines(response, deadline):
+        # Content-Type に文字コードが無いと requests は ISO-8859-1 とみなすため、自前でデコードする
+        line = raw_line.decode("utf-8")
+        if not line:
+            if data_lines:
+                yield event, "\n".join(data_lines)
+            event = None
+            data_lines = []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            event = value
+        elif field == "data":
+            data_lines.append(value)
+    if data_lines:
+        yield event, "\n".join(data_lines)
+
+
+def _parse_retry_after(response):
+    """Retry-After ヘッダーを待ち時間（秒）に変換（秒数・日時のどちらの形式にも対応）"""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class Provider:
+    """AI APIプロバイダーの基底クラス"""
+
+    name = ""
+    icon = ""
+    endpoint = ""
+    model = ""
+    # None はAPI側の既定値を使う
+    temperature = None
+    max_tokens = None
+
+    def __init__(self, endpoint=None, model=None):
+        if endpoint is not None:
+            self.endpoint = endpoint
+        if model is not None:
+            self.model = model
+
+    def generation_params(self):
+        """生成結果に影響するパラメーター（キャッシュのキーなどに使う）"""
+        return {"temperature": self.temperature, "max_tokens": self.max_tokens}
+
+    def build_request(self, api_key, prompt, stream=False):
+        """(URL, ヘッダー, 送信データ) を作成"""
+        raise NotImplementedError
+
+    def parse_response(self, result):
+        """レスポンスのJSONから本文を取り出す"""
+        raise NotImplementedError
+
+    def parse_stream_event(self, event, data):
+        """ストリーミングの1イベント（イベント名, JSON）から本文の断片を取り出す
+
+        本文を含まないイベントでは None を返す。
+        """
+        raise NotImplementedError
+
+    def is_stream_end(self, event, data):
+        """ストリーミングの1イベントが、生成が最後まで終わったことを表すか
+
+        "data: [DONE]" はどのプロバイダーでも終わりとして扱う。
+        """
+        return False
+
+    def _post(self, api_key, prompt, stream, timeout):
+        """リクエストを送信し、ステータスコード200のレスポンスを返す"""
+        url, headers, data = self.build_request(api_key, prompt, stream=stream)
+        if timeout is None:
+            timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+        try:
+            response = get_session(url).post(url, headers=headers, json=data,
+                                             timeout=timeout, stream=stream)
+        except requests.exceptions.Timeout:
+            raise ProviderError(f"{self.name} API 接続タイムアウト", retryable=True)
+        except requests.exceptions.RequestException as e:
+            raise ProviderError(f"{self.name} API 接続エラー: {str(e)}", retryable=True)
+
+        if response.status_code != 200:
+            error_msg = f"{self.name} API エラー: ステータスコード {response.status_code}"
+            try:
+                error_detail = response.json()
+                if 'error' in error_detail:
+                    error_msg += f" - {error_detail['error'].get('message', '')}"
+            except Exception:
+                pass
+            response.close()
+            raise ProviderError(error_msg, status_code=response.status_code,
+                                retry_after=_parse_retry_after(response))
+        return response
+
+    def complete(self, api_key, prompt, timeout=None):
+        """プロンプトを送信して生成結果を取得"""
+        response = self._post(api_key, prompt, False, timeout)
+        try:
+            return self.parse_response(response.json())
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise ProviderError(f"{self.name} API エラー: 応答を解析できません ({str(e)})",
+                                status_code=response.status_code)
+
+    def stream(self, api_key, prompt, timeout=None, deadline=None):
+        """プロンプトを送信し、生成結果を届いた順に断片ごとに返す（ジェネレーター）
+
+        読み込みタイムアウトは断片と断片の間隔に対して適用される。
+        終わりを表すイベントが届く前に接続が切れた場合は、再試行してよい ProviderError にする
+        （途中までの本文を完成した作品として扱わない）。
+        deadline（time.monotonic() 基準）を渡すと、少しずつ届き続けて読み込みタイムアウトに
+        かからない場合も、期限を過ぎた時点で受信を打ち切る（再試行しない ProviderError）。
+        """
+        response = self._post(api_key, prompt, True, timeout)
+        try:
+            finished = False
+            for event, data in iter_sse_events(response, deadline):
+                if data == "[DONE]":
+                    finished = True
+                    break
+                try:
+                    data = json.loads(data)
+                    text = self.parse_stream_event(event, data)
+                    # 終わりのイベントの後に届いたイベント（ping など）で取り消さない
+                    finished = finished or self.is_stream_end(event, data)
+                except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+                    raise ProviderError(f"{self.name} API エラー: 応答を解析できません ({str(e)})")
+                if text:
+                    yield text
+            if not finished:
+                raise ProviderError(f"{self.name} API 受信エラー: 生成の途中で接続が切れました", retryable=True)
+        except requests.exceptions.Timeout:
+            raise ProviderError(f"{self.name} API 受信タイムアウト", retryable=True)
+        except requests.exceptions.RequestException as e:
+            raise ProviderError(f"{self.name} API 接続エラー: {str(e)}", retryable=True)
+        finally:
+            response.close()
+
+
+class ClaudeProvider(Provider):
+    """Claude API"""
+
+    name = "Claude"
+    icon = "🧠"
+    endpoint = "https://api.anthropic.com/v1/messages"
+    model = "claude-3-haiku-20240307"
+    temperature = 0.9
+    max_tokens = 3000
+
+    def build_request(self, api_key, prompt, stream=False):
+        headers = {
+            "x-api-key": api_key,
+            "Content-Type": "application/json",
+            "anthropic-version": "2023-06-01"
+        }
+        data = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        if stream:
+            data["stream"] = True
+        return self.endpoint, headers, data
+
+    def parse_response(self, result):
+        return result["content"][0]["text"]
+
+    def parse_stream_event(self, event, data):
+        event = event or data.get("type")
+        if event == "content_block_delta":
+            return data["delta"].get("text")
+        if event == "error":
+            error = data["error"]
+            raise ProviderError(f"{self.name} API エラー: {error.get('message', '')}",
+                                retryable=error.get("type") in ("overloaded_error", "api_error"))
+        return None
+
+    def is_stream_end(self, event, data):
+        return (event or data.get("type")) == "message_stop"
+
+
+class ChatCompletionsProvider(Provider):
+    """OpenAI 互換の chat/completions API"""
+
+    temperature = 0.9
+    max_tokens = 3000
+
+    def build_request(self, api_key, prompt, stream=False):
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        data = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature
+        }
+        if stream:
+            data["stream"] = True
+        return self.endpoint, headers, data
+
+    def parse_response(self, result):
+        return result["choices"][0]["message"]["content"]
+
+    def parse_stream_event(self, event, data):
+        if "error" in data:
+            raise ProviderError(f"{self.name} API エラー: {data['error'].get('message', '')}")
+        if not data.get("choices"):
+            return None
+        return data["choices"][0].get("delta", {}).get("content")
+
+
+class GrokProvider(ChatCompletionsProvider):
+    """Grok API"""
+
+    name = "Grok"
+    icon = "🚀"
+    endpoint = "https://api.x.ai/v1/chat/completions"
+    model = "grok-beta"
+
+
+class OpenAIProvider(ChatCompletionsProvider):
+    """OpenAI API"""
+
+    name = "OpenAI"
+    icon = "🤖"
+    endpoint = "https://api.openai.com/v1/chat/completions"
+    model = "gpt-3.5-turbo"
+
+
+class GeminiProvider(Provider):
+    """Gemini API"""
+
+    name = "Gemini"
+    icon = "✨"
+    endpoint = "https://generativelanguage.googleapis.com/v1beta/models"
+    model = "gemini-pro"
+
+    def build_request(self, api_key, prompt, stream=False):
+        headers = {"Content-Type": "application/json"}
+        data = {"contents": [{"parts": [{"text": prompt}]}]}
+        if stream:
+            url = f"{self.endpoint}/{self.model}:streamGenerateContent?alt=sse&key={api_key}"
+        else:
+            url = f"{self.endpoint}/{self.model}:generateContent?key={api_key}"
+        return url, headers, data
+
+    def parse_response(self, result):
+        return result["candidates"][0]["content"]["parts"][0]["text"]
+
+    def parse_stream_event(self, event, data):
+        if "error" in data:
+            raise ProviderError(f"{self.name} API エラー: {data['error'].get('message', '')}")
+        candidates = data.get("candidates")
+        if not candidates:
+            return None
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return "".join(part.get("text", "") for part in parts)
+
+    def is_stream_end(self, event, data):
+        # Gemini は終わりのイベントを送らず、最後の断片に finishReason が付く
+        candidates = data.get("candidates")
+        return bool(candidates) and "finishReason" in candidates[0]
+
+
+# API種類 → プロバイダー
+PROVIDERS = {
+    "claude": ClaudeProvider(),
+    "grok": GrokProvider(),
+    "openai": OpenAIProvider(),
+    "gemini": GeminiProvider(),
+}
+
+
+def get_provider(api_type):
+    """API種類からプロバイダーを取得"""
+    provider = PROVIDERS.get(api_type)
+    if provider is None:
+        raise ValueError(f"サポートされていないAPI種類: {api_type}")
+    return provider
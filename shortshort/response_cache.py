@@ -0,0 +1,159 @@
+# response_cache.py
+# AI APIの生成結果をディスクに保存し、同じ条件の生成で再利用するキャッシュ
+#
+# キーは API種類・モデル名・生成パラメーター（temperature など）・プロンプトのハッシュから作り、
+# 1件を1つのJSONファイル（ファイル名はキーのSHA-256）として保存する。
+# 合計サイズが上限を超えると、最も長く使われていないものから削除する（LRU）。
+# 有効期限（TTL）を過ぎたものは読み込み時に削除する。
+#
+# 動作モード（環境変数 SHORTSHORT_CACHE_MODE）:
+#   on     : キャッシュを読み書きする（既定）
+#   off    : キャッシュを使わない
+#   replay : 保存済みの結果だけを返し、APIには接続しない（有効期限は無視）。
+#            保存済みの結果を固定データとして、テストや動作確認で生成を再現するのに使う
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+CACHE_DIR = os.environ.get(
+    "SHORTSHORT_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "responses"),
+)
+CACHE_MODE = os.environ.get("SHORTSHORT_CACHE_MODE", "on")
+CACHE_MAX_BYTES = int(os.environ.get("SHORTSHORT_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+CACHE_TTL = float(os.environ.get("SHORTSHORT_CACHE_TTL", str(7 * 24 * 60 * 60)))
+
+CACHE_MODES = ("on", "off", "replay")
+
+
+def prompt_hash(prompt):
+    """プロンプトのハッシュ（SHA-256の16進文字列）"""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def cache_key(api_type, model, params, prompt):
+    """キャッシュのキーを作成"""
+    key_data = {
+        "api_type": api_type,
+        "model": model,
+        "params": params,
+        "prompt_hash": prompt_hash(prompt),
+    }
+    canonical = json.dumps(key_data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """生成結果のディスクキャッシュ（複数のセッション・スレッドから共有できる）"""
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES, ttl=CACHE_TTL, mode=CACHE_MODE):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"未対応のキャッシュモードです: {mode}")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.mode = mode
+        self._lock = threading.Lock()
+        # キー → ファイルサイズ（先頭ほど長く使われていない）
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        if mode != "off":
+            os.makedirs(directory, exist_ok=True)
+            self._load_index()
+
+    @property
+    def enabled(self):
+        return self.mode != "off"
+
+    @property
+    def replay_only(self):
+        return self.mode == "replay"
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def _load_index(self):
+        """既存のファイルを最終使用時刻（mtime）順に並べて索引を作る"""
+        found = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, entry.name[:-5], stat.st_size))
+        found.sort()
+        for _, key, size in found:
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def _forget(self, key):
+        """索引とファイルから1件を削除（ロックを取得した状態で呼ぶ）"""
+        self._total_bytes -= self._entries.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def get(self, key):
+        """保存済みの生成結果を取得（無いか期限切れの場合は None）"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            if key not in self._entries:
+                return None
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                self._forget(key)
+                return None
+
+            if not self.replay_only and self.ttl and time.time() - record.get("created", 0) > self.ttl:
+                self._forget(key)
+                return None
+
+            # 最近使ったものとして記録する（再起動後もmtimeで順序を復元できる）
+            self._entries.move_to_end(key)
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return record["story"]
+
+    def put(self, key, story, **info):
+        """生成結果を保存（info には確認用の情報を一緒に記録する）"""
+        if not self.enabled or self.replay_only:
+            return
+        record = {"story": story, "created": time.time(), **info}
+        data = json.dumps(record, ensure_ascii=False, indent=1).encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            path = self._path(key)
+            tmp_path = f"{path}.tmp{os.getpid()}.{threading.get_ident()}"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+
+            # 上限を超えた分を古いものから削除する
+            while self._total_bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._forget(oldest)
+
+    def clear(self):
+        """保存済みの生成結果をすべて削除"""
+        with self._lock:
+            for key in list(self._entries):
+                self._forget(key)
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,183 @@
+# scheduler.py
+# AI APIへのリクエストを送信前に調整するスケジューラー
+#
+# プロバイダーごとに1つのスケジューラーをプロセス全体で共有し、
+#   - 1分あたりのリクエスト数（RPM）とトークン数（TPM）のトークンバケットで送信間隔を空ける
+#   - 429 の Retry-After を受け取ったら、そのプロバイダーへの送信を全体で止める
+#   - 429・5xx・タイムアウトは、ゆらぎ（ジッター）を入れた指数バックオフで再試行する
+#   - 呼び出し側ごとの期限（deadline）を過ぎる待ち・再試行は行わず、その時点で失敗にする
+#     （接続・読み込みタイムアウトも残り時間に収める。ストリーミング受信中の期限は
+#     request の中で Provider.stream に同じ deadline を渡して確認する）
+#
+# 上限値は環境変数 SHORTSHORT_<API種類>_RPM / SHORTSHORT_<API種類>_TPM で変更できる
+# （例: SHORTSHORT_CLAUDE_RPM=1000）。0 を指定するとその上限は設けない。
+
+import os
+import random
+import threading
+import time
+
+import providers
+from providers import ProviderError
+
+# API種類 → (RPM, TPM) の既定値（各社の最も低い利用枠を目安にした控えめな値）
+DEFAULT_RATE_LIMITS = {
+    "claude": (50, 40000),
+    "grok": (60, 100000),
+    "openai": (500, 200000),
+    "gemini": (60, 32000),
+}
+
+# 呼び出し側の期限の既定値（秒）
+DEFAULT_DEADLINE = float(os.environ.get("SHORTSHORT_REQUEST_DEADLINE", "180"))
+MAX_ATTEMPTS = int(os.environ.get("SHORTSHORT_MAX_ATTEMPTS", "5"))
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+# バケットに貯められる量（何秒分の送信をまとめて許すか）
+BURST_SECONDS = 10.0
+
+_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+
+def estimate_tokens(provider, prompt):
+    """リクエスト1回で消費するトークン数の見積もり
+
+    日本語はおおむね1文字1トークン前後になるため、プロンプトの文字数に
+    最大出力トークン数を加えたものを上限側の見積もりとして使う。
+    """
+    return len(prompt) + (provider.max_tokens or 0)
+
+
+class TokenBucket:
+    """1分あたりの上限で補充されるトークンバケット
+
+    残量は負になることを許し、先に予約した呼び出しから順に待ち時間が決まる。
+    ロックは呼び出し側（RequestScheduler）で取得する。
+    """
+
+    def __init__(self, per_minute, burst_seconds=BURST_SECONDS):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount, now):
+        """amount を使えるようになるまでの待ち時間（秒）"""
+        self._refill(now)
+        # バケットより大きい要求は、満杯になるまで待てば送れることにする
+        amount = min(amount, self.capacity)
+        return max(0.0, (amount - self.level) / self.rate)
+
+    def consume(self, amount):
+        self.level -= min(amount, self.capacity)
+
+
+class RequestScheduler:
+    """1つのプロバイダーへのリクエストを調整する"""
+
+    def __init__(self, rpm=None, tpm=None, max_attempts=MAX_ATTEMPTS, burst_seconds=BURST_SECONDS):
+        self.request_bucket = TokenBucket(rpm, burst_seconds) if rpm else None
+        self.token_bucket = TokenBucket(tpm, burst_seconds) if tpm else None
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        # Retry-After により送信を止めている期限（time.monotonic() の値）
+        self._paused_until = 0.0
+
+    def _reserve(self, tokens, deadline):
+        """送信枠を予約し、送信までの待ち時間を返す（期限に間に合わない場合は None）"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._paused_until - now)
+            if self.request_bucket is not None:
+                wait = max(wait, self.request_bucket.wait_time(1, now))
+            if self.token_bucket is not None:
+                wait = max(wait, self.token_bucket.wait_time(tokens, now))
+            if now + wait > deadline:
+                return None
+            if self.request_bucket is not None:
+                self.request_bucket.consume(1)
+            if self.token_bucket is not None:
+                self.token_bucket.consume(tokens)
+            return wait
+
+    def pause(self, seconds):
+        """このプロバイダーへの送信を seconds 秒止める（Retry-After）"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def backoff(self, attempt):
+        """attempt 回目の失敗後の待ち時間（上限付き指数バックオフ＋フルジッター）"""
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+    def run(self, request, tokens=1, deadline=None, on_wait=None):
+        """request(timeout) を送信枠・再試行を調整しながら実行し、その戻り値を返す
+
+        deadline は time.monotonic() 基準の期限（None の場合は DEFAULT_DEADLINE 秒後）。
+        request にはその回の送信に使うタイムアウトだけを渡すので、ストリーミングで受信する場合は
+        同じ deadline を Provider.stream にも渡す。
+        on_wait(秒数, 理由) を渡すと、待つ前に呼び出される（画面表示用）。
+        """
+        if deadline is None:
+            deadline = time.monotonic() + DEFAULT_DEADLINE
+
+        attempt = 0
+        while True:
+            wait = self._reserve(tokens, deadline)
+            if wait is None:
+                raise ProviderError("送信上限のため、期限内にリクエストを送信できません",
+                                    retryable=True)
+            if wait > 0:
+                if on_wait is not None:
+                    on_wait(wait, "送信上限")
+                time.sleep(wait)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ProviderError("期限内に生成が完了しませんでした")
+            timeout = (min(providers.CONNECT_TIMEOUT, remaining),
+                       min(providers.READ_TIMEOUT, remaining))
+            try:
+                return request(timeout)
+            except ProviderError as e:
+                attempt += 1
+                if not e.retryable or attempt >= self.max_attempts:
+                    raise
+                if e.retry_after is not None:
+                    delay = e.retry_after
+                    self.pause(delay)
+                else:
+                    delay = self.backoff(attempt)
+                if time.monotonic() + delay > deadline:
+                    raise
+                if on_wait is not None:
+                    on_wait(delay, str(e))
+                # Retry-After の場合は次の _reserve で待つ
+                if e.retry_after is None:
+                    time.sleep(delay)
+
+
+def _limit_from_env(api_type, name, default):
+    value = os.environ.get(f"SHORTSHORT_{api_type.upper()}_{name}")
+    return int(value) if value is not None else default
+
+
+def get_scheduler(api_type):
+    """API種類ごとの共有スケジューラーを取得"""
+    scheduler = _schedulers.get(api_type)
+    if scheduler is not None:
+        return scheduler
+    with _schedulers_lock:
+        scheduler = _schedulers.get(api_type)
+        if scheduler is None:
+            rpm, tpm = DEFAULT_RATE_LIMITS.get(api_type, (0, 0))
+            scheduler = RequestScheduler(
+                rpm=_limit_from_env(api_type, "RPM", rpm),
+                tpm=_limit_from_env(api_type, "TPM", tpm),
+            )
+            _schedulers[api_type] = scheduler
+    return scheduler
@@ -0,0 +1,287 @@
+# story_store.py
+# 生成したショートショート（作品群）をSQLiteに保存するストア
+#
+# 作品群はブラウザのセッションごとに1つ作り、URLの ?group=<キー> で識別する。
+# ページを再読み込みしても、同じURLなら作品群がそのまま残る。
+#
+# データベースはWALモードで開き、複数のセッション（スレッド）から
+# 接続プール経由で同時に読み書きできるようにする。
+# 一覧・並べ替え・書き出しは、評価と生成日時の索引を使ったクエリで行う。
+# 作品群には変更（追加・評価・削除）のたびに増えるバージョン番号があり、
+# 書き出しファイルなどのキャッシュのキーに使う。
+# 評価は★ごとの累計（star_ratings）にも反映し、評価による要素の抽出（bandit.py）が
+# セッションやサーバーの再起動をまたいで学習を引き継げるようにする。
+# このモジュールでは画面表示（st.*）は行わない。
+
+import json
+import os
+import queue
+import secrets
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+DB_PATH = os.environ.get(
+    "SHORTSHORT_DB_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "stories.db"),
+)
+POOL_SIZE = int(os.environ.get("SHORTSHORT_DB_POOL_SIZE", "8"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS story_groups (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    created REAL NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS stories (
+    id INTEGER PRIMARY KEY,
+    group_id INTEGER NOT NULL REFERENCES story_groups(id),
+    created REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    rating INTEGER NOT NULL DEFAULT 0,
+    word_count INTEGER,
+    elements TEXT NOT NULL,
+    star_ids TEXT,
+    corpus_hash TEXT,
+    prompt TEXT NOT NULL,
+    story TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS stories_by_rating ON stories (group_id, rating DESC, id);
+CREATE INDEX IF NOT EXISTS stories_by_created ON stories (group_id, created);
+CREATE TABLE IF NOT EXISTS corpora (
+    id INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS star_ratings (
+    corpus_id INTEGER NOT NULL REFERENCES corpora(id),
+    star_id INTEGER NOT NULL,
+    successes REAL NOT NULL DEFAULT 0,
+    failures REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (corpus_id, star_id)
+) WITHOUT ROWID;
+"""
+
+# 一覧で取得する列（作品データの辞書のキーと同じ名前にする）
+_COLUMNS = "id, timestamp, rating, word_count, elements, star_ids, corpus_hash, prompt, story"
+
+# 並べ順 → ORDER BY 句（同じ評価の中では生成順）
+ORDERS = {
+    "rating": "rating DESC, id",
+    "created": "created, id",
+}
+
+
+def rating_deltas(old_rating, new_rating):
+    """評価の変更による★ごとの累計（成功, 失敗）の増減
+
+    ☆1～5を報酬 0～1 とし、報酬を成功、1 - 報酬を失敗として数える。
+    未評価（0）は何も数えない。
+    """
+    def counts(rating):
+        if rating <= 0:
+            return 0.0, 0.0
+        reward = (rating - 1) / 4
+        return reward, 1.0 - reward
+
+    old_successes, old_failures = counts(old_rating)
+    new_successes, new_failures = counts(new_rating)
+    return new_successes - old_successes, new_failures - old_failures
+
+
+def _row_to_story(row):
+    """データベースの行を作品データ（辞書）に変換"""
+    story_id, timestamp, rating, word_count, elements, star_ids, corpus_hash, prompt, story = row
+    return {
+        "id": story_id,
+        "timestamp": timestamp,
+        "user_rating": rating,
+        "word_count": word_count,
+        "elements": [tuple(element) for element in json.loads(elements)],
+        "star_ids": json.loads(star_ids) if star_ids else None,
+        "corpus_hash": corpus_hash,
+        "prompt": prompt,
+        "story": story,
+    }
+
+
+class StoryStore:
+    """作品群のSQLiteストア（複数のセッション・スレッドから共有できる）"""
+
+    def __init__(self, path=DB_PATH, pool_size=POOL_SIZE):
+        self.path = path
+        self._pool = queue.LifoQueue()
+        self._pool_size = pool_size
+        self._created = 0
+        self._lock = threading.Lock()
+        with self.connection() as conn:
+            conn.executescript(SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(story_groups)")}
+            if "version" not in columns:
+                conn.execute("ALTER TABLE story_groups ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """プールから接続を借りる（使い終わったら返す）"""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self._pool_size
+                if can_create:
+                    self._created += 1
+            conn = self._connect() if can_create else self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def transaction(self):
+        """接続を借りてトランザクションを実行する（例外時はロールバック）"""
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _bump_version(self, conn, group_id):
+        conn.execute("UPDATE story_groups SET version = version + 1 WHERE id = ?", (group_id,))
+
+    def create_group(self):
+        """新しい作品群を作り、そのキーを返す"""
+        key = secrets.token_urlsafe(9)
+        with self.connection() as conn:
+            conn.execute("INSERT INTO story_groups (key, created) VALUES (?, ?)", (key, time.time()))
+        return key
+
+    def group_id(self, key):
+        """作品群のキーから番号を取得（存在しない場合は None）"""
+        with self.connection() as conn:
+            row = conn.execute("SELECT id FROM story_groups WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def group_version(self, group_id):
+        """作品群のバージョン番号（作品群が変更されるたびに増える）"""
+        with self.connection() as conn:
+            row = conn.execute("SELECT version FROM story_groups WHERE id = ?", (group_id,)).fetchone()
+        return row[0] if row else None
+
+    def add_story(self, group_id, story_data):
+        """作品を追加し、番号を付けた作品データを返す"""
+        star_ids = story_data.get("star_ids")
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO stories (group_id, created, timestamp, rating, word_count, elements,"
+                " star_ids, corpus_hash, prompt, story) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    group_id,
+                    time.time(),
+                    story_data["timestamp"],
+                    story_data.get("user_rating", 0),
+                    story_data.get("word_count"),
+                    json.dumps(story_data["elements"], ensure_ascii=False),
+                    json.dumps([int(j) for j in star_ids]) if star_ids is not None else None,
+                    story_data.get("corpus_hash"),
+                    story_data["prompt"],
+                    story_data["story"],
+                ),
+            )
+            self._bump_version(conn, group_id)
+        return dict(story_data, id=cursor.lastrowid)
+
+    def set_rating(self, story_id, rating):
+        """作品の評価を更新し、使った★の評価の累計にも反映する
+
+        累計を変更した場合は (物語要素データのハッシュ, ★番号のリスト, 成功の増減, 失敗の増減)
+        を返す（評価が変わらない場合や、★番号が記録されていない作品では None）。
+        """
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT group_id, rating, star_ids, corpus_hash FROM stories WHERE id = ?", (story_id,)
+            ).fetchone()
+            if row is None or row[1] == rating:
+                return None
+            group_id, old_rating, star_ids, corpus_hash = row
+            conn.execute("UPDATE stories SET rating = ? WHERE id = ?", (rating, story_id))
+            self._bump_version(conn, group_id)
+
+            if not star_ids or not corpus_hash:
+                return None
+            star_ids = json.loads(star_ids)
+            d_successes, d_failures = rating_deltas(old_rating, rating)
+            conn.execute("INSERT OR IGNORE INTO corpora (hash) VALUES (?)", (corpus_hash,))
+            corpus_id = conn.execute("SELECT id FROM corpora WHERE hash = ?", (corpus_hash,)).fetchone()[0]
+            conn.executemany(
+                "INSERT INTO star_ratings (corpus_id, star_id, successes, failures) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (corpus_id, star_id) DO UPDATE SET"
+                " successes = successes + excluded.successes, failures = failures + excluded.failures",
+                [(corpus_id, star_id, d_successes, d_failures) for star_id in star_ids],
+            )
+        return corpus_hash, star_ids, d_successes, d_failures
+
+    def star_ratings(self, corpus_hash):
+        """物語要素データごとの★の評価の累計 {★番号: (成功, 失敗)}"""
+        with self.connection() as conn:
+            rows = conn.execute(
+                "SELECT star_id, successes, failures FROM star_ratings"
+                " WHERE corpus_id = (SELECT id FROM corpora WHERE hash = ?)",
+                (corpus_hash,),
+            ).fetchall()
+        return {star_id: (successes, failures) for star_id, successes, failures in rows}
+
+    def count(self, group_id):
+        """作品群の作品数"""
+        with self.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM stories WHERE group_id = ?", (group_id,)).fetchone()[0]
+
+    def list_stories(self, group_id, order="rating", limit=None):
+        """作品群の作品を並べ順（ORDERS のキー）に従って取得"""
+        sql = f"SELECT {_COLUMNS} FROM stories WHERE group_id = ? ORDER BY {ORDERS[order]}"
+        params = [group_id]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self.connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [_row_to_story(row) for row in rows]
+
+    def iter_stories(self, group_id, order="rating", batch_size=64):
+        """作品群の作品を並べ順に従って少しずつ読み込む（ジェネレーター）
+
+        書き出しなど、全作品を一度にメモリに載せたくない場合に使う。
+        """
+        sql = f"SELECT {_COLUMNS} FROM stories WHERE group_id = ? ORDER BY {ORDERS[order]}"
+        with self.connection() as conn:
+            cursor = conn.execute(sql, (group_id,))
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield _row_to_story(row)
+
+    def clear_group(self, group_id):
+        """作品群の作品をすべて削除"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM stories WHERE group_id = ?", (group_id,))
+            self._bump_version(conn, group_id)
+
+    def close(self):
+        """プールの接続をすべて閉じる"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,97 @@
+# story_corpus
+# デスクトップ版・Web版・ショートショート版で共有する物語要素データの読み込み
+
+from .bitset import StarBitset
+from .compiled import (
+    CompiledCorpus,
+    compile_corpus,
+    compiled_path_for,
+    content_hash,
+    load_compiled,
+    open_compiled,
+    write_compiled,
+)
+from .corpus import COMPILED_PATH, SOURCE_PATH, corpus_hash, load_corpus
+from .diversity import StarVectors, sample_diverse_stars
+from .names import generate_katakana_name
+from .prompts import (
+    ENDING_KEYS,
+    GENRE_KEYS,
+    PROMPT_TEXTS,
+    build_desktop_prompt,
+    build_shortshort_prompt,
+    build_web_prompt,
+    web_prompt_template,
+)
+from .recipes import RECIPE_TEMPLATES, build_recipe_prompt, decode_recipe, encode_recipe
+from .sampler import (
+    SAMPLER_VERSION,
+    elements_from_ids,
+    iter_element_sets,
+    make_rng,
+    sample_elements,
+    sample_genre_elements,
+    sample_genre_stars,
+    sample_star_batch,
+    sample_stars,
+)
+from .search import search_stars
+from .templates import PromptTemplate
+from .weighted import (
+    DISTRIBUTIONS,
+    AliasTable,
+    FenwickTree,
+    distribution_table,
+    sample_alias_stars,
+    sample_distribution_elements,
+    sample_weighted_stars,
+    star_weights,
+)
+
+__all__ = [
+    "AliasTable",
+    "COMPILED_PATH",
+    "CompiledCorpus",
+    "DISTRIBUTIONS",
+    "ENDING_KEYS",
+    "FenwickTree",
+    "GENRE_KEYS",
+    "PROMPT_TEXTS",
+    "PromptTemplate",
+    "RECIPE_TEMPLATES",
+    "SAMPLER_VERSION",
+    "SOURCE_PATH",
+    "StarBitset",
+    "StarVectors",
+    "build_desktop_prompt",
+    "build_recipe_prompt",
+    "build_shortshort_prompt",
+    "build_web_prompt",
+    "compile_corpus",
+    "compiled_path_for",
+    "content_hash",
+    "corpus_hash",
+    "decode_recipe",
+    "distribution_table",
+    "elements_from_ids",
+    "encode_recipe",
+    "generate_katakana_name",
+    "iter_element_sets",
+    "load_compiled",
+    "load_corpus",
+    "make_rng",
+    "open_compiled",
+    "sample_alias_stars",
+    "sample_distribution_elements",
+    "sample_diverse_stars",
+    "sample_elements",
+    "sample_genre_elements",
+    "sample_genre_stars",
+    "sample_star_batch",
+    "sample_stars",
+    "sample_weighted_stars",
+    "search_stars",
+    "star_weights",
+    "web_prompt_template",
+    "write_compiled",
+]
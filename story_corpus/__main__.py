@@ -0,0 +1,7 @@
+# python -m story_corpus で cli.py を実行する
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,59 @@
+# bitset.py
+# ★番号の集合をビット列で持つ（選択済み・使用済みの★の管理用）
+#
+# ★番号は物語要素データ（compiled.py）の★の通し番号で、同じデータなら変わらない。
+# ★7054個でも約900バイトで、含まれるかどうかの判定はビット演算1回で済む。
+# テキストは表示するときにだけ corpus.element(★番号) で取り出す。
+# 反復すると★番号を昇順に返すので、そのまま sampler の exclude に渡せる。
+
+
+class StarBitset:
+    """★番号の集合（★の数と同じ長さのビット列）"""
+
+    __slots__ = ("n_stars", "_bits", "_count")
+
+    def __init__(self, n_stars, star_ids=()):
+        self.n_stars = n_stars
+        self._bits = bytearray((n_stars + 7) >> 3)
+        self._count = 0
+        for star_id in star_ids:
+            self.add(star_id)
+
+    def __contains__(self, star_id):
+        if 0 <= star_id < self.n_stars:
+            return self._bits[star_id >> 3] >> (star_id & 7) & 1 == 1
+        return False
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        # 立っているビットだけを下位から順に取り出す（★の数ではなく要素数に比例）
+        bits = int.from_bytes(self._bits, "little")
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def __repr__(self):
+        return f"StarBitset({self.n_stars}, {list(self)})"
+
+    def add(self, star_id):
+        """★番号を加える"""
+        if not 0 <= star_id < self.n_stars:
+            raise ValueError(f"★番号が範囲外です: {star_id}")
+        mask = 1 << (star_id & 7)
+        if not self._bits[star_id >> 3] & mask:
+            self._bits[star_id >> 3] |= mask
+            self._count += 1
+
+    def discard(self, star_id):
+        """★番号を除く（含まれていなければ何もしない）"""
+        if star_id in self:
+            self._bits[star_id >> 3] &= ~(1 << (star_id & 7)) & 0xFF
+            self._count -= 1
+
+    def clear(self):
+        """すべて除く"""
+        self._bits = bytearray(len(self._bits))
+        self._count = 0
@@ -0,0 +1,276 @@
+# cli.py
+# コマンドラインからプロンプトを大量に生成して JSONL で出力する
+# （物語要素の検索もできる）
+#
+# 使い方:
+#   python -m story_corpus prompts --template web -n 10000 -o prompts.jsonl
+#   python -m story_corpus prompts --template shortshort -n 100 > prompts.jsonl
+#   python -m story_corpus search 時間 旅行
+#   python -m story_corpus recipe DATMFPM4CLABLK5WP2SJGEXQQWV6NEA
+#   python -m story_corpus duplicates --limit 20
+#
+# 1件ずつ生成して書き出すので、件数が増えてもメモリ使用量は変わらない。
+
+import argparse
+import json
+import os
+import random
+import sys
+from collections import defaultdict
+
+from .compiled import load_compiled
+from .corpus import load_corpus
+from .diversity import sample_diverse_stars
+from .names import generate_katakana_name
+from .prompts import (
+    ENDING_KEYS,
+    GENRE_KEYS,
+    PROMPT_TEXTS,
+    build_desktop_prompt,
+    build_shortshort_prompt,
+    build_web_prompt,
+)
+from .recipes import build_recipe_prompt, decode_recipe, encode_recipe
+from .sampler import choice, make_rng, sample_genre_stars, sample_stars
+from .search import search_stars
+from .weighted import distribution_table, sample_alias_stars
+
+# テンプレートごとの既定値（各アプリの初期値に合わせる）
+TEMPLATE_DEFAULTS = {
+    "desktop": {"elements": 3, "word_count": 1000},
+    "web": {"elements": 2, "word_count": 800},
+    "shortshort": {"elements": 5, "word_count": 1200},
+}
+
+
+def iter_prompt_records(corpus, args):
+    """プロンプトを1件ずつ生成
+
+    各レコードには専用のシード（seed）を記録する。同じ設定と seed で
+    generate_record を呼べば、同じプロンプトを再生成できる。
+    --seed を指定した場合は、各レコードのシードもそこから決まる。
+    """
+    seed_stream = make_rng(args.seed) if args.seed is not None else random.SystemRandom()
+    for index in range(args.count):
+        record_seed = int(seed_stream.random() * (1 << 53))
+        yield {"index": index, **generate_record(corpus, args, record_seed)}
+
+
+def generate_record(corpus, args, seed):
+    """シード1つから1件分のプロンプトを生成"""
+    rng = make_rng(seed)
+    clusters = corpus.star_clusters if args.one_per_cluster else None
+    genre_key = None
+    if args.template == "web" and args.genre_bias > 0:
+        # ジャンルに合わせて抽出する場合は、先にジャンルを決める
+        genre_key = choice(rng, GENRE_KEYS) if args.genre == "random" else args.genre
+    if args.diversity > 0:
+        preferred = corpus.genre_star_ids(genre_key) if genre_key is not None else ()
+        star_ids = sample_diverse_stars(corpus.star_vectors, args.elements, args.diversity, seed=rng,
+                                        preferred=preferred, bias=args.genre_bias, clusters=clusters)
+    elif genre_key is not None:
+        star_ids = sample_genre_stars(corpus.n_stars, corpus.genre_star_ids(genre_key),
+                                      args.elements, args.genre_bias, seed=rng, clusters=clusters)
+    elif args.distribution != "stars":
+        star_ids = sample_alias_stars(distribution_table(corpus, args.distribution), args.elements,
+                                      seed=rng, clusters=clusters)
+    else:
+        star_ids = sample_stars(corpus.n_stars, args.elements, seed=rng, clusters=clusters)
+    elements = [corpus.element(j) for j in star_ids]
+    record = {
+        "seed": seed,
+        "template": args.template,
+        "word_count": args.word_count,
+        "star_ids": star_ids,
+        "elements": [{"item": item, "star": star} for item, star in elements],
+    }
+    if args.distribution != "stars":
+        record["distribution"] = args.distribution
+    if args.one_per_cluster:
+        record["one_per_cluster"] = True
+    if args.diversity > 0:
+        record["diversity"] = args.diversity
+
+    if args.template == "desktop":
+        if args.names:
+            characters = args.names
+        else:
+            characters = [generate_katakana_name(rng) for _ in range(args.characters)]
+        record["characters"] = characters
+        record["prompt"] = build_desktop_prompt(elements, args.word_count, characters)
+
+    elif args.template == "web":
+        if genre_key is None:
+            genre_key = choice(rng, GENRE_KEYS) if args.genre == "random" else args.genre
+        ending_key = choice(rng, ENDING_KEYS) if args.ending == "random" else args.ending
+        texts = PROMPT_TEXTS[args.lang]
+        record.update(lang=args.lang, genre=genre_key, ending=ending_key)
+        if args.genre_bias > 0:
+            record["genre_bias"] = args.genre_bias
+        record["prompt"] = build_web_prompt(
+            elements, args.word_count, texts[genre_key], texts[ending_key], args.lang
+        )
+
+    else:
+        record["prompt"] = build_shortshort_prompt(elements, args.word_count)
+
+    if args.recipe:
+        record["recipe"] = encode_recipe(
+            corpus, args.template, star_ids, args.word_count, lang=args.lang,
+            genre=record.get("genre", GENRE_KEYS[0]), ending=record.get("ending", ENDING_KEYS[0]),
+            characters=record.get("characters", ()),
+        )
+    return record
+
+
+def write_jsonl(records, out):
+    """レコードを1行ずつJSONで書き出す"""
+    written = 0
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False))
+        out.write("\n")
+        written += 1
+    return written
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m story_corpus",
+        description="物語要素データのコマンドラインツール",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    prompts = subparsers.add_parser("prompts", help="プロンプトを生成して JSONL で出力")
+    prompts.add_argument("--template", choices=sorted(TEMPLATE_DEFAULTS), default="web",
+                         help="プロンプトの種類（既定: web）")
+    prompts.add_argument("-n", "--count", type=int, default=1, help="生成する件数")
+    prompts.add_argument("--elements", type=int, help="1件あたりの物語要素の数")
+    prompts.add_argument("--word-count", type=int, help="文字数")
+    prompts.add_argument("--lang", choices=sorted(PROMPT_TEXTS), default="ja",
+                         help="言語（web のみ）")
+    prompts.add_argument("--genre", choices=GENRE_KEYS + ["random"], default=GENRE_KEYS[0],
+                         help="ジャンル（web のみ、random で1件ごとに選ぶ）")
+    prompts.add_argument("--genre-bias", type=float, default=0.0,
+                         help="物語要素をジャンルに合わせる度合い 0～1（web のみ、既定: 0 = ジャンルに関係なく抽出）")
+    prompts.add_argument("--distribution", choices=["stars", "items"], default="stars",
+                         help="物語要素の抽出の分布（stars: ★ごとに一様（既定）、items: 項目ごとに一様）")
+    prompts.add_argument("--one-per-cluster", action="store_true",
+                         help="ほぼ重複する★（同じクラスタの★）を1件に1個までにする")
+    prompts.add_argument("--diversity", type=float, default=0.0,
+                         help="似た物語要素を避ける度合い 0～1（MMR、NumPy が必要。既定: 0 = 避けない）")
+    prompts.add_argument("--ending", choices=ENDING_KEYS + ["random"], default=ENDING_KEYS[0],
+                         help="終わり方（web のみ、random で1件ごとに選ぶ）")
+    prompts.add_argument("--characters", type=int, default=2,
+                         help="登場人物数（desktop のみ、名前はランダム）")
+    prompts.add_argument("--names", type=lambda s: [n for n in s.split(",") if n],
+                         help="登場人物名をカンマ区切りで指定（desktop のみ）")
+    prompts.add_argument("--seed", type=int, help="乱数のシード（同じシードなら同じ出力になる）")
+    prompts.add_argument("--recipe", action="store_true",
+                         help="各レコードにレシピコード（recipe）を加える（recipe コマンドで同じプロンプトを再生成できる）")
+    prompts.add_argument("--corpus", help="story_elements.json のパス（省略時は共通データ）")
+    prompts.add_argument("-o", "--output", help="出力先ファイル（省略時は標準出力）")
+
+    search = subparsers.add_parser("search", help="物語要素を検索")
+    search.add_argument("query", nargs="+", help="検索語（複数指定するとすべてを含むものを探す）")
+    search.add_argument("--limit", type=int, default=20, help="表示する件数（既定: 20）")
+    search.add_argument("--corpus", help="story_elements.json のパス（省略時は共通データ）")
+
+    duplicates = subparsers.add_parser("duplicates", help="ほぼ重複する★のクラスタを大きい順に表示")
+    duplicates.add_argument("--limit", type=int, default=0, help="表示するクラスタの数（既定: 0 = すべて）")
+    duplicates.add_argument("--corpus", help="story_elements.json のパス（省略時は共通データ）")
+
+    recipe = subparsers.add_parser("recipe", help="レシピコードからプロンプトを再生成して JSONL で出力")
+    recipe.add_argument("codes", nargs="+", metavar="code", help="レシピコード")
+    recipe.add_argument("--corpus", help="story_elements.json のパス（省略時は共通データ）")
+    return parser
+
+
+def run_prompts(args):
+    defaults = TEMPLATE_DEFAULTS[args.template]
+    if args.elements is None:
+        args.elements = defaults["elements"]
+    if args.word_count is None:
+        args.word_count = defaults["word_count"]
+
+    corpus = load_compiled(args.corpus) if args.corpus else load_corpus()
+    records = iter_prompt_records(corpus, args)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="\n") as out:
+            written = write_jsonl(records, out)
+        print(f"{written}件のプロンプトを {args.output} に出力しました", file=sys.stderr)
+    else:
+        # Windowsのコンソールでも日本語をそのまま出力できるようにする
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(encoding="utf-8", newline="\n")
+        try:
+            write_jsonl(records, sys.stdout)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # head などで途中まで読まれた場合は静かに終了する
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            return 1
+    return 0
+
+
+def run_search(args):
+    corpus = load_compiled(args.corpus) if args.corpus else load_corpus()
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8")
+    for star_index in search_stars(corpus, " ".join(args.query), args.limit):
+        item, star = corpus.element(star_index)
+        print(f"{star_index}\t{item}\t{star}")
+    return 0
+
+
+def run_duplicates(args):
+    corpus = load_compiled(args.corpus) if args.corpus else load_corpus()
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8")
+    members = defaultdict(list)
+    for star_index, cluster in enumerate(corpus.star_clusters):
+        members[cluster].append(star_index)
+    clusters = sorted((ids for ids in members.values() if len(ids) > 1), key=lambda ids: (-len(ids), ids[0]))
+    print(f"{len(clusters)}個のクラスタ（{sum(map(len, clusters))}個の★）", file=sys.stderr)
+    for ids in clusters[:args.limit or None]:
+        for star_index in ids:
+            item, star = corpus.element(star_index)
+            print(f"{ids[0]}\t{star_index}\t{item}\t{star}")
+        print()
+    return 0
+
+
+def run_recipe(args):
+    corpus = load_compiled(args.corpus) if args.corpus else load_corpus()
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8", newline="\n")
+    status = 0
+    for code in args.codes:
+        try:
+            recipe = decode_recipe(code)
+            prompt = build_recipe_prompt(corpus, recipe)
+        except ValueError as e:
+            print(f"{code}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        write_jsonl([{"recipe": code, **recipe, "prompt": prompt}], sys.stdout)
+    return status
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "prompts" and args.genre_bias > 0 and args.distribution != "stars":
+        parser.error("--genre-bias と --distribution items は同時に指定できません")
+    if args.command == "prompts" and args.diversity > 0 and args.distribution != "stars":
+        parser.error("--diversity と --distribution items は同時に指定できません")
+    if args.command == "prompts":
+        return run_prompts(args)
+    if args.command == "search":
+        return run_search(args)
+    if args.command == "duplicates":
+        return run_duplicates(args)
+    if args.command == "recipe":
+        return run_recipe(args)
+    return 1
@@ -0,0 +1,105 @@
+# clusters.py
+# 言い換えに近い★（ほぼ重複する★）のクラスタ
+#
+# 物語要素事典には、見出し語が違っても文がほとんど同じ★がある
+# （「蟻の大群が、不特定多数の人々を襲う。」と「鳥の大群が、不特定多数の人々を襲う。」など）。
+# これらが1つのプロンプトに入ると物語要素の枠が1つ無駄になるので、クラスタにまとめておき、
+# 抽出関数（sampler.py・weighted.py）の clusters 引数で「1クラスタから1個まで」にできる。
+#
+# 判定:
+#   ★テキスト本体（番号を除き、検索と同じ正規化をして記号を除いたもの）の文字2-gramの集合の
+#   Jaccard 係数が JACCARD_THRESHOLD 以上の★どうしをつなぎ、つながったものを1つのクラスタとする。
+#   全ペア（約2500万組）を比べる代わりに、MinHash（NUM_HASHES 個のハッシュ値の最小値）を
+#   LSH_BANDS 個の帯に分け、どれかの帯が一致した組だけを候補として Jaccard 係数を確かめる。
+#   2-gram のハッシュ値は shake_128 の出力をそのまま u32 の並びとして使うので、2-gram ごとに
+#   ハッシュ関数を1回呼ぶだけで済む（NumPy は不要）。
+#
+# 結果はコンパイル時に1回だけ求め、★ごとのクラスタ番号（クラスタ内で最小の★番号。
+# どの★とも似ていない★は自分自身の★番号）として物語要素バイナリ（compiled.py）に格納する。
+# パラメータを変更すると CLUSTERS_HASH が変わり、古いバイナリは読み込み時に作り直される。
+
+import hashlib
+import json
+import sys
+from array import array
+from collections import defaultdict
+from itertools import combinations
+
+from .search import star_search_text, word_bigrams
+
+JACCARD_THRESHOLD = 0.5
+NUM_HASHES = 60
+LSH_BANDS = 20
+_ROWS = NUM_HASHES // LSH_BANDS
+
+CLUSTERS_HASH = hashlib.sha256(
+    json.dumps([JACCARD_THRESHOLD, NUM_HASHES, LSH_BANDS], separators=(",", ":")).encode("ascii")
+).digest()[:8]
+
+
+def star_shingles(star):
+    """★テキストの文字2-gramの集合（search.word_bigrams。1文字以下の★はその文字列だけ）"""
+    return set(word_bigrams(star_search_text(star)))
+
+
+def _shingle_hashes(shingle):
+    values = array("I", hashlib.shake_128(shingle.encode("utf-8")).digest(4 * NUM_HASHES))
+    if sys.byteorder != "little":
+        values.byteswap()
+    # タプルにしておくと、zip で取り出すときに整数を作り直さずに済む
+    return tuple(values)
+
+
+def minhash_signatures(shingle_sets):
+    """2-gramの集合ごとの MinHash（NUM_HASHES 個の最小値のタプル）"""
+    hashes = {shingle: _shingle_hashes(shingle) for shingle in set().union(*shingle_sets)}
+    return [tuple(map(min, zip(*[hashes[shingle] for shingle in shingles]))) for shingles in shingle_sets]
+
+
+def candidate_pairs(signatures):
+    """MinHash の帯のどれかが一致する★番号の組 (i, j)（i < j）の集合"""
+    pairs = set()
+    for start in range(0, LSH_BANDS * _ROWS, _ROWS):
+        buckets = defaultdict(list)
+        for star_index, signature in enumerate(signatures):
+            buckets[signature[start:start + _ROWS]].append(star_index)
+        for members in buckets.values():
+            if len(members) > 1:
+                pairs.update(combinations(members, 2))
+    return pairs
+
+
+def jaccard(a, b):
+    """2つの集合の Jaccard 係数"""
+    return len(a & b) / len(a | b)
+
+
+def near_duplicate_pairs(stars):
+    """★テキストの並びから、ほぼ重複する★番号の組 [(i, j, Jaccard 係数), ...] を求める"""
+    shingle_sets = [star_shingles(star) for star in stars]
+    pairs = []
+    for i, j in sorted(candidate_pairs(minhash_signatures(shingle_sets))):
+        similarity = jaccard(shingle_sets[i], shingle_sets[j])
+        if similarity >= JACCARD_THRESHOLD:
+            pairs.append((i, j, similarity))
+    return pairs
+
+
+def build_star_clusters(story_elements):
+    """物語要素のリストから★ごとのクラスタ番号（クラスタ内で最小の★番号）の並びを作る"""
+    stars = [star for item_data in story_elements for star in item_data["stars"]]
+
+    # Union-Find（根は常にクラスタ内で最小の★番号にする）
+    parent = list(range(len(stars)))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, j, _ in near_duplicate_pairs(stars):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    return [find(x) for x in range(len(stars))]
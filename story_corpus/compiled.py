@@ -0,0 +1,422 @@
+# compiled.py
+# 物語要素データ（story_elements.json）をコンパクトなバイナリ形式に変換し、
+# mmapで読み込むためのモジュール
+#
+# ファイル形式（リトルエンディアン）:
+#   ヘッダー   : MAGIC(8) / version(u32) / 項目数(u32) / ★数(u32) / セクション数(u32)
+#   目次       : セクションごとに 名前(8) / オフセット(u32) / バイト長(u32)
+#   セクション : 8バイト境界に揃えて配置
+#     "items"    u32[項目数+1]  項目名（【～】）の blob 内オフセット
+#     "istars"   u32[項目数+1]  項目ごとの★番号の範囲（開始位置）
+#     "stars"    u32[★数+1]    ★テキスト本体の blob 内オフセット
+#     "staritem" u32[★数]      ★が属する項目番号（★番号→項目番号の平坦な表）
+#     "starlbl"  u32[★数]      ★の番号（「★６ｂ．」）のラベル符号（labels.py を参照）
+#     "blob"     UTF-8文字列を連結したもの（項目名をすべて並べた後に★テキスト本体）
+#                ★テキスト本体は先頭の番号を除いたもの。取り出すときに番号を付け直す
+#     "hash"     元データの内容ハッシュ（SHA-256、32バイト）
+#     "ngchars"  u32[文字数]       全文検索用の文字表（search.py を参照）
+#     "ngkeys"   u32[2-gram数]     全文検索用の2-gram
+#     "ngoffs"   u32[2-gram数+1]  2-gramごとの投稿リストの開始位置
+#     "ngpost"   u32[投稿数]       2-gramを含む★番号
+#     "themes"   ジャンル分類の語彙の内容ハッシュ（8バイト、themes.py を参照）
+#     "genres"   u32[ジャンル数+1]  ジャンルごとの★番号の範囲（開始位置、GENRE_KEYS の順）
+#     "genreids" u32[…]            ジャンルごとの★番号（昇順）
+#     "clhash"   ほぼ重複する★の判定のパラメータのハッシュ（8バイト、clusters.py を参照）
+#     "clusters" u32[★数]          ★のクラスタ番号（クラスタ内で最小の★番号）
+#     "tfoffs"   u32[2-gram数+1]  TF-IDF ベクトルの2-gramごとの開始位置（diversity.py を参照）
+#     "tfstars"  u32[非ゼロ数]     2-gramを含む★番号
+#     "tfvals"   f32[非ゼロ数]     その★の TF-IDF の重み（★ごとにL2正規化済み）
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+from .clusters import CLUSTERS_HASH, build_star_clusters
+from .diversity import StarVectors, build_star_vectors
+from .labels import (
+    RAW_LABEL,
+    decode_label,
+    format_label,
+    parse_star_reference,
+    reference_key,
+    split_star,
+    strip_label,
+)
+from .prompts import GENRE_KEYS
+from .search import SearchIndex, build_ngram_index
+from .themes import THEMES_HASH, tag_genres
+
+MAGIC = b"SPBCORP\x00"
+FORMAT_VERSION = 7
+
+_HEADER = struct.Struct("<8sIIII")
+_SECTION = struct.Struct("<8sII")
+_ALIGN = 8
+
+
+def _u32_bytes(values):
+    """整数列をリトルエンディアンのu32配列バイト列に変換"""
+    arr = array("I", values)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _f32_bytes(values):
+    """実数列をリトルエンディアンのf32配列バイト列に変換"""
+    arr = array("f", values)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def content_hash(story_elements):
+    """物語要素データの内容ハッシュ（SHA-256の16進文字列）
+
+    JSONファイルの改行や空白の違いには影響されないよう、
+    区切り文字を詰めた正規のJSON表現から計算する。
+    """
+    canonical = json.dumps(story_elements, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def compile_corpus(story_elements):
+    """物語要素のリスト（[{"item": ..., "stars": [...]}, ...]）をバイナリに変換"""
+    blob = bytearray()
+    item_offsets = [0]
+    star_ranges = [0]
+    star_items = []
+
+    # blob の前半に項目名、後半に★テキスト本体を並べる
+    for item_index, item_data in enumerate(story_elements):
+        blob += item_data["item"].encode("utf-8")
+        item_offsets.append(len(blob))
+        star_items.extend([item_index] * len(item_data["stars"]))
+        star_ranges.append(len(star_items))
+
+    star_offsets = [len(blob)]
+    star_labels = []
+    for item_data in story_elements:
+        for star in item_data["stars"]:
+            label, body = split_star(star)
+            star_labels.append(label)
+            blob += body.encode("utf-8")
+            star_offsets.append(len(blob))
+
+    ngram_chars, ngram_keys, ngram_offsets, ngram_postings = build_ngram_index(story_elements)
+    genre_offsets = [0]
+    genre_ids = []
+    for ids in tag_genres(story_elements):
+        genre_ids.extend(ids)
+        genre_offsets.append(len(genre_ids))
+
+    vector_offsets, vector_stars, vector_values = build_star_vectors(story_elements)
+
+    sections = [
+        (b"items", _u32_bytes(item_offsets)),
+        (b"istars", _u32_bytes(star_ranges)),
+        (b"stars", _u32_bytes(star_offsets)),
+        (b"staritem", _u32_bytes(star_items)),
+        (b"starlbl", _u32_bytes(star_labels)),
+        (b"blob", bytes(blob)),
+        (b"hash", bytes.fromhex(content_hash(story_elements))),
+        (b"ngchars", _u32_bytes(ngram_chars)),
+        (b"ngkeys", _u32_bytes(ngram_keys)),
+        (b"ngoffs", _u32_bytes(ngram_offsets)),
+        (b"ngpost", _u32_bytes(ngram_postings)),
+        (b"themes", THEMES_HASH),
+        (b"genres", _u32_bytes(genre_offsets)),
+        (b"genreids", _u32_bytes(genre_ids)),
+        (b"clhash", CLUSTERS_HASH),
+        (b"clusters", _u32_bytes(build_star_clusters(story_elements))),
+        (b"tfoffs", _u32_bytes(vector_offsets)),
+        (b"tfstars", _u32_bytes(vector_stars)),
+        (b"tfvals", _f32_bytes(vector_values)),
+    ]
+
+    # セクションの配置位置を決める
+    position = _HEADER.size + _SECTION.size * len(sections)
+    table = []
+    for name, data in sections:
+        position += -position % _ALIGN
+        table.append((name, position, len(data)))
+        position += len(data)
+
+    out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, len(story_elements),
+                                 len(star_items), len(sections)))
+    for name, offset, length in table:
+        out += _SECTION.pack(name, offset, length)
+    for (name, data), (_, offset, _) in zip(sections, table):
+        out += b"\x00" * (offset - len(out))
+        out += data
+    return bytes(out)
+
+
+def write_compiled(story_elements, path):
+    """バイナリ形式のファイルを書き出す（一時ファイル経由で置き換え）"""
+    data = compile_corpus(story_elements)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return data
+
+
+class CompiledCorpus(Sequence):
+    """バイナリ形式の物語要素データ
+
+    項目や★のテキストはアクセスされたときに初めてデコードされる。
+    従来のリスト形式と同じく、インデックスで {"item": ..., "stars": [...]} を返す。
+    """
+
+    def __init__(self, buffer, mmap_obj=None):
+        self._buffer = buffer
+        self._mmap = mmap_obj
+        self._sections = {}
+        self._search_index = None
+        self._star_vectors = None
+        view = memoryview(buffer)
+        self._views = [view]
+        try:
+            self._open(view)
+        except BaseException:
+            # 古い形式などで使えない場合は、ビューと mmap を解放してから送出する
+            # （mmap を開いたままだと、Windows では同じファイルを置き換えられない）
+            self.close()
+            raise
+
+    def _open(self, view):
+        magic, version, n_items, n_stars, n_sections = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError("物語要素バイナリの形式が正しくありません")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"未対応の物語要素バイナリのバージョンです: {version}")
+
+        self.n_items = n_items
+        self.n_stars = n_stars
+        for i in range(n_sections):
+            name, offset, length = _SECTION.unpack_from(view, _HEADER.size + _SECTION.size * i)
+            section = view[offset:offset + length]
+            self._views.append(section)
+            self._sections[name.rstrip(b"\x00").decode("ascii")] = section
+
+        if self._sections.get("themes") != THEMES_HASH:
+            raise ValueError("物語要素バイナリのジャンル分類が古いため使えません")
+        if self._sections.get("clhash") != CLUSTERS_HASH:
+            raise ValueError("物語要素バイナリのクラスタが古いため使えません")
+
+        self._item_offsets = self._u32_section("items")
+        self._star_ranges = self._u32_section("istars")
+        self._star_offsets = self._u32_section("stars")
+        self._star_items = self._u32_section("staritem")
+        self._star_labels = self._u32_section("starlbl")
+        self._blob = self._sections["blob"]
+        self._genre_offsets = self._u32_section("genres")
+        self._genre_ids = self._u32_section("genreids")
+        self._star_clusters = self._u32_section("clusters")
+        self._item_lookup = None
+
+    def _u32_section(self, name):
+        return self._array_section(name, "I")
+
+    def _array_section(self, name, typecode):
+        section = self._sections[name]
+        if sys.byteorder == "little":
+            cast = section.cast(typecode)
+            self._views.append(cast)
+            return cast
+        # ビッグエンディアン環境ではコピーして並べ替える
+        arr = array(typecode, section.tobytes())
+        arr.byteswap()
+        return arr
+
+    @property
+    def total_stars(self):
+        return self.n_stars
+
+    @property
+    def content_hash(self):
+        """元データの内容ハッシュ（キャッシュのキーなどに使う）"""
+        return self._sections["hash"].hex()
+
+    def item_name(self, item_index):
+        """項目名（【～】）を取得"""
+        start = self._item_offsets[item_index]
+        end = self._item_offsets[item_index + 1]
+        return str(self._blob[start:end], "utf-8")
+
+    def star_range(self, item_index):
+        """項目に属する★番号の範囲を取得"""
+        return range(self._star_ranges[item_index], self._star_ranges[item_index + 1])
+
+    def _stored_star(self, star_index):
+        start = self._star_offsets[star_index]
+        end = self._star_offsets[star_index + 1]
+        return str(self._blob[start:end], "utf-8")
+
+    def star_text(self, star_index):
+        """★のテキストを取得（先頭の番号を付け直したもの）"""
+        start = self._star_offsets[star_index]
+        end = self._star_offsets[star_index + 1]
+        text = str(self._blob[start:end], "utf-8")
+        label = self._star_labels[star_index]
+        if label and not label & RAW_LABEL:
+            return format_label(label) + text
+        return text
+
+    def star_body(self, star_index):
+        """★テキストの本体（先頭の番号を除いたもの）を取得"""
+        if self._star_labels[star_index] & RAW_LABEL:
+            # 番号を付け直すと元に戻らない★は、元のテキストのまま格納している
+            return strip_label(self._stored_star(star_index))
+        return self._stored_star(star_index)
+
+    def star_label(self, star_index):
+        """★の番号を (数字, 枝番の英字) で取得（番号の無い★は None）"""
+        return decode_label(self._star_labels[star_index])
+
+    def star_item(self, star_index):
+        """★が属する項目番号を取得"""
+        return self._star_items[star_index]
+
+    def find_star(self, item, number, letter=""):
+        """見出し語（【】は省略可）と番号（★６ｂ → 6, "b"）から★番号を取得（見つからない場合は None）"""
+        if self._item_lookup is None:
+            # 見出し語 → 項目番号の表だけを作り、★はその項目のラベル符号から探す
+            lookup = {}
+            for item_index in range(self.n_items):
+                lookup.setdefault(reference_key(self.item_name(item_index), 0)[0], []).append(item_index)
+            self._item_lookup = lookup
+        headword, number, letter = reference_key(item, number, letter)
+        for item_index in self._item_lookup.get(headword, ()):
+            for j in self.star_range(item_index):
+                if decode_label(self._star_labels[j]) == (number, letter):
+                    return j
+        return None
+
+    def find_star_reference(self, text):
+        """「【猫】★２．」「猫 ★6b」のような参照から★番号を取得（参照でないか見つからない場合は None）"""
+        key = parse_star_reference(text)
+        return self.find_star(*key) if key is not None else None
+
+    def genre_star_ids(self, genre_key):
+        """ジャンル（GENRE_KEYS のいずれか）に分類された★番号の並び（昇順）"""
+        genre_index = GENRE_KEYS.index(genre_key)
+        return self._genre_ids[self._genre_offsets[genre_index]:self._genre_offsets[genre_index + 1]]
+
+    @property
+    def star_clusters(self):
+        """★番号ごとのクラスタ番号の並び（抽出関数の clusters 引数に渡す）"""
+        return self._star_clusters
+
+    def star_cluster(self, star_index):
+        """★のクラスタ番号（ほぼ重複する★どうしで同じ値。クラスタ内で最小の★番号）"""
+        return self._star_clusters[star_index]
+
+    @property
+    def search_index(self):
+        """全文検索のインデックス（search.SearchIndex）"""
+        if self._search_index is None:
+            self._search_index = SearchIndex(
+                self,
+                self._u32_section("ngchars"),
+                self._u32_section("ngkeys"),
+                self._u32_section("ngoffs"),
+                self._u32_section("ngpost"),
+            )
+        return self._search_index
+
+    @property
+    def star_vectors(self):
+        """★の TF-IDF ベクトル（diversity.StarVectors、NumPy が必要）"""
+        if self._star_vectors is None:
+            self._star_vectors = StarVectors(
+                self.n_stars,
+                self._u32_section("tfoffs"),
+                self._u32_section("tfstars"),
+                self._array_section("tfvals", "f"),
+            )
+        return self._star_vectors
+
+    def element(self, star_index):
+        """★番号から (項目名, ★テキスト) を取得"""
+        return (self.item_name(self._star_items[star_index]), self.star_text(star_index))
+
+    def __len__(self):
+        return self.n_items
+
+    def __getitem__(self, item_index):
+        if isinstance(item_index, slice):
+            return [self[i] for i in range(*item_index.indices(self.n_items))]
+        if item_index < 0:
+            item_index += self.n_items
+        if not 0 <= item_index < self.n_items:
+            raise IndexError("項目番号が範囲外です")
+        return {
+            "item": self.item_name(item_index),
+            "stars": [self.star_text(j) for j in self.star_range(item_index)],
+        }
+
+    def to_list(self):
+        """従来のリスト形式に展開"""
+        return [self[i] for i in range(self.n_items)]
+
+    def close(self):
+        """mmapを閉じる"""
+        self._search_index = None
+        self._star_vectors = None
+        # 派生したビューから順に解放する
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._sections.clear()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def open_compiled(path):
+    """バイナリ形式のファイルをmmapで開く（読み込めない場合は mmap を閉じてから例外を送出）"""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return CompiledCorpus(mapped, mmap_obj=mapped)
+    except BaseException:
+        if not mapped.closed:
+            mapped.close()
+        raise
+
+
+def compiled_path_for(json_path):
+    """JSONファイルに対応するバイナリファイルのパス"""
+    return os.path.splitext(os.fspath(json_path))[0] + ".bin"
+
+
+def load_compiled(json_path, compiled_path=None):
+    """JSONファイルに対応するバイナリを読み込む
+
+    バイナリが無いかJSONより古い場合はその場でコンパイルする。
+    書き込みできない場所では、コンパイル結果をメモリ上で使う。
+    """
+    json_path = os.fspath(json_path)
+    if compiled_path is None:
+        compiled_path = compiled_path_for(json_path)
+
+    try:
+        if os.path.getmtime(compiled_path) >= os.path.getmtime(json_path):
+            return open_compiled(compiled_path)
+    except (OSError, ValueError):
+        pass
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        story_elements = json.load(f)
+    try:
+        write_compiled(story_elements, compiled_path)
+        return open_compiled(compiled_path)
+    except OSError:
+        return CompiledCorpus(compile_corpus(story_elements))
@@ -0,0 +1,33 @@
+# corpus.py
+# 全アプリ共通の物語要素データ（story_corpus/data/story_elements.json）の読み込み
+#
+# 元データはこのパッケージ内の1ファイルだけで、初回読み込み時に同じフォルダへ
+# コンパイル済みバイナリ（story_elements.bin）を作成し、以降はそれを mmap で使う。
+# 読み込んだデータはプロセス内で1つだけ作り、全体で共有する。
+
+import os
+import threading
+
+from .compiled import compiled_path_for, load_compiled
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SOURCE_PATH = os.path.join(DATA_DIR, "story_elements.json")
+COMPILED_PATH = compiled_path_for(SOURCE_PATH)
+
+_lock = threading.Lock()
+_corpus = None
+
+
+def load_corpus():
+    """物語要素データを読み込む（プロセス内で1回だけ読み込み、以降は同じものを返す）"""
+    global _corpus
+    if _corpus is None:
+        with _lock:
+            if _corpus is None:
+                _corpus = load_compiled(SOURCE_PATH, COMPILED_PATH)
+    return _corpus
+
+
+def corpus_hash():
+    """物語要素データの内容ハッシュ"""
+    return load_corpus().content_hash
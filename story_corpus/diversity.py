@@ -0,0 +1,163 @@
+# diversity.py
+# 似た物語要素が重ならないようにする抽出（MMR: maximal marginal relevance）
+#
+# ランダムに選ぶと、同じモチーフの★（死に関する★が2つなど）が1回の抽出に入ることがある。
+# ★ごとに文字2-gramの TF-IDF ベクトル（L2正規化）を作っておき、すでに選んだ★との
+# コサイン類似度が高い★ほど選ばれにくくする。
+#
+# ベクトル:
+#   ★テキスト本体（番号を除く）と項目名の文字2-gram（検索と同じ正規化をして記号を除いたもの）。
+#   重みは 出現回数 × (log((1 + ★数) / (1 + その2-gramを含む★数)) + 1)。
+#   コンパイル時に1回だけ作り、2-gramごとの (★番号, 重み) の列（CSC形式の疎行列）として
+#   物語要素バイナリ（compiled.py）に格納する。2-gramの文字列そのものは格納しない。
+#
+# 抽出（sample_diverse_stars、NumPy が必要）:
+#   ★ごとに一様乱数の「関連度」を付け、(1 - diversity) × 関連度 - diversity × (選んだ★との類似度の最大値)
+#   が最大の★を1個ずつ選ぶ。1個目は関連度だけで決まるので一様な抽出と同じ。
+#   選んだ★との類似度は、その★の2-gramの列だけを足し合わせる（np.bincount）ので、
+#   1個あたり全★ぶんの類似度を O(その★の2-gramを含む★の数) で求められる。
+#   ★ごとの重み（評価による重みなど）を渡すと、関連度を u ** (1 / 重み)（u は一様乱数、
+#   重みは最大値で割ったもの）にする。diversity が 0 なら、関連度の大きい順に選ぶことが
+#   重みに比例した重複なしの抽出（Efraimidis–Spirakis 法）と同じになる。
+
+import math
+from collections import Counter
+
+from .sampler import make_rng
+from .search import item_search_text, star_search_text, word_bigrams
+
+
+def build_star_vectors(story_elements):
+    """物語要素のリストから★ごとの TF-IDF ベクトルを作る
+
+    戻り値は (2-gramごとの開始位置, ★番号, 重み) のリスト（CSC形式。各列の★番号は昇順）。
+    """
+    rows = []
+    for item_data in story_elements:
+        item_terms = word_bigrams(item_search_text(item_data["item"]))
+        for star in item_data["stars"]:
+            rows.append(Counter(word_bigrams(star_search_text(star)) + item_terms))
+
+    n_stars = len(rows)
+    document_frequency = Counter(term for row in rows for term in row)
+    terms = sorted(document_frequency)
+    term_ids = {term: i for i, term in enumerate(terms)}
+    idf = {term: math.log((1 + n_stars) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+    columns = [[] for _ in terms]
+    for star_index, row in enumerate(rows):
+        weights = {term: count * idf[term] for term, count in row.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        for term, weight in weights.items():
+            columns[term_ids[term]].append((star_index, weight / norm))
+
+    offsets = [0]
+    star_ids = []
+    values = []
+    for column in columns:
+        for star_index, weight in column:
+            star_ids.append(star_index)
+            values.append(weight)
+        offsets.append(len(star_ids))
+    return offsets, star_ids, values
+
+
+class StarVectors:
+    """物語要素バイナリに格納された★の TF-IDF ベクトル（NumPy が必要）
+
+    offsets / star_ids / values は build_star_vectors の戻り値と同じ並び
+    （mmap 上の u32・f32 配列でもよい。NumPy 配列にコピーするので、mmap を閉じても使える）。
+    """
+
+    def __init__(self, n_stars, offsets, star_ids, values):
+        import numpy as np
+
+        self.n_stars = n_stars
+        self._offsets = np.array(offsets, dtype=np.int64)
+        self._star_ids = np.array(star_ids, dtype=np.int64)
+        self._values = np.array(values, dtype=np.float32)
+        # ★ごとの行（2-gram番号と重み）は、CSC の並びを★番号順に並べ替えて作る
+        terms = np.repeat(np.arange(len(self._offsets) - 1), np.diff(self._offsets))
+        order = np.argsort(self._star_ids, kind="stable")
+        self._row_terms = terms[order]
+        self._row_values = self._values[order]
+        self._row_offsets = np.concatenate(([0], np.cumsum(np.bincount(self._star_ids, minlength=n_stars))))
+
+    def similarities(self, star_index):
+        """star_index の★と全★とのコサイン類似度（長さ★数の float32 配列）"""
+        import numpy as np
+
+        start, end = self._row_offsets[star_index], self._row_offsets[star_index + 1]
+        terms = self._row_terms[start:end]
+        weights = self._row_values[start:end]
+        starts = self._offsets[terms]
+        lengths = self._offsets[terms + 1] - starts
+        # 各2-gramの列（その2-gramを含む★）を連結し、★番号ごとに 重み × 重み を足す
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        products = self._values[positions] * np.repeat(weights, lengths)
+        return np.bincount(self._star_ids[positions], weights=products, minlength=self.n_stars).astype(np.float32)
+
+
+def sample_diverse_stars(vectors, count, diversity=0.5, exclude=(), seed=None, preferred=(), bias=0.0,
+                         clusters=None, weights=None, exploration=0.0):
+    """似た★が重ならないように、重複なしで★番号を count 個抽出（MMR、NumPy が必要）
+
+    vectors は StarVectors（CompiledCorpus.star_vectors）。diversity（0～1）は似た★を避ける度合いで、
+    0 なら一様な抽出と同じ。exclude の★は選ばず、exclude の★と似た★も選ばれにくくする。
+    preferred（ジャンルの★番号など）を渡すと、sample_genre_stars と同じく各要素を確率 bias（0～1）で
+    preferred の★から（足りなければ全★から）、それ以外は全★から選ぶ。
+    clusters（CompiledCorpus.star_clusters）を渡すと、ほぼ重複する★は1クラスタから1個までにする。
+    weights（★ごとの重み）を渡すと、各要素を確率 exploration（0～1）で重みに関係なく、
+    それ以外は重みに比例した関連度で選ぶ（weighted.sample_weighted_stars と同じ。重みが0の★は後回し）。
+    seed は sampler.make_rng と同じ（そこから PCG64 のシードを1つ作る）。
+    """
+    import numpy as np
+
+    if not 0 <= diversity <= 1:
+        raise ValueError(f"多様性は0～1の範囲で指定してください: {diversity}")
+    rng = make_rng(seed)
+    n_stars = vectors.n_stars
+    generator = np.random.Generator(np.random.PCG64(int(rng.random() * (1 << 53))))
+    base = (1.0 - diversity) * generator.random(n_stars)
+    weighted_base = None
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.max(initial=0.0) > 0:
+            positive = weights > 0
+            exponents = np.divide(weights.max(), weights, out=np.ones(n_stars), where=positive)
+            # 重みが0の★は、重みのある★が残っていないときだけ選ぶ（スコアは -1 以上なので 2 下げる）
+            weighted_base = np.where(positive, (1.0 - diversity) * generator.random(n_stars) ** exponents, -2.0)
+    outside = None
+    if bias > 0 and len(preferred):
+        outside = np.ones(n_stars, dtype=bool)
+        outside[np.asarray(preferred, dtype=np.int64)] = False
+
+    max_similarity = np.zeros(n_stars)
+    blocked = np.zeros(n_stars, dtype=bool)
+    clusters = None if clusters is None else np.asarray(clusters)
+    for j in {j for j in exclude if 0 <= j < n_stars}:
+        blocked[j] = True
+        if clusters is not None:
+            blocked[clusters == clusters[j]] = True
+        np.maximum(max_similarity, vectors.similarities(j), out=max_similarity)
+
+    picks = []
+    while len(picks) < count:
+        relevance = base
+        if weighted_base is not None and rng.random() >= exploration:
+            relevance = weighted_base
+        scores = relevance - diversity * max_similarity
+        if outside is not None and rng.random() < bias:
+            # スコアは -1～1 の範囲なので、2 下げれば preferred 以外の★は必ず後回しになる
+            scores[outside] -= 2.0
+        scores[blocked] = -np.inf
+        star_index = int(np.argmax(scores))
+        if blocked[star_index]:
+            break
+        picks.append(star_index)
+        blocked[star_index] = True
+        if clusters is not None:
+            blocked[clusters == clusters[star_index]] = True
+        if len(picks) < count:
+            np.maximum(max_similarity, vectors.similarities(star_index), out=max_similarity)
+    return picks
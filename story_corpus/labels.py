@@ -0,0 +1,90 @@
+# labels.py
+# ★テキスト先頭の番号（「★１．」「★６ｂ．」など）の解析
+#
+# 番号は (数字, 枝番の英字) に分けて、コンパクトな整数（ラベル符号）として
+# 物語要素バイナリ（compiled.py）に格納する。★テキスト本体は番号を除いて格納し、
+# テキストを取り出すときにだけ番号を付け直す。
+#
+# ラベル符号（u32）:
+#   bit 0-7   枝番（0 = なし、1～26 = a～z）
+#   bit 8-30  数字
+#   bit 31    番号を付け直すと元のテキストに戻らない★（全角でない数字など）。
+#             本体には元のテキストをそのまま格納し、番号は検索にだけ使う
+#   0         番号の無い★
+#
+# 利用者が貼り付けた「【猫】★２．」「猫 ★2」のような参照は parse_star_reference で
+# (見出し語, 数字, 枝番) に分け、CompiledCorpus.find_star で★番号を引く。
+
+import re
+import unicodedata
+from functools import lru_cache
+
+RAW_LABEL = 1 << 31
+
+# 「★」＋数字＋枝番＋「．」（元のテキストのまま）
+_STAR_LABEL = re.compile(r"★([0-9０-９]+)([a-zａ-ｚ]?)[.．]")
+# 貼り付けられた参照（NFKC 正規化後）: 【見出し語】★6b.
+_REFERENCE = re.compile(
+    r"^【?(?P<item>[^★【】]+?)】?\s*★\s*(?P<number>\d+)\s*(?P<letter>[a-z]?)\s*\.?\s*$", re.IGNORECASE
+)
+
+# 半角 → 全角（数字と英小文字）
+_TO_FULLWIDTH = {cp: cp + 0xFEE0 for cp in [*range(0x30, 0x3A), *range(0x61, 0x7B)]}
+
+
+def encode_label(number, letter=""):
+    """(数字, 枝番) をラベル符号に変換"""
+    return (number << 8) | (ord(letter) - 0x60 if letter else 0)
+
+
+def decode_label(code):
+    """ラベル符号を (数字, 枝番) に変換（番号の無い★は None）"""
+    if not code:
+        return None
+    letter = code & 0xFF
+    return ((code & ~RAW_LABEL) >> 8, chr(0x60 + letter) if letter else "")
+
+
+@lru_cache(maxsize=1024)
+def format_label(code):
+    """ラベル符号を★テキスト先頭の表記（「★６ｂ．」）に変換"""
+    number, letter = decode_label(code)
+    return f"★{number}{letter}．".translate(_TO_FULLWIDTH)
+
+
+def split_star(star):
+    """★テキストを (ラベル符号, 本体) に分ける
+
+    本体に番号を付け直すと元のテキストに戻る場合だけ番号を取り除き、
+    そうでない場合は RAW_LABEL を立てて元のテキストを本体とする。
+    """
+    match = _STAR_LABEL.match(star)
+    if match is None:
+        return 0, star
+    number, letter = unicodedata.normalize("NFKC", match.group(1) + match.group(2)), ""
+    if number[-1].isalpha():
+        number, letter = number[:-1], number[-1]
+    code = encode_label(int(number), letter)
+    body = star[match.end():]
+    if format_label(code) + body != star:
+        return code | RAW_LABEL, star
+    return code, body
+
+
+def strip_label(star):
+    """★テキストから先頭の番号を除く"""
+    match = _STAR_LABEL.match(star)
+    return star[match.end():] if match else star
+
+
+def reference_key(item, number, letter=""):
+    """(見出し語, 数字, 枝番) の照合用のキー（見出し語は NFKC 正規化し【】を除く）"""
+    return unicodedata.normalize("NFKC", item).strip().strip("【】").strip(), number, letter
+
+
+def parse_star_reference(text):
+    """「【猫】★２．」「猫 ★6b」のような参照を照合用のキーに変換（参照でなければ None）"""
+    match = _REFERENCE.match(unicodedata.normalize("NFKC", text).strip())
+    if match is None:
+        return None
+    return reference_key(match.group("item"), int(match.group("number")), match.group("letter").lower())
@@ -0,0 +1,27 @@
+# names.py
+# 登場人物のカタカナ名を生成する
+
+from .sampler import choice, make_rng
+
+# 1文字目：拗音、撥音、長音以外
+FIRST_CHARS = [
+    'ア', 'イ', 'ウ', 'エ', 'オ',
+    'カ', 'キ', 'ク', 'ケ', 'コ', 'ガ', 'ギ', 'グ', 'ゲ', 'ゴ',
+    'サ', 'シ', 'ス', 'セ', 'ソ', 'ザ', 'ジ', 'ズ', 'ゼ', 'ゾ',
+    'タ', 'チ', 'ツ', 'テ', 'ト', 'ダ', 'ヂ', 'ヅ', 'デ', 'ド',
+    'ナ', 'ニ', 'ヌ', 'ネ', 'ノ',
+    'ハ', 'ヒ', 'フ', 'ヘ', 'ホ', 'バ', 'ビ', 'ブ', 'ベ', 'ボ', 'パ', 'ピ', 'プ', 'ペ', 'ポ',
+    'マ', 'ミ', 'ム', 'メ', 'モ',
+    'ヤ', 'ユ', 'ヨ',
+    'ラ', 'リ', 'ル', 'レ', 'ロ',
+    'ワ', 'ヲ'
+]
+
+# 2文字目：全てのカタカナ（長音も含む）
+SECOND_CHARS = FIRST_CHARS + ['ャ', 'ュ', 'ョ', 'ン', 'ー']
+
+
+def generate_katakana_name(seed=None):
+    """カタカナ2文字の名前を生成（seed は sampler.make_rng と同じ）"""
+    rng = make_rng(seed)
+    return choice(rng, FIRST_CHARS) + choice(rng, SECOND_CHARS)
@@ -0,0 +1,175 @@
+# prompts.py
+# 各アプリのプロンプトテンプレート
+# （tkinter や streamlit に依存しないので、コマンドラインからも使える）
+#
+# テンプレートは読み込み時に1回だけ解析し（templates.py）、Web版では
+# (言語, ジャンル, 終わり方) ごとに固定部分を埋めたものをキャッシュする。
+
+from functools import lru_cache
+
+from .templates import PromptTemplate, element_lines
+
+PROMPT_TEXTS = {
+    "ja": {
+        # ジャンル
+        "genre_folk": "民話",
+        "genre_sf": "SF",
+        "genre_mystery": "ミステリー",
+        "genre_fantasy": "ファンタジー",
+        "genre_horror": "ホラー",
+        "genre_comedy": "コメディ",
+        "genre_romance": "ロマンス",
+        "genre_adventure": "アドベンチャー",
+
+        # 終わり方
+        "ending_natural_unexpected": "自然でかつ多少意外性のある終わり方",
+        "ending_surprising": "読者の予想を裏切る意外な終わり方",
+        "ending_natural": "設定の整合性を重視した自然な終わり方",
+        "ending_happy": "ハッピーエンド",
+        "ending_bitter": "ビターエンド",
+        "ending_open": "オープンエンド（読者の想像に委ねる）",
+
+        # プロンプトテンプレート
+        "prompt_header": "# 物語創作指示\n\n",
+        "prompt_basic_settings": "## 基本設定\n",
+        "prompt_word_count": "- 文字数: 約{count}文字\n",
+        "prompt_genre": "- ジャンル・スタイル: {genre}\n",
+        "prompt_ending": "- 終わり方: {ending}\n\n",
+        "prompt_elements_header": "## 使用する物語要素\n",
+        "prompt_instructions_header": "\n## 指示\n",
+        "prompt_instructions": "上記の物語要素をすべて含む{genre}の物語を創作してください。\n各要素は自然に物語に組み込み、指定した文字数で完結する物語にしてください。\n物語の結末は「{ending}」になるよう心がけてください。"
+    },
+
+    "en": {
+        # ジャンル
+        "genre_folk": "Folk Tale",
+        "genre_sf": "Science Fiction",
+        "genre_mystery": "Mystery",
+        "genre_fantasy": "Fantasy",
+        "genre_horror": "Horror",
+        "genre_comedy": "Comedy",
+        "genre_romance": "Romance",
+        "genre_adventure": "Adventure",
+
+        # 終わり方
+        "ending_natural_unexpected": "Natural ending with some unexpected elements",
+        "ending_surprising": "Unexpected ending that defies reader expectations",
+        "ending_natural": "Natural ending that respects story consistency",
+        "ending_happy": "Happy Ending",
+        "ending_bitter": "Bitter Ending",
+        "ending_open": "Open Ending (left to reader's imagination)",
+
+        # プロンプトテンプレート
+        "prompt_header": "# Story Creation Instructions\n\n",
+        "prompt_basic_settings": "## Basic Settings\n",
+        "prompt_word_count": "- Word count: approximately {count} words\n",
+        "prompt_genre": "- Genre/Style: {genre}\n",
+        "prompt_ending": "- Ending style: {ending}\n\n",
+        "prompt_elements_header": "## Story Elements to Use\n",
+        "prompt_instructions_header": "\n## Instructions\n",
+        "prompt_instructions": "Create a {genre} story that includes all the above story elements.\nIntegrate each element naturally into the story and complete it within the specified word count.\nThe story's conclusion should follow \"{ending}\"."
+    }
+}
+
+GENRE_KEYS = ["genre_folk", "genre_sf", "genre_mystery", "genre_fantasy",
+              "genre_horror", "genre_comedy", "genre_romance", "genre_adventure"]
+
+ENDING_KEYS = ["ending_natural_unexpected", "ending_surprising", "ending_natural",
+               "ending_happy", "ending_bitter", "ending_open"]
+
+
+# デスクトップ版のテンプレート
+DESKTOP_TEMPLATE = PromptTemplate(
+    "# 物語創作指示\n\n"
+    "## 基本設定\n"
+    "- 文字数: 約{word_count}文字\n"
+    "- 登場人物: {characters}\n\n"
+    "## 使用する物語要素\n"
+    "{elements}"
+    "\n## 指示\n"
+    "上記の物語要素をすべて含む物語を創作してください。\n"
+    "各要素は自然に物語に組み込み、指定した文字数で完結する物語にしてください。\n"
+    "登場人物は指定された名前を使用してください。"
+)
+
+
+def build_desktop_prompt(elements, word_count, characters):
+    """デスクトップ版のプロンプトを生成"""
+    return DESKTOP_TEMPLATE.render(
+        word_count=word_count,
+        characters=", ".join(characters),
+        elements=element_lines(elements),
+    )
+
+
+def _web_template_text(texts):
+    """Web版のテンプレート文字列を言語ごとの部品から組み立てる"""
+    return (texts["prompt_header"]
+            + texts["prompt_basic_settings"]
+            + texts["prompt_word_count"]
+            + texts["prompt_genre"]
+            + texts["prompt_ending"]
+            + texts["prompt_elements_header"]
+            + "{elements}"
+            + texts["prompt_instructions_header"]
+            + texts["prompt_instructions"])
+
+
+WEB_TEMPLATES = {lang: PromptTemplate(_web_template_text(texts)) for lang, texts in PROMPT_TEXTS.items()}
+
+
+@lru_cache(maxsize=256)
+def web_prompt_template(lang, story_style, ending_style):
+    """(言語, ジャンル, 終わり方) ごとに固定部分を埋めたテンプレート（キャッシュされる）"""
+    return WEB_TEMPLATES[lang].bind(genre=story_style, ending=ending_style)
+
+
+def build_web_prompt(elements, word_count, story_style, ending_style, lang):
+    """Web版のプロンプトを生成（story_style / ending_style は表示用の名称）"""
+    return web_prompt_template(lang, story_style, ending_style).render(
+        count=word_count,
+        elements=element_lines(elements),
+    )
+
+
+SHORTSHORT_TEMPLATE = PromptTemplate("""あなたは星新一のような天才ショートショート作家です。
+
+# 創作ミッション
+読者が最後まで読んだ瞬間に「まさか！」と驚き、「なるほど！」と納得する、記憶に残る傑作ショートショートを創作してください。
+
+# 基本設定
+- 文字数: 約{word_count}文字
+- ジャンル: ショートショート（掌編小説）
+- 必須要件: 意外なオチで読者を驚かせること
+
+# 必須使用要素
+{elements}
+# ショートショートの絶対条件
+- 読者の予想を完全に裏切る意外なオチ・どんでん返しで終わる
+- 短い中に完結した物語を構築する（起承転結の巧妙な構成）
+- 無駄のない簡潔で洗練された文章
+- 最後の一行で全てがひっくり返る衝撃的な結末
+- 日常の中に潜む非日常、または予想外の真実の発見
+- 読後に深い余韻と「なるほど感」を残す
+- 一度読んだら忘れられない印象的なストーリー
+
+# 物語要素の使用について
+上記の必須使用要素を参考にしながら創作してください。ただし、物語要素の間に辻褄を持たせるのが困難な場合、いくつかの物語要素を無視しても構いません。構成要素をすべて使い切ることよりも、ショートショートとしての面白さや完成度を優先してください。自然で魅力的なストーリーを作ることが最も重要です。
+
+# 重要指示
+- 冒頭から読者を引き込む魅力的な導入で始める
+- 中盤で読者にある方向の期待を抱かせる
+- 結末で期待を見事に裏切り、全く予想外の真実を明かす
+- オチは論理的でありながら意外性に富んでいること
+- 伏線は subtle に仕込み、読み返した時に「ああ、そういうことか！」と気づかせる
+- 人間の心理、社会の皮肉、科学技術の盲点など、深いテーマを含ませる
+- 星新一のような、ユーモアと哲学が混在した独特の味わいを出す
+
+読者が「これは普通の話だな」と思って読み進めているうちに、最後の最後で「え！？そういうことだったの！？」と仰天するような、究極のどんでん返しショートショートを創作してください。
+
+この作品を読んだ読者が、友人に「すごいショートショートを読んだよ！」と興奮して話したくなるような、記憶に焼き付く傑作を生み出してください。""")
+
+
+def build_shortshort_prompt(elements, word_count):
+    """ショートショート専用プロンプトを生成"""
+    return SHORTSHORT_TEMPLATE.render(word_count=word_count, elements=element_lines(elements))
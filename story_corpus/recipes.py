@@ -0,0 +1,187 @@
+# recipes.py
+# プロンプトの「レシピコード」（プロンプトを再生成するための短いコード）
+#
+# プロンプト本文（数KB）の代わりに、★番号と設定だけをビット単位で詰めて
+# Base32（A-Z, 2-7）の文字列にする。★5個のショートショートで約30文字（19バイト）。
+# どのアプリでもコードから同じプロンプトを再生成できる。
+#
+# ビット列（上位から順に）:
+#   版(4) / テンプレート(2) / 物語要素データの内容ハッシュの先頭32ビット
+#   文字数(16) / ★の数(8) / ★番号のビット幅(5) / ★番号（幅ビットずつ）
+#   web       : 言語(2) / ジャンル(4) / 終わり方(4)（PROMPT_TEXTS・GENRE_KEYS・ENDING_KEYS の位置）
+#   desktop   : 登場人物数(4) / 登場人物ごとに
+#                 0(1) + 1文字目(7) + 2文字目(7)    … names.py で作れるカタカナ2文字の名前
+#                 1(1) + バイト長(8) + UTF-8(8ずつ) … それ以外の名前
+#   CRC-32 の下位16ビット（入力ミスの検出用）
+# 末尾は8ビット境界まで0で埋める。
+#
+# 内容ハッシュが違う物語要素データでは★番号が指す★が変わるので、再生成せずにエラーにする。
+
+import base64
+import zlib
+
+from .names import FIRST_CHARS, SECOND_CHARS
+from .prompts import (
+    ENDING_KEYS,
+    GENRE_KEYS,
+    PROMPT_TEXTS,
+    build_desktop_prompt,
+    build_shortshort_prompt,
+    build_web_prompt,
+)
+
+RECIPE_VERSION = 1
+RECIPE_TEMPLATES = ("desktop", "web", "shortshort")
+_LANGS = tuple(PROMPT_TEXTS)
+
+
+class _BitWriter:
+    def __init__(self):
+        self.value = 0
+        self.length = 0
+
+    def write(self, value, bits):
+        if not 0 <= value < (1 << bits):
+            raise ValueError(f"レシピコードに格納できない値です: {value}")
+        self.value = (self.value << bits) | value
+        self.length += bits
+
+    def to_bytes(self):
+        padding = -self.length % 8
+        return (self.value << padding).to_bytes((self.length + padding) // 8, "big")
+
+
+class _BitReader:
+    def __init__(self, data):
+        self.value = int.from_bytes(data, "big")
+        self.remaining = len(data) * 8
+
+    def read(self, bits):
+        if bits > self.remaining:
+            raise ValueError("レシピコードが短すぎます")
+        self.remaining -= bits
+        return (self.value >> self.remaining) & ((1 << bits) - 1)
+
+
+def _write_name(writer, name):
+    if len(name) == 2 and name[0] in FIRST_CHARS and name[1] in SECOND_CHARS:
+        writer.write(0, 1)
+        writer.write(FIRST_CHARS.index(name[0]), 7)
+        writer.write(SECOND_CHARS.index(name[1]), 7)
+        return
+    data = name.encode("utf-8")
+    writer.write(1, 1)
+    writer.write(len(data), 8)
+    for byte in data:
+        writer.write(byte, 8)
+
+
+def _read_name(reader):
+    if reader.read(1) == 0:
+        first, second = reader.read(7), reader.read(7)
+        if first >= len(FIRST_CHARS) or second >= len(SECOND_CHARS):
+            raise ValueError("レシピコードの登場人物名が正しくありません")
+        return FIRST_CHARS[first] + SECOND_CHARS[second]
+    data = bytes(reader.read(8) for _ in range(reader.read(8)))
+    return data.decode("utf-8")
+
+
+def encode_recipe(corpus, template, star_ids, word_count,
+                  lang="ja", genre=GENRE_KEYS[0], ending=ENDING_KEYS[0], characters=()):
+    """★番号と設定からレシピコードを作る
+
+    genre / ending は GENRE_KEYS / ENDING_KEYS のキー（web のみ）、characters は登場人物名（desktop のみ）。
+    """
+    if template not in RECIPE_TEMPLATES:
+        raise ValueError(f"未対応のテンプレートです: {template}")
+    star_ids = [int(j) for j in star_ids]
+    writer = _BitWriter()
+    writer.write(RECIPE_VERSION, 4)
+    writer.write(RECIPE_TEMPLATES.index(template), 2)
+    writer.write(int(corpus.content_hash[:8], 16), 32)
+    writer.write(word_count, 16)
+    writer.write(len(star_ids), 8)
+    width = max(star_ids, default=0).bit_length()
+    writer.write(width, 5)
+    for star_id in star_ids:
+        writer.write(star_id, width)
+
+    if template == "web":
+        writer.write(_LANGS.index(lang), 2)
+        writer.write(GENRE_KEYS.index(genre), 4)
+        writer.write(ENDING_KEYS.index(ending), 4)
+    elif template == "desktop":
+        characters = list(characters)
+        writer.write(len(characters), 4)
+        for name in characters:
+            _write_name(writer, name)
+
+    writer.write(zlib.crc32(writer.to_bytes()) & 0xFFFF, 16)
+    return base64.b32encode(writer.to_bytes()).decode("ascii").rstrip("=")
+
+
+def decode_recipe(code):
+    """レシピコードを辞書に変換（コードが正しくない場合は ValueError）
+
+    戻り値のキー: template / corpus_hash（先頭8桁）/ word_count / star_ids
+    （web は lang / genre / ending、desktop は characters も）
+    """
+    text = "".join(code.split()).replace("-", "").upper()
+    try:
+        data = base64.b32decode(text + "=" * (-len(text) % 8))
+    except ValueError:
+        raise ValueError("レシピコードの文字が正しくありません") from None
+
+    reader = _BitReader(data)
+    version = reader.read(4)
+    if version != RECIPE_VERSION:
+        raise ValueError(f"未対応のレシピコードの版です: {version}")
+    template_index = reader.read(2)
+    if template_index >= len(RECIPE_TEMPLATES):
+        raise ValueError("レシピコードのテンプレートが正しくありません")
+    recipe = {
+        "template": RECIPE_TEMPLATES[template_index],
+        "corpus_hash": f"{reader.read(32):08x}",
+        "word_count": reader.read(16),
+    }
+    count = reader.read(8)
+    width = reader.read(5)
+    recipe["star_ids"] = [reader.read(width) for _ in range(count)]
+
+    try:
+        if recipe["template"] == "web":
+            recipe["lang"] = _LANGS[reader.read(2)]
+            recipe["genre"] = GENRE_KEYS[reader.read(4)]
+            recipe["ending"] = ENDING_KEYS[reader.read(4)]
+        elif recipe["template"] == "desktop":
+            recipe["characters"] = [_read_name(reader) for _ in range(reader.read(4))]
+    except (IndexError, UnicodeDecodeError):
+        raise ValueError("レシピコードの設定が正しくありません") from None
+
+    # CRC は、CRC の直前までを8ビット境界まで0で埋めたバイト列に対して計算している
+    body_bits = len(data) * 8 - reader.remaining
+    checksum = reader.read(16)
+    body = (int.from_bytes(data, "big") >> (len(data) * 8 - body_bits)) << (-body_bits % 8)
+    if zlib.crc32(body.to_bytes((body_bits + 7) // 8, "big")) & 0xFFFF != checksum:
+        raise ValueError("レシピコードが正しくありません（入力ミスの可能性があります）")
+    return recipe
+
+
+def build_recipe_prompt(corpus, recipe):
+    """レシピ（decode_recipe の戻り値かレシピコード）からプロンプトを再生成"""
+    if isinstance(recipe, str):
+        recipe = decode_recipe(recipe)
+    if not corpus.content_hash.startswith(recipe["corpus_hash"]):
+        raise ValueError("物語要素データが異なるため、このレシピコードからは再生成できません")
+    if any(j >= corpus.n_stars for j in recipe["star_ids"]):
+        raise ValueError("レシピコードの★番号が範囲外です")
+
+    elements = [corpus.element(j) for j in recipe["star_ids"]]
+    if recipe["template"] == "desktop":
+        return build_desktop_prompt(elements, recipe["word_count"], recipe["characters"])
+    if recipe["template"] == "web":
+        texts = PROMPT_TEXTS[recipe["lang"]]
+        return build_web_prompt(
+            elements, recipe["word_count"], texts[recipe["genre"]], texts[recipe["ending"]], recipe["lang"]
+        )
+    return build_shortshort_prompt(elements, recipe["word_count"])
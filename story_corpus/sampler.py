@@ -0,0 +1,274 @@
+# sampler.py
+# ★番号の平坦な表（0 ～ ★数-1）から重複なしで★を抽出する
+#
+# 疎なフィッシャー–イェーツ法（入れ替えた位置だけを辞書に記録する）で
+# K個をO(K)で抽出する。やり直し（リトライ）は発生しない。
+# 除外する★がある場合は、除外されていない★だけを詰めた並びの位置として抽出し、
+# 最後に実際の★番号へ対応付ける。
+#
+# シードについて:
+#   抽出関数はすべて seed 引数を受け取る。seed には次のいずれかを渡せる。
+#     None                    … random モジュールの共有の乱数（再現性なし。fork後は自動で再初期化される）
+#     整数                    … random.Random(seed) と同じ系列（numpy.int64 などの整数型も同じ値の整数として扱う）
+#     random.Random           … その乱数生成器をそのまま使う（連続した呼び出しで1本の系列になる）
+#     numpy.random.Generator  … その乱数生成器をそのまま使う
+#   整数への変換には random()（[0, 1) の浮動小数点数）だけを使い、
+#   floor(u * n) で 0 ～ n-1 の値にする。random.Random の random() の系列は
+#   Pythonのバージョンが変わっても同じであることが保証されているため、
+#   同じシード・同じ物語要素データ・同じ SAMPLER_VERSION なら結果は変わらない。
+#   抽出方法を変更する場合は SAMPLER_VERSION を上げる。
+#
+# ほぼ重複する★について:
+#   clusters 引数に★番号ごとのクラスタ番号の並び（CompiledCorpus.star_clusters）を渡すと、
+#   1回の抽出でクラスタごとに1個までしか選ばない（除外する★と同じクラスタの★も選ばない）。
+#   同じクラスタの★が出た場合は、重複なしの抽出をそのまま次へ進める。
+#   ほとんどの★はどの★とも同じクラスタにならないので、追加の手間は1個あたり表の参照1回で済み、
+#   同じクラスタの★が出なかった場合は clusters を渡さないときと同じ結果になる。
+
+import numbers
+import operator
+import random
+
+SAMPLER_VERSION = 1
+
+
+class _NumpyRandom:
+    """numpy.random.Generator を random.Random と同じ使い方にするためのラッパー"""
+
+    def __init__(self, generator):
+        self.generator = generator
+
+    def random(self):
+        return float(self.generator.random())
+
+
+def make_rng(seed=None):
+    """seed から乱数生成器（random() を持つオブジェクト）を作る"""
+    if seed is None or seed is random:
+        return random
+    if isinstance(seed, (random.Random, _NumpyRandom)):
+        return seed
+    if hasattr(seed, "bit_generator"):
+        return _NumpyRandom(seed)
+    if isinstance(seed, numbers.Integral):
+        return random.Random(operator.index(seed))
+    raise TypeError(f"seed には整数・random.Random・numpy.random.Generator を指定してください: {seed!r}")
+
+
+def randbelow(rng, n):
+    """0 ～ n-1 の整数を1つ選ぶ（random() だけを使う）"""
+    return min(int(rng.random() * n), n - 1)
+
+
+def choice(rng, seq):
+    """シーケンスから1つ選ぶ（random() だけを使う）"""
+    return seq[randbelow(rng, len(seq))]
+
+
+def _position_to_star(position, excluded):
+    """除外されていない★のうち position 番目の★番号（excluded は昇順）"""
+    star_index = position
+    for excluded_index in excluded:
+        if excluded_index > star_index:
+            break
+        star_index += 1
+    return star_index
+
+
+def sample_stars(n_stars, count, exclude=(), seed=None, clusters=None):
+    """重複なしで★番号を count 個抽出（★が足りない場合はある分だけ）
+
+    clusters を渡すと、クラスタごとに1個まで（冒頭の説明を参照）。
+    """
+    rng = make_rng(seed)
+    excluded = sorted({i for i in exclude if 0 <= i < n_stars})
+    available = n_stars - len(excluded)
+    count = max(0, min(count, available))
+
+    swapped = {}
+    positions = []
+    if clusters is None:
+        for i in range(count):
+            j = i + randbelow(rng, available - i)
+            positions.append(swapped.get(j, j))
+            swapped[j] = swapped.get(i, i)
+        if not excluded:
+            return positions
+        return [_position_to_star(p, excluded) for p in positions]
+
+    used_clusters = {clusters[j] for j in excluded}
+    picks = []
+    for i in range(available):
+        if len(picks) == count:
+            break
+        j = i + randbelow(rng, available - i)
+        position = swapped.get(j, j)
+        swapped[j] = swapped.get(i, i)
+        star_index = _position_to_star(position, excluded) if excluded else position
+        cluster = clusters[star_index]
+        if cluster not in used_clusters:
+            used_clusters.add(cluster)
+            picks.append(star_index)
+    return picks
+
+
+def sample_elements(corpus, count, exclude=(), seed=None, clusters=None):
+    """重複なしで (項目名, ★テキスト) を count 個抽出"""
+    return [corpus.element(j) for j in sample_stars(corpus.n_stars, count, exclude, seed, clusters)]
+
+
+class _SparseShuffle:
+    """0 ～ n-1 を重複なしで1つずつ取り出す（疎なフィッシャー–イェーツ法）"""
+
+    def __init__(self, n):
+        self.n = n
+        self.drawn = 0
+        self.swapped = {}
+
+    def draw(self, rng):
+        """次の1つ（すべて取り出した後は None）"""
+        i = self.drawn
+        if i >= self.n:
+            return None
+        j = i + randbelow(rng, self.n - i)
+        swapped = self.swapped
+        value = swapped.get(j, j)
+        swapped[j] = swapped.get(i, i)
+        self.drawn = i + 1
+        return value
+
+
+def sample_genre_stars(n_stars, genre_ids, count, bias=1.0, exclude=(), seed=None, clusters=None):
+    """ジャンルに分類された★（genre_ids）を優先して、重複なしで★番号を count 個抽出
+
+    bias はジャンルに合わせる度合い（0～1）。各要素を確率 bias でジャンルの★から、
+    それ以外は全★から選ぶ。1 ならジャンルの★だけ（厳密な絞り込み）、0 なら全★から一様に選ぶ。
+    ジャンルの★が足りない分は全★から補う。
+    ジャンルの★と全★の両方から重複なしの抽出を1つずつ進め、選択済み・除外の★が
+    出た場合はその抽出の次の★を使う（どちらの抽出も同じ★を2度は出さないので必ず終わる）。
+    clusters を渡すと、選択済み・除外の★と同じクラスタの★も同じように飛ばす。
+    """
+    rng = make_rng(seed)
+    taken = set(exclude)
+    used_clusters = {clusters[j] for j in taken if 0 <= j < n_stars} if clusters is not None else None
+    genre_pool = _SparseShuffle(len(genre_ids))
+    all_pool = _SparseShuffle(n_stars)
+
+    picks = []
+    for _ in range(count):
+        star_index = None
+        if rng.random() < bias:
+            while True:
+                position = genre_pool.draw(rng)
+                if position is None:
+                    break
+                candidate = genre_ids[position]
+                if candidate not in taken and (used_clusters is None or clusters[candidate] not in used_clusters):
+                    star_index = candidate
+                    break
+        if star_index is None:
+            while True:
+                star_index = all_pool.draw(rng)
+                if star_index is None:
+                    break
+                if star_index not in taken and (used_clusters is None or clusters[star_index] not in used_clusters):
+                    break
+            if star_index is None:
+                break
+        taken.add(star_index)
+        if used_clusters is not None:
+            used_clusters.add(clusters[star_index])
+        picks.append(star_index)
+    return picks
+
+
+def sample_genre_elements(corpus, genre_key, count, bias=1.0, exclude=(), seed=None, clusters=None):
+    """ジャンル（GENRE_KEYS のいずれか）の★を優先して (項目名, ★テキスト) を count 個抽出"""
+    star_ids = sample_genre_stars(corpus.n_stars, corpus.genre_star_ids(genre_key), count, bias, exclude, seed,
+                                  clusters)
+    return [corpus.element(j) for j in star_ids]
+
+
+def _numpy_generator(seed):
+    """seed から numpy.random.Generator を作る（sample_star_batch 用）"""
+    import numpy as np
+
+    if seed is None:
+        return np.random.Generator(np.random.PCG64())
+    if isinstance(seed, numbers.Integral):
+        return np.random.Generator(np.random.PCG64(operator.index(seed)))
+    if isinstance(seed, _NumpyRandom):
+        return seed.generator
+    if hasattr(seed, "bit_generator"):
+        return seed
+    # random.Random（と random モジュール）は random() だけを使ってシードを作る
+    rng = make_rng(seed)
+    return np.random.Generator(np.random.PCG64(int(rng.random() * (1 << 53))))
+
+
+def _draw_star_rows(rng, n_stars, n_sets, count):
+    """重複なしの★番号の組を n_sets 組抽出（sample_star_batch の本体）"""
+    import numpy as np
+
+    star_ids = np.empty((n_sets, count), dtype=np.int32)
+    sorted_ids = np.empty((n_sets, count), dtype=np.int32)
+
+    for j in range(count):
+        remaining = n_stars - j
+        picked = np.minimum(rng.random(n_sets) * remaining, remaining - 1).astype(np.int32)
+        for i in range(j):
+            picked += picked >= sorted_ids[:, i]
+        star_ids[:, j] = picked
+        sorted_ids[:, :j + 1] = np.sort(star_ids[:, :j + 1], axis=1)
+
+    return star_ids
+
+
+def sample_star_batch(n_stars, n_sets, count, seed=None, clusters=None):
+    """n_sets 組の★番号をまとめて抽出（NumPy が必要）
+
+    戻り値は (n_sets, count) の int32 行列で、各行の★番号は重複しない。
+    seed は他の抽出関数と同じ（冒頭の説明を参照）。整数の場合は PCG64(seed) を使い、
+    その random()（53ビット精度の浮動小数点数）から floor(u * n) で位置を決める。
+    random.Random の場合は、その random() 1回から PCG64 のシードを作る
+    （連続した呼び出しで1本の系列になる）。PCG64 の出力系列は NumPy のバージョンに
+    よらず同じなので、同じシードなら同じ行列になる。
+
+    j 個目の★は残り (★数 - j) 個の中の位置として一様に選び、
+    その行で選択済みの★番号（昇順）を小さい順に飛ばして実際の番号に直す。
+    リトライが無いので、1組あたりの計算量は count の2乗に比例する程度で済む。
+
+    clusters を渡すと、各行でクラスタごとに1個までにする。同じクラスタの★を含む行だけを
+    まとめて抽出し直す（ほとんどの行はそのままなので、同じクラスタの★が出なかった行は
+    clusters を渡さないときと同じになる）。
+    """
+    import numpy as np
+
+    if not 0 <= count <= n_stars:
+        raise ValueError(f"1組あたりの要素数は0～{n_stars}の範囲で指定してください: {count}")
+
+    rng = _numpy_generator(seed)
+    star_ids = _draw_star_rows(rng, n_stars, n_sets, count)
+    if clusters is None or count < 2:
+        return star_ids
+
+    clusters = np.asarray(clusters)
+    if len(np.unique(clusters[:n_stars])) < count:
+        raise ValueError(f"1組あたりの要素数がクラスタの数を超えています: {count}")
+    rows = np.arange(n_sets)
+    while len(rows):
+        row_clusters = np.sort(clusters[star_ids[rows]], axis=1)
+        rows = rows[(row_clusters[:, 1:] == row_clusters[:, :-1]).any(axis=1)]
+        star_ids[rows] = _draw_star_rows(rng, n_stars, len(rows), count)
+    return star_ids
+
+
+def elements_from_ids(corpus, star_ids):
+    """★番号の並び（行列の1行など）を (項目名, ★テキスト) のリストに変換"""
+    return [corpus.element(int(j)) for j in star_ids]
+
+
+def iter_element_sets(corpus, star_id_matrix):
+    """★番号の行列を1行ずつ (項目名, ★テキスト) のリストに変換"""
+    for row in star_id_matrix:
+        yield elements_from_ids(corpus, row)
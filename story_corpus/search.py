@@ -0,0 +1,203 @@
+# search.py
+# 物語要素（項目名と★テキスト）の全文検索
+#
+# 日本語は単語の区切りが無いので、文字2-gram（隣り合う2文字）の転置インデックスを使う。
+# インデックスはコンパイル時に作って物語要素バイナリ（compiled.py）に格納し、
+# 検索時は mmap 上の配列を二分探索するだけで済むようにする。
+#
+# インデックスの形式:
+#   文字表     : コーパスに現れる文字のコードポイント（昇順）。文字番号は位置+1
+#                （0 はテキストの終わりを表す）
+#   2-gram     : (文字番号 << 16) | 次の文字番号 を昇順に並べたもの
+#   投稿リスト : 2-gramごとに、それを含む★番号（昇順）。項目名の2-gramは、その項目の★すべてに載せる
+# 各テキストの最後の文字には「終わり」との2-gramがあるので、どの文字も何らかの2-gramの
+# 1文字目に現れる。1文字の検索語は、その文字で始まる2-gramの範囲（連続している）で引ける。
+#
+# 検索語と本文はどちらも NFKC 正規化・小文字化し、カタカナはひらがなにそろえる
+# （全角・半角やカナの違いを気にせず検索できる）。★テキスト先頭の「★３ｂ．」などの
+# 番号と、項目名の【】は検索対象に含めない。
+# 「【猫】★２．」のような★の参照は、インデックスを使わず見出し語と番号から直接引く（labels.py）。
+#
+# 正規化（normalize_text・item_search_text・star_search_text）と、記号を除いた文字2-gram
+# （word_bigrams）は、ほぼ重複する★の判定（clusters.py）と似た★を避ける抽出のベクトル
+# （diversity.py）でも使う。どれも同じ関数を使い、別に定義しない。
+
+import re
+import unicodedata
+from bisect import bisect_left
+
+# カタカナ → ひらがな
+_KANA_TO_HIRAGANA = {cp: cp - 0x60 for cp in range(0x30A1, 0x30F7)}
+# ★テキスト先頭の番号（正規化後）
+_STAR_LABEL = re.compile(r"^★[0-9a-z]*\.?")
+
+# 句読点・括弧・空白（word_bigrams の2-gram に含めない）
+_NON_WORD = re.compile(r"[\W_]+")
+
+# 文字番号は16ビットに収める
+MAX_CHARS = 0xFFFF
+
+
+def normalize_text(text):
+    """検索用にテキストを正規化（NFKC・小文字化・カタカナをひらがなに）"""
+    return unicodedata.normalize("NFKC", text).casefold().translate(_KANA_TO_HIRAGANA)
+
+
+def item_search_text(item):
+    """項目名の検索対象部分（【】を除く）"""
+    return normalize_text(item).strip("【】")
+
+
+def star_search_text(star):
+    """★テキストの検索対象部分（先頭の番号を除く）"""
+    return _STAR_LABEL.sub("", normalize_text(star), count=1)
+
+
+def word_bigrams(text):
+    """正規化済みのテキストから記号・空白を除いた文字2-gramのリスト（1文字以下ならそのテキストだけ）"""
+    text = _NON_WORD.sub("", text)
+    return [text[i:i + 2] for i in range(len(text) - 1)] or [text]
+
+
+def build_ngram_index(story_elements):
+    """物語要素のリストから2-gramインデックスを作る
+
+    戻り値は (文字表, 2-gram, 投稿リストの開始位置, 投稿リスト) の整数リスト。
+    """
+    texts = []
+    star_index = 0
+    for item_data in story_elements:
+        item_text = item_search_text(item_data["item"])
+        for star in item_data["stars"]:
+            texts.append((star_index, item_text))
+            texts.append((star_index, star_search_text(star)))
+            star_index += 1
+
+    chars = sorted({ch for _, text in texts for ch in text})
+    if len(chars) >= MAX_CHARS:
+        raise ValueError(f"物語要素データの文字の種類が多すぎます: {len(chars)}")
+    char_ids = {ch: i for i, ch in enumerate(chars, 1)}
+
+    postings = {}
+    for star_index, text in texts:
+        ids = [char_ids[ch] for ch in text]
+        ids.append(0)
+        for first, second in zip(ids, ids[1:]):
+            postings.setdefault((first << 16) | second, set()).add(star_index)
+
+    keys = sorted(postings)
+    offsets = [0]
+    flat = []
+    for key in keys:
+        flat.extend(sorted(postings[key]))
+        offsets.append(len(flat))
+    return [ord(ch) for ch in chars], keys, offsets, flat
+
+
+class SearchIndex:
+    """物語要素バイナリに格納された2-gramインデックスによる検索
+
+    chars / keys / offsets / postings は build_ngram_index の戻り値と同じ並び
+    （mmap 上の u32 配列でもよい）。
+    """
+
+    def __init__(self, corpus, chars, keys, offsets, postings):
+        self.corpus = corpus
+        self._chars = chars
+        self._keys = keys
+        self._offsets = offsets
+        self._postings = postings
+        # 照合用に正規化したテキスト（最初の検索時に作る）
+        self._texts = None
+
+    def _char_id(self, ch):
+        cp = ord(ch)
+        i = bisect_left(self._chars, cp)
+        if i < len(self._chars) and self._chars[i] == cp:
+            return i + 1
+        return None
+
+    def _key_range(self, lo, hi):
+        """2-gram が lo 以上 hi 未満の投稿リスト（連続した範囲）"""
+        start = self._offsets[bisect_left(self._keys, lo)]
+        end = self._offsets[bisect_left(self._keys, hi)]
+        return self._postings[start:end]
+
+    def _term_candidates(self, term):
+        """検索語の2-gramをすべて含む★番号の集合"""
+        ids = [self._char_id(ch) for ch in term]
+        if None in ids:
+            return set()
+        if len(ids) == 1:
+            return set(self._key_range(ids[0] << 16, (ids[0] + 1) << 16))
+
+        lists = [self._key_range(key, key + 1) for key in {(a << 16) | b for a, b in zip(ids, ids[1:])}]
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for posting in lists[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        return candidates
+
+    def _search_texts(self):
+        """★ごとの (項目名, ★テキスト) の正規化済みテキスト"""
+        if self._texts is None:
+            corpus = self.corpus
+            items = [item_search_text(corpus.item_name(i)) for i in range(corpus.n_items)]
+            self._texts = [
+                (items[corpus.star_item(j)], star_search_text(corpus.star_text(j)))
+                for j in range(corpus.n_stars)
+            ]
+        return self._texts
+
+    def search(self, query, limit=20):
+        """query に一致する★番号を関連の高い順に返す
+
+        空白で区切った語はすべて含むもの（AND）を返す。
+        項目名に一致する語が多いもの（同じ数なら項目名が短いもの）、
+        ★テキストの前の方で一致するものほど上位になる。
+        「【猫】★２．」「猫 ★2」のような★の参照は、その★だけを返す。
+        """
+        star_index = self.corpus.find_star_reference(query)
+        if star_index is not None:
+            return [star_index] if limit is None or limit > 0 else []
+
+        terms = [term for term in normalize_text(query).split() if term]
+        terms = [term.strip("【】") or term for term in terms]
+        if not terms:
+            return []
+
+        candidates = None
+        for term in sorted(set(terms), key=len, reverse=True):
+            found = self._term_candidates(term)
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                return []
+
+        texts = self._search_texts()
+        ranked = []
+        for star_index in candidates:
+            item_text, star_text = texts[star_index]
+            item_hits = 0
+            position = 0
+            for term in terms:
+                if term in item_text:
+                    item_hits += 1
+                    continue
+                found_at = star_text.find(term)
+                if found_at < 0:
+                    break
+                position += found_at
+            else:
+                ranked.append((-item_hits, len(item_text) if item_hits else 0, position, star_index))
+
+        ranked.sort()
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [rank[-1] for rank in ranked]
+
+
+def search_stars(corpus, query, limit=20):
+    """物語要素を全文検索し、一致した★番号を関連の高い順に返す"""
+    return corpus.search_index.search(query, limit)
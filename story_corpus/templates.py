@@ -0,0 +1,89 @@
+# templates.py
+# プロンプト用の小さなテンプレートエンジン
+#
+# テンプレートは str.format と同じ {名前} 形式で書き、最初に1回だけ解析して
+# 「固定の文字列」と「差し込み位置」の並びに変換しておく。
+# bind() で一部の値（ジャンル・終わり方など）を先に埋めると、隣り合う固定部分を
+# 連結した断片の並びができるので、それをキャッシュしておけば
+# プロンプト1件の生成は、断片と差し込む値（物語要素の行など）の連結1回で済む。
+#
+# 連結は、断片の並びの差し込み位置に値を入れて "".join する（1回の連結で済む）。
+
+from string import Formatter
+
+_formatter = Formatter()
+
+
+class PromptTemplate:
+    """解析済みのテンプレート
+
+    fragments は固定の文字列と差し込み位置（None）の並び、
+    slots は差し込み位置の番号と (名前, 変換, 書式) の組。
+    render(**値) で残りの差し込み位置を埋めた文字列を作る。
+    """
+
+    def __init__(self, text=None, fragments=None, slots=None):
+        if text is not None:
+            fragments, slots = self._parse(text)
+        self.fragments = tuple(fragments)
+        self.slots = tuple(slots)
+        self.field_names = frozenset(name for _, (name, _, _) in self.slots)
+
+    @staticmethod
+    def _parse(text):
+        fragments = []
+        slots = []
+        for literal, name, format_spec, conversion in _formatter.parse(text):
+            if literal:
+                fragments.append(literal)
+            if name is not None:
+                if not name.isidentifier():
+                    raise ValueError(f"テンプレートの差し込み名が正しくありません: {{{name}}}")
+                if any(c in format_spec for c in "{}"):
+                    raise ValueError(f"テンプレートの書式指定が正しくありません: {{{name}:{format_spec}}}")
+                slots.append((len(fragments), (name, conversion, format_spec)))
+                fragments.append(None)
+        return fragments, slots
+
+    def render(self, **values):
+        """残りの差し込み位置を埋めて文字列を作る"""
+        parts = list(self.fragments)
+        for index, (name, conversion, format_spec) in self.slots:
+            value = values[name]
+            if conversion is not None:
+                value = _formatter.convert_field(value, conversion)
+            # 書式指定の無い文字列（物語要素の行など）はそのまま使う
+            parts[index] = value if not format_spec and type(value) is str else format(value, format_spec)
+        return "".join(parts)
+
+    def bind(self, **values):
+        """一部の差し込み位置を埋めた新しいテンプレートを返す
+
+        埋めた値と前後の固定部分は1つの文字列に連結される。
+        """
+        fragments = list(self.fragments)
+        for index, (name, conversion, format_spec) in self.slots:
+            if name in values:
+                value = values[name]
+                if conversion is not None:
+                    value = _formatter.convert_field(value, conversion)
+                fragments[index] = format(value, format_spec)
+
+        # 固定部分を連結し直す
+        merged = []
+        merged_slots = []
+        slot_fields = dict(self.slots)
+        for index, fragment in enumerate(fragments):
+            if fragment is None:
+                merged_slots.append((len(merged), slot_fields[index]))
+                merged.append(None)
+            elif merged and merged[-1] is not None:
+                merged[-1] += fragment
+            else:
+                merged.append(fragment)
+        return PromptTemplate(fragments=merged, slots=merged_slots)
+
+
+def element_lines(elements):
+    """物語要素の行（"1. 【項目】 ★テキスト" と改行を並べた文字列）"""
+    return "".join(f"{i}. {item} {star}\n" for i, (item, star) in enumerate(elements, 1))
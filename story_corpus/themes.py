@@ -0,0 +1,81 @@
+# themes.py
+# ジャンル（GENRE_KEYS）ごとの★の分類
+#
+# ジャンルごとのキーワード（語彙）が項目名か★テキストに含まれる★を、そのジャンルの★とする。
+# 分類はコンパイル時に1回だけ行い、ジャンルごとの★番号の配列として物語要素バイナリ
+# （compiled.py）に格納する。1つの★が複数のジャンルに入ることも、どのジャンルにも入らないこともある。
+# 照合は全文検索（search.py）と同じ正規化をしたテキストで行う。
+#
+# 語彙を変更すると THEMES_HASH が変わり、古いバイナリは読み込み時に作り直される。
+
+import hashlib
+import json
+
+from .prompts import GENRE_KEYS
+from .search import item_search_text, normalize_text, star_search_text
+
+GENRE_LEXICONS = {
+    "genre_folk": (
+        "昔話", "民話", "伝説", "言い伝え", "狐", "狸", "鬼", "天狗", "河童", "山姥", "竜", "龍", "蛇", "猿",
+        "地蔵", "長者", "爺", "婆", "翁", "媼", "殿様", "村人", "恩返し", "化かす", "観音", "和尚", "庄屋",
+        "鶴", "亀", "浦島", "羽衣", "神", "仏", "僧",
+    ),
+    "genre_sf": (
+        "ロボット", "宇宙", "未来", "時間旅行", "タイム", "科学", "機械", "人工", "実験", "惑星", "星人",
+        "地球", "電子", "装置", "発明", "クローン", "複製", "超能力", "テレパシー", "月世界", "火星",
+        "コンピュータ", "原子", "光線", "透明人間", "ミサイル", "遺伝子", "人造", "アンドロイド", "予知",
+        "並行世界", "次元", "空間", "瞬間移動", "ワープ", "円盤", "人類", "文明",
+    ),
+    "genre_mystery": (
+        "殺人", "殺す", "殺し", "殺さ", "犯人", "探偵", "犯罪", "盗", "泥棒", "推理", "謎", "密室", "証拠",
+        "事件", "死体", "毒", "変装", "暗号", "秘密", "偽", "騙", "陰謀", "警察", "刑事", "裁判", "アリバイ",
+        "替え玉", "身代わり", "誘拐", "脅迫", "復讐", "見破",
+    ),
+    "genre_fantasy": (
+        "魔法", "魔術", "妖精", "竜", "龍", "魔女", "呪文", "変身", "異界", "冥界", "天界", "精霊", "女神",
+        "巨人", "小人", "不死", "宝", "剣", "指輪", "予言", "王子", "王女", "姫", "城", "魔物", "怪物",
+        "一角獣", "仙人", "仙界", "異郷", "天人", "神々",
+    ),
+    "genre_horror": (
+        "幽霊", "亡霊", "怨霊", "化け物", "妖怪", "死体", "死者", "墓", "呪", "祟", "たたり", "悪霊", "悪魔",
+        "怪談", "血", "骸骨", "生首", "棺", "吸血", "人食い", "食人", "狂気", "恐怖", "悪夢", "死神", "憑",
+        "生霊", "怨念", "殺され",
+    ),
+    "genre_comedy": (
+        "笑", "滑稽", "愚か", "愚人", "馬鹿", "ばか", "間抜け", "勘違い", "取り違え", "聞き違い", "言い間違い",
+        "間違え", "誤解", "とんち", "頓智", "洒落", "冗談", "いたずら", "悪戯", "屁", "酔っ", "大食",
+        "ほら吹き", "大ぼら", "見栄", "けち", "粗忽", "早とちり", "のんき", "うっかり", "からか", "化けくらべ",
+        "知恵くらべ", "だまされ",
+    ),
+    "genre_romance": (
+        "恋", "愛", "結婚", "婚", "夫婦", "求婚", "婚約", "駆け落ち", "心中", "片思い", "嫉妬", "浮気", "不倫",
+        "離婚", "花嫁", "花婿", "口づけ", "接吻", "一目惚れ", "逢い引き", "密会", "契り", "愛人", "相思相愛",
+        "妻", "夫",
+    ),
+    "genre_adventure": (
+        "旅", "冒険", "航海", "船", "遭難", "漂流", "島", "探検", "宝探し", "戦い", "戦争", "戦士", "英雄",
+        "勇者", "退治", "脱出", "逃亡", "追跡", "砂漠", "洞窟", "地底", "騎士", "決闘", "武者修行", "遠征",
+        "海賊", "山賊", "怪物",
+    ),
+}
+
+# 語彙（とジャンルの並び）の内容ハッシュ。バイナリに記録し、一致しなければ作り直す
+THEMES_HASH = hashlib.sha256(
+    json.dumps([[key, GENRE_LEXICONS[key]] for key in GENRE_KEYS], ensure_ascii=False).encode("utf-8")
+).digest()[:8]
+
+
+def tag_genres(story_elements):
+    """物語要素のリストを分類し、GENRE_KEYS の順にジャンルごとの★番号（昇順）のリストを返す"""
+    lexicons = [[normalize_text(word) for word in GENRE_LEXICONS[key]] for key in GENRE_KEYS]
+    genre_ids = [[] for _ in GENRE_KEYS]
+    star_index = 0
+    for item_data in story_elements:
+        item_text = item_search_text(item_data["item"])
+        for star in item_data["stars"]:
+            text = f"{item_text}\n{star_search_text(star)}"
+            for ids, words in zip(genre_ids, lexicons):
+                if any(word in text for word in words):
+                    ids.append(star_index)
+            star_index += 1
+    return genre_ids
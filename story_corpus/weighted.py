@@ -0,0 +1,323 @@
+# weighted.py
+# 重み付きの★の抽出
+#
+# AliasTable は Walker / Vose のエイリアス法の表で、重みの列ごとに O(N) で1回作れば
+# 重みに比例した1つの抽出が O(1) で行える。抽出の分布（DISTRIBUTIONS）:
+#   stars  : ★ごとに一様（sampler.sample_stars と同じ分布）
+#   items  : 項目ごとに一様（★の少ない項目の★ほど選ばれやすい）
+#   custom : ★ごとに指定した重み
+# 一部の重みだけを変える場合は表を作り直さず、変更分を別に持って抽出時に補正する。
+#
+# FenwickTree は重みの累積和を二分木（Fenwick木）で持ち、
+#   - 1つの重みの変更 O(log N)
+#   - 重みに比例した1つの抽出 O(log N)
+# で行える。評価によって少しずつ重みが変わる場合（ショートショート版の評価の学習など）に使う。
+# 乱数の扱い（seed）は sampler.py と同じ。
+
+import math
+from functools import lru_cache
+
+from .sampler import make_rng, randbelow
+
+DISTRIBUTIONS = ("stars", "items", "custom")
+
+# 重複なしの抽出で、選択済みの★が続いた場合に残りの★から直接選ぶまでの回数
+_MAX_REJECTS = 32
+
+
+class AliasTable:
+    """重み（0以上の実数）に比例して位置を O(1) で選ぶエイリアス表（Walker / Vose の方法）
+
+    set で重みを変更すると、変更した位置を表とは別に持ち、表から変更した位置が出たら
+    引き直す（変更した位置は別に重みに比例して選ぶ）。変更が増えたら表を作り直す。
+    """
+
+    def __init__(self, weights):
+        self.weights = [float(w) for w in weights]
+        if not self.weights:
+            raise ValueError("重みが空です")
+        if min(self.weights) < 0:
+            raise ValueError("重みに負の値があります")
+        self._build()
+
+    def __len__(self):
+        return len(self.weights)
+
+    def _build(self):
+        n = len(self.weights)
+        total = math.fsum(self.weights)
+        if total <= 0:
+            raise ValueError("重みの合計が0です")
+        scaled = [w * n / total for w in self.weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            i = small.pop()
+            j = large[-1]
+            prob[i] = scaled[i]
+            alias[i] = j
+            scaled[j] = (scaled[j] + scaled[i]) - 1.0
+            if scaled[j] < 1.0:
+                small.append(large.pop())
+        # 残りは誤差で1からずれているだけなので、そのまま自分を選ぶ（prob = 1）
+        self._prob = prob
+        self._alias = alias
+        self._base_weights = list(self.weights)
+        self._base_total = total
+        # 表を作った後に変更した位置 → 現在の重み
+        self._changed = {}
+        self._changed_total = 0.0
+        self._hidden = 0.0
+
+    @property
+    def total(self):
+        """重みの合計"""
+        return self._base_total - self._hidden + self._changed_total
+
+    def set(self, index, weight):
+        """index の重みを weight にする（表は変更が増えたときだけ作り直す）"""
+        weight = float(weight)
+        if weight < 0:
+            raise ValueError(f"重みに負の値は指定できません: {weight}")
+        changed = self._changed
+        base_weight = self._base_weights[index]
+        if index in changed:
+            self._changed_total -= changed.pop(index)
+            self._hidden -= base_weight
+        if weight != base_weight:
+            changed[index] = weight
+            self._changed_total += weight
+            self._hidden += base_weight
+        self.weights[index] = weight
+        if len(changed) > max(16, len(self.weights) >> 6) or self._hidden > self._base_total / 4:
+            self._build()
+
+    def draw(self, rng):
+        """重みに比例して位置を1つ選ぶ（rng は random() を持つオブジェクト）"""
+        changed = self._changed
+        if changed:
+            base_mass = self._base_total - self._hidden
+            if base_mass <= self._base_total * 1e-12:
+                base_mass = 0.0
+            u = rng.random() * (base_mass + self._changed_total)
+            if u >= base_mass:
+                u -= base_mass
+                for index, weight in changed.items():
+                    if u < weight:
+                        return index
+                    u -= weight
+                # 誤差で最後まで来た場合は、重みのある最後の位置
+                for index in reversed(list(changed)):
+                    if changed[index] > 0:
+                        return index
+                raise ValueError("重みの合計が0です")
+
+        prob = self._prob
+        n = len(prob)
+        while True:
+            u = rng.random() * n
+            k = min(int(u), n - 1)
+            index = k if u - k < prob[k] else self._alias[k]
+            if index not in changed:
+                return index
+
+
+def star_weights(corpus, distribution="stars", weights=None):
+    """抽出の分布（DISTRIBUTIONS）に対応する★ごとの重みのリスト
+
+    custom の場合は weights に★ごとの重み（★数と同じ長さの列、または {★番号: 重み}）を渡す。
+    """
+    n_stars = corpus.n_stars
+    if distribution == "stars":
+        return [1.0] * n_stars
+    if distribution == "items":
+        result = []
+        for item_index in range(corpus.n_items):
+            stars = corpus.star_range(item_index)
+            result.extend([1.0 / len(stars)] * len(stars))
+        return result
+    if distribution == "custom":
+        if weights is None:
+            raise ValueError("custom の場合は weights を指定してください")
+        if isinstance(weights, dict):
+            result = [0.0] * n_stars
+            for star_index, weight in weights.items():
+                result[int(star_index)] = float(weight)
+            return result
+        if len(weights) != n_stars:
+            raise ValueError(f"重みの数が★の数と一致しません: {len(weights)} / {n_stars}")
+        return [float(w) for w in weights]
+    raise ValueError(f"未対応の抽出の分布です: {distribution}")
+
+
+@lru_cache(maxsize=8)
+def distribution_table(corpus, distribution):
+    """stars / items の分布のエイリアス表（物語要素データごとに1回だけ作る）
+
+    返す表は共有されるので set で変更しない（変更する場合は AliasTable(star_weights(...)) を作る）。
+    """
+    if distribution == "custom":
+        raise ValueError("custom の表は AliasTable(star_weights(corpus, \"custom\", weights)) で作ってください")
+    return AliasTable(star_weights(corpus, distribution))
+
+
+def _draw_remaining(weights, taken, rng, clusters=None, used_clusters=()):
+    """選択済み（と使用済みのクラスタ）を除いた★から重みに比例して直接選ぶ（O(N)、残りが無ければ None）"""
+    remaining = [(i, w) for i, w in enumerate(weights)
+                 if w > 0 and i not in taken and (clusters is None or clusters[i] not in used_clusters)]
+    if not remaining:
+        return None
+    u = rng.random() * math.fsum(w for _, w in remaining)
+    for i, w in remaining:
+        if u < w:
+            return i
+        u -= w
+    return remaining[-1][0]
+
+
+def sample_alias_stars(table, count, exclude=(), seed=None, clusters=None):
+    """重み（AliasTable）に比例して、重複なしで★番号を count 個抽出
+
+    表は変更しない（複数のスレッドから同じ表を使える）。選択済み・除外の★が出たら引き直し、
+    それが続く場合（重みが一部の★に偏っている場合）は残りの★から直接選ぶ。
+    重みが0の★は選ばれない（足りない場合はある分だけ）。
+    clusters を渡すと、選択済み・除外の★と同じクラスタの★も引き直す（sampler.py を参照）。
+    """
+    rng = make_rng(seed)
+    taken = set(exclude)
+    used_clusters = set()
+    if clusters is not None:
+        used_clusters = {clusters[j] for j in taken if 0 <= j < len(table)}
+    picks = []
+    while len(picks) < count:
+        for _ in range(_MAX_REJECTS):
+            star_index = table.draw(rng)
+            if star_index not in taken and (clusters is None or clusters[star_index] not in used_clusters):
+                break
+        else:
+            star_index = _draw_remaining(table.weights, taken, rng, clusters, used_clusters)
+            if star_index is None:
+                break
+        taken.add(star_index)
+        if clusters is not None:
+            used_clusters.add(clusters[star_index])
+        picks.append(star_index)
+    return picks
+
+
+def sample_distribution_elements(corpus, count, distribution="stars", exclude=(), seed=None):
+    """抽出の分布（stars / items）に従って、重複なしで (項目名, ★テキスト) を count 個抽出"""
+    star_ids = sample_alias_stars(distribution_table(corpus, distribution), count, exclude, seed)
+    return [corpus.element(j) for j in star_ids]
+
+
+class FenwickTree:
+    """重みの列（0以上の実数）から、重みに比例して位置を選ぶためのFenwick木"""
+
+    def __init__(self, weights):
+        self.weights = [float(w) for w in weights]
+        n = len(self.weights)
+        tree = [0.0] + self.weights
+        # 子から親へ足し込んで O(N) で作る
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._top = 1 << (n.bit_length() - 1) if n else 0
+
+    def __len__(self):
+        return len(self.weights)
+
+    def add(self, index, delta):
+        """index の重みに delta を加える"""
+        self.weights[index] += delta
+        tree = self._tree
+        i = index + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def set(self, index, weight):
+        """index の重みを weight にする"""
+        self.add(index, weight - self.weights[index])
+
+    @property
+    def total(self):
+        """重みの合計"""
+        total = 0.0
+        i = len(self.weights)
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, u):
+        """累積和が u を超える最初の位置（0 <= u < total）"""
+        tree = self._tree
+        n = len(self.weights)
+        position = 0
+        step = self._top
+        while step:
+            next_position = position + step
+            if next_position <= n and tree[next_position] <= u:
+                position = next_position
+                u -= tree[next_position]
+            step >>= 1
+        # 浮動小数点の誤差で重み0の位置や範囲外に着いた場合は、重みのある位置まで戻る
+        position = min(position, n - 1)
+        while position > 0 and self.weights[position] <= 0:
+            position -= 1
+        return position
+
+
+def sample_weighted_stars(tree, count, exclude=(), exploration=0.0, seed=None, clusters=None):
+    """重み（FenwickTree）に比例して、重複なしで★番号を count 個抽出
+
+    exploration（0～1）の確率で、重みに関係なく全★から一様に選ぶ（探索）。
+    重みが0の★は、探索のときだけ選ばれる。
+    抽出中は選んだ★と除外する★の重みを一時的に0にし、最後に元に戻す
+    （同じ木を複数のスレッドで使う場合は、呼び出し側でロックする）。
+    clusters を渡すと、選択済み・除外の★と同じクラスタの★が出たときはその★の重みも0にして
+    引き直す（sampler.py を参照）。
+    """
+    rng = make_rng(seed)
+    n_stars = len(tree)
+    taken = {j for j in exclude if 0 <= j < n_stars}
+    count = max(0, min(count, n_stars - len(taken)))
+    used_clusters = {clusters[j] for j in taken} if clusters is not None else None
+
+    saved = {j: tree.weights[j] for j in taken}
+    for j in saved:
+        tree.set(j, 0.0)
+    picks = []
+    try:
+        # クラスタで飛ばした★も taken に入るので、★が残っていなければ count 個未満で終わる
+        while len(picks) < count and len(taken) < n_stars:
+            star_index = None
+            total = tree.total
+            if total > 0 and rng.random() >= exploration:
+                star_index = tree.find(rng.random() * total)
+                if tree.weights[star_index] <= 0:
+                    # 合計が誤差だけで、重みのある★が残っていない
+                    star_index = None
+            if star_index is None:
+                # 探索（または重みのある★が残っていない場合）は一様に選ぶ
+                star_index = randbelow(rng, n_stars)
+                if star_index in taken:
+                    continue
+            taken.add(star_index)
+            saved[star_index] = tree.weights[star_index]
+            tree.set(star_index, 0.0)
+            if used_clusters is not None:
+                if clusters[star_index] in used_clusters:
+                    # 選ばずに重みを0にしたまま引き直す
+                    continue
+                used_clusters.add(clusters[star_index])
+            picks.append(star_index)
+    finally:
+        for j, weight in saved.items():
+            tree.set(j, weight)
+    return picks
@@ -1,15 +1,39 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import json
-import random
+import gzip
+import os
+import sys
+import threading
+
+from story_corpus import (
+    CompiledCorpus,
+    StarBitset,
+    build_desktop_prompt,
+    build_recipe_prompt,
+    decode_recipe,
+    encode_recipe,
+    generate_katakana_name,
+    load_corpus,
+    sample_stars,
+    search_stars,
+)
 
 # pyperclipの代替としてtkinterのクリップボード機能を使用
 
+# 内蔵データ（data_integration.pyで作成し、exe化の際に同梱する）
+# 同梱されていない場合（ソースから実行した場合）は story_corpus の共通データを使う
+CORPUS_RESOURCE = "story_elements.bin.gz"
+
+def resource_path(name):
+    """同梱リソースのパス（exe化した場合は展開先のフォルダ）"""
+    base_dir = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, name)
+
 class StoryPromptBuilder:
     def __init__(self, root):
         self.root = root
         self.root.title("物語生成プロンプトビルダー v1.0")
-        self.root.geometry("800x700")
+        self.root.geometry("800x850")
         
         # アイコン設定（エラー回避）
         try:
@@ -19,12727 +43,43 @@ class StoryPromptBuilder:
         
         # データ
         self.story_elements = []
-        self.selected_elements = []
+        # 選択された要素は★番号で持ち、テキストは表示するときに取り出す
+        self.selected_star_ids = []
+        self.selected_stars = StarBitset(0)
+        self.search_results = []
         self.characters = []
         
-        # 内蔵データを読み込む
-        self.load_story_elements()
+        # 内蔵データはUI作成と並行してバックグラウンドで展開する
+        self.elements_ready = threading.Event()
+        self.load_error = None
+        threading.Thread(target=self.load_story_elements, daemon=True).start()
         
         # UI作成
         self.create_widgets()
         
     def load_story_elements(self):
-        self.story_elements = [
-            {
-                        "item": "【相打ち】",
-                        "stars": [
-                                    "★１．刺し違え。",
-                                    "★２．互いに呪い合って、相手を動物に変える。",
-                                    "★３．猟師と猪の相打ち。",
-                                    "★４．互いにミサイルを相手国へ撃ち込む。"
-                        ]
-            },
-            {
-                        "item": "【合言葉】",
-                        "stars": [
-                                    "★１．合言葉で、味方であるか否かを確認する。",
-                                    "★２．警察や探偵が、合言葉を用いて犯罪組織に潜入する。",
-                                    "★３．合言葉を知らぬが、機転を利かせてその場をきりぬける。",
-                                    "★４．合言葉を知らないため、殺される。"
-                        ]
-            },
-            {
-                        "item": "【合図】",
-                        "stars": [
-                                    "★１．吉報か凶報かを示す。意図的に、あるいは手違いにより、正しくない合図が送られることがある。",
-                                    "★２．秘密の重要な合図。当事者以外には合図の意味はわからない。",
-                                    "★３．客をもてなす合図。",
-                                    "★４．生まれたのが男児か女児かを知らせる合図。",
-                                    "★５．遅すぎた合図。",
-                                    "★６．夫への変わらぬ愛を知らせるハンカチ。"
-                        ]
-            },
-            {
-                        "item": "【愛想づかし】",
-                        "stars": [
-                                    "★１．遊女が悪人をあざむくために、わざと夫や恋人に冷たい態度をとる・愛想づかしをする。",
-                                    "★２．愛する男の家族からの頼みにより、遊女が、男と別れる決心をする。",
-                                    "★３．妻が、夫の決心を鈍らせないように、夫に冷たい態度を見せる。",
-                                    "★４．権力者からの強要によって、女が恋人に別れを告げる。",
-                                    "★５．母親が、娘の幸福を願って愛想づかしをする。"
-                        ]
-            },
-            {
-                        "item": "【アイデンティティ】",
-                        "stars": [
-                                    "★１．自分が誰だかわからなくなる男。",
-                                    "★２．他人を見て、「これは自分だ」と誤認する男。",
-                                    "★３．自分が誰だかわからなくなる女。",
-                                    "★４．自分の実体は幻にすぎないと悟る男。",
-                                    "★５．自分を落とした男。",
-                                    "★６．アイデンティティを否定される男。",
-                                    "★７．自分が白人か黒人かわからない男。",
-                                    "★８．「私」は「あなた」であり、「あなた」は「私」である。",
-                                    "★９．自分が未来の弥勒菩薩であることを悟る。"
-                        ]
-            },
-            {
-                        "item": "【赤ん坊】",
-                        "stars": [
-                                    "★１．生まれたその日に立ち上がり歩行する赤ん坊。",
-                                    "★２．生まれた時のことを知っている赤ん坊。",
-                                    "★３．抱くと重くなる赤ん坊。",
-                                    "★４．産女（うぶめ）の赤ん坊。",
-                                    "★５．赤ん坊が天に昇って星となった。",
-                                    "★６．母親による嬰児殺し。",
-                                    "★７．赤ん坊の幽霊、あるいは父親の幻想。"
-                        ]
-            },
-            {
-                        "item": "【赤ん坊（天界の）】",
-                        "stars": [
-                                    "★１．天界や異郷の存在が、男の赤ん坊の形で地上に派遣される。赤ん坊は地上で成長し、天界へは帰らない。",
-                                    "★２．天界から女の赤ん坊の形で地上に送られ、成長後も地上にとどまって、天界へは帰らない。",
-                                    "★３．天界から女の赤ん坊の形で地上に送られるが、成長後、地上にとどまることなく、天界に帰ってしまう。"
-                        ]
-            },
-            {
-                        "item": "【赤ん坊がしゃべる】",
-                        "stars": [
-                                    "★１．赤ん坊が言葉を話す。",
-                                    "★２．赤ん坊が生まれてすぐ予言をする。",
-                                    "★３．赤ん坊が「わたしの父母は、あなた方ではない」と言う。",
-                                    "★４．赤ん坊がしゃべれるのに黙っている。"
-                        ]
-            },
-            {
-                        "item": "【悪魔】",
-                        "stars": [
-                                    "★１．神に反逆し、戦う悪魔。地獄に住む悪魔。",
-                                    "★２．「神」という言葉を聞いただけで、悪魔は滅ぶ。",
-                                    "★３．悪魔と問答する。",
-                                    "★４．悪魔をつかまえる。",
-                                    "★５．悪魔の花嫁。",
-                                    "★６．悪魔の子供。",
-                                    "★７．悪魔に似た姿の宇宙生命体。",
-                                    "★８．「悪魔」と呼ばれた人。"
-                        ]
-            },
-            {
-                        "item": "【悪魔との契約】",
-                        "stars": [
-                                    "★１．悪魔が人間の望みをかなえ、その代償に人間は魂を悪魔に与える。",
-                                    "★２．地獄堕ちと引き換えに、名画を描かせてやろう、との誘い。",
-                                    "★３．悪魔にだまされた人間が、愚かな契約をする。",
-                                    "★４．悪魔が神と賭けをして、人間を試す。",
-                                    "★５．欲のない人間には、悪魔の誘惑も無力である。"
-                        ]
-            },
-            {
-                        "item": "【痣（あざ）】",
-                        "stars": [
-                                    "★１．顔に青痣のある男。",
-                                    "★２．この世での使命を果たした後に、痣が消える。",
-                                    "★３．妊娠中に火を見たため、子供の身体に赤痣が現れる。",
-                                    "★４．性空上人の顔の痣と、肖像画に落とした筆の墨跡。"
-                        ]
-            },
-            {
-                        "item": "【足】",
-                        "stars": [
-                                    "★１．足で人を踏む。",
-                                    "★２．足で人をまたぐ。",
-                                    "★３．足の裏に文字を書く。",
-                                    "★４．脚を切り裂いて、傷口の中に物を入れる。",
-                                    "★５．人間の身体に動物の足。",
-                                    "★６．裸足の女。",
-                                    "★７ａ．足と靴。靴が脱げないので、足を切り落とす。",
-                                    "★７ｂ．足と靴。靴に合わせるために、足の指や踵を切り落とす。"
-                        ]
-            },
-            {
-                        "item": "【足が弱い】",
-                        "stars": [
-                                    "★１．生まれながらに足に障害を持つ神。",
-                                    "★２．傷を負うなどして足を悪くした人。",
-                                    "★３．「足に傷を負った人が、後に失明する」との迷信。",
-                                    "★４．足の奇病ゆえに死ぬ男。",
-                                    "★５．英雄が、足の踵を矢で射られて死ぬ。",
-                                    "★６．不死身の怪物の唯一の弱点が、足にある。"
-                        ]
-            },
-            {
-                        "item": "【足跡】",
-                        "stars": [
-                                    "★１．神の足跡。",
-                                    "★２．鬼・異類の足跡。",
-                                    "★３．巨人の足跡。",
-                                    "★４．河童の足跡。",
-                                    "★５．一本足の足跡。",
-                                    "★６．にせの足跡。"
-                        ]
-            },
-            {
-                        "item": "【足跡からわかること】",
-                        "stars": [
-                                    "★１．姿が見えなくても、足跡を残せば、居場所を知られてしまう。",
-                                    "★２．足が宙に浮いていれば、足跡はつかない。",
-                                    "★３．雪や花で足跡を隠す。",
-                                    "★４．行きの足跡と帰りの足跡。",
-                                    "★５．重い物を運んで歩けば、足跡は深くなる。",
-                                    "★６．大きな足跡と小さな足跡。"
-                        ]
-            },
-            {
-                        "item": "【足音】",
-                        "stars": [
-                                    "★１．人間が歩く足音。",
-                                    "★２．妖怪が歩く足音。",
-                                    "★３．幽霊が歩く足音。"
-                        ]
-            },
-            {
-                        "item": "【仇討ち（兄の）】",
-                        "stars": [
-                                    "★１．兄の仇を討つ。"
-                        ]
-            },
-            {
-                        "item": "【仇討ち（夫の）】",
-                        "stars": [
-                                    "★１．夫の仇を討つ。",
-                                    "★２．夫を殺した人物でなく、夫の死の原因となった物を、敵（かたき）と見なして討つ。"
-                        ]
-            },
-            {
-                        "item": "【仇討ち（主君の）】",
-                        "stars": [
-                                    "★１．主君・主人の仇を討つ。"
-                        ]
-            },
-            {
-                        "item": "【仇討ち（父の）】",
-                        "stars": [
-                                    "★１．父の仇を討つ。",
-                                    "★２．父の敵（かたき）を眼の前にしながら、討たない。",
-                                    "★３．父が殺されそうなことを知った子供たちが、先回りして父の敵を討ち、父の命を救う。",
-                                    "★４．父親の敵（かたき）と知らずに殺す。意図せずに行なわれた仇討ち。",
-                                    "★５．父および兄の仇を討つ。",
-                                    "★６．父および夫の仇を討つ。"
-                        ]
-            },
-            {
-                        "item": "【仇討ち（妻の）】",
-                        "stars": [
-                                    "★１．暴行された妻と娘の仇を討ちたいと思うが、犯人が特定できないので、同類の犯罪者を何人も殺す。"
-                        ]
-            },
-            {
-                        "item": "【仇討ち（動物の）】",
-                        "stars": [
-                                    "★１．動物の動物に対する仇討ち。",
-                                    "★２．日本および西欧の伝説・昔話などをもとに創作された、動物仇討ち物語。"
-                        ]
-            },
-            {
-                        "item": "【仇討ち（友人の）】",
-                        "stars": [
-                                    "★１．友人の仇を討つ。"
-                        ]
-            },
-            {
-                        "item": "【仇討ちせず】",
-                        "stars": [
-                                    "★１．「仇討をする」と嘘を言って、大勢の見物人を集める。",
-                                    "★２．敵（かたき）討ちの否定。"
-                        ]
-            },
-            {
-                        "item": "【あだ名】",
-                        "stars": [
-                                    "★１．容姿や服装を見て、あだ名をつける。",
-                                    "★２．同音異義語で、二重の意味を持つあだ名。",
-                                    "★３．Ａが口にした言葉が、そのままＡのあだ名になる。",
-                                    "★４．いつもあだ名で呼んでいるので、本名を忘れてしまう。",
-                                    "★５．カップルについたあだ名。"
-                        ]
-            },
-            {
-                        "item": "【頭】",
-                        "stars": [
-                                    "★１．頭に角をつけて鬼の姿になる。",
-                                    "★２．頭に髑髏をのせて変身する。",
-                                    "★３．頭に金環をはめる。",
-                                    "★４．頭にかぶったものが取れなくなる。",
-                                    "★５．頭から木が生える。",
-                                    "★６．頭から人が生まれる。",
-                                    "★７．多くの頭（顔・首）を持つ怪物。",
-                                    "★８．巨大な頭部だけの怪物。",
-                                    "★９．頭をつけかえる。",
-                                    "★１０．脳髄の半分をつけかえる。",
-                                    "★１１．頭を胴体から離して生活する。"
-                        ]
-            },
-            {
-                        "item": "【後追い心中】",
-                        "stars": [
-                                    "★１．愛する女の後を追って、男も死ぬ。",
-                                    "★２．愛する女の後を追って、二人の男が死ぬ。"
-                        ]
-            },
-            {
-                        "item": "【穴】",
-                        "stars": [
-                                    "★１．異郷へ通ずる穴。",
-                                    "★２．富士の人穴。",
-                                    "★３．蓼科（たでしな）山の人穴。",
-                                    "★４．底知れぬ穴。",
-                                    "★５．穴の中に入り、体が大きくなってしまって、外へ出られない。",
-                                    "★６．穴に入れた腕が引き抜けない。",
-                                    "★７．穴を掘ってその中へ言葉を言い入れる。",
-                                    "★８．のぞき穴。",
-                                    "★９．身体に開いた穴。",
-                                    "★１０．身体の穴がどんどん大きくなり、身体は消えて穴だけの存在になる。"
-                        ]
-            },
-            {
-                        "item": "【兄嫁】",
-                        "stars": [
-                                    "★１．兄嫁に誘惑される。",
-                                    "★２．兄嫁と一夜をともに過ごすが、何事も起こらない。",
-                                    "★３．兄嫁を恋する。",
-                                    "★４．兄嫁と結婚する。"
-                        ]
-            },
-            {
-                        "item": "【姉弟】",
-                        "stars": [
-                                    "★１．姉弟の対立と和解。",
-                                    "★２．姉が自らの青春を犠牲にしてでも、弟の夢を叶えてやろうとする。",
-                                    "★３．蛇になった姉が弟を襲う。",
-                                    "★４．羊になった弟が姉を救う。",
-                                    "★５．姉弟が山へ行き、姉だけが帰って来る。",
-                                    "★６．姉弟が森へ行き、姉だけが帰って来る。",
-                                    "★７．姉弟が継母に殺される。",
-                                    "★８．弟が子息（しそく）なら、姉は八足（はっそく）。",
-                                    "★９．姉の死。"
-                        ]
-            },
-            {
-                        "item": "【尼】",
-                        "stars": [
-                                    "★１．ヨーロッパの尼僧が、アジアやアフリカへ派遣される。",
-                                    "★２．尼僧の沐浴。",
-                                    "★３．不思議な尼。",
-                                    "★４．化尼（けに。仏菩薩が尼の姿で現れたもの）。",
-                                    "★５．尼天狗。"
-                        ]
-            },
-            {
-                        "item": "【雨音】",
-                        "stars": [
-                                    "★１．雨音を楽しむ。",
-                                    "★２．雨音で、人のいるのを察知する。",
-                                    "★３．雨音と思ったら、そうではなかった。"
-                        ]
-            },
-            {
-                        "item": "【雨乞い】",
-                        "stars": [
-                                    "★１．王、僧、呪術師などが、天や龍神に祈って雨を呼ぶ。",
-                                    "★２．女性の力で雨を呼ぶ。",
-                                    "★３．龍が体をばらばらにされる、という犠牲をはらって雨を降らせる。",
-                                    "★４．龍の作り物をばらばらに引き裂いて、雨を乞う。",
-                                    "★５．地上で水をまけば、天から雨が降る。共感呪術。",
-                                    "★６．石を持ち上げて雨を乞う。"
-                        ]
-            },
-            {
-                        "item": "【天の川】",
-                        "stars": [
-                                    "★１．天の川が出現して、男女の間を隔てる。",
-                                    "★２．冬の夜の天の河。",
-                                    "★３．母乳がほとばしって天の川になる。",
-                                    "★４．灰が天の川になる。",
-                                    "★５．天の川は、天上界に架けられた橋。",
-                                    "★６．天の川に沿って走る銀河鉄道。",
-                                    "★７．地上の人間が天の川へ招かれる。"
-                        ]
-            },
-            {
-                        "item": "【あまのじゃく】",
-                        "stars": [
-                                    "★１．あまのじゃくが鶏の鳴き真似をする。",
-                                    "★２．あめのさぐめが「鳥を射よ」と言う。",
-                                    "★３．鳥が、あまのさぐめの正体を暴く。",
-                                    "★４．あまのじゃくが、空の星を取ろうとする。",
-                                    "★５．人の言葉に、わざと逆らう性格。",
-                                    "★６．父の言葉に逆らう息子。",
-                                    "★７．「してはいけない行為だ」という、ただその理由だけで、人はその行為を犯し続けている。",
-                                    "★８．天逆毎姫（あまのさこのひめ）。"
-                        ]
-            },
-            {
-                        "item": "【雨宿り】",
-                        "stars": [
-                                    "★１．雨宿りが縁で、男女が契りをかわす。",
-                                    "★２．雨宿りをもっと大がかりにしたのが、光源氏の「須磨」「明石」の物語である。",
-                                    "★３．雨宿りの最中の、男女の情交。",
-                                    "★４．男女が雨宿りで出会うが、契りをかわすまでにはならない。",
-                                    "★５．雨宿りする男が、情交の対象になりえぬ老婆に出会う。",
-                                    "★６．雨宿りで男が出会う女は、生身の人間でなく、妖怪の類であることもある。",
-                                    "★７．風雅な雨宿り。"
-                        ]
-            },
-            {
-                        "item": "【雨】",
-                        "stars": [
-                                    "★１．不吉な雨。",
-                                    "★２．人を死にいたらせる雨。",
-                                    "★３．雨の夜の怪物。",
-                                    "★４．雨の夜に、狸が人間を妖怪と見間違う。",
-                                    "★５．雨漏り。",
-                                    "★６．雨を牢に入れる。",
-                                    "★７．雨を予知する。",
-                                    "★８．雨の日は、屋外で働く職人や商人は仕事にありつけず、賃金を得られない。"
-                        ]
-            },
-            {
-                        "item": "【蟻】",
-                        "stars": [
-                                    "★1．人間が蟻に変ずる。蟻が人間に変ずる。",
-                                    "★２．蟻の恩返し。",
-                                    "★３．蟻の教え、蟻の助け。",
-                                    "★４．勤勉な蟻。",
-                                    "★５．蟻の国。",
-                                    "★６．蟻の大群が、不特定多数の人々を襲う。",
-                                    "★７．蟻を踏みつぶさない。"
-                        ]
-            },
-            {
-                        "item": "【あり得ぬこと】",
-                        "stars": [
-                                    "★１ａ．「枯れた植物が芽吹く、根づく」という、あり得ぬことを想定し、それが実現する。",
-                                    "★１ｂ．「調理した食物が芽吹く、根づく」という、あり得ぬことを想定し、それが実現する。",
-                                    "★１ｃ．「馬に角が生え、烏の頭が白くなる」という、あり得ぬことを想定し、それが実現する。",
-                                    "★１ｄ．「人の死体が川をさかのぼる」という、あり得ぬことを想定し、それが実現する。",
-                                    "★２．あり得ぬはず、と安心していたことが意想外の形で現実化する。",
-                                    "★３．あり得ぬことを妄想し、幻視する。",
-                                    "★４．身体が二つなければあり得ないこと。",
-                                    "★５．あり得ぬもの。",
-                                    "★６．あり得ぬ不幸。"
-                        ]
-            },
-            {
-                        "item": "【アリバイ】",
-                        "stars": [
-                                    "★１ａ．空間の操作。犯行時刻に、犯人が現場から遠く離れた場所にいるように見せかけて、にせのアリバイを作る。",
-                                    "★１ｂ．時間の操作。実際に犯行が行なわれた時刻の数分～数十分後に、見せかけの犯行時刻を設定して、犯人がにせのアリバイを作る。",
-                                    "★１ｃ．犯罪者のアリバイを作ってやる商売。",
-                                    "★２．真のアリバイを証明しようとする。",
-                                    "★３．無実の人のアリバイを、嘘を言って否定する。",
-                                    "★４．ある事件のアリバイを証明すると、別の事件の犯人であることがバレてしまう。",
-                                    "★５．目撃者の愚かな錯覚から、犯人の意図せぬアリバイが成立してしまう。",
-                                    "★６．警察の捜査圏から、空間的にも時間的にも外へ出てしまう。"
-                        ]
-            },
-            {
-                        "item": "【泡】",
-                        "stars": [
-                                    "★１．泡から女神が生まれる。",
-                                    "★２．泡から子供が生まれる。",
-                                    "★３ａ．神龍が口から泡を吐く。",
-                                    "★３ｂ．神がかりした女の口から泡が出る。",
-                                    "★４ａ．泡から陸地ができる。",
-                                    "★４ｂ．泡から島ができる。",
-                                    "★５．死んで泡になる。",
-                                    "★６．泡の生滅と人の生死。",
-                                    "★７．泡がきっかけで、殺人が露見する。",
-                                    "★８．泡の数と人間の数。"
-                        ]
-            },
-            {
-                        "item": "【合わせ鏡】",
-                        "stars": [
-                                    "★１．二つの鏡で合わせ鏡をする。",
-                                    "★２．十の鏡で合わせ鏡をする。",
-                                    "★３．球状の鏡の中に入って、自分の姿を映し見る。",
-                                    "★４．合わせ鏡をすると、鏡の奥から悪魔が現れる。"
-                        ]
-            },
-            {
-                        "item": "【暗号】",
-                        "stars": [
-                                    "★１ａ．古代の戦争に用いられた暗号。",
-                                    "★１ｂ．太平洋戦争開戦時の暗号。",
-                                    "★２．数字による暗号。",
-                                    "★３．点字を利用した暗号。",
-                                    "★４．「ｅ」の字が多用されることを手がかりに、暗号を解読する。",
-                                    "★５．暗号解読器。",
-                                    "★６．暗号による日記。"
-                        ]
-            },
-            {
-                        "item": "【暗殺】",
-                        "stars": [
-                                    "★１．王や大臣などの暗殺。",
-                                    "★２ａ．刃物をふるったり鉄槌を投げたりして暗殺を試みるが、失敗する。",
-                                    "★２ｂ．銃撃して暗殺しようとするが、その瞬間相手が動いたので失敗する。",
-                                    "★３．暗殺の未遂。",
-                                    "★４．暗殺者を赦す。",
-                                    "★５．暗殺を恐れる人。",
-                                    "★６．暗殺を事故死として取り扱う。"
-                        ]
-            },
-            {
-                        "item": "【安楽死】",
-                        "stars": [
-                                    "★１．自殺をはかった人を安楽死させる。",
-                                    "★２．不治の病気の人を安楽死させる。",
-                                    "★３．安楽死専門の医者。",
-                                    "★４．安楽死を願って失敗する。",
-                                    "★５．安楽死施設。"
-                        ]
-            },
-            {
-                        "item": "【言い間違い】",
-                        "stars": [
-                                    "★１．あわてたため、馴染みのない言葉のため、などの理由で言い間違いをする。",
-                                    "★２．二人が互いに相手の言葉に連られて、言い間違いをする。",
-                                    "★３．言い間違いが、隠れた願望をあらわす。",
-                                    "★４．願望ではなく、言葉や概念の近接性によって、言い間違いが起こる。",
-                                    "★５．俳優の言い間違いから、戯曲の題名が決まる。",
-                                    "★６．雨が降ってきた時の、言い間違いの物語。",
-                                    "★７．言い間違いを聞いた人が、さらに言い間違える物語。"
-                        ]
-            },
-            {
-                        "item": "【息】",
-                        "stars": [
-                                    "★１．熱い息と冷たい息。",
-                                    "★２．臭い息と香ばしい息。",
-                                    "★３．不浄の息で、経典をけがしてはいけない。",
-                                    "★４．長い時間、息をとめることができる。",
-                                    "★５．自分で息をとめて死ぬ。",
-                                    "★６．息を失った男。",
-                                    "★７．臨終時の最後の息とともに、魂が吐き出される。",
-                                    "★８．「雨女」が、人の寝息に乗じて体内に入り込む。",
-                                    "★９．「山地乳（やまちち）」が、人の寝息を吸い取る。",
-                                    "★１０．キョンシーは、人の呼気を感知する。",
-                                    "★１１．亀の呼吸。"
-                        ]
-            },
-            {
-                        "item": "【息が生命を与える】",
-                        "stars": [
-                                    "★１．神が人間に息（生命）を与える。",
-                                    "★２．息を吐きかけて、死者を蘇生させる。",
-                                    "★３．息を吐きかけて、分身を作る。",
-                                    "★４．神が息を吐いて、神の子を生む。"
-                        ]
-            },
-            {
-                        "item": "【息が生命を奪う】",
-                        "stars": [
-                                    "★１．息を吐きかけて生命を奪う。",
-                                    "★２．息を吐きかけて盲目にする。"
-                        ]
-            },
-            {
-                        "item": "【生き肝】",
-                        "stars": [
-                                    "★１．生き肝（あるいは心臓）は、さまざまな病気に著効のある薬である。",
-                                    "★２．猿の生き肝（あるいは心臓）。",
-                                    "★３．猿の化身が「心を与えてもよい」と言う。",
-                                    "★４．雷公の生き肝。",
-                                    "★５．生き肝でなく、胎児そのものを必要とするばあいもある。"
-                        ]
-            },
-            {
-                        "item": "【異郷訪問】",
-                        "stars": [
-                                    "★１．海の彼方もしくは海底。",
-                                    "★２．山中。川の上流を尋ねて到る。",
-                                    "★３．地底。",
-                                    "★４．天上。",
-                                    "★５ａ．夢の中の異郷訪問。",
-                                    "★５ｂ．夢の中で、他人が異郷へ旅するありさまを見る。",
-                                    "★６．少年少女の異郷訪問。",
-                                    "★７．近代小説の中の異郷訪問。",
-                                    "★８．異郷の女と、家で待つ妻。",
-                                    "★９．いつもとは違う道から町へ入ったために、異郷をかいま見る。"
-                        ]
-            },
-            {
-                        "item": "【異郷再訪】",
-                        "stars": [
-                                    "★１．異郷を再度訪れようとしても道がわからず、二度と行くことができない。",
-                                    "★２．一般に、異郷は一度だけ訪れるものであるが、異郷を三度訪れる物語もある。"
-                        ]
-            },
-            {
-                        "item": "【異郷の時間】",
-                        "stars": [
-                                    "★１．山奥・仙界などの異郷で短期間を過ごしてから帰ると、現世では、異郷での十倍・百倍あるいはそれ以上の年月が経過していた。",
-                                    "★２．逆に、異郷で長い時間を過ごしたと思っても、現世ではわずかな時間しかたっていなかったというばあいもある。",
-                                    "★３．星界の時間経過と地上の時間経過の違い。",
-                                    "★４．他化自在天の一日一夜は、人間界の千六百年。",
-                                    "★５．不死の神々の住む異郷では、人間世界とは時間のあり方が異なる。"
-                        ]
-            },
-            {
-                        "item": "【異郷の食物】",
-                        "stars": [
-                                    "★１．異郷へ行っても、食物を食べなかったおかげで、故国・故郷へ帰って来ることができた。",
-                                    "★２．神の国へ行ったが、食事をしなかったため、神になれなかった。",
-                                    "★３．不死の神饌を飲んで、神の仲間になった。"
-                        ]
-            },
-            {
-                        "item": "【生霊】",
-                        "stars": [
-                                    "★１ａ．憎しみの念が生霊となる。",
-                                    "★１ｂ．恋情や嫉妬の念が生霊となる。",
-                                    "★２．生霊が人間に手助けを請う。",
-                                    "★３．生霊を落とすことはきわめて難しい。それに比べれば、死霊を鎮める方が幾分か容易である。",
-                                    "★４．にせの生霊。"
-                        ]
-            },
-            {
-                        "item": "【生贄】",
-                        "stars": [
-                                    "★１．神や怪物に人間を捧げるならわしがあったが、英雄がこのならわしをやめさせる。"
-                        ]
-            },
-            {
-                        "item": "【遺産】",
-                        "stars": [
-                                    "★１．莫大な遺産を相続する男。",
-                                    "★２．遺産を分配する。",
-                                    "★３．遺産分配の争い。",
-                                    "★４．亡兄や亡父の遺産をねらう男。",
-                                    "★５．余命いくばくもない人の遺産をねらう女。",
-                                    "★６．死亡保険金を、家族への遺産とする。"
-                        ]
-            },
-            {
-                        "item": "【石】",
-                        "stars": [
-                                    "★１．動かそうとしても動かぬ石。",
-                                    "★２．自ら動く石。",
-                                    "★３．物言う岩。",
-                                    "★４．成長する石。",
-                                    "★５．英雄に触れたため、不思議な力を持つようになった石。",
-                                    "★６．人に害をなす石。",
-                                    "★７．石が人間に変わる、石から妖怪が出現する。",
-                                    "★８．岩が玉と化して、人間世界を経験する。",
-                                    "★９ａ．堅い石を、刀で切る。",
-                                    "★９ｂ．人間だと思って刀で真っ二つに切ったら、それは石だった。",
-                                    "★９ｃ．虎だと思って矢を射込んだら、それは石だった。",
-                                    "★１０．岩の絵から出て来る馬を、岩に戻す。",
-                                    "★１１．石を食べる。",
-                                    "★１２．石を用いて子供が生まれるのを遅らせる。",
-                                    "★１３．石の上の「私」。"
-                        ]
-            },
-            {
-                        "item": "【石に化す】",
-                        "stars": [
-                                    "★１．女が石に化す。",
-                                    "★２．男が石に化す。",
-                                    "★３．動物が石に化す。",
-                                    "★４．妖怪や魔物が人間を石にする。"
-                        ]
-            },
-            {
-                        "item": "【石の誓約（うけひ）】",
-                        "stars": [
-                                    "★１．石を切れるかどうか。",
-                                    "★２．石を蹴り上げることができるかどうか。",
-                                    "★３．石が水を切って飛ぶかどうか。",
-                                    "★４．石が河に落ちるかどうか。"
-                        ]
-            },
-            {
-                        "item": "【石の売買】",
-                        "stars": [
-                                    "★１．高く売れる石。",
-                                    "★２．売れなかった石。",
-                                    "★３．石が高く売買される場合があることにつけこんで、金（かね）や石を騙（だま）し取る。"
-                        ]
-            },
-            {
-                        "item": "【石つぶて】",
-                        "stars": [
-                                    "★１．ねらい通り当る石つぶて。",
-                                    "★２．銭形平次の「投げ銭」は、没羽箭張清の石つぶてにヒントを得たものである。",
-                                    "★３．八町以内なら、百発百中の石つぶて。",
-                                    "★４．当てるつもりがないのに、偶然当る石つぶて。",
-                                    "★５．婚礼の夜、その家に近隣の人が石つぶてを打ちつける風習。",
-                                    "★６．石を投げつけて人を殺す。"
-                        ]
-            },
-            {
-                        "item": "【椅子】",
-                        "stars": [
-                                    "★１．すわると身体にくっついてしまう椅子。",
-                                    "★２．一度すわると、立ち上がる気がなくなる椅子。",
-                                    "★３．いつもすわる決まった椅子。",
-                                    "★４．椅子にすわって物を隠す。",
-                                    "★５．神さまの椅子。",
-                                    "★６．死刑執行に用いられる電気椅子。",
-                                    "★７．安楽自殺用の長椅子。",
-                                    "★８．人間が椅子になる。"
-                        ]
-            },
-            {
-                        "item": "【泉】",
-                        "stars": [
-                                    "★１．神に祈ったり、岩に穴をあけたりして、泉を湧き出させる。",
-                                    "★２．剣を用いて、泉を湧き出させる。",
-                                    "★３．女の身体のあった場所から泉が湧き出る。",
-                                    "★４．泉に落ちる。",
-                                    "★５．泉の名を嫌う。",
-                                    "★６．病気を治す泉。"
-                        ]
-            },
-            {
-                        "item": "【板】",
-                        "stars": [
-                                    "★１．神の言葉を記した石の板。",
-                                    "★２．人類の前に繰り返し現れる謎の黒石板。",
-                                    "★３．板鬼が侍を、板状におしつぶす。",
-                                    "★４．月が「自分」を押し倒して、板にする。",
-                                    "★５．板が伸びる。",
-                                    "★６．板に赤ん坊を乗せて川へ流す。",
-                                    "★７．戸板に死骸を打ちつけて川へ流す。"
-                        ]
-            },
-            {
-                        "item": "【一妻多夫】",
-                        "stars": [
-                                    "★１．一人の女が、四人の夫を持つ。",
-                                    "★２．一人の女が、五人の夫を持つ。",
-                                    "★３．前世の五人の夫が、現世では五人の子供に生まれ変わる。",
-                                    "★４．一人の女が何度も結婚し、そのたびに夫に死別する。",
-                                    "★５．幽霊の一妻多夫。",
-                                    "★６．何人もの男と関係を持ったので、生まれた子供の父親がわからない。",
-                                    "★７ａ．父親が誰なのか、つきとめようとする。",
-                                    "★７ｂ．『氏子中』の変型が『町内の若い衆』。"
-                        ]
-            },
-            {
-                        "item": "【一夫多妻】",
-                        "stars": [
-                                    "★１．一人の男が大勢の女を妻として、自分の邸内に住まわせる。",
-                                    "★２．王や皇帝は、数十人あるいは百人以上の妻を持つ。",
-                                    "★３．天竺の国王は、千人以上の妻を持つことがある。",
-                                    "★４．明治大正時代の華族の男も、多くの妻妾を持つことがあった。",
-                                    "★５．妻一人と愛人九人。",
-                                    "★６．モルモン教は一夫多妻制だった。"
-                        ]
-            },
-            {
-                        "item": "【糸】",
-                        "stars": [
-                                    "★１．糸をたどって、神の居所をつきとめる。",
-                                    "★２．迷路のごとき穴に糸を通せという難題。",
-                                    "★３．身体から糸が出る。",
-                                    "★４．糸だと思ったら視神経。",
-                                    "★５．死に臨んだ人と、仏を結ぶ糸。",
-                                    "★６．多量の糸を繰り出して、相手を縛る。",
-                                    "★７．糸くり（糸つむぎ）の労苦。"
-                        ]
-            },
-            {
-                        "item": "【糸と生死】",
-                        "stars": [
-                                    "★１．瀕死の肉体と、魂（あるいは幽体）をつなぐ糸。",
-                                    "★２．肉体と、幽体・複体をつなぐ二本の太い紐。",
-                                    "★３．命（魂）を肉体につなぐ紐を、捜し求める。"
-                        ]
-            },
-            {
-                        "item": "【糸と男女】",
-                        "stars": [
-                                    "★１．糸は、男女を結びつける働きをする。",
-                                    "★２．女の足指に結びつけた長い細紐を、男が引く。",
-                                    "★３．謎の夫の着物に長い糸をつけ、それをたどって正体を知る。",
-                                    "★４．無関係な像に糸を結びつけ、「像に犯された」といつわる。",
-                                    "★５．夫が糸をたどって、妻と再会する。",
-                                    "★６．女の袖に赤糸をつけて、男が追う。その男の袖に白糸をつけて、もう一人の女が追う。"
-                        ]
-            },
-            {
-                        "item": "【井戸】",
-                        "stars": [
-                                    "★１．井戸に毒龍が棲む。",
-                                    "★２ａ．井戸から亡霊が出る。",
-                                    "★２ｂ．テレビに映る井戸から亡霊が現われ、テレビの外へ出て来る。",
-                                    "★３ａ．井戸の中の呪宝。",
-                                    "★３ｂ．井戸の中の大金。",
-                                    "★４．井戸に死体を隠す。",
-                                    "★５．井戸の底が異郷に通ずる。",
-                                    "★６．火を吐く井戸。",
-                                    "★７．湯がわく井戸。",
-                                    "★８．井戸の水が、上まで上がって来る。"
-                        ]
-            },
-            {
-                        "item": "【井戸と男女】",
-                        "stars": [
-                                    "★１ａ．井戸のほとりで男女が巡り会う。",
-                                    "★１ｂ．井戸のほとりで侍女あるいは老僕が介在して、男女が縁を結ぶ。",
-                                    "★２．井戸のもとで遊んでいた子供たちが、成長後、夫婦になる。",
-                                    "★３．『伊勢物語』第２３段、『井筒』（能）の明治時代版。井戸端に落とした財布がきっかけで、男女が深い関係になる。"
-                        ]
-            },
-            {
-                        "item": "【井戸に落ちる】",
-                        "stars": [
-                                    "★１．井戸に子供が落ちて死ぬ。",
-                                    "★２．井戸に落ちて現世では死ぬが、死後の世界では幸せになれる。",
-                                    "★３．井戸に落ちる子供を救う。",
-                                    "★４．「井戸に貴重品を落とした」と、子供が嘘を言う。",
-                                    "★５．蠍（さそり）が井戸に落ちて溺れ死ぬ。",
-                                    "★６．井戸に身投げする。"
-                        ]
-            },
-            {
-                        "item": "【従兄弟・従姉妹】",
-                        "stars": [
-                                    "★１．従兄弟・従姉妹の結婚。",
-                                    "★２．従兄弟・従姉妹の恋。",
-                                    "★３．二人の従姉妹。",
-                                    "★４．従兄妹間の結婚の結果、子供にその影響が出ることがある。",
-                                    "★５．従姉の娘との結婚。",
-                                    "★６．敵対する従父（いとこ）。"
-                        ]
-            },
-            {
-                        "item": "【犬】",
-                        "stars": [
-                                    "★１．犬は人間の忠実な家来である。",
-                                    "★２．飼い主とともに死んでいく犬。",
-                                    "★３．飼い主である老人の自殺を思いとどまらせる犬。",
-                                    "★４．飼い主の死後も、その帰りを待つ犬。",
-                                    "★５．人間の言いつけに忠実な余り、死んでしまう犬。",
-                                    "★６．犬に道を譲る。",
-                                    "★７．人間の魂が犬に乗り移る。",
-                                    "★８．犬が人間に変身する。",
-                                    "★９．人間を襲う犬。",
-                                    "★１０．人間の後をつける犬。",
-                                    "★１１．犬が狼に化す。",
-                                    "★１２．「犬」の文字。",
-                                    "★１３．犬の口に手を入れる。"
-                        ]
-            },
-            {
-                        "item": "【犬に転生】",
-                        "stars": [
-                                    "★１．人間が犬に転生する。",
-                                    "★２．仔犬を見て、友人の転生した姿であることを知る。",
-                                    "★３．仔犬を見て、自分の父母の転生した姿かもしれぬ、と思う。",
-                                    "★４．犬を見ても、恋人の転生した姿であることを知らない。",
-                                    "★５．何度も何度も犬に生まれ変わる。",
-                                    "★６．人間が犬に転生し、その犬が再び人間に転生したのが、現在の自分かもしれぬ、という空想。"
-                        ]
-            },
-            {
-                        "item": "【犬の教え】",
-                        "stars": [
-                                    "★１．犬が人間に危険を知らせる、宝のありかを知らせるなど、貴重な情報をもたらす。",
-                                    "★２．犬の教えを無視して出かけ、暗殺される。",
-                                    "★３．犬の教えを悟らず、その犬を殺してしまう。"
-                        ]
-            },
-            {
-                        "item": "【犬婿】",
-                        "stars": [
-                                    "★１．犬婿と人間の娘。",
-                                    "★２．犬が、人間の娘二人と交わる。",
-                                    "★３．犬が、人間の女大勢と交わる。",
-                                    "★４ａ．犬婿と人間の娘の間に生まれた子供たち。",
-                                    "★４ｂ．犬婿と人間の女の間に生まれた犬頭人身の子供たち。",
-                                    "★５．直接交わることなく、犬の気を受けて娘が懐妊する。",
-                                    "★６ａ．人間の男が、犬婿を殺す。",
-                                    "★６ｂ．犬婿が、人間の男を殺す。",
-                                    "★７．犬が人間に化けて女と交わる。",
-                                    "★８．狗国。"
-                        ]
-            },
-            {
-                        "item": "【猪】",
-                        "stars": [
-                                    "★１ａ．伊吹山の神の化身である猪。",
-                                    "★１ｂ．ヴィシュヌ神の化身である猪。",
-                                    "★２．猪狩り。",
-                                    "★３．猪の牙で殺される。",
-                                    "★４．死者たちが猪の肉を食べる。",
-                                    "★５．猪に似せた石。",
-                                    "★６．猪頭人身。"
-                        ]
-            },
-            {
-                        "item": "【命乞い】",
-                        "stars": [
-                                    "★１ａ．鰻が人間の姿をとって訪れ、命乞いをする。",
-                                    "★１ｂ．魚が人間の夢に現れて命乞いをする。",
-                                    "★２．蟹が人間の夢に現れて命乞いをする。",
-                                    "★３．亀が人間の夢に現れて命乞いをする。",
-                                    "★４．猿神が、人間の神主の口を借りて命乞いをする。"
-                        ]
-            },
-            {
-                        "item": "【衣服】",
-                        "stars": [
-                                    "★１．衣服・衣装の力。",
-                                    "★２．人を焼き殺す衣服。",
-                                    "★３ａ．白い衣服が死を招き寄せる。",
-                                    "★３ｂ．貴族の装束のおかげで、死を免れた。",
-                                    "★４．衣服を腐らせる。",
-                                    "★５．衣服を取り替えて着る。",
-                                    "★６．衣服に触れるだけで病気が治る。",
-                                    "★７．女の移り香がしみついた薄衣。",
-                                    "★８．衣服と文化。",
-                                    "★９ａ．衣服の片袖。",
-                                    "★９ｂ．死者と会った証拠の片袖。",
-                                    "★１０．狂犬に咬（か）まれた衣服。",
-                                    "★１１．幽霊が衣服を身につけている理由。",
-                                    "★１２．もぬけのからの衣。",
-                                    "★１３．夫婦の間に、衣が一枚しかない。"
-                        ]
-            },
-            {
-                        "item": "【入れ替わり】",
-                        "stars": [
-                                    "★１．瓜二つの兄弟姉妹が相談して、互いに入れ替わる。",
-                                    "★２ａ．王子と乞食が衣服を交換したために、入れ替わってしまう。",
-                                    "★２ｂ．殿様と百姓が衣服を交換したために、入れ替わってしまう。",
-                                    "★３ａ．少年少女の身体と心が入れ替わる。",
-                                    "★３ｂ．少年少女の行動が入れ替わる。",
-                                    "★４ａ．二人の男の心が入れ替わる。",
-                                    "★４ｂ．熟睡する二人の男の魂が入れ替わる。",
-                                    "★４ｃ．同時に死んだ二人の男の魂が入れ替わる。",
-                                    "★５．二軒の家の住人が入れ替わる。",
-                                    "★６．四肢や内臓を取り替える。"
-                        ]
-            },
-            {
-                        "item": "【入れ子構造】",
-                        "stars": [
-                                    "★１ａ．入れ子構造の人間たち。",
-                                    "★１ｂ．入れ子構造の人間たちの正体。",
-                                    "★２．入れ子の鍋。",
-                                    "★３．入れ子構造の動物。",
-                                    "★４．入れ子構造の女性器。",
-                                    "★５．入れ子構造の戯曲。",
-                                    "★６．夢の中の夢の中の夢。入れ子構造の夢。"
-                        ]
-            },
-            {
-                        "item": "【いれずみ】",
-                        "stars": [
-                                    "★１．入れ墨の習俗。",
-                                    "★２．罪人に入れ墨をほどこす。",
-                                    "★３．入れ墨・刺青を隠す。",
-                                    "★４．刺青の絵が動き、物語になる。",
-                                    "★５．美女の背中一面に彫られた刺青。"
-                        ]
-            },
-            {
-                        "item": "【入れ目】",
-                        "stars": [
-                                    "★１．義眼の中に紙片を隠す。",
-                                    "★２．他人の義眼を飲み込んでしまう。",
-                                    "★３．義眼に針を刺して、人を驚かす。",
-                                    "★４．景清の目を入れてもらう。",
-                                    "★５．ガラスの偽眼（いれめ）を死体にはめる。",
-                                    "★６．失った人間の目の代わりに、動物の目を入れる。",
-                                    "★７．動物の目では役に立たないので、人間の目を取り返す。",
-                                    "★８．着脱自在の目。"
-                        ]
-            },
-            {
-                        "item": "【因果応報】",
-                        "stars": [
-                                    "★１．他に対して行なった善行・悪行が、後に同じような形で自分の身にふりかかる。",
-                                    "★２．前世で他に対して行なった善行・悪行が、現世で同じような形で自分の身にふりかかる。",
-                                    "★３．前世からの因果が現世で果たせなければ、来世へ持ち越される。",
-                                    "★４．現世で行なった善行・悪行に対して、その十倍の報いを冥界で受ける。",
-                                    "★５．偶発的な事故のばあいにも、因果応報の理がはたらく。",
-                                    "★６．親の因果が子に報う。"
-                        ]
-            },
-            {
-                        "item": "【隕石】",
-                        "stars": [
-                                    "★１．隕石が地上へ落ちる。"
-                        ]
-            },
-            {
-                        "item": "【隠蔽】",
-                        "stars": [
-                                    "★１．悪事を、より大きな悪事によって隠蔽する。",
-                                    "★２．音・声を、より大きな音・声によって隠蔽する。",
-                                    "★３．強い金色光が、金の簪（かんざし）を隠蔽する。",
-                                    "★４．死に関わる臭気を、より強い臭気で隠蔽する。",
-                                    "★５ａ．一つの殺人死体のまわりに大勢の戦死者を配置して、殺人行為を隠蔽する。",
-                                    "★５ｂ．言いにくい報告事項の前後に別のことがらを述べて、目立たなくする。",
-                                    "★６．殺人を駆け落ちに見せかける。",
-                                    "★７．女性スパイの存在を隠蔽するため、架空の男性スパイをでっち上げる。"
-                        ]
-            },
-            {
-                        "item": "【飢え】",
-                        "stars": [
-                                    "★１．飢えた人と出会う。",
-                                    "★２ａ．飢えのために、食物ではないものを食べる。",
-                                    "★２ｂ．食物ではないもののように見せかけて、こっそり食物を食べる。",
-                                    "★３ａ．船上で食が尽き、人間の肉を食べる。",
-                                    "★３ｂ．戦場で食が尽き、人間の肉を食べる。",
-                                    "★４．人間の肉を食べた者は、身体のまわりが光る。",
-                                    "★５．飢え死に。",
-                                    "★６．食物が見えていても食べられず、死んでしまう。",
-                                    "★７．飢えた人が、高額の食事代金を支払う。"
-                        ]
-            },
-            {
-                        "item": "【魚】",
-                        "stars": [
-                                    "★１．人間が魚に化す。",
-                                    "★２．人間の魂が魚の中に入る。",
-                                    "★３．魚が人間に生まれ変わる。",
-                                    "★４．物言う魚。",
-                                    "★５．笑う魚。",
-                                    "★６．魚が船に飛び入る。"
-                        ]
-            },
-            {
-                        "item": "【魚女房】",
-                        "stars": [
-                                    "★１．魚女房が正体を知られたので、男のもとを去る。",
-                                    "★２．魚女房が男と別れた後も、時々逢いに来る。",
-                                    "★３．魚女房が男と一生添い遂げる。",
-                                    "★４．男が飼っていた魚が、「男の子を身ごもった」と言う。",
-                                    "★５．金魚女房。"
-                        ]
-            },
-            {
-                        "item": "【魚の腹】",
-                        "stars": [
-                                    "★１．失った物が魚の腹から見つかる。",
-                                    "★２．魚の腹から珠が出る。",
-                                    "★３．魚の腹に物を隠す。",
-                                    "★４．大魚の腹の中の人。",
-                                    "★５．大魚の腹の中の像・人形。"
-                        ]
-            },
-            {
-                        "item": "【誓約（うけひ）】",
-                        "stars": [
-                                    "★１．ある条件を設定し、その成否によって、願いが叶うかどうか、吉か凶か、運命を占う。",
-                                    "★２．自分がどのような行動をするかを決める。",
-                                    "★３．自分の将来を占うが、曖昧な結果に終わる。"
-                        ]
-            },
-            {
-                        "item": "【動かぬ死体】",
-                        "stars": [
-                                    "★１．死体が一箇所にとどまって動かないので、そこに葬る。",
-                                    "★２．聖者の遺骨・遺物が一箇所にとどまって動かないので、そこに安置する。",
-                                    "★３．親友が駆けつけるまで、埋葬されることを拒否して動かない死体。"
-                        ]
-            },
-            {
-                        "item": "【動く首】",
-                        "stars": [
-                                    "★１．胴体から離れても、動き、飛び、噛みつく首。",
-                                    "★２．胴体から離れても、ものを言う首。"
-                        ]
-            },
-            {
-                        "item": "【動く死体】",
-                        "stars": [
-                                    "★１．通夜に死体が動き出す。",
-                                    "★２．屍体翻弄。",
-                                    "★３．死体が動いて人を襲う。"
-                        ]
-            },
-            {
-                        "item": "【兎】",
-                        "stars": [
-                                    "★１ａ．兎と亀の駆けくらべ。",
-                                    "★１ｂ．兎とはりねずみの駆けくらべ。",
-                                    "★２．自分の身を犠牲にする兎。",
-                                    "★３．傷ついたものをさらに傷つける兎と、傷を負った上にさらに傷つけられる兎。",
-                                    "★４．走る兎。",
-                                    "★５．予備の四本足を持つ兎。",
-                                    "★６．黒い兎。",
-                                    "★７．兎の起源。"
-                        ]
-            },
-            {
-                        "item": "【牛】",
-                        "stars": [
-                                    "★１．人間が、死んでから牛に生まれ変わる。",
-                                    "★２．仏が牛に化身する。",
-                                    "★３．牛が涎（よだれ）で歌を書く。",
-                                    "★４．牛の導き。牛の教え。",
-                                    "★５ａ．神が牛に変身して乙女をあざむく。",
-                                    "★５ｂ．神が乙女を牛に変身させる。",
-                                    "★６．人間が牛になる、との迷信。",
-                                    "★７ａ．カウボーイたちが、牛を遠方へ運ぶ。",
-                                    "★７ｂ．牛飼いが牛を追う。",
-                                    "★８ａ．闘牛。天竺や日本の闘牛は、牛と牛が闘う。",
-                                    "★８ｂ．スペインの闘牛は、牛と人間が闘う。"
-                        ]
-            },
-            {
-                        "item": "【後ろ】",
-                        "stars": [
-                                    "★１．後ろ手。一般に、相手に背を向けて何事かをするのは呪いのしぐさである。",
-                                    "★２．神と対面するのは畏れ多いので、後ろ手で行なうという場合もある。",
-                                    "★３．後ろへ投げる。",
-                                    "★４．自分自身の後ろ姿を見て死ぬ人と、生き返った人。",
-                                    "★５．本を読む自分自身の後ろ姿。"
-                        ]
-            },
-            {
-                        "item": "【嘘】",
-                        "stars": [
-                                    "★１．巧みな嘘のために、自分の目も信じられなくなる。",
-                                    "★２．いつも嘘をついているので、本当のことを言っても信用されない。",
-                                    "★３．いつも演技をしているので、本心を吐露しても信用されない。",
-                                    "★４．嘘つき男に証拠を求める。",
-                                    "★５．嘘つき男・嘘つき女の最後の嘘。",
-                                    "★６．嘘ばかり言う動物。",
-                                    "★７．嘘の嫌いな子。",
-                                    "★８ａ．嘘のつもりで言ったことが、偶然、現実と一致した。",
-                                    "★８ｂ．嘘を言ったら、それが実現した。",
-                                    "★９．冗談で言った小さな嘘が、大事件に発展する。",
-                                    "★１０．嘘発見器。"
-                        ]
-            },
-            {
-                        "item": "【嘘対嘘】",
-                        "stars": [
-                                    "★１．嘘に対して嘘で対抗する。",
-                                    "★２．嘘のつきくらべ。"
-                        ]
-            },
-            {
-                        "item": "【嘘対演技】",
-                        "stars": [
-                                    "★１．嘘と知りつつだまされたふりをする。",
-                                    "★２．だまされたふりをして人をだます。"
-                        ]
-            },
-            {
-                        "item": "【嘘も方便】",
-                        "stars": [
-                                    "★１．苦しい旅を続けさせるための方便としての嘘。",
-                                    "★２．畑（畠）を掘らせるための方便としての嘘。"
-                        ]
-            },
-            {
-                        "item": "【歌】",
-                        "stars": [
-                                    "★１．命と引き換えに、名歌を詠む。",
-                                    "★２．歌をうたったために、神のもとへ召される。",
-                                    "★３．歌を作ったために、上司から叱責される。",
-                                    "★４．入水する時に歌を詠んで身を沈める。",
-                                    "★５．覚悟の入水でなく、思いがけず水に落ちた時も、歌をうたう。",
-                                    "★６．神の歌。託宣歌。",
-                                    "★７ａ．虚構の歌。名所の歌を、現地へ行かずに作る。",
-                                    "★７ｂ．虚構の新体詩。友人の体験を聞いて、現地へ行かずに詩を作る。",
-                                    "★８．歌詞のとおりに殺人事件が起こる。"
-                        ]
-            },
-            {
-                        "item": "【歌の力】",
-                        "stars": [
-                                    "★１．歌を詠んで、日照りに雨を降らせる。",
-                                    "★２．逆に、歌を詠んで雨を止める。",
-                                    "★３．歌の力で夫の愛を得る。",
-                                    "★４．歌をうたって、愛する人をさがす。",
-                                    "★５．歌を詠んで、罪を許される。",
-                                    "★６．女が歌を詠んで、貴人の怒りを鎮める。",
-                                    "★７．歌を詠んで、仲間を処刑から救う。",
-                                    "★８．歌を歌って、戦闘を回避する。",
-                                    "★９．歌を詠んで、帰郷の願いが叶う。",
-                                    "★１０．歌を詠んだ功徳で、病気が治る。"
-                        ]
-            },
-            {
-                        "item": "【歌合戦】",
-                        "stars": [
-                                    "★１．歌の名手が、歌詞と歌唱力を競う。",
-                                    "★２．日本の平安時代の歌合。"
-                        ]
-            },
-            {
-                        "item": "【歌問答】",
-                        "stars": [
-                                    "★１．Ａが歌の上の句または下の句を提示し、Ｂがそれに合う句をつける。",
-                                    "★２．死者と生者の歌問答。"
-                        ]
-            },
-            {
-                        "item": "【うちまき】",
-                        "stars": [
-                                    "★１ａ．米をまいて、魔物を追い払う。",
-                                    "★１ｂ．米をまいて、魂を身体にとどめる。",
-                                    "★２．小さな魔物に米粒をまくのに対し、大きな鬼に豆をまいて追い払う。",
-                                    "★３．豆の代わりに金銀をまく。",
-                                    "★４．小判をまく。",
-                                    "★５．神など尊いものを拝む時にも、うちまきをする。",
-                                    "★６ａ．魔性のものが、うちまきのごとく多くの石つぶてを投げつける。",
-                                    "★６ｂ．豆を投げつける。",
-                                    "★６ｃ．砂をまく。"
-                        ]
-            },
-            {
-                        "item": "【宇宙】",
-                        "stars": [
-                                    "★１．人工的に宇宙を創造する。",
-                                    "★２．宇宙の進化。",
-                                    "★３．膨張する宇宙が収縮に転じ、一点に集まる。",
-                                    "★４．宇宙は有限か無限か。",
-                                    "★５．無意識の奥底の宇宙空間。",
-                                    "★６．宇宙の形状。",
-                                    "★７．宇宙の外へ出る。",
-                                    "★８．宇宙を決定づける基本定数。",
-                                    "★９ａ．宇宙の起源。",
-                                    "★９ｂ．『旧約聖書』の記事をもとに計算すると、宇宙の始まりは六千年前。"
-                        ]
-            },
-            {
-                        "item": "【宇宙人】",
-                        "stars": [
-                                    "★１．宇宙人が地球を攻撃する。",
-                                    "★２ａ．地球に来襲した火星人の、意外な弱点。",
-                                    "★２ｂ．地球に来襲したＸ星人の、意外な弱点。",
-                                    "★３．宇宙人と地球人との、友好的な出会い。",
-                                    "★４．宇宙人が、高度な文明を持つ自分たちの星へ、地球人何人かを招く。",
-                                    "★５．地球人が「自分は宇宙人だ」との自覚を得る。あるいは、宇宙人が「自分は地球人だ」との自覚を得る。",
-                                    "★６．宇宙人と地球人の結婚。",
-                                    "★７．ＳＦ作家の想像の産物である火星人。"
-                        ]
-            },
-            {
-                        "item": "【宇宙生物】",
-                        "stars": [
-                                    "★１．恐ろしい宇宙生物。",
-                                    "★２．宇宙怪獣。",
-                                    "★３．相手に合わせて姿を変える、宇宙の知的生命体。",
-                                    "★４．肉体から解放され、青い火の玉になった火星の生命体。"
-                        ]
-            },
-            {
-                        "item": "【うつほ舟】",
-                        "stars": [
-                                    "★１．女がうつほ舟に入れられ、海に流される。",
-                                    "★２ａ．母親が、産んだばかりの嬰児とともに、うつほ舟に入れられて海へ流される。",
-                                    "★２ｂ．神功皇后が御子とともに船に乗る物語も、「うつほ舟の母子」と見ることができる。",
-                                    "★３．男または怪物が、船で流されることもある。",
-                                    "★４．化人（けにん）が、うつほ舟に乗って去る。"
-                        ]
-            },
-            {
-                        "item": "【馬】",
-                        "stars": [
-                                    "★１ａ．馬と結婚の約束をする娘。",
-                                    "★１ｂ．馬と夫婦になる娘。",
-                                    "★１ｃ．馬と交わる女たち。",
-                                    "★２．馬が動かなくなる。",
-                                    "★３．人食い馬と英雄。",
-                                    "★４．他人の馬に乗っていたため、間違って殺される。",
-                                    "★５．馬の教え。",
-                                    "★６ａ．観音の化身の白馬。",
-                                    "★６ｂ．海の上を駆ける白馬。",
-                                    "★７．天翔ける馬。",
-                                    "★８．八本足の馬。",
-                                    "★９．駿馬と駄馬。",
-                                    "★１０．馬が埴輪に変わる。",
-                                    "★１１．馬人間。",
-                                    "★１２．馬乗り。"
-                        ]
-            },
-            {
-                        "item": "【馬に化す】",
-                        "stars": [
-                                    "★１．人間を馬にする草、馬を人間にもどす草。",
-                                    "★２．「人を馬にする」と称するが、できない。",
-                                    "★３．人を馬に変えるふりをして、人妻と交わる。",
-                                    "★４．「馬を人に変え、人を馬に変える」と称して、酒食や金品をだまし取る。",
-                                    "★５．人が死んで馬に生まれ変わる。"
-                        ]
-            },
-            {
-                        "item": "【海】",
-                        "stars": [
-                                    "★１．海の水のからい理由。",
-                                    "★２．海の水すべてを収める器。",
-                                    "★３．海の水を干上がらせる。",
-                                    "★４ａ．海の水を二つに分ける。",
-                                    "★４ｂ．海の水が分かれない。",
-                                    "★５．海の水を飲み干す。",
-                                    "★６．海を汲みつくそうとする・埋めつくそうとする。",
-                                    "★７．海水を掬（すく）って懐に入れ続ける。",
-                                    "★８．海の中から、不死の甘露などを得る。",
-                                    "★９．海上を歩く。",
-                                    "★１０．海の名前の起源。",
-                                    "★１１．海の世界は、そのまま天上世界に通じている。"
-                        ]
-            },
-            {
-                        "item": "【海に沈む宝】",
-                        "stars": [
-                                    "★１．貴重な宝物を海に沈める。",
-                                    "★２．海に沈んだ宝を引き上げる。再び取り戻す。"
-                        ]
-            },
-            {
-                        "item": "【海の底】",
-                        "stars": [
-                                    "★１．海底の龍宮世界。",
-                                    "★２．海の底にも都がある。",
-                                    "★３．海の下の町には、おにぎりもお菓子もある。",
-                                    "★４．海の中はとても良い所だった、という嘘。",
-                                    "★５．深海の底の知的生命体。"
-                        ]
-            },
-            {
-                        "item": "【裏切り】",
-                        "stars": [
-                                    "★１．師を裏切る。",
-                                    "★２．親友を裏切る。",
-                                    "★３．犯罪者仲間を裏切る。"
-                        ]
-            },
-            {
-                        "item": "【占い】",
-                        "stars": [
-                                    "★１．未来の禍福を知る。",
-                                    "★２．多くの人の目前に迫った危難を、人相や手相から読み取る。",
-                                    "★３．銭占い。",
-                                    "★４．歌占い。",
-                                    "★５．雲占い。"
-                        ]
-            },
-            {
-                        "item": "【占い師】",
-                        "stars": [
-                                    "★１．自分の災難を予見できない占い師。",
-                                    "★２．にせ占い師。",
-                                    "★３．占い師の死後。"
-                        ]
-            },
-            {
-                        "item": "【瓜二つ】",
-                        "stars": [
-                                    "★１．間違えられたり、身代わりになったりする。",
-                                    "★２．神、仏、悪魔などが、ある人間と瓜二つに化ける。瓜二つの人間を造る。",
-                                    "★３．瓜二つの集団。",
-                                    "★４．瓜二つの二人と思わせて、実は一人が二役をする。",
-                                    "★５．現身と霊姿と思わせて、実は一人が二役をする。"
-                        ]
-            },
-            {
-                        "item": "【ウロボロス】",
-                        "stars": [
-                                    "★１．自分の尾をくわえて円環状になる蛇や魚。",
-                                    "★２．「自分の足指を用いて妊娠する女」というのは、「自分の尾をくわえる蛇」と同類のものであろう。",
-                                    "★３ａ．自分の尾をくわえて回転する犬。",
-                                    "★３ｂ．自分の排泄物を主食とする虫。",
-                                    "★４ａ．自分の頭の池へ身投げする男。",
-                                    "★４ｂ．自分の持つ瓶（びん）の中へ落ちる男。",
-                                    "★５．自分の身体から自分自身を産み出す女。",
-                                    "★６．自分と交わり自分を産み出した人。父も母も子もすべて「わたし」。",
-                                    "★７．ヘビ・ガマ・ナメクジ、三すくみのウロボロス。"
-                        ]
-            },
-            {
-                        "item": "【運命】",
-                        "stars": [
-                                    "★１ａ．定まった死の運命。",
-                                    "★１ｂ．定まった結婚の運命。",
-                                    "★１ｃ．定まった貧窮の運命。",
-                                    "★２．良い運命も、前世からの定め。",
-                                    "★３ａ．運命の転換。Ａが受けるはずの非運を、Ｂが受ける。",
-                                    "★３ｂ．悪い運命は、他の人や物に移すことができる。",
-                                    "★４．悪運の兆し。",
-                                    "★５．不運と思われた出来事が、実は幸運に結びついていた。",
-                                    "★６．幸運も不運も、平均的な確率の範囲内にあるのが望ましい。"
-                        ]
-            },
-            {
-                        "item": "【運命の受容】",
-                        "stars": [
-                                    "★１．悪い運命でも、そのまま受け入れる。",
-                                    "★２．息子の運命を、父親が引き受けようとする。",
-                                    "★３．悪い運命を他の人に移すことなく、自ら引き受ける。",
-                                    "★４．悪い運命が将来予想される時、それを前もって受け入れ、早く終わらせてしまう。"
-                        ]
-            },
-            {
-                        "item": "【絵】",
-                        "stars": [
-                                    "★１．本物そっくりの絵。",
-                                    "★２．気まぐれに描いた絵にそっくりの人物。",
-                                    "★３．迫真の絵姿。",
-                                    "★４．威力ある絵姿。",
-                                    "★５．ある時には名画と見えたものが、別の時に見ると印象が異なる。ある人が名画と見るものを、他の人は無価値なものと見る。",
-                                    "★６．絵姿が老いてゆく。",
-                                    "★７．不動様の絵姿の両目を、線香で焼き抜く。"
-                        ]
-            },
-            {
-                        "item": "【絵から抜け出る】",
-                        "stars": [
-                                    "★１．絵に描かれた動物が抜け出て、生きた動物となる。",
-                                    "★２．絵から抜け出た動物の目をつぶして、もとの絵に戻す。",
-                                    "★３．絵から抜け出る女。",
-                                    "★４．絵から出てくる大津波。"
-                        ]
-            },
-            {
-                        "item": "【絵の中に入る】",
-                        "stars": [
-                                    "★１．絵の中に入り、また出て来る。",
-                                    "★２．絵の中に入って、絵の作者と出会う。",
-                                    "★３．絵の中に入ったきり、出て来ない。",
-                                    "★４．絵の中の舟に乗り、画中に姿を消す。",
-                                    "★５．絵の中の舟に乗らず、俗世にとどまる。"
-                        ]
-            },
-            {
-                        "item": "【映画】",
-                        "stars": [
-                                    "★１．映画の怪。",
-                                    "★２．映画のスクリーンの中に入りこむ。",
-                                    "★３．映画の登場人物が、観客にむかって呼びかける。",
-                                    "★４．映画の登場人物が観客に呼びかけ、スクリーンから出て来る。",
-                                    "★５．映画をそのまま事実として体験する。",
-                                    "★６．サイレント映画とトーキー映画。",
-                                    "★７．結末が二種類ある映画。",
-                                    "★８．映画を愛する人々。",
-                                    "★９．映画を作れない、という内容の映画。",
-                                    "★１０．物語の最後に、それが現実のことではなく、映画の撮影だったことが示される。",
-                                    "★１１．試写会。"
-                        ]
-            },
-            {
-                        "item": "【映画の中の時間】",
-                        "stars": [
-                                    "★１．映画の中の時間進行と、現実の時間進行（上映時間）を一致させる。",
-                                    "★２．数十年の人生を、数十年かけて上映する映画。"
-                        ]
-            },
-            {
-                        "item": "【エイプリル・フール】",
-                        "stars": [
-                                    "★１．エイプリル・フールの日のいたずら。",
-                                    "★２．嘘を聞いて本心があらわれる。",
-                                    "★３．「エイプリル・フール」も「四月馬鹿」も通じない。"
-                        ]
-            },
-            {
-                        "item": "【ＡＢＣ】",
-                        "stars": [
-                                    "★１．ＡＢＣ順の書写。",
-                                    "★２．ＡＢＣ順の読書。",
-                                    "★３．ＡＢＣ順の殺人。",
-                                    "★４．ＡＢＣ順の学び。"
-                        ]
-            },
-            {
-                        "item": "【エレベーター】",
-                        "stars": [
-                                    "★１．エレベーター内に閉じ込められる。",
-                                    "★２．落下するエレベーター。",
-                                    "★３．エレベーターの中の男女。",
-                                    "★４．エレベーターで地獄まで降りる。",
-                                    "★５．部屋全体がエレベーター。",
-                                    "★６．エスカレーターであの世まで運ばれる、という話もある。"
-                        ]
-            },
-            {
-                        "item": "【円環構造】",
-                        "stars": [
-                                    "★１ａ．最上のものを求め、巡り巡ってまたもとの出発点にもどる。",
-                                    "★１ｂ．理想の夫を遠くに求め、巡り巡ってもっとも身近な所から夫を選ぶ。",
-                                    "★２．最強のものを求めて転々とするが、もとの出発点にはもどらない。",
-                                    "★３．しりとりを続けて、もとの出発点にもどる。",
-                                    "★４．役所のたらい回し。",
-                                    "★５．夢から現実にまたがる円環構造。",
-                                    "★６ａ．過去の世界へ送り込んだ自分自身と、年月を経てふたたび対面する男。",
-                                    "★６ｂ．三十年後の自分自身を殺し、それから三十年を経て、かつての自分自身に殺される女。",
-                                    "★７．円環状に曲がった空間。"
-                        ]
-            },
-            {
-                        "item": "【演技】",
-                        "stars": [
-                                    "★１．道化を演じる。",
-                                    "★２．臆病者のふりをする。",
-                                    "★３．破戒僧のふりをする。",
-                                    "★４．悪人のふりをしてわざと殺される。",
-                                    "★５．いつわりの恋。"
-                        ]
-            },
-            {
-                        "item": "【縁切り】",
-                        "stars": [
-                                    "★１．親子の縁を切る理由。",
-                                    "★２．夫婦の縁を切る理由。",
-                                    "★３．縁切り寺。",
-                                    "★４ａ．縁切り石。",
-                                    "★４ｂ．縁切り榎。",
-                                    "★５．別れのスポット。",
-                                    "★６．大勢の愛人たちと縁を切って別れる。"
-                        ]
-            },
-            {
-                        "item": "【宴席】",
-                        "stars": [
-                                    "★１．夜、怪物や死者などが宴会を開く。",
-                                    "★２．敵味方入り交じっての酒宴。闘いの場となる。",
-                                    "★３ａ．宴席に招かれざる客が現れる、または凶事が起こる。",
-                                    "★３ｂ．宴席にもたらされる訃報。",
-                                    "★４．婚礼の妨害。",
-                                    "★５．秘密の仮装パーティ。"
-                        ]
-            },
-            {
-                        "item": "【尾】",
-                        "stars": [
-                                    "★１ａ．動物の尾を、女の髪だと思ってつかむ。",
-                                    "★１ｂ．女の髪を、名馬の尾だと思って喜ぶ。",
-                                    "★２ａ．動物の尾に火をつけて罰する。火をつけた側の所有物が、そのために燃えてしまう。",
-                                    "★２ｂ．多くの狐の尾に火をつけ、敵の畑を焼く。",
-                                    "★２ｃ．多くの牛の尾に火をつけ、敵軍を攻める。",
-                                    "★３．猿の尾の短いわけ。",
-                                    "★４．窓の外を通り過ぎない尾。",
-                                    "★５．猫の尾と星の尾。",
-                                    "★６．罪人の身体に尾を巻きつけて、罪の軽重を示す。",
-                                    "★７．大蛇の尾から太刀を取り出す。",
-                                    "★８．ハブの尾。"
-                        ]
-            },
-            {
-                        "item": "【尾ある人】",
-                        "stars": [
-                                    "★１．紀伊半島の山地に住む、尾のある人たち。",
-                                    "★２．ヒマラヤの山奥に住む、尾のある人たち。",
-                                    "★３．尾のある子供が生まれる家系。",
-                                    "★４．成人になってから、尻尾が生え出す。"
-                        ]
-            },
-            {
-                        "item": "【王】",
-                        "stars": [
-                                    "★１．王を求める民。",
-                                    "★２ａ．神々が、治めるべき国を分配する。",
-                                    "★２ｂ．王が息子たちに、治めるべき国を分配する。",
-                                    "★２ｃ．王位を譲り合う。",
-                                    "★３ａ．王の衣裳を着れば、王と見なされる。",
-                                    "★３ｂ．閻魔の冠・衣をつけて、なり代わる。",
-                                    "★４．王と海賊。",
-                                    "★５．王殺し。",
-                                    "★６．王の前世。",
-                                    "★７．亡命する王。"
-                        ]
-            },
-            {
-                        "item": "【扇】",
-                        "stars": [
-                                    "★１．扇を交換する。",
-                                    "★２．扇を投げる。",
-                                    "★３．密会の場所に、扇を置き忘れる。",
-                                    "★４．金の扇で太陽を招き返す。",
-                                    "★５．扇の的。",
-                                    "★６．女の身の上を、秋の扇にたとえる。",
-                                    "★７．川を流れる扇を手掛かりに、恋しい人と再会する。",
-                                    "★８．扇と傘の共通点。"
-                        ]
-            },
-            {
-                        "item": "【狼】",
-                        "stars": [
-                                    "★１ａ．神や動物を呑みこむ狼。",
-                                    "★１ｂ．肉親に化けて、人や動物を呑みこむ狼。",
-                                    "★２．狼頭人身。",
-                                    "★３．狼娘。",
-                                    "★４．狼女房。",
-                                    "★５．狼に育てられる子。",
-                                    "★６ａ．狼の恩返し。",
-                                    "★６ｂ．狼の恩知らず。",
-                                    "★７．狼の口に腕を入れて噛み切られる、あるいは噛み砕かれる。",
-                                    "★８．狼の口の奥まで腕を入れ、狼を裏返す。",
-                                    "★９．狼の筋。物が盗まれた時、これを焼くと、犯人が誰かわかる。"
-                        ]
-            },
-            {
-                        "item": "【狼男】",
-                        "stars": [
-                                    "★１．狼に変身する男や女や子供。",
-                                    "★２．狼男のふりをする。",
-                                    "★３．凶暴な男が、その性格にふさわしく、狼に化身する。"
-                        ]
-            },
-            {
-                        "item": "【大晦日】",
-                        "stars": [
-                                    "★１．大晦日は、神・鬼・霊など超自然的存在と出会う時。または死と再生の時。",
-                                    "★２．大晦日にやって来る神や怪物。",
-                                    "★３．大晦日は、祝祭の時である。",
-                                    "★４．大晦日は、経済活動の区切り目である。"
-                        ]
-            },
-            {
-                        "item": "【伯父（叔父）】",
-                        "stars": [
-                                    "★１ａ．叔父と姪が関係を持つ。",
-                                    "★１ｂ．叔父と姪の性関係は、二十世紀の日本では禁忌である。",
-                                    "★２ａ．仲の良い叔父と姪。",
-                                    "★２ｂ．「中年男と若い女のカップル」と思ったら、ごく普通の叔父と姪だった。",
-                                    "★３．殺人犯の叔父が、姪を殺そうとする。",
-                                    "★４．「叔父」と名乗る人。",
-                                    "★５．叔父と甥が戦う。",
-                                    "★６．甥が伯父を救う。"
-                        ]
-            },
-            {
-                        "item": "【教え子】",
-                        "stars": [
-                                    "★１．教え子が教師を慕う。教師が教え子を愛する。",
-                                    "★２．教師が教え子と関係を持つ。",
-                                    "★３．教師が教え子と結婚する。",
-                                    "★４．家庭教師と教え子の恋。",
-                                    "★５．小説家と教え子の恋。",
-                                    "★６．老教師のお気に入りの女学生。",
-                                    "★７．教え子の事故死。"
-                        ]
-            },
-            {
-                        "item": "【教え子たち】",
-                        "stars": [
-                                    "★１．十二人の教え子たち。",
-                                    "★２．教え子たちが、退職した「先生」をいつまでも慕い続ける。",
-                                    "★３．教え子たちが、教師を追放する。",
-                                    "★４．夜間中学の教え子たち。"
-                        ]
-            },
-            {
-                        "item": "【夫】",
-                        "stars": [
-                                    "★１．働かぬ夫。",
-                                    "★２．夫になることさえ面倒がる怠け者。",
-                                    "★３．まぬけな夫。",
-                                    "★４．自慢の夫。",
-                                    "★５．夫さがし。",
-                                    "★６．夫の真の姿。",
-                                    "★７．夫の生還。",
-                                    "★８．夫の愛情を試す。",
-                                    "★９．夫が告白した悪事を、妻が別の人に語る。",
-                                    "★１０．夫たるべき条件。",
-                                    "★１１．天国の神を、夫とする。"
-                        ]
-            },
-            {
-                        "item": "【夫の弱点】",
-                        "stars": [
-                                    "★１．夫の身体の一ヵ所にある弱点を、妻（あるいは愛人）が敵に教える。敵にあたるのが、妻のもとの夫・あるいは新しい夫、というばあいもある。",
-                                    "★２．夫の身体の外に心臓があることを、妻が敵に教える。"
-                        ]
-            },
-            {
-                        "item": "【夫の秘密】",
-                        "stars": [
-                                    "★１．夫は重婚していた。",
-                                    "★２．夫には、妻以外に愛する女がいた。",
-                                    "★３．夫は仕事に出かけるふりをして、実際は物乞いをしていた。",
-                                    "★４．夫は毎日、街の事務所へ出勤し、方々に放火していた。"
-                        ]
-            },
-            {
-                        "item": "【夫殺し】",
-                        "stars": [
-                                    "★１．女が愛人と共謀して、自分の夫を殺す。",
-                                    "★２．女が、夫の喉を喰い破って殺す。",
-                                    "★３．女が、急病の夫を見殺しにする。",
-                                    "★４．女が、三人の夫を死にいたらしめる。",
-                                    "★５．女が、夫のみならず、夫との間に生まれた子供までも殺す。",
-                                    "★６．夫殺しの未遂。失敗。"
-                        ]
-            },
-            {
-                        "item": "【落とし穴】",
-                        "stars": [
-                                    "★１．子供がいたずらで作った落とし穴。",
-                                    "★２．落とし穴を掘って、敵対する人物を落とし入れる。",
-                                    "★３．落とし穴計画の失敗。",
-                                    "★４．落とし穴の上を歩いても落ちない。",
-                                    "★５．自分が掘った落とし穴に、自分が落ちる。"
-                        ]
-            },
-            {
-                        "item": "【踊り】",
-                        "stars": [
-                                    "★１．やめられない踊り。",
-                                    "★２．踊りの褒美。",
-                                    "★３ａ．猫の踊り。",
-                                    "★３ｂ．踊る猫が魔力を用いて、主人に福をもたらす。",
-                                    "★４．雀の踊り。",
-                                    "★５．死体の踊り。",
-                                    "★６．天人の舞い。",
-                                    "★７．カーニバルの踊り。",
-                                    "★８．踊り子との恋。"
-                        ]
-            },
-            {
-                        "item": "【鬼】",
-                        "stars": [
-                                    "★１．人を喰う鬼。",
-                                    "★２．女を喰う鬼。",
-                                    "★３．鬼と戦う。鬼を退治する。",
-                                    "★４．鬼退治の供。",
-                                    "★５．海の彼方の島に住む鬼たち。",
-                                    "★６．鬼が美女に化ける。",
-                                    "★７．鬼を笑わせる。",
-                                    "★８．鬼が泣く。"
-                        ]
-            },
-            {
-                        "item": "【鬼に化す】",
-                        "stars": [
-                                    "★１．女が、生きながら鬼と化す。",
-                                    "★２ａ．僧が、死後に鬼と化す。",
-                                    "★２ｂ．奴が、死後に鬼と化す。",
-                                    "★３．鬼の面をかぶって人を脅す。"
-                        ]
-            },
-            {
-                        "item": "【斧】",
-                        "stars": [
-                                    "★１．斧を水中へ落とす。",
-                                    "★２．水中へ落とした斧を探して、死者と出会う。",
-                                    "★３．水中へ落とした斧を、神様が拾ってくれる。",
-                                    "★４．水中へ斧を落として、大蟹を退治する。",
-                                    "★５．水中へ落とした斧が浮かび上がる。",
-                                    "★６．斧男。",
-                                    "★７．銀世界に落ちた銀の手斧。"
-                        ]
-            },
-            {
-                        "item": "【伯母（叔母）】",
-                        "stars": [
-                                    "★１．叔母と甥が結婚する。",
-                                    "★２．（血のつながらぬ）叔母と甥が関係を持つ。",
-                                    "★３．叔母への慕情。",
-                                    "★４．おば（伯母・叔母）の身代わりの姪。",
-                                    "★５ａ．甥がおば（伯母・叔母）を捨てる。",
-                                    "★５ｂ．姪がおば（伯母・叔母）を捨てる。",
-                                    "★６．叔母が母親である。"
-                        ]
-            },
-            {
-                        "item": "【親孝行】",
-                        "stars": [
-                                    "★１．老父・老母に孝行を尽くす。",
-                                    "★２．親の罪を訴える孝行息子。親の罪を隠す孝行息子。",
-                                    "★３．罪を得た親を、子供が命を捨てても救おうとする。",
-                                    "★４．究極の親孝行。",
-                                    "★５．五人の息子に孝行を期待する。",
-                                    "★６．亡友の孝心。",
-                                    "★７．継母に孝行を尽くす息子。"
-                        ]
-            },
-            {
-                        "item": "【親捨て】",
-                        "stars": [
-                                    "★１ａ．老親を山へ捨てる。",
-                                    "★１ｂ．老親を野へ追い遣る。",
-                                    "★１ｃ．老親を老人ホームへ入れる。",
-                                    "★２ａ．老親が子供たちに冷たくされ、自ら家を出る。",
-                                    "★２ｂ．『リア王』の日本版。",
-                                    "★２ｃ．『リア王』の二十世紀庶民版。",
-                                    "★３．棄老国で孝行息子が老親をかくまう。",
-                                    "★４．近未来の棄老国。",
-                                    "★５．親を売る。",
-                                    "★６．親不孝の三兄弟。"
-                        ]
-            },
-            {
-                        "item": "【泳ぎ】",
-                        "stars": [
-                                    "★１．風呂で泳ぐ人。",
-                                    "★２．プールで泳ぐ老人。",
-                                    "★３．いくつものプールを泳いで家へ帰る。",
-                                    "★４．泳ぎの名手。",
-                                    "★５ａ．泳ぐ人の足を引っぱる。",
-                                    "★５ｂ．泳ぐ人の肛門から内臓を抜き取る。",
-                                    "★６ａ．水がなければ泳げない。",
-                                    "★６ｂ．水があっても、すぐその下が岩場であれば、飛び込んではいけない。",
-                                    "★７．水泳と医術。"
-                        ]
-            },
-            {
-                        "item": "【恩返し】",
-                        "stars": [
-                                    "★１．人間に救われた動物が後に恩返しする。",
-                                    "★２．命の恩人への償い。"
-                        ]
-            },
-            {
-                        "item": "【恩知らず】",
-                        "stars": [
-                                    "★１．動物が、人間から受けた恩を仇で返す。",
-                                    "★２．人間が、動物から受けた恩を仇で返す。",
-                                    "★３．動物の、動物に対する忘恩。",
-                                    "★４．人間の、人間に対する忘恩。",
-                                    "★５．恩知らずのように見えて、実は恩返しをしていた。",
-                                    "★６．恩返しの心が、やがて恩知らずの心に変わる。"
-                        ]
-            },
-            {
-                        "item": "【温泉】",
-                        "stars": [
-                                    "★１．温泉発見。鳥獣に教えられたり、夢告を得たりして温泉を見出す。",
-                                    "★２．温泉の功徳。温泉に入って死者が蘇生する・病者が回復する。",
-                                    "★３．湯治しても、病気が治らない。",
-                                    "★４．温泉地で、生と死について考える。",
-                                    "★５．温泉治療で、心機一転をはかる。",
-                                    "★６．温泉の楽しみ。",
-                                    "★７．温泉に入って死ぬ。",
-                                    "★８．温泉と男女。",
-                                    "★９．温泉で湯浴みする狐。",
-                                    "★１０．温泉があたたかい理由。"
-                        ]
-            },
-            {
-                        "item": "【蚊】",
-                        "stars": [
-                                    "★１．沖縄に蚊がひろがった起源。",
-                                    "★２．奈良に蚊が多いわけ。",
-                                    "★３．酒呑童子が死後、蚊になる。",
-                                    "★４．蚊に刺されても、追い払わない。",
-                                    "★５．蚊を封じ込める。"
-                        ]
-            },
-            {
-                        "item": "【貝】",
-                        "stars": [
-                                    "★１ａ．男が、貝の中から現れた美女と結婚する。",
-                                    "★１ｂ．田螺の中から現れた少女が、男のために食事を作る。",
-                                    "★１ｃ．男が、貝を女に変えて交わる。",
-                                    "★２ａ．貝が動物に転生し、さらに人間に転生する。",
-                                    "★２ｂ．貝から他の生類に転生できるかと期待したが、できなくなった。",
-                                    "★２ｃ．人間に食われることを悲しむ貝もいる。",
-                                    "★３．貝が気を吹き出す。",
-                                    "★４．螺（ほら）貝が龍になる。",
-                                    "★５．珍しい貝。",
-                                    "★６ａ．猿が、貝に手をはさまれる。",
-                                    "★６ｂ．猿田毘古神（サルタビコノカミ）が、貝に手をはさまれる。",
-                                    "★６ｃ．人が、貝に指をはさまれる。",
-                                    "★６ｄ．少年が、貝に足をはさまれる。"
-                        ]
-            },
-            {
-                        "item": "【開眼】",
-                        "stars": [
-                                    "★１．唾による開眼。",
-                                    "★２．尿で眼を洗って開眼。",
-                                    "★３．歌の徳で開眼。",
-                                    "★４．仏の力で開眼。",
-                                    "★５．何も書いてない白紙を仏と信じて開眼。",
-                                    "★６．宝珠などの呪具で開眼。",
-                                    "★７．天使の教えにより開眼。"
-                        ]
-            },
-            {
-                        "item": "【開眼手術】",
-                        "stars": [
-                                    "★１．手術をうけて開眼する。",
-                                    "★２．開眼手術後の幻滅。"
-                        ]
-            },
-            {
-                        "item": "【外国語】",
-                        "stars": [
-                                    "★１．外国語の発生。",
-                                    "★２．知らない外国語を話せるようになる。",
-                                    "★３．外国語だから、何を言っているかわからない。",
-                                    "★４．獣の声が外国語に聞こえる。",
-                                    "★５．外国語の流入。"
-                        ]
-            },
-            {
-                        "item": "【改心】",
-                        "stars": [
-                                    "★１．悪心から善心への転換。",
-                                    "★２．宗教的回心。",
-                                    "★３．人為的に、悪心を改造して無害な人格にする。",
-                                    "★４．改心するが、予期せぬ結果に終わる。",
-                                    "★５．改心の逆。悪心を起こす。"
-                        ]
-            },
-            {
-                        "item": "【怪物退治】",
-                        "stars": [
-                                    "★１．英雄が怪物を退治する。",
-                                    "★２．女が怪物を退治する。",
-                                    "★３ａ．二十世紀の怪物退治。化学兵器を用いる。",
-                                    "★３ｂ．二十世紀の怪物退治。爆発物を呑み込ませる。",
-                                    "★４．幽霊退治。",
-                                    "★５．乱暴者が三つの怪物を退治に出かけるが、三つめの怪物は彼自身だった。",
-                                    "★６．怪獣対怪獣。"
-                        ]
-            },
-            {
-                        "item": "【蛙】",
-                        "stars": [
-                                    "★１．愚かな蛙。",
-                                    "★２ａ．巨大なガマガエル。",
-                                    "★２ｂ．巨大になろうとするヒキガエル。",
-                                    "★３．毛の生えた蛙が家に現れたら、誰かが死ぬ。",
-                                    "★４．蛙の行動を見て、悟りを得る。",
-                                    "★５ａ．蛙の形をした霊・魂。",
-                                    "★５ｂ．蛙の形をした子供。",
-                                    "★６．蛙と月。",
-                                    "★７．蛙が顔にくっついて取れない。"
-                        ]
-            },
-            {
-                        "item": "【蛙女房】",
-                        "stars": [
-                                    "★１ａ．蛙女房が正体を知られて、夫のもとを去る。",
-                                    "★１ｂ．蛙女房が、歌を残して去って行く。",
-                                    "★２．男が蛙と交わり、病んで死ぬ。",
-                                    "★３．蛙女房が人間の男と添い遂げ、子孫も繁栄する。",
-                                    "★４．王子が蛙を妻としたが、その正体は人間だった。"
-                        ]
-            },
-            {
-                        "item": "【蛙婿】",
-                        "stars": [
-                                    "★１．ヒキガエル婿。",
-                                    "★２．蛙婿の正体は人間の王子だった。"
-                        ]
-            },
-            {
-                        "item": "【顔】",
-                        "stars": [
-                                    "★１．顔が前後逆向きになる。",
-                                    "★２．顔を傷つけ、人相をわからなくする。",
-                                    "★３．動物の顔に人間の身体。",
-                                    "★４．死顔。",
-                                    "★５．目・耳・鼻・口のない顔。のっぺらぼう。",
-                                    "★６．美男美女の顔を、魔物が奪い取る。",
-                                    "★７．美貌を鬼に奪い取られた、との嘘。",
-                                    "★８．絵の名手が、妻の顔に絵の具を塗って、美しく描きかえようと試みる。",
-                                    "★９．多くの顔を持つ人。",
-                                    "★１０．山腹の岩が、人の顔に見える。"
-                        ]
-            },
-            {
-                        "item": "【画家】",
-                        "stars": [
-                                    "★１．世間に認められぬ天才画家。",
-                                    "★２．天才画家が廃人となるが、彼の魂は永遠の美を見る。",
-                                    "★３．贋作画家。",
-                                    "★４．盲目になった画家。"
-                        ]
-            },
-            {
-                        "item": "【鏡】",
-                        "stars": [
-                                    "★１ａ．直接見てはいけないものを、鏡に映して見る。",
-                                    "★１ｂ．鏡に映すだけでも致命的なことがある。",
-                                    "★２．鏡が鬼を退治する。",
-                                    "★３．地獄の審判の鏡。",
-                                    "★４．鏡は異郷への入り口である。",
-                                    "★５．鏡を水中に沈める。",
-                                    "★６．鏡面に文字を書く。",
-                                    "★７．半鏡。鏡を二つに割って、夫婦が半分ずつ持つ。",
-                                    "★８．鏡に執念が残る。",
-                                    "★９．鏡の反射。"
-                        ]
-            },
-            {
-                        "item": "【鏡が割れる】",
-                        "stars": [
-                                    "★１．鏡が割れるのは、死の予兆。"
-                        ]
-            },
-            {
-                        "item": "【鏡に映らない】",
-                        "stars": [
-                                    "★１．幽霊は鏡に映らない。",
-                                    "★２．吸血鬼は鏡に映らない。",
-                                    "★３．影を取られたため、鏡に映らない。"
-                        ]
-            },
-            {
-                        "item": "【鏡に映る遠方】",
-                        "stars": [
-                                    "★１．遠くて見えないものも、手もとの鏡に映しとれば見ることができる（実際には、不可能なことである）。",
-                                    "★２．鏡が、遠くの国にいる人の姿を映し出す。",
-                                    "★３．鏡が、はるかな天界や地獄界の有様を映し出す。"
-                        ]
-            },
-            {
-                        "item": "【鏡に映る自己】",
-                        "stars": [
-                                    "★１．若い女が、自分の美しい顔を、窓ガラスに映して見る。",
-                                    "★２．男も、自分の顔を鏡に映して見ることがある。",
-                                    "★３．鏡に映る自分を見て、みじめな姿に驚く。",
-                                    "★４．日本人が鏡に映る自分を見て、黄色人種のみすぼらしさを実感する。",
-                                    "★５．鏡に映るのが自分の姿と悟らない。",
-                                    "★６．複数の人間が一つの鏡に各自の姿を映しつつ、それを他人だと思う。",
-                                    "★７ａ．鏡に映る自分の顔を、「亡母だ」と思う。",
-                                    "★７ｂ．本当に死者の姿が鏡に映る物語もある。"
-                        ]
-            },
-            {
-                        "item": "【鏡に映る真実】",
-                        "stars": [
-                                    "★１．鏡が、動物の正体を映し出す。",
-                                    "★２．鏡が、乙女の真の姿を映し出す。",
-                                    "★３．鏡が、人の内臓や骨を映し出す。",
-                                    "★４．鏡が真実を告げる。",
-                                    "★５．逆に、鏡が偽りを映し出す。",
-                                    "★６．鏡が醜いものを強調して映す。"
-                        ]
-            },
-            {
-                        "item": "【鏡に映る未来】",
-                        "stars": [
-                                    "★１．鏡に将来の吉凶が映る。",
-                                    "★２．鏡に将来の夫が映る。"
-                        ]
-            },
-            {
-                        "item": "【鍵】",
-                        "stars": [
-                                    "★１．はじめて見た「鍵」というもの。",
-                                    "★２．日記帳を引き出しに入れ鍵をかける。",
-                                    "★３．ホテルのルーム・キー。",
-                                    "★４．鍵を海へ捨てる。",
-                                    "★５．鍵を拾い、それに合う鍵穴を探す。",
-                                    "★６．鍵穴。"
-                        ]
-            },
-            {
-                        "item": "【書き換え】",
-                        "stars": [
-                                    "★１．数字を書き換える。",
-                                    "★２．漢字を書き換える。",
-                                    "★３．運び手に死をもたらす手紙（＊→〔手紙〕２ａ）を書き換える。",
-                                    "★４．「赤ん坊が生まれた」と知らせる手紙を、「鬼子を産んだ」「犬を産んだ」などと書き換える。",
-                                    "★５．手紙を書き換えて、人の運命を変える。"
-                        ]
-            },
-            {
-                        "item": "【書き間違い】",
-                        "stars": [
-                                    "★１ａ．人名を書き間違えて、不幸を招く。",
-                                    "★１ｂ．外来語を書き間違えて、不幸を招く。",
-                                    "★２．思いがけない事故で、書いた文字が別の字になってしまう。",
-                                    "★３．心の中の思いが、書き間違いとしてあらわれる。",
-                                    "★４．文字を知らないので、当て字を書いてしまう。",
-                                    "★５．書き落とした点を、あとから書き足す。",
-                                    "★６．わざと違った文字を書く。",
-                                    "★７．活字の誤植。"
-                        ]
-            },
-            {
-                        "item": "【架空の人物】",
-                        "stars": [
-                                    "★１．現実には存在しない人物を設定する。",
-                                    "★２．空想家が出会う現実の女性。"
-                        ]
-            },
-            {
-                        "item": "【核戦争】",
-                        "stars": [
-                                    "★１．第三次世界大戦。",
-                                    "★２ａ．一人の男の狂気が核戦争を引き起こす。",
-                                    "★２ｂ．核戦争への恐怖で一人の男が発狂する。",
-                                    "★３．核戦争を起こし、その混乱に乗じて世界を征服しようとする。",
-                                    "★４．来たるべき核戦争への、心の準備。",
-                                    "★５．核爆弾テロ。",
-                                    "★６．核戦争後の世界。"
-                        ]
-            },
-            {
-                        "item": "【隠れ身】",
-                        "stars": [
-                                    "★１．術を使って姿を消す。",
-                                    "★２．頭巾・蓑・扇などの呪具を身につけて、姿を消す。",
-                                    "★３．薬を飲んで姿を消す。",
-                                    "★４．保護色の衣裳を身につけて、姿を消す。",
-                                    "★５．隠れている場所をわからないようにする。",
-                                    "★６．人から「見えない」と言われてそれを信じ、隠れ身になったと思い込む。",
-                                    "★７．姿を見えなくされ、声も出せなくされてしまう。"
-                        ]
-            },
-            {
-                        "item": "【影】",
-                        "stars": [
-                                    "★１ａ．影が身体から独立する。",
-                                    "★１ｂ．影が、身体とは異なった形に変ずる。",
-                                    "★１ｃ．身体から独立した影、と思ったら、それは他の人間が影のふりをしていたのだった。",
-                                    "★２．影から逃れようと走る人。",
-                                    "★３．影取り沼。",
-                                    "★４ａ．ふかに影を呑まれる。",
-                                    "★４ｂ．怪物に影を取られる。",
-                                    "★５．影を踏まれる。",
-                                    "★６．影で居場所がわかる。",
-                                    "★７ａ．長い影と短い影。",
-                                    "★７ｂ．夕日によってできる影。",
-                                    "★８．影となった女。姿は目に見えるが実体がなく、手でとらえることはできない。",
-                                    "★９．木の影（蔭）。"
-                        ]
-            },
-            {
-                        "item": "【影のない人】",
-                        "stars": [
-                                    "★１．身体から影を奪われる。",
-                                    "★２．影を持たない存在が、影を得ようとする。",
-                                    "★３．仙人には影がない。",
-                                    "★４．霊体には影がない。"
-                        ]
-            },
-            {
-                        "item": "【駆け落ち】",
-                        "stars": [
-                                    "★１．結婚を許されぬ男女が、一緒に逃げる。",
-                                    "★２．駆け落ちした男女が離れ離れになってしまう。",
-                                    "★３．駆け落ちの未遂。",
-                                    "★４．駆け落ちしようとする二人（人妻とその恋人）のところへ、夫が駆けつける。",
-                                    "★５．駆け落ちの相手に棄てられる。",
-                                    "★６ａ．「駆け落ち」と言って娘をだまし、誘拐する。",
-                                    "★６ｂ．「娘が誘拐された」と思ったら、実は駆け落ちしていたのだった。"
-                        ]
-            },
-            {
-                        "item": "【賭け事】",
-                        "stars": [
-                                    "★１．鬼と賭け事をして勝つ。",
-                                    "★２ａ．死神と賭け事をして勝つ。",
-                                    "★２ｂ．死神と賭け事をして負ける。",
-                                    "★３．神様どうしの賭け事。",
-                                    "★４ａ．賭け事に負けて王国を失う。",
-                                    "★４ｂ．賭け事に負けて財産を失う。身代をつぶす。",
-                                    "★５．魔術など超自然的方法で賭け事に勝とうとする。",
-                                    "★６．賭け事に絶対負けぬ法。",
-                                    "★７．勝っても負けても結果は同じ賭け事。",
-                                    "★８．この世でもあの世でも賭け事。"
-                        ]
-            },
-            {
-                        "item": "【影武者】",
-                        "stars": [
-                                    "★１．武将の身代わりとなって、敵の目をあざむく。",
-                                    "★２．六人の影武者。",
-                                    "★３．死んだのは影武者で、本物は生きているかもしれぬ、との期待。",
-                                    "★４．二十世紀の政治家にも、影武者が用いられることがある。",
-                                    "★５．戦時ではなく平時に、敵ではなく女性を欺く影武者もいる。"
-                        ]
-            },
-            {
-                        "item": "【過去】",
-                        "stars": [
-                                    "★１．過去を隠す・消す。",
-                                    "★２．油断・慢心などにより、ついうっかりと過去の悪事を語る。",
-                                    "★３ａ．改心して過去の悪事を白状する。",
-                                    "★３ｂ．乱心して過去の悪事を白状する。",
-                                    "★３ｃ．過去の悪事が露見したと思いこみ、問われもせぬのに白状する。",
-                                    "★４ａ．過去の犯罪行為の経験が、現在の問題解決に役立つ。",
-                                    "★４ｂ．現在の問題解決が、過去の犯罪行為の経験にもとづくことが露見する。",
-                                    "★５．秘密の過去が暴かれることを恐れ、人を殺す。",
-                                    "★６．過去を創造する。"
-                        ]
-            },
-            {
-                        "item": "【笠（傘）】",
-                        "stars": [
-                                    "★１ａ．雨に濡れる人に、笠を与える。",
-                                    "★１ｂ．雨や雪に濡れる仏像に、笠をかぶせる。",
-                                    "★２．女に傘を貸す。",
-                                    "★３ａ．傘に入って来る女。",
-                                    "★３ｂ．傘に入って来る死者。",
-                                    "★４ａ．古い傘から発生する妖怪。",
-                                    "★４ｂ．雨師（雨を降らせる神）に仕える雨ふり小僧。",
-                                    "★５．傘を知らぬ里。",
-                                    "★６．傘をさして空を飛ぶ。"
-                        ]
-            },
-            {
-                        "item": "【重ね着】",
-                        "stars": [
-                                    "★１．鎧の上に衣を着る。",
-                                    "★２．逆に、法衣の上に鎧を着る。",
-                                    "★３．死装束の上に羽織を着る。",
-                                    "★４．重ね着が喪服のごとく見える。",
-                                    "★５．他国の軍服の下に、自国の軍服を着る。",
-                                    "★６．青色の軍服の上を、灰色の土埃がおおう。"
-                        ]
-            },
-            {
-                        "item": "【仮死】",
-                        "stars": [
-                                    "★１．毒殺されそうな人物を救うために、仮死状態になる薬を飲ませる。",
-                                    "★２．女がいったん仮死状態になり、その後、男と駆け落ちする。",
-                                    "★３．女が仮死状態になり、男と駆け落ちしようとして失敗する。",
-                                    "★４．女が実際に死んでしまい、その後に薬で蘇生させる物語もある。",
-                                    "★５．喉につまった食べ物が取れて、仮死の女が息をふきかえす。",
-                                    "★６．仮死状態で生まれた赤ん坊。"
-                        ]
-            },
-            {
-                        "item": "【火事】",
-                        "stars": [
-                                    "★１．大火事。",
-                                    "★２．ビル火災。",
-                                    "★３．厩（うまや）の火事。",
-                                    "★４ａ．火事によって家は焼けたが、聖母の絵姿は無事だった。",
-                                    "★４ｂ．野火が起こったが寺は無事で、仏像は自ら外へ避難していた。",
-                                    "★５．火事を知らせる。",
-                                    "★６ａ．火事の家から、子供を救い出す。",
-                                    "★６ｂ．火事の家（火宅）から、子供たちを避難させる。",
-                                    "★７．火事を喜ぶ人。",
-                                    "★８ａ．火事を予言する。",
-                                    "★８ｂ．火事の前兆の、赤い着物・赤い旗。"
-                        ]
-            },
-            {
-                        "item": "【貸し借り】",
-                        "stars": [
-                                    "★１．前世での負債。",
-                                    "★２ａ．現世で物を盗まれるのは、前世での借りを返すこと。",
-                                    "★２ｂ．現世の借金を来世に返す。",
-                                    "★２ｃ．現世で食べた肉を冥途で返す。",
-                                    "★３ａ．たくさんの膳や椀を借りる。椀貸し淵。",
-                                    "★３ｂ．中国版・椀貸し淵。",
-                                    "★４．債務の有無を証拠立てる領収書。",
-                                    "★５．念仏を質物として、銭一貫文を借りる。"
-                        ]
-            },
-            {
-                        "item": "【風】",
-                        "stars": [
-                                    "★１．神が風を起こす。",
-                                    "★２．狐が風を起こす。",
-                                    "★３．人が術を用いて風を起こす。",
-                                    "★４．つむじ風を起こし、その中心を真空にする。",
-                                    "★５．自然の風か、魔法による風か、見分ける。",
-                                    "★６．風を静める。",
-                                    "★７ａ．竜巻で、吹き飛ばされる家。",
-                                    "★７ｂ．暴風にも、びくともしない塔。",
-                                    "★８．風が旗竿を吹き折る。",
-                                    "★９．風が動くか、幡（はた）が動くか。"
-                        ]
-            },
-            {
-                        "item": "【風邪】",
-                        "stars": [
-                                    "★１．風と風邪。",
-                                    "★２．風邪の神。",
-                                    "★３．風邪の用心。",
-                                    "★４．デートの証拠の風邪。",
-                                    "★５．流行性感冒（インフルエンザ）。"
-                        ]
-            },
-            {
-                        "item": "【風の神】",
-                        "stars": [
-                                    "★１．風の神の祭り。",
-                                    "★２．風の神と子供たち。",
-                                    "★３．風の神の袋。"
-                        ]
-            },
-            {
-                        "item": "【火葬】",
-                        "stars": [
-                                    "★１．死者を火葬にしたので、蘇生しても魂の戻るべき身体がない。",
-                                    "★２．自分の身体を火葬で失い、他人の身体を借りて蘇生したため、家族が二倍になった。",
-                                    "★３．生体から一時的に魂が抜け出ている間に、その生体を焼いてしまう。",
-                                    "★４．「私を火葬するな」と言い残して死ぬ。",
-                                    "★５．火葬しなくても遺体は腐敗する。",
-                                    "★６．遺体の代わりに得た新しい身体が不満、というばあいもある。",
-                                    "★７．仏の火葬。",
-                                    "★８．火葬の煙。",
-                                    "★９．「このしろ」を焼いて、人を火葬したかのごとく欺（あざむ）く。",
-                                    "★１０．日本の火葬の始まり。"
-                        ]
-            },
-            {
-                        "item": "【仮想世界】",
-                        "stars": [
-                                    "★１．自分が生まれなかった世界。",
-                                    "★２．現実世界の歴史と仮想世界の歴史。",
-                                    "★３．一人の小説家の想像の産物である世界。",
-                                    "★４．コンピュータが作り出した仮想世界。"
-                        ]
-            },
-            {
-                        "item": "【片足】",
-                        "stars": [
-                                    "★１．片足・一本足の神。",
-                                    "★２．一本足の人形。",
-                                    "★３．傷を負って片足になった人。",
-                                    "★４ａ．悪魔の片足は馬の足。",
-                                    "★４ｂ．足の形をした根。半分は人間の足、半分は小羊の足。",
-                                    "★５．片足の登山。",
-                                    "★６．片足で立つ。",
-                                    "★７．片足に靴をはき、片足は裸足の男。",
-                                    "★８．片足に足袋をはき、片足は裸足の女。"
-                        ]
-            },
-            {
-                        "item": "【片腕】",
-                        "stars": [
-                                    "★１．怪物の片腕（前足）を取る。",
-                                    "★２．怪物が、取られた片腕を取り返しに来る。",
-                                    "★３ａ．片腕を斬り取られる。",
-                                    "★３ｂ．片手を噛み切られる。",
-                                    "★４ａ．片腕を取られたので、銀の腕をつける。",
-                                    "★４ｂ．片腕を取られたので、鉄の鉤（かぎ）をつける。",
-                                    "★４ｃ．片腕に鉤手（フック）をつけた殺人鬼。",
-                                    "★５．片腕の静脈に、ねじを装着する。",
-                                    "★６．自らの片臂を切り落とす。",
-                                    "★７．子供たちの片腕を切り落とす。",
-                                    "★８．若い女の片腕。"
-                        ]
-            },
-            {
-                        "item": "【片目】",
-                        "stars": [
-                                    "★１．片目を射る。左目を射る・射られるという物語が多い。",
-                                    "★２．片目を抉る。",
-                                    "★３．自らの片目をくり抜く。",
-                                    "★４．片目が抜け出る。",
-                                    "★５．神像の目を取る。",
-                                    "★６．片目の魚。",
-                                    "★７．片目の蛙。",
-                                    "★８．二人の片目を足し合わせれば一人の両目と等しい、という計算。"
-                        ]
-            },
-            {
-                        "item": "【語り手】",
-                        "stars": [
-                                    "★１．信頼できない語り手。語り手が必ずしも事実を語らない。",
-                                    "★２．越境する語り手。物語の語り手（あるいは作者）と作中人物が交渉する。メタ・フィクション。",
-                                    "★３ａ．語り手である「筆者」と、作中人物「医師リウー」が、同一人物であることが最後に明かされる。",
-                                    "★３ｂ．語り手の「わたし」が、物語に登場する人物「ムーン」であることが、最後に明かされる。",
-                                    "★４．語り手が犯罪者であることが、最後に明かされる。",
-                                    "★５．語り手が遠い昔に殺人を犯したことが、最後に明かされる。",
-                                    "★６．物語の最後に真相を明かす、という語り方。",
-                                    "★７．語り手が死者である。",
-                                    "★８．語り手が死んでしまうが、また生き返る。"
-                        ]
-            },
-            {
-                        "item": "【河童】",
-                        "stars": [
-                                    "★１．河童婿。",
-                                    "★２．河童駒引き。",
-                                    "★３．河童の詫び証文。",
-                                    "★４．相撲をとる河童。",
-                                    "★５．厠にひそむ河童。",
-                                    "★６．河童が命を棄てて、雨を降らせる。",
-                                    "★７．河童の皿。",
-                                    "★８．河童の教え。",
-                                    "★９．河童の変形の「ガッパ」。",
-                                    "★１０．河童の世界のアダムとエバ（イヴ）。"
-                        ]
-            },
-            {
-                        "item": "【かつら】",
-                        "stars": [
-                                    "★１．かつらを用いる男。",
-                                    "★２．かつらを用いる女。",
-                                    "★３．かもじ（入れ髪）。",
-                                    "★４．悪人の髪を藁人形に入れて呪ったが、それはかつらだった。"
-                        ]
-            },
-            {
-                        "item": "【蟹】",
-                        "stars": [
-                                    "★１．蟹が蛇を殺す。",
-                                    "★２．蟹が蛇を殺して、人を救う。",
-                                    "★３．蟹が蛇を殺して、娘を救う。",
-                                    "★４．蟹が蛇に味方する。",
-                                    "★５．悪人は死後、蟹に生まれ変わる。",
-                                    "★６ａ．平家蟹。",
-                                    "★６ｂ．島村蟹。",
-                                    "★６ｃ．毛蟹。",
-                                    "★７．蟹缶詰の「献上品」。",
-                                    "★８．蟹を養う爺と、蟹を喰う婆。",
-                                    "★９．巨大な蟹のような姿。",
-                                    "★１０．かに座。"
-                        ]
-            },
-            {
-                        "item": "【金】",
-                        "stars": [
-                                    "★１．金の使いこみとその穴埋め。",
-                                    "★２．金の使いこみを防ぐ、ただ一つの方法。",
-                                    "★３．借金とその返済。",
-                                    "★４．金を払わずに、その音だけを聞かせる。",
-                                    "★５．「金を与える」という言葉だけを聞かせる。",
-                                    "★６．乗り物の代金。",
-                                    "★７．年金。",
-                                    "★８．賞金稼ぎ。",
-                                    "★９．金が金を呼ぶ。"
-                        ]
-            },
-            {
-                        "item": "【金が人手を巡る】",
-                        "stars": [
-                                    "★１．金が人の手から手へ巡る。",
-                                    "★２．金が夫・妻・および第三者の間を巡る。"
-                        ]
-            },
-            {
-                        "item": "【金を拾う】",
-                        "stars": [
-                                    "★１．三方一両損。",
-                                    "★２．五十文を費やして十文を拾う。",
-                                    "★３．落ちている金を拾って財を成す。",
-                                    "★４．大金を拾うが、それを届けず自分のものにしてしまう。",
-                                    "★５．金を落とした人と拾った人の縁組み。"
-                        ]
-            },
-            {
-                        "item": "【鐘】",
-                        "stars": [
-                                    "★１．水底の鐘。",
-                                    "★２．鐘の中に入る・隠れる。",
-                                    "★３．鐘をついて時を知らせる。",
-                                    "★４．鐘をついて、龍神を池に封じる。",
-                                    "★５．鐘をつかない。",
-                                    "★６．無間（むげん）の鐘。"
-                        ]
-            },
-            {
-                        "item": "【金貸し】",
-                        "stars": [
-                                    "★１．冷酷な金貸し。",
-                                    "★２．金貸しが、借り手の身体を傷つける。",
-                                    "★３．金貸しの妾。",
-                                    "★４．金貸しは、死後地獄へ堕ちる。"
-                        ]
-            },
-            {
-                        "item": "【金貸し殺し】",
-                        "stars": [
-                                    "★１．金貸しの男を殺す。",
-                                    "★２．金貸しの老婆を殺す。"
-                        ]
-            },
-            {
-                        "item": "【壁】",
-                        "stars": [
-                                    "★１ａ．壁を通り抜ける。",
-                                    "★１ｂ．壁を通り抜けて、少し過去へ戻る。",
-                                    "★２．壁に穴を開ける。",
-                                    "★３ａ．人間が壁に変身する。",
-                                    "★３ｂ．人間が壁にはりついて一体化する。",
-                                    "★４ａ．行く手をふさぐ壁。",
-                                    "★４ｂ．外地で出会った「塗り壁」。"
-                        ]
-            },
-            {
-                        "item": "【釜】",
-                        "stars": [
-                                    "★１．釜から食物がいくらでも出てくる。",
-                                    "★２．地獄の釜で煮られる人。",
-                                    "★３．地獄の釜が四つに裂ける。",
-                                    "★４．地獄の釜の休日。",
-                                    "★５．釜ゆでの刑。",
-                                    "★６．釜が淵の主（ぬし）になる。"
-                        ]
-            },
-            {
-                        "item": "【鎌】",
-                        "stars": [
-                                    "★１．人の命を奪う鎌。",
-                                    "★２．鎌では切れぬ不死身の身体。",
-                                    "★３．大鎌で麦を刈ると、多くの人が死ぬ。",
-                                    "★４．命をとられるか、鎌をとられるか、二つに一つ。",
-                                    "★５．鎌のおかげで命が助かった。",
-                                    "★６．鎌で風を切る。",
-                                    "★７．鎌を用いて火の難を逃れる。",
-                                    "★８ａ．鎌が自分で稲を刈って働く。",
-                                    "★８ｂ．鎌が自らの居場所を知らせる。"
-                        ]
-            },
-            {
-                        "item": "【神】",
-                        "stars": [
-                                    "★１．すべてが神。",
-                                    "★２．唯一絶対神。",
-                                    "★３．神はいつでもどこでも、人を見ている。",
-                                    "★４．神から出て、神に還る。",
-                                    "★５．神の存在を信じるか否か？",
-                                    "★６．神界の階層構造。",
-                                    "★７．御神体。",
-                                    "★８．「死ぬ神」と「不死の神」。",
-                                    "★９ａ．「不老の神」と「老いる人間」。",
-                                    "★９ｂ．童女（をとめ）は八十年を経てすっかり年老いたが、神の子孫である天皇は不老だった。",
-                                    "★１０．流行の神。",
-                                    "★１１．神への非礼。",
-                                    "★１２．人間が神を傷つける。",
-                                    "★１３．人間が神を助ける。"
-                        ]
-            },
-            {
-                        "item": "【神に仕える女】",
-                        "stars": [
-                                    "★１．神域の処女。",
-                                    "★２．斎宮（いつきのみや）。",
-                                    "★３．巫女が国を治める。"
-                        ]
-            },
-            {
-                        "item": "【神になった人】",
-                        "stars": [
-                                    "★１．人間が死後に神となって祀（まつ）られる。",
-                                    "★２．人間の夫婦が、死後に神や仏となって祀られる。",
-                                    "★３．帝王の父親は、神でなければならない。",
-                                    "★４．生きた人間が「神」と呼ばれ、共同体を支配する。",
-                                    "★５．人間が神のふりをする。"
-                        ]
-            },
-            {
-                        "item": "【神の訴え】",
-                        "stars": [
-                                    "★１．神が苦を訴える。",
-                                    "★２．神が祭りを要求する。"
-                        ]
-            },
-            {
-                        "item": "【神の名前】",
-                        "stars": [
-                                    "★１．神は多くの名前を持つ。"
-                        ]
-            },
-            {
-                        "item": "【神を見る】",
-                        "stars": [
-                                    "★１．神の姿を見るのは、怖れ慎むべきことである。",
-                                    "★２．選ばれた人が神の姿を見て、言葉を聞く。"
-                        ]
-            },
-            {
-                        "item": "【髪】",
-                        "stars": [
-                                    "★１ａ．金髪。",
-                                    "★１ｂ．赤毛。",
-                                    "★１ｃ．緑色の髪。",
-                                    "★１ｄ．辮髪（べんぱつ）。",
-                                    "★２．逆立つ髪。",
-                                    "★３．人に魔法をかけるために、その髪の毛を用いる。"
-                        ]
-            },
-            {
-                        "item": "【髪（女の）】",
-                        "stars": [
-                                    "★１．女の長い髪。",
-                                    "★２．美しい髪を手に入れ、その主である女をさがす。",
-                                    "★３．女の長い髪が蛇に変わる・蛇に見える。",
-                                    "★４．神が、女の髪を蛇に変える。",
-                                    "★５．女の髪を売る。",
-                                    "★６．死んだ女の髪を売ろうとする。"
-                        ]
-            },
-            {
-                        "item": "【髪が伸びる】",
-                        "stars": [
-                                    "★１．切り取られ、剃り落とされた髪は、時間がたてばまたもとどおりに伸びる。",
-                                    "★２．髪が伸びて力を回復する。",
-                                    "★３．髪が伸びることを利用して、秘密の通信をする。"
-                        ]
-            },
-            {
-                        "item": "【髪を切る・剃る】",
-                        "stars": [
-                                    "★１．生命や力の根源である髪や髭を、切り取る・剃り落とす。",
-                                    "★２．不義をはたらいた人の髪を切る。片側の髪だけ切ることがある。",
-                                    "★３．髪を剃れば通信文があらわれるのではないか、と疑う。"
-                        ]
-            },
-            {
-                        "item": "【神がかり】",
-                        "stars": [
-                                    "★１．神が人間の口を通して様々なことを告げる。",
-                                    "★２．神がかりによって、死者がでる。",
-                                    "★３．いつわりの神がかり。",
-                                    "★４．いつわりの神がかりのつもりが、本当の神が乗り移る。",
-                                    "★５．子供に神がかりする理由。",
-                                    "★６．神がかりになった巫女の思い。"
-                        ]
-            },
-            {
-                        "item": "【神隠し】",
-                        "stars": [
-                                    "★１．神・魔物などが人を連れ去る。"
-                        ]
-            },
-            {
-                        "item": "【雷】",
-                        "stars": [
-                                    "★１．人間が雷に化す。",
-                                    "★２．雷と性交。雷雨は天と地の性交であり、それに促されて男女も契りを交わす。",
-                                    "★３．雷の嫁になる。",
-                                    "★４．武器としての雷。",
-                                    "★５ａ．雷の真似をする。",
-                                    "★５ｂ．雷を真似るのは、本物の雷を招く呪術だった。",
-                                    "★６．雷雨で占う。"
-                        ]
-            },
-            {
-                        "item": "【亀】",
-                        "stars": [
-                                    "★１．釣り上げた亀を海へ返し、後にその亀と夫婦になる。",
-                                    "★２．亡き母の霊が亀と化して子を救う。",
-                                    "★３ａ．亀の甲羅は有用なものである。",
-                                    "★３ｂ．亀の甲羅で吉凶を占う。",
-                                    "★４．亀の予言。",
-                                    "★５ａ．世界を支える亀。",
-                                    "★５ｂ．「世界を支える亀」を支えるものは何か？",
-                                    "★６．亀の寿命は一万年。"
-                        ]
-            },
-            {
-                        "item": "【仮面】",
-                        "stars": [
-                                    "★１．美しい顔を隠す仮面。",
-                                    "★２．醜い顔を隠す仮面。",
-                                    "★３．醜い顔を面で隠していることを利用して、別人とすりかわる。",
-                                    "★４．国王と同じ顔を隠す仮面。",
-                                    "★５．白色人種の容貌を隠す黄金の仮面。",
-                                    "★６．仮面の女が自分の妻であると気づかずに、口説いてしまう。",
-                                    "★７．仮面の男の正体について、読者はおおよそ見当をつけている。作中人物が、仮面の男の正体を察知する場合もある。",
-                                    "★８．覆面を捨てることによって、自分の正体を隠す。"
-                        ]
-            },
-            {
-                        "item": "【蚊帳】",
-                        "stars": [
-                                    "★１．蚊帳の中の男女。",
-                                    "★２．蚊帳つり狸。",
-                                    "★３．蚊帳を知らない人。",
-                                    "★４．魔を追い払う蚊帳。",
-                                    "★５．小さな箱の中から大きな蚊帳。",
-                                    "★６．蚊帳を質に入れる。"
-                        ]
-            },
-            {
-                        "item": "【烏（鴉）】",
-                        "stars": [
-                                    "★１．烏（鴉）の色が黒くなったわけ。",
-                                    "★２．白い烏。",
-                                    "★３．三本足の烏（鴉）。",
-                                    "★４．烏の戦争。",
-                                    "★５．人間が烏になる。",
-                                    "★６．烏と太陽。"
-                        ]
-            },
-            {
-                        "item": "【烏（鴉）の教え】",
-                        "stars": [
-                                    "★１．鴉が世界の情報をもたらす。",
-                                    "★２．烏が人の死を知らせる。",
-                                    "★３ａ．烏（鴉）が死体のありかを教える。",
-                                    "★３ｂ．逆に、鴉が死体の匿（かく）し方を教える。",
-                                    "★４．烏が鬼の有無を教える。",
-                                    "★５．烏が軍勢や猟師を導く。",
-                                    "★６．鴉が人を化かす。"
-                        ]
-            },
-            {
-                        "item": "【ガラス】",
-                        "stars": [
-                                    "★１．ガラスの靴。",
-                                    "★２．ガラスの山。",
-                                    "★３．ガラスでできた棺。",
-                                    "★４．ガラスの指。",
-                                    "★５．ガラス障子に気づかず、ぶつかる。",
-                                    "★６．すべてガラス製の建物。",
-                                    "★７．謎のガラス工場。",
-                                    "★８．ガラスの兇器のまわりに、窓ガラスの多くの破片を配置する。"
-                        ]
-            },
-            {
-                        "item": "【川】",
-                        "stars": [
-                                    "★１．川の両岸の男女。",
-                                    "★２．川の向こうの死者。",
-                                    "★３．忘却の川。",
-                                    "★４．川の水を飲んだために、妻に逢えなくなる。",
-                                    "★５．天界の河が地上に降下する。"
-                        ]
-            },
-            {
-                        "item": "【川の流れ】",
-                        "stars": [
-                                    "★１．神が矢となって川を流れ下り、女と結婚する。",
-                                    "★２．川を流れ下る木の枝が女に変じ、漁夫の男と結婚する。",
-                                    "★３．川を流れ下るさまざまなもの。",
-                                    "★４．川を流れ下る物を見て、その上流を尋ねる。",
-                                    "★５．川に合図の物を流す。",
-                                    "★６．川をさかのぼるもの。"
-                        ]
-            },
-            {
-                        "item": "【厠】",
-                        "stars": [
-                                    "★１．厠へ流れ入る矢。",
-                                    "★２．厠にかけた弓矢。",
-                                    "★３．厠の神。",
-                                    "★４．厠の中に置かれた人。",
-                                    "★５ａ．厠にいる人が、ほととぎすの声を聞く。",
-                                    "★５ｂ．父子二代、厠でほととぎすの声を聞き、災いを受けた。",
-                                    "★６．厠にいる人を襲って殺す。",
-                                    "★７．厠の中の人を見る。",
-                                    "★８．厠へ流し捨てる。",
-                                    "★９．貸し雪隠。"
-                        ]
-            },
-            {
-                        "item": "【厠の怪】",
-                        "stars": [
-                                    "★１．厠に出る妖怪。",
-                                    "★２．厠に出る幽霊。",
-                                    "★３．厠の幽霊にとりつかれた人。",
-                                    "★４．厠から手が出て、尻をなでる。",
-                                    "★５．厠から手が出て、人を引きずりこむ。",
-                                    "★６．厠にいる人が、天狗にさらわれる。",
-                                    "★７．厠に住む鬼。"
-                        ]
-            },
-            {
-                        "item": "【癌】",
-                        "stars": [
-                                    "★１．癌に直面した男が、公園作りを考える。",
-                                    "★２．癌の手術によって「性」を失う。",
-                                    "★３．癌患者の入院生活。",
-                                    "★４．癌への恐れ。",
-                                    "★５．「不治の癌」との診断を受けて、自殺を決意する。",
-                                    "★６．「不治の癌」との偽りの診断を受けて、自殺する。",
-                                    "★７．癌の疑い。"
-                        ]
-            },
-            {
-                        "item": "【漢字】",
-                        "stars": [
-                                    "★１．漢字を分解する。",
-                                    "★２．二つの漢字を合わせて、一文字の人名と見る。",
-                                    "★３．漢字の意味を説き聞かせる。",
-                                    "★４．形が類似した漢字。"
-                        ]
-            },
-            {
-                        "item": "【観相】",
-                        "stars": [
-                                    "★１．人相を見て、将来、地位と権力を得るであろうことを見抜く。",
-                                    "★２．身分をいつわっても、それを見抜く。",
-                                    "★３．寿命を占い、才能を評価し、身分を見抜く。",
-                                    "★４．少年を見て、聖者であることを知る。",
-                                    "★５．青年の将来を予言する。",
-                                    "★６．出家者・往生者の相を見る。",
-                                    "★７．非凡の相ゆえ、特別に取り立てられる。",
-                                    "★８．女難の相。",
-                                    "★９．貧賤の相。"
-                        ]
-            },
-            {
-                        "item": "【観法】",
-                        "stars": [
-                                    "★１．水想観。心の中に水を観じ、自身とその周囲をすべて水にしてしまう。",
-                                    "★２．不浄観。生きた人間を見ても、髑髏や白骨に見えてしまう。",
-                                    "★３．食物も、その本体は不浄のものである。",
-                                    "★４．柏の木を観想すれば、柏の木が現れる。",
-                                    "★５．次の例は、禅師が「無」を観じていたために、その姿が見えなかったのであろう。"
-                        ]
-            },
-            {
-                        "item": "【木】",
-                        "stars": [
-                                    "★１ａ．神が、木から人間を造る。",
-                                    "★１ｂ．神が、木を人間の背骨にする。",
-                                    "★２．世界をささえる木。",
-                                    "★３．生命に関わる木。",
-                                    "★４．遠くからは見えるが、近寄ると見えなくなる木。",
-                                    "★５．縁結びの木。",
-                                    "★６．子授けの木。",
-                                    "★７．形を変えて生き続ける木。",
-                                    "★８．木を植える。",
-                                    "★９．木を引き抜く。",
-                                    "★１０．木にはさまれる。",
-                                    "★１１．盆栽。"
-                        ]
-            },
-            {
-                        "item": "【木に化す】",
-                        "stars": [
-                                    "★１．人間が木に変わる。",
-                                    "★２．愛し合う男女が、ともに木に変わる。",
-                                    "★３．自殺者が、地獄へ堕ちて木に変わる。",
-                                    "★４．矢・槍・櫛などが地面に根づいて、木になる。",
-                                    "★５．髭や毛が、木になるばあいもある。"
-                        ]
-            },
-            {
-                        "item": "【木の上】",
-                        "stars": [
-                                    "★１．木の上には神仏が現れる。",
-                                    "★２．木の上に、冥府の使いが現れることもある。"
-                        ]
-            },
-            {
-                        "item": "【木の下】",
-                        "stars": [
-                                    "★１．木の下の出会い。",
-                                    "★２．木の下に埋まっている死体。"
-                        ]
-            },
-            {
-                        "item": "【木の精】",
-                        "stars": [
-                                    "★１．人間（男）と木の精（女）との結婚。",
-                                    "★２．木の精が老人の姿で現れる。"
-                        ]
-            },
-            {
-                        "item": "【木の股】",
-                        "stars": [
-                                    "★１．神が木の股に降下する。",
-                                    "★２．木の股に子供を置く。",
-                                    "★３．木の股の上から、矢を射る。"
-                        ]
-            },
-            {
-                        "item": "【記憶】",
-                        "stars": [
-                                    "★１．失われた過去の記憶がよみがえる。",
-                                    "★２ａ．戦争による記憶喪失。",
-                                    "★２ｂ．戦争による記憶喪失＋交通事故による記憶喪失。",
-                                    "★２ｃ．交通事故による記憶喪失。",
-                                    "★３．記憶と前世。",
-                                    "★４．他人の記憶の侵入。",
-                                    "★５．未来の記憶が過去に逆行する。",
-                                    "★６．記憶力の弱い人。",
-                                    "★７．記憶を持つ人と持たぬ人。",
-                                    "★８ａ．誕生以来のすべての記憶を持つ人。",
-                                    "★８ｂ．生前および死後のあらゆる記憶を保持する人。",
-                                    "★９．書物の全文を記憶する。",
-                                    "★１０．記憶の中の存在を、実体化する。",
-                                    "★１１．擬似記憶。",
-                                    "★１２．全人類が、実在しない過去を記憶している。"
-                        ]
-            },
-            {
-                        "item": "【帰還】",
-                        "stars": [
-                                    "★１．夫の帰還を迎える妻。",
-                                    "★２．夫の帰還を、霊となって迎える妻。",
-                                    "★３．夫が帰還した時、妻は他の男と結婚していた。",
-                                    "★４．婚約者が帰還した時、女は他の男と結婚していた。",
-                                    "★５．夫が新しい妻を連れて、もとの妻の所へやって来る。",
-                                    "★６．父の帰還。",
-                                    "★７．息子の帰還。"
-                        ]
-            },
-            {
-                        "item": "【聞き違い】",
-                        "stars": [
-                                    "★１．死に瀕した人間の苦悶の声音を、風音や鼾声と聞き違える。",
-                                    "★２．ある語を、発音の類似した別の語に聞き違える。",
-                                    "★３．葉が風に吹かれる音を、羽ばたきと聞き違える。",
-                                    "★４．聞き違いから、新しい文学作品を創造する。"
-                        ]
-            },
-            {
-                        "item": "【偽死】",
-                        "stars": [
-                                    "★１．身を守るため・極秘の活動をするために、死んだと見せかけて姿を隠す。",
-                                    "★２ａ．路傍で死体のふりをして、旅人を襲う。",
-                                    "★２ｂ．戦場で死体のふりをして、身の安全をはかる。",
-                                    "★３ａ．死んだふりをして、葬儀費用を得る。",
-                                    "★３ｂ．死んだふりをして、家族の反応を見る。",
-                                    "★４．はじめ他殺死体のふりをしておいて、後に自殺する。",
-                                    "★５．子供たちを救うために、父が死んだふりをする。",
-                                    "★６．母親と息子がともに死をよそおう。"
-                        ]
-            },
-            {
-                        "item": "【貴種流離】",
-                        "stars": [
-                                    "★１．高貴な生まれの人が、青年期に達してから肉親と別れ辺境をさすらう。",
-                                    "★２．インドには夫婦ともに流離する物語がある。"
-                        ]
-            },
-            {
-                        "item": "【傷あと】",
-                        "stars": [
-                                    "★１．イエス･キリストの聖痕（スティグマ）。",
-                                    "★２．愛のあかしの傷あと。",
-                                    "★３．同一人・同一存在である証拠としての傷あと。",
-                                    "★４．仏像に残る証拠の傷あと。",
-                                    "★５．犯人の身体に残る証拠の傷あと。",
-                                    "★６．柱に残る証拠の傷あと。",
-                                    "★７．刀傷と鉄砲傷。",
-                                    "★８．冥府で受けた傷が、蘇生後の身体に残る。",
-                                    "★９．神が受けた傷を、人間の身体に移す。",
-                                    "★１０ａ．殺された人のそばに、その殺害者が近寄ると、死体の傷口から血が流れ出る。",
-                                    "★１０ｂ．優れた騎士が触れると、それまで治らなかった傷口がふさがる。",
-                                    "★１１．女性器を見て、傷あと・傷口と思う。"
-                        ]
-            },
-            {
-                        "item": "【犠牲】",
-                        "stars": [
-                                    "★１．一人が犠牲になって、大勢の人々を救う。",
-                                    "★２．神の子が犠牲になって、全人類を救う。",
-                                    "★３．ロボットが犠牲になって、地球人類を救う。",
-                                    "★４ａ．動物が自分の身を犠牲にして、人間を救う。",
-                                    "★４ｂ．人間が自分の身を犠牲にして、動物を救う。",
-                                    "★４ｃ．動物が自分の身を犠牲にして、仲間の獣たちを救う。",
-                                    "★４ｄ．柳の木が自分の身を犠牲にして、蝗（ばった）の害を防ぐ。",
-                                    "★５．王が自らの命を犠牲にして、国に勝利をもたらす。",
-                                    "★６．自分の安全のために、他人を犠牲にする。",
-                                    "★７．自分の思いを犠牲にして、友達の恋を叶えてやる。"
-                        ]
-            },
-            {
-                        "item": "【狐】",
-                        "stars": [
-                                    "★１．狐が、友人・知人などに化ける。",
-                                    "★２．雄狐が姫君を恋し、女に化けて近づく。",
-                                    "★３．狐が化ける現場を、人間が目撃する。",
-                                    "★４．人間なのに、狐が化けたもの、と見なす。",
-                                    "★５．人間を化かす能力はあっても、それができない狐。",
-                                    "★６．人間が狐を化かす。",
-                                    "★７．人間が狐に化ける。",
-                                    "★８．狐が人を助ける。",
-                                    "★９．狐の教え。",
-                                    "★１０．狐に生まれ変わる。",
-                                    "★１１．虎の威を借る狐。",
-                                    "★１２ａ．狐火。",
-                                    "★１２ｂ．狐の嫁入り。",
-                                    "★１３．自分以外すべて狐。"
-                        ]
-            },
-            {
-                        "item": "【狐つき】",
-                        "stars": [
-                                    "★１．狐が人間にとりつく。",
-                                    "★２．狐が人間にとりつくやり方。",
-                                    "★３．狐は、生きた人間ばかりではなく、死者にもとりつくことがある。",
-                                    "★４．狐がとりついて、昔の合戦の物語をする。",
-                                    "★５．本物の狐つきかどうか、疑わしいこともある。",
-                                    "★６．狐がとりつくのではなく、人間の方からすすんで狐に同化する。",
-                                    "★７．芸術狐がとりつく。"
-                        ]
-            },
-            {
-                        "item": "【狐女房】",
-                        "stars": [
-                                    "★１．狐女房。『鶴女房』など一般の異類婚姻譚と異なり、夫の「のぞき見」による破局ではなく、犬のために女房が去ることが多い。",
-                                    "★２．人間と狐の交わりは禁忌。",
-                                    "★３．人間と狐女房との間に生まれた美女。",
-                                    "★４．人間の妻が、狐になってしまう。",
-                                    "★５．人間に害をなす妖狐。"
-                        ]
-            },
-            {
-                        "item": "【切符】",
-                        "stars": [
-                                    "★１．どこまででも行ける切符。",
-                                    "★２．地獄の片道切符。",
-                                    "★３．切符が、チョッキのポケットから上着のポケットへ移動する。",
-                                    "★４．大きな石塊の下の切符。",
-                                    "★５．定期券。"
-                        ]
-            },
-            {
-                        "item": "【きのこ】",
-                        "stars": [
-                                    "★１．笑い茸（たけ）。",
-                                    "★２．毒きのこ。",
-                                    "★３．毒きのこを食べて死ぬ人と、死なない人。",
-                                    "★４．言葉を発し、動き回るきのこ。",
-                                    "★５．きのこ人間。",
-                                    "★６．きのこに転生する法師。",
-                                    "★７．紫色のきのこ。",
-                                    "★８．蟻の目からは、きのこは家や山のように見える。"
-                        ]
-            },
-            {
-                        "item": "【木登り】",
-                        "stars": [
-                                    "★１．木の上で一生を送る。",
-                                    "★２．木登り名人。",
-                                    "★３ａ．木に登って見下ろすと、男女の性交の幻が見える。",
-                                    "★３ｂ．見上げると、木の上の性交が見える。",
-                                    "★３ｃ．木に登って、偶然、隣家の性交を見る。",
-                                    "★４．木につかまる人との問答。",
-                                    "★５．登った木から手を放せば、仙人になれる。",
-                                    "★６．木に登る人と猪。",
-                                    "★７ａ．木に登る人の姿が水に映ったので、「木の上にいるのだ」と知る。",
-                                    "★７ｂ．木に登る人の姿が水に映ったので、「水の中にいるのだ」と思う。"
-                        ]
-            },
-            {
-                        "item": "【器物霊】",
-                        "stars": [
-                                    "★１．古い器物や金銀などが、動き出したり物を言ったりする。人間の形をとることもある。",
-                                    "★２．杓（しゃく）の変化（へんげ）。",
-                                    "★３．甕（かめ）の変化（へんげ）。",
-                                    "★４．傘の変化（へんげ）。",
-                                    "★５．箒の変化（へんげ）。",
-                                    "★６．張形（はりかた）の変化（へんげ）。",
-                                    "★７．器物霊が人にとりつく。",
-                                    "★８．器物霊が、自分の素性を知らない。"
-                        ]
-            },
-            {
-                        "item": "【偽名】",
-                        "stars": [
-                                    "★１．名前を偽る。",
-                                    "★２．有名作家の名前を借りる。",
-                                    "★３．わざと本名ではない別の名前で呼びかける。"
-                        ]
-            },
-            {
-                        "item": "【肝だめし】",
-                        "stars": [
-                                    "★１．男たちが集まり、魔物がいるかもしれぬ場所まで一人で行けるか、肝だめしをする。",
-                                    "★２．仲間が先回りして、肝だめしの場所に来た男を脅す。",
-                                    "★３．子供や女たちの間で、肝だめしが行なわれることもある。",
-                                    "★４．肝だめしに出かけた男が、何でもないことにおびえて死んでしまう。",
-                                    "★５．三階の窓に腰掛けて酒が飲めるか、賭けをする。"
-                        ]
-            },
-            {
-                        "item": "【吸血鬼】",
-                        "stars": [
-                                    "★１．男の吸血鬼。",
-                                    "★２．女の吸血鬼。",
-                                    "★３ａ．吸血鬼たちが、ただ一人残った人間を殺す。",
-                                    "★３ｂ．吸血鬼たちが、ただ一人残った人間をそのまま生かしておく。",
-                                    "★３ｃ．人類が一人残らず吸血鬼になってしまえば、問題はない。",
-                                    "★３ｄ．逆に、人類が吸血鬼を殺しつくし、男女二人の吸血鬼だけが生き残る。",
-                                    "★４．美女の血をしぼって飲む。",
-                                    "★５．恙（つつが）虫は、人の血を吸って殺す。",
-                                    "★６．「のぶすま」は、人を包んで血を吸う。"
-                        ]
-            },
-            {
-                        "item": "【九十九】",
-                        "stars": [
-                                    "★１．九十九対一。",
-                                    "★２．銭九十九文。",
-                                    "★３．九十九の首。",
-                                    "★４．九十九の谷。"
-                        ]
-            },
-            {
-                        "item": "【九百九十九】",
-                        "stars": [
-                                    "★１．九百九十九の生命を奪う。",
-                                    "★２．九百九十九本の指を切る。",
-                                    "★３．九百九十九本の太刀を奪う。",
-                                    "★４．九百九十九人の垢を洗い落とす。",
-                                    "★５．九百九十九足のぞうり。",
-                                    "★６．九百九十九対一。"
-                        ]
-            },
-            {
-                        "item": "【経】",
-                        "stars": [
-                                    "★１．経が人を救う。",
-                                    "★２．経のおかげで寿命が延びる。",
-                                    "★３．経の功徳で蘇生する。",
-                                    "★４．仏法を知ることができない人も、経によって救われる。",
-                                    "★５．前世で経典の文字を喰ったり焼いたりした報いを、現世で受ける。",
-                                    "★６ａ．経文の読誦で、犬の獣欲を鎮める。",
-                                    "★６ｂ．経文の読誦で、蛇を改心させる。",
-                                    "★７．経文の読誦で、開かぬ掌を開く。",
-                                    "★８．経文を唱えて身投げする。",
-                                    "★９．生臭い魚が、清浄な経典に変わる。",
-                                    "★１０．文字のない経典。",
-                                    "★１１．寝息がそのまま称名。"
-                        ]
-            },
-            {
-                        "item": "【狂気】",
-                        "stars": [
-                                    "★１．狂気に陥る英雄。",
-                                    "★２．狂気に陥る女。",
-                                    "★３．神罰による狂気。",
-                                    "★４．狂人として隔離される男。",
-                                    "★５．狂気から正気に戻って死ぬ男。",
-                                    "★６．狂人に仕立て上げられる人。"
-                        ]
-            },
-            {
-                        "item": "【競走】",
-                        "stars": [
-                                    "★１．他者の力を利用して、先に目的地に着く。",
-                                    "★２．計略を使って、競走相手を遅れさせる。",
-                                    "★３．仲間たちの力を借りて、競走に勝つ。",
-                                    "★４ａ．古代の戦車競走。",
-                                    "★４ｂ．二十世紀の自動車競走。",
-                                    "★５ａ．速く走る者が、ゆっくり歩く者に追いつけない。",
-                                    "★５ｂ．言葉のトリックによって、速く走る者がゆっくり歩く者に追いつけない。",
-                                    "★５ｃ．追いつくだけで良いのに、追い越してしまう。",
-                                    "★６．わざと競走に負ける。",
-                                    "★７．好きな時に、好きな所から、好きなだけ走る競走。"
-                        ]
-            },
-            {
-                        "item": "【兄弟】",
-                        "stars": [
-                                    "★１．兄弟が争う。対立する。",
-                                    "★２ａ．母親が、二人の息子のうち、兄よりも弟の方をかわいがる。",
-                                    "★２ｂ．逆に、母親が兄をかわいがり、弟につらく当たる。",
-                                    "★３．弟に及ばぬ兄。",
-                                    "★４．浦島の弟。"
-                        ]
-            },
-            {
-                        "item": "【兄弟と一人の女】",
-                        "stars": [
-                                    "★１．兄と弟が、同じ一人の女と関係を持つ。",
-                                    "★２．兄弟が、不和の原因である女を殺す。",
-                                    "★３．弟が女を殺し、兄が死骸を始末する。"
-                        ]
-            },
-            {
-                        "item": "【兄妹】",
-                        "stars": [
-                                    "★１．血のつながらぬ兄妹。",
-                                    "★２．異母兄妹。",
-                                    "★３．異母兄妹の双方と関係を持つ女。",
-                                    "★４．兄妹同然に育った、仲の良い男女。",
-                                    "★５．「兄妹である」と称して、実は夫婦。",
-                                    "★６．「兄」と称して実は愛人。「旦那」と称して実は兄。",
-                                    "★７．婚約者を「兄」と呼ぶ。",
-                                    "★８．「あなたは生き別れた兄にそっくりだ」と言って、女が男を口説こうとする。"
-                        ]
-            },
-            {
-                        "item": "【兄弟殺し】",
-                        "stars": [
-                                    "★１．兄が弟を殺す・傷つける。",
-                                    "★２．弟が兄を殺す・傷つける。",
-                                    "★３．誤解により、兄弟の一方がもう一方を殺す、あるいは殺そうとするが、誤解が解け和解する。"
-                        ]
-            },
-            {
-                        "item": "【兄妹婚】",
-                        "stars": [
-                                    "★１．神々はしばしば兄妹（姉弟）で結婚する。",
-                                    "★２．鳥なら兄妹でも結婚できる。",
-                                    "★３．人間の兄妹間の結婚。",
-                                    "★４．孤島に漂着した兄妹の結婚。",
-                                    "★５．片方あるいは双方が、兄妹であることを知らずに結婚する。",
-                                    "★６．兄が結婚を望むが、妹が拒否する。",
-                                    "★７．想像上の兄妹婚。",
-                                    "★８．姉弟婚。",
-                                    "★９．異父兄妹・姉弟の結婚。",
-                                    "★１０．異母兄弟・姉妹の結婚。",
-                                    "★１１．一人の姫君が、異母兄および異父兄から思慕される。",
-                                    "★１２．兄妹婚によって生まれた男児が成長後、自分も兄妹婚をしてしまう。二代にわたる兄妹婚。"
-                        ]
-            },
-            {
-                        "item": "【凶兆】",
-                        "stars": [
-                                    "★１．誕生時の凶兆。",
-                                    "★２．結婚に関する凶兆。",
-                                    "★３．外出に関する凶兆。",
-                                    "★４．軍事行動に関する凶兆。"
-                        ]
-            },
-            {
-                        "item": "【凶兆にあらず】",
-                        "stars": [
-                                    "★１．凶兆だと思ったら、ただの取り越し苦労だった。",
-                                    "★２．凶兆だと思ったら、かえって吉兆だった。",
-                                    "★３．凶兆を認めず無視するのが、賢明な判断。"
-                        ]
-            },
-            {
-                        "item": "【恐怖症】",
-                        "stars": [
-                                    "★１．高所恐怖症。",
-                                    "★２．鉄道恐怖症。",
-                                    "★３．赤色恐怖症。",
-                                    "★４．閉所恐怖症。"
-                        ]
-            },
-            {
-                        "item": "【共謀】",
-                        "stars": [
-                                    "★１．二人以上が共謀して、対立や争いの演技をする。",
-                                    "★２．二人が共謀して、欲深な人間から金をだまし取る。",
-                                    "★３．殺す側と殺される側が共謀し、暗殺事件を作り上げる。",
-                                    "★４．十二人が共謀して演技をする。",
-                                    "★５ａ．茶番。仲間どうしが示し合わせ、大勢の人がいる所で仇討ちや身投げなどの騒ぎを起こし、最後にオチをつけて、「何だ。芝居だったのか」と皆を驚かせ面白がらせる趣向。江戸時代後期に流行した。",
-                                    "★５ｂ．仇討ちの茶番を利用して、人を殺す。"
-                        ]
-            },
-            {
-                        "item": "【巨人】",
-                        "stars": [
-                                    "★１．英雄が巨人と一騎討ちする。",
-                                    "★２．巨人の国を訪れる。",
-                                    "★３．城に住む巨人。",
-                                    "★４ａ．巨人の身体から世界ができる。",
-                                    "★４ｂ．巨人の身体の破片が、害虫や雑草になる。",
-                                    "★５ａ．日本古代の巨人。",
-                                    "★５ｂ．巨人伝説の起源は、膨張した溺死体だったかもしれない。",
-                                    "★６．巨人（神）が地形を変える。",
-                                    "★７．人を驚かす大入道。"
-                        ]
-            },
-            {
-                        "item": "【去勢】",
-                        "stars": [
-                                    "★１．自らを去勢する。",
-                                    "★２．父親が、息子の手で去勢される。",
-                                    "★３．敵によって去勢される。",
-                                    "★４．刑罰としての去勢。",
-                                    "★５．密通の現場をおさえられ、去勢される。",
-                                    "★６．カストラート（去勢歌手）。"
-                        ]
-            },
-            {
-                        "item": "【切れぬ木】",
-                        "stars": [
-                                    "★１．斧で切ろうとしても切れない木。",
-                                    "★２．切れぬ木を切り倒す。",
-                                    "★３．切ってはならぬ木を切ったために、死ぬ。",
-                                    "★４．移転・移植できぬ木。",
-                                    "★５．切り倒しても動かぬ木。",
-                                    "★６．役立たずゆえ切られない木。散木。"
-                        ]
-            },
-            {
-                        "item": "【金（きん）】",
-                        "stars": [
-                                    "★１．動物が黄金を排泄する。",
-                                    "★２．「金を排泄する」と称する馬。",
-                                    "★３．槌や棒で、子供や僧を撃つと、黄金に変ずる。",
-                                    "★４．人間の女が黄金を産む。",
-                                    "★５ａ．金粉を女の全身に塗る。",
-                                    "★５ｂ．金箔を女の全身に貼る。",
-                                    "★５ｃ．金箔を男の全身に貼る。",
-                                    "★６．金箔に、刻印のごとき文字が現れる。",
-                                    "★７．黄金の巨大どくろ。"
-                        ]
-            },
-            {
-                        "item": "【金貨】",
-                        "stars": [
-                                    "★１ａ．動物が金貨を排泄する。",
-                                    "★１ｂ．鳥が金貨を産む。",
-                                    "★２．人間の口から金貨が出る。",
-                                    "★３．全身で金貨に触れる。",
-                                    "★４．金貨だと思ったら、黄色の銅貨にすぎなかった。",
-                                    "★５．小判だと思ったら、砂利だった。",
-                                    "★６．握り飯の中の小判。",
-                                    "★７．小判の刻印。",
-                                    "★８．小判の紛失。"
-                        ]
-            },
-            {
-                        "item": "【禁忌（言うな）】",
-                        "stars": [
-                                    "★１．一言も口をきくな。",
-                                    "★２．秘密を言うな。",
-                                    "★３．問うな。"
-                        ]
-            },
-            {
-                        "item": "【禁忌（聞くな）】",
-                        "stars": [
-                                    "★１．声を聞くな。",
-                                    "★２．最後まで聞くと死ぬので、途中で逃げる。"
-                        ]
-            },
-            {
-                        "item": "【禁忌（見るな）】",
-                        "stars": [
-                                    "★１．姿を見るな。",
-                                    "★２．ふりかえるな。",
-                                    "★３．「見るな」ではなく「見せるな」。"
-                        ]
-            },
-            {
-                        "item": "【禁忌を恐れず】",
-                        "stars": [
-                                    "★１．伝統的な物語では、禁忌は侵すべからざるもので、侵せば不幸な運命に陥る。しかし禁忌そのものが虚構で、これを侵しても無事な人間たちの物語が、やがて出てくる。"
-                        ]
-            },
-            {
-                        "item": "【銀行】",
-                        "stars": [
-                                    "★１．銀行強盗。",
-                                    "★２．銀行強盗を決行する前に、銀行の警備態勢を調査する。",
-                                    "★３．銀行員の横領。",
-                                    "★４．血液銀行。"
-                        ]
-            },
-            {
-                        "item": "【禁制】",
-                        "stars": [
-                                    "★１．禁漁。",
-                                    "★２．鹿の殺生禁断。",
-                                    "★３．花見の禁制。",
-                                    "★４．帯剣の禁制。",
-                                    "★５．無断立ち入り禁止の部屋へ、剣を持って入る。",
-                                    "★６．禁酒法。",
-                                    "★７．切支丹の禁制。",
-                                    "★８．敵性音楽の禁制。",
-                                    "★９．神父は、罪を犯した人の懺悔を聞いても、その内容を他言してはならない。"
-                        ]
-            },
-            {
-                        "item": "【空間】",
-                        "stars": [
-                                    "★１ａ．小さな口の中に大空間がある。",
-                                    "★１ｂ．ポケットの中に大空間がある。",
-                                    "★１ｃ．小さな球体の中に原寸大の宇宙空間がある。",
-                                    "★２．大山を芥子粒に入れ、大海を毛穴に入れる。",
-                                    "★３．小さな頭の方が、日本より広い。",
-                                    "★４．二次元の平面空間に住む「わたし」。",
-                                    "★５．もしも、地球や月が二次元平面上の存在だったら、三次元世界から自在に操作できるだろう。",
-                                    "★６．空間の起源。",
-                                    "★７．虚無の宇宙空間。"
-                        ]
-            },
-            {
-                        "item": "【空間と時間】",
-                        "stars": [
-                                    "★１．空間と時間とは別のものではない。",
-                                    "★２．上へ登ると未来へ行き、下へ降りると過去へ行く。",
-                                    "★３．時空間を見る。",
-                                    "★４．劇が演ぜられる舞台上では、空間と時間は自在に転換する。"
-                        ]
-            },
-            {
-                        "item": "【空間移動】",
-                        "stars": [
-                                    "★１ａ．遠く離れた空間に瞬時に移動する。テレポーテーション。大阪から九州まで行く、という物語がある。",
-                                    "★１ｂ．江戸から九州へ空間移動する。",
-                                    "★１ｃ．瞬間移動するかもめ。",
-                                    "★２．身体全体が空間移動したのか、身体から魂が抜け出て遠方へ行ったのか、判別し難いことがある。",
-                                    "★３ａ．三由旬も離れた遠方まで手を伸ばす。",
-                                    "★３ｂ．縮地法。",
-                                    "★４．電気装置を用いて、物質を瞬時に遠方へ送る。",
-                                    "★５．ワームホール（時空のトンネル）を通り抜ける。",
-                                    "★６．この宇宙から、他の宇宙へ飛ばされる。",
-                                    "★７．遠い空間を航行したはずが、もとの所に戻っていた。"
-                        ]
-            },
-            {
-                        "item": "【空襲】",
-                        "stars": [
-                                    "★１．空襲で家を焼かれる。",
-                                    "★２．空襲の夜の男女の出会い。",
-                                    "★３．女を連れて空襲から逃げる。",
-                                    "★４．天から降って来て、町を焼き滅ぼす火。",
-                                    "★５．大空襲に遭った経験を小説にする。",
-                                    "★６．防空壕。",
-                                    "★７．空襲で死んだ人々の亡霊。"
-                        ]
-            },
-            {
-                        "item": "【偶然】",
-                        "stars": [
-                                    "★１ａ．偶然に、だれが泥棒かを言い当てる。",
-                                    "★１ｂ．偶然に、泥棒の行動を言い当てる。",
-                                    "★１ｃ．偶然、同時刻に二つのことがらが起こる。",
-                                    "★２．近代の小説は、事件の必然的な展開を重視するので、一般に、偶然のできごとを避ける傾向がある。しかし、次のような例もある。",
-                                    "★３．近代以前の物語では、偶然というより、神仏の不思議なはからい、として語られる。",
-                                    "★４．深い縁のある人と偶然出会う。",
-                                    "★５．仕組まれた偶然。",
-                                    "★６．原因が複雑すぎて見当がつかない時に、偶然という。",
-                                    "★７．シンクロニシティ（共時性）。",
-                                    "★８．セレンディピティ。"
-                        ]
-            },
-            {
-                        "item": "【空想】",
-                        "stars": [
-                                    "★１ａ．自分が住みたい家について、あれこれ空想するが、実現できない。",
-                                    "★１ｂ．将来開きたい店について、あれこれ空想する。",
-                                    "★２ａ．犯罪を空想するが、実行せずにおく。",
-                                    "★２ｂ．犯罪の空想があまりに真実に近づいた結果、ほんとうに実行してしまう。",
-                                    "★２ｃ．犯罪を空想しただけなのに、自首する。",
-                                    "★３ａ．空想にのめりこみ、現実と区別がつかなくなる。",
-                                    "★３ｂ．空想にのめりこんで、大事なものをこわしてしまう。",
-                                    "★４．一方的な思い込み。",
-                                    "★５．殺されるのではないか、との思い込み。"
-                        ]
-            },
-            {
-                        "item": "【盟神探湯（くかたち）】",
-                        "stars": [
-                                    "★１．真実を述べていれば、熱湯に手を入れる・熱鉄を手に握るなどしても火傷をしない。",
-                                    "★２．熱湯なのだから、たとえ真実を述べていても、火傷をすることがあるかもしれない。",
-                                    "★３．『日本書紀』の時代から一千年を隔てた江戸中期になっても、熱鉄を握らせて、真実の誓いか否か確かめようとする物語がある。"
-                        ]
-            },
-            {
-                        "item": "【釘】",
-                        "stars": [
-                                    "★１．男を呪って、木に釘を打つ。",
-                                    "★２．悪人の写真に釘を打つ。",
-                                    "★３．釘が抜ける。",
-                                    "★４．釘を抜く。",
-                                    "★５．冥府で身体に釘を打ち込まれる。",
-                                    "★６．釘を打ち込んだら、他所で思いがけないことが起こった。"
-                        ]
-            },
-            {
-                        "item": "【草】",
-                        "stars": [
-                                    "★１．草は、傷ついたものを回復させ、死んだものを蘇生させる力を持つ。",
-                                    "★２．草は消化剤や下剤となる。",
-                                    "★３．蛙を殺す草と、蛙を生かす草。",
-                                    "★４．忘れ草と忘れな草。",
-                                    "★５ａ．人間の発生と草。",
-                                    "★５ｂ．人間の死と草。",
-                                    "★６．草花にも魂がある。"
-                        ]
-            },
-            {
-                        "item": "【くじ】",
-                        "stars": [
-                                    "★１．くじを引いて神意を問う。",
-                                    "★２ａ．くじを引いて、犠牲になるべき人間を選ぶ。",
-                                    "★２ｂ．くじを引いて、慰安婦を選ぶ。",
-                                    "★３．毎年一度、くじを引いて、死ぬべき人を選ぶ風習。",
-                                    "★４．くじを引くと、「当選者なし」が神意であったことがわかる。",
-                                    "★５．神意を問う「くじ」ではなく、民意を問う「入れ札（＝投票）」。",
-                                    "★６．神慮に叶うまで、何度も「くじ」を引く。",
-                                    "★７．赤ん坊の名前をくじで決める。"
-                        ]
-            },
-            {
-                        "item": "【薬】",
-                        "stars": [
-                                    "★１．いもりの黒焼の惚れ薬。",
-                                    "★２．媚薬を、葡萄酒と間違えて飲む。",
-                                    "★３．葡萄酒を、「媚薬だ」と偽って売りつける。",
-                                    "★４．強壮剤を睡眠剤と取り違える。",
-                                    "★５．人間の眼と骨髄で作った薬。"
-                        ]
-            },
-            {
-                        "item": "【薬と毒】",
-                        "stars": [
-                                    "★１．薬か毒か、一方を選んで飲む。",
-                                    "★２．薬と毒の両方を一度に提示せず、はじめに毒を送り、後から薬を送る。",
-                                    "★３．薬と間違えて、毒の瓶（びん）を渡す。",
-                                    "★４．毒が薬に変じる。",
-                                    "★５．薬Ａと薬Ｂは、それぞれ単独で服用するなら問題ないが、両方を一緒に飲むと猛毒に変化する。"
-                        ]
-            },
-            {
-                        "item": "【口から出る】",
-                        "stars": [
-                                    "★１．口から、良いもの悪いもの、いろいろなものが出てくる。",
-                                    "★２．死者の口から花が咲く。",
-                                    "★３．口から食物を出す。"
-                        ]
-            },
-            {
-                        "item": "【口と魂】",
-                        "stars": [
-                                    "★１．魂は、口から人体に入る。",
-                                    "★２．他人の魂を、口から飲みこんでしまうこともある。",
-                                    "★３．魂となるはずの原子を、飲みこんでいるかもしれない。",
-                                    "★４．魂が出て行かないように口をふさぐ。",
-                                    "★５．出て行った魂は、もう一度口から入れなければならない。"
-                        ]
-            },
-            {
-                        "item": "【口に入る】",
-                        "stars": [
-                                    "★１．口に何かが入って妊娠する。",
-                                    "★２．口に何かが入る、と夢見て妊娠する。",
-                                    "★３．口に何かが入り才能を発揮する。",
-                                    "★４．口に何かが入る、と夢見て才能を発揮する。"
-                        ]
-            },
-            {
-                        "item": "【口二つ】",
-                        "stars": [
-                                    "★１．上の口と下の口。",
-                                    "★２．頭部にも口がある。"
-                        ]
-            },
-            {
-                        "item": "【唇】",
-                        "stars": [
-                                    "★１ａ．唇の動きを見て、言葉を読み取る。読唇術。",
-                                    "★１ｂ．コンピューターが、人間の唇の動きを読み取る。",
-                                    "★２ａ．二つ折りの半紙を女性にくわえさせ、唇の形を写し取る。唇紋。",
-                                    "★２ｂ．百唇譜に唇紋を収集し、女たちから金をゆすり取る。"
-                        ]
-            },
-            {
-                        "item": "【口封じ】",
-                        "stars": [
-                                    "★１．重要な秘密が外部にもれないように、大勢の人々を殺す。",
-                                    "★２．秘密を知る人物を殺そうとするが、未遂に終わる。",
-                                    "★３．ＡがＢから貴重な情報を聞き出す。Ａはその情報を独占しようと考え、Ｂが他の人物に情報を教えぬよう、Ｂを殺して口を封じる。",
-                                    "★４．妻が、自首しようとする夫を殺して、その口を封じる。",
-                                    "★５．口止めのために身体を与える。",
-                                    "★６．口止め料。"
-                        ]
-            },
-            {
-                        "item": "【靴（履・沓・鞋）】",
-                        "stars": [
-                                    "★１．遠くへ行ける靴。飛行靴。",
-                                    "★２ａ．人の形見や身代わりとしての靴。",
-                                    "★２ｂ．下駄も、人間の身代わりと認められた。",
-                                    "★３．王が、靴の持ち主の女を捜して、妻とする。",
-                                    "★４．靴の持ち主を捜されると困るので、他人の靴と取り替える。",
-                                    "★５ａ．焼けた鉄靴をはかされて、踊り狂う。",
-                                    "★５ｂ．意志にかかわらず、踊り続ける靴。",
-                                    "★６．沓を前後逆にはく。",
-                                    "★７．靴をきっかけに、親交を結ぶ。",
-                                    "★８．草履が男女の縁結びをする。"
-                        ]
-            },
-            {
-                        "item": "【国見】",
-                        "stars": [
-                                    "★１．神が、天上から地表の国土を見下ろす。",
-                                    "★２．天皇が、山などの高所から国土を望見する。",
-                                    "★３．神の国見と天皇の国見。",
-                                    "★４．国見をして、特定の家に目を止める。",
-                                    "★５．国見をして、住むべき土地を決める。",
-                                    "★６ａ．帝王ではなく大泥棒が、山ではなく楼上から、都の春景色を眺める。",
-                                    "★６ｂ．ビルの屋上から下を見おろすだけでも、人格改造ができる。",
-                                    "★７ａ．宇宙の高みから、地球を見下ろす。",
-                                    "★７ｂ．宇宙の高みから下界を見下ろすと、青く見える。"
-                        ]
-            },
-            {
-                        "item": "【首】",
-                        "stars": [
-                                    "★１．男の首と女。",
-                                    "★２．女の首と男。",
-                                    "★３．合戦で、敵の首を取る。",
-                                    "★４．竹鋸（のこぎり）で首を引き切る。",
-                                    "★５ａ．首を胴体から切り離して復活を防ぐ。",
-                                    "★５ｂ．胴体から切り離されても生き続ける首。",
-                                    "★６．首提灯。",
-                                    "★７．首と西瓜。",
-                                    "★８．首売り。",
-                                    "★９．首斬り役人。",
-                                    "★１０．首をつけかえる。",
-                                    "★１１ａ．十余年前の古傷が裂け、首が落ちて死ぬ。",
-                                    "★１１ｂ．首が落ちた話から、教訓を導き出す。",
-                                    "★１１ｃ．咽喉を切られた傷口が開いて死ぬ、という物語もある。"
-                        ]
-            },
-            {
-                        "item": "【首くくり】",
-                        "stars": [
-                                    "★１．首くくりの松。",
-                                    "★２．首をくくった人間のその後。",
-                                    "★３．幽霊が人を首くくりに導く。",
-                                    "★４．首吊り自殺にみせかけた殺人。",
-                                    "★５．絞首台にぶら下がる死体。",
-                                    "★６．首くくりの女神。",
-                                    "★７．縊死するまでの時間。"
-                        ]
-            },
-            {
-                        "item": "【首のない人】",
-                        "stars": [
-                                    "★１．死者の身元がわからないように首を切断して持ち去り、胴体だけの死体を残す。",
-                                    "★２．ＡがＢを殺して首を切断し、Ｂの死体にＡの衣服を着せて、殺されたのはＡであるかのように見せかける。",
-                                    "★３．ＡがＢを殺して首を切断し、Ｃが殺されたかのように見せかける。",
-                                    "★４．首なしの幽霊。",
-                                    "★５．首が、鏡や水に映らない。",
-                                    "★６．たとえ首がなくなっても、動いてみせる。",
-                                    "★７．首なしで生きている人。"
-                        ]
-            },
-            {
-                        "item": "【熊】",
-                        "stars": [
-                                    "★１．神の化身の熊。",
-                                    "★２ａ．熊が人を助ける。",
-                                    "★２ｂ．熊に助けられたのに、恩を仇で返す。",
-                                    "★３．熊を捕らえる。",
-                                    "★４．熊に追われる。",
-                                    "★５．牡熊と人間の娘の間に生まれた子供。",
-                                    "★６ａ．熊の皮を着た男。",
-                                    "★６ｂ．熊の皮を着た女。",
-                                    "★７．美女の代わりに熊。",
-                                    "★８ａ．熊を撃つ猟師。",
-                                    "★８ｂ．熊と猟師が、生と死を交換する。"
-                        ]
-            },
-            {
-                        "item": "【熊女房】",
-                        "stars": [
-                                    "★１．牝熊と、人間の男との結婚。",
-                                    "★２．熊の化身の女と、天帝の子との結婚。"
-                        ]
-            },
-            {
-                        "item": "【雲】",
-                        "stars": [
-                                    "★１．雲に乗って空を飛ぶ。",
-                                    "★２．雲の上の天上世界へ行く。",
-                                    "★３．池に映った雲の上に乗る。",
-                                    "★４．縄で雲を引き寄せる。",
-                                    "★５ａ．大蛇の上にある雲。",
-                                    "★５ｂ．天子たるべき人の上にある雲。",
-                                    "★５ｃ．聖僧の上にある雲。",
-                                    "★６．紫の雲。",
-                                    "★７ａ．雲が乙女を隠す。",
-                                    "★７ｂ．雲が都市を隠す。",
-                                    "★７ｃ．人が雲を消す。",
-                                    "★８．雲の起源。",
-                                    "★９ａ．八色（やいろ）の雲。",
-                                    "★９ｂ．原子雲。",
-                                    "★１０．雲見。"
-                        ]
-            },
-            {
-                        "item": "【蜘蛛】",
-                        "stars": [
-                                    "★１．蜘蛛の糸が人の身体を引き上げる・引きずりこむ。",
-                                    "★２．蜘蛛に化す。",
-                                    "★３．蜘蛛の教え。",
-                                    "★４ａ．人間の髪の中に、蜘蛛が卵を産みつける。",
-                                    "★４ｂ．人間の皮膚に、蜘蛛が卵を産みつける。"
-                        ]
-            },
-            {
-                        "item": "【繰り返し】",
-                        "stars": [
-                                    "★１．同じ仕事をいつまでも繰り返し、終わる時がない。",
-                                    "★２．繰り返し苦を受ける。",
-                                    "★３．繰り返しの生と死。",
-                                    "★４．繰り返し同一事を主張する。"
-                        ]
-            },
-            {
-                        "item": "【クリスマス】",
-                        "stars": [
-                                    "★１ａ．クリスマスの前夜に、霊的な存在が訪れる。",
-                                    "★１ｂ．クリスマスの前夜に、宇宙人が訪れる。",
-                                    "★２．クリスマスの夜の、死の会話。",
-                                    "★３．クリスマス・イヴの死。",
-                                    "★４．クリスマスの日の出来事。",
-                                    "★５．戦場にもクリスマスは訪れる。",
-                                    "★６．クリスマス前後の物語。",
-                                    "★７．まだクリスマスが来ていないのに、「メリー・クリスマス」と挨拶する。",
-                                    "★８．ある年のクリスマスから翌年のクリスマスまで、一年間の物語。",
-                                    "★９ａ．クリスマス・プレゼント。",
-                                    "★９ｂ．クリスマス・プレゼントの起源。"
-                        ]
-            },
-            {
-                        "item": "【車】",
-                        "stars": [
-                                    "★１ａ．地獄の迎えの火車（かしゃ）。",
-                                    "★１ｂ．葬送の時、風雨が起こって棺を吹き飛ばす現象も、「火車（かしゃ）」と呼ぶ。",
-                                    "★２．人力車。",
-                                    "★３．車を造り、それをバラバラに分解する。",
-                                    "★４．車の中の美女をのぞき見る。"
-                        ]
-            },
-            {
-                        "item": "【系図】",
-                        "stars": [
-                                    "★１．近親婚などにより、複雑な系図が発生する。",
-                                    "★２．奇妙な家族関係・複雑な系図が近親婚の結果であることを、賢者が察知する。",
-                                    "★３．前世から現世にまたがる系図。前世の母子が現世で夫婦になる。",
-                                    "★４．息子が、「転生した父」の母と関係を持つ。これは、孫と祖母が夫婦関係を結んだ、と見ることができる。",
-                                    "★５．時間旅行の結果、自分の息子が自分の祖父になった。",
-                                    "★６．現実では夫婦だが、夢の中では母子になっている。",
-                                    "★７．複雑な系図に関する難問の答えがわからない。",
-                                    "★８．「姉」とも「叔母」とも呼ばれる人。",
-                                    "★９．少年が自家の系図を見て、祖先の名をはずかしめぬよう発奮し、努力する。"
-                        ]
-            },
-            {
-                        "item": "【契約】",
-                        "stars": [
-                                    "★１．延寿・不死など、死を遠ざける契約とその盲点。",
-                                    "★２．金銀・財産などの獲得、あるいは賭けなどに関わる契約と、その盲点。",
-                                    "★３．仕事に関わる契約と、その盲点。",
-                                    "★４．いったん契約どおりにした後、その契約を無化するようなことをする。",
-                                    "★５．プログラミングを無化する簡単な一言。"
-                        ]
-            },
-            {
-                        "item": "【けがれ】",
-                        "stars": [
-                                    "★１ａ．死者の国を訪れた後には、水でけがれを洗い落とさねばならない。",
-                                    "★１ｂ．穢（きたな）いことを聞いた後には、水で耳を洗う。",
-                                    "★１ｃ．「罪」も、けがれと同様に、水で浄化されると考えられていた。",
-                                    "★２．死のけがれを恐れて、死体のそばに近寄らない。",
-                                    "★３．死者のけがれにふれた時には、身を慎まねばならない。",
-                                    "★４．産のけがれ。",
-                                    "★５．犬の出産も、けがれになる。",
-                                    "★６．性交後、身を清めることなく、けがれた身体で読経する。"
-                        ]
-            },
-            {
-                        "item": "【毛皮】",
-                        "stars": [
-                                    "★１．毛皮を捕る人。",
-                                    "★２．千種類の獣物（けだもの）の毛皮。",
-                                    "★３．暖かい毛皮。",
-                                    "★４．虎の毛皮をかぶった驢馬。",
-                                    "★５．衣服に毛や皮が生じて、人間が虎に化す。",
-                                    "★６．動物の毛皮を剥ぐのは、大きな罪である。"
-                        ]
-            },
-            {
-                        "item": "【下宿】",
-                        "stars": [
-                                    "★１ａ．青年が、下宿先の娘や人妻に恋をする。",
-                                    "★１ｂ．青年が、親類・縁者の家に寄宿し、その家の娘に恋をする。",
-                                    "★２ａ．青年が、寄宿先の娘と性関係を持つ。",
-                                    "★２ｂ．寄宿・下宿先の娘と性関係を持った後に、棄ててしまう。",
-                                    "★３．近世の、商家に住みこみで働く男が主人の妹や娘と恋仲になる物語が、下宿の恋の原型であろう。",
-                                    "★４．厄介な下宿人たち。",
-                                    "★５．下宿の主人夫婦。",
-                                    "★６．殺人者かもしれぬ青年下宿人。",
-                                    "★７．下宿を捜す。",
-                                    "★８．男二人が、下宿で共同生活をする。"
-                        ]
-            },
-            {
-                        "item": "【結核】",
-                        "stars": [
-                                    "★１．結核で死ぬ女。",
-                                    "★２．結核の男が刺殺される。",
-                                    "★３．結核に感染しても発症せず、健康人のごとく生活できる場合もある。"
-                        ]
-            },
-            {
-                        "item": "【結婚】",
-                        "stars": [
-                                    "★１ａ．相手の財産を目当てに結婚する。",
-                                    "★１ｂ．財産目当てに結婚しようとするが、それを見抜かれる。",
-                                    "★２．財産目当ての結婚と思われるのがいやで、求婚しない。",
-                                    "★３．相手が財産家であることを知らずに結婚する。",
-                                    "★４ａ．Ａ家の息子とＢ家の娘が結婚することによって、ＡＢ二つの家系が一つに結び合わされる。",
-                                    "★４ｂ．恩人の息子と仇敵の娘の結婚。",
-                                    "★５．娘の結婚を機に、大家族が解体する。",
-                                    "★６．親と子、二組の結婚式が同時に行なわれる。",
-                                    "★７ａ．年の差婚。",
-                                    "★７ｂ．高齢者どうしの結婚。",
-                                    "★８．結婚詐欺。",
-                                    "★９．結婚の無効。"
-                        ]
-            },
-            {
-                        "item": "【結婚の策略】",
-                        "stars": [
-                                    "★１．自分が目当ての人と結婚するために、その妨げとなり得る人をまず結婚させてしまう。",
-                                    "★２．娘を結婚させるために、寡夫の父親が「自分も再婚する」と嘘をつく。",
-                                    "★３．両親が息子をあざむき、息子の望む花嫁とは別の女性と結婚させる。",
-                                    "★４．偽装結婚。"
-                        ]
-            },
-            {
-                        "item": "【結婚の障害】",
-                        "stars": [
-                                    "★１．敵対する二つの家族（あるいは二つの集団）に属する男と女。",
-                                    "★２．宗教の相違。",
-                                    "★３．人種の違い。",
-                                    "★４．病気。",
-                                    "★５．結婚の妨害。娘が父と再婚相手の仲を裂くため、策略を用いて、父の心を別の女に向けさせる。"
-                        ]
-            },
-            {
-                        "item": "【月食】",
-                        "stars": [
-                                    "★１．鬼が月を食べると、月食（月蝕）になる。",
-                                    "★２ａ．巨人が月を呑むと、月食になる。",
-                                    "★２ｂ．巨人が月の光を吸い取ると、月食になる。",
-                                    "★３．月と太陽が交合すると、月食になる。",
-                                    "★４．月の神が棺の中に入る＝月食、という解釈。"
-                        ]
-            },
-            {
-                        "item": "【決闘】",
-                        "stars": [
-                                    "★１．銃による決闘。",
-                                    "★２．剣や槍による決闘。",
-                                    "★３．拳銃と刃物の決闘。",
-                                    "★４．毒杯を飲む決闘。",
-                                    "★５．相手が肉親や親友と知らずに決闘する。",
-                                    "★６．最強の剣客二人の決闘。",
-                                    "★７．戦場での一騎討ちと和解。",
-                                    "★８．決闘を取りやめて仲直りする。",
-                                    "★９．決闘ののち、親友・主従になる。",
-                                    "★１０．三人で行なう決闘。",
-                                    "★１１ａ．六人対四人の決闘。",
-                                    "★１１ｂ．四人対三人の決闘。"
-                        ]
-            },
-            {
-                        "item": "【仮病】",
-                        "stars": [
-                                    "★１．病気のふりをして、他人の家へ泊り込む。",
-                                    "★２．病気のふりをして、家に居残る。",
-                                    "★３．病気のふりをして、夫を遠方へ追いやる。",
-                                    "★４．瀕死の病人のふりをして、不実な男に結婚を承知させる。",
-                                    "★５ａ．瀕死の病人のふりをして、殺人犯を油断させる。",
-                                    "★５ｂ．瀕死の病人のふりをして敵を油断させ、討とうとするが失敗する。",
-                                    "★５ｃ．病気による意識朦朧をよそおって、殺人を犯す。",
-                                    "★６．病気のように見せかける薬。",
-                                    "★７．すべては「空（くう）」であり、病気もその実体はないことを説くために、病人のふりをする。"
-                        ]
-            },
-            {
-                        "item": "【剣】",
-                        "stars": [
-                                    "★１．剣の由来・その流伝。",
-                                    "★２．自ら動く剣。",
-                                    "★３．ただ一度だけ使える剣。",
-                                    "★４．切れぬ剣。",
-                                    "★５．抜けない剣を用意しておいて、真剣と取り替える。",
-                                    "★６．毒剣と普通の剣とが入れ替わる。"
-                        ]
-            },
-            {
-                        "item": "【剣を失う】",
-                        "stars": [
-                                    "★１．戦闘中に剣を折られて死ぬ。",
-                                    "★２．致命傷を負ったことを知り、剣を捨てる。",
-                                    "★３．身辺にあった剣を失い、まもなく病んで死ぬ。"
-                        ]
-            },
-            {
-                        "item": "【剣を得る】",
-                        "stars": [
-                                    "★１．剣を手に入れ、一人前の英雄としての資格を得る。",
-                                    "★２．一人の英雄だけが、石や木から剣を引き抜くことができる。",
-                                    "★３．少年または青年が、父の残した剣を手に入れる。"
-                        ]
-            },
-            {
-                        "item": "【幻視】",
-                        "stars": [
-                                    "★１．死を知らせる幻像を見る。",
-                                    "★２．火事の幻視と、本物の火事。",
-                                    "★３．翌日の火事を、前もって幻視する。",
-                                    "★４．自分の網膜にある血管が見え、赤い炎を幻視する発作が起こる。"
-                        ]
-            },
-            {
-                        "item": "【原水爆】",
-                        "stars": [
-                                    "★１．広島への原爆投下。",
-                                    "★２．水爆ミサイルの誤射。",
-                                    "★３．原爆の恐怖。",
-                                    "★４．広島で原爆を受けたため、性的不能になった。",
-                                    "★５ａ．原水爆実験の影響で、怪獣が現れる。",
-                                    "★５ｂ．原爆爆発の衝撃で、怪獣が現れる。",
-                                    "★６．放射能汚染。"
-                        ]
-            },
-            {
-                        "item": "【碁】",
-                        "stars": [
-                                    "★１．碁の勝負を見ているうちに、長年月が経過する。",
-                                    "★２．碁が始まるとともに宇宙が始まり、碁が終わるとともに宇宙が終わる。",
-                                    "★３ａ．碁に夢中の男が、大金を置き忘れる。",
-                                    "★３ｂ．碁に夢中の男が、人を死に追いやる。",
-                                    "★４ａ．仙人が碁を打つ。",
-                                    "★４ｂ．老僧が碁を打つ。",
-                                    "★５．碁子（ごいし）の精霊。",
-                                    "★６．碁の上達。",
-                                    "★７．碁を知らぬ小児。"
-                        ]
-            },
-            {
-                        "item": "【恋文】",
-                        "stars": [
-                                    "★１．恋文が第三者の手に入る。",
-                                    "★２．「恋文を見た」との返事。",
-                                    "★３．開封されなかった恋文。",
-                                    "★４．自分自身に宛てて恋文を書く。",
-                                    "★５．知らずして、自分宛ての恋文を書く。",
-                                    "★６．女郎が、「あなたと夫婦になります」との起請文を、三人の客に与える。",
-                                    "★７．生前にもらった恋文が気がかりで、幽霊が成仏できない。"
-                        ]
-            },
-            {
-                        "item": "【恋わずらい】",
-                        "stars": [
-                                    "★１．男が一目見た女に恋して、病臥する。",
-                                    "★２．男が夢で見た女に恋して、病臥する。",
-                                    "★３．老翁の恋わずらい。",
-                                    "★４．男が恋わずらいのあげく、死んでしまう。",
-                                    "★５ａ．恋わずらいして死んだ男が、神になる。",
-                                    "★５ｂ．恋わずらいして死んだ男が、天で女と結ばれる。",
-                                    "★６．娘が恋わずらいして死ぬ。",
-                                    "★７．娘が恋わずらいして、熱病になる。",
-                                    "★８．対象不定の恋わずらい。"
-                        ]
-            },
-            {
-                        "item": "【硬貨】",
-                        "stars": [
-                                    "★１．電話に必要な硬貨。",
-                                    "★２ａ．銃弾を防ぐ一枚の銀貨。",
-                                    "★２ｂ．銃弾を防ぐ多くのバラ銭。",
-                                    "★３．硬貨の鳴る音。",
-                                    "★４．硬貨を捜す幽霊。",
-                                    "★５．まだ造られていないはずの今年の硬貨。"
-                        ]
-            },
-            {
-                        "item": "【交換】",
-                        "stars": [
-                                    "★１ａ．衣服を交換する。",
-                                    "★１ｂ．仕事の道具を交換する。",
-                                    "★１ｃ．握り飯を果実の種と交換する。",
-                                    "★２．影あるいは魂と交換に、富を得る。",
-                                    "★３ａ．耳と交換に、金を得ようとする。",
-                                    "★３ｂ．舌と交換に、人魚が脚を得る。",
-                                    "★３ｃ．目と交換に、食べ物を得る。",
-                                    "★３ｄ．片目と交換に、貴重な情報を得る。",
-                                    "★４ａ．自分の子供の身体と交換に、天下を取ることを願う。",
-                                    "★４ｂ．身命と交換に、人々の苦を救う教えを聞く。",
-                                    "★４ｃ．全人類の生命と交換に、宇宙の真理を教わる。",
-                                    "★５ａ．交換を繰り返して、だんだん価値高い物を手に入れる。",
-                                    "★５ｂ．交換を繰り返して、だんだん価値の低い物と取り替えていく。",
-                                    "★６．価値の低い物と交換したと思ったら、そうではなかった。",
-                                    "★７ａ．私製の紙幣を官製の通貨と交換する。",
-                                    "★７ｂ．古い品を新品と交換する。",
-                                    "★８．契りを交わした男女が、互いの持ち物を交換する。",
-                                    "★９．名前を交換する。",
-                                    "★１０．馬を交換する。",
-                                    "★１１．交換殺人。"
-                        ]
-            },
-            {
-                        "item": "【洪水】",
-                        "stars": [
-                                    "★１．大洪水のために世界が水没する。",
-                                    "★２．大洪水で生き残った兄妹が夫婦になる。",
-                                    "★３ａ．洪水で流される人。",
-                                    "★３ｂ．洪水で流される動物。",
-                                    "★４．近代小説の中の洪水。",
-                                    "★５．洪水の幻覚。"
-                        ]
-            },
-            {
-                        "item": "【こうもり】",
-                        "stars": [
-                                    "★１．どっちつかずのこうもり。",
-                                    "★２．人間がこうもりに変身する。",
-                                    "★３．こうもりが人間に転生する。",
-                                    "★４．白いこうもり。",
-                                    "★５．人間がこうもりの扮装をする。"
-                        ]
-            },
-            {
-                        "item": "【高齢出産】",
-                        "stars": [
-                                    "★１．六十～九十歳の女が子を産む。",
-                                    "★２．いつわりの高齢出産。",
-                                    "★３．四十八歳までは出産可能。"
-                        ]
-            },
-            {
-                        "item": "【声】",
-                        "stars": [
-                                    "★１．超自然的な声。神霊の声。",
-                                    "★２．家族や恋人の呼び声。",
-                                    "★３．持ち帰りを禁ずる声。",
-                                    "★４．破壊的な叫び声。",
-                                    "★５．声色を使う。",
-                                    "★６．声の吹き替え。",
-                                    "★７．かき消される声。",
-                                    "★８ａ．声の大きさと距離。",
-                                    "★８ｂ．近くにいても遠くにいても、同じように聞こえる声。",
-                                    "★９．大声と小声を使い分けて、離れた所にいる人をだます。",
-                                    "★１０．叫び声から人間が生まれた。",
-                                    "★１１ａ．三百人の声を聞き分ける。",
-                                    "★１１ｂ．一時に八人の言葉を聞き分ける。",
-                                    "★１２．「声」の意味。"
-                        ]
-            },
-            {
-                        "item": "【氷】",
-                        "stars": [
-                                    "★１．氷結した湖面を走る。",
-                                    "★２．氷を使った殺人と自殺。",
-                                    "★３．凍った凶器。",
-                                    "★４．氷姫の接吻。",
-                                    "★５．光る氷。",
-                                    "★６．氷とガラス。",
-                                    "★７．氷漬け。",
-                                    "★８．氷河。"
-                        ]
-            },
-            {
-                        "item": "【古歌】",
-                        "stars": [
-                                    "★１．古歌を知らない。",
-                                    "★２．古歌にある言葉。"
-                        ]
-            },
-            {
-                        "item": "【誤解による殺害】",
-                        "stars": [
-                                    "★１．誤解によって動物を殺す。",
-                                    "★２．誤解によって人を殺す。",
-                                    "★３．逆に、「人を殺した」と誤解する。",
-                                    "★４．誤解によって戦争が起こる。"
-                        ]
-            },
-            {
-                        "item": "【誤解による自死】",
-                        "stars": [
-                                    "★１．誤解によって自殺する。",
-                                    "★２．誤解によって心労死する。"
-                        ]
-            },
-            {
-                        "item": "【五月】",
-                        "stars": [
-                                    "★１．五月生まれの人。",
-                                    "★２．五月の節句。",
-                                    "★３．五月の禁忌。",
-                                    "★４．五月一日に見えるもの。"
-                        ]
-            },
-            {
-                        "item": "【子食い】",
-                        "stars": [
-                                    "★１．母親が、知らずに我が子の肉を食う。",
-                                    "★２．父親が、知らずに我が子の肉を食う。",
-                                    "★３．父親が、我が子の肉と知りつつ、食う。",
-                                    "★４．山羊が、我が子の身代わりになって食われる。"
-                        ]
-            },
-            {
-                        "item": "【極楽】",
-                        "stars": [
-                                    "★１．死んで極楽に往生する。",
-                                    "★２．死者が、極楽に往生したことを、知人の夢にあらわれて教える。",
-                                    "★３．極楽へ行く夢を見る。",
-                                    "★４．悪人も死後、極楽へ行くことができる。",
-                                    "★５．犬も極楽往生する。",
-                                    "★６．極楽へ往生せずに、俗世へ戻る。",
-                                    "★７．極楽へ往生せずに、魔道へ入る。",
-                                    "★８．一九八〇年代頃の日本は極楽。",
-                                    "★９．皆が極楽へ行ってしまって、誰もいなくなる。",
-                                    "★１０．極楽は西方にある。",
-                                    "★１１．生きた身のまま極楽へ行く。",
-                                    "★１２．この世から極楽浄土までの距離。"
-                        ]
-            },
-            {
-                        "item": "【心】",
-                        "stars": [
-                                    "★１．心は物理的制約を受けず、超スピードで移動することができる。",
-                                    "★２．心の転換。瞬時に白けた気分になる。",
-                                    "★３．緊張の後の気のゆるみ。油断。",
-                                    "★４．言葉とうらはらの本心。",
-                                    "★５ａ．他人の不幸を喜ぶ心。",
-                                    "★５ｂ．他人の幸福を喜び、他人の不幸を悲しむ心。",
-                                    "★６．心に憎しみを抱くか否かで、結果が異なる。",
-                                    "★７．心を持つものと、心を持たぬもの。",
-                                    "★８ａ．身体に別人の心を入れる。",
-                                    "★８ｂ．身体に別人の心を入れたら、という想像。",
-                                    "★９．他人の心を鏡のように映す。",
-                                    "★１０．潜在意識の思いが、実体となって現れる。",
-                                    "★１１．心の深層へ降り、超空間の穴を抜けて、異世界を探索する。",
-                                    "★１２．外界と見えるものも、心の中の景色である。",
-                                    "★１３．心に浮かぶ「考え」は、自分で作り出したものではない。",
-                                    "★１４．一人の身体の中に出現する複数の心。"
-                        ]
-            },
-            {
-                        "item": "【子殺し】",
-                        "stars": [
-                                    "★１．父親が、家のためあるいは使命のために、子を殺す。",
-                                    "★２．主君の若君や主君の妻の身代わりとするために、家来が自分の子を殺す。",
-                                    "★３．子が、わざと親から殺されるように仕向ける。",
-                                    "★４．子を殺そうとして、天に助けられる。",
-                                    "★５．神の命令によって父親が我が子を殺そうとする。",
-                                    "★６．母親が子を殺す。",
-                                    "★７．親が、自分の子と知らずに殺す。",
-                                    "★８．芸術家である父親が、娘を見殺しにする。"
-                        ]
-            },
-            {
-                        "item": "【誤射】",
-                        "stars": [
-                                    "★１．猟師などが、人間を獲物や魔物と見誤って鉄砲で撃つ。",
-                                    "★２．親孝行な息子が獲物と間違われて、弓で射殺（いころ）される。あるいは殺されそうになる。",
-                                    "★３．逆に、息子が獲物と見間違えて、母親を弓で射殺（いころ）す。",
-                                    "★４．意図的に鹿と間違えられ、射殺（いころ）されようとする。",
-                                    "★５．ねらいがそれて、目ざす相手とは別の人物を銃撃してしまう。",
-                                    "★６．戦場での誤射。"
-                        ]
-            },
-            {
-                        "item": "【子捨て】",
-                        "stars": [
-                                    "★１．生まれてまもない嬰児を捨てる。",
-                                    "★２ａ．捨てられた子が、母と幸福な再会をする。",
-                                    "★２ｂ．捨てられた子が母と再会し、父の霊と対面する。",
-                                    "★２ｃ．捨てられた子が、霊となって母と再会する。",
-                                    "★２ｄ．捨てられた子が、再び同じ両親のもとに生まれる。",
-                                    "★３．少年（あるいは少女）を捨てる。",
-                                    "★４．神が子を捨てる。",
-                                    "★５．判断力を失って、あるいは錯覚して、赤ん坊を川へ捨てる。",
-                                    "★６．夏目漱石は赤ん坊の頃、捨て子同然の扱いを受けた。",
-                                    "★７．子供の無事成長を願って、いったん捨て子にする。",
-                                    "★８．子供を捨てるか否かの選択。"
-                        ]
-            },
-            {
-                        "item": "【こだま】",
-                        "stars": [
-                                    "★１．自分の声のこだまを、敵だと思う。",
-                                    "★２．自分の声のこだまで、死んでしまう。",
-                                    "★３．自分の声のこだまを喜ぶ。",
-                                    "★４．雄略天皇と出会った一言主の神の物語は、「こだま（やまびこ）現象」と解釈されることがある。"
-                        ]
-            },
-            {
-                        "item": "【琴】",
-                        "stars": [
-                                    "★１．琴は神を招く道具である。",
-                                    "★２．琴の奇瑞。",
-                                    "★３ａ．心乱れれば琴も乱れる。",
-                                    "★３ｂ．琴の音で異変を知る。",
-                                    "★３ｃ．琴の音を聞いて、悪心から善心に変わる。",
-                                    "★４．琴の音が声をかき消す・声が琴の音をかき消す。",
-                                    "★５ａ．西洋の琴の起源。",
-                                    "★５ｂ．モンゴルの馬頭琴の起源。",
-                                    "★５ｃ．和琴（わごん）の起源。",
-                                    "★６ａ．大樹から琴を作る。",
-                                    "★６ｂ．船から琴を作る。",
-                                    "★６ｃ．竹や針金や革紐で琴を作る。",
-                                    "★７ａ．琴の音色を探し求める。",
-                                    "★７ｂ．琴を肉体、音色を魂にたとえる。"
-                        ]
-            },
-            {
-                        "item": "【言挙げ】",
-                        "stars": [
-                                    "★１．神をないがしろにする言葉を発して、神の怒りをかう。",
-                                    "★２．妖怪・幽霊の類も、侮ることはできない。",
-                                    "★３．言挙げして殺される。",
-                                    "★４．言挙げして悪魔に呪われる。",
-                                    "★５ａ．神や霊などの問いかけに対し、「やれるものならやってみろ」と答えるのも、言挙げの一種であろう。",
-                                    "★５ｂ．問いかけに怖れて逃げた人は無事で、「やれるものならやってみろ」と挑戦した人は刺された。"
-                        ]
-            },
-            {
-                        "item": "【言忌み】",
-                        "stars": [
-                                    "★１ａ．特定の言葉を嫌い、使わないようにする。",
-                                    "★１ｂ．特定の言葉を嫌い、他の言葉で言い換える。",
-                                    "★２ａ．特定の言葉を口にしたら、罰金を取られる。",
-                                    "★２ｂ．逆に、特定の字を口にしたら田楽が食える、という話もある。",
-                                    "★３．特定の言葉を口にしなければ、大金を得られる。",
-                                    "★４．特定の言葉を口にして、出入り差し止めになる。",
-                                    "★５．特定の言葉を口にすると、死ぬ。",
-                                    "★６ａ．死を連想する言葉は、慎むべきである。",
-                                    "★６ｂ．正月一日に念仏を唱えるのは、慎むべきである。",
-                                    "★７．まだ現実になっていないことを、口に出して言うのは慎むべきである。"
-                        ]
-            },
-            {
-                        "item": "【言霊】",
-                        "stars": [
-                                    "★１．威力ある言葉。",
-                                    "★２ａ．たとえ話をして相手から言質を取る。",
-                                    "★２ｂ．嘘の話をして相手から言質を取る。",
-                                    "★３．取り消された言葉。",
-                                    "★４．取り消せぬ言葉。",
-                                    "★５ａ．出まかせに言ったり書いたりした言葉が、現実のものになる。",
-                                    "★５ｂ．事実と反する嘘を言うと、その言葉が本当になってしまう。",
-                                    "★６．妖怪を話題にすると、妖怪が現れる。",
-                                    "★７．冗談で言った言葉を相手が真にうけ、重大な結果をもたらす。"
-                        ]
-            },
-            {
-                        "item": "【五人兄弟】",
-                        "stars": [
-                                    "★１．五人兄弟の物語。",
-                                    "★２．五人の兄弟分。五人組。",
-                                    "★３．天父と地母から生まれた五兄弟。",
-                                    "★４．アマテラスとスサノヲから生まれた五兄弟。"
-                        ]
-            },
-            {
-                        "item": "【五人姉妹】",
-                        "stars": [
-                                    "★１．五人姉妹の物語。",
-                                    "★２．仲の良い五人の少女たち。"
-                        ]
-            },
-            {
-                        "item": "【小人】",
-                        "stars": [
-                                    "★１．小さな身体の男が、物語の主人公になって活躍する。",
-                                    "★２．小さな身体の娘。",
-                                    "★３．森に住む小人たち。",
-                                    "★４．小人の国。",
-                                    "★５ａ．夜のうちに仕事をしてくれる小人。",
-                                    "★５ｂ．夜のうちに魚を届けてくれる小人。",
-                                    "★６．夜中に枕元で騒ぐ小人たち。",
-                                    "★７．海から来る小人。",
-                                    "★８ａ．小人が見る見る大きくなり、金銀もたくさん出て来る。",
-                                    "★８ｂ．小判が出て来るのと引き換えに、一人前の人間が縮んで小人になる。",
-                                    "★９．身体の小さな男が、見世物にされる。"
-                        ]
-            },
-            {
-                        "item": "【殺し屋】",
-                        "stars": [
-                                    "★１．殺し屋に仕事を依頼したことを後悔する。",
-                                    "★２．殺し屋に追われる人。",
-                                    "★３．足を洗おうとする殺し屋は、殺される。",
-                                    "★４．貴賤無数の人々を殺し続ける男。",
-                                    "★５．殺すべき相手が誰か、自問する殺し屋。",
-                                    "★６．女殺し屋。"
-                        ]
-            },
-            {
-                        "item": "【再会（夫婦）】",
-                        "stars": [
-                                    "★１．夫婦が別れ別れになり、何年かののちに再会する。",
-                                    "★２．戦乱で別れた夫婦・恋人が再会する。",
-                                    "★３．慕い合う男女が思いがけぬ所で再会する。",
-                                    "★４．再会した時、夫が零落している。",
-                                    "★５．再会した時、妻が零落している。",
-                                    "★６．男が、死んだはずの恋人その他の人物たちと、再会する。"
-                        ]
-            },
-            {
-                        "item": "【再会（父子）】",
-                        "stars": [
-                                    "★１．父親が、行方知れずの娘と再会する。",
-                                    "★２．父親が、家から追放した息子や娘と再会する。",
-                                    "★３．父親が子供と再会するが、父と名乗らずに別れる。"
-                        ]
-            },
-            {
-                        "item": "【再会（母子）】",
-                        "stars": [
-                                    "★１．母親と息子が再会する。",
-                                    "★２．母親が娘と再会するが、母と名乗らず別れる。",
-                                    "★３．母親が、再会した息子を殺す。"
-                        ]
-            },
-            {
-                        "item": "【再会（盲人との）】",
-                        "stars": [
-                                    "★１．男が、盲目になった愛人と再会する。",
-                                    "★２．女が、盲目になった愛人を訪れる。",
-                                    "★３．盲目になった父母や夫と再会し、開眼させる。"
-                        ]
-            },
-            {
-                        "item": "【再会拒否】",
-                        "stars": [
-                                    "★１．遁世僧が、旧知の人との再会を避けて姿をくらます。",
-                                    "★２．零落した人が、旧知の人との再会を避けて姿をくらます。",
-                                    "★３．世を捨てた夫が、自分の所在を妻に知らせず、対面もしない。",
-                                    "★４．父親と息子が、互いに再会を拒否する。"
-                        ]
-            },
-            {
-                        "item": "【最期の言葉】",
-                        "stars": [
-                                    "★１．愛する人の名前を呼んで、死んでゆく。",
-                                    "★２．謎の言葉を残して死ぬ。",
-                                    "★３．謎のメッセージを残して死ぬ。",
-                                    "★４．殺人者の名を書き遺したつもりが、最愛の人の名を書いた、と見なされてしまった。",
-                                    "★５．最期の言葉の心得。"
-                        ]
-            },
-            {
-                        "item": "【さいころ】",
-                        "stars": [
-                                    "★１ａ．二つのさいころに六の目を出す。",
-                                    "★１ｂ．三つのさいころに六の目を出す。",
-                                    "★１ｃ．五つのさいころに一の目を出す。",
-                                    "★２．さいころ賭博。",
-                                    "★３．さいころを、わざと壺皿の外へ転がし、しかもそれに気づかないふりをする。",
-                                    "★４．多くのさいころの目の総数。"
-                        ]
-            },
-            {
-                        "item": "【妻妾同居】",
-                        "stars": [
-                                    "★１．夫と妻二人、合計三人が仲良く暮らす。",
-                                    "★２．三人同衾。",
-                                    "★３．妻妾同居して、夫も妻妾も子供も全員死ぬ。",
-                                    "★４．妻妾対立。互いに相手を呪い殺そうとする。"
-                        ]
-            },
-            {
-                        "item": "【最初の人】",
-                        "stars": [
-                                    "★１．最初に見る人・出会う人が深い縁のある人である。",
-                                    "★２．最初に行く人・来る人が、犠牲になって死ぬ。",
-                                    "★３．神の慈悲で、最初に来る人が死なずにすむ。",
-                                    "★４．人間を犠牲にせぬよう、動物を最初に行かせる。",
-                                    "★５．最初の人になろうとして失敗する。"
-                        ]
-            },
-            {
-                        "item": "【最初の物】",
-                        "stars": [
-                                    "★１．最初に手にする物が幸運のきっかけになる。",
-                                    "★２．生まれて最初に出会うもの。"
-                        ]
-            },
-            {
-                        "item": "【裁判】",
-                        "stars": [
-                                    "★１．名裁判。",
-                                    "★２．不可解な裁判・信頼できぬ裁判。",
-                                    "★３．珍判決。",
-                                    "★４．かつて関わりのあった男女の一方が裁く人、他方が被告となって、法廷で再会する。",
-                                    "★５．父親が、知らずに息子を裁く。",
-                                    "★６．友人間の紛争の裁きと、敵どうしの争いの裁き。",
-                                    "★７．陪審員たち。",
-                                    "★８．宇宙連合が、多くの生命を殺戮した地球人類を裁く。",
-                                    "★９．冥界の裁判官たち。"
-                        ]
-            },
-            {
-                        "item": "【財布】",
-                        "stars": [
-                                    "★１．他人の財布を持ったまま、死んでしまう。",
-                                    "★２．財布の中にいくら入っていたか。",
-                                    "★３．三人が拾った一つの財布。"
-                        ]
-            },
-            {
-                        "item": "【催眠術】",
-                        "stars": [
-                                    "★１．女性に催眠術をかけていたずらをする。",
-                                    "★２ａ．催眠術にかからない。",
-                                    "★２ｂ．催眠術にかかったふりをする。",
-                                    "★３．相手を見つめて催眠状態に陥れ、死に追い込む。",
-                                    "★４．催眠攻撃とその撃退。",
-                                    "★５．夢遊病者に暗示をかける。",
-                                    "★６．催眠をほどこして病気を治療する。",
-                                    "★７．催眠状態で長年月眠る。",
-                                    "★８ａ．催眠状態から死にいたる。",
-                                    "★８ｂ．催眠状態が死後も続く。",
-                                    "★９．催眠状態で、ＵＦＯに誘拐された体験を思い出す。"
-                        ]
-            },
-            {
-                        "item": "【坂】",
-                        "stars": [
-                                    "★１．二人の人物が坂で出会う。",
-                                    "★２．坂で怪事に遇う。",
-                                    "★３ａ．坂でころぶと、死を招く。",
-                                    "★３ｂ．坂を登るだけでも、死の危険がある。",
-                                    "★４ａ．海にも坂がある（「さかいめ」・「境界」の意味であるという）。",
-                                    "★４ｂ．この宇宙と隣りの宇宙との境目。",
-                                    "★５．坂道で敵を防ぐ。"
-                        ]
-            },
-            {
-                        "item": "【逆さまの世界】",
-                        "stars": [
-                                    "★１．金銀が嫌われ、いやしめられる世界。",
-                                    "★２．時間が逆転する世界。",
-                                    "★３．昼と夜、覚醒と夢が逆転する世界。",
-                                    "★４．美醜の基準が逆の世界。",
-                                    "★５．親子関係が逆転する世界。",
-                                    "★６．逆さまに見る世界。",
-                                    "★７．動物が人間を支配する世界。",
-                                    "★８．前後さかさまに着せられた衣服。",
-                                    "★９．「水死」とは逆の「水生」。"
-                        ]
-            },
-            {
-                        "item": "【逆立ち】",
-                        "stars": [
-                                    "★１．逆立ちの死体。",
-                                    "★２．逆立ちの刑罰。",
-                                    "★３．上下逆さまに立てた柱。",
-                                    "★４．上下逆さまに立てた屏風。"
-                        ]
-            },
-            {
-                        "item": "【作中人物】",
-                        "stars": [
-                                    "★１ａ．戯曲の登場人物が、「自分たちは作者によって創り出された存在だ」と自覚している。",
-                                    "★１ｂ．小説の登場人物が、「自分たちは作者によって創り出された存在だ」と自覚している。",
-                                    "★１ｃ．マンガの登場人物が、「自分たちは作者によって創り出された存在だ」と自覚している。",
-                                    "★２．舞台上で死んだ作中人物も、劇が終われば元気な姿で観客に挨拶する。",
-                                    "★３ａ．物語を読む少年が、その物語の作中人物になる。",
-                                    "★３ｂ．自分の行動の記録が他者の手で物語として記されたため、物語中の人物になったことを知る。",
-                                    "★４ａ．作中人物が作者に憑依する。",
-                                    "★４ｂ．作中人物が作者のもとから逃げ出す。",
-                                    "★４ｃ．作中人物が作者を叱る。",
-                                    "★５．作中人物と作者を混同する。",
-                                    "★６．作中人物たちが、現実世界を批判する。",
-                                    "★７．作中人物が現実世界に現れたかと思って、ギョッとする。",
-                                    "★８ａ．小説の作中人物（「男」）が、その小説を読んでいる読者（「彼」）をナイフで殺す。",
-                                    "★８ｂ．小説の作中人物（実は実在人物である「わたし」）が、その小説を読んでいる読者（「あなた」）をナイフで殺す。",
-                                    "★９．読者が小説家に、作中人物の死の取り消しを要求する。"
-                        ]
-            },
-            {
-                        "item": "【桜】",
-                        "stars": [
-                                    "★１．人間の祈りによって、桜の花の寿命が延びる。",
-                                    "★２．一月十六日に咲く「十六桜」。",
-                                    "★３．身代わりに死んだ人の形見の桜。",
-                                    "★４．お姫様が首をつった桜。",
-                                    "★５．桜の樹の下の屍体。",
-                                    "★６．桜は人の心を狂わせる。",
-                                    "★７．桜の化身。",
-                                    "★８．花見。",
-                                    "★９．桜の夢。"
-                        ]
-            },
-            {
-                        "item": "【酒】",
-                        "stars": [
-                                    "★１．酒を用いて怪物を倒す。",
-                                    "★２．酒宴の席で敵を倒す。",
-                                    "★３ａ．酒は国を亡ぼす。",
-                                    "★３ｂ．酒は人間を堕落させる。",
-                                    "★３ｃ．酒は情欲をかきたてる。",
-                                    "★３ｄ．酒は、まだ飲まないうちから凶をなす。",
-                                    "★３ｅ．飲酒（おんじゅ）戒を破った報い。",
-                                    "★４．酔っぱらい。",
-                                    "★５．夫に隠れて飲酒した女たち。",
-                                    "★６．酒の上の争い。",
-                                    "★７．酒に酔った勢いで出家する。",
-                                    "★８．大酒飲みの男。どれだけ酒が飲めるか試す。",
-                                    "★９．大酒飲みの南極老人星。",
-                                    "★１０．アルコール依存症。",
-                                    "★１１．千日の酒。",
-                                    "★１２．密造酒。",
-                                    "★１３．酒の起源。",
-                                    "★１４．大きな杯。"
-                        ]
-            },
-            {
-                        "item": "【酒と水】",
-                        "stars": [
-                                    "★１．水が酒に変わる。",
-                                    "★２．酒が水に変わる。",
-                                    "★３．酒に水をまぜて売る。",
-                                    "★４．水に酒をまぜて売る。",
-                                    "★５．「水」といつわって、酒を飲ませる。"
-                        ]
-            },
-            {
-                        "item": "【さすらい】",
-                        "stars": [
-                                    "★１．一箇所にとどまれず、諸方をさすらう人。",
-                                    "★２．神や悪魔の呪いを受けたために、永遠にさすらいを続けねばならない人。",
-                                    "★３．さすらいの旅人が、立ち寄った土地の悪人たちを退治して、去って行く。",
-                                    "★４．さすらいの旅は無益である。"
-                        ]
-            },
-            {
-                        "item": "【さそり】",
-                        "stars": [
-                                    "★１．死んだ蠍（さそり）が、星となって赤く燃える。",
-                                    "★２．釣針が、さそり座の星になる。",
-                                    "★３．さそりを使って人を殺す。",
-                                    "★４．サソリ人間。"
-                        ]
-            },
-            {
-                        "item": "【悟り】",
-                        "stars": [
-                                    "★１ａ．禅の悟りを開く。",
-                                    "★１ｂ．禅僧の言葉から、魔球開発のヒントを得る。",
-                                    "★２．悟りを求める男。",
-                                    "★３．悟りをもたらす毒蕈（きのこ）。",
-                                    "★４．女が自らの本性を悟る。",
-                                    "★５．他人の心を読み取る。",
-                                    "★６．「さとりの化け物」とは逆に、自分の考えていることが、すべて他人に筒抜けになってしまう。",
-                                    "★７．二十世紀の「さとる（さとり）の化物」。",
-                                    "★８．仏陀の悟り。"
-                        ]
-            },
-            {
-                        "item": "【猿】",
-                        "stars": [
-                                    "★１．猿が人間を助け、怪物と闘う。",
-                                    "★２．ずる賢い猿。",
-                                    "★３．猿のたたり。",
-                                    "★４ａ．猿が、網を打とうとして失敗する。",
-                                    "★４ｂ．猿が、男根を亀に噛まれる。",
-                                    "★４ｃ．猿が、陰嚢を木にはさまれる。",
-                                    "★５．猿が人間に転生する。",
-                                    "★６．人間が猿に転生する。",
-                                    "★７．人間が猿化する。",
-                                    "★８．猿は、人間の前段階の存在。",
-                                    "★９．人間は、猿から進化したものではない。",
-                                    "★１０．天女が猿に転生する。"
-                        ]
-            },
-            {
-                        "item": "【猿神退治】",
-                        "stars": [
-                                    "★１ａ．旅人が、村里を苦しめる猿神を追い払い、村里の娘と夫婦になる。",
-                                    "★１ｂ．旅人が猛犬を用いて猿神を打ち倒し、村里の娘と夫婦になる。",
-                                    "★２．二十世紀の猿神退治。"
-                        ]
-            },
-            {
-                        "item": "【猿女房】",
-                        "stars": [
-                                    "★１．猿が人間の女の姿となって、人間の男と夫婦になる。"
-                        ]
-            },
-            {
-                        "item": "【猿婿】",
-                        "stars": [
-                                    "★１．猿と人間の女が夫婦になる〔＊猿は人間の男に変身するわけではなく、猿の姿のままである〕。",
-                                    "★２．人間の魂を持つ雄猿と、普通の雌猿が夫婦になる。"
-                        ]
-            },
-            {
-                        "item": "【三者択一】",
-                        "stars": [
-                                    "★１ａ．三つの人生の中から一つを選ぶ。",
-                                    "★１ｂ．人生の前途に、三つの選択肢しかない。",
-                                    "★１ｃ．三つの世界から一つを選ぶのではなく、三つとも自分のものにする。",
-                                    "★２．三人の女神の中から、もっとも美しい一人を選ぶ。",
-                                    "★３．三つの箱の中から一つを選ぶ。",
-                                    "★４．三人の男の中から、本物を一人見分ける。",
-                                    "★５．三人の女の中から、本物を一人見分ける。",
-                                    "★６ａ．三人の中から、身分高い大名を一人を見分ける。",
-                                    "★６ｂ．大勢の中から、身分高い奥様を一人見分ける。",
-                                    "★７ａ．三つの指輪のうち、どれが本物かわからない。",
-                                    "★７ｂ．三人の子供のうち、誰が自分の子かわからない。"
-                        ]
-            },
-            {
-                        "item": "【山椒魚】",
-                        "stars": [
-                                    "★１．岩屋の中から出られなくなった山椒魚。",
-                                    "★２．山椒魚の体の中に閉じ込められた「ぼく」。",
-                                    "★３．山椒魚を買いに行く。",
-                                    "★４．山椒魚を見れば、疱瘡除けになる。",
-                                    "★５．水界の生物である山椒魚が、陸地を切り崩して人類を圧迫する。"
-                        ]
-            },
-            {
-                        "item": "【残像・残存】",
-                        "stars": [
-                                    "★１．殺人の被害者が最後に見た光景が、網膜や角膜に残像として保存される。",
-                                    "★２．生きている人間の網膜にも、目に見た光景が焼きつけられることがある。",
-                                    "★３．美しい景色を網膜に保存しようと思う。",
-                                    "★４．鏡に映した美人の像が残る。",
-                                    "★５．笑いの残存。",
-                                    "★６．声の残存。",
-                                    "★７．残留思念。"
-                        ]
-            },
-            {
-                        "item": "【三題噺】",
-                        "stars": [
-                                    "★１．客から出された三つの題材を組み合わせて、落語家が即興で噺を作る。「卵酒」「毒消しの護符」「鉄砲」という三つの題から、三遊亭円朝は『鰍沢』の物語を作った〔＊「身延詣り」「遊女」「熊の膏薬」の三題が出された、などの異説もある〕。",
-                                    "★２．「新米の盲乞食」「袴着の祝い」「大仏餅」の題で、円朝が作ったと言われる噺。",
-                                    "★３．「芝浜」「革財布」「酔っ払い」の題で、円朝が作ったと言われる噺。",
-                                    "★４．帰宅までに、三題話を作らねばならない。"
-                        ]
-            },
-            {
-                        "item": "【三度目】",
-                        "stars": [
-                                    "★１．三度目にはじめて成功する、願いが叶うなど、前二回とは異なった状況になる。",
-                                    "★２．同じことがらが三度繰り返され、三度目にそれを受け入れる。",
-                                    "★３．三度目も、一度目・二度目と同様に不運が続く。",
-                                    "★４．一度目はうまく行く。二度目は失敗する。三度目に意外な結末をむかえる。",
-                                    "★５．弟子が師を三度裏切る。",
-                                    "★６．鶏が一羽ずつ、三度も届いたので驚く。",
-                                    "★７．三度目の仏頭。"
-                        ]
-            },
-            {
-                        "item": "【三人兄弟】",
-                        "stars": [
-                                    "★１．三人兄弟の末子が成功する。王になる。",
-                                    "★２．三人兄弟も父親も死ぬ悲劇。",
-                                    "★３．二十世紀の三人兄弟譚。",
-                                    "★４．三つ子の兄弟。",
-                                    "★５．三人の義兄弟。"
-                        ]
-            },
-            {
-                        "item": "【三人姉妹】",
-                        "stars": [
-                                    "★１．三人姉妹の末子が物語の主人公となり活躍する。あるいは末子が幸福になる。",
-                                    "★２．三人姉妹も父親も死ぬ悲劇。",
-                                    "★３．近代劇の三人姉妹。",
-                                    "★４．生者と死者に分かたれた三人姉妹。",
-                                    "★５．アマテラスとスサノヲから生まれた三姉妹。"
-                        ]
-            },
-            {
-                        "item": "【三人の魔女・魔物】",
-                        "stars": [
-                                    "★１．三人の魔女や女神は、一般に姉妹と考えられているが、原典では必ずしも明確に姉妹と記されないものもある。",
-                                    "★２．口裂け女も、三人姉妹だと言われることがある。",
-                                    "★３．三人一組の神や妖怪。"
-                        ]
-            },
-            {
-                        "item": "【三人目】",
-                        "stars": [
-                                    "★１．三人目に出会う人。",
-                                    "★２．三人から嘘を言われると、それを本当と思ってしまう。",
-                                    "★３．三人から「お前は病気だ」と言われると、「自分は病気だ」と思ってしまう。死んでしまうことさえある。"
-                        ]
-            },
-            {
-                        "item": "【死】",
-                        "stars": [
-                                    "★１．死後も意識があるので、自分が死んだことに気づかない。",
-                                    "★２．死と同時に意識がなくなるので、自分が死んだことに気づかない。",
-                                    "★３．死体が自分の死に気づかず、歩き出す。",
-                                    "★４．「お前は自分が死んだのに気づかないのだ」と言われて、「自分はもう死んでいるのかもしれない」と思う。",
-                                    "★５．一日おきに死んで無になる男。",
-                                    "★６．死者の道案内。",
-                                    "★７．死ぬと年をとらない。",
-                                    "★８．自ら望まぬ限り死なない。",
-                                    "★９．生きている人間は本当は死んでいて、死んだ人間が本当は生きているのかもしれない。",
-                                    "★１０．死ぬ時、自分の全人生をふりかえる。",
-                                    "★１１．現世から見た死と、霊界から見た死。"
-                        ]
-            },
-            {
-                        "item": "【死の起源】",
-                        "stars": [
-                                    "★１．人間は蛇のように脱皮できず、死の運命を得た。",
-                                    "★２．石は死なず、人間は死ぬ。",
-                                    "★３．月は蘇（よみがえ）るが、人間は死ぬ。",
-                                    "★４．性交が、人間世界に死をもたらした。",
-                                    "★５．死の必要性。"
-                        ]
-            },
-            {
-                        "item": "【死の知らせ】",
-                        "stars": [
-                                    "★１．離れた所にいる家族や親友の死の知らせ。",
-                                    "★２．差し迫った死の知らせ。",
-                                    "★３．死の誤報による悲劇。",
-                                    "★４．死の誤報による運命のいたずら。",
-                                    "★５．死の誤報を利用し、過去と縁を切って新たな生活を始める二人。"
-                        ]
-            },
-            {
-                        "item": "【死因】",
-                        "stars": [
-                                    "★１．瀕死の人に手を加えて、真の死因を隠す。",
-                                    "★２ａ．自殺を殺人に見せかける。",
-                                    "★２ｂ．殺人を投身自殺に見せかける。",
-                                    "★３ａ．「何者かに殺された」と思われる死体があったが、それは人為的に引き起こされた死ではなく、自然のいたずらによるものだった。",
-                                    "★３ｂ．殺人事件と思われたが、実は、性の戯れのあげくの死であった。",
-                                    "★３ｃ．事故死を「殺人だ」と思い込む。",
-                                    "★４．病死と見えたものが、その裏に配偶者の殺意があった。",
-                                    "★５．病死をよそおった他殺と見せかけて、実は本当の病死。",
-                                    "★６．事故死か自殺かわからない。",
-                                    "★７．死に方によって、死後行く場所が異なる。",
-                                    "★８．老齢や病気による死は、望ましいものではない。"
-                        ]
-            },
-            {
-                        "item": "【塩】",
-                        "stars": [
-                                    "★１．食物の味付けに必要な塩。",
-                                    "★２．塩を運ぶ。",
-                                    "★３．塩で水を清める。",
-                                    "★４．「塩」という言葉を嫌う。",
-                                    "★５ａ．塩を食卓に置かない。",
-                                    "★５ｂ．醢（ししびしお）を食膳に上さない。",
-                                    "★６．塩をまいて怪物を退治する。"
-                        ]
-            },
-            {
-                        "item": "【鹿】",
-                        "stars": [
-                                    "★１．白鹿は神の化身。",
-                                    "★２．白鹿と思ったら白い石だった。",
-                                    "★３．鹿の死体を隠しておいたら、横取りされた。",
-                                    "★４．銭を隠しておいたら、鹿の死体に変わっていた。",
-                                    "★５ａ．鹿を「馬」と言う。",
-                                    "★５ｂ．鹿を「犬」と言う。",
-                                    "★６．鹿の内臓には、解毒作用がある。",
-                                    "★７．子鹿の成長物語。",
-                                    "★８．鹿が星になる。"
-                        ]
-            },
-            {
-                        "item": "【仕返し】",
-                        "stars": [
-                                    "★１．相手から受けた仕打ちと同様のことをやり返す。",
-                                    "★２．相手から批判された言葉をそのまま投げ返す。",
-                                    "★３．通常とは異なる仕返しのやり方。",
-                                    "★４．女にふられた男が恨みを抱き、その女が他の男との間にもうけた子供に、仕返しをする。"
-                        ]
-            },
-            {
-                        "item": "【時間】",
-                        "stars": [
-                                    "★１．時間の経過が、意識内では実際よりもはるかに短く感じられる。",
-                                    "★２．短時間なのに、意識内では実際の十倍以上の長時間を経験する。",
-                                    "★３ａ．二重の時間。現世にありながら、ある人物が二十年ほど歳をとる間に、その人物をとりまく環境は三百年以上経過する。",
-                                    "★３ｂ．二重の時間。十年後が翌日のようでもある。",
-                                    "★４．時間を自由自在に操作して、長くも短くも感じさせる。",
-                                    "★５．音楽を演奏し始めると、時間が変化する。",
-                                    "★６．時間を貯蓄する。",
-                                    "★７．夜なのに明るくして時間をごまかす。"
-                        ]
-            },
-            {
-                        "item": "【時間が止まる】",
-                        "stars": [
-                                    "★１．時間を止める。",
-                                    "★２．超高速で思考・行動したために、時間が止まったように見える。",
-                                    "★３．時間が止まった世界。",
-                                    "★４．心の中の時間が止まる。",
-                                    "★５．無意識の底は、無時間の世界である。"
-                        ]
-            },
-            {
-                        "item": "【時間旅行】",
-                        "stars": [
-                                    "★１ａ．未来へ旅行する。",
-                                    "★１ｂ．近未来へのタイム・リープ。",
-                                    "★２ａ．タイム・スリップして、過去の世界へ行く。",
-                                    "★２ｂ．自ら願って、過去の世界へ移り住む。",
-                                    "★２ｃ．過去の世界へ時間旅行する夢。",
-                                    "★２ｄ．現在から過去の世界へ行くのではなく、過去の世界が現在へ引き寄せられる。",
-                                    "★３ａ．過去を変えるために、未来からやって来る。",
-                                    "★３ｂ．変わりそうな過去を、変わらないように元に戻す。",
-                                    "★３ｃ．一匹の蝶の死という些細な出来事が、その後の歴史を大きく変える。",
-                                    "★３ｄ．過去に干渉しても、歴史が変わらない場合がある。",
-                                    "★４．組織的に過去を改造する。",
-                                    "★５．痙攣（けいれん）的時間旅行者。"
-                        ]
-            },
-            {
-                        "item": "【死期】",
-                        "stars": [
-                                    "★１ａ．自分の死期を前もって知り、予告する。",
-                                    "★１ｂ．自分の死期を予言するが、その一日前に死ぬ。",
-                                    "★２ａ．釈迦如来入滅の日である二月十五日に死にたい、と願う。",
-                                    "★２ｂ．聖徳太子薨去の日である二月五日に死ぬだろう、と予言する。",
-                                    "★３ａ．死ぬ日を予告し、人々を集めて別れの挨拶をする。",
-                                    "★３ｂ．死の当日、師僧のもとを訪れ、挨拶して死ぬ。",
-                                    "★４ａ．自分の死期を、死神や神霊などから知らされる。",
-                                    "★４ｂ．自分の往生の時期を、仏菩薩から知らされる。",
-                                    "★５．他人の死期を知り、それにあわせて行動する。",
-                                    "★６．死期を知らせる石塔。"
-                        ]
-            },
-            {
-                        "item": "【四季の部屋】",
-                        "stars": [
-                                    "★１ａ．東に春、南に夏、西に秋、北に冬の景色。",
-                                    "★１ｂ．東南が春、東北が夏、西南が秋、西北が冬の町。",
-                                    "★１ｃ．四季のカンヅメ。",
-                                    "★２．一年十二ヵ月の部屋。",
-                                    "★３．見ることを禁じられた、四季の部屋・十二ヵ月の部屋。"
-                        ]
-            },
-            {
-                        "item": "【識別力】",
-                        "stars": [
-                                    "★１ａ．嗅覚。人体や事物から発する微かなにおい。",
-                                    "★１ｂ．嗅覚。遠方の火事のにおい。",
-                                    "★２．触覚。",
-                                    "★３．聴覚。",
-                                    "★４ａ．味覚。",
-                                    "★４ｂ．聞き酒。",
-                                    "★５ａ．視覚。わずかな差異を見分ける。",
-                                    "★５ｂ．一目見るだけで、多くの物の数がわかる。",
-                                    "★５ｃ．分子を見分ける。",
-                                    "★６．五官によらぬ識別。",
-                                    "★７．一切を識別しない。達人の一つの姿。"
-                        ]
-            },
-            {
-                        "item": "【地獄】",
-                        "stars": [
-                                    "★１ａ．地獄で繰り返し責め苦を受ける。",
-                                    "★１ｂ．西欧世界の地獄でも同様に、繰り返しの責め苦がある。",
-                                    "★２．地獄の責め苦から救われる。",
-                                    "★３．地獄はどこにあるのか。",
-                                    "★４ａ．現世の境界がそのまま地獄。",
-                                    "★４ｂ．現世に地獄を造る。",
-                                    "★５．亡者が地獄へ来てくれない。",
-                                    "★６．地獄絵を描いた後に死ぬ。",
-                                    "★７．殺人者は当然、死後に地獄へ堕ちる。",
-                                    "★８．地獄で魂が受けている罰が、現世の肉体に病気としてあらわれる。",
-                                    "★９．人間が地獄の鬼に責められるのではなく、人間自身が怪奇で醜悪な凶霊と化して互いに傷つけ合う、という物語もある。"
-                        ]
-            },
-            {
-                        "item": "【自己視】",
-                        "stars": [
-                                    "★１ａ．自己像を見る。",
-                                    "★１ｂ．老いた自己の姿を見る。",
-                                    "★１ｃ．若かった頃の自己の姿を見る。",
-                                    "★１ｄ．未来の自分の姿を夢で見る。",
-                                    "★２ａ．自分の死体を見る。",
-                                    "★２ｂ．自分の死体を見て、その中に入ろうとするが、なかなか入れない。",
-                                    "★３．成長し変身した魂が、ぬけがらとなった自分の身体を見る。",
-                                    "★４ａ．死に近づいた人が、屋根の上から自分の姿を見下ろす。",
-                                    "★４ｂ．死んだ人が、屋根の上から市中の人々を見下ろす。",
-                                    "★４ｃ．上から自分の姿を見下ろしても、まったく無事であったということもある。",
-                                    "★５．「自分の姿を見た」と思い込み、死が近いことを覚悟する。"
-                        ]
-            },
-            {
-                        "item": "【自己との対話】",
-                        "stars": [
-                                    "★１ａ．現在の自分と未来の自分の対話。",
-                                    "★１ｂ．現在の自分と未来の自分の対面。",
-                                    "★２．現在の自分と過去の自分の対話。",
-                                    "★３．現在の自分と過去の自分の殴り合い。",
-                                    "★４．死を前にした自分自身との対話。",
-                                    "★５．自分の心が生み出した幻覚との対話。",
-                                    "★６．体外の魂との対話。"
-                        ]
-            },
-            {
-                        "item": "【自殺願望】",
-                        "stars": [
-                                    "★１ａ．自殺を手伝ってくれる人を捜す。",
-                                    "★１ｂ．他人の手を借りて自殺する。",
-                                    "★２．毎日自殺しようとしては、思いとどまる。",
-                                    "★３．繰り返し自殺を試みる男が、悟りの境地に達する。",
-                                    "★４．自殺願望の少年が、重病の少女に出会う。",
-                                    "★５．自殺志願者と間違えられる。",
-                                    "★６．自殺者の霊。"
-                        ]
-            },
-            {
-                        "item": "【自傷行為】",
-                        "stars": [
-                                    "★１．兵役を逃れるために、自らの身体を傷つける。",
-                                    "★２．殺人犯が、自分も被害者であるように見せかけるため、死なない程度に自らの身体を傷つけたり、毒を飲んだりする。",
-                                    "★３．死なない程度に自らの身体を傷つけるつもりが、手元が狂って死んでしまう。",
-                                    "★４．死なない程度の毒を飲むつもりが、飲みすぎて死んでしまう。",
-                                    "★５．当たり屋。走っている自動車にわざと接触して、軽い怪我をする。「示談にしよう」と持ちかけ、自動車の運転者から金を得る。",
-                                    "★６．貴族社会から逃れて法師になるために、身体を醜く傷つけようと思う。",
-                                    "★７．悪人が乱心し、自分の身体を刀で切り刻む。",
-                                    "★８．悪霊にとりつかれた人が、自分の身体を歯で噛みちぎる。",
-                                    "★９．治世の期間を終えた王が、自分の鼻・耳・唇などをナイフで切り落とす。"
-                        ]
-            },
-            {
-                        "item": "【自縄自縛】",
-                        "stars": [
-                                    "★１．自分の作った縄で自分が縛られる。",
-                                    "★２ａ．知らずして、自分自身に死の宣告をする。",
-                                    "★２ｂ．自分の受けるべき罰を自分で決める。",
-                                    "★２ｃ．自分の作った法律で自分自身や家族が裁かれる。",
-                                    "★３．自らの用意した殺人具にかかって死ぬ。"
-                        ]
-            },
-            {
-                        "item": "【地震】",
-                        "stars": [
-                                    "★１．大地震。",
-                                    "★２ａ．吉事・奇瑞としての地震。",
-                                    "★２ｂ．次の例も、吉事・奇瑞の地震と見て良いであろう。",
-                                    "★３．誕生・臨終時の地震。",
-                                    "★４．地震の原因。",
-                                    "★５．地震の恐怖。",
-                                    "★６ａ．さしせまった地震の予知。",
-                                    "★６ｂ．翌日の地震の夢告。",
-                                    "★６ｃ．三日後の地震の予言。",
-                                    "★７．地震を防ぐ重石（おもし）。",
-                                    "★８ａ．「地震だ」と思ったら、動物の背中に上陸していたのだった。",
-                                    "★８ｂ．「地震だ」と思ったら、動物の上に寝ていたのだった。"
-                        ]
-            },
-            {
-                        "item": "【紙銭】",
-                        "stars": [
-                                    "★１．紙銭（しせん。紙を銭の形に切って金銀の箔を貼ったもの）を火で焼くと、冥府の役人や亡者たちが受け取って使うことができる。",
-                                    "★２．紙の質が悪いと、銭として使えない。",
-                                    "★３ａ．紙を着物の形に切って焼き、冥界の着物とする。",
-                                    "★３ｂ．紙の旗や木刀を焼く。",
-                                    "★４．亡父からもらった銭が、後に紙銭に変じた。",
-                                    "★５．紙銭でなく、本物の硬貨を持って冥府へ行く場合もある。"
-                        ]
-            },
-            {
-                        "item": "【死相】",
-                        "stars": [
-                                    "★１．死相を見て、死を予言する。",
-                                    "★２．死相を見て、そのとおりに死を現実化させる。",
-                                    "★３．面に死相があらわれる。",
-                                    "★４．死相が消える。"
-                        ]
-            },
-            {
-                        "item": "【地蔵】",
-                        "stars": [
-                                    "★１ａ．地蔵が小僧の姿で現れ、人を助ける。",
-                                    "★１ｂ．地蔵が小僧の姿で冥府に現れ、死者を蘇生させる。",
-                                    "★２．地蔵が女に化けて、人をだます。",
-                                    "★３．地蔵像にささった矢。",
-                                    "★４．地蔵像に与えられた米と銭。",
-                                    "★５．閻魔と地蔵は同一存在である。",
-                                    "★６．安産させてくれる地蔵。",
-                                    "★７．石地蔵を動かす。"
-                        ]
-            },
-            {
-                        "item": "【舌】",
-                        "stars": [
-                                    "★１．人の死後、舌だけが生前のままの状態で残る。",
-                                    "★２．獣や龍の舌を切り取って持ち、自分がその獣や龍を退治した証拠とする。",
-                                    "★３．人間の舌を切り取って、しゃべれなくする。",
-                                    "★４．雀の舌を切る。",
-                                    "★５ａ．他人の舌を噛み切る。",
-                                    "★５ｂ．自分の舌を噛み切る。",
-                                    "★６ａ．地獄で舌を抜かれる。",
-                                    "★６ｂ．舌のない状態で生まれる。",
-                                    "★７．広長舌。仏の三十二相の一つ。長広舌に同じ。"
-                        ]
-            },
-            {
-                        "item": "【死体】",
-                        "stars": [
-                                    "★１ａ．死体が黄金など価値あるものに変化する。",
-                                    "★１ｂ．死体が黄金に変り、また死体にもどる。",
-                                    "★１ｃ．死体から黄金を取り出す。",
-                                    "★１ｄ．死体から金歯などを取る。",
-                                    "★２ａ．死体を見に行く。",
-                                    "★２ｂ．死者に逢いに行く。",
-                                    "★３．死体を損壊・陵辱する。",
-                                    "★４．死体をきちんと葬らないと、死者の霊は鎮まらない。",
-                                    "★５ａ．放置された死体を供養・埋葬する。後に死体がその恩を返す。",
-                                    "★５ｂ．水死体を弔（とむら）って、福運を授かる。",
-                                    "★６．天人が自らの前世の死体を供養する。",
-                                    "★７．管理された死体。",
-                                    "★８．身代わりの死体。",
-                                    "★９．死体と一緒に暮らす人。",
-                                    "★１０．死体との交わり。"
-                        ]
-            },
-            {
-                        "item": "【死体から食物】",
-                        "stars": [
-                                    "★１．神の死体から食物が生ずる。",
-                                    "★２．動物の死体から食物が生ずる。",
-                                    "★３．人の死体からたばこが生ずる。"
-                        ]
-            },
-            {
-                        "item": "【死体消失】",
-                        "stars": [
-                                    "★１．葬ったはずの死体が、墓や棺の中から消える。",
-                                    "★２ａ．死体が消え、代わりに花があった。",
-                                    "★２ｂ．白鳥が飛び立ち、死体が消えていた。",
-                                    "★３．死体が塵と化して消え失せる。",
-                                    "★４．月世界の住人は、死体を残さない。",
-                                    "★５．死に近づいた人が姿を消す、行方知れずになるなどして、死体を残さない。",
-                                    "★６．死体が確認できなければ、どこかで生きているかもしれない。",
-                                    "★７．たとえ埋葬された死体があっても、それが当人のものだという証拠はない。"
-                        ]
-            },
-            {
-                        "item": "【死体処理】",
-                        "stars": [
-                                    "★１．一つの死体を見た複数の人間が、それぞれ自分が殺したと思いこんで、死体の処理に苦慮する。",
-                                    "★２．複数の死体を一つだと思って処理する一人の男。",
-                                    "★３．一つの死体を処理する一人の人間。",
-                                    "★４．殺人犯が、自分が殺した人間以外の死体も処理せねばならなくなる。"
-                        ]
-            },
-            {
-                        "item": "【死体変相】",
-                        "stars": [
-                                    "★１．死体が腐敗し、その相（すがた）がしだいに変わっていく。",
-                                    "★２ａ．死体の変わり行く過程を見る。不浄観。",
-                                    "★２ｂ．死体変相の過程を絵巻物にする。",
-                                    "★３ａ．聖者の死体は腐敗しない。",
-                                    "★３ｂ．聖者の死体でも腐敗することがある。",
-                                    "★３ｃ．特別な役割を持つ死体なので、腐敗しない。",
-                                    "★４ａ．人間に化けた狐が、死体となってから正体をあらわす。",
-                                    "★４ｂ．人間に化けた狸が、死体となってから正体をあらわす。",
-                                    "★４ｃ．人間に化けた猫が、死体となってから正体をあらわす。",
-                                    "★４ｄ．透明人間が、死体となってから姿をあらわす。"
-                        ]
-            },
-            {
-                        "item": "【七人・七匹】",
-                        "stars": [
-                                    "★１．七人の英雄。",
-                                    "★２．七人の小人。",
-                                    "★３．七人の天使・妖精・霊。",
-                                    "★４．七人の兄弟姉妹。",
-                                    "★５．六人の兄と一人の妹。"
-                        ]
-            },
-            {
-                        "item": "【歯痛】",
-                        "stars": [
-                                    "★１．虫が歯を食うので、歯が痛くなる。",
-                                    "★２．歯の痛みを、黒くて固い石や、白くてやわらかい豆腐に移して、身体から離す。",
-                                    "★３．歯痛が治ったら、梨を川や海へ流す。",
-                                    "★４．歯が痛い時に梨を流す、ということもある。"
-                        ]
-            },
-            {
-                        "item": "【自転車】",
-                        "stars": [
-                                    "★１．仕事に必要な自転車を盗まれる。",
-                                    "★２．女性の自転車乗り。",
-                                    "★３．夏目漱石はロンドン留学中に、自転車に乗る稽古をした。",
-                                    "★４．志賀直哉の少年時代、自転車はたいへん高価だった。",
-                                    "★５．自転車を後ろから引っぱる。",
-                                    "★６．自転車の曲乗り。",
-                                    "★７．空飛ぶ自転車。"
-                        ]
-            },
-            {
-                        "item": "【死神】",
-                        "stars": [
-                                    "★１ａ．現世の人間のもとを訪れ、冥府まで連れて行く。日本固有の死神の物語はなかなか確認できない。",
-                                    "★１ｂ．歌舞伎作品の中には、死神が現れるものがある。",
-                                    "★１ｃ．死神が、人に死期を告知するとともに、その人の本性を教える。",
-                                    "★２．冥府の使いの鬼なども死神の一種であろうが、人間から饗応を受けたために、その人間を放免してしまうことが多い。",
-                                    "★３．死神を避けて遠方へ逃げる。",
-                                    "★４．死神のような男。",
-                                    "★５ａ．人を死の世界に誘う黒い影。",
-                                    "★５ｂ．病気の子供を死の世界に誘うかのごとく現れる少年。",
-                                    "★５ｃ．部屋の四隅に座る死神。",
-                                    "★６．死神と思ったら、愛の神だった。",
-                                    "★７．「死神」といっても、特定の魔物が存在するわけではない。",
-                                    "★８．お迎えがやって来るが、出発は、すぐでなくても良い。"
-                        ]
-            },
-            {
-                        "item": "【芝居】",
-                        "stars": [
-                                    "★１．芝居を現実と混同する。",
-                                    "★２．現実を芝居と錯覚する。",
-                                    "★３．現実の殺人事件を芝居の形で再現し、犯人に見せる。",
-                                    "★４．戯曲の筋書きを現実化し、その後に、戯曲を舞台で上演する。",
-                                    "★５ａ．学生の素人芝居。",
-                                    "★５ｂ．素人芝居を利用して、人を殺す。",
-                                    "★６．芝居の作中人物のみならず、作者や観客たちも登場する芝居。"
-                        ]
-            },
-            {
-                        "item": "【紙幣】",
-                        "stars": [
-                                    "★１ａ．紙幣のナンバーが記録されており、盗んだ金だとわかってしまう。",
-                                    "★１ｂ．同じナンバーの多数の紙幣。",
-                                    "★２．紙幣に目印がある。",
-                                    "★３．正規の通貨ではない特殊な紙幣。",
-                                    "★４．紙幣の束を燃やす。",
-                                    "★５．高額紙幣を小額紙幣とすりかえる。"
-                        ]
-            },
-            {
-                        "item": "【島】",
-                        "stars": [
-                                    "★１ａ．孤島での生活。",
-                                    "★１ｂ．孤島の少年たち。",
-                                    "★２．陸の孤島の少年たち。",
-                                    "★３．死者の行く島、死者のいる島。",
-                                    "★４．空飛ぶ島。",
-                                    "★５．別世界の楽園。理想郷。",
-                                    "★６ａ．怪物が住む島。",
-                                    "★６ｂ．恐竜が住む島。",
-                                    "★６ｃ．怪人が住む島。",
-                                    "★７．島の名前。"
-                        ]
-            },
-            {
-                        "item": "【姉妹】",
-                        "stars": [
-                                    "★１．容貌が大きく異なる姉妹。",
-                                    "★２．性質・性格が大きく異なる姉妹。"
-                        ]
-            },
-            {
-                        "item": "【姉妹と一人の男】",
-                        "stars": [
-                                    "★１．姉と妹が、同じ一人の男と関わりを持つ。",
-                                    "★２．姉妹の一方が、他方の幸福を思って身を引く。",
-                                    "★３．姉妹が、不和の原因である男を殺す。"
-                        ]
-            },
-            {
-                        "item": "【姉妹と二人の男】",
-                        "stars": [
-                                    "★１．姉妹と二人の男の関わり。"
-                        ]
-            },
-            {
-                        "item": "【死夢】",
-                        "stars": [
-                                    "★１．自らの死を予示する不吉な夢を見る。",
-                                    "★２．家族や友人の死を予示する不吉な夢を見る。",
-                                    "★３．友人や知人の死を知らせる夢を見る。",
-                                    "★４．恩人や友人が夢に現れて、別れを告げる。",
-                                    "★５．親友どうしが生前に、「先に死んだ者が、死後の世界のありさまを相手に知らせよう」と約束しておく。",
-                                    "★６．死後またこの世に転生する運命の人が、転生後の人生で体験することを、前もって夢に見る。",
-                                    "★７．自分が死んだ夢を見る。"
-                        ]
-            },
-            {
-                        "item": "【指紋】",
-                        "stars": [
-                                    "★１．指紋をもとに、殺人犯をつきとめる。",
-                                    "★２．指紋を偽造して、無実の人を殺人犯に仕立て上げる。",
-                                    "★３．指紋を隠すために、自分の指や手首を切断する。",
-                                    "★４．番号社会でも、最終的には指紋が頼りになる。"
-                        ]
-            },
-            {
-                        "item": "【弱点】",
-                        "stars": [
-                                    "★１．超人や怪物などにも、苦手なもの・恐ろしいものがある。",
-                                    "★２．身体の一ヵ所に残る弱点。",
-                                    "★３．身体の一ヵ所にある、触れてはならない部分（これも、ただ一ヵ所の弱点・急所の一種であろう）。"
-                        ]
-            },
-            {
-                        "item": "【写真】",
-                        "stars": [
-                                    "★１．男が女を恨み、女の写真を傷つける。",
-                                    "★２．旧知の人の写真を見て、その所在を知る。",
-                                    "★３．愛する人の写真。",
-                                    "★４．恋人と並んで映っている写真を二つに切って、恋人の写真と自分の写真を別々にする。",
-                                    "★５．不倫の証拠写真。",
-                                    "★６．見えぬ目で見る写真。",
-                                    "★７．観光地などで、「写真を撮って下さい」と頼まれる。",
-                                    "★８．「写真を見てくれ」と言われたが、それは鏡だった。",
-                                    "★９．フィルムのすりかえ。"
-                        ]
-            },
-            {
-                        "item": "【写真と生死】",
-                        "stars": [
-                                    "★１．瀕死の人の写真をとると、生命力を与えることができる。",
-                                    "★２．写真を撮影すると、被写体の人物が急死する。",
-                                    "★３．三人で写真をとると、真ん中の人が早死にする。",
-                                    "★４．写真に撮られる＝魂を抜かれる。"
-                        ]
-            },
-            {
-                        "item": "【シャム双生児】",
-                        "stars": [
-                                    "★１．胴体部分が癒着した双子。",
-                                    "★２ａ．シャム双生児の分離手術には、危険がともなう。",
-                                    "★２ｂ．シャム双生児が切り離され、一方が死ぬ。",
-                                    "★２ｃ．シャム双生児の男女が二人に分かれ、結婚する。",
-                                    "★３ａ．兄妹婚をした男女が、シャム双生児に生まれ変わる。",
-                                    "★３ｂ．人工的にシャム双生児を造る。",
-                                    "★４．シャム双生児のような姿になることを望む。",
-                                    "★５．胴体部分が癒着した三つ子。"
-                        ]
-            },
-            {
-                        "item": "【銃】",
-                        "stars": [
-                                    "★１．名銃を巡る争い。",
-                                    "★２．射撃の名手。",
-                                    "★３．自分を射撃の名手だと思いこむ男。",
-                                    "★４．遠方からの狙撃。",
-                                    "★５．銃の暴発。",
-                                    "★６．盗まれた銃。",
-                                    "★７．銃を持つふりをする。",
-                                    "★８．汗をかく銃。"
-                        ]
-            },
-            {
-                        "item": "【周回】",
-                        "stars": [
-                                    "★１．男と女が、木や柱の周りをまわって結婚する。",
-                                    "★２．一人の人間が、木の周りを一周して男と女になる。",
-                                    "★３．虎たちが、木の周りをグルグルまわる。",
-                                    "★４．杭につながれた状態で、グルグルまわる。",
-                                    "★５．町のまわりを回る。",
-                                    "★６ａ．塔のまわりを百周する。",
-                                    "★６ｂ．仏のまわりを一周する。",
-                                    "★７．世界を一周する。",
-                                    "★８．北極星のまわりを、星々が回る。"
-                        ]
-            },
-            {
-                        "item": "【十五歳】",
-                        "stars": [
-                                    "★１．十五歳の娘が、死の眠りにおちいる。",
-                                    "★２．十五歳の娘が、はじめての恋をする。",
-                                    "★３．十五歳の娘が、発心して寺に入る。"
-                        ]
-            },
-            {
-                        "item": "【十三歳】",
-                        "stars": [
-                                    "★１．十三歳の少女が、旅に出る、男と出会う、死に直面するなど、人生の転機をむかえる。",
-                                    "★２．十三歳の少女とは結婚できない。",
-                                    "★３．十三歳の少年が女と出会う。",
-                                    "★４．十三歳の少年たちが大人を殺す。"
-                        ]
-            },
-            {
-                        "item": "【十字架】",
-                        "stars": [
-                                    "★１．イエス・キリストをつるした十字架。",
-                                    "★２ａ．十字架の力。",
-                                    "★２ｂ．十字の切り傷。",
-                                    "★３．聖者の口から十字架が出る。",
-                                    "★４．空に浮かぶ十字架。",
-                                    "★５．十字架の交換。",
-                                    "★６．十字架にかけて誓う。",
-                                    "★７．墓標としての十字架。",
-                                    "★８．南十字星を、南方で戦死した兵たちの墓標と見なす。"
-                        ]
-            },
-            {
-                        "item": "【醜女】",
-                        "stars": [
-                                    "★１．醜貌の女。",
-                                    "★２．醜貌ゆえ帰される花嫁。",
-                                    "★３．醜貌だが財産を持つ花嫁。",
-                                    "★４．醜女が仏に祈って美女となる。",
-                                    "★５．美女の顔が醜く変わる。",
-                                    "★６．一人の男を巡る四人の女の顔半面が、病気・火傷・怪我などで醜く変貌する。",
-                                    "★７．性格ブス。"
-                        ]
-            },
-            {
-                        "item": "【醜貌】",
-                        "stars": [
-                                    "★１．醜貌の神。",
-                                    "★２．醜貌の男。"
-                        ]
-            },
-            {
-                        "item": "【手術】",
-                        "stars": [
-                                    "★１．脳を手術して、知能を高める。",
-                                    "★２ａ．ロボトミー手術。精神病患者の前頭葉白質を切除して、人格を変えてしまう。",
-                                    "★２ｂ．想像力除去手術。",
-                                    "★３ａ．手術の麻酔による譫言（うわごと）。",
-                                    "★３ｂ．麻酔なしで手術する。",
-                                    "★４．自分の身体を手術する。",
-                                    "★５．手術の失敗。",
-                                    "★６．手術不能。",
-                                    "★７．生体実験手術。"
-                        ]
-            },
-            {
-                        "item": "【入水】",
-                        "stars": [
-                                    "★１．複数の男から求婚された女が、入水して死ぬ。",
-                                    "★２．夫や兄が討死したり捕らわれたりしたため、その妻や妹が入水して死ぬ。",
-                                    "★３．入水する女が、救助されてしまうこともある。",
-                                    "★４．海の神への捧げ物として、女が入水する。",
-                                    "★５．夫や子と別れた女が入水する。",
-                                    "★６．政治的な理由による入水。",
-                                    "★７．入水往生。",
-                                    "★８．全国民の、あるいは全人類の集団入水。",
-                                    "★９．バケツの水で、入水自殺を試みる。"
-                        ]
-            },
-            {
-                        "item": "【出産】",
-                        "stars": [
-                                    "★１．石を産む。",
-                                    "★２．河童を産む。",
-                                    "★３．玉を産む。",
-                                    "★４．卵を産む。",
-                                    "★５．手を産む。",
-                                    "★６．肉塊を産む。",
-                                    "★７．水を産む。",
-                                    "★８．蓮花を産む。",
-                                    "★９．国土を産む。",
-                                    "★１０．アダムとイヴ（エヴァ）の物語を、イザナキ・イザナミ神話の訛伝と見なす。",
-                                    "★１１．山中で出産する。",
-                                    "★１２．自ら望んで私生児を産む。",
-                                    "★１３．死体が出産する。",
-                                    "★１４．男女の産み分け。"
-                        ]
-            },
-            {
-                        "item": "【出生】",
-                        "stars": [
-                                    "★１ａ．出生を隠す。",
-                                    "★１ｂ．出生をいつわり、他人になりすます。",
-                                    "★１ｃ．生まれ年をいつわる。",
-                                    "★２ａ．真の父母が別にいることを知らされる。",
-                                    "★２ｂ．真の父が別にいることを知らされる。",
-                                    "★２ｃ．祖父と母の間に生まれた子供。",
-                                    "★２ｄ．祖父と母の間の子供か、と疑われたが、父と母の間の子であった。",
-                                    "★２ｅ．真の母が別にいることを知らされる。",
-                                    "★３．身分ある人の子であることがわかる。",
-                                    "★４．みにくいアヒルの子が、美しい白鳥の子だったことがわかる。",
-                                    "★５ａ．身分高い人の子として育てられたが、実はそうではなかったことがわかる。",
-                                    "★５ｂ．母親の身分が低かったことを知らされる。",
-                                    "★６．最高権力者の出生の秘密。"
-                        ]
-            },
-            {
-                        "item": "【呪的逃走】",
-                        "stars": [
-                                    "★１．ものを投げて逃げる。投げたものがいろいろに変化して、追っ手の追跡を妨げる。",
-                                    "★２．神の助け・天の助けを得て逃げる。",
-                                    "★３．大集団の呪的逃走。"
-                        ]
-            },
-            {
-                        "item": "【寿命】",
-                        "stars": [
-                                    "★１．寿命は生まれた時に決まっている。",
-                                    "★２ａ．死すべきはずの人の寿命が延びる。",
-                                    "★２ｂ．来世で授かる寿命のうちの何年かを借りて、現世の寿命を延ばす。",
-                                    "★３ａ．夫が寿命の半分を妻に与える。",
-                                    "★３ｂ．自分の寿命を十年縮めて、他人の命乞いをする。",
-                                    "★３ｃ．釈尊は寿命を二十年縮めた。",
-                                    "★４．動物の寿命を譲り受けて寿命を延ばす。",
-                                    "★５．あまりに恵まれた人は、長生きできない。",
-                                    "★６．長寿の時代、短命の時代。"
-                        ]
-            },
-            {
-                        "item": "【呪文】",
-                        "stars": [
-                                    "★１．死者を復活させる呪文。",
-                                    "★２．入り口を開く呪文と、その忘却。",
-                                    "★３．間違った呪文でも、信じて唱えれば効果がある。",
-                                    "★４．危難を逃れ、命を救う呪文。",
-                                    "★５．蛇よけの呪文。"
-                        ]
-            },
-            {
-                        "item": "【順送り】",
-                        "stars": [
-                                    "★１．老親が息子に捨てられ、息子は孫に捨てられる。",
-                                    "★２．老親を死に追いやった男が、「やがて自分も、娘によって殺されるのではないか」と心配する。",
-                                    "★３．旧世代は新世代に追われ、新世代は新々世代に追われる。",
-                                    "★４．組織のトップの座が空くと、下の者が一段ずつ順々に昇進して行く。"
-                        ]
-            },
-            {
-                        "item": "【殉死】",
-                        "stars": [
-                                    "★１ａ．明治天皇の死と乃木大将の殉死。",
-                                    "★１ｂ．天皇や王のあとを追って、多くの人々が殉死する。あるいは殉死させられる。",
-                                    "★１ｃ．王のあとを追って多数の人や動物が殉死し、皆天国へ到る。",
-                                    "★２．インディアンの首長が死ぬと、黒人奴隷が一人殉死させられる。",
-                                    "★３．主人の死後、従者と馬を殉死させる。",
-                                    "★４．妻への殉死。夫への殉死。",
-                                    "★５．殉死を許可されなかった人。",
-                                    "★６．殉教。キリスト教の信仰をつらぬいて命を捨てる。"
-                        ]
-            },
-            {
-                        "item": "【乗客】",
-                        "stars": [
-                                    "★１．汽車に乗り合わせた男から、物語を聞く。",
-                                    "★２．汽車に乗り合わせた娘を見る。",
-                                    "★３．汽車に乗り合わせた人妻と話をする。",
-                                    "★４．死者と生者が同じ汽車に乗る。",
-                                    "★５．乗客たちの命が、危険にさらされる。",
-                                    "★６．乗客の一人を犠牲にする。",
-                                    "★７ａ．消えた乗客。",
-                                    "★７ｂ．消えるヒッチハイカー。",
-                                    "★７ｃ．消された乗客。",
-                                    "★８．長距離列車に乗り合わせた人々の人生模様。",
-                                    "★９ａ．無賃乗船。",
-                                    "★９ｂ．無賃乗車。"
-                        ]
-            },
-            {
-                        "item": "【肖像画】",
-                        "stars": [
-                                    "★１ａ．男が、美女の肖像画を見て恋する。",
-                                    "★１ｂ．青年が美女の肖像画に恋するが、彼女はすでにこの世の人ではなかった。",
-                                    "★２．美女がよりいっそう美しく絵に描かれる物語と、美女なのに醜く描かれる物語。",
-                                    "★３ａ．肖像画の完成と同時に、そのモデルが死ぬ。",
-                                    "★３ｂ．肖像画に描かれたモデルが、三年ほどして死ぬ。",
-                                    "★３ｃ．肖像画を描かれる＝魂を抜かれる。",
-                                    "★３ｄ．肖像画を描いた人物が死ぬ。",
-                                    "★４ａ．モデルは中年になったが、肖像画は若い顔のまま。",
-                                    "★４ｂ．モデルは若い顔のままで、肖像画が老いてゆく。",
-                                    "★５．肖像画を傷つけると、モデルが病気になる。",
-                                    "★６．男の肖像画を見て、そのモデルの妻になろうと考える。",
-                                    "★７．夢で見た人の肖像画を描く。",
-                                    "★８．怪物の肖像画を見て、本物だと思う。"
-                        ]
-            },
-            {
-                        "item": "【昇天】",
-                        "stars": [
-                                    "★１．人間が、仙人となって昇天する。",
-                                    "★２．狐が龍となって昇天する。",
-                                    "★３．神の国（あるいは死の世界）へ引き上げられる",
-                                    "★４．月世界へ昇天する。",
-                                    "★５．宇宙空間へ昇り、また地上へ帰還する"
-                        ]
-            },
-            {
-                        "item": "【娼婦】",
-                        "stars": [
-                                    "★１．娼婦を愛する。",
-                                    "★２．娼婦と結婚する。",
-                                    "★３ａ．終戦直後の娼婦たち。",
-                                    "★３ｂ．兵士たちを客にとる慰安婦。",
-                                    "★４．貴族に変装して娼婦に逢う。",
-                                    "★５．老いた娼婦と、若い美青年。",
-                                    "★６．娼婦と僧。",
-                                    "★７．娼婦との結婚を批判される。",
-                                    "★８ａ．娼婦が、前途ある青年のことを思って、身を引く。",
-                                    "★８ｂ．『椿姫』の二十世紀版。",
-                                    "★９．一人の娼婦を巡る争いで、四人の男が死ぬ。",
-                                    "★１０．売春禁止法成立間際の娼館と娼婦。",
-                                    "★１１．旅館の女中が売春することもあった。"
-                        ]
-            },
-            {
-                        "item": "【成仏】",
-                        "stars": [
-                                    "★１．この世から離れられず、さまよっている幽霊を救い、苦しみのない世界へ送る。",
-                                    "★２．餓鬼道に堕ちた霊を救い、苦しみのない世界へ送る。",
-                                    "★３．死後の行き先が決まらず、落ち着くべき世界へ行けない。",
-                                    "★４．人間や動物（有情）のみならず、草木（非情）も成仏できる。"
-                        ]
-            },
-            {
-                        "item": "【食物】",
-                        "stars": [
-                                    "★１．食物を多くの人に与える。",
-                                    "★２ａ．食物を、食べる以外の用途に使う。",
-                                    "★２ｂ．逆に、糞尿など本来食物ではないものを食べる。",
-                                    "★３．自分の存在を維持するためには、食べたり飲んだりする必要がある。",
-                                    "★４．ただ一種類の食物だけを食べる人。",
-                                    "★５．自分に合う食物が見つからない。",
-                                    "★６ａ．目の前にありながら食べられない食物。",
-                                    "★６ｂ．豚のハムも鳥の肉も食べられない。",
-                                    "★６ｃ．食べてはいけない神聖な動物。",
-                                    "★７．女神が身体から食物を出す。",
-                                    "★８．女性が身体に食物を塗りつける。",
-                                    "★９．食物を呪う。",
-                                    "★１０．食物（うどんの感触）を、別のもの（血）と誤認する。"
-                        ]
-            },
-            {
-                        "item": "【処刑】",
-                        "stars": [
-                                    "★１ａ．磔刑（はりつけ）。",
-                                    "★１ｂ．キリストは弟を身代わりにして、磔刑を逃れた。",
-                                    "★２．絞首刑。",
-                                    "★３．火刑。",
-                                    "★４．銃殺刑。",
-                                    "★５ａ．ギロチン。",
-                                    "★５ｂ．フランスでは、二十世紀の半ばを過ぎてもなお、ギロチンによる処刑が行なわれていた。",
-                                    "★６．言葉による処刑。",
-                                    "★７．私刑（リンチ）。",
-                                    "★８ａ．絞首刑執行から絶命までの一瞬に、意識の中では長い時間が経過する。",
-                                    "★８ｂ．銃殺刑執行から絶命までの一瞬に、意識の中では長い時間が経過する。"
-                        ]
-            },
-            {
-                        "item": "【処女】",
-                        "stars": [
-                                    "★１．「誰とも結婚せず、一生処女でいよう」との決意。",
-                                    "★２．若い娘を見て、処女か否かを見抜く。",
-                                    "★３．非処女かと疑われるが、後に処女であることがわかる。",
-                                    "★４．花嫁がすでに処女でない。",
-                                    "★５ａ．赤ん坊を産んだ後、処女を回復する。",
-                                    "★５ｂ．繰り返し、処女を回復する。"
-                        ]
-            },
-            {
-                        "item": "【処女懐胎】",
-                        "stars": [
-                                    "★１．処女が受胎を告知される。",
-                                    "★２．処女が神の子を身ごもったまま、人間の男と結婚する。",
-                                    "★３．処女懐胎を疑う女。",
-                                    "★４．神なき時代の、処女懐胎の物語。"
-                        ]
-            },
-            {
-                        "item": "【処女妻】",
-                        "stars": [
-                                    "★１．夫の意志で、妻を処女のままにしておく。",
-                                    "★２．妻の意志で、処女のままでいる。",
-                                    "★３．夫が実は女であったばあい、妻は当然処女のままである。",
-                                    "★４．性戯にふけりながらも、処女を守る。",
-                                    "★５ａ．帝と処女妻。",
-                                    "★５ｂ．帝から「召す」と言われたが、召されなかった乙女。"
-                        ]
-            },
-            {
-                        "item": "【女装】",
-                        "stars": [
-                                    "★１．英雄・豪傑の女装。",
-                                    "★２．貴人の女装。",
-                                    "★３．少年の女装。",
-                                    "★４．恋しい女の形見の服を着る。",
-                                    "★５．女装の男に求婚する。",
-                                    "★６．男児を女装で育てると健康に成長する、との俗信があった。",
-                                    "★７．歌舞伎の女形。",
-                                    "★８．女装した将軍を、臣下がそれと知らず斬り殺す。",
-                                    "★９．女装して死を免れる。"
-                        ]
-            },
-            {
-                        "item": "【女中】",
-                        "stars": [
-                                    "★１．雇い主が小間使いと結婚し、正妻にする。",
-                                    "★２．雇い主が家政婦と性関係を結ぶ。",
-                                    "★３．「夫が女中を妊娠させたのではないか」と、妻が疑う。",
-                                    "★４．雇い主が家政婦を殺す。",
-                                    "★５．家政婦が、雇われ先の家庭の秘密をあばき、家族の不和を煽（あお）り立てて楽しむ。",
-                                    "★６．小間使が、殺人犯をつきとめようとする。"
-                        ]
-            },
-            {
-                        "item": "【初夜】",
-                        "stars": [
-                                    "★１．新婚初夜の怪。",
-                                    "★２．新婚二夜目の怪。",
-                                    "★３．新婚初夜の殺人。",
-                                    "★４．新婚初夜をのぞき見る。",
-                                    "★５．第二の初夜。",
-                                    "★６．初夜権。花婿・花嫁の結婚に際して、まず最初に領主（あるいは族長・呪術師など）が花嫁と寝所をともにし、それがすんでから花嫁を花婿に引き渡す。"
-                        ]
-            },
-            {
-                        "item": "【虱】",
-                        "stars": [
-                                    "★１．眠る龍の頭の虱を取る。",
-                                    "★２．虱と思ったら、呉公（むかで）だった。",
-                                    "★３．虱の仇討ち。",
-                                    "★４．虱を飼う人と、虱を食う人。",
-                                    "★５．魂が虱の体へ入る。",
-                                    "★６．虱を見る。"
-                        ]
-            },
-            {
-                        "item": "【心中】",
-                        "stars": [
-                                    "★１．心中から始まる物語。",
-                                    "★２．心中で終わる物語。",
-                                    "★３．夫婦の心中。",
-                                    "★４．男女三人の心中。",
-                                    "★５．一家心中。",
-                                    "★６ａ．心中をはかって、生き残る男。",
-                                    "★６ｂ．心中をはかって、生き残る女。",
-                                    "★７ａ．心中するカップルと、心中をとりやめるカップル。",
-                                    "★７ｂ．心中をとりやめるカップルと、心中の名所で事故死するカップル。",
-                                    "★８．心中した男女の身体を引き離す。"
-                        ]
-            },
-            {
-                        "item": "【心臓】",
-                        "stars": [
-                                    "★１．龍の心臓。",
-                                    "★２．魚の心臓。",
-                                    "★３．恋人の心臓。",
-                                    "★４．心臓を傷つける。",
-                                    "★５ａ．心臓の鼓動を調べる。",
-                                    "★５ｂ．脈搏を調べる物語もある。",
-                                    "★６．死者の心臓の鼓動が聞こえる。",
-                                    "★７．恋をすると、心臓がドキドキする。"
-                        ]
-            },
-            {
-                        "item": "【人造人間】",
-                        "stars": [
-                                    "★１．本物の人間たちの中に混じっていても、見分けがつかない人造人間。",
-                                    "★２．死体から造られた人間。",
-                                    "★３．死人の骨から造られた人間。",
-                                    "★４．植物から造られた人間。",
-                                    "★５．土から造られた人間。"
-                        ]
-            },
-            {
-                        "item": "【水死】",
-                        "stars": [
-                                    "★１．男が愛人を水死させる。",
-                                    "★２．夫が妻を水死させようとして果たさず、後にその妻と再会し、ふたたび結婚する。",
-                                    "★３．夫が妻をボートに乗せて湖を渡る。夫は、往路では妻を水死させようとし、復路では妻を助けようとする。",
-                                    "★４．男が、水死したはずの女と再会する。",
-                                    "★５．賊によって水死させられたはずの人物が無事に陸に上がり、賊と対面する。"
-                        ]
-            },
-            {
-                        "item": "【彗星】",
-                        "stars": [
-                                    "★１．彗星が女性の姿で地上へ降下する。",
-                                    "★２．彗星が地球に衝突する。",
-                                    "★３．凶兆と見なされる彗星も、喜びの心で見れば、輝かしいものに見える。",
-                                    "★４．彗星は、箒星（ははきぼし＝ほうきぼし）とも言う。",
-                                    "★５．地上の妖精たちが、天界の「ほうきぼし」になった。",
-                                    "★６．彗星が惑星（金星）になった。"
-                        ]
-            },
-            {
-                        "item": "【水没】",
-                        "stars": [
-                                    "★１．村や町が水没する。",
-                                    "★２ａ．大陸が水没する。",
-                                    "★２ｂ．日本列島が水没する。",
-                                    "★３．全世界が水没する。",
-                                    "★４．水没した町の中で暮らす。"
-                        ]
-            },
-            {
-                        "item": "【水浴】",
-                        "stars": [
-                                    "★１ａ．水浴する天女などの衣を隠す。",
-                                    "★１ｂ．温浴する女妖の衣を奪う。",
-                                    "★２．人妻の水浴を見る。",
-                                    "★３．女神の水浴を不用意に見てしまうと罰せられる。",
-                                    "★４ａ．行水する女を見る。水浴する女とそれを見た男が性関係を結ぶ物語の変型。",
-                                    "★４ｂ．行水する女の物語を、俳句的世界へ転換する。",
-                                    "★４ｃ．行水する母親が変身する。",
-                                    "★５．水浴びする男を見る。",
-                                    "★６．海岸の少女を、中年男が見る。"
-                        ]
-            },
-            {
-                        "item": "【頭痛】",
-                        "stars": [
-                                    "★１．頭痛と蛇。",
-                                    "★２．院（法皇）の頭痛の原因。",
-                                    "★３．再発する頭痛。",
-                                    "★４．頭痛の原因が「前世の自分」ではなく、現世の「第二の自分」。",
-                                    "★５．頭痛を動物に移して治す。"
-                        ]
-            },
-            {
-                        "item": "【鼈（すっぽん）】",
-                        "stars": [
-                                    "★１．鼈に喰いつかれる。",
-                                    "★２．三足の鼈。",
-                                    "★３．亀と鼈の遊び。",
-                                    "★４．人面鼈身の怪物。"
-                        ]
-            },
-            {
-                        "item": "【すばる】",
-                        "stars": [
-                                    "★１．一つの星が六つに割れて、すばる星（プレアデス星団）になった。",
-                                    "★２．すばる星は、もとは七つ星だった。",
-                                    "★３．六人兄弟がすばる星になった。",
-                                    "★４．六人姉妹がすばる星になった。",
-                                    "★５．すまる＝すばる。"
-                        ]
-            },
-            {
-                        "item": "【相撲】",
-                        "stars": [
-                                    "★１．相撲の起源。",
-                                    "★２．相撲の勝ちをゆずる。",
-                                    "★３．相撲取りになりそこね、ばくち打ちの渡世人に身をもちくずす。",
-                                    "★４ａ．女の相撲。",
-                                    "★４ｂ．女子プロレス。",
-                                    "★５．「老齢」との相撲。"
-                        ]
-            },
-            {
-                        "item": "【すりかえ】",
-                        "stars": [
-                                    "★１．金と石のすりかえ。",
-                                    "★２．手紙のすりかえ。",
-                                    "★３．剣のすりかえ。",
-                                    "★４．平中説話には、香を排泄物にすりかえる話と、逆に、排泄物を香にすりかえる話の両方がある。どちらか一方の話がまずあって、それを変形させてもう一方の話が出来上がったのであろう。",
-                                    "★５．水と墨とのすりかえ。",
-                                    "★６．酒と毒のすりかえ。毒と酒のすりかえ。",
-                                    "★７．文書のすりかえ。",
-                                    "★８．貴重な品などを、悪人が別のものとすりかえる。"
-                        ]
-            },
-            {
-                        "item": "【すれ違い】",
-                        "stars": [
-                                    "★１．慕い合う二人あるいは敵どうしが、お互いを目前にしながら会えない。",
-                                    "★２．一瞬のすれ違い。"
-                        ]
-            },
-            {
-                        "item": "【寸断】",
-                        "stars": [
-                                    "★１．殺した怪物の蘇生・復活を防ぐため、死体を寸断して、諸方に分葬する。",
-                                    "★２．以下の例も、復活を防ぐために死体を寸断した可能性がある。",
-                                    "★３．死体処理法としての寸断。バラバラ殺人の極端な形態。",
-                                    "★４．返り血のついた衣服の処理法としての寸断。細かく切り刻んで捨てる。",
-                                    "★５ａ．女神の死体が寸断され、そこから食物が生ずる。",
-                                    "★５ｂ．子供の死体が寸断され、そこから食物が生ずる。",
-                                    "★６．女の死体が寸断され、そこから大勢の女が生ずる。"
-                        ]
-            },
-            {
-                        "item": "【精液】",
-                        "stars": [
-                                    "★１ａ．神や人間が精液を飲み込んで、子供を産む。",
-                                    "★１ｂ．精液が大地・樹・岩にかかり、そこから子供が生まれる。",
-                                    "★２．生命を与える精液は、また生命を奪う毒にもなる。",
-                                    "★３．精液が尽きれば、生命も尽きる。",
-                                    "★４．夢精。",
-                                    "★５．精液を地面へ放出して無駄にする。",
-                                    "★６．女性の手によって射精する。"
-                        ]
-            },
-            {
-                        "item": "【性器（男）】",
-                        "stars": [
-                                    "★１．男性器を露出する。",
-                                    "★２．男性器が見えていることに気づかない。",
-                                    "★３．男性器を失う、傷つける。",
-                                    "★４．にせの男性器を切り取る。",
-                                    "★５．美しい男性器。",
-                                    "★６．男性器と女性器の形の違い。",
-                                    "★７．男も女も同じで、ほんの少しだけ差がある。",
-                                    "★８．男性器を「悪魔」、女性器を「地獄」と言う。"
-                        ]
-            },
-            {
-                        "item": "【性器（女）】",
-                        "stars": [
-                                    "★１．女性器を露出して神にはたらきかける。",
-                                    "★２．女であることを示すために性器をあらわす。",
-                                    "★３．女性器を露出して敵や魔物に対抗する、あるいは退治する。",
-                                    "★４．女性器の絵を刺青にするのは、魔よけ・弾丸よけの意味があるのかもしれない。",
-                                    "★５．貞操を守る紐も、女性器同様に、化け物を退治する力を持つ。",
-                                    "★６．歯牙のある女性器。ヴァギナ・デンタータ。",
-                                    "★７．女性器を傷つける。",
-                                    "★８．女性器をみるための計略。"
-                        ]
-            },
-            {
-                        "item": "【性交】",
-                        "stars": [
-                                    "★１．初めての性体験。",
-                                    "★２．性交の方法を知らない男女。",
-                                    "★３ａ．性交によってＡからＢに病気をうつす。その結果Ａの病気が治る。",
-                                    "★３ｂ．病気治療と称して性交する医者。",
-                                    "★４．性交による若返り。",
-                                    "★５．性交の喜び。",
-                                    "★６．女が性交中に目を閉じて、別の男のことを思う。",
-                                    "★７ａ．子供が、父母の性交現場を目撃する。",
-                                    "★７ｂ．子供が、父と芸者の性交現場を目撃する。",
-                                    "★７ｃ．子供が、母と愛人の性交現場を目撃する。",
-                                    "★８．一人の男がある家を訪れ、一家全員（男も女も）と性関係を持つ。",
-                                    "★９．性交によらぬ遺伝・妊娠。",
-                                    "★１０．さまざまな性体験。",
-                                    "★１１．一年に一度の交わり。",
-                                    "★１２．天人の交わり。",
-                                    "★１３．いもりの交尾。",
-                                    "★１４．交接の証拠。"
-                        ]
-            },
-            {
-                        "item": "【性交せず】",
-                        "stars": [
-                                    "★１．性交を拒否する女。",
-                                    "★２．性交を嫌悪し、男を殺す女。",
-                                    "★３．女と一夜をともに過ごしながらも、性交をせぬ男。",
-                                    "★４．男が性交に及ぼうとするのではないか、と女が警戒するが、男は空腹で、食べ物が欲しいだけだった。",
-                                    "★５．性病の男が、自ら性交を禁ずる。",
-                                    "★６．医者が、肺病の男に性交を禁ずる。",
-                                    "★７．性関係のない夫婦。"
-                        ]
-            },
-            {
-                        "item": "【性交と死】",
-                        "stars": [
-                                    "★１．異類との性交が死をもたらす。",
-                                    "★２．禁じられた、あるいは呪われた性交が、死をもたらす。",
-                                    "★３．禁欲期間後の性交が死をもたらす。",
-                                    "★４．性交の過多が死をもたらす。",
-                                    "★５．性交過多による死を回避する。",
-                                    "★６．死者の霊が、生者の身体を借りて性交する。"
-                        ]
-            },
-            {
-                        "item": "【生死不明】",
-                        "stars": [
-                                    "★１．物語の最後で主人公が生死不明の状態になる。",
-                                    "★２．重病で死を目前にした主人公が、あるいは持ち直すかもしれない、というところで物語が終わる。",
-                                    "★３．物語の最後で生死不明だった主人公が、その続編で、健在であることが示される。",
-                                    "★４．今の自分が、生きているのか死んでいるのか、判断できない。",
-                                    "★５．殺したはずの男に似た人物が、追いかけて来る。男は生きていたのか、それとも良く似た別人なのか、わからない。"
-                        ]
-            },
-            {
-                        "item": "【成長】",
-                        "stars": [
-                                    "★１ａ．生まれて三日で一人前に成長する娘。",
-                                    "★１ｂ．背丈三寸から、三ヵ月で一人前に成長する娘。",
-                                    "★１ｃ．通常の倍、あるいはそれ以上のスピードで成長する子供。",
-                                    "★２．子供が速く成長したと錯覚する愚者。",
-                                    "★３．会うたびに成長した姿を見せる少女は、実はこの世の人間ではなかった。",
-                                    "★４．成長の速い動物。",
-                                    "★５．一夜のうちに生じ、成長する植物。"
-                        ]
-            },
-            {
-                        "item": "【成長せず】",
-                        "stars": [
-                                    "★１．成長しない子供。後に立派な仕事をなしとげるばあいがある。",
-                                    "★２．成長せず、母親を苦しめる子。",
-                                    "★３．ロボットは成長しない。",
-                                    "★４．永遠の少年。",
-                                    "★５．不幸な事故のために、成長が止まる。",
-                                    "★６．成長を自らの意志で止め、また再開する。"
-                        ]
-            },
-            {
-                        "item": "【性転換】",
-                        "stars": [
-                                    "★１．男から女へ性転換する人。",
-                                    "★２．女から男へ性転換する人。",
-                                    "★３ａ．女が悟りを開いて男へ性転換する。変生男子。",
-                                    "★３ｂ．母親の胎内にいるうちに性転換し、女子を男子に変えて誕生させる。",
-                                    "★４．男から女に変わり、また男にもどる人。",
-                                    "★５．性転換する動物。",
-                                    "★６．性転換手術。",
-                                    "★７．放射能の影響による性転換。"
-                        ]
-            },
-            {
-                        "item": "【生命】",
-                        "stars": [
-                                    "★１．宇宙＝生命。",
-                                    "★２．宇宙生命（コスモゾーン）と同様、「道」もあらゆるところにある。",
-                                    "★３．魚にも葉にも、人間同様の生命がある。",
-                                    "★４．樹木に宿る生命。",
-                                    "★５．生命体である海。",
-                                    "★６．個人の生命を、河（あるいは海）の水の一滴にたとえることがある。",
-                                    "★７．個体発生は系統発生を繰り返す。",
-                                    "★８ａ．一つの生命を、二人で分ける。",
-                                    "★８ｂ．二つの生命のうち、一つを与える。"
-                        ]
-            },
-            {
-                        "item": "【生命指標】",
-                        "stars": [
-                                    "★１．旅人が生きているか死んでしまったかを教える短剣。",
-                                    "★２．生命指標の合理的解釈。",
-                                    "★３．病人が治るか死ぬかを教える虱。",
-                                    "★４．生命指標（死神）と病人の位置関係を変える。"
-                        ]
-            },
-            {
-                        "item": "【切腹】",
-                        "stars": [
-                                    "★１ａ．武士・軍人の切腹。",
-                                    "★１ｂ．多人数の切腹。",
-                                    "★２．女性の切腹。",
-                                    "★３．立ち腹。立ったままの姿勢で切腹する。",
-                                    "★４．切腹できない臆病者。",
-                                    "★５．理想的な死に方としての切腹。",
-                                    "★６．腹に墨で線を引き、「切腹するぞ」と言って脅す。",
-                                    "★７．陰腹（かげばら）。ひそかに切腹し、さらし布をきつく巻いて血を止め、切腹したことを他人にさとられないようにする。",
-                                    "★８．西洋人から見た「ハラキリ」。"
-                        ]
-            },
-            {
-                        "item": "【接吻】",
-                        "stars": [
-                                    "★１．接吻は、超自然的な力を持つ。",
-                                    "★２．接吻で人の命を救う。",
-                                    "★３．問いかけに対する答えとしての接吻。",
-                                    "★４．合図としての接吻。",
-                                    "★５．大地への接吻。",
-                                    "★６．生まれて初めての接吻。",
-                                    "★７．窓ガラスをへだてての接吻。",
-                                    "★８．間接キッス。",
-                                    "★９ａ．天女の接吻。",
-                                    "★９ｂ．悪魔の接吻。",
-                                    "★１０．接吻の人違い。",
-                                    "★１１．映画の接吻シーンの検閲。"
-                        ]
-            },
-            {
-                        "item": "【背中】",
-                        "stars": [
-                                    "★１．男が背負った子供や僧が、次第にあるいは急に、重くなる。",
-                                    "★２．男が背負った僧や老人が、強い力で男を苦しめる。",
-                                    "★３．背中に飛び乗ってくる化け物。",
-                                    "★４．重い荷物を背負う。",
-                                    "★５．背中合わせ。",
-                                    "★６．背中の筋。"
-                        ]
-            },
-            {
-                        "item": "【背中の女】",
-                        "stars": [
-                                    "★１．男が女を背負って、遠方へ連れて行く。",
-                                    "★２．背中に負った女の触感。",
-                                    "★３．背負われることを拒む女。",
-                                    "★４．男が老女を背負って、山を登る。",
-                                    "★５．男が女を背負うのとは逆に、女（鬼女）が男（僧）を背負う。"
-                        ]
-            },
-            {
-                        "item": "【背中の死体】",
-                        "stars": [
-                                    "★１．死体を背負う。",
-                                    "★２．逆に、死体の背中に生きた人間が乗る。"
-                        ]
-            },
-            {
-                        "item": "【背中の仏】",
-                        "stars": [
-                                    "★１．仏像を背負う。"
-                        ]
-            },
-            {
-                        "item": "【蝉】",
-                        "stars": [
-                                    "★１．人間が蝉になった。",
-                                    "★２．大昔の人間の一部から、蝉の種族が発生した。",
-                                    "★３．夏の間、歌って暮らした蝉。",
-                                    "★４．蝉の鳴き声。"
-                        ]
-            },
-            {
-                        "item": "【千】",
-                        "stars": [
-                                    "★１．千人。",
-                                    "★２．千日。",
-                                    "★３ａ．千年を経た古狐と古木。",
-                                    "★３ｂ．千年が一つの区切り目。",
-                                    "★４．千本の手。",
-                                    "★５．千本の卒塔婆。",
-                                    "★６．千の性器。",
-                                    "★７．千枚田。",
-                                    "★８．宝は千揃えて持つのがよい。",
-                                    "★９．千の仏。",
-                                    "★１０．千羽鶴。",
-                                    "★１１．千人針。千人の女性が一針ずつ、縫い玉を縫いつけた晒し布。出征兵士がこれを腹にまけば、弾丸よけになると言われた。"
-                        ]
-            },
-            {
-                        "item": "【前世】",
-                        "stars": [
-                                    "★１．人間には前世が必要である。",
-                                    "★２．イエス＝キリストには前世がない。",
-                                    "★３．前世を映す皿。",
-                                    "★４ａ．自らの前世を、動物だと考える。",
-                                    "★４ｂ．自らの前世を、犬かもしれないと空想する。",
-                                    "★５．前世で殺生したために、現世で殺される。",
-                                    "★６ａ．前世の骸骨を見る。",
-                                    "★６ｂ．前世の骸骨の山に登る。"
-                        ]
-            },
-            {
-                        "item": "【前世を語る】",
-                        "stars": [
-                                    "★１．自らの前世を知っていて、それを人に語る。",
-                                    "★２．幼い頃は前世を覚えているが、成長すると忘れてしまう。",
-                                    "★３．自らの前生だけでなく次生も語る。",
-                                    "★４．催眠術をかけられて、自らの前世を語り出す。",
-                                    "★５．自らの前世を語ることの禁忌。"
-                        ]
-            },
-            {
-                        "item": "【前世を知る】",
-                        "stars": [
-                                    "★１．自分の前世を教えられる。",
-                                    "★２．自分の前世と前々世を教えられる。",
-                                    "★３．偽りの前世を教えられてそれを信じる。",
-                                    "★４．前世が身分低い者であったことを知る。"
-                        ]
-            },
-            {
-                        "item": "【戦争】",
-                        "stars": [
-                                    "★１．第二次世界大戦。",
-                                    "★２．朝鮮戦争。",
-                                    "★３ａ．ベトナム戦争。",
-                                    "★３ｂ．ベトナム戦争の帰還兵。",
-                                    "★４．未来の二百年戦争後の理想世界。",
-                                    "★５．戦争の記憶・記録を消去することの是非。",
-                                    "★６．世界から戦争をなくす方法。",
-                                    "★７．戦時中の興奮と連帯感を懐かしむ。"
-                        ]
-            },
-            {
-                        "item": "【洗濯】",
-                        "stars": [
-                                    "★１ａ．洗濯する乙女の所へ、竹や剣が流れ寄る。",
-                                    "★１ｂ．洗濯する乙女の前に、男が現れる。",
-                                    "★２．洗濯する婆の所へ、桃が流れて来る。",
-                                    "★３．男が洗濯する。",
-                                    "★４．亡霊が洗濯する。",
-                                    "★５．洗濯石鹸の泡。"
-                        ]
-            },
-            {
-                        "item": "【千里眼】",
-                        "stars": [
-                                    "★１．遠方の光景を見る。",
-                                    "★２．遠方の火事を見る。",
-                                    "★３．遠方の火事を知って、これを消す。",
-                                    "★４．天眼通。",
-                                    "★５ａ．水の中に顔を入れ、何百里も離れた場所を見る。",
-                                    "★５ｂ．月面の井戸の中から鏡を通して、遠い地球の町や家を見る。",
-                                    "★６．透視。"
-                        ]
-            },
-            {
-                        "item": "【僧】",
-                        "stars": [
-                                    "★１．僧と后・姫君。",
-                                    "★２．僧と遊女。",
-                                    "★３ａ．僧がこの世に遺した物への執着心によって、死後、蛇の身を受ける。",
-                                    "★３ｂ．眠る僧の魂が、蛇となって金貨を守る。",
-                                    "★３ｃ．高徳の僧が自らの意志で、死後に蛇となる。",
-                                    "★４．悪僧。",
-                                    "★５．兵士が僧になる。"
-                        ]
-            },
-            {
-                        "item": "【象】",
-                        "stars": [
-                                    "★１．空飛ぶ象。",
-                                    "★２．象を働かせる。",
-                                    "★３．象の恩返し。",
-                                    "★４．象の頭を持つ神。",
-                                    "★５．象人間。",
-                                    "★６ａ．大象が狭い窓から出る。",
-                                    "★６ｂ．大象が小さな門を通れない。",
-                                    "★７．象の夢。",
-                                    "★８．象の重さ。",
-                                    "★９．人を殺す象。",
-                                    "★１０．象を射殺する。",
-                                    "★１１．群盲象を撫でる。"
-                        ]
-            },
-            {
-                        "item": "【像】",
-                        "stars": [
-                                    "★１ａ．像を夫や妻のごとく愛する。神が像に生命を与える。",
-                                    "★１ｂ．像が生きた仏となる。",
-                                    "★１ｃ．土で造った像に生命が宿り、動き出して暴れる。",
-                                    "★２．夫が死んだので、夫の像を作って交わる。",
-                                    "★３．美女の像に心をうばわれ、そのモデルの王女を妻とする。",
-                                    "★４．像が人間の身代わりになる。",
-                                    "★５．像の中に物を隠す。",
-                                    "★６．宝石や金で飾られた像。",
-                                    "★７．像の背丈が伸びる。",
-                                    "★８ａ．像を食事に招待する。",
-                                    "★８ｂ．像と結婚の約束をする。",
-                                    "★９．像を傷つける。",
-                                    "★１０．像を作るのではなく、木の中から像を掘り出す。",
-                                    "★１１．動物の像。",
-                                    "★１２．人間が像のふりをする。"
-                        ]
-            },
-            {
-                        "item": "【葬儀】",
-                        "stars": [
-                                    "★１．通夜から告別式・火葬までのさまざまな手続き。",
-                                    "★２．葬儀の焼香。",
-                                    "★３．通夜や葬儀の場に、死者と瓜二つの人がやって来る。",
-                                    "★４．通夜の家に雨宿りする無法者たち。",
-                                    "★５．葬列から子供を守る。",
-                                    "★６．陽気な葬儀。"
-                        ]
-            },
-            {
-                        "item": "【装身具】",
-                        "stars": [
-                                    "★１ａ．姦通の証拠となる装身具。性交の際、装身具をはずす・忘れるなどして、それが夫などの手に入る。",
-                                    "★１ｂ．姦通の証拠となる装身具。夫が妻に贈った装身具を、妻が愛人に与える。",
-                                    "★２．装身具が悪事の証拠となる。",
-                                    "★３．装身具が、異郷の人と会った証拠になる。",
-                                    "★４．矢を防ぐ装身具。"
-                        ]
-            },
-            {
-                        "item": "【底なし】",
-                        "stars": [
-                                    "★１．いくらでも物を棄てられる底なしの穴。",
-                                    "★２．いくらでも金貨が入る底なしの靴。",
-                                    "★３．いくらでもインクが入る底なしの万年筆。",
-                                    "★４．いくらでも食べられる底なしの胃袋。",
-                                    "★５．杯の底が海へ通じている。",
-                                    "★６．底のない壺。",
-                                    "★７．底を抜いた柄杓（ひしゃく）。"
-                        ]
-            },
-            {
-                        "item": "【蘇生】",
-                        "stars": [
-                                    "★１．神または神に等しい人が蘇生する。",
-                                    "★２．人間が生き返る・人間を生き返らせる。",
-                                    "★３．生者が死者とともに寝ることによって、蘇生させる方法がある。",
-                                    "★４ａ．男が、死んだ女を蘇生させ、結婚する。",
-                                    "★４ｂ．男が、死んだ女を一時的に蘇生させるだけで、結婚はできない。",
-                                    "★５．蘇生あるいは転生。",
-                                    "★６．動物を生き返らせる。"
-                        ]
-            },
-            {
-                        "item": "【蘇生者の言葉】",
-                        "stars": [
-                                    "★１．蘇生して、「ここは自分の家ではない」と言う人。",
-                                    "★２．蘇生して、冥府のさまを語る人。"
-                        ]
-            },
-            {
-                        "item": "【空飛ぶ円盤】",
-                        "stars": [
-                                    "★１．地球人が空飛ぶ円盤に乗って、宇宙人から教えを受ける。",
-                                    "★２．ＵＦＯが地球人を誘拐する。",
-                                    "★３．地球人が空飛ぶ円盤を造り、世界各地に飛ばせる。",
-                                    "★４．回復すべき全体性の象徴が円形であり、その円形を空に幻視したものが、空飛ぶ円盤である。",
-                                    "★５．空飛ぶ円盤の夢。"
-                        ]
-            },
-            {
-                        "item": "【体外の魂】",
-                        "stars": [
-                                    "★１．生命の根源（＝魂）が、身体から離れたところにあるので、身体をいくら攻撃されても無事である。しかし、体外にある魂が損傷すれば、身体は倒れる。",
-                                    "★２．生命の根源である心臓を、肉体から取り出して木の上に置く。",
-                                    "★３．窓外に見える葉を、自分の生命と同一視する。"
-                        ]
-            },
-            {
-                        "item": "【体外離脱】",
-                        "stars": [
-                                    "★１．体外離脱して、霊界へ行く。",
-                                    "★２．体外離脱して、他の天体へ行く。",
-                                    "★３．体外離脱して、空高く上昇する。",
-                                    "★４．離脱した魂と身体を結ぶ銀色の紐。",
-                                    "★５．体外離脱して、極小世界と極大世界の両方を訪れる。",
-                                    "★６．心も身体も、ともに浮き上がるような錯覚。"
-                        ]
-            },
-            {
-                        "item": "【太鼓】",
-                        "stars": [
-                                    "★１．打たずに鳴る太鼓。",
-                                    "★２．打っても鳴らぬ鼓。",
-                                    "★３．太鼓や鼓の音。",
-                                    "★４．恋しい人の所へ行きたいので、太鼓を打つ。",
-                                    "★５．恋しい人を逃がすために、太鼓を打つ。",
-                                    "★６．はじめて見た太鼓。",
-                                    "★７．初音の鼓。"
-                        ]
-            },
-            {
-                        "item": "【第二の夫】",
-                        "stars": [
-                                    "★１．貧運の夫と別れ、第二の夫と裕福に暮らす。",
-                                    "★２ａ．最初の夫は少将や中将。第二の夫は帝。",
-                                    "★２ｂ．最初の夫は少将。第二の夫は関白の息子。",
-                                    "★３．最初の夫も、次の夫も死に、女も自殺する。",
-                                    "★４．夫の死後、夫を殺した男と恋愛関係になる。"
-                        ]
-            },
-            {
-                        "item": "【太陽】",
-                        "stars": [
-                                    "★１．太陽が人間に及ぼす力。",
-                                    "★２．太陽から、人類の最初の男女が発生する。",
-                                    "★３．太陽神と合一する。",
-                                    "★４ａ．太陽を飲み込む。",
-                                    "★４ｂ．太陽を吐き出す。",
-                                    "★５ａ．太陽が東へ沈む。",
-                                    "★５ｂ．太陽は西へ沈み、夜は地の下を潜（くぐ）る。",
-                                    "★６．人間が太陽を追いかける。",
-                                    "★７．円筒形の太陽。",
-                                    "★８．十個の太陽。",
-                                    "★９ａ．太陽と目。",
-                                    "★９ｂ．太陽が目ならば、日食は一時的盲目。",
-                                    "★１０．太陽を見ない。",
-                                    "★１１．太陽は、星から光の供給を受けている。",
-                                    "★１２．太陽の背景としての青空。",
-                                    "★１３．夜中の太陽。"
-                        ]
-            },
-            {
-                        "item": "【太陽を射る】",
-                        "stars": [
-                                    "★１．二つの太陽のうちの一つを、矢で射る。",
-                                    "★２．十個の太陽を矢で射る。",
-                                    "★３．九つの太陽と十個の月を、矢で射る。",
-                                    "★４．太陽神に矢を向ける。"
-                        ]
-            },
-            {
-                        "item": "【太陽を止める】",
-                        "stars": [
-                                    "★１．神に祈って大陽を中天にとどまらせる。",
-                                    "★２．太陽が沈むのを遅らせようとする試み。",
-                                    "★３．西へ沈む太陽を招き返す。"
-                        ]
-            },
-            {
-                        "item": "【太陽と月】",
-                        "stars": [
-                                    "★１．太陽と月の近親婚。",
-                                    "★２．太陽が月を、泥の中へ落とした。",
-                                    "★３．月は、もとは太陽だった。",
-                                    "★４．月と太陽が入れ替わる。",
-                                    "★５．太陽も月も、イエス・キリストが作った。",
-                                    "★６．太陽も月も、恐ろしい存在。",
-                                    "★７．太陽神と月神と海神の引越し。",
-                                    "★８．太陽神と月神の性別。"
-                        ]
-            },
-            {
-                        "item": "【太陽と月の夢】",
-                        "stars": [
-                                    "★１．太陽と月を、左右の袂に入れる夢。",
-                                    "★２．太陽を胸に、月を足の下にする夢。",
-                                    "★３．太陽と月が輝くが、自分はその光にあたらない、との夢。",
-                                    "★４．太陽と月の夢を見て、子を産む。"
-                        ]
-            },
-            {
-                        "item": "【太陽と月の別れ】",
-                        "stars": [
-                                    "★１．太陽と月の離婚。",
-                                    "★２．太陽と月は姉弟であるが、昼と夜に別れて住むことにした。",
-                                    "★３．思わぬ事故のために、太陽と月が離れ離れになった。"
-                        ]
-            },
-            {
-                        "item": "【鷹】",
-                        "stars": [
-                                    "★１．鷹を逃がしてしまう。",
-                                    "★２．男が鷹を追って、女と出会う。",
-                                    "★３．鷹が来るのは、瑞祥である。",
-                                    "★４．主人に忠義を尽くす鷹。",
-                                    "★５．人間が鷹に変わる。",
-                                    "★６ａ．鷹を飼育した人の晩年。",
-                                    "★６ｂ．鷹狩りをした人の末路。",
-                                    "★６ｃ．鷹狩りをした人の子供。",
-                                    "★７ａ．人が鷹を食べる。",
-                                    "★７ｂ．鷹が人を襲う。",
-                                    "★８．鷹が、雀や鳩を追う。"
-                        ]
-            },
-            {
-                        "item": "【宝】",
-                        "stars": [
-                                    "★１．家宝などを割る。",
-                                    "★２．家宝を盗んだとの濡れ衣。",
-                                    "★３．宝くらべ。",
-                                    "★４．宝を守る龍や蛇。",
-                                    "★５．宝石のように美しい蛇。",
-                                    "★６．傷ついた動物が、治療してくれた人間に宝をもたらす。",
-                                    "★７．身体から出る宝。",
-                                    "★８ａ．水に沈む宝。",
-                                    "★８ｂ．水に沈めた大金が浮かび上がる。"
-                        ]
-            },
-            {
-                        "item": "【宝が人手を巡る】",
-                        "stars": [
-                                    "★１．宝が人の手から手へ巡る。",
-                                    "★２．宝が夫・妻・および第三者の間を巡る。"
-                        ]
-            },
-            {
-                        "item": "【宝を失う】",
-                        "stars": [
-                                    "★１．宝の持ち主が、それを失うことを恐れる。",
-                                    "★２．宝の持ち主が、宝を失うのではないかと心配し続け、失ってかえって安堵する。",
-                                    "★３．宝の持ち主が、宝を失うのではないかと心配し続け、失って嘆き悲しむ。",
-                                    "★４．宝のごとく大切な若妻を失うのではないかと心配し続け、失ってかえって安堵する。",
-                                    "★５．宝石のごとき女性を失う。"
-                        ]
-            },
-            {
-                        "item": "【宝を知らず】",
-                        "stars": [
-                                    "★１．宝の持ち主がその存在・その価値を知らない。",
-                                    "★２．賊が、人の宝を奪い取るが、その価値を知らず捨ててしまう。",
-                                    "★３．宝の持ち主がその価値を知らないように見えたが、実は知っていた。",
-                                    "★４．ある人にとっては貴重な宝も、別の人の手に渡れば、無価値なものとして扱われる。"
-                        ]
-            },
-            {
-                        "item": "【宝くじ】",
-                        "stars": [
-                                    "★１．宝くじが当たる。",
-                                    "★２．宝くじが当たって、性格が変わった女。",
-                                    "★３．当たりくじを見せびらかす。",
-                                    "★４．富札（とみふだ）。",
-                                    "★５．福（さいわい）を得る富札（とみふだ）。"
-                        ]
-            },
-            {
-                        "item": "【宝さがし】",
-                        "stars": [
-                                    "★１．海賊や貴族が隠した宝をさがす。",
-                                    "★２．金鉱をさがす。",
-                                    "★３．失った・あるいは奪われた宝を、取り戻す・さがす。",
-                                    "★４．身体さがし。失った器官を取り戻す。"
-                        ]
-            },
-            {
-                        "item": "【竹】",
-                        "stars": [
-                                    "★１ａ．竹林に生えた竹の中から、小さな女児が現れる。",
-                                    "★１ｂ．竹林に生えた竹の中から、小さな男児が現れる。",
-                                    "★２ａ．野に棄てた一本の竹から、竹林が生じる。",
-                                    "★２ｂ．地に投げた櫛から、竹林が生じる。",
-                                    "★３．竹の葉が病を治す。",
-                                    "★４．地から生えた竹が人を殺す。",
-                                    "★５．竹の釘。",
-                                    "★６．竹に雀。",
-                                    "★７．竹林の怪。"
-                        ]
-            },
-            {
-                        "item": "【多元宇宙】",
-                        "stars": [
-                                    "★１．無限に分岐する宇宙。",
-                                    "★２．無数の可能な未来のうち、一つだけが現実になる。",
-                                    "★３．考え得る宇宙が、すべて実在する。",
-                                    "★４．他の宇宙の自分たちを抹殺する。",
-                                    "★５．他の宇宙の自分たちに会う。",
-                                    "★６．多くの宇宙に多くの神。",
-                                    "★７．「実宇宙」と「虚宇宙」。"
-                        ]
-            },
-            {
-                        "item": "【蛸】",
-                        "stars": [
-                                    "★１ａ．婆が蛸の足を七本食べ、その後、海へ引きずりこまれる。",
-                                    "★１ｂ．猫が蛸の足を七本食べ、八本目は食べない。",
-                                    "★１ｃ．蛸が自分自身の足を食べ、身体を食べる。",
-                                    "★２ａ．蛸の八本の足を二本切って、六本足にする。",
-                                    "★２ｂ．蛸の八本の足を六本切って、二本足にする。",
-                                    "★２ｃ．蛸の十本の足を二本切って、八本足にする。",
-                                    "★３．精進すべき日に蛸を食べる。",
-                                    "★４．蛸を食べて死ぬ。",
-                                    "★５．蛸が経に変わる。",
-                                    "★６．蛇が蛸に変わる。",
-                                    "★７．毛の生えた蛸。"
-                        ]
-            },
-            {
-                        "item": "【堕胎】",
-                        "stars": [
-                                    "★１．堕胎手術の結果、女が死ぬ。",
-                                    "★２．堕胎手術後、女が出家する。",
-                                    "★３．間引き。堕胎手術ができなかった時代は、出産するまで待って子供を殺した。",
-                                    "★４ａ．母体に衝撃を与えて、子供を堕そうと試みる。",
-                                    "★４ｂ．腹の中の子を叩きつぶす、という乱暴な堕胎もある。",
-                                    "★５．夜叉の毒気を身体から下ろす。"
-                        ]
-            },
-            {
-                        "item": "【畳】",
-                        "stars": [
-                                    "★１．「畳が欲しい」と訴える。",
-                                    "★２．多くの畳を敷いて、客をもてなす。",
-                                    "★３．海に沈む時にも、多くの畳を敷く。",
-                                    "★４．八畳敷きの座敷に化けた狸。",
-                                    "★５．畳を叩くような音。",
-                                    "★６．畳替え。"
-                        ]
-            },
-            {
-                        "item": "【たたり】",
-                        "stars": [
-                                    "★１．人を殺したため、たたりを受ける。",
-                                    "★２．蛇を殺したり傷つけたりしたため、たたりを受ける。",
-                                    "★３．人魚を殺したたたり。",
-                                    "★４．刀剣のたたり。",
-                                    "★５．たたりを防ぐために供養をする。",
-                                    "★６．たたりのある場所。"
-                        ]
-            },
-            {
-                        "item": "【立往生】",
-                        "stars": [
-                                    "★１．弁慶の立往生。",
-                                    "★２．英雄ク・ホリンの立往生。",
-                                    "★３．聖者スライマーンの立往生。"
-                        ]
-            },
-            {
-                        "item": "【立ち聞き（盗み聞き）】",
-                        "stars": [
-                                    "★１．神々など超自然的存在が問答するのを聞く。",
-                                    "★２．重要な情報を偶然に耳にする。",
-                                    "★３．たまたま出会った人などのささいな一言から、難問解決のヒントを得ることがある。",
-                                    "★４ａ．必要な情報を得るために盗み聞きをする。",
-                                    "★４ｂ．盗聴器。",
-                                    "★５．不十分な情報しか得られぬ立ち聞き。",
-                                    "★６ａ．鳥の話を人間が立ち聞きする。",
-                                    "★６ｂ．逆に、人間の話を鳥が立ち聞きする。",
-                                    "★７．わざと立ち聞きさせる。"
-                        ]
-            },
-            {
-                        "item": "【脱走】",
-                        "stars": [
-                                    "★１．捕虜収容所からの脱走。",
-                                    "★２．刑務所・牢獄からの脱走。脱獄。",
-                                    "★３．脱獄に成功した男と、失敗した男との友情。",
-                                    "★４．脱獄した夫の代わりに、妻を牢に入れる。"
-                        ]
-            },
-            {
-                        "item": "【狸】",
-                        "stars": [
-                                    "★１．狸婿。",
-                                    "★２．狸女房。",
-                                    "★３．狸が人に化ける。",
-                                    "★４．狸が死んだのを、「仏になった」と表現する。",
-                                    "★５ａ．狸が茶釜に化ける。",
-                                    "★５ｂ．狸が汽車に化ける。",
-                                    "★６．父親を、狸が化けたものと誤解して殺す。",
-                                    "★７．狸の恩返し。",
-                                    "★８．狸のいたずら。",
-                                    "★９ａ．狸囃子（たぬきばやし）。",
-                                    "★９ｂ．盗賊一味が狸囃子を奏して、人々を惑わせる。",
-                                    "★１０．狸の腹鼓。",
-                                    "★１１．狸や狐が、いろいろなものに化ける能力を有する理由。"
-                        ]
-            },
-            {
-                        "item": "【旅】",
-                        "stars": [
-                                    "★１．主人公たちが果てしない旅をする。",
-                                    "★２ａ．神が身をやつして旅をする。",
-                                    "★２ｂ．王族・貴族・領主などが、身分を隠して旅をする。",
-                                    "★２ｃ．王女が身分を隠して町に出る。",
-                                    "★３ａ．星界への旅。",
-                                    "★３ｂ．天界への旅。",
-                                    "★４．旅する動物・異類。",
-                                    "★５．破滅する世界の救いを求めての旅。",
-                                    "★６．貴重な情報を求めての旅。",
-                                    "★７ａ．失われた宝を求めての旅。",
-                                    "★７ｂ．宝を廃棄するための旅。",
-                                    "★８．聖杯探求の旅。",
-                                    "★９．自由を求めての旅。",
-                                    "★１０．ロマンスを求めての旅。",
-                                    "★１１．亡き妻の生まれ変わりを探す旅。",
-                                    "★１２．二人旅。",
-                                    "★１３．女の長旅。"
-                        ]
-            },
-            {
-                        "item": "【旅立ち】",
-                        "stars": [
-                                    "★１．青年が新天地を求めて旅立つ。",
-                                    "★２．一家あげての遠方への旅立ち。"
-                        ]
-            },
-            {
-                        "item": "【玉（珠）】",
-                        "stars": [
-                                    "★１．つねに身につけている玉（珠）。",
-                                    "★２．自分が宝玉を身につけていることを知らない。",
-                                    "★３．二つの玉（珠）。",
-                                    "★４．傷ついた動物が、治療してくれた人間に玉（珠）をもたらす。",
-                                    "★５．龍が守護する玉（珠）。",
-                                    "★６．玉（珠）を得る夢。",
-                                    "★７．動物の体内にある玉（珠）。",
-                                    "★８．男が女に玉を与える。",
-                                    "★９．身体が一つの球になる。"
-                        ]
-            },
-            {
-                        "item": "【卵】",
-                        "stars": [
-                                    "★１．卵の中に魂を隠す。",
-                                    "★２．金の卵を産む。",
-                                    "★３．半熟卵を食べる。",
-                                    "★４．卵を食べた罪。",
-                                    "★５．睾丸を卵に見立てる。",
-                                    "★６．宇宙卵。"
-                        ]
-            },
-            {
-                        "item": "【魂】",
-                        "stars": [
-                                    "★１．瀕死の人の肉体から魂が抜け出て、平生と変わらぬ姿で現れる。",
-                                    "★２．死んだ人が、その時刻に遠方で、平生と同じ姿で目撃される。",
-                                    "★３．横たわる肉体から、魂が抜け出て遠方へ行く。",
-                                    "★４．魂を遠方へ送るために、肉体を殺す。",
-                                    "★５．天使などが、死者の魂を天国に運ぼうとしてもできない。",
-                                    "★６．悪魔や死神が、死者の魂を取ろうとする。",
-                                    "★７．生者の魂が、肉体に先立って地獄へ堕ちる場合がある。",
-                                    "★８．何千何万という生者が、魂を悪魔に売った。",
-                                    "★９．人間の魂と動物の魂の違い。",
-                                    "★１０．魂を持たぬ存在。"
-                        ]
-            },
-            {
-                        "item": "【魂と鏡】",
-                        "stars": [
-                                    "★１．身体から抜け出た魂が、遠方の鏡に映し出される。",
-                                    "★２．室内で鏡に映した姿が、遠方で友人たちに目撃される。",
-                                    "★３．鏡を見すぎると、魂が遊離する。"
-                        ]
-            },
-            {
-                        "item": "【魂の数】",
-                        "stars": [
-                                    "★１．一人の人間の身体には、二つの魂が宿っている。",
-                                    "★２．一人の人間の身体には、三魂七魄（さんこんしちはく）がある。",
-                                    "★３．一人の人間の身体にいくつの魂が宿るかについては、民族・部族によっていろいろな見方がある。",
-                                    "★４．類魂。一つであると同時に多数である魂。"
-                        ]
-            },
-            {
-                        "item": "【魂呼ばい】",
-                        "stars": [
-                                    "★１．死者の名前を呼んで、生の世界へ引き戻そうとする。",
-                                    "★２．魂呼ばいによって、死に瀕した人が生き返った。",
-                                    "★３．魂呼ばいによって、死者が一時的に息を吹き返した。",
-                                    "★４．行方知れずの人の魂を請い求めていたら、別人の魂を（＝死者を）呼び起こしてしまった。"
-                        ]
-            },
-            {
-                        "item": "【樽】",
-                        "stars": [
-                                    "★１．大きな樽の中に人間が隠れる。",
-                                    "★２．樽の中に人間を閉じ込める。",
-                                    "★３．樽の中に人間を入れて、海へ捨てる。",
-                                    "★４ａ．死体を樽の中に入れる。",
-                                    "★４ｂ．破砕された死体が、セメント樽に詰められる。",
-                                    "★５．刑罰として、人間を樽の中に入れる。",
-                                    "★６．樽を住居とする。"
-                        ]
-            },
-            {
-                        "item": "【俵】",
-                        "stars": [
-                                    "★１．米俵。",
-                                    "★２．米俵の蓋に乗せて、疱瘡の神を追い払う",
-                                    "★３．俵に人間を入れることもある。",
-                                    "★４．俵には人間でなく、米を入れるべきである。",
-                                    "★５．米俵が空を飛ぶ。"
-                        ]
-            },
-            {
-                        "item": "【弾丸】",
-                        "stars": [
-                                    "★１．弾丸を噛んで痛みに耐える。",
-                                    "★２．銃弾を防ぐ盾。",
-                                    "★３．警官隊や軍隊が、無数の銃弾を浴びせてアウトロー二人を殺す。",
-                                    "★４．銃弾の転生。",
-                                    "★５．特別の弾丸。"
-                        ]
-            },
-            {
-                        "item": "【誕生】",
-                        "stars": [
-                                    "★１．誕生時の奇瑞。",
-                                    "★２．火の中で誕生する。",
-                                    "★３．同日に生まれた二人は、強い運命の絆で結ばれる。",
-                                    "★４．仇敵の子に生まれ変わる。",
-                                    "★５．誕生を拒否する子供。",
-                                    "★６．誕生以前の子供たち。",
-                                    "★７．誕生と同時に、人間には守護霊がつけられる。"
-                        ]
-            },
-            {
-                        "item": "【誕生（鉱物から）】",
-                        "stars": [
-                                    "★１．石から男児が生まれる。"
-                        ]
-            },
-            {
-                        "item": "【誕生（植物から）】",
-                        "stars": [
-                                    "★１．木から男児が誕生する。",
-                                    "★２．花・実・種などから女児が誕生する。"
-                        ]
-            },
-            {
-                        "item": "【誕生（卵から）】",
-                        "stars": [
-                                    "★１．卵から創造神が生まれる。",
-                                    "★２ａ．卵から男児が生まれる。",
-                                    "★２ｂ．卵から女児が生まれる。",
-                                    "★３．女が卵を産む。その卵から一人あるいは多数の子供が生まれる。"
-                        ]
-            },
-            {
-                        "item": "【誕生（血から）】",
-                        "stars": [
-                                    "★１．血から神や人間が誕生する。",
-                                    "★２．血から稲や木が生ずる。"
-                        ]
-            },
-            {
-                        "item": "【誕生（動物から）】",
-                        "stars": [
-                                    "★１ａ．鹿から男児が生まれる。",
-                                    "★１ｂ．鹿から女児が生まれる。",
-                                    "★２．山犬から悪魔の子が生まれる。",
-                                    "★３．魚から男女が生まれる。"
-                        ]
-            },
-            {
-                        "item": "【誕生（母体から）】",
-                        "stars": [
-                                    "★１．赤ん坊が、母親の脇腹から誕生する。",
-                                    "★２．母親の腹を刃物で切り裂き、赤ん坊を取り出す。"
-                        ]
-            },
-            {
-                        "item": "【男性遍歴】",
-                        "stars": [
-                                    "★１．数名あるいはそれ以上の男たちと関係を持ち、成長する、または破滅する女。"
-                        ]
-            },
-            {
-                        "item": "【男装】",
-                        "stars": [
-                                    "★１．男たちから身を守るために、男装する。",
-                                    "★２．立身のために男装する。",
-                                    "★３．男色の男に近づくために男装する。",
-                                    "★４ａ．男装して、苦境にある夫や恋人などを救う。",
-                                    "★４ｂ．男装して夫や恋人に会い、後に正体を明かす。",
-                                    "★５．男装しているために、女に子を産ませた・女を犯そうとした、との濡れ衣を着せられる。",
-                                    "★６．親しい男に女性であると見破られ、犯される。",
-                                    "★７．恋しい男の形見の衣を着る。",
-                                    "★８．近衛士官姿の美女。",
-                                    "★９．姫宮を男宮として育てる。",
-                                    "★１０．集団の男装。"
-                        ]
-            },
-            {
-                        "item": "【血】",
-                        "stars": [
-                                    "★１．災いを招く、あるいは退ける目印としての血。",
-                                    "★２．拭いても拭き取れぬ血。",
-                                    "★３．拭き取れぬ血を作る困難。",
-                                    "★４．殺人犯の衣類に残る、被害者の血痕。",
-                                    "★５．処刑された人の血が、無実であることを示す。",
-                                    "★６ａ．河の水が血に染まる。",
-                                    "★６ｂ．淵の水が血の色に濁る。",
-                                    "★６ｃ．草花や石が血に染まる。"
-                        ]
-            },
-            {
-                        "item": "【血の味】",
-                        "stars": [
-                                    "★１．血をなめて、その味をおぼえる。",
-                                    "★２．血がしみこんだビスケット。"
-                        ]
-            },
-            {
-                        "item": "【血の力】",
-                        "stars": [
-                                    "★１．血の力で開眼する。",
-                                    "★２．血の力で病気が治る。",
-                                    "★３．血の力で不死身となる。",
-                                    "★４．血の力で蘇生する。",
-                                    "★５．血の力で誕生した人を、血の力で倒す。"
-                        ]
-            },
-            {
-                        "item": "【知恵比べ】",
-                        "stars": [
-                                    "★１．外国と日本の知恵比べ。"
-                        ]
-            },
-            {
-                        "item": "【誓い】",
-                        "stars": [
-                                    "★１ａ．いかさまの誓い。不義の人妻が潔白を主張し、夫をあざむく。",
-                                    "★１ｂ．いかさまの誓い。不義の人妻が潔白を主張するが、夫が嘘を見抜く。",
-                                    "★２．いかさまの誓い。王女の潔白を誓う。",
-                                    "★３．いかさまの誓い。返さぬ金を「返した」と言う。"
-                        ]
-            },
-            {
-                        "item": "【地下鉄】",
-                        "stars": [
-                                    "★１．あこがれの地下鉄。",
-                                    "★２．地下鉄構内の殺人死体。",
-                                    "★３．地下鉄の乗っ取り。",
-                                    "★４．地下鉄の中では、現実とは異なる時間が流れる。",
-                                    "★５．地下鉄の路線が、異空間へ入りこむ。",
-                                    "★６．地下鉄のホームでの出会い。"
-                        ]
-            },
-            {
-                        "item": "【力くらべ】",
-                        "stars": [
-                                    "★１．引っ張り合い。",
-                                    "★２．女どうしの力くらべ。",
-                                    "★３．神々の力くらべ。我慢くらべ。",
-                                    "★４．最強の攻撃兵器と最強の防御装置の激突。"
-                        ]
-            },
-            {
-                        "item": "【地球】",
-                        "stars": [
-                                    "★１ａ．地球の自転を停止させる。",
-                                    "★１ｂ．地球の自転が遅くなり、つねに同じ面を太陽に向けて公転する。",
-                                    "★２．地球を逆回転させる。",
-                                    "★３．地球に接近し、衝突する恐れのある天体。",
-                                    "★４．人が地球の中心を通り抜ける。",
-                                    "★５．第二の地球。",
-                                    "★６．地球は生きている。",
-                                    "★７．人間が地球に変身する。",
-                                    "★８．地球の全生命の死滅。",
-                                    "★９．宇宙の知的生命体が、地球を救うために人類を滅ぼそうとする。"
-                        ]
-            },
-            {
-                        "item": "【稚児】",
-                        "stars": [
-                                    "★１．僧が稚児と契りを結ぶ。",
-                                    "★２．現世の快楽にふける稚児と、来世の応報を想う稚児。",
-                                    "★３．稚児と姫君の恋物語。"
-                        ]
-            },
-            {
-                        "item": "【地図】",
-                        "stars": [
-                                    "★１．原寸大の地図。",
-                                    "★２．地図上の距離と実際の距離の混同。",
-                                    "★３．地図に似た田虫の形状。",
-                                    "★４．地図にも載らぬ島。",
-                                    "★５．地図を見て、自分のいる場所を知る。",
-                                    "★６．地図で見ると、南半球の大陸が倒三角形である理由。"
-                        ]
-            },
-            {
-                        "item": "【父子関係】",
-                        "stars": [
-                                    "★１．父親のわからない子。",
-                                    "★２．真の父子かどうかの判定。",
-                                    "★３．真の父子であれば、子の血は父の血と融合し、父の骨に染（し）み込んで行く。",
-                                    "★４．息子が父親を見るが、それが父であることを友人たちに言わず、赤の他人のような態度をとる。",
-                                    "★５．母は父の姿を、幼い娘の目から隠す。父は幼い娘を見ても、他人のふりをする。",
-                                    "★６．父親の遺骸に平気で矢を射込む息子と、射ることができない息子。"
-                        ]
-            },
-            {
-                        "item": "【父と息子】",
-                        "stars": [
-                                    "★１．父と息子とが、同じ一人の女と関わりを持つ。",
-                                    "★２．父に及ばぬ息子。",
-                                    "★３．父を尊敬し、慕う息子。",
-                                    "★４．父が、自分の果たせなかった夢を、息子に託す。",
-                                    "★５．父の世界と息子の世界。",
-                                    "★６．息子が父に反逆する。",
-                                    "★７．父が敵となって、息子の前に立ちはだかる。",
-                                    "★８．互いに父であり息子であると知らずに戦う。",
-                                    "★９．養父と息子。"
-                        ]
-            },
-            {
-                        "item": "【父と娘】",
-                        "stars": [
-                                    "★１．父が娘を溺愛する。",
-                                    "★２．娘の結婚による父との別れ。",
-                                    "★３．嫁に行く娘と行かない娘の対比。",
-                                    "★４．いつわりの父と娘。",
-                                    "★５．娘が、父と敵対する立場の青年を、夫や恋人にする。",
-                                    "★６．娘が父を裏切り、夫を助ける。"
-                        ]
-            },
-            {
-                        "item": "【父の霊】",
-                        "stars": [
-                                    "★１．父の霊。",
-                                    "★２．父祖の霊。"
-                        ]
-            },
-            {
-                        "item": "【父殺し】",
-                        "stars": [
-                                    "★１．息子が父親を殺す。",
-                                    "★２．息子が、継父になろうとする男を殺す。",
-                                    "★３．義父殺し。"
-                        ]
-            },
-            {
-                        "item": "【父さがし】",
-                        "stars": [
-                                    "★１．父を捜し尋ねる息子。",
-                                    "★２．証拠の品を持って父のもとへ来る息子。",
-                                    "★３．証拠の品を持って父のもとへ来るにせ息子。",
-                                    "★４．父と別れて育ちながらも、父が誰かを知っている息子。",
-                                    "★５．父を捜し尋ねる娘。"
-                        ]
-            },
-            {
-                        "item": "【父娘婚】",
-                        "stars": [
-                                    "★１．互いに父親であり娘であることを知らずに、性関係を結ぶ。",
-                                    "★２．娘が自分の正体を隠して父親と交わり、男児を産む。",
-                                    "★３．娘二人が、父親を眠らせて交わり、男児を産む。",
-                                    "★４ａ．父親が、眠る娘を犯す。",
-                                    "★４ｂ．父親が、力ずくで自分の娘を犯す。",
-                                    "★４ｃ．父親が自分の娘を犯し、娘は女児を産む。",
-                                    "★４ｄ．父親が自分の娘を愛し、娘は男児を産む。娘は後に、男児を夫とする（父娘相姦の後に、母子相姦が行なわれるわけである）。",
-                                    "★５．父娘相姦の噂。",
-                                    "★６．父親が、自分の娘との結婚を望む。",
-                                    "★７．父娘婚とも双子婚とも解釈できる物語。",
-                                    "★８．養父と養女の結婚。"
-                        ]
-            },
-            {
-                        "item": "【乳房】",
-                        "stars": [
-                                    "★１．人間が乳房に変身する。",
-                                    "★２．乳房を露出して、敵を追い払う。",
-                                    "★３．乳房を恐れる。",
-                                    "★４ａ．乳房を握って安らぎを感じる。",
-                                    "★４ｂ．乳房をつかんだ手が離れない。",
-                                    "★５．乳房を手術する。",
-                                    "★６．乳房榎。",
-                                    "★７．母体の死後も乳を出し続ける乳房。",
-                                    "★８．五百人の子に乳を与える乳房。",
-                                    "★９．乳房の起源。",
-                                    "★１０．女の乳房と男の乳首。",
-                                    "★１１．乳房を蛇に噛ませる。",
-                                    "★１２．アマゾンの乳房。",
-                                    "★１３．乳房が三つある女。"
-                        ]
-            },
-            {
-                        "item": "【チフス】",
-                        "stars": [
-                                    "★１．明治・大正の頃には、腸チフス（チブス）は死にいたる伝染病だった。",
-                                    "★２．昭和になっても、チフスは危険な病だった。",
-                                    "★３．浮気の証拠のチフス。"
-                        ]
-            },
-            {
-                        "item": "【地名】",
-                        "stars": [
-                                    "★１．地名の起源。",
-                                    "★２．呪力を持つ地名。",
-                                    "★３．不吉な地名。",
-                                    "★４．近代の地名。",
-                                    "★５．地名が人の心に及ぼす力。",
-                                    "★６．地名の誤解。"
-                        ]
-            },
-            {
-                        "item": "【血文字】",
-                        "stars": [
-                                    "★１．血文字で辞世の和歌を記す。",
-                                    "★２．血文字で、強い怒り・恨みの心を表す。",
-                                    "★３．墨がないので血で長大な文章を記す。"
-                        ]
-            },
-            {
-                        "item": "【茶】",
-                        "stars": [
-                                    "★１．素人が茶の湯を始める。",
-                                    "★２．おかしなお茶会。",
-                                    "★３．朝茶は縁起が良い。",
-                                    "★４．マテ茶。",
-                                    "★５．ほうじ茶と法事。",
-                                    "★６．片葉の茶。"
-                        ]
-            },
-            {
-                        "item": "【仲介者】",
-                        "stars": [
-                                    "★１．仲介者が、君臣・父子などの仲を隔てる。",
-                                    "★２．仲介者が男女の仲を裂く。",
-                                    "★３．結婚の使者。",
-                                    "★４．人間が神様のもとへ使者を送る。"
-                        ]
-            },
-            {
-                        "item": "【蝶】",
-                        "stars": [
-                                    "★１．蝶は死者の魂、もしくは死者の化身である。",
-                                    "★２．亡魂が、蝶の前段階の毛虫になるばあいもある。",
-                                    "★３．夢を見る人と蝶。",
-                                    "★４．人の死と蝶。",
-                                    "★５．蝶の精。",
-                                    "★６．蝶が口に入って身ごもる。"
-                        ]
-            },
-            {
-                        "item": "【長者】",
-                        "stars": [
-                                    "★１．貧しい男が長者になる。",
-                                    "★２．石油成金。",
-                                    "★３．長者の財力。",
-                                    "★４ａ．長者が、広い土地に黄金を敷きつめる。",
-                                    "★４ｂ．長者が、遠い町まで小判を並べる。",
-                                    "★４ｃ．大金持ちが、町に銀貨を敷きつめる。"
-                        ]
-            },
-            {
-                        "item": "【長者没落】",
-                        "stars": [
-                                    "★１．長者の家が没落する。",
-                                    "★２．子を授かることと引き換えに、長者が財を失う。",
-                                    "★３．第二次世界大戦後の農地改革で、長者が没落する。"
-                        ]
-            },
-            {
-                        "item": "【長寿】",
-                        "stars": [
-                                    "★１．百年～数百年以上生きる長寿の男。",
-                                    "★２．千年以上生きる長寿の男。",
-                                    "★３．二百年生きる長寿の女。",
-                                    "★４．一千年生きる長寿の女。",
-                                    "★５．長寿をもたらす食物。",
-                                    "★６．長寿をもたらす人肉。",
-                                    "★７．長寿をもたらす王。",
-                                    "★８．超長寿者の意識。"
-                        ]
-            },
-            {
-                        "item": "【追放】",
-                        "stars": [
-                                    "★１ａ．実の親が、息子を追放する。",
-                                    "★１ｂ．実の親が、娘を追放する。",
-                                    "★１ｃ．育ての親が、娘を追放する。",
-                                    "★２．伯父が甥を追放する。",
-                                    "★３．王が臣下を追放する。",
-                                    "★４．一年間だけ王位にあって、その後、遠方へ追放されるならわし。"
-                        ]
-            },
-            {
-                        "item": "【通訳】",
-                        "stars": [
-                                    "★１．通訳をしつつ、他の人間にはわからないように情報の交換をする。",
-                                    "★２．正しく通訳したのに、「誤訳」と発表される。",
-                                    "★３．怪獣語を通訳する。"
-                        ]
-            },
-            {
-                        "item": "【杖】",
-                        "stars": [
-                                    "★１ａ．地にさした杖が根づき、葉が生じたり花が咲いたりする。",
-                                    "★１ｂ．杖に花が咲く。",
-                                    "★１ｃ．杖から鳩が出る。",
-                                    "★２．杖を用いて、水を湧き出させる。",
-                                    "★３．杖が蛇に化す。",
-                                    "★４ａ．魔法の杖で人を変身させる。",
-                                    "★４ｂ．魔法の杖で死体から猪を出す。"
-                        ]
-            },
-            {
-                        "item": "【月】",
-                        "stars": [
-                                    "★１．月の異変。人間の思いが月を曇らせる。",
-                                    "★２ａ．湖水に映る月を見て、「月が湖の中にある」と思う。",
-                                    "★２ｂ．水に映る月を取ろうとする。",
-                                    "★３．空の月を取る。",
-                                    "★４．空の月に追いかけられる。",
-                                    "★５．月の一部が無数の隕石となって、地球へ落下した。",
-                                    "★６．十二個の月。"
-                        ]
-            },
-            {
-                        "item": "【月の光】",
-                        "stars": [
-                                    "★１．月の光が、人間に大きな影響を与える。",
-                                    "★２．月を見ること・月の光に照らされることは、不吉であると考えられた。",
-                                    "★３．月を長く見ていると、命が縮まる。",
-                                    "★４．月の光に照らされた山や畑や谷が、布・海・雪などに見える。",
-                                    "★５．真白い角封筒と思ったら、真四角の月かげだった。"
-                        ]
-            },
-            {
-                        "item": "【月の満ち欠け】",
-                        "stars": [
-                                    "★１．月が痩せたり肥ったりする。",
-                                    "★２．竜などが月を食べるので、欠けて行く。",
-                                    "★３．月は欠けて姿を消しても、まもなくまた現れる。"
-                        ]
-            },
-            {
-                        "item": "【月の模様】",
-                        "stars": [
-                                    "★１．月面に、兎の姿が見える。",
-                                    "★２．月面に、茨や柴を運ぶ人が見える。",
-                                    "★３．月面に、水桶を運ぶ人が見える。",
-                                    "★４．月面に、手形の跡が見える。"
-                        ]
-            },
-            {
-                        "item": "【月旅行】",
-                        "stars": [
-                                    "★１．ロケットで月まで飛ぶ。",
-                                    "★２．バネ仕掛けの器械で月まで飛ぶ。",
-                                    "★３．豆のつるを攀じ登って月まで行く。",
-                                    "★４．船が風で月まで飛ばされる。",
-                                    "★５．月への逃亡。",
-                                    "★６．李白は月をとらえて（＊→〔月〕２ｂの李白の伝説）、月に移り住んだのか？"
-                        ]
-            },
-            {
-                        "item": "【辻占】",
-                        "stars": [
-                                    "★１．将来の運命を知るために、辻に立つ。道行く人が、将来の予言をしてくれる。",
-                                    "★２．通りかかる人の日常の普通の会話や独り言を、当面の自分の境遇にあてはめて解釈し、吉凶を占う。",
-                                    "★３．近くにいる人の日常の普通の会話を、当面の自分の問題にあてはめて解釈し、行動の指針とする。",
-                                    "★４．拾ったものを、当面の自分の問題にあてはめて解釈し、行動の指針とする。",
-                                    "★５．人の言葉を不吉な辻占と受け取って心配するが、取り越し苦労だった。"
-                        ]
-            },
-            {
-                        "item": "【土】",
-                        "stars": [
-                                    "★１．土は人間を造る材料になる。",
-                                    "★２．土と接触するとエネルギーが補給される。",
-                                    "★３．土と接触すると、地上のルールに従うことになる。",
-                                    "★４．土中から生まれる。",
-                                    "★５ａ．大地が裂けて、極悪人が呑みこまれる。",
-                                    "★５ｂ．親不孝者の最期。",
-                                    "★６．地の底へ沈む。",
-                                    "★７．地面から出現する。",
-                                    "★８．土を食べる。"
-                        ]
-            },
-            {
-                        "item": "【唾】",
-                        "stars": [
-                                    "★１ａ．唾を吐いて呪う。",
-                                    "★１ｂ．唾を吐いて相手を倒す・傷つける。",
-                                    "★１ｃ．唾を吐いて相手の姿を消す。",
-                                    "★２．相手に唾を吐かせる。",
-                                    "★３．吐き出された唾が、黄金に化す。",
-                                    "★４．唾をつける。"
-                        ]
-            },
-            {
-                        "item": "【壺】",
-                        "stars": [
-                                    "★１．壺の中の赤ん坊。",
-                                    "★２．壺の中の大空間。",
-                                    "★３．壺の中に閉じ込める。",
-                                    "★４．壺むすこ。",
-                                    "★５．クラインの壺。"
-                        ]
-            },
-            {
-                        "item": "【妻】",
-                        "stars": [
-                                    "★１．妻の愚行が大勢に不幸をもたらす。",
-                                    "★２．妻の愚行が夫に不幸や死をもたらす。",
-                                    "★３．妻が夫の宝を焼く。",
-                                    "★４ａ．妻が夫を待ち続けるが夫は帰らず、悲しみのうちに妻は死ぬ。",
-                                    "★４ｂ．妻が夫を待ちつづけるが、夫は妻を忘れる・あるいは捨てる。",
-                                    "★５．婚約者との結婚までの一年間を待ちきれず、女が他の男に心を移す。",
-                                    "★６ａ．妻の貞節を試す。",
-                                    "★６ｂ．愛人の貞節を試すために心中を迫る。",
-                                    "★７ａ．夫が別人に変身して、妻を試す・誘惑する。",
-                                    "★７ｂ．夫が別人に変装して、強引に妻を犯す。",
-                                    "★７ｃ．妻が、誘惑者の正体が夫だと見抜きながら、気づかぬふりをする。",
-                                    "★８．自分の妻と知らずに口説く。",
-                                    "★９．恐妻家たち。",
-                                    "★１０．妻の欲心。"
-                        ]
-            },
-            {
-                        "item": "【妻争い】",
-                        "stars": [
-                                    "★１．複数の男が、一人の女を得ようとして争う。女は男たちの内の一人と結婚する。",
-                                    "★２．複数の男が、一人の女を得ようとして争う。女は誰とも結婚せずに、遠い世界へ去る。",
-                                    "★３．大勢の男が、一人の女に求婚して争う。女は誰とも結婚せずに死に、男たちは諦める。"
-                        ]
-            },
-            {
-                        "item": "【妻食い】",
-                        "stars": [
-                                    "★１．夫（爺）が、知らずに妻（婆）の肉を食う。",
-                                    "★２．夫が愛妻の死を悲しみ、妻の肉を食べる。",
-                                    "★３．夫が妻の肉を、客に食べさせる。"
-                        ]
-            },
-            {
-                        "item": "【妻殺し】",
-                        "stars": [
-                                    "★１．男が自分の妻を殺す。",
-                                    "★２ａ．男が何人もの女と結婚し、次々に殺す。",
-                                    "★２ｂ．王が、大勢の妻を殺す。",
-                                    "★３．夫が直接手を下すのではないが、妻を死に追い込む。",
-                                    "★４．意図的に妻を殺したのか事故なのか、夫自身にもわからない。",
-                                    "★５．妻殺しの真の動機が、夫自身にもわからない。"
-                        ]
-            },
-            {
-                        "item": "【爪】",
-                        "stars": [
-                                    "★１．爪が、抜いても切ってもまた生えて来るわけ。",
-                                    "★２．爪と同様に、鬚や髪も、抜いても切ってもまた生えて来る。",
-                                    "★３．生爪を抜く。",
-                                    "★４．はがれた爪。"
-                        ]
-            },
-            {
-                        "item": "【釣り】",
-                        "stars": [
-                                    "★１ａ．釣りをする男が怪異に遭う。",
-                                    "★１ｂ．鰻釣りの名人が、鰻にされてしまう。",
-                                    "★２ａ．男が配偶者を釣り上げる。",
-                                    "★２ｂ．男が釣針を捜して異郷へ行き、配偶者を得る。",
-                                    "★２ｃ．女が釣りに行って人間の目をつかまえ、それが男に変わる。",
-                                    "★３．釣り人と王。",
-                                    "★４．釣り人と仏。",
-                                    "★５．幻術師の釣り。",
-                                    "★６．西洋人の釣り。",
-                                    "★７．島を釣る。",
-                                    "★８．釣りによる占い。"
-                        ]
-            },
-            {
-                        "item": "【鶴女房】",
-                        "stars": [
-                                    "★１．鶴が人間の男の妻になるが、のぞき見され、正体を知られたので、去って行く。",
-                                    "★２．のぞき見しなくても、時期がくれば鶴女房は去って行く。"
-                        ]
-            },
-            {
-                        "item": "【手】",
-                        "stars": [
-                                    "★１．手および腕を失う。",
-                                    "★２．手や指を身体の中に入れる。",
-                                    "★３ａ．怪物の手。",
-                                    "★３ｂ．怪人の手。",
-                                    "★４．巨大な手。",
-                                    "★５．麻痺した手。",
-                                    "★６ａ．手で女性器の形状をあらわす。魔を払う動作。",
-                                    "★６ｂ．神に「マノ・フィカ」を向けるのは、涜神のふるまいである。",
-                                    "★７．「手の指の間から子供がこぼれ落ちた」というのは、指の股から誕生したということであろう。",
-                                    "★８．自らの両臂を焼く。"
-                        ]
-            },
-            {
-                        "item": "【デウス・エクス・マキナ】",
-                        "stars": [
-                                    "★１．機械仕掛けの神。苦境にある作中人物の所へ現れて、一瞬のうちにすべてを解決してくれる神。",
-                                    "★２．苦境にある作中人物に救いの手を差しのべる、貴人・超人など神のごとき存在。"
-                        ]
-            },
-            {
-                        "item": "【手紙】",
-                        "stars": [
-                                    "★１ａ．他人あての手紙を、勝手に開封して読む。",
-                                    "★１ｂ．他人の手紙を手に入れ、当事者に売りつける。",
-                                    "★２ａ．「この手紙を持参した者を死なせよ」との手紙。",
-                                    "★２ｂ．「ダビデ」は英語では\"David\"。",
-                                    "★２ｃ．ダビデの物語の日本版。",
-                                    "★３．「死の手紙」を持たされたが、窮地を脱することができた。",
-                                    "★４．天界や水界にいる神や龍への手紙を託される。",
-                                    "★５．手紙の入れ違い。",
-                                    "★６．手紙の届け違い。",
-                                    "★７．開封されない手紙。読まれない手紙。",
-                                    "★８．投函されなかった手紙。",
-                                    "★９．三人にあてた一通の手紙。",
-                                    "★１０．死者からの手紙。",
-                                    "★１１．文通。"
-                        ]
-            },
-            {
-                        "item": "【手ざわり】",
-                        "stars": [
-                                    "★１．鷹の手ざわり。",
-                                    "★２．女性の身体の手ざわり。",
-                                    "★３．幽霊の手ざわり。",
-                                    "★４．一般に幽霊は、さわろうとして手をのばしても、手ごたえがなく、突き抜けてしまうことが多い。",
-                                    "★５．水の手ざわりと「w a t e r」という語。"
-                        ]
-            },
-            {
-                        "item": "【手相】",
-                        "stars": [
-                                    "★１．手相を見て未来を知る。",
-                                    "★２．手相が良くないので、何も言わない。",
-                                    "★３．手相で過去を知る。",
-                                    "★４．手相を見て、でたらめな予言をする。"
-                        ]
-            },
-            {
-                        "item": "【鉄】",
-                        "stars": [
-                                    "★１．鉄を食べる新人種。",
-                                    "★２．妊娠中に鉄を食べる。",
-                                    "★３．鉄を産む。",
-                                    "★４．鉄製のストーブ。"
-                        ]
-            },
-            {
-                        "item": "【掌】",
-                        "stars": [
-                                    "★１．掌に金貨を握って生まれる。",
-                                    "★２．掌に珠を握って生まれる。",
-                                    "★３．掌に、前世の夫や愛人に関わるものを握って生まれる。",
-                                    "★４．掌に凝血を握って生まれる。",
-                                    "★５．掌に、文字の書かれた紙を握って生まれる。",
-                                    "★６．掌に文字がある。",
-                                    "★７．仏の掌の中に世界がある。"
-                        ]
-            },
-            {
-                        "item": "【手毬唄】",
-                        "stars": [
-                                    "★１．手毬唄の歌詞。"
-                        ]
-            },
-            {
-                        "item": "【天】",
-                        "stars": [
-                                    "★１．生きた身で、天界を訪れる。",
-                                    "★２．天界の階層を昇って行く。",
-                                    "★３．身体は現世にありながら、心は天界へ昇る。",
-                                    "★４．死後、天に生まれる人は、ごく少数である。",
-                                    "★５．死後、天へ向かう人と、地上に転生する人。",
-                                    "★６．死後、天へ行く人と、地下へ行く人。",
-                                    "★７．いったん天に生まれても、その後に地獄へ堕ちることがある。"
-                        ]
-            },
-            {
-                        "item": "【天狗】",
-                        "stars": [
-                                    "★１．天狗が人と争う。天狗が人を助ける。",
-                                    "★２．天狗が人の運命を狂わせる。",
-                                    "★３．天狗が人をさらう。神隠しにあったと見なされる。",
-                                    "★４．天狗が人をさらって、八つ裂きにする。",
-                                    "★５．天狗の託宣。",
-                                    "★６．死後、天狗道に入る。",
-                                    "★７．天狗どうしの喧嘩。",
-                                    "★８．天狗が木を切り倒す。"
-                        ]
-            },
-            {
-                        "item": "【転校生】",
-                        "stars": [
-                                    "★１．不思議な転校生。",
-                                    "★２．転校生をいじめる。",
-                                    "★３．転校生が学園を支配する。"
-                        ]
-            },
-            {
-                        "item": "【天国】",
-                        "stars": [
-                                    "★１．金持ちが天国へ行くのは、きわめてまれである。",
-                                    "★２．心が悪ければ、天国へ行けない。",
-                                    "★３．悪人も、改心すれば天国へ行く。",
-                                    "★４．父母と別れて、自分だけ天国へ行くことはできない。",
-                                    "★５．使命を果たさず死んだため天国へ直行できず、天国と地獄の中間に留め置かれる。",
-                                    "★６．天国は宇宙の彼方にあるのか。",
-                                    "★７．天国から、さらにその上の天国へ避難する。"
-                        ]
-            },
-            {
-                        "item": "【天使】",
-                        "stars": [
-                                    "★１．天使が降下して、人間の女と結ばれる。",
-                                    "★２．天使が人間の女を恋するが、結ばれない。",
-                                    "★３．神に反逆する天使。",
-                                    "★４．年老いた天使。",
-                                    "★５．天使は、死者の魂を天国まで運ぶ。",
-                                    "★６．毛虫が変態して蝶になるように、人間も姿かたちを変えて天使になる。"
-                        ]
-            },
-            {
-                        "item": "【転生】",
-                        "stars": [
-                                    "★１．同じ名または類似した名で生まれ変わる。",
-                                    "★２．転生後も、前世の容貌や性質を受け継ぐ。",
-                                    "★３．神や天人が悪魔と戦うために、人間となって地上に転生する。",
-                                    "★４．仙境の存在が俗世間の生活に関心を持ち、人間となって下界に転生する。",
-                                    "★５ａ．死んだ後、間をおかずに、すぐまたこの世に生まれる。",
-                                    "★５ｂ．死んだ後、間をおかずに、他の惑星（あるいはもとの惑星）に生まれ変わる。",
-                                    "★５ｃ．「私」がまだ生きているのに、「私」の生まれ変わりの少年が現れた。",
-                                    "★６．転生しかけて、またもとの身体に戻る。",
-                                    "★７．死後、地上に転生するかしないかの境目。",
-                                    "★８．輪廻転生の始めと終わり。"
-                        ]
-            },
-            {
-                        "item": "【転生（動物への）】",
-                        "stars": [
-                                    "★１．牛に転生して、現世の悪行を償う。",
-                                    "★２．現世に残した物への執着により、蛇に転生する。",
-                                    "★３．魚への転生。",
-                                    "★４ａ．人間は死んだ後に、各氏族の祖先である動物に転生する。",
-                                    "★４ｂ．キリスト教に改宗すれば、動物に転生せずにすむ。",
-                                    "★５．人間のまま転生し続けることは稀で、前世で動物だったり、来世で動物になったりするのが普通である。"
-                        ]
-            },
-            {
-                        "item": "【転生する男女】",
-                        "stars": [
-                                    "★１．男が女と死別するが、女はまもなくこの世に再誕して、恋しい男と結ばれる。",
-                                    "★２．夫のもとを去った鶴女房が人間に転生して、ふたたび夫と結婚する。",
-                                    "★３．死んだ妻が金星人に転生して、夫と再会する。",
-                                    "★４．愛し合う男女が、ともに転生する。",
-                                    "★５．相思相愛の男女が結婚できなかった。その孫の世代の二人も、互いを慕いつつ結婚できなかった。",
-                                    "★６．男は死後、転生してこの世に再誕するが、女は死後、転生せず霊界にとどまる。"
-                        ]
-            },
-            {
-                        "item": "【転生と性転換】",
-                        "stars": [
-                                    "★１．男から女へ、性を変えて転生する。",
-                                    "★２．女から男へ、性を変えて転生する。",
-                                    "★３．転生者に、妻となり夫となってまとわりつく。",
-                                    "★４．転生に際して性を変える法則。",
-                                    "★５．同性のまま転生することもある。"
-                        ]
-            },
-            {
-                        "item": "【転生と天皇】",
-                        "stars": [
-                                    "★１．僧が転生して天皇になる。",
-                                    "★２．聖徳太子が転生して聖武天皇になった。",
-                                    "★３．ヤマタノヲロチが転生して安徳天皇になった。",
-                                    "★４．大蛇が転生して天皇になるのとは逆に、天皇が転生して大龍になる。",
-                                    "★５．前世の行ないがたいへん良かったので、今世で天皇に生まれたが、来世は無間地獄に堕ちるかもしれない。"
-                        ]
-            },
-            {
-                        "item": "【転生先】",
-                        "stars": [
-                                    "★１ａ．冥府で、次の生での転生先を選ぶ。",
-                                    "★１ｂ．冥府で、次の生での転生先を指定される。",
-                                    "★２．霊界の神的存在が、転生すべき家を明確に指示する。",
-                                    "★３．恩人の家に転生する。",
-                                    "★４．自分の家に転生する。",
-                                    "★５ａ．何気ない一言や、死ぬ時に見たものによって、転生先が決まる。",
-                                    "★５ｂ．死ぬ時の一念によって、転生先が決まる。",
-                                    "★５ｃ．めぐり会った女性によって、転生先が決まる。",
-                                    "★６．転生先を間違える。",
-                                    "★７．転生先を知らせる。"
-                        ]
-            },
-            {
-                        "item": "【天井】",
-                        "stars": [
-                                    "★１．天井の妖怪。",
-                                    "★２．つり天井。",
-                                    "★３．天井が下りてきて人を押しつぶす。",
-                                    "★４．天井裏に大事な物を隠す。"
-                        ]
-            },
-            {
-                        "item": "【電信柱】",
-                        "stars": [
-                                    "★１．夜に歩く電信柱。",
-                                    "★２．高原の木が、町の電信柱になった。",
-                                    "★３．電信柱と柳の木の恋。",
-                                    "★４．電信柱の上に出る幽霊。",
-                                    "★５．電信は速い。"
-                        ]
-            },
-            {
-                        "item": "【天地】",
-                        "stars": [
-                                    "★１．天地開闢以前の太初の混沌。",
-                                    "★２ａ．天地は卵から生まれた。",
-                                    "★２ｂ．卵のような混沌から天地が分かれる。",
-                                    "★２ｃ．卵のような天地の殻外へ出る。",
-                                    "★３ａ．初めの頃、天と地はそれほど離れていなかった。",
-                                    "★３ｂ．天地が離れていなかった時代の人。",
-                                    "★３ｃ．手で天に触れることができた時代。",
-                                    "★４．神や巨人が、天地を分ける。",
-                                    "★５．天が傾く。",
-                                    "★６．天空の破壊と修復。"
-                        ]
-            },
-            {
-                        "item": "【天人降下】",
-                        "stars": [
-                                    "★１ａ．人の琴や琵琶などの演奏に応じて、天人が舞う。",
-                                    "★１ｂ．天女が羽衣を返してもらうことと引き換えに、舞いを見せる。",
-                                    "★２．天人が、地上の人を天界へ連れて行こうとする。",
-                                    "★３．天人がお告げや予言を与える。",
-                                    "★４ａ．天人が、地上の人間に転生して降下する。",
-                                    "★４ｂ．天人が地上に生まれても、短期間で天に戻ってしまうことがある。"
-                        ]
-            },
-            {
-                        "item": "【天人女房】",
-                        "stars": [
-                                    "★１．天女が降下して地上の男と結婚し、後に天へ帰る。",
-                                    "★２．天女が地上の男を富ませ、良い妻をめとらせるべく、降下する。",
-                                    "★３．天女の産んだ子が帝王になる。",
-                                    "★４．妻の死が、天への帰還だったことが後にわかる。",
-                                    "★５．天女が人間の男と結婚し、添い遂げる。"
-                        ]
-            },
-            {
-                        "item": "【天人の衣】",
-                        "stars": [
-                                    "★１．天衣無縫。",
-                                    "★２．天女（仙女）の衣を奪う。",
-                                    "★３．天女でなくとも、衣服を奪われては、たいへん困ったことになる。"
-                        ]
-            },
-            {
-                        "item": "【電話】",
-                        "stars": [
-                                    "★１．電話のかけ間違え。",
-                                    "★２．他人あての電話に出てしまう。",
-                                    "★３．通じなかった電話。",
-                                    "★４．死者からの電話。",
-                                    "★５．電話を利用した殺人計画。",
-                                    "★６．長電話をして、相手をその場から動かさない。",
-                                    "★７．携帯電話。"
-                        ]
-            },
-            {
-                        "item": "【同一人物】",
-                        "stars": [
-                                    "★１．まったく無関係な別人であるはずの二人が、実は同一人物だったことがわかる。",
-                                    "★２．叔母と亡父が同一人物であることに気づかない。",
-                                    "★３．記憶喪失の夫が、かつての妻と現在の妻が同一人物であることに気づく。",
-                                    "★４．同一人物である証拠の目印。"
-                        ]
-            },
-            {
-                        "item": "【同音異義】",
-                        "stars": [
-                                    "★１ａ．同じ発音の別語。",
-                                    "★１ｂ．「芽」と「目」という同音異義語を用いて、兄弟の生き方の違いを語る。",
-                                    "★２．類似した発音の別語。",
-                                    "★３．同音のため、別の語と勘違いする。",
-                                    "★４．知らない言葉を聞き、その言葉と同音のものを捜す。",
-                                    "★５．同じ言葉で、正反対の二つの解釈ができるような物言いをする。",
-                                    "★６．人の言った言葉を、ことさらに別の意味に解釈して、利益を得る。",
-                                    "★７ａ．「翁」という語の意味。",
-                                    "★７ｂ．\"Instrument\"という語の意味。"
-                        ]
-            },
-            {
-                        "item": "【盗作・代作】",
-                        "stars": [
-                                    "★１．他人の著作物を盗む。",
-                                    "★２ａ．他人の詩の一部を改変し、自作として披露する。",
-                                    "★２ｂ．翻訳に手を入れ、自作として発表する。",
-                                    "★３．知らずに、過去の大作家の作品を盗作してしまう。",
-                                    "★４．オリジナルの作品なのに、「盗作だ」と非難される。",
-                                    "★５．高名な作家の作品は、実は別人が代作していたのだった。",
-                                    "★６．病気の少女の描いた漫画を、その恋人の青年の名前で発表する。"
-                        ]
-            },
-            {
-                        "item": "【同日の死】",
-                        "stars": [
-                                    "★１．同日に死ぬ二人。",
-                                    "★２．同日に死ぬ夫婦と愛馬。",
-                                    "★３．同日に死ぬ大勢の人。",
-                                    "★４．同日に病気になる、という物語もある。",
-                                    "★５．何年か後の同月同日、もしくは命日の死。",
-                                    "★６．殺人者が、人を殺した翌年の同月同日に殺される。",
-                                    "★７．殺人者が、人を殺してから七年目の同月同日に病死する、もしくは処刑される。",
-                                    "★８．「同日に死のう」と誓う三人の義兄弟。",
-                                    "★９．「同日に死にたい」と神に願う夫婦。"
-                        ]
-            },
-            {
-                        "item": "【同日の誕生】",
-                        "stars": [
-                                    "★１．同日に誕生する二人。",
-                                    "★２．同日に誕生する人と馬。",
-                                    "★３．同日に誕生する人間の子と悪魔の子。",
-                                    "★４．甲が乙を殺す。乙が死んだ日に丙が生まれる。丙は多年の後に甲を処刑する。"
-                        ]
-            },
-            {
-                        "item": "【投身自殺】",
-                        "stars": [
-                                    "★１．高所から地面へ身を投げて死ぬ。",
-                                    "★２．高所から身を投げても、神仏の助けがあれば無事である。",
-                                    "★３．投身自殺に見せかけて、人を高所から投げ落とす。",
-                                    "★４．高い断崖から身を投げたつもりが、そうではなかった。",
-                                    "★５．高い塔から投身自殺して冥府へ行こうと考えたが、別の道筋に変更する。"
-                        ]
-            },
-            {
-                        "item": "【同性愛】",
-                        "stars": [
-                                    "★１．男性が男性を愛する。",
-                                    "★２．同性愛の現場を見られて自殺する。",
-                                    "★３．女性が女性を愛する。",
-                                    "★４．同性愛者だ、との噂。"
-                        ]
-            },
-            {
-                        "item": "【逃走】",
-                        "stars": [
-                                    "★１．ものを投げ捨て、追っ手がそれを拾ううちに遠くへ逃げる。",
-                                    "★２．男が、蛇と化した女から逃走する。",
-                                    "★３ａ．青年が、愛人である女から逃走する。",
-                                    "★３ｂ．逃走する男が、女に追いつかれて夫婦になる。",
-                                    "★４．臆病者が、逃げ回りつつ敵を追う。",
-                                    "★５．逃げる必要もないのに誤解して逃走する。",
-                                    "★６．襲われたと誤解して、腰を抜かす。",
-                                    "★７．集団の逃走。"
-                        ]
-            },
-            {
-                        "item": "【童貞】",
-                        "stars": [
-                                    "★１．童貞を守る。",
-                                    "★２．三十男の童貞。",
-                                    "★３．童貞を捨てる。"
-                        ]
-            },
-            {
-                        "item": "【動物援助】",
-                        "stars": [
-                                    "★１．人間の仕事を、動物が手伝う。",
-                                    "★２．人間に課せられた難題を、動物が解決する。",
-                                    "★３．動物が、弱い娘を救う。",
-                                    "★４．戦争の時、動物が一方に加勢する。"
-                        ]
-            },
-            {
-                        "item": "【動物音声】",
-                        "stars": [
-                                    "★１．犬や猫の鳴き声が、人間の言葉に聞こえる。",
-                                    "★２．牛の鳴き声が、読経に聞こえる。",
-                                    "★３．鳥の鳴き声が、人間の言葉に聞こえる。",
-                                    "★４．鸚鵡の言葉。",
-                                    "★５．狐の鳴き声。",
-                                    "★６．人間の悲鳴が、動物の鳴き声に聞こえる。",
-                                    "★７．人間が、鼠の鳴き声を真似る。"
-                        ]
-            },
-            {
-                        "item": "【動物教導】",
-                        "stars": [
-                                    "★１．何種類かの動物が、人間に知識や技術を教える。",
-                                    "★２．動物が、犯罪・犯人をあばく。",
-                                    "★３ａ．動物の性交を見て、男女が性交のしかたを学ぶ。",
-                                    "★３ｂ．動物の動きを見て、男女が性交のしかたを悟る。"
-                        ]
-            },
-            {
-                        "item": "【動物犯行】",
-                        "stars": [
-                                    "★１．人間が盗んだ、と思われたものが、実は動物の仕業だった。",
-                                    "★２．人間の悪戯と思われたものが、実は動物の仕業だった。",
-                                    "★３．人間の犯した殺人と思われていたものが、実は動物の仕業だった。",
-                                    "★４．動物の仕業と思われたものが、実は人間の犯行だった。"
-                        ]
-            },
-            {
-                        "item": "【動物傅育】",
-                        "stars": [
-                                    "★１．幼い王の子などを、動物が世話をして育てる。",
-                                    "★２．赤ん坊を育てる犬の素性について考える。"
-                        ]
-            },
-            {
-                        "item": "【同名の人】",
-                        "stars": [
-                                    "★１．同名異人。",
-                                    "★２．同名で瓜二つであるが、双子ではない。",
-                                    "★３．神話伝説中の人物と同名の現代人。",
-                                    "★４．「アドルフ」というファースト・ネームを持つ三人の男。",
-                                    "★５．同名の人と動物。",
-                                    "★６．同名の人と都市。",
-                                    "★７ａ．同じ名前の人がいれば、死すべき人の代わりに冥府へ送ることができる。",
-                                    "★７ｂ．同名で異姓の人が、冥府へ送られる。",
-                                    "★８．好きになった女性が、皆同じ名前。",
-                                    "★９．同じ名前の二万の仏。"
-                        ]
-            },
-            {
-                        "item": "【毒】",
-                        "stars": [
-                                    "★１ａ．毒殺。",
-                                    "★１ｂ．毒殺の失敗。",
-                                    "★１ｃ．毒殺と服毒自殺。",
-                                    "★２．毒殺される人を救おうと、その身代わりになって毒を飲む。",
-                                    "★３．別人に送られたチョコレートを、毒入りと知らずに食べて死ぬ。",
-                                    "★４．毒入りの弁当。",
-                                    "★５．ふぐの毒見（毒味）。",
-                                    "★６．きのこの毒見（毒味）。",
-                                    "★７．菓子を「毒だ」と言う。",
-                                    "★８．毒で育てられた美女。"
-                        ]
-            },
-            {
-                        "item": "【毒酒】",
-                        "stars": [
-                                    "★１．毒酒を飲ませて殺す。",
-                                    "★２．敵には毒酒、味方には薬酒となる、不思議な酒。",
-                                    "★３．銚子に仕掛けをして、相手にだけ毒酒を飲ませる。"
-                        ]
-            },
-            {
-                        "item": "【毒蛇】",
-                        "stars": [
-                                    "★１．毒蛇を踏んで噛まれる妻。",
-                                    "★２．毒蛇で人を殺そうとした人自身が、毒蛇に噛まれて死ぬ。",
-                                    "★３．毒蛇にも害されない人。",
-                                    "★４ａ．毒蛇に毒を吸い戻させる。",
-                                    "★４ｂ．「毒を吸い戻せ」と毒蛇に命ずる。",
-                                    "★５．人語を解する蝮（まむし）。",
-                                    "★６．毒蛇が転生して仏弟子になった。",
-                                    "★７．仏像・仏舎利が毒蛇になった、という物語もある。"
-                        ]
-            },
-            {
-                        "item": "【髑髏】",
-                        "stars": [
-                                    "★１ａ．父親の髑髏。",
-                                    "★１ｂ．父母の髑髏。",
-                                    "★１ｃ．兄の髑髏。",
-                                    "★１ｄ．幼い頃の髑髏。",
-                                    "★２ａ．旅人が無縁仏の髑髏を見る。",
-                                    "★２ｂ．旅人が無縁仏の髑髏の苦を救い、供養をする。髑髏がその恩返しをする。",
-                                    "★３．旅人が美女と語り明かすが、翌朝見ると、髑髏があるだけだった。",
-                                    "★４．無数の前世の無数の髑髏。",
-                                    "★５．仏法を聞いた人の髑髏と、聞かなかった人の髑髏。",
-                                    "★６．髑髏を叩いて、どこに転生したか判定する。",
-                                    "★７．財宝の道しるべとしての髑髏。",
-                                    "★８．髑髏の酒器。",
-                                    "★９．正月に髑髏を捧げて歩く。",
-                                    "★１０．髑髏を見て、生前の顔を幻視する。",
-                                    "★１１．赤ん坊の頭蓋骨。"
-                        ]
-            },
-            {
-                        "item": "【時計】",
-                        "stars": [
-                                    "★１．十二時を打つ時計。",
-                                    "★２．正午なのに十三時を打つ時計。",
-                                    "★３．六時なのに七時を打つ時計。",
-                                    "★４．時計を遅らせて時間をごまかす。",
-                                    "★５．日暮れを告げる寺の鐘を、日没以前に鳴らして時間をごまかす。",
-                                    "★６．時計を止めて時間をごまかす。",
-                                    "★７．夫や子供や客が少しずつ進めた時計の針を、主婦がいっぺんに戻してしまう。",
-                                    "★８．進んだり遅れたりする時計。",
-                                    "★９．遅れることによって、持ち主の命を救った時計。",
-                                    "★１０．異なった時刻を指す二つの時計。",
-                                    "★１１．同じ時刻で止まった二つの時計。",
-                                    "★１２．何時かわからない時計。",
-                                    "★１３．不思議な砂時計。"
-                        ]
-            },
-            {
-                        "item": "【土葬】",
-                        "stars": [
-                                    "★１ａ．土葬された人間が生き返る。",
-                                    "★１ｂ．土葬された人間を生き返らせる。",
-                                    "★２．土葬された女が子を産む。",
-                                    "★３．土葬された人が蘇生したが、身体に障害が残った。",
-                                    "★４．土葬された死者になりすまし、蘇生したかのように見せかける。",
-                                    "★５．火葬か土葬かが、生死の分かれ目。"
-                        ]
-            },
-            {
-                        "item": "【土地】",
-                        "stars": [
-                                    "★１ａ．一日で歩ける範囲の土地を得る。",
-                                    "★１ｂ．三歩で歩ける範囲の土地を得る。",
-                                    "★２ａ．自分の持っている土くれで、他人の広い土地をおおう。",
-                                    "★２ｂ．動物の皮一枚を紐状に切って、広い土地を囲む。",
-                                    "★３．土を得るのは、土地を手に入れることに通ずる。",
-                                    "★４．泥を得るのは、国を得る予兆である。",
-                                    "★５．土塊を得て、それが島になった。",
-                                    "★６．海の底の泥から大地を造る。",
-                                    "★７．水に浮かんだ土埃から、陸地ができる。",
-                                    "★８ａ．国土を造成して広くする。",
-                                    "★８ｂ．海の向こうの土地を引き寄せて、国土とする。",
-                                    "★８ｃ．国土がすべて買い取られ、宇宙の彼方へ持って行かれる。",
-                                    "★９．領地が競売にかけられる。",
-                                    "★１０．土地をめぐる争い。",
-                                    "★１１．生まれた土地に守られる人。",
-                                    "★１２．「無用」と見えて必要な土地。"
-                        ]
-            },
-            {
-                        "item": "【隣の爺】",
-                        "stars": [
-                                    "★１．幸運を得た爺の、隣に住む爺が真似をして失敗する。",
-                                    "★２．婆が真似をして失敗する物語もある。"
-                        ]
-            },
-            {
-                        "item": "【扉】",
-                        "stars": [
-                                    "★１．扉を開く方法。",
-                                    "★２．扉を開くことができるただ一人の人。",
-                                    "★３ａ．遠くの場所へ通じる扉。どこでもドア。",
-                                    "★３ｂ．異郷へ通ずる扉。",
-                                    "★４．半開きの扉。",
-                                    "★５ａ．七番目の扉を開ける〔＊→『青ひげ』（ペロー）の変型〕。",
-                                    "★５ｂ．十三番目の扉を開ける。",
-                                    "★６．回転扉。",
-                                    "★７ａ．岩の扉を、天界から地上へ投げ落とす。",
-                                    "★７ｂ．岩の扉を怪力で割る。",
-                                    "★８．戸締りをする文明と戸締りをしない文明。",
-                                    "★９．黒い扉だと思ったら、夜の闇だった。"
-                        ]
-            },
-            {
-                        "item": "【妬婦】",
-                        "stars": [
-                                    "★１ａ．嫉妬する妻が、夫のもう一人の妻を殺す。",
-                                    "★１ｂ．妻が生霊・死霊となって、夫のもう一人の妻を取り殺す。",
-                                    "★１ｃ．妻が死霊となって、夫のもう一人の妻を取り殺し、ついで夫の命をも奪う。",
-                                    "★１ｄ．もとの妻が、新たな妻を迎えた夫を殺す。",
-                                    "★１ｅ．嫉妬する妻が、死後多くの美女にたたる。",
-                                    "★１ｆ．嫉妬する妻が、夫の愛する火桶を壊す。",
-                                    "★２．神々の妻の嫉妬。",
-                                    "★３．后の嫉妬。",
-                                    "★４．妹への嫉妬。",
-                                    "★５．嫉妬する女の怒りの形相。"
-                        ]
-            },
-            {
-                        "item": "【ともし火】",
-                        "stars": [
-                                    "★１．ともし火は命の火でもある。ともし火が消えると人も死ぬ。",
-                                    "★２ａ．「世人が愚かだから」と言って、白昼に火をともす。",
-                                    "★２ｂ．白昼に火をともして、人間を探す。",
-                                    "★２ｃ．白昼に火をともして、神を探す。",
-                                    "★２ｄ．白昼に火をともすのとは逆に、闇夜に灯を消して真っ暗にする。それで悟りを開いた人がいる。",
-                                    "★３．闇夜のともし火を守る。",
-                                    "★４．ともし火を消す女。",
-                                    "★５．ともし火代わりに、家に火をつける。",
-                                    "★６．電燈。"
-                        ]
-            },
-            {
-                        "item": "【虎】",
-                        "stars": [
-                                    "★１．虎退治。",
-                                    "★２．絵の虎。",
-                                    "★３．心身を病んだ人間が、虎に変わる。",
-                                    "★４．虎に変身する術。",
-                                    "★５．虎に自分の身体を食わせる。",
-                                    "★６．虎に食われないように、いろいろな物を与えて逃れる。",
-                                    "★７．虎の皮。"
-                        ]
-            },
-            {
-                        "item": "【鳥】",
-                        "stars": [
-                                    "★１．鳥が飛び入る。",
-                                    "★２．鳥が手紙を運ぶ。",
-                                    "★３．鳥が宝石を呑み込む。",
-                                    "★４．鳥の大群が、不特定多数の人々を襲う。",
-                                    "★５．一羽の鳥が、恨みのある人を襲う。",
-                                    "★６．聖者が鳥に説教する。",
-                                    "★７．鳥を探す。",
-                                    "★８．絵に描かれた鳥の不思議。",
-                                    "★９．双頭の鳥。",
-                                    "★１０．鳥の化身である夫。"
-                        ]
-            },
-            {
-                        "item": "【鳥に化す】",
-                        "stars": [
-                                    "★１．人が死後に鳥に化す。",
-                                    "★２．人が生きたまま鳥に化す。",
-                                    "★３．鳥になろうとして、なれなかった少年。"
-                        ]
-            },
-            {
-                        "item": "【鳥の教え】",
-                        "stars": [
-                                    "★１．鳥の行動に教えられる。",
-                                    "★２．鳥の行動から、人生や男女関係についての教訓を得る。",
-                                    "★３．鳥に導かれて移動する。",
-                                    "★４．鳥が、死体のありかを教える。",
-                                    "★５．鳥が、盗難を教える。",
-                                    "★６．千鳥の香炉が、身の危険を教える。",
-                                    "★７．鳥の言葉に教えられる。",
-                                    "★８．何らかのきっかけで、鳥の言葉が理解できるようになる。"
-                        ]
-            },
-            {
-                        "item": "【取り合わせ】",
-                        "stars": [
-                                    "★１．本来無関係の男女が、隣り合って並んでいるために、夫婦・恋人と見なされる。",
-                                    "★２．男女二人の死体が同じ所に並んでいれば、心中と見なされやすい。",
-                                    "★３．Ａ地点の住所と、それとは無関係なＢ地点の電話番号を、隣り合わせに並べて記す。",
-                                    "★４．大きなものと小さなものの取り合わせ。",
-                                    "★５．奇妙な取り合わせ。",
-                                    "★６．食べ合わせ。"
-                        ]
-            },
-            {
-                        "item": "【取り替え子】",
-                        "stars": [
-                                    "★１ａ．生まれたばかりの赤ん坊を、他人の子と取り替える。",
-                                    "★１ｂ．生まれたばかりの赤ん坊を、猪の子とすりかえる。",
-                                    "★２．生まれる前に取り替える。",
-                                    "★３．幼い子を取り替える・取り違える。",
-                                    "★４．子を取り替えて育てる。",
-                                    "★５．若君と乳人子（めのとご）を取り替えたように見なされる（＊実際は、取り替え子ではなかった）。",
-                                    "★６．悪魔や魔法使いなどが人間の赤ん坊をさらい、代わりに自分の子を置いておく。",
-                                    "★７．悪魔が人間の赤ん坊をさらった後、悪魔自身が赤ん坊に変身して、人間の父母のもとにとどまる。",
-                                    "★８．ジプシーが美しい女児をさらい、代わりに化け物のような醜い男児を置いておく。"
-                        ]
-            },
-            {
-                        "item": "【取り違え】",
-                        "stars": [
-                                    "★１．白粉（おしろい）と眉墨を取り違える。",
-                                    "★２．主人の着物と間男の着物を取り違える。",
-                                    "★３．手拭いと越中ふんどしを取り違える。",
-                                    "★４．出来の良い作品と悪い作品を取り違える。",
-                                    "★５．蝸牛と山伏を取り違える。",
-                                    "★６．見知らぬ人どうしが、買った本の包みを取り違える。",
-                                    "★７．あわて者が、あらゆるものを取り違える。"
-                        ]
-            },
-            {
-                        "item": "【取り違え花婿】",
-                        "stars": [
-                                    "★１．男が、女の居所近くにいたため、その愛人と間違えられる。"
-                        ]
-            },
-            {
-                        "item": "【取り違え花嫁】",
-                        "stars": [
-                                    "★１．男が、目当ての女性とは別の人を誤って連れ出す。",
-                                    "★２．妻だと思って抱き寄せたら、犬だった。"
-                        ]
-            },
-            {
-                        "item": "【取り違え夫婦】",
-                        "stars": [
-                                    "★１．手違いによって、夫婦交換をしてしまう。"
-                        ]
-            },
-            {
-                        "item": "【泥棒】",
-                        "stars": [
-                                    "★１．宝石泥棒。",
-                                    "★２．金塊泥棒。",
-                                    "★３．泥棒が、「金目（かねめ）のものだろう」と思って、死体を盗んで行く。",
-                                    "★４．泥棒が盗んだと思ったら、そうではなかった。",
-                                    "★５．泥棒に入られる。",
-                                    "★６．逃げ道がわからない泥棒。"
-                        ]
-            },
-            {
-                        "item": "【トンネル】",
-                        "stars": [
-                                    "★１ａ．トンネルを抜けて異郷へ行く。",
-                                    "★１ｂ．トンネルを抜けて死者の国へ行く。",
-                                    "★１ｃ．トンネルを抜けて過去の世界へ行く。",
-                                    "★２．通行の難所にトンネルを掘る。",
-                                    "★３ａ．銀行の地下金庫までトンネルを掘る。",
-                                    "★３ｂ．愛人の住む城までトンネルを掘る。",
-                                    "★４．トンネルを掘って脱獄をはかるが、失敗する。",
-                                    "★５．壁のトンネルを、ポスターで隠す。",
-                                    "★６．トンネルに出る幽霊。",
-                                    "★７．抜けられないトンネル。"
-                        ]
-            },
-            {
-                        "item": "【菜】",
-                        "stars": [
-                                    "★１．菜を摘む女に、王が求婚する。",
-                                    "★２．菜（あるいは桑）を摘む女が、王の后になる。",
-                                    "★３．菜を摘む女に、蛇や霊が寄って来る。",
-                                    "★４．男が桑を摘む女を見て、それが自分の妻と気づかず口説く。",
-                                    "★５．転生した子の口に菜っ葉。"
-                        ]
-            },
-            {
-                        "item": "【名当て】",
-                        "stars": [
-                                    "★１．未知の植物（煙草）の名を当てるための計略。",
-                                    "★２．立ち聞きすることによって、鬼などの秘密の名前を言い当てる。",
-                                    "★３．思わず口にした言葉が、秘密の名前を偶然言い当てる。",
-                                    "★４．秘密の名前を言い当てることができない人に、正答を教える。"
-                        ]
-            },
-            {
-                        "item": "【長い眠り】",
-                        "stars": [
-                                    "★１．数十年から数百年の眠り。",
-                                    "★２．野山や森へ行き、二十年～百年も眠ってしまったことに気づかず、家へ帰る。",
-                                    "★３．永遠の眠り。",
-                                    "★４．滅尽定（完全な無念無想の禅定）。",
-                                    "★５．人類の睡眠時間が、しだいに長くなる。",
-                                    "★６．長く眠る怪物。"
-                        ]
-            },
-            {
-                        "item": "【流れ星】",
-                        "stars": [
-                                    "★１．宇宙飛行士が、宇宙空間から地球の大気圏へ落下する。地上からは流れ星に見える。",
-                                    "★２．流れ星を見る母子。",
-                                    "★３．夜の闇の中を、流れ星のように光を放って飛んで行く魂。"
-                        ]
-            },
-            {
-                        "item": "【泣き声】",
-                        "stars": [
-                                    "★１．泣き声を聞き分ける。",
-                                    "★２．女の泣き声の中にある嘘を聞き取る。",
-                                    "★３．同じ一人の女の、嘘泣きと本泣き。",
-                                    "★４．泣き声と思ったら風の音だった。",
-                                    "★５．だんだん大きくなる泣き声。"
-                        ]
-            },
-            {
-                        "item": "【謎】",
-                        "stars": [
-                                    "★１．怪物が人間に、怪物の正体を問う謎を出す。",
-                                    "★２．怪物が人間に、答えが「人間」である謎を出す。",
-                                    "★３．女が住居、逢い引きの日時などを謎の形で告げる。",
-                                    "★４．歌の形の謎。",
-                                    "★５．答えのない謎。解決のつかない物語。",
-                                    "★６．ＡかＢかという謎に対して、ＡでもＢでもない第三の解答が示される。",
-                                    "★７．Ａグループの人からはＢグループの一員と見なされ、Ｂグループの人からはＡグループの一員と見なされる、謎の人物。",
-                                    "★８．ある詩句や語句が、物語の登場人物の運命を大きく変える。しかし、詩句・語句の内容そのものは物語の中で明かされず、読者にとっては謎のままに、物語が終わる。"
-                        ]
-            },
-            {
-                        "item": "【名付け】",
-                        "stars": [
-                                    "★１．名付け親。",
-                                    "★２．子供の名前をつけ間違える。",
-                                    "★３．子供に名前をつけない。",
-                                    "★４．ひ弱な子が健康に育つように、強い動物の名前をつける。",
-                                    "★５．親から与えられた名前に、ふさわしくありたいと思う。",
-                                    "★６ａ．妻が、夫との間にできた子供に、かつて夫が愛した女性の名前をつける。",
-                                    "★６ｂ．人妻が、愛人との間にできた子供に、愛人と同じ名前をつける。",
-                                    "★７．自分の名前を敵に与えて死んでゆくのは、生まれてくる子供に愛する人の名前をつける物語と、関連があるであろう。",
-                                    "★８．死者に戒名をつける。",
-                                    "★９．たまたま目にしたものと、自分の年齢とから、適当な名前をつける。",
-                                    "★１０．災いを避けるために、名前を変える。",
-                                    "★１１．良くないことが起こったために、名前を変える。",
-                                    "★１２．次々に新たな呼び名がつけられる。",
-                                    "★１３．命名の起源。",
-                                    "★１４．誤解によって名前がつく。"
-                        ]
-            },
-            {
-                        "item": "【名前】",
-                        "stars": [
-                                    "★１ａ．威力ある名前（イエス＝キリスト）。",
-                                    "★１ｂ．威力ある名前（聖母マリア）。",
-                                    "★１ｃ．威力ある名前（仏）。",
-                                    "★１ｄ．威力ある名前（獏）。",
-                                    "★２．自分の名前を忘れる。",
-                                    "★３．名前の呼び方の不審。",
-                                    "★４．怪物などから名前を呼ばれる。",
-                                    "★５．怪物などから名前を問われても教えない。",
-                                    "★６．秘密の名前を知られたら、もはやその場にとどまれない。",
-                                    "★７ａ．名前と命。誰が名前をつけるかによって、生まれた子供の生死が左右される。",
-                                    "★７ｂ．名前と命。長い名前を唱えている間に、子供が死んでしまう。",
-                                    "★８．名前と形。",
-                                    "★９．名は体をあらわす。",
-                                    "★１０．珍しい姓。"
-                        ]
-            },
-            {
-                        "item": "【波】",
-                        "stars": [
-                                    "★１．大波が、陸地の奥にまで到る。",
-                                    "★２．高波を幻視する。",
-                                    "★３．浪の音で天候を予知する。",
-                                    "★４．波を数える。",
-                                    "★５．光り輝く波。",
-                                    "★６．津波よけの酒かす。",
-                                    "★７．津波を予知する。",
-                                    "★８．巨大な津波。"
-                        ]
-            },
-            {
-                        "item": "【涙】",
-                        "stars": [
-                                    "★１．涙の力で開眼する。",
-                                    "★２．涙の力で蘇生する。",
-                                    "★３．涙の力で本来の心を取り戻す。",
-                                    "★４．涙が毒となって死をもたらす。",
-                                    "★５．紅玉の涙。真珠の涙。",
-                                    "★６．涙の海。",
-                                    "★７．涙が枯れるまで泣き続ける。",
-                                    "★８．いつまでも止まらない涙。",
-                                    "★９．血の涙を流す。",
-                                    "★１０．うその涙"
-                        ]
-            },
-            {
-                        "item": "【難題】",
-                        "stars": [
-                                    "★１．主が従者の智恵を試すために難題を出す。",
-                                    "★２．ＡであってもＢであってもならない、という難題。",
-                                    "★３．Ａでありつつ同時にＢでもあれ、という難題。",
-                                    "★４．最強の物どうしがぶつかり合い、競い合ったらどうなるか、という難題。",
-                                    "★５．からまり合ったものを解け、との難題。",
-                                    "★６．天の助けによって、難題が解決する。",
-                                    "★７．難題を、解かないことによって解く。"
-                        ]
-            },
-            {
-                        "item": "【難題求婚】",
-                        "stars": [
-                                    "★１．娘が難題を出して、求婚者たちを退ける。",
-                                    "★２．娘が難題を出して、求婚者たちを殺す。",
-                                    "★３．娘が、求婚者である父親から逃れようと、難題を出す。",
-                                    "★４．娘の父親が、婿に難題を出す。",
-                                    "★５．娘の父親が、求婚者に難題を出す。",
-                                    "★６．息子の父親や母親が、嫁に難題を出す。",
-                                    "★７．娘の親が、求婚する動物に難題を課す。",
-                                    "★８．后が、恋する老人に難題を出す。",
-                                    "★９．賢者が、求婚者に難題を出す。"
-                        ]
-            },
-            {
-                        "item": "【難題問答】",
-                        "stars": [
-                                    "★１．難題に対して難題を返す。",
-                                    "★２．難題に対して直接答えず、反問する。",
-                                    "★３．鳥の生死を問う。",
-                                    "★４．不可能問答。"
-                        ]
-            },
-            {
-                        "item": "【虹】",
-                        "stars": [
-                                    "★１．虹が、水・酒などを飲む。",
-                                    "★２．虹が、口中へ入る。",
-                                    "★３ａ．虹が女に子を産ませる。",
-                                    "★３ｂ．虹のごとき日の光が、女に子を産ませる。",
-                                    "★４．虹は、神の娘の貞操帯からできた。",
-                                    "★５ａ．虹の立つ所を掘ると鏡。",
-                                    "★５ｂ．虹の立つ所へ行くと蝦蟇（がま）。",
-                                    "★６．希望の象徴の虹。",
-                                    "★７．武器の象徴の白い虹。",
-                                    "★８．二・二六事件前日の白い虹。",
-                                    "★９．虹の橋。"
-                        ]
-            },
-            {
-                        "item": "【二者択一】",
-                        "stars": [
-                                    "★１．二つのものの中から、一つを選ぶ。",
-                                    "★２．二つの方法・二つの生き方の中から、一つを選ぶ。",
-                                    "★３．恩師と愛人の二人から、一人を選ぶ。",
-                                    "★４．二人の罪人の中から、釈放すべき一人を選ぶ。",
-                                    "★５ａ．二人の子供のうちのどちらを助けるか。",
-                                    "★５ｂ．二人の子供のどちらが長子か見分ける。",
-                                    "★５ｃ．二人の子供のどちらが自分の子か、わからない。",
-                                    "★６ａ．二つのうちどちらを得ようか迷ったあげく、どちらも得られなくなる。",
-                                    "★６ｂ．二つとも得ようとして、どちらも失う。さらには身を滅ぼす。",
-                                    "★６ｃ．あちらを立てれば、こちらが立たず。",
-                                    "★７．二つの選択肢のどちらでもない、第三の道を選ぶ。",
-                                    "★８．究極の二者択一。",
-                                    "★９．生死のかかった選択。二者ともに生きることは不可能。どちらかが死なねばならない。"
-                        ]
-            },
-            {
-                        "item": "【二者同想】",
-                        "stars": [
-                                    "★１ａ．愛し合う夫と妻が、ともに同じようなことを考え、行なう。",
-                                    "★１ｂ．『賢者の贈り物』（Ｏ・ヘンリー）のパロディ。",
-                                    "★２．兄弟が、ともに同じようなことを考え、行なう。",
-                                    "★３．父親二人が、ともに自分の命を捨てて子供を救う。",
-                                    "★４．敵対するＡとＢが、ともに同じようなことを考え、行なう。",
-                                    "★５．女性を獲得したいと望むＡとＢが、ともに同じようなことを考え、行なう。",
-                                    "★６．貧しい男女が、それぞれ金持ちのふりをする。",
-                                    "★７．二者同想と思っていたら、そうではなかった。"
-                        ]
-            },
-            {
-                        "item": "【にせ金】",
-                        "stars": [
-                                    "★１．にせ紙幣。",
-                                    "★２．変造貨幣。",
-                                    "★３．にせ小判。",
-                                    "★４．せんべいの紙幣。",
-                                    "★５．トマトの金貨。"
-                        ]
-            },
-            {
-                        "item": "【にせ狂人】",
-                        "stars": [
-                                    "★１．自らのなすべきことをするために、狂人のふりをして人目をあざむく。",
-                                    "★２．処罰を逃れるため、身を守るために、狂人のふりをする。"
-                        ]
-            },
-            {
-                        "item": "【にせ首】",
-                        "stars": [
-                                    "★１．身代わりのにせ首。",
-                                    "★２．生きた人間が、死者の首を身代わりに置いて逃げる。"
-                        ]
-            },
-            {
-                        "item": "【にせ入水】",
-                        "stars": [
-                                    "★１．着物や書き置きを残して、入水したかのように見せかける。",
-                                    "★２．石を沈めて、入水したかのように思わせる。",
-                                    "★３．いつわりの入水往生。"
-                        ]
-            },
-            {
-                        "item": "【にせ心中】",
-                        "stars": [
-                                    "★１．心中の真似事をして、世間の注目を集めようとする。",
-                                    "★２．自殺を望む男と女が二人一緒に死ねば、世間の人は「心中だ」と思う。"
-                        ]
-            },
-            {
-                        "item": "【にせ手紙】",
-                        "stars": [
-                                    "★１．にせの手紙を用いて、人をおびき寄せる。",
-                                    "★２．にせの手紙を用いて、味方どうし・恋人どうしの仲を裂く。",
-                                    "★３．女好きの男に、にせの恋文を送ってからかう。",
-                                    "★４．目障りな女に、にせの恋文を送って反応を見る。",
-                                    "★５．いつわりの恋文を受け取った女が、差し出した男に好意を持つ。"
-                        ]
-            },
-            {
-                        "item": "【にせの宝】",
-                        "stars": [
-                                    "★１．にせの美術品や宝物を偽造する。",
-                                    "★２．美術品を盗み、そっくりのにせものを代わりに置いていく。",
-                                    "★３．美術品や宝石がにせものであることが発覚しないように、それを盗んでしまう。",
-                                    "★４．物語の最後で、宝物がにせものであったことが判明する。"
-                        ]
-            },
-            {
-                        "item": "【にせ花婿】",
-                        "stars": [
-                                    "★１．別人の名をかたって女と関係を結ぶ。",
-                                    "★２．魔法などを用いて、目ざす女の夫の姿に変身する。",
-                                    "★３．愛撫のしかたが違うので、にせものと見破られる。",
-                                    "★４．無力な本物の花婿を助けて結婚させる。",
-                                    "★５．求婚者たちの中に、にせ者が一人いる。",
-                                    "★６．花婿が、見合いの時の青年と違う。",
-                                    "★７．近代小説の中のにせ花婿。"
-                        ]
-            },
-            {
-                        "item": "【にせ花嫁】",
-                        "stars": [
-                                    "★１．別人になりかわって嫁入りする。",
-                                    "★２．魔物・妖怪の類が花嫁に化ける。",
-                                    "★３．男に魔法をかけ、にせ花嫁を与える。",
-                                    "★４ａ．雲から造られたにせ花嫁。",
-                                    "★４ｂ．枯れ木から造られたにせ花嫁。",
-                                    "★５．花嫁が、見合いの時の娘と違う。",
-                                    "★６．五十人の花嫁を、一人だと思いこむ。"
-                        ]
-            },
-            {
-                        "item": "【にせもの】",
-                        "stars": [
-                                    "★１．他人になりすます。",
-                                    "★２．にせの内臓や舌。",
-                                    "★３．にせの剣。竹光あるいは木刀。",
-                                    "★４．にせもの対にせもの。"
-                        ]
-            },
-            {
-                        "item": "【にせものと本物】",
-                        "stars": [
-                                    "★１．にせものと思ったら本物だった。",
-                                    "★２．にせものと本物の鉢合わせ。"
-                        ]
-            },
-            {
-                        "item": "【にせ幽霊】",
-                        "stars": [
-                                    "★１．生きた人間が幽霊のふりをして、人を脅す。",
-                                    "★２．幽霊のふりをして、家から人を追い出す。",
-                                    "★３．「幽霊を見た」と誤解する。",
-                                    "★４．本物の幽霊を見ても、「これは幻覚だ」と考える。"
-                        ]
-            },
-            {
-                        "item": "【日食】",
-                        "stars": [
-                                    "★１ａ．日食を知っている人が、知らない人たちを脅す。",
-                                    "★１ｂ．「日食を知らない原住民たちを脅そう」と考えるが、彼らは日食を知っていた。",
-                                    "★２．合戦中に起こった日食。",
-                                    "★３．イエス＝キリストが処刑された時に起こった日食。",
-                                    "★４．卑弥呼の時代に皆既日食があり、それが変化してアマテラスの岩戸隠れ神話（＊→〔扉〕１の『古事記』上巻）になった、という考え方もある。",
-                                    "★５．悪神が、日の女神を幽閉する。",
-                                    "★６．悪魔が、お日さまとお月さまを飲みこもうとする。",
-                                    "★７．太陽と月を、山に閉じ込める。",
-                                    "★８．太陽と月が、岩屋に隠れる。",
-                                    "★９．太陽の精・月の精が、他国へ去る。",
-                                    "★１０．日食と月食の起源。",
-                                    "★１１．月ではなく、暗黒星雲が太陽を隠す。",
-                                    "★１２．惑星が太陽を隠すのが日食、という考え方。",
-                                    "★１３．黒い星が、日蝕・月蝕を起こす。"
-                        ]
-            },
-            {
-                        "item": "【尿】",
-                        "stars": [
-                                    "★１．巨人の尿。",
-                                    "★２．女が尿をする夢は、王を産むことを意味する。",
-                                    "★３ａ．花嫁が尿をして、石に化す。",
-                                    "★３ｂ．花嫁が尿をして、島に化す。",
-                                    "★３ｃ．乙女が尿をして、美青年（正体は蛇）に魅入られる。",
-                                    "★４．修行者の尿をなめて、鹿が子を産む。",
-                                    "★５．寝小便。",
-                                    "★６．尿検査。他人の尿を提出する。"
-                        ]
-            },
-            {
-                        "item": "【女護が島】",
-                        "stars": [
-                                    "★１．女人だけが住む島。",
-                                    "★２．女護が島の女たちは、風を口や性器に受けて身ごもる。",
-                                    "★３ａ．西洋の女護が島。",
-                                    "★３ｂ．南島の女護が島。",
-                                    "★４．女護が島の起源。",
-                                    "★５．女護が島の廃止。",
-                                    "★６．女護が島と思ったら、鬼が島だった。"
-                        ]
-            },
-            {
-                        "item": "【女人禁制】",
-                        "stars": [
-                                    "★１．女人禁制の山。",
-                                    "★２．女人禁制の寺。",
-                                    "★３．女人禁制の島。"
-                        ]
-            },
-            {
-                        "item": "【にらみ合い】",
-                        "stars": [
-                                    "★１．人間と蛇のにらみ合い。",
-                                    "★２．英雄と怪物のにらみ合い。",
-                                    "★３．「にらめっこをしよう」と言って、相手に催眠術をかける。"
-                        ]
-            },
-            {
-                        "item": "【鶏】",
-                        "stars": [
-                                    "★１．鶏が鳴いて、岩屋戸や地底にこもった太陽を招く。",
-                                    "★２．鶏を夜明け前に鳴かせ、朝だと思わせる。",
-                                    "★３．人間が鶏の鳴きまねをする。",
-                                    "★４．黄金製の鶏。",
-                                    "★５．金鶏の声。",
-                                    "★６．鶏石の声。"
-                        ]
-            },
-            {
-                        "item": "【人魚】",
-                        "stars": [
-                                    "★１ａ．男が人魚と結婚するが、後に人魚は夫と別れて海へ帰る。",
-                                    "★１ｂ．男が人魚と結婚し、一緒に人魚の世界へ行く。",
-                                    "★１ｃ．男と人魚が結婚するが、二人とも死んでしまう。",
-                                    "★２．人魚の娘が、人間の王子を恋する。",
-                                    "★３．貴公子が人魚を買う。",
-                                    "★４．人間の夫婦が、人魚の娘を育てる。",
-                                    "★５ａ．人間が、人魚の肉を食べる。",
-                                    "★５ｂ．人魚が、人間を食べる。",
-                                    "★６ａ．人間の女が、変身して人魚となる。",
-                                    "★６ｂ．人間の男が、変身して人魚となる。"
-                        ]
-            },
-            {
-                        "item": "【人形】",
-                        "stars": [
-                                    "★１．人形が人間になる。",
-                                    "★２．最初、人形を人間と思って身構える。後に、人間を人形と思って油断する。",
-                                    "★３．人形を横たえて、人間が寝ているように見せかける。",
-                                    "★４．敵の攻撃を引き受ける身代わり人形。",
-                                    "★５．殉死者の身代わりの人形。",
-                                    "★６ａ．人形に魂が入って動き出す。",
-                                    "★６ｂ．人形から魂が抜け出て幽霊となる。",
-                                    "★７．旧時代の人形芝居。"
-                        ]
-            },
-            {
-                        "item": "【人形妻】",
-                        "stars": [
-                                    "★１．男が、美女の人形と夜をともにする。",
-                                    "★２．一人の映画女優をモデルにした三十体の袋人形。",
-                                    "★３．美女に恋をしたら、それは人形だった。"
-                        ]
-            },
-            {
-                        "item": "【人間】",
-                        "stars": [
-                                    "★１．人間にとってもっとも良いこと。",
-                                    "★２．人間の中に潜む獣性。",
-                                    "★３．「人間」という概念は不要。",
-                                    "★４．「人類」「猿類」という区別は間違い。「男類」「女類」「猿類」とすべき。"
-                        ]
-            },
-            {
-                        "item": "【人間を造る】",
-                        "stars": [
-                                    "★１．神が人間を造る。",
-                                    "★２．神が美女を造る。",
-                                    "★３．神が人間の形態を変える。",
-                                    "★４．神が人間を必要とした理由。",
-                                    "★５．鬼が人を造る。",
-                                    "★６．宇宙旅行用に人間を改造する。",
-                                    "★７．未来の新人類を造る。"
-                        ]
-            },
-            {
-                        "item": "【妊娠】",
-                        "stars": [
-                                    "★１ａ．妊娠時のアクシデント。",
-                                    "★１ｂ．妊娠期間中のアクシデント。",
-                                    "★２．妊娠期間中に胎児に施した教育。",
-                                    "★３．一人の女が、常に妊娠し続ける。",
-                                    "★４．大勢の女たちを、同時に妊娠させる。",
-                                    "★５．病気だと思ったら、妊娠だった。",
-                                    "★６．避妊。"
-                        ]
-            },
-            {
-                        "item": "【妊娠（男の）】",
-                        "stars": [
-                                    "★１．二人の男が交わって、一方が妊娠する。",
-                                    "★２．男女の夫婦で、夫が妻の子を身ごもる。",
-                                    "★３．男が水を飲んで妊娠する。",
-                                    "★４．男が口から妊娠し、口から出産する。"
-                        ]
-            },
-            {
-                        "item": "【妊娠（風による）】",
-                        "stars": [
-                                    "★１．風を受けて妊娠する。"
-                        ]
-            },
-            {
-                        "item": "【妊娠（太陽による）】",
-                        "stars": [
-                                    "★１．日光感精。太陽の光をうけて妊娠する。",
-                                    "★２．太陽神と交わって身ごもる。",
-                                    "★３．太陽に子を願って身ごもる。",
-                                    "★４．太陽の夢を見て身ごもる。"
-                        ]
-            },
-            {
-                        "item": "【妊娠（玉を得て）】",
-                        "stars": [
-                                    "★１．玉を得る夢を見て、妊娠・出産する。",
-                                    "★２．玉を得そこなうが、妊娠・出産する。"
-                        ]
-            },
-            {
-                        "item": "【妊娠期間】",
-                        "stars": [
-                                    "★１．妊娠期間が長い。",
-                                    "★２．赤ん坊の身体に入るべき魂が、いつまでも霊界にとどまっているために、妊娠してもなかなか生まれない。"
-                        ]
-            },
-            {
-                        "item": "【人数】",
-                        "stars": [
-                                    "★１．船に乗れる人数。",
-                                    "★２．宇宙船に乗れる人数。",
-                                    "★３．正しい人の数。",
-                                    "★４．人数を減らしても、仕事はできる。",
-                                    "★５．人数が増えても、苦労は同じ。",
-                                    "★６．人口増加の起源。",
-                                    "★７．増加する人口が減少に転じ、一人だけになる。",
-                                    "★８．人間の数と魂の数。",
-                                    "★９．鳥の数と枝の数。"
-                        ]
-            },
-            {
-                        "item": "【人数（不吉な）】",
-                        "stars": [
-                                    "★１．十三人は不吉な人数である。",
-                                    "★２．八人が不吉だ、という物語もある。"
-                        ]
-            },
-            {
-                        "item": "【人数が合わない】",
-                        "stars": [
-                                    "★１．人数が一人多い。",
-                                    "★２．人数が一人少ない。",
-                                    "★３．入場者の数と、使われた切符の数が一致しない。",
-                                    "★４．人間の数と花の数が一致しない。",
-                                    "★５．死体の数と懸賞金の額が合わない。",
-                                    "★６．死体の数が多い。"
-                        ]
-            },
-            {
-                        "item": "【妊婦】",
-                        "stars": [
-                                    "★１．妊婦の腹を裂く。",
-                                    "★２．妊婦の胎内の子が、男児か女児か確かめる。",
-                                    "★３．妊婦の腹を裂いて胎児を助け出す、ということもある。",
-                                    "★４．「妊婦ではない」と言いくるめる。",
-                                    "★５．ふとった女だと思ったら、妊婦だった。"
-                        ]
-            },
-            {
-                        "item": "【盗み】",
-                        "stars": [
-                                    "★１．出来心による盗み。",
-                                    "★２．万引き。衣服やカバンなどに隠せる小物を、店から盗む。",
-                                    "★３．盗癖。",
-                                    "★４．死体を盗む。"
-                        ]
-            },
-            {
-                        "item": "【濡れ衣】",
-                        "stars": [
-                                    "★１ａ．盗みの濡れ衣を着せられる。",
-                                    "★１ｂ．文字どおり、「濡れた衣を盗んだ」との濡れ衣を着せられる。",
-                                    "★２ａ．「銀の食器を盗んだ」との濡れ衣を着せられる物語と、逆に、盗んだにもかかわらず「あげたのだ」と言われる物語。",
-                                    "★２ｂ．「甕を盗んだ」との濡れ衣。",
-                                    "★３．「食べてはいけないものを食べた」との濡れ衣を着せられる。",
-                                    "★４．妻殺しの濡れ衣を着せられる。",
-                                    "★５．謀反の濡れ衣を着せられる。",
-                                    "★６．冤罪事件。",
-                                    "★７．濡れ衣を晴らす歌。濡れ衣を着せられて死んだ北野天神に訴える。",
-                                    "★８．濡れ衣を着せられても、否定しない。",
-                                    "★９．進んで他人の罪を引き受ける。",
-                                    "★１０．殺人犯が、他人にその罪を着せようかと考えるが、思いなおして自首する。"
-                        ]
-            },
-            {
-                        "item": "【願い事】",
-                        "stars": [
-                                    "★１．願いは一度口に出せば叶う。",
-                                    "★２ａ．三つの願い。願い事をする前と同じ状態にもどってしまう。",
-                                    "★２ｂ．二つ目の願いを、三つ目の願いで取り消す。",
-                                    "★２ｃ．三つ目にようやく賢明な願い事をする。",
-                                    "★２ｄ．三つの願いが叶うしるし。",
-                                    "★３．愚かな願い事・誤った願い事をしたために、想定外の悪い状況におちいる。"
-                        ]
-            },
-            {
-                        "item": "【猫】",
-                        "stars": [
-                                    "★１．飼い主に富と地位をもたらす猫。",
-                                    "★２．綱をつけて飼う猫。",
-                                    "★３．猫の教え。",
-                                    "★４ａ．もの言う猫。",
-                                    "★４ｂ．人間が猫に言葉を教える。",
-                                    "★５ａ．死ぬ姿を見せない猫。",
-                                    "★５ｂ．飼い主の死と同時に、行方知れずになった猫。",
-                                    "★６ａ．夫と牝猫と妻の三角関係。",
-                                    "★６ｂ．夫と雌猫と二人の妻の、複雑な関係。",
-                                    "★７．猫を恐れる人。",
-                                    "★８．老人と老猫。",
-                                    "★９ａ．人間が猫に生まれ変わる。",
-                                    "★９ｂ．猫が人間に生まれ変わる。",
-                                    "★１０．妖猫が人を喰い殺して、その人に化ける。",
-                                    "★１１．猫女房。",
-                                    "★１２．猫の名前。",
-                                    "★１３．猫にとってライオンは、神のごとき存在である。"
-                        ]
-            },
-            {
-                        "item": "【猫と鼠】",
-                        "stars": [
-                                    "★１．猫と鼠が憎み合うようになった起源。",
-                                    "★２．猫を恐れる鼠。",
-                                    "★３．猫と互角に戦う鼠。",
-                                    "★４．猫の言い分・鼠の言い分。"
-                        ]
-            },
-            {
-                        "item": "【寝言】",
-                        "stars": [
-                                    "★１．寝言で正体がわかる。",
-                                    "★２ａ．寝言で愛人の名前を呼ぶ。",
-                                    "★２ｂ．寝言で自分の情事を語る。",
-                                    "★３．「寝言を言った」という嘘。",
-                                    "★４．眠ったふりをして、わざと寝言を言う。",
-                                    "★５．子供時代の寝言。",
-                                    "★６．いびき。"
-                        ]
-            },
-            {
-                        "item": "【鼠】",
-                        "stars": [
-                                    "★１．変事・凶事の発端としての鼠。",
-                                    "★２．鼠の恩返し。",
-                                    "★３ａ．鼠の援助。弓の弦を喰い切る。",
-                                    "★３ｂ．鼠の援助。矢を捜して来る。",
-                                    "★４．鼠婿。",
-                                    "★５．天才鼠。",
-                                    "★６．人間が鼠に変身する。",
-                                    "★７．鼠が人間に生まれ変わる。"
-                        ]
-            },
-            {
-                        "item": "【鼠と魂】",
-                        "stars": [
-                                    "★１．生者あるいは死者の魂が、鼠の形となって現れる。",
-                                    "★２ａ．魂だと思って、鼠を呑みこむ。",
-                                    "★２ｂ．鼠を口にねじ込まれる。",
-                                    "★３ａ．次の物語は、「旅籠の一家の正体が鼠だった」とも解釈できるし、「旅籠の一家は人間で、彼らの魂が鼠に見えた」とも解釈できる（＊→〔体外の魂〕１）。",
-                                    "★３ｂ．次の物語の鼠も、死者の魂と解釈してよいであろう。"
-                        ]
-            },
-            {
-                        "item": "【熱湯】",
-                        "stars": [
-                                    "★１．美女の身体を熱湯に浸す。",
-                                    "★２．山姥の身体に熱湯を浴びせて殺す。",
-                                    "★３．敵軍の兵士たちに熱湯を浴びせる。",
-                                    "★４．熱湯に身体を浸すと心地よい。熱湯から出ると熱くてたまらない。",
-                                    "★５．身体にふれた水が、たちまち熱湯になる。",
-                                    "★６．熱湯を身体に浴びて、神託を得る。",
-                                    "★７．熱した油を用いて、妖怪や盗賊を殺す。",
-                                    "★８．熱して溶かした鉛を注ぐこともある。",
-                                    "★９ａ．現世で犯した悪業の罰として、死後、熱湯・熱銅を飲まされる。",
-                                    "★９ｂ．「死者が熱銅を飲む」のとは異なり、「生者が熱銅を飲む夢」を見る物語がある。夢の世界は冥界と同じ、ということであろうか。",
-                                    "★１０．地獄で、煮えたぎる血・瀝青の中に入れられる。",
-                                    "★１１．三途の川の水が湯となって、身体を焼く。",
-                                    "★１２．地獄の釜の熱湯。"
-                        ]
-            },
-            {
-                        "item": "【眠り】",
-                        "stars": [
-                                    "★１．神の眠りと人間世界。",
-                                    "★２．眠っている人を起こしてはいけない。",
-                                    "★３．眠くなる町。",
-                                    "★４．眠くてたまらない少女。",
-                                    "★５．睡眠時間。",
-                                    "★６．睡眠時には、身体から魂が抜け出て浮遊するといわれるが、身体そのものが宙に浮く物語もある。",
-                                    "★７．臨終時の眠り。",
-                                    "★８．半醒半睡の境。"
-                        ]
-            },
-            {
-                        "item": "【眠りと魂】",
-                        "stars": [
-                                    "★１．眠っている間に、動物の形をした魂が、身体から出たり入ったりする。",
-                                    "★２．魂が体外に出ているうちに身体を動かすと、魂はもとの身体に戻れない。",
-                                    "★３．眠る人の身体を半回転させて、頭と足の向きを逆にする。",
-                                    "★４．眠る人の外見を変えても、魂は身体に戻れなくなる。"
-                        ]
-            },
-            {
-                        "item": "【眠る男】",
-                        "stars": [
-                                    "★１．男が目覚めて女を見出し、結婚する。",
-                                    "★２．英雄は長い時間眠ることがある。",
-                                    "★３．眠る夫を殺そうとする妻。",
-                                    "★４．眠る夫を、眠る妻が殺す。"
-                        ]
-            },
-            {
-                        "item": "【眠る女】",
-                        "stars": [
-                                    "★１．眠る女が目覚めると、そこに夫となるべき男がいる。",
-                                    "★２．女が目覚めるのが遅いと悲劇になる。",
-                                    "★３．眠る女を捨てて去る。",
-                                    "★４．眠る女を犯す。",
-                                    "★５．眠る女の醜い姿。",
-                                    "★６ａ．老人は娘を目覚めさせられない。",
-                                    "★６ｂ．娘が目覚めたとしても、相手が老人では、娘は逃げ出す。",
-                                    "★６ｃ．目覚めた娘に、老人が「これは夢なのだ」と言う。"
-                        ]
-            },
-            {
-                        "item": "【眠る怪物】",
-                        "stars": [
-                                    "★１．眠る怪物を退治する。",
-                                    "★２．眠る怪物の宝物を盗んで逃げる。",
-                                    "★３．眠る敵を討つ。"
-                        ]
-            },
-            {
-                        "item": "【閨】",
-                        "stars": [
-                                    "★１．閨の怪。",
-                                    "★２．愛人と寝ている閨へ、配偶者が乗り込む。",
-                                    "★３．天皇と后の閨へ、家臣が参入する。",
-                                    "★４ａ．閨の隔て。剣。",
-                                    "★４ｂ．閨の隔て。毛布や帯。",
-                                    "★４ｃ．閨の隔てを取り除く。",
-                                    "★５．他人の閨を遠方から盗み見る。"
-                        ]
-            },
-            {
-                        "item": "【年数】",
-                        "stars": [
-                                    "★１．壺の破片数＝結婚生活の年数。",
-                                    "★２．砂粒の数＝生きられる年数。",
-                                    "★３．牛の数と穂の数＝豊作の年数と飢饉の年数。",
-                                    "★４．歩いた歩数＝王朝の存続年数。",
-                                    "★５．食われた鳥の数＝戦争継続の年数。"
-                        ]
-            },
-            {
-                        "item": "【のぞき見】",
-                        "stars": [
-                                    "★１．のぞき見から情交・結婚にいたることが多い。",
-                                    "★２．のぞき見して異類の正体を知る。",
-                                    "★３．有料ののぞき見。",
-                                    "★４．のぞき見される側からの反応。"
-                        ]
-            },
-            {
-                        "item": "【のぞき見（僧を）】",
-                        "stars": [
-                                    "★１．僧をのぞき見る。"
-                        ]
-            },
-            {
-                        "item": "【のぞき見（妻を）】",
-                        "stars": [
-                                    "★１．夫が妻の姿をのぞき見る。のぞかれた妻が夫を追う・襲う。",
-                                    "★２．夫が妻をのぞき見る。正体を知られた妻が去る。",
-                                    "★３．夫が妻をのぞき見て、罰を受ける。",
-                                    "★４．夫が妻の様子をうかがって、妻の本心を知る。"
-                        ]
-            },
-            {
-                        "item": "【のぞき見（人妻を）】",
-                        "stars": [
-                                    "★１．人妻の裸身をのぞき見る。"
-                        ]
-            },
-            {
-                        "item": "【のぞき見（部屋を）】",
-                        "stars": [
-                                    "★１．他人の部屋をのぞく。",
-                                    "★２．他人の部屋をのぞき見て、殺人事件を察知する。",
-                                    "★３．のぞき見をして殺人現場を目撃する。しかしそれは、殺人の真似事をしているだけだった。",
-                                    "★４．自分の家をのぞき見る。"
-                        ]
-            },
-            {
-                        "item": "【乗っ取り】",
-                        "stars": [
-                                    "★１ａ．客あるいは下宿人が、しだいに主人を圧迫し、最後には家を乗っ取る。",
-                                    "★１ｂ．突然押しかけて来た訪問者が、たちまち家を乗っ取る。",
-                                    "★２ａ．魂が身体から離れたすきに、悪霊がその身体を乗っ取る。",
-                                    "★２ｂ．死者の魂が、生者の身体から魂を追い出して、その身体を乗っ取る。",
-                                    "★２ｃ．先に死んで葬られた死者Ａの魂が、後に死んだ死者Ｂの身体に乗り移って蘇生する。その際、Ｂの身体を変形させて、Ａの身体にしてしまう。",
-                                    "★３．人面瘡（人面疽）が宿主に取って代わる。"
-                        ]
-            },
-            {
-                        "item": "【のりなおし】",
-                        "stars": [
-                                    "★１．悪事・凶兆と思われることがらを、善事・吉兆のように解釈しなおす。",
-                                    "★２．凶夢と思われるものを吉夢と解釈して、良い運命をもたらす。",
-                                    "★３．凶兆と知りつつ「吉夢」といつわり述べる話もある。",
-                                    "★４．吉夢であったのに、悪く解釈したために運を取り逃がす。",
-                                    "★５．自殺を事故死だったように言い直す。",
-                                    "★６．転んだのを、「一休みしているのだ」と言う。"
-                        ]
-            },
-            {
-                        "item": "【呪い】",
-                        "stars": [
-                                    "★１．言葉で呪う。",
-                                    "★２．人形を刃物で切って呪う。",
-                                    "★３．釘を打って呪う。",
-                                    "★４．土器や石などの呪物を、ある特定の場所に置く。",
-                                    "★５．呪いのビデオ。",
-                                    "★６．いちじくの木を呪って枯らす。",
-                                    "★７．子供たちを呪って死なせる。",
-                                    "★８．家にこもって物忌みされると呪いが効かないので、相手を外へ出すことが必要である。",
-                                    "★９ａ．呪いが自分の身に返る。",
-                                    "★９ｂ．呪いが自分の身に返ることを承知の上で、人を呪い殺す。",
-                                    "★１０．期限つきの呪い。",
-                                    "★１１．家にまつわる呪いを消すため、嫁が命を捨てる。"
-                        ]
-            },
-            {
-                        "item": "【葉】",
-                        "stars": [
-                                    "★１．葉を用いて、傷を癒し死者を生き返らせる。",
-                                    "★２．一枚の葉が、死の遠因になる。",
-                                    "★３．死者の国へ入るために必要な、黄金の葉。",
-                                    "★４．落ち散らぬ一枚の葉。",
-                                    "★５．赤ん坊が葉に変ずる。",
-                                    "★６ａ．葉に虫喰いの文字があらわれる。",
-                                    "★６ｂ．葉に薬で文字を書き、虫喰いのように見せかける。",
-                                    "★７ａ．柳の葉が魚に変わる。",
-                                    "★７ｂ．柳の葉に魂を入れて、魚を作る。",
-                                    "★８．片葉。"
-                        ]
-            },
-            {
-                        "item": "【葉と金銭】",
-                        "stars": [
-                                    "★１．受け取った銭が、後に見ると葉になっている。",
-                                    "★２．最初は葉を渡し、後から本物の紙幣を持って来る。",
-                                    "★３．受け取った金貨を、枯れ葉とすりかえる。"
-                        ]
-            },
-            {
-                        "item": "【歯】",
-                        "stars": [
-                                    "★１．歯の美しい天皇",
-                                    "★２．歯がなかった皇后。",
-                                    "★３．金（きん）を入れて歯を飾る。",
-                                    "★４．金歯を売る。",
-                                    "★５．歯形。",
-                                    "★６ａ．自分の歯が抜ける夢。",
-                                    "★６ｂ．他人の歯が抜ける夢。",
-                                    "★７．虫歯を抜く。一本で二文、二本だと三文。",
-                                    "★８．入れ歯。",
-                                    "★９．牙のある女。"
-                        ]
-            },
-            {
-                        "item": "【灰】",
-                        "stars": [
-                                    "★１．灰をまくと花が咲く。",
-                                    "★２．死者を火葬にした灰。",
-                                    "★３．不死身の怪人も、身体を焼いて灰にしてしまえば、生き返ることはできない。",
-                                    "★４．隠れ蓑笠を焼いた灰。",
-                                    "★５．灰で縄をなう。",
-                                    "★６．灰にまみれて暮らす娘。",
-                                    "★７ａ．床に灰をまき、足跡を取る。",
-                                    "★７ｂ．灰の上の足跡を消す。"
-                        ]
-            },
-            {
-                        "item": "【売買】",
-                        "stars": [
-                                    "★１．思いがけず高値で売れる物。",
-                                    "★２．高値で売れた物が、さらに高い値段で転売される。",
-                                    "★３．安茶碗を高価なものと早合点したことがきっかけで、本当に高価な茶碗になる。",
-                                    "★４．貴重な物を、知らずに安い値段で売る。",
-                                    "★５．だんだん安くなる物。",
-                                    "★６．福運をもたらすはずのものを、金に困って人に売る。",
-                                    "★７．「貧」を売る。",
-                                    "★８．一見、無価値と思われるものを買う。",
-                                    "★９．特殊な事情のために高値で売買される物。",
-                                    "★１０．無意味な売買。",
-                                    "★１１ａ．初茄子二つのセット販売。",
-                                    "★１１ｂ．家と猫の二点セットを売る。",
-                                    "★１１ｃ．さとう餅とうづら焼きの二点セットを買う。"
-                        ]
-            },
-            {
-                        "item": "【売買のいかさま】",
-                        "stars": [
-                                    "★１．いったん買った商品をすぐ別の商品に買い換え、売り手を混乱させて、目的の商品を正価の半額で手に入れる。",
-                                    "★２．上記と同様の方法を用い、商品を半額ではなく、無料で手に入れる。",
-                                    "★３．売り手を錯覚させて、商品をただで手に入れる。",
-                                    "★４．無価値なものを高価なもののように思わせ、金をだまし取る。"
-                        ]
-            },
-            {
-                        "item": "【蝿】",
-                        "stars": [
-                                    "★１．人間が死後、蝿に転生する。",
-                                    "★２．人間の身体から抜け出た魂が、蝿に見える。",
-                                    "★３．蝿と人間の合成。",
-                                    "★４ａ．蝿が馬車の屋根にとまる。",
-                                    "★４ｂ．蝿が飛行機の中に入り込む。",
-                                    "★５．蝿が建てた屋敷に、多くの動物が住む。",
-                                    "★６ａ．剣にとまった蝿が、自然に斬れてしまう。",
-                                    "★６ｂ．刀で蝿を斬ろうとして、失敗する。",
-                                    "★７．蝿が手をすり足をするわけ。",
-                                    "★８ａ．蝿が、死体のありかを教える。",
-                                    "★８ｂ．蝿が、死者の受けた致命傷を教える。",
-                                    "★９．蝿の死。",
-                                    "★１０．蝿を先祖とする人間。"
-                        ]
-            },
-            {
-                        "item": "【墓】",
-                        "stars": [
-                                    "★１．夫婦・恋人の墓。",
-                                    "★２．主人と忠犬の墓。",
-                                    "★３．落武者の墓。",
-                                    "★４．墓の中の人。",
-                                    "★５．墓の中の財宝。",
-                                    "★６．墓をあばく。",
-                                    "★７．自分の名前が書かれた墓石。",
-                                    "★８．子供が、小動物の墓を作って遊ぶ。",
-                                    "★９．他人の墓。",
-                                    "★１０．墓に食べ物を供えねばならない理由。",
-                                    "★１１ａ．墓に咲く花。",
-                                    "★１１ｂ．墓に生える草。",
-                                    "★１２．この世の男が、墓に葬られている娘と結婚する。"
-                        ]
-            },
-            {
-                        "item": "【秤（はかり）】",
-                        "stars": [
-                                    "★１ａ．天秤の一方に心臓、他方に羽毛を置いて、重さを比べる。",
-                                    "★１ｂ．天秤の一方に大きな石、他方に紙を置いて、重さを比べる。",
-                                    "★１ｃ．天秤の一方に人の肉、他方に鳩を置いて、重さを比べる。",
-                                    "★２．つきたての餅は重いが、水分が蒸発してから目方を量ると軽い。",
-                                    "★３．二種類の秤を用いて不正を行なう。",
-                                    "★４．芸術作品の価値をはかる測定器。"
-                        ]
-            },
-            {
-                        "item": "【白髪】",
-                        "stars": [
-                                    "★１ａ．生まれながらに白髪の人。",
-                                    "★１ｂ．白髪で生まれ、その後だんだん若返る。",
-                                    "★１ｃ．子供の頃から、頭髪の半分が白髪。",
-                                    "★２ａ．黒髪が短時間のうちに白髪になる。",
-                                    "★２ｂ．逆に、白髪が一晩のうちに黒髪になる。",
-                                    "★２ｃ．白髪が飛んで来て、頭にくっついてしまう。",
-                                    "★３ａ．白髪は老いのしるしである。",
-                                    "★３ｂ．老いのしるしの白髪を黒く染める。",
-                                    "★４．白髪は神性のしるしでもある。"
-                        ]
-            },
-            {
-                        "item": "【禿げ頭】",
-                        "stars": [
-                                    "★１．禿げ頭の男。",
-                                    "★２．円形禿げ。",
-                                    "★３．禿げ頭の目印。",
-                                    "★４．禿げ頭の老兵たち。",
-                                    "★５ａ．禿げ頭と薬罐（やかん）。",
-                                    "★５ｂ．禿げ頭と瓢箪（ひょうたん）。",
-                                    "★６．蛇に呑まれて禿げ頭になった人と、蛇を食べて禿げ頭になった人。"
-                        ]
-            },
-            {
-                        "item": "【化け物屋敷】",
-                        "stars": [
-                                    "★１．化け物が出る宿を訪れる・泊まる。"
-                        ]
-            },
-            {
-                        "item": "【箱】",
-                        "stars": [
-                                    "★１．歪（いびつ）な空間の中の箱。",
-                                    "★２．箱の長さが伸びる。",
-                                    "★３．箱の中に入る人。",
-                                    "★４．箱を頭からかぶる人。"
-                        ]
-            },
-            {
-                        "item": "【箱の中身】",
-                        "stars": [
-                                    "★１．箱の中の宝物。",
-                                    "★２ａ．箱の中の男性器。",
-                                    "★２ｂ．箱の中の男性器と眼球。",
-                                    "★３．箱の中身を言い当てる。",
-                                    "★４．入れ物の中身を偶然に言い当てる。",
-                                    "★５．箱の中に年齢を封じ込める。",
-                                    "★６．箱を開けたら空っぽだった。"
-                        ]
-            },
-            {
-                        "item": "【箱を開ける男】",
-                        "stars": [
-                                    "★１．箱を開けたために、たちまち老衰する。",
-                                    "★２．箱を開けたために、鼻血が出る・死ぬなどの目にあう。",
-                                    "★３．箱を開けても、中のものを見なければ無事でいられる。",
-                                    "★４．天皇が神璽の箱を開ける。",
-                                    "★５．国司が反魂香の箱を開ける。"
-                        ]
-            },
-            {
-                        "item": "【箱を開ける女】",
-                        "stars": [
-                                    "★１．箱を開けると、蛇がいた。",
-                                    "★２．箱を開けると、煙が立ち昇る。",
-                                    "★３．箱を開けると、幽冥界の眠りが立ち昇る。"
-                        ]
-            },
-            {
-                        "item": "【箱船（方舟）】",
-                        "stars": [
-                                    "★１．箱船を造って大洪水に備える。",
-                                    "★２．二十世紀の箱船ともいうべき核シェルターにこもって、核戦争に備える。",
-                                    "★３．女・赤ん坊・卵などを箱に入れて海に流す。"
-                        ]
-            },
-            {
-                        "item": "【橋】",
-                        "stars": [
-                                    "★１．橋は現実世界と異郷を結ぶものである。",
-                                    "★２．橋を渡って異郷へ行ける人と行けぬ人。",
-                                    "★３．橋から落として殺す。"
-                        ]
-            },
-            {
-                        "item": "【橋が落ちる】",
-                        "stars": [
-                                    "★１．橋が壊れる。",
-                                    "★２．橋を爆破する。"
-                        ]
-            },
-            {
-                        "item": "【橋の上の出会い】",
-                        "stars": [
-                                    "★１．橋の上で、生者と死者が出会う。",
-                                    "★２．橋の上で、鬼や怪物など恐ろしい物と出会う。",
-                                    "★３．橋の上で、神霊などからの情報を得る。",
-                                    "★４ａ．橋の上で男女が出会う。",
-                                    "★４ｂ．男どうしが出会うこともある。"
-                        ]
-            },
-            {
-                        "item": "【橋を架ける】",
-                        "stars": [
-                                    "★１．遠くの山や島に向けて、橋を架ける。",
-                                    "★２．多くの動物が連なり並んで、橋を作る。",
-                                    "★３．わらが横たわって橋になる。",
-                                    "★４．「私」が横たわって橋になる。"
-                        ]
-            },
-            {
-                        "item": "【箸】",
-                        "stars": [
-                                    "★１．箸が成長して木になる。",
-                                    "★２．箸が川を流れ下る。",
-                                    "★３．箸で身体を傷つける。",
-                                    "★４．箸を捨てる。"
-                        ]
-            },
-            {
-                        "item": "【梯子】",
-                        "stars": [
-                                    "★１．天へ通ずる梯子。",
-                                    "★２．神宝（＝神）の所まで登るための梯子。",
-                                    "★３．雲まで届く梯子。",
-                                    "★４ａ．梯子を外して、二階から降りられなくする。",
-                                    "★４ｂ．梯子を外して、地上へ登れなくする。",
-                                    "★４ｃ．二階から梯子を外すと、敵も登れないが自分たちも降りられない。",
-                                    "★５．梯子の夢。",
-                                    "★６．人間梯子。"
-                        ]
-            },
-            {
-                        "item": "【破傷風】",
-                        "stars": [
-                                    "★１．破傷風になって死ぬ。",
-                                    "★２．血を用いて破傷風を治す。",
-                                    "★３．破傷風で長期間病臥する。"
-                        ]
-            },
-            {
-                        "item": "【裸】",
-                        "stars": [
-                                    "★１．男の裸踊り。",
-                                    "★２．女の裸踊り。",
-                                    "★３．裸を恥じる。",
-                                    "★４．裸であることに気づかない。",
-                                    "★５．女神の裸。",
-                                    "★６ａ．娘が衣を僧に布施して、裸で帰る。",
-                                    "★６ｂ．女が前世で衣を惜しみ、現世で裸になる。",
-                                    "★７．幽霊は、裸であるのが当たり前。"
-                        ]
-            },
-            {
-                        "item": "【八月十五夜】",
-                        "stars": [
-                                    "★１．陰暦八月十五夜の宴。",
-                                    "★２．八月十五夜の思い。",
-                                    "★３．八月十五夜の出会い・再会。",
-                                    "★４．八月十五夜の契り。",
-                                    "★５．八月十五夜のおば捨て。",
-                                    "★６．八月十五夜の妖怪退治。",
-                                    "★７．八月十五夜の怪異。",
-                                    "★８ａ．八月十五夜に月世界を訪れる。",
-                                    "★８ｂ．八月十五夜に月世界へ帰る。",
-                                    "★８ｃ．月世界は、死者の世界でもある。",
-                                    "★９．八月十五夜前後の死。",
-                                    "★１０．十五夜の月見。"
-                        ]
-            },
-            {
-                        "item": "【八人・八体】",
-                        "stars": [
-                                    "★１．八人の男。",
-                                    "★２．八人の乙女。",
-                                    "★３．八人の美女と見えて実は一人。",
-                                    "★４．一つの身体に付属する八つのもの。"
-                        ]
-            },
-            {
-                        "item": "【白血病】",
-                        "stars": [
-                                    "★１．広島の原爆投下に起因する白血病。",
-                                    "★２．事故で放射能を浴びたことに起因する白血病。",
-                                    "★３．原因不明の白血病。"
-                        ]
-            },
-            {
-                        "item": "【鳩】",
-                        "stars": [
-                                    "★１．鳩の教え。",
-                                    "★２．鳩の夢。",
-                                    "★３ａ．鴿（はと）が人間に生まれ変わる。",
-                                    "★３ｂ．何度も何度も鳩に生まれ変わる。",
-                                    "★４．鳩を売る。"
-                        ]
-            },
-            {
-                        "item": "【花】",
-                        "stars": [
-                                    "★１．人が死に、その血を吸った地面から花が咲き出る。",
-                                    "★２．白い薔薇を血で赤い薔薇に変える。",
-                                    "★３．女が百合の花に変身する。",
-                                    "★４．殺した女を記念する花。",
-                                    "★５．悪の象徴である花。",
-                                    "★６．夢に見た花。",
-                                    "★７．絵に描かれた花。",
-                                    "★８．天から花が降る。",
-                                    "★９．花に託して、思いを述べる。"
-                        ]
-            },
-            {
-                        "item": "【花の精】",
-                        "stars": [
-                                    "★１．桜の精。",
-                                    "★２．菊の精。",
-                                    "★３．牡丹の精。",
-                                    "★４．百合の精。",
-                                    "★５．杜若の精。",
-                                    "★６．さまざまな草花の精たち。"
-                        ]
-            },
-            {
-                        "item": "【鼻】",
-                        "stars": [
-                                    "★１．鼻がもとにもどる。",
-                                    "★２．鼻が長くなる。",
-                                    "★３．大きな鼻の人。",
-                                    "★４．接吻の邪魔になる鼻。",
-                                    "★５．鼻を斬り取る。"
-                        ]
-            },
-            {
-                        "item": "【母と息子】",
-                        "stars": [
-                                    "★１．息子が亡母を恋う。",
-                                    "★２．少年が、母に似た少女を恋し、母の幻影を見る。",
-                                    "★３．息子が母親を創造する。"
-                        ]
-            },
-            {
-                        "item": "【母と娘】",
-                        "stars": [
-                                    "★１．母と娘とが、同じ一人の男と性関係を持つ。",
-                                    "★２．母と娘の双方に思いを寄せる男たち。",
-                                    "★３．同名の母と娘が、一人の男に追われる。",
-                                    "★４．別れ別れになっていた母と娘が再会する。",
-                                    "★５．母が自分の素性を隠して、娘に会う。",
-                                    "★６．母を呼ぶ娘。"
-                        ]
-            },
-            {
-                        "item": "【母なるもの】",
-                        "stars": [
-                                    "★１．神託の「母」を、「大地」と解釈する。",
-                                    "★２．夢に見た「母」を、「大地」と解釈する。",
-                                    "★３．大地は、一人の女の身体だった。"
-                        ]
-            },
-            {
-                        "item": "【母の霊】",
-                        "stars": [
-                                    "★１．母の霊が息子を救う。",
-                                    "★２．母の霊が娘を救う。",
-                                    "★３．亡母が動物の姿で現れて、息子を救う。",
-                                    "★４．亡母が動物の姿で現れて、娘を救う。"
-                        ]
-            },
-            {
-                        "item": "【母子婚】",
-                        "stars": [
-                                    "★１．互いに母であり息子であることを知らずに、性関係を結ぶ。",
-                                    "★２．互いに母であり息子であることを知りつつ、性関係を結ぶ。",
-                                    "★３．母親との性関係を夢想する。",
-                                    "★４ａ．男が誰もいないので、女が自分の産んだ息子と交わる。",
-                                    "★４ｂ．男が誰もいないので、女が自分の産んだ息子と交わり、さらに孫とも交わる。",
-                                    "★５．神々の母子婚。",
-                                    "★６．青年が、母親同然の年配の中年女と性交する。"
-                        ]
-            },
-            {
-                        "item": "【母殺し】",
-                        "stars": [
-                                    "★１．子供が母を殺す。",
-                                    "★２．母殺しの未遂。",
-                                    "★３．母と知らずに殺す。",
-                                    "★４．母と知らずに殺そうとするが、未遂に終わる。"
-                        ]
-            },
-            {
-                        "item": "【母さがし】",
-                        "stars": [
-                                    "★１．母を捜し尋ね、再会する。",
-                                    "★２．母を捜し尋ね、最後の別れをする。",
-                                    "★３．母を捜し尋ねてようやく再会したが、母は冷淡だった。"
-                        ]
-            },
-            {
-                        "item": "【腹】",
-                        "stars": [
-                                    "★１．怪物・妖怪などの腹に呑みこまれる。",
-                                    "★２．腹の中あるいは体内に入って病者を治療する。",
-                                    "★３．大仏の腹の中へ入る。",
-                                    "★４．腹を切り裂き、体内に貴重な品を入れて守る。",
-                                    "★５．腹中の声。",
-                                    "★６．腹中の蛇。"
-                        ]
-            },
-            {
-                        "item": "【針】",
-                        "stars": [
-                                    "★１．針が蛇をしりぞける・退治する。",
-                                    "★２ａ．針と出産。",
-                                    "★２ｂ．難産と針。",
-                                    "★２ｃ．針三本を金（かね）の鳥居に見立てて寄進し、難産が安産になった。",
-                                    "★３．僧の誕生と針。",
-                                    "★４．針の入った飯。",
-                                    "★５．飲みこんだ針を体外へ出す。",
-                                    "★６．針の呑みくらべ。",
-                                    "★７ａ．身体に針を刺して、文字を刻む。",
-                                    "★７ｂ．身体に針を刺して、絵模様を彫る。",
-                                    "★７ｃ．針を刺される痛みに耐えて、仏法を得る。",
-                                    "★８．針の山。",
-                                    "★９．針の穴。"
-                        ]
-            },
-            {
-                        "item": "【鍼（はり）】",
-                        "stars": [
-                                    "★１．人を生かす鍼。病気を治す鍼。",
-                                    "★２．人を殺す鍼。"
-                        ]
-            },
-            {
-                        "item": "【パン】",
-                        "stars": [
-                                    "★１ａ．十二人の使徒にパンを与える。",
-                                    "★１ｂ．一人の裏切り者にパンを与える。",
-                                    "★２ａ．パンを盗む。",
-                                    "★２ｂ．パンを踏む。",
-                                    "★３．パンを凶器として用いる。",
-                                    "★４．パンを、消しゴム代わりにする。",
-                                    "★５．大勢にパンを与えても、食べきれずに残る。",
-                                    "★６．パンと石。",
-                                    "★７．パンの古びかたで、日数の経過を示す。"
-                        ]
-            },
-            {
-                        "item": "【半牛半人】",
-                        "stars": [
-                                    "★１．牛面人身。",
-                                    "★２．人面牛身。",
-                                    "★３．腰から上は牛、下は人。"
-                        ]
-            },
-            {
-                        "item": "【半犬半人】",
-                        "stars": [
-                                    "★１．犬頭人身。",
-                                    "★２．人面犬身。"
-                        ]
-            },
-            {
-                        "item": "【反魂】",
-                        "stars": [
-                                    "★１．死者の魂を現世に呼び戻す。",
-                                    "★２ａ．魂を呼び戻す反魂香と間違えて、反魂丹（解毒剤の一種）を焚き、煙だらけになる。",
-                                    "★２ｂ．亡妻の魂が反魂丹に感応した、と思い込む。"
-                        ]
-            },
-            {
-                        "item": "【半死半生】",
-                        "stars": [
-                                    "★１．半死半生の人。",
-                                    "★２．半死半生の動物・植物。",
-                                    "★３．健康な人 ―― 半身不随の人 ――"
-                        ]
-            },
-            {
-                        "item": "【半身】",
-                        "stars": [
-                                    "★１．大砲に吹き飛ばされて、身体が左半身と右半身に分かれる。",
-                                    "★２．股裂きの刑を受けて、身体が左半身と右半身に分かれる。",
-                                    "★３．刀で斬られて、身体が上半身と下半身に分かれる。",
-                                    "★４．前生の悪事の報いで、身体の半分を切り取られる。",
-                                    "★５．丸い子供を二つに切り分ける。",
-                                    "★６．半身の人の国。",
-                                    "★７．半身の仏画。"
-                        ]
-            },
-            {
-                        "item": "【ハンセン病】",
-                        "stars": [
-                                    "★１．隔離されるハンセン病患者。",
-                                    "★２．ハンセン病の王。",
-                                    "★３．ハンセン病者の戸籍から抜け出る。",
-                                    "★４．レプラ（ハンセン病）を恐れる者はレプラになる。",
-                                    "★５．ハンセン病の起源。",
-                                    "★６．『法華経』が癩病を治す。"
-                        ]
-            },
-            {
-                        "item": "【犯人さがし】",
-                        "stars": [
-                                    "★１ａ．誰もいないと油断して、犯人が犯行をしゃべってしまう。",
-                                    "★１ｂ．犯人の不安な心理。",
-                                    "★２．「犯人だ」と指摘されないようにしたつもりが、かえって犯人であることを明らかにしてしまった。",
-                                    "★３．犯人を一人に絞り込めず、逆に、末広がりに広がって行く。",
-                                    "★４．殺人の実行犯と被害者の接点を作らず、誰が犯人か、つきとめられないようにする。",
-                                    "★５ａ．犯人さがしを命ずる人物が、やがて自分自身が犯人であったことを知る。",
-                                    "★５ｂ．自分自身が犯人であることを知っている裁判官が、それを隠して裁判を行なう。"
-                        ]
-            },
-            {
-                        "item": "【火】",
-                        "stars": [
-                                    "★１ａ．神が自らを犠牲にして、人間世界に火をもたらす。",
-                                    "★１ｂ．神が人間世界に火をもたらし、人間は死の運命を得る。",
-                                    "★２．神にも等しい偉大な王が、人間世界に火をもたらす。",
-                                    "★３．賢人が人間に火食を教える。",
-                                    "★４．動物が人間に火を与える。",
-                                    "★５．火を消す女。",
-                                    "★６．火の中に入って無事であれば、身の潔白が証明される。",
-                                    "★７．母親の遺体を火で焼いた時に、その腹から男児が生まれ出る。",
-                                    "★８．焼身供養。",
-                                    "★９．現世の物を火で焼くと、冥界へ送ることができる。",
-                                    "★１０．火を乗り越えることによって、男は女を得ることができる。",
-                                    "★１１．「火」という文字。"
-                        ]
-            },
-            {
-                        "item": "【火の雨】",
-                        "stars": [
-                                    "★１．火の雨が降るので、岩穴などに隠れる。",
-                                    "★２．神が火を降らせ、二つの町の住民が全滅する。"
-                        ]
-            },
-            {
-                        "item": "【光】",
-                        "stars": [
-                                    "★１．身体から光を放つ人。",
-                                    "★２．口から光が出る。",
-                                    "★３．光を放つ神像・仏像。",
-                                    "★４．光る樹木で仏像を造る。",
-                                    "★５ａ．光る剣。",
-                                    "★５ｂ．光る鎧。",
-                                    "★５ｃ．光る石。",
-                                    "★６ａ．太陽光線＝太陽の足。",
-                                    "★６ｂ．太陽光線＝針。"
-                        ]
-            },
-            {
-                        "item": "【光と生死】",
-                        "stars": [
-                                    "★１．光とともに誕生する。",
-                                    "★２．人の死に際して光が現れる。",
-                                    "★３．死に近い人が光に包まれる。",
-                                    "★４．死んで行く当人が光を見る。"
-                        ]
-            },
-            {
-                        "item": "【引きこもり】",
-                        "stars": [
-                                    "★１．青年が自室に長期間とじこもり、外へ出ない。",
-                                    "★２．女神が岩屋に閉じこもる。"
-                        ]
-            },
-            {
-                        "item": "【飛行】",
-                        "stars": [
-                                    "★１．飛行能力を持つ超人。",
-                                    "★２．修行して飛行術を身につけた人・身につけられなかった人。",
-                                    "★３．飛行する男が、女の肌を見て墜落する。",
-                                    "★４．幼時には飛行能力があったが、成長後、飛べなくなった。",
-                                    "★５．着地せずに、空中で跳躍する人。",
-                                    "★６．空を飛ぶ大勢の人々。",
-                                    "★７．人工の翼をつけて空を飛ぶ人。",
-                                    "★８．気球に乗って空を飛ぶ人。",
-                                    "★９．動物に乗って空を飛ぶ人。",
-                                    "★１０ａ．多くの鳥の力によって空を飛ぶ人。",
-                                    "★１０ｂ．鳥にすがって空を飛ぶ鼠。",
-                                    "★１１．砲弾に乗って空を飛ぶ人。",
-                                    "★１２．空飛ぶ絨毯・トランク。",
-                                    "★１３．物を飛ばす。",
-                                    "★１４ａ．自ら飛ぶ鏡。",
-                                    "★１４ｂ．自ら飛ぶ梅の木。",
-                                    "★１５．飛ぶこと自体を追求する鳥。"
-                        ]
-            },
-            {
-                        "item": "【飛行機】",
-                        "stars": [
-                                    "★１．飛行機による郵便物の輸送。",
-                                    "★２．飛行機事故。",
-                                    "★３ａ．墜落した飛行機に、乗らなかった男。",
-                                    "★３ｂ．飛行機の墜落を望む乗客たち。",
-                                    "★３ｃ．飛行機事故で生き残った母子。",
-                                    "★４．爆発物を持って旅客機に搭乗する。",
-                                    "★５．飛行機の出発時刻の遅延。"
-                        ]
-            },
-            {
-                        "item": "【膝】",
-                        "stars": [
-                                    "★１ａ．父親の膝。",
-                                    "★１ｂ．祖父の膝。",
-                                    "★１ｃ．自分の子供でなければ、膝に入ってきても嬉しくない。",
-                                    "★２．女性の膝には、性的な意味合いがある。性器を暗示することもある。",
-                                    "★３．膝枕。",
-                                    "★４．女神の膝。"
-                        ]
-            },
-            {
-                        "item": "【美女奪還】",
-                        "stars": [
-                                    "★１ａ．鬼にさらわれた美女を、英雄が取り戻す。",
-                                    "★１ｂ．山賊にさらわれた娘を、若者が取り戻す。",
-                                    "★１ｃ．銀河帝国軍に捕らわれた姫君を、英雄が取り戻す。",
-                                    "★２．怪物にさらわれた妻を、夫が取り戻す。",
-                                    "★３．奪われた人妻を取り返そうと、戦争を始める。",
-                                    "★４．怪物に奪われた美女を人間が奪い返すのとは逆に、人間に奪われた美女を、怪物が取り返しに来る。"
-                        ]
-            },
-            {
-                        "item": "【火攻め】",
-                        "stars": [
-                                    "★１．火攻めにあい、穴の中に身を隠す。",
-                                    "★２．火攻めにあい、馬の腹中に身を隠す。",
-                                    "★３．火攻めにあい、迎え火をつける。",
-                                    "★４．火攻めにあいそうになり、歌を詠む。"
-                        ]
-            },
-            {
-                        "item": "【額の傷】",
-                        "stars": [
-                                    "★１．処罰として、額に傷をつけられる。",
-                                    "★２．大勢と戦って、額に傷を負う。",
-                                    "★３．少女を救って、額に傷を負う。",
-                                    "★４．女に打たれて、額に傷を負う。",
-                                    "★５．額の傷を、「陀羅尼を籠めたためだ」といつわる。",
-                                    "★６．額の傷口から、神や人が誕生する。"
-                        ]
-            },
-            {
-                        "item": "【額の印】",
-                        "stars": [
-                                    "★１．特別な人物であることを示す印が、生まれつき額にある。",
-                                    "★２．不死の印を額につけて生まれる。",
-                                    "★３．天使や魔女などが、人の額に印をつける。",
-                                    "★４．悪魔の子ダミアンの「６６６」は、頭部にしるされている。",
-                                    "★５．死者の額に文字を記す。"
-                        ]
-            },
-            {
-                        "item": "【棺】",
-                        "stars": [
-                                    "★１ａ．自ら棺の中に入る人。",
-                                    "★１ｂ．棺の中で寝る人。",
-                                    "★１ｃ．棺から起き上がる人。",
-                                    "★１ｄ．棺から出してくれ、と訴える死者。",
-                                    "★２ａ．棺の中に自分と同じ人間がいる、との夢。",
-                                    "★２ｂ．中空から自分の柩を見下ろす、との夢。",
-                                    "★３ａ．病死者の遺体が入った棺に、殺害死体を押し込んで隠す。棺の中に二つの死体があるとは誰も気づかず、棺はそのまま埋葬される。",
-                                    "★３ｂ．死体の入った棺の中に、意識不明の人物を入れて、一緒に埋葬しようとたくらむ。",
-                                    "★４．樽や桶の形をした棺を、駕籠のように二人でかつぐ。",
-                                    "★５．早桶に、死体を上下逆さまに入れる。",
-                                    "★６．棺を引きずって旅する男。",
-                                    "★７．「官（かん）」と「棺（かん）」。"
-                        ]
-            },
-            {
-                        "item": "【人買い】",
-                        "stars": [
-                                    "★１．人を買い、労働力として転売する。",
-                                    "★２．養い親のもとから、子供を買う。",
-                                    "★３．子供を、買うのではなく借りる。"
-                        ]
-            },
-            {
-                        "item": "【人質】",
-                        "stars": [
-                                    "★１ａ．一人の賊が人質を取って小屋などに逃げ込む。",
-                                    "★１ｂ．人質を取らず、空き家に立てこもる物語もある。",
-                                    "★２．三人の脱獄囚が、一家四人を人質にする。",
-                                    "★３．友人を人質にする。",
-                                    "★４．大勢の人質。",
-                                    "★５．人質の命を助けるために、あえて傷つける。"
-                        ]
-            },
-            {
-                        "item": "【人魂】",
-                        "stars": [
-                                    "★１ａ．死の直前あるいは死の数日前に、人魂が身体から出て行く。",
-                                    "★１ｂ．死の何ヵ月か前、時には一年以上も前に、人魂が身体から出て行くこともある。",
-                                    "★２ａ．多数の人魂が現れ、その後、大勢の人々が死ぬ。",
-                                    "★２ｂ．鬼火が現れ、その後、大勢の人々が死ぬ。",
-                                    "★３．死者を迎えに来る人魂。",
-                                    "★４．にせの人魂。"
-                        ]
-            },
-            {
-                        "item": "【人違い】",
-                        "stars": [
-                                    "★１．人相・風体などにより、人違いする。",
-                                    "★２．人違いを契機にして物語が始まる。",
-                                    "★３ａ．「あなたが捜しているのは私ではない。人違いだ」と言う。",
-                                    "★３ｂ．「私が捜しているのはあなたではない。人違いだ」と言う。",
-                                    "★３ｃ．「私が待っていたのはあなたではない」と言う。",
-                                    "★４．人違いしたふりをして、情報を得る。",
-                                    "★５．人違いしたふりをして、本人には言えないことを言う。",
-                                    "★６．目指す本人なのに、人違いだと思う。",
-                                    "★７．人違いであることを、相手に悟られないようにふるまう。"
-                        ]
-            },
-            {
-                        "item": "【一つ覚え】",
-                        "stars": [
-                                    "★１．一度うまくいったことに味をしめ、別の状況下でも一度目と同じことを言ったりしたりして、失敗する。",
-                                    "★２．一つ覚えの言葉を、何度も繰り返す。",
-                                    "★３．一つ覚えが、思いがけない形で功を奏する。",
-                                    "★４．愚か者の一つ覚えではなく、悟達の境地ゆえに、異なる問いに同じ言葉で答えるばあいがある。"
-                        ]
-            },
-            {
-                        "item": "【人妻】",
-                        "stars": [
-                                    "★１．人妻を奪う。",
-                                    "★２．他人の愛妾を奪う。",
-                                    "★３．人妻を愛しながらも肉体的には結ばれない。",
-                                    "★４．夫のもとへ戻る人妻。",
-                                    "★５．人妻に言い寄る男。無力な夫。",
-                                    "★６．人妻との恋を成就させる。"
-                        ]
-            },
-            {
-                        "item": "【一つ目】",
-                        "stars": [
-                                    "★１．一つ目の神・鬼・怪物。",
-                                    "★２．一つ目小僧",
-                                    "★３．一つ目の人ばかりの国。",
-                                    "★４．三人が、たった一つの目を用いる。",
-                                    "★５．五匹が、たった一つの目を用いる。"
-                        ]
-            },
-            {
-                        "item": "【人柱】",
-                        "stars": [
-                                    "★１ａ．誰を人柱にしたらよいか、提案した人自身が人柱にされる。",
-                                    "★１ｂ．提案者が、自らが人柱に選ばれるように細工をする。",
-                                    "★２．誤解により、自ら人柱になるような行動をしてしまう。",
-                                    "★３．人柱にされる人の身代わりに、別の人物が人柱となることを志願する。",
-                                    "★４．落とし穴に落とされ、知らぬうちに人柱にされてしまう。",
-                                    "★５ａ．人柱にされた娘が大蛇に化す。",
-                                    "★５ｂ．人柱にされた女性の泣き声が聞こえる。",
-                                    "★６．人柱をやめて、代わりに石を埋める。",
-                                    "★７．奈良の大仏建立の時の人柱。"
-                        ]
-            },
-            {
-                        "item": "【瞳】",
-                        "stars": [
-                                    "★１．絵に描かれた龍や虎に、瞳を点ずる。",
-                                    "★２ａ．眼に瞳が二つある。",
-                                    "★２ｂ．眼に瞳が二つあるのに加えて、額に「米」の字がある。",
-                                    "★２ｃ．右目の瞳が左目に移動して、左目の瞳が二つになった。",
-                                    "★３．瞳に針を刺す。"
-                        ]
-            },
-            {
-                        "item": "【一夜妻】",
-                        "stars": [
-                                    "★１．男が女と一夜だけの契りを結んで別れる。",
-                                    "★２．男女が初めての契りを結んだ直後に、相次いで死んでしまう。",
-                                    "★３．男は一夜だけの関係のつもりだったが、女はいつまでも男につきまとう。"
-                        ]
-            },
-            {
-                        "item": "【一夜孕み】",
-                        "stars": [
-                                    "★１ａ．神は、ただ一度の交わりで子をなすことができる。",
-                                    "★１ｂ．神の性質を受け継いだ人間も、一度の交わりで子をなすことがある。",
-                                    "★２．神およびその直接の子孫でありながら、一夜で孕ませる力があることを忘れていることがある。",
-                                    "★３．貴族と街の女との、一夜の関係で生まれた子供の運命。",
-                                    "★４．一夜の関係で生まれた子供を、後に殺してしまう。"
-                        ]
-            },
-            {
-                        "item": "【一人三役】",
-                        "stars": [
-                                    "★１．一人が三人の人物を演じ分ける。",
-                                    "★２．一人が事件の被害者・犯人・探偵の三役を演じる。",
-                                    "★３．一人で三人の人物に扮しつつ、さらに架空の人物二人の話をして、合計五人いるように見せかける。",
-                                    "★４．一人の女が三人に見える、あるいは、一人の男の人格が三つに分裂する。"
-                        ]
-            },
-            {
-                        "item": "【一人二役】",
-                        "stars": [
-                                    "★１．一人二役を演じて、二重の生活をする。",
-                                    "★２ａ．第一の人物を抹殺して、本来存在しない第二の人物になる。",
-                                    "★２ｂ．第二の人物を造るが、後に抹殺する。",
-                                    "★３．一人の人間が人格の分裂を起こし、無意識のうちに二役を演ずる。",
-                                    "★４．一人の人物が、姿は別人に変装し、声は自分の声で話して、その場に二人いるかのように見せかける。",
-                                    "★５ａ．正義の味方は、ふだんの顔と悪者と戦う時と二つの顔を持つ。",
-                                    "★５ｂ．正義の味方が一人二役をしているように見えるが、実はそうではなかった。",
-                                    "★６ａ．犯人と警察官とが同一人物。",
-                                    "★６ｂ．犯人と探偵とが同一人物。",
-                                    "★７．善人・悪人の二役をする。",
-                                    "★８．作者が「一人二役」の設定で物語を始めるが、途中から構想を変えて、「瓜二つの二人」とする。"
-                        ]
-            },
-            {
-                        "item": "【皮膚】",
-                        "stars": [
-                                    "★１．皮膚の色の違い。",
-                                    "★２．白色人種の美しさ。",
-                                    "★３．黒い皮膚の父親からは、黒い皮膚の子供が生まれる。",
-                                    "★４．皮膚病。"
-                        ]
-            },
-            {
-                        "item": "【秘密の子】",
-                        "stars": [
-                                    "★１．妻が、夫以外の男との間にもうけた子供。",
-                                    "★２．夫が愛人に産ませた子を、妻が自分の子として育てる。",
-                                    "★３．実の父母とは異なる夫婦の子とされる。"
-                        ]
-            },
-            {
-                        "item": "【秘密を語る】",
-                        "stars": [
-                                    "★１．口論のあげく、秘密にしておくべきことをしゃべってしまう。",
-                                    "★２．主人から叱責されたことを恨み、秘密を口外する。"
-                        ]
-            },
-            {
-                        "item": "【百】",
-                        "stars": [
-                                    "★１．百年の眠り。",
-                                    "★２．百年の死。",
-                                    "★３．お百度参り。祈願成就のために、社寺の境内の一定距離を百回往復する。",
-                                    "★４．百日参り。",
-                                    "★５．百人の子供。",
-                                    "★６．百枚の原稿用紙。",
-                                    "★７．完全数としての百。",
-                                    "★８．百プラス一。"
-                        ]
-            },
-            {
-                        "item": "【百物語】",
-                        "stars": [
-                                    "★１．何人かが集まって怪談を語り合う。最後の百話目に到れば、幽霊や妖怪が出現するなどの怪異が起こるという。",
-                                    "★２ａ．百物語がだんだん進み、最後の百話目に近づくと、化け物の方でも「そろそろ出ようか」と準備をする。",
-                                    "★２ｂ．百物語が終わりに近づくと、皆こわがって帰ってしまう。",
-                                    "★３．中世・近世の西欧の百物語。百は完璧数と見なされた。"
-                        ]
-            },
-            {
-                        "item": "【百鬼夜行】",
-                        "stars": [
-                                    "★１．百鬼夜行に出会う。",
-                                    "★２．悪事を思う人の後ろに、数十匹の鬼がついて行く。",
-                                    "★３．さまざまな異形のものたちが、夜の歩道を行き交う。"
-                        ]
-            },
-            {
-                        "item": "【憑依】",
-                        "stars": [
-                                    "★１．生者・死者の霊魂が他者にとりついて、様々な行動をする。",
-                                    "★２．生者・死者の霊魂が、重要な情報を告げるために、人に憑依する。",
-                                    "★３．ＡがＢを殺す。殺されたＢの霊魂が、Ａにとりついて復讐する。",
-                                    "★４．婚約者を残して死んだ女が、婚約者の妻となるべき娘に憑依する。",
-                                    "★５．悪魔・悪霊がとりつく。",
-                                    "★６ａ．「だり仏」「ひだる神」が人にとりついて、食物を要求する。",
-                                    "★６ｂ．餓鬼が人にとりついて、水を要求する。",
-                                    "★６ｃ．鬼が僧にとりついて、肉を食う。",
-                                    "★７．梟（ふくろう）が人にとりつく。",
-                                    "★８．身体を持たない存在が、若い肉体にとりついて、味覚や性感を奪う。",
-                                    "★９ａ．憑依による物語か、空想の物語か、区別がつかない。",
-                                    "★９ｂ．死んだ恋人の声なのか、生者が意図的にあるいは無意識に死者の声色をつかったのか、区別がつかない。",
-                                    "★９ｃ．次の例は、蛇が人間に憑依し、人間の声帯を借りて、怒りの声を発したのであろう。"
-                        ]
-            },
-            {
-                        "item": "【病院】",
-                        "stars": [
-                                    "★１．異郷から帰って来た男が、精神病院に収容される。",
-                                    "★２．社会の通念と異なる考えを持つ男が、精神病院に収容される。",
-                                    "★３．凶悪な犯罪者が、精神病院に収容される。",
-                                    "★４．病状の変化とともに、患者を上階・下階に移動させる病院。",
-                                    "★５．星を見て病気を治す病院。"
-                        ]
-            },
-            {
-                        "item": "【病気】",
-                        "stars": [
-                                    "★１．病気を治してくれる神や仏。",
-                                    "★２．疫病で死んだ人が、そのまま疫神になる。",
-                                    "★３．病気を、他人にうつして治す。",
-                                    "★４．病気は治ったが、死んでしまった。",
-                                    "★５．病気と心。",
-                                    "★６ａ．いつも「自分は病気である」と思っている男。",
-                                    "★６ｂ．病気は、仏道への良い導き手。",
-                                    "★７．「重病だ」との、医師の誤診や患者の誤解。",
-                                    "★８ａ．伝染病のために人類が死滅する。",
-                                    "★８ｂ．エイズの流行 → 若者（兵員）の大量死 → 戦争の根絶。",
-                                    "★９．難病。",
-                                    "★１０．奇病。",
-                                    "★１１．病気と階級。",
-                                    "★１２．看病。",
-                                    "★１３ａ．病気見舞い。",
-                                    "★１３ｂ．善意で病人の世話をするが、恩を仇で返される。"
-                        ]
-            },
-            {
-                        "item": "【瓢箪】",
-                        "stars": [
-                                    "★１．観賞用の瓢箪。",
-                                    "★２．瓢箪の中身。",
-                                    "★３．瓢箪の中から、いくらでもご馳走が出て来る。",
-                                    "★４．瓢箪の中に紙をはる。",
-                                    "★５．瓢箪に吸い込まれる。",
-                                    "★６．沈まない瓢箪。",
-                                    "★７．一夜ひさご。一夜のうちに天へ届くまでつるを伸ばす瓢箪（または夕顔）。",
-                                    "★８．瓢箪の起源。",
-                                    "★９．瓢箪に油を塗って腹を切る。"
-                        ]
-            },
-            {
-                        "item": "【ひょっとこ】",
-                        "stars": [
-                                    "★１．ひょっとこの面の起源。",
-                                    "★２．ひょっとこの面で、泣き顔を隠す。",
-                                    "★３．ひょっとこの面を取っても、自分の本当の顔が現れるとは限らない。"
-                        ]
-            },
-            {
-                        "item": "【瓶（びん）】",
-                        "stars": [
-                                    "★１．不思議な生き物の入った瓶（びん）。",
-                                    "★２．壜（びん）の中に魂を隠す。",
-                                    "★３．罎（びん）に映る顔。",
-                                    "★４．瓶（びん）の中の手紙。",
-                                    "★５．瓶（びん）から手が抜けない。",
-                                    "★６．空き瓶（びん）の中に入って、異郷へ行く。"
-                        ]
-            },
-            {
-                        "item": "【貧乏神】",
-                        "stars": [
-                                    "★１．貧乏神を祀る。",
-                                    "★２ａ．貧乏神を追い出す。",
-                                    "★２ｂ．凶夢を転じて、貧乏神を追い出すめでたい歌にする。",
-                                    "★２ｃ．貧乏神を追い出すことに失敗する。",
-                                    "★２ｄ．一定期間いた後に、自ら退去する貧乏神。",
-                                    "★３．貧乏神から逃れられない。",
-                                    "★４．母は恋の女神、父は貧乏神。"
-                        ]
-            },
-            {
-                        "item": "【封印】",
-                        "stars": [
-                                    "★１ａ．魔物や怪物を、地中に封じ込める。",
-                                    "★１ｂ．龍神を、池の底に封じ込める。",
-                                    "★１ｃ．悪魔を、底なしの深淵に封じ込める。",
-                                    "★１ｄ．宇宙の「禍つ事（まがつごと）」を、星団の中に封じ込める。",
-                                    "★２．瓶など小さな容器に封ずる。",
-                                    "★３．封印を解く。",
-                                    "★４．効力のない封印。"
-                        ]
-            },
-            {
-                        "item": "【笛】",
-                        "stars": [
-                                    "★１．さまざまな笛の呪力・奇瑞。",
-                                    "★２．神や霊を呼び寄せる笛。",
-                                    "★３．笛の音をほめる声。",
-                                    "★４．持ち主に祟る笛。",
-                                    "★５．名笛と贋笛。",
-                                    "★６．骨で作った笛。",
-                                    "★７．口笛。"
-                        ]
-            },
-            {
-                        "item": "【福の神】",
-                        "stars": [
-                                    "★１．福の神が家から出て行く。",
-                                    "★２．福の神たちの競争。",
-                                    "★３．富をもたらす化け物キジムナー。",
-                                    "★４ａ．家の中で目撃される、ざしきぼっこ・ざしきわらし。",
-                                    "★４ｂ．ざしきぼっこ・ざしきわらしが家から出て行く。",
-                                    "★５．七福神。"
-                        ]
-            },
-            {
-                        "item": "【袋】",
-                        "stars": [
-                                    "★１．開けてはならぬ袋。",
-                                    "★２．いくらでも米や金が出てくる袋。",
-                                    "★３．さまざまなものを吸い込む袋。",
-                                    "★４．危急の時に開ける袋。",
-                                    "★５ａ．命の入った袋。",
-                                    "★５ｂ．経の入った袋。",
-                                    "★５ｃ．嘘の入った袋。",
-                                    "★６．多くの目玉の入った袋。",
-                                    "★７．袋に生命が宿り、人間の形になる。",
-                                    "★８．大きな袋には、人間が入る。"
-                        ]
-            },
-            {
-                        "item": "【不死】",
-                        "stars": [
-                                    "★１．不死者。",
-                                    "★２ａ．不死ではあるが、老衰する。",
-                                    "★２ｂ．不老ではあるが、死んでしまった。",
-                                    "★３．不死を求める人。",
-                                    "★４．不死性を他にゆずる。",
-                                    "★５．不死をもたらす河と、死をもたらす河。",
-                                    "★６．不死の薬を得る。",
-                                    "★７．肉体を機械に変えて不死となる。"
-                        ]
-            },
-            {
-                        "item": "【豚】",
-                        "stars": [
-                                    "★１．豚妻。",
-                                    "★２．豚の娼婦。",
-                                    "★３ａ．人間が豚に転生する。",
-                                    "★３ｂ．天人が豚に転生する。",
-                                    "★４ａ．人間の魂が豚の中に入る。",
-                                    "★４ｂ．悪霊も豚の中に入る。",
-                                    "★５．幾万匹もの豚。",
-                                    "★６．子豚の三兄弟。",
-                                    "★７．豚たちが革命を起こす。",
-                                    "★８．屠殺される豚。",
-                                    "★９．豚と星。"
-                        ]
-            },
-            {
-                        "item": "【双面（ふたおもて）】",
-                        "stars": [
-                                    "★１．死霊Ａが生者Ｂにとりつく。さらに死霊Ａは、生者Ｂとそっくり同じ姿で出現して、ＡとＢが同じ振りで舞う。",
-                                    "★２．死霊Ａと死霊Ｂが合わさって一体になる。死霊（Ａ＋Ｂ）は、生者Ｃとそっくり同じ姿で出現し、（Ａ＋Ｂ）とＣが同じ振りで踊る。"
-                        ]
-            },
-            {
-                        "item": "【双子】",
-                        "stars": [
-                                    "★１．瓜二つのため、間違えられる。",
-                                    "★２．名前まで同じの双子。",
-                                    "★３ａ．双子の一方が善良、他方が邪悪。",
-                                    "★３ｂ．双子の一方が大統領、他方が陰謀団の総統。",
-                                    "★４．男女の双子。",
-                                    "★５．双子の一方が畸形嚢腫。",
-                                    "★６．父親が異なる双子。",
-                                    "★７ａ．父親が異なる二組の双子（あるいは四つ子）。",
-                                    "★７ｂ．母親が異なる二組の双子。",
-                                    "★８．双子の起源。",
-                                    "★９．双子が生まれた時の父親の言動。",
-                                    "★１０．胎内にいる時から争う双子。"
-                        ]
-            },
-            {
-                        "item": "【双子（別々に育つ）】",
-                        "stars": [
-                                    "★１．親が、双子の一人を残し一人を捨てたため、双子が互いを知ることなく別々に育つ。",
-                                    "★２．親が双子の一方を捨てるが、後に取り戻す。",
-                                    "★３．両親が離婚する時、双子を分けたため、双子が互いを知ることなく別々に育つ。",
-                                    "★４．双子の一方が、地下世界へ行ってしまう。",
-                                    "★５．別々に育った十組の双子。"
-                        ]
-            },
-            {
-                        "item": "【双子婚】",
-                        "stars": [
-                                    "★１．男女が、双子の兄妹であることを承知の上で関係を結ぶ。",
-                                    "★２．男女が、双子の兄妹であることを知らずに関係を結ぶ。"
-                        ]
-            },
-            {
-                        "item": "【二つの宝】",
-                        "stars": [
-                                    "★１．二ふりの剣。",
-                                    "★２．剣と折紙（鑑定書）。",
-                                    "★３．槍と杯。",
-                                    "★４．二つの指輪。",
-                                    "★５．二つの宝を手放すと死ぬ。"
-                        ]
-            },
-            {
-                        "item": "【二人夫】",
-                        "stars": [
-                                    "★１．二人の男が一人の女を愛し、一方の男が女への恋をあきらめて身を引く。",
-                                    "★２．二人の天皇を夫とする。",
-                                    "★３．二人の男妾を持つ。",
-                                    "★４．二人の男と一人の女、合計三人が仲良く暮らす。",
-                                    "★５．現世の夫と霊界の夫。"
-                        ]
-            },
-            {
-                        "item": "【二人夫（殺人で終る）】",
-                        "stars": [
-                                    "★１．二人の男が一人の女を愛し、女が一方の男を殺す。",
-                                    "★２．二人の男が一人の女を愛し、一方の男が女を殺す。",
-                                    "★３．二人の男が一人の女を愛し、一方の男が他方の男を殺す。"
-                        ]
-            },
-            {
-                        "item": "【二人夫（自死で終る）】",
-                        "stars": [
-                                    "★１．二人の男が一人の女を愛し、女はどちらを選ぶこともできず自死する。",
-                                    "★２．二人の男が一人の女を愛し、女はどちらを選ぶこともできず自死しようとするが、死にきれない。",
-                                    "★３．二人の男が一人の女を愛し、男が二人とも自殺する。"
-                        ]
-            },
-            {
-                        "item": "【二人妻】",
-                        "stars": [
-                                    "★１．男がもとの妻のほかに愛人を作るが、やがて、もとの妻の美質に目覚める。",
-                                    "★２．二人の妻が夫を譲り合う。",
-                                    "★３．二人の妻のために禿げ頭になり、捨てられる。",
-                                    "★４．夫が新しい女に心を移したので、もとの妻が怒って家を出る。",
-                                    "★５ａ．狐妻と幽霊妻。",
-                                    "★５ｂ．現世の妻と来世の妻。",
-                                    "★５ｃ．現実の妻と夢の中の妻。"
-                        ]
-            },
-            {
-                        "item": "【二人妻（等分に愛する）】",
-                        "stars": [
-                                    "★１．一ヵ月を十五日ずつに分けて、二人の妻の所へ通う。",
-                                    "★２．一日交替の妻。",
-                                    "★３．二人の妻を平等に愛そうとして、盲目になる。"
-                        ]
-            },
-            {
-                        "item": "【二人妻の正体】",
-                        "stars": [
-                                    "★１．二人妻の一方がにせもの。",
-                                    "★２．二人妻が両方とも本物。"
-                        ]
-            },
-            {
-                        "item": "【二人同夢】",
-                        "stars": [
-                                    "★１．二人の人間が同じ夢を見る。",
-                                    "★２ａ．夫婦恋人が、お互い相手を夢に見る。",
-                                    "★２ｂ．二人の僧が、お互い相手のことを夢に見る。",
-                                    "★２ｃ．二人が、それぞれ相手の見るべき夢を見る。",
-                                    "★３．二人が同時期に死に、まもなく生き返って、互いに「相手を冥府で見た」と言う。これは、二人同夢と同様の体験といってよかろう。",
-                                    "★４．三人同夢。",
-                                    "★５．多人同夢。"
-                        ]
-            },
-            {
-                        "item": "【二人の王】",
-                        "stars": [
-                                    "★１．二人の王が並び立つ。",
-                                    "★２．世俗の王と宗教の王が並び立つ。"
-                        ]
-            },
-            {
-                        "item": "【二人の神】",
-                        "stars": [
-                                    "★１．隣りの宇宙の神様が、この宇宙の神様に会いに来る。",
-                                    "★２．二つの神を一所に置く。",
-                                    "★３．アマテラスとタカミムスヒ（＝タカギ）。"
-                        ]
-            },
-            {
-                        "item": "【二人の仏】",
-                        "stars": [
-                                    "★１．二人の仏が対面する。遠い仏国土の如来が、釈迦如来のもとを訪れる。",
-                                    "★２．二人の仏が、一つの世に並んで現れることはない。",
-                                    "★３ａ．五十六億七千万年を隔てて現れる、前仏（ぜんぶつ）と後仏（ごぶつ）。",
-                                    "★３ｂ．前仏（釈迦）が後仏（弥勒）に会いに行く。"
-                        ]
-            },
-            {
-                        "item": "【二人一役】",
-                        "stars": [
-                                    "★１．二人が協力して、一人ではできないことをする。",
-                                    "★２．二人が、背負う者・背負われる者となって、一人ではできないことをする。",
-                                    "★３．Ａは殺人を考えるだけで実行はしない。Ｂは、Ａの考えを十分に理解できないものの、それに従って殺人を実行に移す。",
-                                    "★４．一人の盗賊の奇妙な仕業と思われたことが、意図を異にする二人の人物の行ないであった。",
-                                    "★５．死者二人の霊が合体して、一人の生者の姿になる。"
-                        ]
-            },
-            {
-                        "item": "【仏舎利】",
-                        "stars": [
-                                    "★１．釈迦の遺骨である仏舎利は、白い玉であり、傷つくことも砕けることもない。",
-                                    "★２．掌に仏舎利を握って生まれる。",
-                                    "★３．仏舎利の数が増える。",
-                                    "★４．仏像から仏舎利を取ることができるか。",
-                                    "★５．前世で貸した仏舎利。"
-                        ]
-            },
-            {
-                        "item": "【葡萄】",
-                        "stars": [
-                                    "★１．葡萄から酒を造る。",
-                                    "★２．すっぱい葡萄。",
-                                    "★３．イエスは葡萄の木、弟子はその枝。"
-                        ]
-            },
-            {
-                        "item": "【舞踏会】",
-                        "stars": [
-                                    "★１．貴族あるいは上流社会の生活様式としての舞踏会。",
-                                    "★２．男女の出会いの場としての舞踏会。",
-                                    "★３．舞踏会の夜の事件。",
-                                    "★４．仮面舞踏会の扮装。"
-                        ]
-            },
-            {
-                        "item": "【ふとん】",
-                        "stars": [
-                                    "★１．蒲団の匂いを嗅いで女を偲ぶ。",
-                                    "★２．蒲団から声がする。",
-                                    "★３．何枚も重ねた布団の下の物を感知する。",
-                                    "★４．両手を布団の上に出して寝る。",
-                                    "★５．女性の肉体を蒲団にたとえる。",
-                                    "★６．いくら年齢の離れた男女でも、一つの蒲団に寝れば、ただではすまない。"
-                        ]
-            },
-            {
-                        "item": "【船】",
-                        "stars": [
-                                    "★１．船が氷山と衝突する。",
-                                    "★２．船が大津波を受けて転覆する。",
-                                    "★３．船が台風で転覆・沈没する。",
-                                    "★４．乗組員のストライキ。反乱。",
-                                    "★５．船の発明。",
-                                    "★６．たらい舟。",
-                                    "★７ａ．ヨットに乗る男二人と女一人。",
-                                    "★７ｂ．救命ボートに乗る男三人。",
-                                    "★８．船の中の一人が、海に入る。",
-                                    "★９．船の中から一人を選んで、海に入れる。船の外へ追いやる。",
-                                    "★１０．沈んだ舟と沈まなかった舟。",
-                                    "★１１．般若の船。"
-                        ]
-            },
-            {
-                        "item": "【不能】",
-                        "stars": [
-                                    "★１．戦傷によって、性的不能になる男。",
-                                    "★２ａ．生まれつき・あるいは病気のため、性的不能の男。",
-                                    "★２ｂ．心理的葛藤のため、性的不能になる男。",
-                                    "★３．死んだ妻の呪いによって、夫が性的不能になる。",
-                                    "★４．不能者の暴行。"
-                        ]
-            },
-            {
-                        "item": "【不眠】",
-                        "stars": [
-                                    "★１．不眠症の人。",
-                                    "★２．眠ったふり。",
-                                    "★３．身体は眠っているのに、意識が覚醒している。金縛り状態になる。",
-                                    "★４．眠ってはいけない夜。",
-                                    "★５．不眠症にならない人。",
-                                    "★６．死んでも治らぬ不眠症。"
-                        ]
-            },
-            {
-                        "item": "【不倫】",
-                        "stars": [
-                                    "★１．夫の不倫の結果、妻が心を病む。",
-                                    "★２．夫の不倫の結果、妻が死ぬ。",
-                                    "★３．夫の不倫相手の女が自殺する。",
-                                    "★４．夫の不倫の結果、妻が夫を殺す。",
-                                    "★５．妻と情婦が手を組んで夫を殺す、と見せかけ、実は夫と情婦が共謀して、妻を死に追いやる。",
-                                    "★６．不倫願望",
-                                    "★７．上司の不倫。",
-                                    "★８．病気の妻が死ねば、正式に結婚できる。"
-                        ]
-            },
-            {
-                        "item": "【風呂】",
-                        "stars": [
-                                    "★１．玄関で風呂に入る。",
-                                    "★２．五右衛門風呂（風呂の底が釜になっており、下から直に湯を沸かす）の入り方。",
-                                    "★３．銭湯の男湯と女湯。",
-                                    "★４．入浴中の妻が、夫の危難を救うため、裸のまま出て来る。",
-                                    "★５ａ．風呂場で丸腰でいるところを、襲って殺す。",
-                                    "★５ｂ．風呂場なら丸腰だろうと思って襲い、失敗する。",
-                                    "★５ｃ．風呂場に閉じ込めて蒸し殺す。",
-                                    "★６．妻が夫を風呂に入れて殺そうとするが、失敗する。",
-                                    "★７．銭湯での殺人事件。",
-                                    "★８．若い娘を風呂に入れて、その身体を点検する。",
-                                    "★９．男装した娘が、風呂に入る。"
-                        ]
-            },
-            {
-                        "item": "【分割】",
-                        "stars": [
-                                    "★１．重い物を、四つに分割して運ぶ。",
-                                    "★２．重い死体を、二つに切って運ぶ。",
-                                    "★３．人体を、いったん四つに切って救出する。",
-                                    "★４．一まとまりなら強いものも、三つに分割すれば弱くなる。",
-                                    "★５．神聖な宝石は、分割すると価値がなくなってしまう。",
-                                    "★６．大金を子供たちに分配する。",
-                                    "★７．「三」できれいに割り切れる金額。",
-                                    "★８．知行を分割する。",
-                                    "★９．天下を三分割する。",
-                                    "★１０．夫婦で苦と楽を分割する。",
-                                    "★１１．役割を分担して、難題を解決する。",
-                                    "★１２．多くに切り分けて、分量をごまかす。",
-                                    "★１３．無限の分割。"
-                        ]
-            },
-            {
-                        "item": "【焚書】",
-                        "stars": [
-                                    "★１．独裁体制・全体主義体制を維持するため、体制にとって不都合な思想を記した書物を焼き棄てる。",
-                                    "★２．著者が自らの著書を焼く。",
-                                    "★３．ドン・キホーテの心を狂わせた本を、友人たちが焼き棄てる。"
-                        ]
-            },
-            {
-                        "item": "【分身】",
-                        "stars": [
-                                    "★１ａ．自分の分身が、方々で知人たちに目撃される。",
-                                    "★１ｂ．自分の分身が知人たちに目撃され、やがて自分もその分身を見る。",
-                                    "★１ｃ．一人の人物が、同時に二ヵ所で目撃される。",
-                                    "★２．一人の人物が、同時に二つの窓を通り抜ける。",
-                                    "★３．家へ帰って来た自分と、床に臥していた自分。",
-                                    "★４．剣で縦に斬られて、一人の人間が二人になる。",
-                                    "★５．本体を残して影（分身）を消す。",
-                                    "★６．他者を殺すつもりで、自分自身を殺してしまった。",
-                                    "★７．自殺するつもりだったが、自分を殺すのではなく、分身を殺してしまった。",
-                                    "★８．夫の分身と妻の分身。"
-                        ]
-            },
-            {
-                        "item": "【分身（多数）】",
-                        "stars": [
-                                    "★１．数体～数百体の分身。",
-                                    "★２．何十億、さらにそれ以上の無数の分身。",
-                                    "★３．分身たちを消す。"
-                        ]
-            },
-            {
-                        "item": "【兵役】",
-                        "stars": [
-                                    "★１．兵役によって、夫婦や恋人が引き裂かれる。",
-                                    "★２．兵役によって引き裂かれた夫婦が、再び結ばれる。",
-                                    "★３．兵役を忌避して隠れる、逃げる。",
-                                    "★４．兵役を逃れるために、狂人のふりをする。",
-                                    "★５．兵役を免除される。",
-                                    "★６ａ．権力者が私情から、従者に兵役を課す。",
-                                    "★６ｂ．有力者の子弟が兵役を免除され、その代わりに、別の人物が不当に徴兵されることがあった。",
-                                    "★７．兵役を喜び、「ずっと軍隊にいたい」と願う。",
-                                    "★８．兵役により、野球選手としての一生を台なしにされる。",
-                                    "★９ａ．兵役による戦傷。両手を失う。",
-                                    "★９ｂ．兵役による戦傷。四肢を失う。",
-                                    "★１０．兵役を志願し、戦死する。",
-                                    "★１１．兵卒が、戦犯として処刑される。",
-                                    "★１２．戦場へ行く女学生たち。",
-                                    "★１３．戦地から復員した将校。",
-                                    "★１４．召集令状。"
-                        ]
-            },
-            {
-                        "item": "【へそ】",
-                        "stars": [
-                                    "★１．神の臍の中から、五穀が生ずる。",
-                                    "★２．少童が臍から金の小粒を出す。",
-                                    "★３．臍の奥。",
-                                    "★４．婆の臍。",
-                                    "★５．過去の臍の緒。"
-                        ]
-            },
-            {
-                        "item": "【蛇】",
-                        "stars": [
-                                    "★１．蛇は英雄の片割れ。",
-                                    "★２．蛇と樹木。",
-                                    "★３．蛇の足。",
-                                    "★４ａ．双頭の蛇を見ると、死ぬ（＊→〔神を見る〕１の変形）。",
-                                    "★４ｂ．蛇の化身の女児を見ると、死ぬ。",
-                                    "★５．蛇が人を追う。",
-                                    "★６．蛇を食べる。",
-                                    "★７．蛇の身を捨てて、人や天人の姿になる。",
-                                    "★８．蛇の作り物。"
-                        ]
-            },
-            {
-                        "item": "【蛇と金（かね）】",
-                        "stars": [
-                                    "★１．財布の金が蛇に変わる。",
-                                    "★２．大判小判が蛇に変わり、また大判小判にもどる。",
-                                    "★３．金（かね）が蛇に入れ替わり、金にもどらない。",
-                                    "★４．金（かね）は毒蛇同然のもの。"
-                        ]
-            },
-            {
-                        "item": "【蛇と剣】",
-                        "stars": [
-                                    "★１．大小二本の剣が大蛇・小蛇に化して、盗人を追い払う。",
-                                    "★２．自ら動く剣が、盗人の目には蛇に見える。",
-                                    "★３．剣が自ら動いて、大蛇を斬る。"
-                        ]
-            },
-            {
-                        "item": "【蛇と酒】",
-                        "stars": [
-                                    "★１．酒が蛇に変わる。",
-                                    "★２．酒が蛇に変わり、また酒にもどる。"
-                        ]
-            },
-            {
-                        "item": "【蛇に化す】",
-                        "stars": [
-                                    "★１．人が生きたまま蛇に化す。",
-                                    "★２．人の両肩から蛇が生え出る。",
-                                    "★３．人が死後に蛇に化す。",
-                                    "★４ａ．恨みを抱いて死んだ女が、蛇となって仏壇に現れる。",
-                                    "★４ｂ．仏壇に蛇が現れても、それは死者と関連があるとは限らない。",
-                                    "★４ｃ．蛇が死者の魂と見なされることを利用して、殺人を死霊の祟りのように見せかける。",
-                                    "★４ｄ．死後蛇に化した、あるいは、魂が蛇の形で現れたように、人々に思わせる。",
-                                    "★５．人の臨終の前後に現れる蛇。",
-                                    "★６．手拭いが蛇になる。"
-                        ]
-            },
-            {
-                        "item": "【蛇の室】",
-                        "stars": [
-                                    "★１．多くの蛇が集まる室。"
-                        ]
-            },
-            {
-                        "item": "【蛇退治】",
-                        "stars": [
-                                    "★１．神や英雄が大蛇を退治する。",
-                                    "★２ａ．英雄は、赤ん坊の時でさえ、蛇を退治することがある。",
-                                    "★２ｂ．蛇退治ではないが、日本の「道場法師」の説話にも、赤ん坊と蛇の組み合わせが見られる。",
-                                    "★３．近代の英雄が蛇を退治する。",
-                                    "★４．女が蛇を退治する",
-                                    "★５．蛇が道をふさぐが、英雄は恐れず通る。",
-                                    "★６．開墾の妨げをする蛇を追い払う。"
-                        ]
-            },
-            {
-                        "item": "【蛇女房】",
-                        "stars": [
-                                    "★１．男が美しい女と結婚するが、女の正体は蛇だった。",
-                                    "★２．蛇精が蛇の身を棄てて人間の女になり、青年と結婚する。",
-                                    "★３．半人半蛇の女と交わる。",
-                                    "★４．蛇が男性器をくわえる。",
-                                    "★５．女の身体の中に棲む蛇。"
-                        ]
-            },
-            {
-                        "item": "【蛇婿】",
-                        "stars": [
-                                    "★１ａ．蛇が人間の男に化けて、女と交わる。",
-                                    "★１ｂ．蛇体の神が人間の女と交わる。",
-                                    "★２．蛇に犯される夢を見て、懐妊する。",
-                                    "★３．蛇が人間の女に巻きつく。",
-                                    "★４．女神が蛇と結婚する。",
-                                    "★５．蛇婿の本体は、美青年であった。",
-                                    "★６．蛇婿と人間の女との間に生まれた子供の身体的特徴。",
-                                    "★７．蛇が女性器をねらう。"
-                        ]
-            },
-            {
-                        "item": "【蛇息子】",
-                        "stars": [
-                                    "★１．人間の女が小蛇を産み、育てる。蛇は成長後、昇天しようとして失敗する。",
-                                    "★２ａ．人間の夫婦が小蛇を育てる。蛇は成長後、昇天する。",
-                                    "★２ｂ．爺婆が小蛇を育てる。蛇は成長後、海へ去る。",
-                                    "★３．独身者が小蛇を育てる。蛇は成長後、馬や人を呑み、町を水没させる。",
-                                    "★４．少年が雌の小蛇をかわいがる、という話もある。"
-                        ]
-            },
-            {
-                        "item": "【部屋】",
-                        "stars": [
-                                    "★１．開（あ）かずの間（ま）。",
-                                    "★２ａ．多くの死体がある部屋。",
-                                    "★２ｂ．見ることを禁じられた、多くの死体のある部屋。",
-                                    "★３．人体の血や油（脂）をしぼり取る部屋。纐纈城。",
-                                    "★４．小さな部屋での怪事。",
-                                    "★５．小さな部屋の中の大空間。",
-                                    "★６．子供を部屋から外にださないようにして保護する。"
-                        ]
-            },
-            {
-                        "item": "【変化（へんげ）】",
-                        "stars": [
-                                    "★１．狐狸や鬼が、母に化けて訪れる。",
-                                    "★２．狸が、伯母に化けて訪れる。",
-                                    "★３．狐が、伯父に化けて訪れる。",
-                                    "★４．鬼が、弟に化けて訪れる。",
-                                    "★５．身体全体が化けるのではなく、手足だけを変える。"
-                        ]
-            },
-            {
-                        "item": "【変身】",
-                        "stars": [
-                                    "★１．身体が大きくなったり小さくなったりする。",
-                                    "★２．変身を重ねる。次々といろいろなものに変身する。",
-                                    "★３．男女二人が協力して、一まとまりの物に変身する。",
-                                    "★４．計略を用いて怪物を小さく変身させる。",
-                                    "★５．日本人が四年周期で変身し、西洋風の華やかな歓楽を享受する。しかしやがて日本の暮らしに心の落ち着きを感じるようになる。",
-                                    "★６．博士が薬を飲んで別人に変身し、薬を飲んでまたもとにもどる。しかし次第にもとの姿にもどりにくくなる。"
-                        ]
-            },
-            {
-                        "item": "【変身（人から動物に）】",
-                        "stars": [
-                                    "★１．人間が、魔法などによって動物に変身させられる。後に、もとの姿に戻れることもある。",
-                                    "★２．美女が動物の皮をかぶって変身する。皮を脱げばまた美しい姿にもどる。",
-                                    "★３．明確な理由なく、一人の人間が動物に変身する。",
-                                    "★４．明確な理由なく、大勢の人間が動物に変身し、一人だけ人間のまま取り残される。"
-                        ]
-            },
-            {
-                        "item": "【変身（動物から人に）】",
-                        "stars": [
-                                    "★１．魔法がとけて、動物が人間に変わる。",
-                                    "★２．蛇や田螺が人間に変わる。「魔法がとけた」とは明示されない。"
-                        ]
-            },
-            {
-                        "item": "【変身（醜から美に）】",
-                        "stars": [
-                                    "★１．醜貌・奇形から美貌に変身する。",
-                                    "★２．いったん醜い姿にされ、後に本来の端正な容姿に戻る。"
-                        ]
-            },
-            {
-                        "item": "【返答】",
-                        "stars": [
-                                    "★１．魔や霊などの問いかけに、返事をしてはいけない。",
-                                    "★２ａ．返事をしないと、罰せられることがある。",
-                                    "★２ｂ．返事をして、福運を授かることもある。",
-                                    "★３ａ．返答するはずのない杭が返答する。",
-                                    "★３ｂ．返答するはずのない鴛鴦が返答する。",
-                                    "★３ｃ．返答するはずのない死体が返答する。",
-                                    "★３ｄ．返答するはずのない米が返答する。",
-                                    "★４ａ．鸚鵡返しの返答。",
-                                    "★４ｂ．鸚鵡返しの返歌。",
-                                    "★５．返歌すべきところを、せずにすます。",
-                                    "★６．無心の返答。"
-                        ]
-            },
-            {
-                        "item": "【棒】",
-                        "stars": [
-                                    "★１．魔法の棒。",
-                                    "★２．如意棒。",
-                                    "★３．金の棒。",
-                                    "★４．占い棒。水脈や鉱脈の探知に用いる。",
-                                    "★５．棒があれば、闇の中でも走ることができる。",
-                                    "★６．男が棒に変身する。",
-                                    "★７．赤い棒だと思ったら、赤い夕焼けだった。"
-                        ]
-            },
-            {
-                        "item": "【放火】",
-                        "stars": [
-                                    "★１．愛人に逢うために、自分の家に火をつける。",
-                                    "★２．詩作のために、火事を起こす。",
-                                    "★３．不滅の美である金閣寺を焼いて、世界を変えようとする。",
-                                    "★４．「神は愛なり」の教えは嘘だと言って、教会に放火する。",
-                                    "★５．放火をして、その罪を他人に負わせる。",
-                                    "★６．放火によって寺は焼けたが、仏の画像は無事だった。",
-                                    "★７．狐の放火。"
-                        ]
-            },
-            {
-                        "item": "【忘却】",
-                        "stars": [
-                                    "★１．すべてを忘れる。",
-                                    "★２．自分のした行動を忘れ、それを誰か他の人間のやったことだと思う。",
-                                    "★３．自分の考えたアイデアを忘れ、それを他人に教えてもらおうとする。",
-                                    "★４．重要な言葉やことがらを忘れる。",
-                                    "★５．長期間に渡る習慣ゆえに、その習慣が期限つきであることを忘れる。",
-                                    "★６．願望を意識下に抑圧したために起こる忘却。",
-                                    "★７．忘却の国。",
-                                    "★８．異世界へ帰る人は、現世の人間への感情を忘れてしまう。",
-                                    "★９．死後の世界へ行った人は、現世に生きていた時の心を忘れてしまう。"
-                        ]
-            },
-            {
-                        "item": "【忘却（妻を）】",
-                        "stars": [
-                                    "★１．男が薬を飲まされて、妻を忘れる。",
-                                    "★２．男が呪いによって、妻を忘れる。",
-                                    "★３．帝が愛人を忘れたまま、長年月が経過する。",
-                                    "★４．帝が愛人を忘れ、愛人は死ぬ。",
-                                    "★５．王子が恋人を忘れるが、恋人が王子に自分を思い出させる。",
-                                    "★６．男が、年月の経過につれて、しだいに恋人のことを忘れる。",
-                                    "★７．男が、恋人と結婚したことを忘れてしまう。"
-                        ]
-            },
-            {
-                        "item": "【暴行】",
-                        "stars": [
-                                    "★１．処女が自分の純潔を犠牲にして、肉親の敵（かたき）である男を暴行犯に仕立て上げる。",
-                                    "★２．合意の上の情交であるのに、「暴行」と見なされる。",
-                                    "★３．「黒人が、白人女性を暴行した」との訴え。",
-                                    "★４．暴行犯との、思いがけぬ再会。",
-                                    "★５．法に訴えても暴行犯を処罰できなかったので、射殺する。",
-                                    "★６．少女を輪姦から救うために、殺してしまう。",
-                                    "★７．暴行現場を見ないように、目をそむける。",
-                                    "★８．異物を用いての暴行。",
-                                    "★９．暴行できない事情。"
-                        ]
-            },
-            {
-                        "item": "【暴行（人妻を）】",
-                        "stars": [
-                                    "★１ａ．夫の目の前で、妻が悪人に暴行される。その後の妻の言葉。",
-                                    "★１ｂ．『今昔物語集』巻２９－２３にもとづく『藪の中』（芥川龍之介）では、若い男（盗賊多襄丸）・夫（金沢武弘）・妻（真砂）の言い分が食い違う。",
-                                    "★１ｃ．『藪の中』（芥川龍之介）にもとづく『羅生門』（黒澤明）では、事件を目撃した木こりが最後に「真相」を語る。",
-                                    "★２．夫が不在の間に、妻が知り合いの男に犯される。",
-                                    "★３．夫がいる部屋の隣りで、妻が輪姦される。",
-                                    "★４．暴行された人妻が、そのことを夫に知られたくないと思う。"
-                        ]
-            },
-            {
-                        "item": "【帽子】",
-                        "stars": [
-                                    "★１．権力の象徴である帽子。",
-                                    "★２ａ．学生の象徴である制帽。",
-                                    "★２ｂ．檀那方のかぶる帽子と労働者のかぶる帽子。",
-                                    "★３．帽子一つからわかること。",
-                                    "★４．帽子の絵。",
-                                    "★５．魔法の帽子。",
-                                    "★６．いろいろなものが出てくる奇術師の帽子。",
-                                    "★７．頭に冠や烏帽子をかぶらないのは、無作法・非礼である。",
-                                    "★８．君子は冠を正しくして死ぬ。",
-                                    "★９．かぶると姿が見えなくなる帽子。",
-                                    "★１０．武将の兜。"
-                        ]
-            },
-            {
-                        "item": "【放生】",
-                        "stars": [
-                                    "★１．多くの生類を買い取って放生し、功徳を積む。",
-                                    "★２．箱の中に多くの生類がいると思って買い取ったら、中には仏の絵像があった。",
-                                    "★３．亀を買い取って放生する。",
-                                    "★４．うなぎの放生のつもりで、赤ん坊を放生してしまう。"
-                        ]
-            },
-            {
-                        "item": "【坊主頭】",
-                        "stars": [
-                                    "★１．眠っている人の髪を剃って、坊主頭にする。",
-                                    "★２．眠っている間に坊主頭にされたため、それが自分だと認識できない人。",
-                                    "★３．狐にだまされて坊主頭になる。"
-                        ]
-            },
-            {
-                        "item": "【ボクシング】",
-                        "stars": [
-                                    "★１．貧しい少年や青年が、ボクサーになる。",
-                                    "★２．無名のボクサーの大抜擢。",
-                                    "★３．引退したボクサー。",
-                                    "★４．八百長試合。",
-                                    "★５．女性ボクサー。",
-                                    "★６．古代のボクシング。"
-                        ]
-            },
-            {
-                        "item": "【北斗七星】",
-                        "stars": [
-                                    "★１．北斗七星と、その子供の小さな星。",
-                                    "★２ａ．北斗七星がすべて消える。",
-                                    "★２ｂ．北斗七星の一つが消える。",
-                                    "★３．北斗七星が落ちて来る夢。",
-                                    "★４．北斗星を呑む夢。",
-                                    "★５．北斗星は、人の死をつかさどる。",
-                                    "★６．北斗七星は、北の空を一年中ぐるぐる回る。"
-                        ]
-            },
-            {
-                        "item": "【ほくろ】",
-                        "stars": [
-                                    "★１．同一人である証拠のほくろ。",
-                                    "★２ａ．同一人が転生した証拠のほくろ。",
-                                    "★２ｂ．足の裏につけた墨が、転生後、ほくろとして現れる。",
-                                    "★３．身体の同じ部位にほくろのある二人。",
-                                    "★４．人妻のほくろの位置を、夫以外の男が知る。",
-                                    "★５ａ．后のほくろ。",
-                                    "★５ｂ．ほくろでなく、灸点という形もある。",
-                                    "★６．魅力的なほくろ。",
-                                    "★７．ほくろを消す。"
-                        ]
-            },
-            {
-                        "item": "【歩行】",
-                        "stars": [
-                                    "★１．空中歩行。",
-                                    "★２．水上歩行。",
-                                    "★３ａ．二足歩行から四足歩行へ退化する。",
-                                    "★３ｂ．四足歩行で福を得る。",
-                                    "★３ｃ．二足歩行が、人間の魂の病気の起源。",
-                                    "★４．後ろ向きの歩行。",
-                                    "★５．誕生してすぐの歩行。"
-                        ]
-            },
-            {
-                        "item": "【星】",
-                        "stars": [
-                                    "★１ａ．空の星を落とそうとする。",
-                                    "★１ｂ．高い山に登れば、星を取ることができる。",
-                                    "★２．空の星が落ちる夢。",
-                                    "★３．多くの星が動いて、人々を驚かせる。",
-                                    "★４．昼間に星が見える。",
-                                    "★５．星は、空に輝く眼。",
-                                    "★６．砂漠の星空。",
-                                    "★７．星を食べる。"
-                        ]
-            },
-            {
-                        "item": "【星と生死】",
-                        "stars": [
-                                    "★１．人の誕生と星。",
-                                    "★２ａ．イエス＝キリスト誕生を告げる星。",
-                                    "★２ｂ．イエス誕生の時に輝いた星の真相。",
-                                    "★３．人の死と星。",
-                                    "★４．死後の「私」と星。"
-                        ]
-            },
-            {
-                        "item": "【星に化す】",
-                        "stars": [
-                                    "★１．地上の人間が天に昇って、星に化す。",
-                                    "★２ａ．神あるいは聖人の魂が星になる。",
-                                    "★２ｂ．英雄の無念の思いが星になる。",
-                                    "★３．鳥が星になる。",
-                                    "★４．冠が星になる。",
-                                    "★５．首飾りが星になる。",
-                                    "★６ａ．人間が一時的に天界を訪れる。地上から見ると、新しい星が現れたように見える。",
-                                    "★６ｂ．地上の人間の動きが、天界の星の動きとなってあらわれる。"
-                        ]
-            },
-            {
-                        "item": "【星の化身】",
-                        "stars": [
-                                    "★１．星が人間の姿をして地上に現れる。",
-                                    "★２．星が銀貨や銅貨に変る。"
-                        ]
-            },
-            {
-                        "item": "【蛍】",
-                        "stars": [
-                                    "★１．蛍の光。",
-                                    "★２．多数の亡魂が多数の蛍になる。",
-                                    "★３．生きた女の身体から抜け出た魂かもしれぬ蛍。",
-                                    "★４．死んだ女の身体から抜け出た魂かもしれぬ蛍。",
-                                    "★５．禿げ頭を、蛍の光に見立てる。",
-                                    "★６．星が蛍になった。"
-                        ]
-            },
-            {
-                        "item": "【発心】",
-                        "stars": [
-                                    "★１．人の死・動物の死に接して現世の無常を観じ、発心して仏道へ入る。",
-                                    "★２．桜花を見、稲穂を見て、無常を観ずる。",
-                                    "★３．仏の教えを聞く・すぐれた僧に出会うなどして、発心し仏道に入る。"
-                        ]
-            },
-            {
-                        "item": "【ホテル】",
-                        "stars": [
-                                    "★１．多くの客が宿泊する都会の大ホテル。",
-                                    "★２．孤独を求めて都会のホテルにこもる。",
-                                    "★３．性交のためのホテル。",
-                                    "★４．ホテルの部屋のマジック･ミラー。",
-                                    "★５．ホテルの経営者が、自分の息子を殺す。",
-                                    "★６．人を狂わせ、殺すホテル。",
-                                    "★７．高級ホテルではなく、貧しい人々の寝泊りする木賃宿。"
-                        ]
-            },
-            {
-                        "item": "【仏】",
-                        "stars": [
-                                    "★１．仏の化身。",
-                                    "★２．「仏が訪れる」との夢告。",
-                                    "★３．仏像が苦痛を訴える。",
-                                    "★４．仏像が無実を訴える、あるいは、罪を告白する。",
-                                    "★５．にせの仏。",
-                                    "★６．人間が死んで仏菩薩になる。"
-                        ]
-            },
-            {
-                        "item": "【仏を見る】",
-                        "stars": [
-                                    "★１．夢で阿弥陀仏を見る。",
-                                    "★２．目を閉じて普賢菩薩を見る。",
-                                    "★３．地蔵菩薩を見る。",
-                                    "★４．観音菩薩を見る。",
-                                    "★５．人によって、異なる仏の姿が見える。",
-                                    "★６．人によって、男女二人とも菩薩二体とも見える。",
-                                    "★７．「仏の姿を見た」と思ったら、狸や天狗が化けたものだった。"
-                        ]
-            },
-            {
-                        "item": "【骨】",
-                        "stars": [
-                                    "★１ａ．神が、男（アダム）のあばら骨から女（エバ＝イヴ）を造る。",
-                                    "★１ｂ．「僕」の肋骨からイヴを作ってほしい。",
-                                    "★２．神が男を、悪魔が女を作った。",
-                                    "★３．死者の骨をつないで、生前の姿に戻す。",
-                                    "★４．動物の骨片から、その動物を再生する。",
-                                    "★５．骨が生命力の要、という信仰。",
-                                    "★６．武器としての骨。",
-                                    "★７ａ．火葬後の骨が原形をとどめない。",
-                                    "★７ｂ．火葬後の骨が、脆（もろ）く黒ずんでいる。",
-                                    "★７ｃ．火葬後の骨が蛇に変わる。",
-                                    "★８．人間の骨の代わりに動物の骨。",
-                                    "★９ａ．聖者の遺骨を見た人が死ぬ。",
-                                    "★９ｂ．聖者の遺骨に触れた死者が生き返る。",
-                                    "★１０ａ．親友二人の骨を混ぜる。",
-                                    "★１０ｂ．骸骨を抱きしめる骸骨。"
-                        ]
-            },
-            {
-                        "item": "【洞穴（ほらあな）】",
-                        "stars": [
-                                    "★１．洞穴に住む母子。",
-                                    "★２．洞穴に住む男女。",
-                                    "★３．洞穴に住む犬と娘。",
-                                    "★４．洞穴に住む怪物。"
-                        ]
-            },
-            {
-                        "item": "【本】",
-                        "stars": [
-                                    "★１．読書に熱中して、何も目に入らず、音も聞こえない。",
-                                    "★２．書物を食べる。",
-                                    "★３．本のページに毒を塗る。",
-                                    "★４．不思議な本。",
-                                    "★５．無限のページを有する本。",
-                                    "★６．莫大な数の本。",
-                                    "★７ａ．本の中に入る。",
-                                    "★７ｂ．本の世界に入り込んで、現実に戻れない。",
-                                    "★８ａ．本を開くと、美女の姿が栞（しおり）になっていた。",
-                                    "★８ｂ．本を開くと、蛇の抜け殻が栞（しおり）になっていた。",
-                                    "★８ｃ．本の中に遺書を挟んでおく。",
-                                    "★９ａ．本の冊数が減って行く。",
-                                    "★９ｂ．冊数が減っても、本の値段が変わらない。",
-                                    "★９ｃ．売った時の倍の値段で、本を買い戻す。"
-                        ]
-            },
-            {
-                        "item": "【本と眠り】",
-                        "stars": [
-                                    "★１．眠るための本。",
-                                    "★２．本を読んで眠り、その本の影響を受けた夢を見る。",
-                                    "★３．本を読んで眠ったが、本の内容とは全然関係のない夢を見る。"
-                        ]
-            },
-            {
-                        "item": "【本占い】",
-                        "stars": [
-                                    "★１．本を開き、そのページに書いてある言葉を読んで、吉凶を判断し行動の指針とする。",
-                                    "★２．本を開き、そのページに書いてある言葉をもとに、小説の題を決める。",
-                                    "★３．本を読んで目についた言葉が、翌日の運命を暗示していた。"
-                        ]
-            },
-            {
-                        "item": "【迷子】",
-                        "stars": [
-                                    "★１．迷子の世話をする。",
-                                    "★２．「まいご」と「まごい」。",
-                                    "★３．少女を迷子に仕立てて、人をおびき寄せる。"
-                        ]
-            },
-            {
-                        "item": "【枕】",
-                        "stars": [
-                                    "★１ａ．木を枕に寝て、神々の問答を聞く。",
-                                    "★１ｂ．石を枕に寝て、神のお告げを聞く。",
-                                    "★２．枕の穴が異郷への入口。",
-                                    "★３．枕の場所を変える（枕に乗っている頭部の位置も変わる）と、体外に出ていた魂が身体に戻れなくなる。",
-                                    "★４．枕返し。眠っている人の枕をひっくり返す。",
-                                    "★５．枕の下から金貨。",
-                                    "★６．枕の下に宝船の絵。",
-                                    "★７．古い枕が妖怪化する。",
-                                    "★８．枕にも、決まった寿命（＝数）がある。"
-                        ]
-            },
-            {
-                        "item": "【正夢】",
-                        "stars": [
-                                    "★１．真実の夢といつわりの夢。",
-                                    "★２．近代小説の正夢。"
-                        ]
-            },
-            {
-                        "item": "【魔女】",
-                        "stars": [
-                                    "★１．三人の魔女。",
-                                    "★２．魔女を妻とする。",
-                                    "★３．魔女のお化粧（つくり）。",
-                                    "★４．魔女の宿。",
-                                    "★５．魔女裁判。"
-                        ]
-            },
-            {
-                        "item": "【待ち合わせ】",
-                        "stars": [
-                                    "★１．男女が待ち合わせるが、女が来ない。",
-                                    "★２．男女が待ち合わせるが、男が来ない。",
-                                    "★３．友人どうしが待ち合わせる。",
-                                    "★４ａ．謎の人物と待ち合わせる。",
-                                    "★４ｂ．誰を待っているのか、何を待っているのか、答えられないこともある。",
-                                    "★５．待ち伏せ。"
-                        ]
-            },
-            {
-                        "item": "【末子】",
-                        "stars": [
-                                    "★１．六人きょうだいの末子。",
-                                    "★２．七人きょうだいの末子。",
-                                    "★３．八人きょうだいの末子。"
-                        ]
-            },
-            {
-                        "item": "【待つべき期間】",
-                        "stars": [
-                                    "★１ａ．七日待つ。",
-                                    "★１ｂ．七日待てない。",
-                                    "★２ａ．百日待つ。",
-                                    "★２ｂ．百日待てない。",
-                                    "★３．千日待つ。",
-                                    "★４ａ．三年待つ。",
-                                    "★４ｂ．三年待てない。",
-                                    "★５．百年待つ。"
-                        ]
-            },
-            {
-                        "item": "【真似】",
-                        "stars": [
-                                    "★１．幸運を得た人の隣人が、真似をして失敗する。",
-                                    "★２．幸運を得た人の兄弟姉妹が、真似をして失敗する。",
-                                    "★３ａ．人間が動物の真似をする。",
-                                    "★３ｂ．動物相互の真似。",
-                                    "★４ａ．共鳴動作。Ａの動作を、Ｂが無意識のうちに真似して、同じように動く。",
-                                    "★４ｂ．『蜘蛛』や『目羅博士』の原型かもしれぬ物語。",
-                                    "★４ｃ．共鳴動作。Ａが笑い、それにつられてＢも笑い出す。",
-                                    "★５．知らず知らず仲間の口真似をしてしまい、自分が誰だかわからなくなる。",
-                                    "★６．溺れた時の動作を真似て演じ、服従のしるしとする。"
-                        ]
-            },
-            {
-                        "item": "【まばたき】",
-                        "stars": [
-                                    "★１．天人は、まばたきをしない。",
-                                    "★２．まばたきをしない訓練。",
-                                    "★３．まばたきをしたために、にらみ合いに負ける。"
-                        ]
-            },
-            {
-                        "item": "【継子いじめ】",
-                        "stars": [
-                                    "★１ａ．平安～鎌倉時代頃の継子いじめの物語。",
-                                    "★１ｂ．室町時代頃の継子いじめの物語。",
-                                    "★１ｃ．近代の継子いじめの物語。",
-                                    "★１ｄ．中国の継子いじめの物語。",
-                                    "★１ｅ．西欧の継子いじめの物語。",
-                                    "★２．継子ではなく、実の子をいじめる。"
-                        ]
-            },
-            {
-                        "item": "【継子殺し】",
-                        "stars": [
-                                    "★１．継母が継子を殺す。",
-                                    "★２．継母が継子を殺そうとするが、継子は無事だった。",
-                                    "★３．本妻の子の乳母が、継子を殺そうとする物語もある。",
-                                    "★４．継母にそそのかされて父も子を殺そうとする。",
-                                    "★５．継子をこらしめるつもりで、自分の子を殺してしまう。"
-                        ]
-            },
-            {
-                        "item": "【継子への恋】",
-                        "stars": [
-                                    "★１．継子が男であるばあい、継母が継子を恋することが多い。",
-                                    "★２．「継母から言い寄られた」との嘘。",
-                                    "★３．権力者の妻が、夫の部下など年少の男に恋する物語が、古代の文献にいくつか見られる。これらが、継母の邪恋の物語の古形であろう。"
-                        ]
-            },
-            {
-                        "item": "【守り札】",
-                        "stars": [
-                                    "★１．守り札の奇瑞。",
-                                    "★２．守り札が人間の身代わりになって割れる。",
-                                    "★３ａ．守り札が悪霊や疫病の侵入を防ぐ。",
-                                    "★３ｂ．幽霊の侵入を防ぐ守り札をはがす。",
-                                    "★４．お守り紐。",
-                                    "★５．護符の効力を示すための芝居。"
-                        ]
-            },
-            {
-                        "item": "【麻薬】",
-                        "stars": [
-                                    "★１．麻薬中毒。",
-                                    "★２．コカインの注射。",
-                                    "★３．阿片の吸引・服用。",
-                                    "★４．麻薬による死。",
-                                    "★５．麻薬と犯罪組織。",
-                                    "★６ａ．麻薬を人形の中に隠して運ぶ。",
-                                    "★６ｂ．麻薬を赤ん坊の体内に隠して運ぶ。"
-                        ]
-            },
-            {
-                        "item": "【眉毛・睫毛】",
-                        "stars": [
-                                    "★１．眉毛をかざして見ると正体がわかる。",
-                                    "★２．眉毛に唾をつけるのは、狐に化かされないためのまじないである。",
-                                    "★３．長い眉毛は長命の相である。",
-                                    "★４．苦しい時・憂鬱な時には、眉をひそめる。",
-                                    "★５．睫毛を射切る。",
-                                    "★６．白い眉。",
-                                    "★７．巨人の睫毛。"
-                        ]
-            },
-            {
-                        "item": "【曼荼羅】",
-                        "stars": [
-                                    "★１．幾万の曼陀羅（曼荼羅）が、みな同じ絵模様。",
-                                    "★２．極楽浄土の荘厳なありさまを、曼荼羅に描いて示す。",
-                                    "★３．心の奥底のイメージを、円を中心とする図形に描いたら、それは曼荼羅絵図そっくりであった。"
-                        ]
-            },
-            {
-                        "item": "【ミイラ】",
-                        "stars": [
-                                    "★１．古代のミイラが甦（よみがえ）る。",
-                                    "★２．ミイラを見て、「前世の自分だ」と悟る。",
-                                    "★３．豆ミイラ。",
-                                    "★４．ミイラの夢を見る。",
-                                    "★５．ミイラの魂が宇宙空間を巡礼する。"
-                        ]
-            },
-            {
-                        "item": "【身売り】",
-                        "stars": [
-                                    "★１．金のない夫のため・親のために、女が遊里へ身を売る。",
-                                    "★２．母親が娘を遊郭に売ろうとするが、思いとどまる。",
-                                    "★３．身売りする娘を買い戻す。",
-                                    "★４．亡父・亡母の追善供養のため、子供が人買いに身を売る。",
-                                    "★５．貧しい飼い主を助けるため、猫が身売りする。",
-                                    "★６．仏陀に布施するために、貧しい男が身を売る。",
-                                    "★７．女児を売る。"
-                        ]
-            },
-            {
-                        "item": "【身代わり】",
-                        "stars": [
-                                    "★１．仏・菩薩などが、殺されるはずの人間に代わって刃や矢を受け、人間の命を救う。",
-                                    "★２．仏・菩薩などが、人間に代わって苦を受ける。",
-                                    "★３．二重の身代わり。ＡとＢが出会うかわりに、Ａの身代わりとＢの身代わりが、お互い相手を本物のＢでありＡであると思って出会う。",
-                                    "★４．Ａの身代わりにＢがなり、さらにＢの身代わりにＣがなる。",
-                                    "★５．身代わりの死が不可能なばあいもある。"
-                        ]
-            },
-            {
-                        "item": "【身代わり（夫の）】",
-                        "stars": [
-                                    "★１．夫や恋人の身代わりに女が死ぬ。"
-                        ]
-            },
-            {
-                        "item": "【身代わり（主君の）】",
-                        "stars": [
-                                    "★１．主君の身代わりになって家来が死ぬ、苦を受ける。",
-                                    "★２．主君や義理ある人を救うため、家族を身代わりにする。"
-                        ]
-            },
-            {
-                        "item": "【身代わり（人体の）】",
-                        "stars": [
-                                    "★１．頭の代わりの饅頭。",
-                                    "★２．首の代わりの頭髻（たぶさ）。",
-                                    "★３．敵の身体の代わりの衣服。"
-                        ]
-            },
-            {
-                        "item": "【身代わり（病者の）】",
-                        "stars": [
-                                    "★１．病者の身代わりに、その肉親や弟子などが死のうとする。しかし、神の恵みなどによって死なずにすむ。",
-                                    "★２．病者の命を救い、その代わりに死んでゆく。",
-                                    "★３．身代わりを志願する人も、寿命が尽きていた。"
-                        ]
-            },
-            {
-                        "item": "【身代わり（友人の）】",
-                        "stars": [
-                                    "★１．友人の身代わりになる。"
-                        ]
-            },
-            {
-                        "item": "【水】",
-                        "stars": [
-                                    "★１．水が多すぎて飲めない。",
-                                    "★２ａ．水が血に変わって、飲めなくなる。",
-                                    "★２ｂ．水が火に見えて飲めない。",
-                                    "★２ｃ．血が水に変って、大勢のかわきをいやす。",
-                                    "★３．水をしりぞける。",
-                                    "★４．水の上に水を積み重ねる。",
-                                    "★５．水上に座す。",
-                                    "★６ａ．水の力で、死者が生き返る。",
-                                    "★６ｂ．水の力で、傷つき病む人が回復する。",
-                                    "★７．水に吸い込まれる女。",
-                                    "★８．水遁の術。",
-                                    "★９．原初の水。"
-                        ]
-            },
-            {
-                        "item": "【水に化す】",
-                        "stars": [
-                                    "★１．水に化す異類の男。",
-                                    "★２．水に化す異類の女。",
-                                    "★３．液体人間。"
-                        ]
-            },
-            {
-                        "item": "【湖】",
-                        "stars": [
-                                    "★１ａ．陸地が湖になる。湖の起源。",
-                                    "★１ｂ．湖が陸地になる。",
-                                    "★２．湖上を歩く。",
-                                    "★３．湖が、前世・現世・来世を映す。",
-                                    "★４ａ．湖に映る月を見て、物語創作のインスピレーションを得る。",
-                                    "★４ｂ．湖に月が映るありさまを、別のものに見立てる。"
-                        ]
-            },
-            {
-                        "item": "【水鏡】",
-                        "stars": [
-                                    "★１．水鏡に本性が映し出される。",
-                                    "★２．水鏡を見て、人や鳥の所在を知る。",
-                                    "★３．水に映る黄金を、そこに実在するものと思う。",
-                                    "★４．酒に映る美女を、そこに実在するものと思う。",
-                                    "★５．他人の姿が水に映るのを、自分が映っていると誤解する。",
-                                    "★６．酒に映る縄や弓を、蛇だと思う。"
-                        ]
-            },
-            {
-                        "item": "【水鏡に映る自己】",
-                        "stars": [
-                                    "★１．動物が自分の姿を水に映す。",
-                                    "★２ａ．美少年が自分の姿を泉に映す。",
-                                    "★２ｂ．泉を見る美少年の瞳に映る泉。",
-                                    "★３．女が、変わりはてた姿を水に映す。",
-                                    "★４．自分の顔が、水に映らない。"
-                        ]
-            },
-            {
-                        "item": "【水鏡に映る未来】",
-                        "stars": [
-                                    "★１．将来の自分の姿が、水に映る。",
-                                    "★２．将来の夫の顔が、水に映る。",
-                                    "★３．未来の妻の姿が、水に映る。"
-                        ]
-            },
-            {
-                        "item": "【見立て】",
-                        "stars": [
-                                    "★１．目の前にある物を、それと形状の類似した別の物と見なす。",
-                                    "★２．育ちが良いために、日用の卑俗な物品を、風雅な飾り物に見立ててしまう。",
-                                    "★３．無間（むげん）の鐘（＊→〔鐘〕６）に見立てた、泥の鐘や石の鉢。",
-                                    "★４ａ．人間の一生（嬰児期、成年期、老年期）を、一日（朝、昼、晩）に見立てる。",
-                                    "★４ｂ．仏陀は自分の現世での一生を、月の満ち欠けに見立てた。",
-                                    "★５．人間の一生を四季に見立てると、小春（晩秋から初冬）は何歳ぐらいにあたるか？",
-                                    "★６．百姓娘を貴婦人に見立てる。",
-                                    "★７．イザナキ・イザナミの「見立て」。"
-                        ]
-            },
-            {
-                        "item": "【道】",
-                        "stars": [
-                                    "★１ａ．どの道を行くか選ぶ。",
-                                    "★１ｂ．どの海路を行くか選ぶ。",
-                                    "★２．人生の横道。",
-                                    "★３．道の真ん中を通る。",
-                                    "★４．道で女に出会う。",
-                                    "★５．道が違って、会うことができない。",
-                                    "★６．道ばたで何かを見ても、手を出さずに通り過ぎるべきである。",
-                                    "★７．長い道のりを縮める方法。",
-                                    "★８．二つの散歩道。"
-                        ]
-            },
-            {
-                        "item": "【道しるべ】",
-                        "stars": [
-                                    "★１．豆や石など小さなものを道すじに落として、道しるべとする。",
-                                    "★２．草花の種をまいて、道しるべとする。",
-                                    "★３．枝を折って、道しるべとする。",
-                                    "★４．奇矯なふるまいをし、その痕跡を残して道しるべとする。",
-                                    "★５．役に立たなかった道しるべ。",
-                                    "★６．にせの道しるべ。",
-                                    "★７．道案内の誤り。",
-                                    "★８．道案内する幣（ぬさ）。"
-                        ]
-            },
-            {
-                        "item": "【道連れ】",
-                        "stars": [
-                                    "★１．旅の男が、妖怪や幽霊などと道連れになる。",
-                                    "★２．旅の若者が、女と道連れになる。",
-                                    "★３．旅人が、道連れになった男に脅される。",
-                                    "★４．敵を道連れにして死ぬ。",
-                                    "★５ａ．死者の埋葬をした男が、死者の霊と道連れになり、恩返しされる。",
-                                    "★５ｂ．死者の埋葬をした男の息子が、天使と道連れになり、恩恵を受ける。",
-                                    "★６ａ．死んだ夫が、妻も一緒に冥界へ連れて行く。",
-                                    "★６ｂ．死んだ主人が、侍妾も一緒に冥界へ連れて行く。"
-                        ]
-            },
-            {
-                        "item": "【密会】",
-                        "stars": [
-                                    "★１．男女が密会して、幼児から目を離したために、幼児が事件や事故に遭う。",
-                                    "★２．男女の密会中に、傷害事件が起こる。",
-                                    "★３．男女の密会中に、一方が死んでしまう。"
-                        ]
-            },
-            {
-                        "item": "【密室】",
-                        "stars": [
-                                    "★１．近代の推理小説では、人間の侵入不可能な密室の中で、殺人が行なわれる。",
-                                    "★２．被害者が一人で部屋にこもって鍵をかけ、その後に倒れる。「出入り不可能な密室に、被害者だけがいて犯人の姿がない」、という状況ができ上がる。",
-                                    "★３．次の物語は、密室から死体が消えるという展開で、近代の推理小説のような印象を受ける。",
-                                    "★４ａ．密室にこもって、魂を遠方へ送る。",
-                                    "★４ｂ．密室にこもって、魂を霊界へ送る。",
-                                    "★４ｃ．スウェーデンボルグを読む人。",
-                                    "★５．小さな密室に入って姿を消す。"
-                        ]
-            },
-            {
-                        "item": "【密通】",
-                        "stars": [
-                                    "★１．人妻が愛人と密通する物語は、古代エジプト、古代ギリシアの時代からある。",
-                                    "★２．欧米の近代小説で名作と言われるものの中には、人妻の密通をテーマとするものが目立つ。",
-                                    "★３ａ．夫が旅に出ている留守に密通する。",
-                                    "★３ｂ．夫の旅中に密通する物語の変型。",
-                                    "★４．夫の目の前で、妻が情夫と交わる。",
-                                    "★５．姦通を指摘された妻が、開き直る。",
-                                    "★６．妻の不貞に夫が気づかない。",
-                                    "★７．「妻に裏切られたのは自分だけではない」と知って、夫の心が慰められる。",
-                                    "★８．もののはずみ・偶発的な事故がきっかけで、男女が不義密通の関係になる。",
-                                    "★９．不義密通のでっちあげ。",
-                                    "★１０．二世代にわたり繰り返される密通。",
-                                    "★１１．鳥の密通。"
-                        ]
-            },
-            {
-                        "item": "【三つの宝】",
-                        "stars": [
-                                    "★１．三種の神器。",
-                                    "★２．根の堅州国の三つの宝。",
-                                    "★３．三種の家宝。",
-                                    "★４．莫大な秘宝のありかを明かす三つの宝石。",
-                                    "★５．御伽話の三つの宝。",
-                                    "★６．三つの宝を横取りして逃げる。"
-                        ]
-            },
-            {
-                        "item": "【三つ目】",
-                        "stars": [
-                                    "★１．三つの目を持つ神や人。",
-                                    "★２．「人間の両目」に「馬の片目」を足して三つ目。"
-                        ]
-            },
-            {
-                        "item": "【身投げ】",
-                        "stars": [
-                                    "★１ａ．川へ身投げする人と、それを止める人。",
-                                    "★１ｂ．川へ身投げする人と、それを救う人との縁組み。",
-                                    "★２．身投げする女を救った男が、後にその女に命を救われる。",
-                                    "★３．愛する夫を救うために、妻が海に身を投げる。",
-                                    "★４．大勢の身投げ者を救っていた人が、後に自分も身投げをする。",
-                                    "★５．身投げの失敗。",
-                                    "★６．身投げするふりをして、金をだまし取る。",
-                                    "★７．毎晩の身投げ。",
-                                    "★８．集団の身投げ。"
-                        ]
-            },
-            {
-                        "item": "【身分】",
-                        "stars": [
-                                    "★１．王族・貴族の青年と、町娘・村娘との身分違いの恋。",
-                                    "★２．裕福な家庭の青年と女中との、身分違いの恋。",
-                                    "★３．上流貴族の男と中流貴族の女の契り。",
-                                    "★４．斜陽貴族の青年と、新興ブルジョアジーである村長の娘との、身分違いの恋・結婚。",
-                                    "★５．上流階級の男と、労働者階級の女との、身分違いの恋・結婚。",
-                                    "★６．男性貴族と海女の、身分違いの契り。",
-                                    "★７．良い家柄の・身分ある男だと思ったら、そうではなかった。",
-                                    "★８．王族の娘と男性取材記者の、身分違いの恋。",
-                                    "★９．伯爵未亡人とセールスマンの結婚。彼らの飼い犬どうしの結婚。",
-                                    "★１０．将校の未亡人を思慕する、無学な人力車夫。",
-                                    "★１１．身分・境遇の異なる双子。",
-                                    "★１２．貴族にあこがれる、成金の町人。",
-                                    "★１３．社会制度の変化により、身分を失った人。"
-                        ]
-            },
-            {
-                        "item": "【未亡人】",
-                        "stars": [
-                                    "★１．未亡人と独身青年の恋。",
-                                    "★２．未亡人が独身青年を誘惑し、もてあそぶ。",
-                                    "★３．未亡人の再婚話。",
-                                    "★４．未亡人と寡夫の恋。",
-                                    "★５．未亡人と妻帯者の恋。",
-                                    "★６．社交界で何人もの男をあやつる未亡人。",
-                                    "★７．亡夫の莫大な遺産を得た未亡人。再婚すれば、その遺産を失う。",
-                                    "★８．名士の未亡人。",
-                                    "★９．戦争未亡人。",
-                                    "★１０．未亡人になるかもしれぬ人妻。"
-                        ]
-            },
-            {
-                        "item": "【見間違い】",
-                        "stars": [
-                                    "★１．身体の一部分を、金や貴重品などと見間違う。",
-                                    "★２．複合体（動物＋器物、複数の動物）を、一体の化け物と見誤る。",
-                                    "★３．人の行動を見て、その意図するところを取り違える。",
-                                    "★４．自殺しようとする人を見るが、遠方からなので、そのことがわからない。",
-                                    "★５．大勢が、目前で起こっていることの意味を取り違える。",
-                                    "★６．水だと思ったら、水銀（みずかね）だった。",
-                                    "★７．信じられないものを見た時、それを「目の錯覚」と考える。"
-                        ]
-            },
-            {
-                        "item": "【耳】",
-                        "stars": [
-                                    "★１．耳から誕生する。",
-                                    "★２．耳からさまざまなものが出る。",
-                                    "★３．耳の穴を抜けて別世界へ行く。",
-                                    "★４．耳が聞こえないと、思索や瞑想に好都合な場合がある。",
-                                    "★５．耳が聞こえないゆえの悲劇。",
-                                    "★６．耳が聞こえない聾者にとって、音は存在するのだろうか？"
-                        ]
-            },
-            {
-                        "item": "【耳を切る】",
-                        "stars": [
-                                    "★１．敵の耳を切り取る。",
-                                    "★２．職人の耳を切り取る。",
-                                    "★３．不義の男女の耳を切り取る。",
-                                    "★４．手柄の証拠として耳を切り取る。",
-                                    "★５．刃物を使わずに、耳をもぎとる・食い切る。",
-                                    "★６．自分の耳を切り落とす。",
-                                    "★７．自分の耳を切って人に与える。"
-                        ]
-            },
-            {
-                        "item": "【未来記】",
-                        "stars": [
-                                    "★１．未来に起こることを文字で記した書物。",
-                                    "★２．未来の新聞。",
-                                    "★３．未来記の、実現した所までを読み、あとは見ずにおく。",
-                                    "★４．未来の予見とその対策。",
-                                    "★５．未来が記してあるかもしれないページを開くと、すべてが消え失せる。",
-                                    "★６．未来が見えるテレビ。",
-                                    "★７．未来に起こることを描く幻像や絵画。",
-                                    "★８．宇宙の過去から未来まで、風景を見るように、すべて一望できる。どのようにしても、いささかもそれらを変えることはできない。"
-                        ]
-            },
-            {
-                        "item": "【百足】",
-                        "stars": [
-                                    "★１．百足が蛇を殺す。",
-                                    "★２．百足と蛇が戦い、人間が蛇の見方をする。",
-                                    "★３．百足の多くの足。",
-                                    "★４．百足が人を殺す。",
-                                    "★５．大百足が家の中に現れる。"
-                        ]
-            },
-            {
-                        "item": "【無限】",
-                        "stars": [
-                                    "★１．無限に小さくなるが、ゼロにはならない。",
-                                    "★２ａ．無限に近い膨大な情報を、一つの刻み目に収める。",
-                                    "★２ｂ．大海を一毛に、須弥山を芥子粒に、無量劫を一念に収める。",
-                                    "★３．無限の情報を、一巻の書物に収める。",
-                                    "★４．無限の時間。無限の繰り返し。",
-                                    "★５．無限の時間と無限の空間。",
-                                    "★６．無限の極小世界と無限の極大世界。",
-                                    "★７．無限の空間を想定すれば、何でも起こり得る。",
-                                    "★８．無限の空間の彼方に、自分の姿を見る。",
-                                    "★９．無限の速度の原理。"
-                        ]
-            },
-            {
-                        "item": "【婿選び】",
-                        "stars": [
-                                    "★１．大勢の男を集め、理想の婿を選ぶ。",
-                                    "★２．婿にしたい男に毬を投げる。",
-                                    "★３．心ひかれる美男に果物を投げるのは、婿選びの変形であろう。",
-                                    "★４．花束を投げたら爆弾と間違えられた、ということもある。"
-                        ]
-            },
-            {
-                        "item": "【夢告】",
-                        "stars": [
-                                    "★１．夢の中に神仏などが現れ、直接言葉で意志を伝え、指示を与える。したがって夢解きをする必要がない。",
-                                    "★２．二人が同じ夢告を得る。",
-                                    "★３．三人が同じ夢告を得る。",
-                                    "★４．「七年後の死」の夢告。",
-                                    "★５．いつわりの夢告。"
-                        ]
-            },
-            {
-                        "item": "【無言】",
-                        "stars": [
-                                    "★１ａ．無言の行。",
-                                    "★１ｂ．二～三人が、無言の行くらべをする。",
-                                    "★１ｃ．無言のまま、なしとげねばならぬ仕事。",
-                                    "★２ａ．妻が無言のまま試練に耐え抜く。",
-                                    "★２ｂ．無言でいなければならない妻が、声を発してしまう。",
-                                    "★２ｃ．声が出ない妻。",
-                                    "★３．無言の人。",
-                                    "★４．無言の霊。対話不可の霊。",
-                                    "★５．対話不可の人。",
-                                    "★６．驚愕のあまり、言葉を発することも身体を動かすこともできない。"
-                        ]
-            },
-            {
-                        "item": "【虫】",
-                        "stars": [
-                                    "★１．虫が身体から出る。",
-                                    "★２ａ．人間が死んで、一匹の虫に生まれ変わる。",
-                                    "★２ｂ．人間が死んで、多くの虫に化す。",
-                                    "★２ｃ．人間の死体に多くの蛆がわく。",
-                                    "★３．虫が死んで、天上界に生まれる。",
-                                    "★４．虫好きの人。",
-                                    "★５．虫の生態を見て、人間存在について考える。",
-                                    "★６．虫の会話を聞く。",
-                                    "★７．姿を変える虫。",
-                                    "★８ａ．嫁が姑に虫を食べさせる。",
-                                    "★８ｂ．女中が女主人に虫を食べさせる。"
-                        ]
-            },
-            {
-                        "item": "【無心】",
-                        "stars": [
-                                    "★１．無心で行なったことが奇跡を起こす。",
-                                    "★２．幼児の心。",
-                                    "★３．赤ん坊の心。",
-                                    "★４．無心で矢を射る。"
-                        ]
-            },
-            {
-                        "item": "【無尽蔵】",
-                        "stars": [
-                                    "★１．食物・宝物などがいくらでも出てきて、尽きることがない。",
-                                    "★２．無限に出て来る食物の、とめ方を知らない。",
-                                    "★３．無限に出て来た御飯が、出て来なくなる。",
-                                    "★４．酒をどれだけ飲んでも減らない。",
-                                    "★５．着物の布が限りなく出てくる。",
-                                    "★６ａ．無限に物が湧き出ると思ったら、それはよそから取って来たのだった。",
-                                    "★６ｂ．無限にお金が湧き出ると思ったら、それはよそから取って来たのだった。",
-                                    "★６ｃ．無限にお金が湧き出ると思ったら、それは未来から借りて来たのだった。",
-                                    "★７．際限なく湧き出て良いものと、良くないもの。"
-                        ]
-            },
-            {
-                        "item": "【無性の人】",
-                        "stars": [
-                                    "★１．男女の区別ができる以前の存在。",
-                                    "★２．男性器も女性器も持たぬ無性人間。",
-                                    "★３．男でも女でもないから「神」。",
-                                    "★４．死とともに、性の区別も終わる。",
-                                    "★５．魂に性はない。"
-                        ]
-            },
-            {
-                        "item": "【胸騒ぎ】",
-                        "stars": [
-                                    "★１．親子の間に起こる精神感応。"
-                        ]
-            },
-            {
-                        "item": "【夢遊病】",
-                        "stars": [
-                                    "★１ａ．婚約者が夢遊病であることがわかったので、結婚をとりやめる。",
-                                    "★１ｂ．婚約者が夢遊病であることがわかったので、結婚する。",
-                                    "★２．夢遊状態で宝石や大金を隠し、その記憶がない。",
-                                    "★３．事故死した人を見て、夢遊病者が「自分が殺した」と思い込む。",
-                                    "★４．夢遊病者に、殺人・傷害の罪を着せる。",
-                                    "★５．ＡがＢを夢遊病者に仕立て上げる。Ａは殺人を犯し、その罪をＢに着せる。",
-                                    "★６．殺人を犯した後、夢遊病となる。",
-                                    "★７．身体は眠っており、その人物と同じ姿をした魂が、身体から抜け出て外をさまよう。このような場合は、夢遊病と区別し難いことがある。"
-                        ]
-            },
-            {
-                        "item": "【無理心中】",
-                        "stars": [
-                                    "★１．男が愛人や妻と無理やり心中する。",
-                                    "★２．無理心中の未遂。",
-                                    "★３．殺人を無理心中に見せかける。"
-                        ]
-            },
-            {
-                        "item": "【目】",
-                        "stars": [
-                                    "★１．目の呪力。",
-                                    "★２．蛇ににらまれると、動けなくなる。",
-                                    "★３．目と鏡は、密接な関係がある。"
-                        ]
-            },
-            {
-                        "item": "【目の左右】",
-                        "stars": [
-                                    "★１．右目と左目が、異なるものを見る。",
-                                    "★２．左目が太陽となり、右目が月となる。",
-                                    "★３．左目を洗うと（あるいは左手に鏡を持つと）太陽神が生まれ、右目を洗うと（あるいは右手に鏡を持つと）月神が生まれた。"
-                        ]
-            },
-            {
-                        "item": "【目を閉じる】",
-                        "stars": [
-                                    "★１．異郷へ行くには目を閉じる必要がある。",
-                                    "★２．死ぬ時も目を閉じる。",
-                                    "★３．死顔の目を閉じてやる。"
-                        ]
-            },
-            {
-                        "item": "【目を抜く】",
-                        "stars": [
-                                    "★１．自らの両目を抜き取って、他の人や子供に与える。",
-                                    "★２．砂男が子供の目玉を抜き取る。",
-                                    "★３．蛇が自らの両目をくり抜く。",
-                                    "★４．男が蛇の両目をくり抜く。",
-                                    "★５．両眼が抜け出た夢を見る。"
-                        ]
-            },
-            {
-                        "item": "【冥界行】",
-                        "stars": [
-                                    "★１．地下の冥界へ下る。",
-                                    "★２．船で冥界へ行く。",
-                                    "★３．六道を見る。",
-                                    "★４．冥界の父に会いに行く。",
-                                    "★５．冥界の母に会いに行く。",
-                                    "★６．冥界の妻に会いに行く。"
-                        ]
-            },
-            {
-                        "item": "【冥界にあらず】",
-                        "stars": [
-                                    "★１．現世の人を眠らせ、「冥界で目覚めた」と思いこませる。",
-                                    "★２．現世にいるのに、「ここは冥界だ」と強弁する。",
-                                    "★３．心中をはかり、「冥界へ来た」と思い込む。"
-                        ]
-            },
-            {
-                        "item": "【冥界の穴】",
-                        "stars": [
-                                    "★１．死者が穴を通って、天上界あるいは地下界へ行く。",
-                                    "★２．冥府の死者が穴を通って、現世に戻って来る。",
-                                    "★３．現世にある穴が、極楽あるいは冥府へ通じる。"
-                        ]
-            },
-            {
-                        "item": "【冥界の川】",
-                        "stars": [
-                                    "★１．舟で川を渡って冥府にいたる。",
-                                    "★２．生きた人間が意識を失い、舟で冥府の川を運ばれる。",
-                                    "★３．渡し守が眠っている間に、生きた人間が舟に乗って冥府の川を渡る。",
-                                    "★４．渡し守の交代。",
-                                    "★５．舟に乗るのではなく、橋を歩いて冥府の川を渡る。",
-                                    "★６．冥界にある忘却の川。",
-                                    "★７．精霊界から霊界へ移転する途中の大河。",
-                                    "★８．冥界の川の手前で引き返す。"
-                        ]
-            },
-            {
-                        "item": "【冥界の坂】",
-                        "stars": [
-                                    "★１．冥界への出入口には、坂道がある。",
-                                    "★２．胸坂（むなさか）。"
-                        ]
-            },
-            {
-                        "item": "【冥界の時間】",
-                        "stars": [
-                                    "★１．冥界の一日は、人間界の一年に相当する。",
-                                    "★２．逆に、冥界の一年が人間界の一日に相当する。",
-                                    "★３．冥界の三年は、人間界の三十年。",
-                                    "★４．冥界で「しばしの間」を過ごすうちに、人間界では六年が経過した。",
-                                    "★５．地獄で苦を受ける時間の長さ。",
-                                    "★６．冥界の時間経過だけ述べて、人間界の時間経過には言及しないこともある。"
-                        ]
-            },
-            {
-                        "item": "【冥界の食物】",
-                        "stars": [
-                                    "★１．冥界の食物を口にすると、現世に戻れなくなる。",
-                                    "★２．冥界の食物を口にしない。",
-                                    "★３．死者が人間界の食物を食べる。",
-                                    "★４．死者が人間界の食物を食べない。",
-                                    "★５．鬼道（＝餓鬼道）では、人間界の一食を得れば、一年間満腹する。"
-                        ]
-            },
-            {
-                        "item": "【冥界の道】",
-                        "stars": [
-                                    "★１．冥界へ到る途中の道。",
-                                    "★２．冥界の三つの分かれ道。",
-                                    "★３．天界・楽園へいたる道と、地獄へいたる道。",
-                                    "★４．この世へ戻る道と、戻らぬ道。"
-                        ]
-            },
-            {
-                        "item": "【冥婚】",
-                        "stars": [
-                                    "★１．この世の男と冥界の女との結婚。",
-                                    "★２．人間界の男が、冥界の女を生き返らせようと試みるが、できなかった。",
-                                    "★３．人間界の夫が、幽霊になった妻との共寝を恐れて逃げる。",
-                                    "★４．現世の男と冥界の女が、ともに転生することによって結婚が可能になる。",
-                                    "★５．人間界の女が死んで、冥界の男と結婚する。",
-                                    "★６．冥界の男神と現世の女神との結婚。",
-                                    "★７．死者の霊が生者の夢にあらわれて、情交を求める。",
-                                    "★８．生前関わりのなかった男女を合葬し、冥界での夫婦とする。"
-                        ]
-            },
-            {
-                        "item": "【冥府往還】",
-                        "stars": [
-                                    "★１．現世と冥府を往還して働く。",
-                                    "★２．数日おきに死んだり生き返ったりして、現世と冥府を往還する。",
-                                    "★３．当人が気づかないうちに、現世と冥府を毎日毎夜往還している。"
-                        ]
-            },
-            {
-                        "item": "【迷路】",
-                        "stars": [
-                                    "★１．複雑な迷路とその脱出法。",
-                                    "★２．長い糸や紐を持って、迷路へ入る。",
-                                    "★３．迷路から出られなくなって、死んでしまう人。",
-                                    "★４．惑わし神や狐などのために、道に迷う。",
-                                    "★５．目隠しをして俥に乗せられ、迷宮の中を行くごとく、方々へ引き回される。",
-                                    "★６．多くの鏡を用いて作られた迷路の部屋。",
-                                    "★７．都市の地下に広がる迷路のような下水道。",
-                                    "★８．門も壁も階段もない迷路・迷宮。"
-                        ]
-            },
-            {
-                        "item": "【眼鏡】",
-                        "stars": [
-                                    "★１．不思議な眼鏡。",
-                                    "★２．遠眼鏡（とおめがね）を覗いて美女を発見する。",
-                                    "★３．顕微鏡を覗いて美女を発見する。",
-                                    "★４．釣り竿を遠眼鏡に見せかける。",
-                                    "★５．三つの眼鏡。",
-                                    "★６．美貌を損なうので、眼鏡をかけない。"
-                        ]
-            },
-            {
-                        "item": "【女神】",
-                        "stars": [
-                                    "★１ａ．処女神である織女。",
-                                    "★１ｂ．織女の起源。",
-                                    "★２．流行の女神。",
-                                    "★３．死の女神。",
-                                    "★４ａ．男装の女神。神は完全な存在だから、男女両方の性質をあわせ持つことをあらわす。",
-                                    "★４ｂ．女神アマテラスの子孫である神功皇后も、戦いに臨んで男装をした。"
-                        ]
-            },
-            {
-                        "item": "【目印】",
-                        "stars": [
-                                    "★１．神が人々に災いを与えるが、助けるべき人間には目印をつける。",
-                                    "★２ａ．病気などの災いから救う家の戸口に、目印をつける。",
-                                    "★２ｂ．逆に、病気の災いを与える家に、目印をつける。",
-                                    "★３．病人の出た家に目印をつける。",
-                                    "★４．特定の人の身体や衣服に目印をつけておき、後にその人をさがす。",
-                                    "★５．犯罪者の身体や衣服に目印をつけて、捕らえる。",
-                                    "★６．特定の物に目印をつけておき、後に、その物に関わる人物をつきとめる。",
-                                    "★７．ある人物の衣服や持ち物の特徴を目印にして、その人を捜す。",
-                                    "★８．身を守るための目印が、敵にとっては、ねらうべき目印になる。",
-                                    "★９．無意味な目印。",
-                                    "★１０ａ．船に目印をつける。",
-                                    "★１０ｂ．船に目印をつけても安心できない。",
-                                    "★１１ａ．空につけた目印。",
-                                    "★１１ｂ．宇宙空間につけた目印。"
-                        ]
-            },
-            {
-                        "item": "【目印を消す】",
-                        "stars": [
-                                    "★１．目印となるものを捨てる、切り落とす。",
-                                    "★２．同じ目印を多くの人、場所につけて、本来の目印がどれなのか、わからなくする。"
-                        ]
-            },
-            {
-                        "item": "【面】",
-                        "stars": [
-                                    "★１．肉づきの面。",
-                                    "★２．顔の肉が面にくっついて取れてしまう。",
-                                    "★３．人肉の面。",
-                                    "★４．凶相の面。",
-                                    "★５．愚かな動物が、面をつけた役者を見て、「上手に化けるものだ」と感心する。"
-                        ]
-            },
-            {
-                        "item": "【麺】",
-                        "stars": [
-                                    "★１ａ．索餅（そうめん）を供える。",
-                                    "★１ｂ．『遠野物語拾遺』２９６（＊→〔妻食い〕２）の異伝。",
-                                    "★１ｃ．初めて食べたそうめん。",
-                                    "★１ｄ．鰡（ぼら）がそうめんを食べる。",
-                                    "★２．麦縄（＝冷麦）。",
-                                    "★３．ラーメン。"
-                        ]
-            },
-            {
-                        "item": "【申し子】",
-                        "stars": [
-                                    "★１．神仏に祈って子を得る。日本では中世の物語に多く見られる。",
-                                    "★２．外国にも、古くから、神などに祈って子を得る物語がある。",
-                                    "★３ａ．本来授かるべき子種がないが、神仏の特別のはからいで、子が生まれる。",
-                                    "★３ｂ．「子を授けないと大変なことになるぞ」と言って、神仏を脅す。",
-                                    "★４．子供が授からぬ理由。"
-                        ]
-            },
-            {
-                        "item": "【盲点】",
-                        "stars": [
-                                    "★１ａ．すぐ目の前にあっても気づかれぬ物。",
-                                    "★１ｂ．犯行現場にいても疑われない人。",
-                                    "★１ｃ．あまりに身近にいる男性なので、好きだということに気づかない。",
-                                    "★２．盲点に入ったかのごとく、目前のものが見えなくなる症状。欠視症。",
-                                    "★３．人間の姿全体が、盲点に入って見えなくなる。",
-                                    "★４．闇の中で明かりを持つ人は、かえってその姿が見えにくい。"
-                        ]
-            },
-            {
-                        "item": "【盲目】",
-                        "stars": [
-                                    "★１．敵のために眼をつぶされる。",
-                                    "★２．自らの手で眼を突き刺す、または、抉る。",
-                                    "★３ａ．男が、神聖な女性の裸体を見たために、罰を受けて盲目になる。",
-                                    "★３ｂ．男が女神の姿を見たために、斜視になる。",
-                                    "★３ｃ．男が、女性の犯されるありさまを見たために、仕返しに目をえぐられる。",
-                                    "★４ａ．神意により盲目になる。",
-                                    "★４ｂ．仏罰を受けて盲目になる。",
-                                    "★５．生前の嫉妬の罪により、死後盲目になる。",
-                                    "★６．もののけが目隠しをするので、目が見えない。"
-                        ]
-            },
-            {
-                        "item": "【盲目の人】",
-                        "stars": [
-                                    "★１．盲目ゆえ誤解する。",
-                                    "★２．盲人をだます。",
-                                    "★３．盲人のふりをする。",
-                                    "★４．盲目の夫と苦労をともにする妻。",
-                                    "★５．盲人ばかりの国。",
-                                    "★６．盲目の旅人。彼は剣の使い手でもある。"
-                        ]
-            },
-            {
-                        "item": "【木馬】",
-                        "stars": [
-                                    "★１．空飛ぶ木馬。",
-                                    "★２．大勢の兵士が入った巨大な木馬。",
-                                    "★３．回転木馬。"
-                        ]
-            },
-            {
-                        "item": "【文字】",
-                        "stars": [
-                                    "★１ａ．文字の力。",
-                                    "★１ｂ．特定の文字の力。",
-                                    "★２．文字の読み方。",
-                                    "★３．虫喰いによる文字。",
-                                    "★４．筆跡。",
-                                    "★５．空に書く文字。川に書く文字。",
-                                    "★６．文字を見つめて考えていると、それが正しい文字かどうかわからなくなる。",
-                                    "★７．文字を解する兎や狐。",
-                                    "★８．文字の起源。"
-                        ]
-            },
-            {
-                        "item": "【文字が消える】",
-                        "stars": [
-                                    "★１．神力や妖術などによって、文字が消える。",
-                                    "★２．烏賊墨で書いた文字は、時間がたつと消えてしまう。",
-                                    "★３．書き写すと、もとの文字が消えてしまう。カット・アンド・ペースト。",
-                                    "★４．消えぬ文字を消す方法。"
-                        ]
-            },
-            {
-                        "item": "【餅】",
-                        "stars": [
-                                    "★１ａ．餅を食べずに、弓の的にする。",
-                                    "★１ｂ．餅を食べずに、その上を踏んで歩く。",
-                                    "★２．鳥が餅に変わる。",
-                                    "★３．餅を与える。",
-                                    "★４．餅と石。",
-                                    "★５ａ．餅を搗かない。",
-                                    "★５ｂ．餅を食べない。",
-                                    "★５ｃ．雑煮を食べない。",
-                                    "★５ｄ．鴨雑煮。",
-                                    "★６．餅と運命。",
-                                    "★７．天から与えられる餅。",
-                                    "★８．餅のなる木。",
-                                    "★９．物言う牡丹餅。",
-                                    "★１０．牡丹餅が蛙に変わる。"
-                        ]
-            },
-            {
-                        "item": "【もとにもどる】",
-                        "stars": [
-                                    "★１．寝たきりの難病からいったん回復するが、しばらくして、またもとの麻痺状態にもどってしまう。"
-                        ]
-            },
-            {
-                        "item": "【物語】",
-                        "stars": [
-                                    "★１．雨の日・雨の夜に、女性の話や恋の話をする。",
-                                    "★２．爺婆が雨の夜に恐ろしいものの話をする。",
-                                    "★３ａ．自分が本当は好きなもの、欲しいものを、「嫌い」「こわい」と言って、仲間たちをだます。",
-                                    "★３ｂ．自分が本当は好きなもの、欲しいものを、「嫌い」「こわい」と言って、幽霊や化け物をだます。",
-                                    "★４．未知の物語を求める・聞く。",
-                                    "★５．一人が、あるいは何人かが、次々と様々な物語を語る。",
-                                    "★６ａ．延命のために、様々な物語を語り続ける。",
-                                    "★６ｂ．演説終了とともに議員を罷免されるので、議員の地位を保持するためにいつまでも演説をし続ける。",
-                                    "★７ａ．物語が途中で中断されたため、聞き手が怒る。",
-                                    "★７ｂ．物語がいつまでも続くので、聞き手が飽きる。"
-                        ]
-            },
-            {
-                        "item": "【物語（議論）】",
-                        "stars": [
-                                    "★１．何人かが集まって、哲学的な話題を語り合う。"
-                        ]
-            },
-            {
-                        "item": "【物語（小説）】",
-                        "stars": [
-                                    "★１．虚構の小説と、現実の事件との偶然の符合。",
-                                    "★２．小説のストーリーとそっくりの殺人事件が起きる。",
-                                    "★３．現実の殺人事件そっくりの小説を執筆する。",
-                                    "★４．小説の中の小説。",
-                                    "★５．いつまでも続く長い長い小説。",
-                                    "★６．人間の一生を、長編小説の一部と見なす。"
-                        ]
-            },
-            {
-                        "item": "【物狂い】",
-                        "stars": [
-                                    "★１．恋人や子供と別れた女が、狂気となって諸方を巡る。",
-                                    "★２．妻や恋人と別れた男が、狂気となって諸方を巡る。"
-                        ]
-            },
-            {
-                        "item": "【物乞い】",
-                        "stars": [
-                                    "★１．神仏が乞食姿であらわれる。",
-                                    "★２ａ．神仏が人の慈悲心を試すために、繰り返し物乞いをする。",
-                                    "★２ｂ．西欧にも、同様の物語がある。",
-                                    "★２ｃ．強引にパンと財布を奪った少年も、イエス・キリストの化身かもしれない。",
-                                    "★３．醜い乞食女の悪魔的な美。",
-                                    "★４．繰り返しの物乞いに応じて、宝をすべて布施する。",
-                                    "★５．食や金でなく、身体を布施として乞う。",
-                                    "★６．物乞いとなって、自分の家に戻る。",
-                                    "★７．二人の乞食。"
-                        ]
-            },
-            {
-                        "item": "【もののけ】",
-                        "stars": [
-                                    "★１．死霊・生霊・妖怪などが、病気・懐妊中の女性にとりついて苦しめる。",
-                                    "★２．病気の男性を、もののけが苦しめる。",
-                                    "★３ａ．一人の女の生霊・死霊が、二十数年、あるいは三十年にも渡って、何人もの女を苦しめる。",
-                                    "★３ｂ．一人の法師の死霊が、二年余を隔てて、二人の女（異父姉妹）にとりつき苦しめる。",
-                                    "★４．屈強な武将も、もののけに取りつかれることがある。"
-                        ]
-            },
-            {
-                        "item": "【桃】",
-                        "stars": [
-                                    "★１．天界の桃を食べれば、不老長生が得られる。",
-                                    "★２．桃を一つ食べると、一年が経過する。",
-                                    "★３ａ．桃を用いて、鬼や魔物を追い払う。『桃太郎』の物語の原型、と見なされることもある。",
-                                    "★３ｂ．『桃太郎』は、現代では、「大きな桃が一つ流れて来て、包丁で二つに切ったら中に赤ん坊がいた」という展開が一般的であるが、曲亭馬琴は、それとは異なる伝承を記している。",
-                                    "★４．妖怪や死霊は桃を恐れる。",
-                                    "★５．桃の木の化身。",
-                                    "★６．甘い桃と苦い桃。"
-                        ]
-            },
-            {
-                        "item": "【百夜（ももよ）通い】",
-                        "stars": [
-                                    "★１ａ．百夜通いの最後の日に、男の親が急死する。",
-                                    "★１ｂ．百夜通いの最後の日に、男が病死する。",
-                                    "★１ｃ．百夜通いの最後の日に、女が逃げ去る。",
-                                    "★２．「あと一夜」というところで、男が去って行く。",
-                                    "★３．人を雇って百夜通いさせる。",
-                                    "★４．百夜通いの恋が実る。",
-                                    "★５．女の百夜通い。"
-                        ]
-            },
-            {
-                        "item": "【森】",
-                        "stars": [
-                                    "★１ａ．飢饉で食物がなくなったので、親が子供を森の奥に捨てる。",
-                                    "★１ｂ．飢饉で食物がなくなったので、子供たちのために食物を残して、親が森の奥に姿を消す。",
-                                    "★２．森の中の城・宮殿・家・小屋。",
-                                    "★３．森の中で死者に出会う。",
-                                    "★４．森を抜けて異世界へ行く。",
-                                    "★５．森に隠遁する。",
-                                    "★６．富士の樹海。"
-                        ]
-            },
-            {
-                        "item": "【門】",
-                        "stars": [
-                                    "★１．門は、冥府への入り口である。",
-                                    "★２ａ．極楽の東門。",
-                                    "★２ｂ．地獄の東門。",
-                                    "★２ｃ．地獄の外門と内門。",
-                                    "★２ｄ．天国の門。",
-                                    "★２ｅ．龍宮のような門。",
-                                    "★３．疫病に侵され死に瀕した市は、現世に出現した冥府である。冥府の入り口に相当する市門は、閉鎖される。",
-                                    "★４．門は、神や鬼などと出会い交渉する所である。",
-                                    "★５．門が倒れる。",
-                                    "★６．入れない門。"
-                        ]
-            },
-            {
-                        "item": "【問答】",
-                        "stars": [
-                                    "★１ａ．無言の問答。",
-                                    "★１ｂ．身振り手振りによる問答。",
-                                    "★２．智恵くらべの問答。",
-                                    "★３．旅の賢者と子供の問答。",
-                                    "★４．生者と死者との問答。"
-                        ]
-            },
-            {
-                        "item": "【矢】",
-                        "stars": [
-                                    "★１．白羽の矢。",
-                                    "★２．矢の落ちた所に住む娘を、妻とする。",
-                                    "★３．矢を射る時に、第二の矢を用意する。",
-                                    "★４．二本の矢を同時に射る。",
-                                    "★５．クピードの二本の矢。",
-                                    "★６．三本の矢を折る。",
-                                    "★７．四本の矢を受け止める。",
-                                    "★８．五本の矢を折る。",
-                                    "★９．戦いのために、多くの矢を調達する。",
-                                    "★１０．無数の矢を身体に受けて倒れる武将。",
-                                    "★１１ａ．第一の矢の矢筈に、第二の矢が突き刺さる。",
-                                    "★１１ｂ．後続の矢が次々に前の矢に刺さり、多数の矢がつながって一直線に空中に並ぶ。"
-                        ]
-            },
-            {
-                        "item": "【矢が戻る】",
-                        "stars": [
-                                    "★１．矢を射ると、射手の方へ戻って来る。",
-                                    "★２．射られた矢を、射手に投げ返す。",
-                                    "★３．射手が、自分の矢で自分を傷つける。"
-                        ]
-            },
-            {
-                        "item": "【厄年】",
-                        "stars": [
-                                    "★１．女の厄年（三十七歳）に病気になる。",
-                                    "★２．厄年の男（二十五歳）と厄年の女（十九歳）が心中する。",
-                                    "★３．厄年に生まれた子を捨てる。"
-                        ]
-            },
-            {
-                        "item": "【火傷（やけど）】",
-                        "stars": [
-                                    "★１．美女の顔に熱湯をかけて、火傷を負わせる。",
-                                    "★２．美女が自分の顔を焼いて、醜い傷あとをつける。",
-                                    "★３．地蔵菩薩や阿弥陀如来が、人の身代わりになって火傷を負う。",
-                                    "★４ａ．焼きゴテを肩に当てて、焼き印を押す。",
-                                    "★４ｂ．焼いた定規を肩に当てて、赤い傷あとをつける。",
-                                    "★５．月面の模様は火傷のあと。",
-                                    "★６．地獄で受けた火傷あと。"
-                        ]
-            },
-            {
-                        "item": "【宿】",
-                        "stars": [
-                                    "★１．旅人が宿を請うが、そこには鬼や怪物の類が住んでいる。",
-                                    "★２．旅人が宿で命をねらわれる。",
-                                    "★３．旅人を殺す大石を仕掛けた宿。",
-                                    "★４．宿で殺される、と旅人が誤解する。",
-                                    "★５．宿を請う人を、実の子であると知らずに殺す。",
-                                    "★６．旅人が宿で馬にされてしまう。",
-                                    "★７．消え失せる宿。",
-                                    "★８．一宿一飯の恩義。"
-                        ]
-            },
-            {
-                        "item": "【宿の女】",
-                        "stars": [
-                                    "★１．旅する男が、宿の女と関係を持つ。",
-                                    "★２．宿の女に心ひかれるが、関係を持たない。"
-                        ]
-            },
-            {
-                        "item": "【宿の巡り合い】",
-                        "stars": [
-                                    "★１．宿で、人々が思いがけぬ巡り合いや再会をする。",
-                                    "★２．旅人が人（あるいは動物）を殺した後、一軒の家に宿を借りるが、そこは旅人が殺した人（あるいは動物）の家族の家だった。",
-                                    "★３．旅人が人を傷つけた後、一軒の家に宿を借りるが、そこは旅人が傷つけた人の家族の家だった。",
-                                    "★４．旅の娘が不良青年に暴行されかかったが、その晩、娘が旅館へ行くと、旅館の若旦那は昼間の不良青年だった。"
-                        ]
-            },
-            {
-                        "item": "【宿を請う】",
-                        "stars": [
-                                    "★１．神が宿を請う。",
-                                    "★２．スサノヲが宿を請う。",
-                                    "★３．僧が宿を請う。"
-                        ]
-            },
-            {
-                        "item": "【屋根】",
-                        "stars": [
-                                    "★１．屋根の上の人。",
-                                    "★２ａ．屋根の上で働く職人に、情事を見られてしまう。",
-                                    "★２ｂ．屋根から見た情事の話がきっかけで、男女が関係を持つ。",
-                                    "★３．屋根裏から下の部屋をのぞき見る。",
-                                    "★４．下へ下へ行くと屋根があった。",
-                                    "★５．屋根へ上がって駱駝を捜す。",
-                                    "★６．屋根へ上がることの禁忌。",
-                                    "★７．屋根の破風を破って飛び去る。"
-                        ]
-            },
-            {
-                        "item": "【山】",
-                        "stars": [
-                                    "★１．山にこもって思索・瞑想する。",
-                                    "★２．山での説法。説教。",
-                                    "★３．船が山の上に止まる。",
-                                    "★４ａ．山を動かす。",
-                                    "★４ｂ．山が動かないのなら、人間が動く。",
-                                    "★５．山を崩す。",
-                                    "★６．山崩れ。",
-                                    "★７．山を焼く。"
-                        ]
-            },
-            {
-                        "item": "【山と神】",
-                        "stars": [
-                                    "★１．神が山へ降り立つ。",
-                                    "★２．神が舟で川をさかのぼって、山にいたる。",
-                                    "★３．人が山に登って神に祈る。神と出会う。",
-                                    "★４．古代神話の山を探す。"
-                        ]
-            },
-            {
-                        "item": "【山と死】",
-                        "stars": [
-                                    "★１．山は、死者の世界との接点である。山へ登って、死者と出会う。",
-                                    "★２．現世に別れを告げ、深山に入って死を待つ。",
-                                    "★３．飛行機で高い山の頂上へ向かう夢を見つつ、死ぬ。",
-                                    "★４．人間は死ぬと、山に登る。",
-                                    "★５．人間の寿命と山。"
-                        ]
-            },
-            {
-                        "item": "【山の起源】",
-                        "stars": [
-                                    "★１．日本の山の起源。",
-                                    "★２．富士山の起源。",
-                                    "★３．駒が嶽の起源。",
-                                    "★４．一もっこ山の起源。"
-                        ]
-            },
-            {
-                        "item": "【山の背比べ】",
-                        "stars": [
-                                    "★１．山の背比べ。",
-                                    "★２．二つの山の一方が背伸びし、一方が身を縮める。",
-                                    "★３．山の背伸びを止める。"
-                        ]
-            },
-            {
-                        "item": "【山姥】",
-                        "stars": [
-                                    "★１．山奥に住む白髪の老女。",
-                                    "★２．山姥が人間や動物を食う。",
-                                    "★３．山姥が富を授ける。",
-                                    "★４．人間が山姥を殺す。",
-                                    "★５．山姥が子を産む。",
-                                    "★６．山姥は金太郎（＝坂田金時）の母親である。"
-                        ]
-            },
-            {
-                        "item": "【闇】",
-                        "stars": [
-                                    "★１．闇の中の戦闘。同士討ち。",
-                                    "★２．闇の中の人殺し。人違いして別人を殺す。",
-                                    "★３．闇の中、相手を間違えて交わる。",
-                                    "★４．自分の正体を隠すために、闇の中で交わる。",
-                                    "★５．醜貌の男が、闇の中でのみ妻と逢う。",
-                                    "★６．「二度と恋人の姿を見ない」との誓いを守るために、闇の中で密会する。",
-                                    "★７．闇の中では盲目の人は、目の見える人よりも、かえって有利である。",
-                                    "★８．闇の中の盗み。",
-                                    "★９．歌舞伎の「だんまり」。闇の中で、何人かが無言のまま手探りで絡み合う。"
-                        ]
-            },
-            {
-                        "item": "【遺言】",
-                        "stars": [
-                                    "★１．敵を討て、との遺言。",
-                                    "★２．遺言にそむく息子。",
-                                    "★３．遺言状。",
-                                    "★４．二つの遺言。",
-                                    "★５．女神の遺言。"
-                        ]
-            },
-            {
-                        "item": "【誘拐】",
-                        "stars": [
-                                    "★１．子供を誘拐して殺す。",
-                                    "★２ａ．子供を誘拐し、身代金を得る。",
-                                    "★２ｂ．誘拐犯から要求された身代金を、犯人逮捕の懸賞金にする。",
-                                    "★２ｃ．誘拐犯ではなく、誘拐された被害者が、身代金の額を決める。",
-                                    "★３．親の口を封じるために、息子を誘拐する。",
-                                    "★４．若い娘を誘拐する。",
-                                    "★５．花嫁を誘拐する。"
-                        ]
-            },
-            {
-                        "item": "【遊女】",
-                        "stars": [
-                                    "★１．賤しい職業の男が、高嶺の花の遊女を見そめる。",
-                                    "★２．遊女殺し。",
-                                    "★３．娼妓が男をだます。",
-                                    "★４．菩薩のごとき心の遊女。",
-                                    "★５．老人に身請けされることを望む遊女。"
-                        ]
-            },
-            {
-                        "item": "【幽霊（所につく）】",
-                        "stars": [
-                                    "★１．幽霊が、自分の死んだ場所に出現する。",
-                                    "★２．霊が、生前の自分の家から離れない。",
-                                    "★３．居城が解体され移築されると、幽霊もいっしょに移築先へついて行く。"
-                        ]
-            },
-            {
-                        "item": "【幽霊（人につく）】",
-                        "stars": [
-                                    "★１．幽霊が、配偶者や恋人のもとへ現れる。",
-                                    "★２．幽霊が、友人のもとへ現れる。"
-                        ]
-            },
-            {
-                        "item": "【幽霊（物につく）】",
-                        "stars": [
-                                    "★１．幽霊が、現世に残した物に執着する。",
-                                    "★２．きわめてささいな物に執着するばあいがある。"
-                        ]
-            },
-            {
-                        "item": "【幽霊と生者の逆転】",
-                        "stars": [
-                                    "★１．生きた人間だと思っていたら実は幽霊だったことが、後にわかる。",
-                                    "★２．生きた人間だと思っていたら幽霊で、幽霊だと思っていたら生きた人間だったことが、後にわかる。生者と死者の逆転。"
-                        ]
-            },
-            {
-                        "item": "【幽霊の訴え】",
-                        "stars": [
-                                    "★１．幽霊が人間に手助けを請う。",
-                                    "★２．死者の霊が供養を請う。",
-                                    "★３．死者の霊が、「自分は殺されたのだ」と訴える。",
-                                    "★４．死者が骨と化し、鳥となって、「自分は殺されたのだ」と訴える。"
-                        ]
-            },
-            {
-                        "item": "【幽霊の有無】",
-                        "stars": [
-                                    "★１．幽霊のあるなしの議論。",
-                                    "★２．「幽霊はいない」と論ずる幽霊。",
-                                    "★３．目前の幽霊が実在するのか、ただ幻覚を見ているだけなのか、わからない。"
-                        ]
-            },
-            {
-                        "item": "【幽霊を見る】",
-                        "stars": [
-                                    "★１．一人だけが霊の姿を見る。",
-                                    "★２．大勢の人が幽霊を目撃する。"
-                        ]
-            },
-            {
-                        "item": "【幽霊族】",
-                        "stars": [
-                                    "★１．幽霊族の最期。"
-                        ]
-            },
-            {
-                        "item": "【誘惑】",
-                        "stars": [
-                                    "★１．神女もしくは魔性の女の誘惑。",
-                                    "★２．英雄が女に心を奪われ、本来の任務を忘れる。",
-                                    "★３．傾国の美女を用いて、帝王の心を惑わす。",
-                                    "★４．超人的な力を持つ男が、誘惑に負けて女と交わり、力を失う。",
-                                    "★５．謹厳実直な男が、女ゆえに身を滅ぼす。",
-                                    "★６．女の誘惑に負けなかった男の物語もある。",
-                                    "★７．神、仏、僧などが女に化身し、あるいは女を送って、男の心を試すために誘惑する。誘惑に乗る男も乗らぬ男もいる。",
-                                    "★８．仏や僧が女に化身し、誘惑に乗る男をそのまま仏道へ導く。"
-                        ]
-            },
-            {
-                        "item": "【雪】",
-                        "stars": [
-                                    "★１．雪に難渋して宿を求める。",
-                                    "★２．雪の夜に、神仏またはそれに等しい存在が身をやつして訪れ、福を授ける。",
-                                    "★３．雪と足跡。",
-                                    "★４．積もった雪が村全体を隠す。",
-                                    "★５．雪だるまが死体を隠す。",
-                                    "★６．雪だるまの恋。",
-                                    "★７．真夏の雪。",
-                                    "★８．雪山。"
-                        ]
-            },
-            {
-                        "item": "【雪女】",
-                        "stars": [
-                                    "★１．雪女と結婚する。",
-                                    "★２ａ．雪女を風呂に入れたら、消えてしまった。",
-                                    "★２ｂ．雪むすめを火に近づけたら、消えてしまった。",
-                                    "★３．抱くだけで消えてしまう雪女もいる。",
-                                    "★４．雪女と話をすると殺される。",
-                                    "★５．雪女郎を見ると死ぬ。",
-                                    "★６．雪の精を見ても死なない。",
-                                    "★７．男に裏切られた女が、雪女と化す。"
-                        ]
-            },
-            {
-                        "item": "【行方不明】",
-                        "stars": [
-                                    "★１．若い女が行方不明になる。",
-                                    "★２．若い男が行方不明になり、何年か後に再び姿を現す。",
-                                    "★３．初老の男が行方不明になる。",
-                                    "★４．行方不明の隠蔽。",
-                                    "★５．行方不明の失踪人を捜す調査員が、自らも失踪人となる。"
-                        ]
-            },
-            {
-                        "item": "【ゆすり】",
-                        "stars": [
-                                    "★１．人に言いがかりをつけて、大金を要求する。",
-                                    "★２．犯罪やスキャンダルに関わりのある人物を脅して、金品を要求する。",
-                                    "★３ａ．恐喝する相手が、自分の愛人だった。",
-                                    "★３ｂ．恐喝する相手が、自分の妻だった。",
-                                    "★４．恐喝者が別人に出し抜かれ、金を奪われ殺人の濡れ衣を着せられる。"
-                        ]
-            },
-            {
-                        "item": "【指】",
-                        "stars": [
-                                    "★１ａ．指先から光を放つ。",
-                                    "★１ｂ．指先から水を出す。",
-                                    "★１ｃ．指先から甘露を降らす。",
-                                    "★２．人の指が蛇に変わる。",
-                                    "★３．指に噛みつく女。",
-                                    "★４．指をくわえて得る知恵。",
-                                    "★５．指先に残る記憶。",
-                                    "★６．指と痛み。",
-                                    "★７．握った指が掌を貫いて、手の甲へ抜ける。",
-                                    "★８．指を細くして、指輪に合わせようとする。",
-                                    "★９．足の趾（ゆび）。"
-                        ]
-            },
-            {
-                        "item": "【指を切る】",
-                        "stars": [
-                                    "★１．女が自らの指を一本切り取る。",
-                                    "★２．賭けに負けると、指を一本切り取る。",
-                                    "★３．指を一本切り取って、悟りに導く。",
-                                    "★４．切断された指が動く。",
-                                    "★５．ヤクザが指をつめる。",
-                                    "★６．殺人犯の指を噛み切る。"
-                        ]
-            },
-            {
-                        "item": "【指輪】",
-                        "stars": [
-                                    "★１．はめた人の姿を見えなくする指輪。",
-                                    "★２．動物と語り合える指輪。",
-                                    "★３．眠りをさます指輪。",
-                                    "★４．「回想の指輪」と「忘却の指輪」。",
-                                    "★５．愛を成就する一対の指輪。",
-                                    "★６．愛のしるしとして、男から女へ・女から男へ、贈られる指輪。",
-                                    "★７．男が指輪を二つに折り、半分を自分が持ち、半分を女に渡す。",
-                                    "★８．指輪を示して、その持ち主の存在を知らせる。",
-                                    "★９．指輪の自慢。",
-                                    "★１０．指輪を奪おうと、指ごと切り落とす。"
-                        ]
-            },
-            {
-                        "item": "【指輪を捨てる】",
-                        "stars": [
-                                    "★１．海に投げ捨てた指輪が、持ち主の所へ戻って来る。",
-                                    "★２．投げ捨てた指輪が戻って来ることを確信する。"
-                        ]
-            },
-            {
-                        "item": "【弓】",
-                        "stars": [
-                                    "★１ａ．弓の名手。",
-                                    "★１ｂ．弓を用いない名手。",
-                                    "★２．強弓を引く。",
-                                    "★３．弓を引けないように、腕を不具にする。",
-                                    "★４．弓の絃（つる）。",
-                                    "★５．姿を変える弓。",
-                                    "★６．神々の武器。"
-                        ]
-            },
-            {
-                        "item": "【夢】",
-                        "stars": [
-                                    "★１．繰り返し見る夢。",
-                                    "★２．夢の中で見る夢。",
-                                    "★３．夢と自覚している夢。",
-                                    "★４．他者の夢の中の存在。",
-                                    "★５ａ．夫が眠って夢を見る。妻が覚醒した状態で、夫の夢の内容を目撃する。",
-                                    "★５ｂ．人間が眠って夢を見る。夢の内容を人造人間が目撃し、まわりの人たちに説明する。",
-                                    "★５ｃ．妻が眠って夢を見る。妻の身体から抜け出した魂を、夫が目撃する。",
-                                    "★５ｄ．母親が眠って夢を見る。母親の身体から抜け出した魂を、息子が目撃する。",
-                                    "★６．懐妊を知らせる夢。"
-                        ]
-            },
-            {
-                        "item": "【夢と現実】",
-                        "stars": [
-                                    "★１．夢か現実かわからない。",
-                                    "★２ａ．夢と現実を等価と見る。",
-                                    "★２ｂ．夢が現実に影響を及ぼす。",
-                                    "★３ａ．現実に起こったことを、「夢だ」と言う。",
-                                    "★３ｂ．「すばらしい夢からさめて、みじめな現実に戻った」と絶望するが、それこそが夢であり、「すばらしい夢」と思っていたことが現実だった。",
-                                    "★４ａ．人間の一生は夢だ、と悟る。",
-                                    "★４ｂ．神も人間も宇宙もすべて夢だ、と教えられる。",
-                                    "★５．夢の中で体験したことの痕跡が、身体に残る。",
-                                    "★６．夢から覚めて、その夢のもとになったことがらを知る。"
-                        ]
-            },
-            {
-                        "item": "【夢の売買】",
-                        "stars": [
-                                    "★１．幸福をもたらす夢を売り買いする。",
-                                    "★２．両人が承知で売り買いするのとは異なり、夢を見た当人の知らぬうちに、その夢が他人に取られる話もある。"
-                        ]
-            },
-            {
-                        "item": "【夢オチ】",
-                        "stars": [
-                                    "★１．長い時間にわたる経験が、実は短時間の夢だったことが、物語の最後にわかる。",
-                                    "★２．眠れない夢を見ていた、という夢オチ。",
-                                    "★３．夢オチの提案。",
-                                    "★４．二十世紀中頃になっても、正攻法の夢オチの物語が作られることがある。",
-                                    "★５ａ．若者が一生のことを夢に見て、目覚めたらもとの若者だった。",
-                                    "★５ｂ．一生の夢を見た若者の思い。",
-                                    "★５ｃ．若者が一生のことを夢に見て、目覚めたら老人になっていた。"
-                        ]
-            },
-            {
-                        "item": "【夢語り】",
-                        "stars": [
-                                    "★１．良い夢を見たら、それが実現するまでは人に語ってはならない。",
-                                    "★２．良い夢を語って、悪く夢合わせされると、夢が実現しない。",
-                                    "★３．悪い夢を見た時、その日のうちに人に語れば、夢は実現せずにすむ。",
-                                    "★４．悪い夢を見たが、その内容を誰にも話さなかった。",
-                                    "★５．夢で見た虫の話をしていたちょうどその時、現実にその虫が現れた。"
-                        ]
-            },
-            {
-                        "item": "【夢で得た物】",
-                        "stars": [
-                                    "★１．夢の中で見たもの・得たものが、現実にある。",
-                                    "★２．夢の中で見たもの・得たものと類似のものが、現実にある。",
-                                    "★３．逆に、夢の中で人に物を与える形もある。",
-                                    "★４．一方で物を得れば、他方ではその物がなくなっている。"
-                        ]
-            },
-            {
-                        "item": "【夢で見た人】",
-                        "stars": [
-                                    "★１．夢で見た人と現実世界で出会う。",
-                                    "★２．夢の中の存在である女学生が、現実世界に出現する。",
-                                    "★３．夢で逢う人の家を、目覚めてから訪れる。",
-                                    "★４．夢で見た鹿を探す。"
-                        ]
-            },
-            {
-                        "item": "【夢解き】",
-                        "stars": [
-                                    "★１ａ．王が見た夢を、賢者が解釈して将来を予言する。",
-                                    "★１ｂ．王が、自分の見た夢の内容を語らずに、「私が見た夢の内容とその解釈を示せ」と、賢者たちに要求する。",
-                                    "★２．凶夢を解釈しなおす。夢違え。",
-                                    "★３．夢は、いったん解釈されてしまったら、もう解釈し直すことはできない、という話もある。",
-                                    "★４．夢を誤って解釈する。"
-                        ]
-            },
-            {
-                        "item": "【曜日】",
-                        "stars": [
-                                    "★１．日曜日。",
-                                    "★２．月曜日。",
-                                    "★３．金曜日。",
-                                    "★４．土曜日。",
-                                    "★５．日曜日から始まり、金曜日に終わる悲劇。",
-                                    "★６．一週間。"
-                        ]
-            },
-            {
-                        "item": "【予言】",
-                        "stars": [
-                                    "★１．予言された運命から逃れようとしても逃れられない。",
-                                    "★２．予言にそそのかされて行動する。",
-                                    "★３．死の予言を人為的に実現させる。",
-                                    "★４ａ．死の予言を無視して、命が助かる。",
-                                    "★４ｂ．死の予言をそのまま受け入れて、命が助かるばあいもある。",
-                                    "★５．予言の真の意味がわからず、誤った受け取りかたをする。したがって、意想外の形で予言が実現する。",
-                                    "★６．無意識のうちに未来を予知する。",
-                                    "★７．何気なく発した言葉が、将来の自分の運命の予言になる。",
-                                    "★８．宇宙のすべての原子の、現時点での運動（その方向と速度）を知れば、未来の任意の時点における全原子の位置は、正確に計算（＝予知）できる（過去についても同様である）。"
-                        ]
-            },
-            {
-                        "item": "【横取り】",
-                        "stars": [
-                                    "★１ａ．ＡとＢが貴重な品を巡って争い、通りかかったＣがその品を横取りする。",
-                                    "★１ｂ．Ａ、Ｂ、Ｃが貴重な品を巡って争い、通りかかったＤがその品を横取りする。",
-                                    "★１ｃ．ＡとＢが金を巡って争い、通りかかったＣがその金を預かる。",
-                                    "★１ｄ．ＡとＢが争い、通りかかったＣがＡとＢを獲物として得る。",
-                                    "★１ｅ．ＡとＢが争い、通りかかったＣが争いをやめさせて、Ａ・Ｂ双方の命を救う。「漁父の利」とは異なる展開。",
-                                    "★２．手柄を横取りする。"
-                        ]
-            },
-            {
-                        "item": "【横恋慕】",
-                        "stars": [
-                                    "★１．王などの権力者が、部下の妻に横恋慕し、部下を迫害する。",
-                                    "★２．王などの権力者が、部下の妻を奪おうとして難題を出す。",
-                                    "★３．横恋慕された女の夫が迫害されず、かえって昇進する物語もある。",
-                                    "★４．夏目漱石は、権力者の横恋慕をモチーフとした作品を二つ、明治三十九年（１９０６）に発表している。",
-                                    "★５．横恋慕とは逆に、若い二人の幸福のために身を引く男。",
-                                    "★６．横恋慕に起因する殺人と自殺で、男女三人が皆死ぬ。"
-                        ]
-            },
-            {
-                        "item": "【夜泣き】",
-                        "stars": [
-                                    "★１．特別な素質、運命を持つ人物が、幼い頃に夜泣きをする。",
-                                    "★２．幼い子が、霊を感知して夜泣きする。",
-                                    "★３．夜泣きする石。",
-                                    "★４．夜に鳴く鶏。",
-                                    "★５．子供の夜泣きをとどめる松。"
-                        ]
-            },
-            {
-                        "item": "【四人兄弟】",
-                        "stars": [
-                                    "★１．四人兄弟の長子が王位を継承する。",
-                                    "★２．四人兄弟の末子が天皇になる。",
-                                    "★３．四人兄弟の末子が総領になる。",
-                                    "★４．四人兄弟が協力して大蛇を退治する。",
-                                    "★５．四人兄弟と父親との関係。"
-                        ]
-            },
-            {
-                        "item": "【四人姉妹】",
-                        "stars": [
-                                    "★１．四人姉妹それぞれの生き方。"
-                        ]
-            },
-            {
-                        "item": "【呼びかけ】",
-                        "stars": [
-                                    "★１．一声だけの呼びかけ。",
-                                    "★２．妖怪や幽霊などの呼びかけに、返事をしてはいけない。",
-                                    "★３．呼びかけに答えて良い相手と、答えてはいけない相手がある。",
-                                    "★４．呼びかけるか、呼びかけられるかで、生死が分かれる。",
-                                    "★５．化け物の呼びかけに返事をしてはならない、という俗信を利用した詐術。",
-                                    "★６．阿弥陀仏に呼びかける。",
-                                    "★７．帰宅時、家人に声をかける。"
-                        ]
-            },
-            {
-                        "item": "【読み間違い】",
-                        "stars": [
-                                    "★１．ひらがなの読み間違い。",
-                                    "★２．漢字の読み間違い。",
-                                    "★３．漢字二文字を、一文字に見間違える。",
-                                    "★４．作文の題一題を、二題と見間違える。",
-                                    "★５．アルファベットの読み間違い。",
-                                    "★６．わざと読み間違える。"
-                        ]
-            },
-            {
-                        "item": "【嫁いじめ】",
-                        "stars": [
-                                    "★１．姑が嫁を嫌って、何かと辛くあたる。",
-                                    "★２．姑が嫁を嫌って、無理難題を課す。",
-                                    "★３．姑の善意の押し売りが、結果的に嫁いじめになる。"
-                        ]
-            },
-            {
-                        "item": "【嫁えらび】",
-                        "stars": [
-                                    "★１．年頃の娘たちを城へ招き、その中から花嫁を選ぶ。",
-                                    "★２．年頃の娘たちがいる女学校へ行き、嫁を選ぶ。",
-                                    "★３．毎月一人ずつ、妻候補の女性と逢う。"
-                        ]
-            },
-            {
-                        "item": "【嫁くらべ】",
-                        "stars": [
-                                    "★１．嫁たちの美貌や教養をくらべる。",
-                                    "★２．嫁たちの従順さをくらべる。"
-                        ]
-            },
-            {
-                        "item": "【嫁と姑】",
-                        "stars": [
-                                    "★１．嫁が姑を嫌う。",
-                                    "★２．嫁が姑に孝行を尽くす。",
-                                    "★３．夫が死んだ後に、舅・姑の家へ行き、嫁として仕える。",
-                                    "★４．姑が嫁を離縁する。"
-                        ]
-            },
-            {
-                        "item": "【余命】",
-                        "stars": [
-                                    "★１．ろばの皮の大きさで、余命を知る。",
-                                    "★２．酒や食べ物の残量で、余命を知る。",
-                                    "★３．札束や宝石の残量で、余命を知る。"
-                        ]
-            },
-            {
-                        "item": "【夜】",
-                        "stars": [
-                                    "★１．夜に変身する。",
-                                    "★２ａ．夜に謎の外出をする。",
-                                    "★２ｂ．夜、身体は家で眠っていて、魂だけが外出する。",
-                                    "★２ｃ．夜に天界へ昇る。",
-                                    "★３．夜にだけ訪れる夫。",
-                                    "★４．夜の夫と昼の夫。"
-                        ]
-            },
-            {
-                        "item": "【夜と昼】",
-                        "stars": [
-                                    "★１．夜が先に生じ、後に昼が生じた。",
-                                    "★２．夜が一日の中心で、一日は夜から始まる。",
-                                    "★３．夜から一日が始まるので、昼間からその日の朝を振り返って「今朝」と言うように、朝から夜を振り返って「今夜」と言う〔＊「昨夜」とは言わない〕。",
-                                    "★４．はじめは昼だけで、後から夜ができた。"
-                        ]
-            },
-            {
-                        "item": "【四十歳】",
-                        "stars": [
-                                    "★１．初老となった四十歳で、あらたに結婚し・出産して、人生の新段階をむかえる。",
-                                    "★２．四十歳に達した人を殺す。"
-                        ]
-            },
-            {
-                        "item": "【落雷】",
-                        "stars": [
-                                    "★１．落雷で人が死傷する。",
-                                    "★２．落雷に遭いながらも無事だった。",
-                                    "★３ａ．雷が落ちて捕らえられる。",
-                                    "★３ｂ．雷が木にはさまって、捕らえられる。",
-                                    "★４．落ちた雷が、人間に何ものかを授けて昇天する。",
-                                    "★５．激しい雷鳴。",
-                                    "★６．臨終時の落雷。"
-                        ]
-            },
-            {
-                        "item": "【落下する人】",
-                        "stars": [
-                                    "★１．高い煙突から落下する人。",
-                                    "★２．大きな客船の高い甲板から海へ落下する人。",
-                                    "★３．水のないプールの底へ落下する人。",
-                                    "★４．深い穴を落下して行く人。",
-                                    "★５．急激に落下せず、ゆっくり軟着陸するための工夫。",
-                                    "★６．上へ落ちて行く人。"
-                        ]
-            },
-            {
-                        "item": "【落下する物】",
-                        "stars": [
-                                    "★１．落下する刃物。",
-                                    "★２．無意識の殺意による、刃物や植木鉢の落下。",
-                                    "★３．落下する果実。",
-                                    "★４．落下する亀。",
-                                    "★５ａ．天空が落ちるのではないか、と恐れる。",
-                                    "★５ｂ．雷や隕石が落ちるのではないか、と恐れる。",
-                                    "★６ａ．落ちそうで落ちない石。",
-                                    "★６ｂ．落ちそうで落ちない睾丸。",
-                                    "★７．天から穀物が降ってくる。",
-                                    "★８．天から、バラバラにされた身体が降ってくる。",
-                                    "★９．天からお札（ふだ）が降ってくる。"
-                        ]
-            },
-            {
-                        "item": "【離縁・離婚】",
-                        "stars": [
-                                    "★１．離婚・離別で終わる物語。",
-                                    "★２．離縁・離婚を繰り返す。",
-                                    "★３．離婚を望む夫婦。",
-                                    "★４．両親の離婚後の子供が、父とともに暮らすか、母とともに暮らすか。",
-                                    "★５．両親の離婚後の子供が、父の家と母の家を行ったり来たりする。",
-                                    "★６．神々の離婚。",
-                                    "★７．「離婚せねば災難に遭う」と言って脅す。",
-                                    "★８．これといった理由もなく、男女が別れる。",
-                                    "★９．離婚の町。"
-                        ]
-            },
-            {
-                        "item": "【離婚せず】",
-                        "stars": [
-                                    "★１．父親の説得により、離婚を思いとどまる妻。",
-                                    "★２．旅先での経験により、離婚を思いとどまる妻。",
-                                    "★３．妻が妊娠したため、離婚できなくなる。",
-                                    "★４．子供が生まれたため、離婚せずにすむ。",
-                                    "★５．夫を連れて家を去ろうとする妻。"
-                        ]
-            },
-            {
-                        "item": "【理髪師】",
-                        "stars": [
-                                    "★１ａ．床屋が、客の咽を剃刀でえぐる。",
-                                    "★１ｂ．悪人が床屋と入れ替わり、客の喉を剃刀でかき切る。",
-                                    "★２．客を練習台にして、剃刀の稽古をする。",
-                                    "★３．悪事をはたらく髪結い。",
-                                    "★４．理髪師が、王の耳がろばの耳であることを知る。",
-                                    "★５．理髪師が、王の白髪を見つける。",
-                                    "★６．女性理髪師とその夫。"
-                        ]
-            },
-            {
-                        "item": "【龍】",
-                        "stars": [
-                                    "★１．人とともにある龍。人を守護する龍。",
-                                    "★２．龍の姿を見る。",
-                                    "★３ａ．龍に乗って去る。",
-                                    "★３ｂ．龍の引く車に乗って去る。",
-                                    "★４．龍の持つ玉。",
-                                    "★５．龍は水を得れば神通力を発揮する。",
-                                    "★６．龍の苦しみ。",
-                                    "★７．龍の肉。",
-                                    "★８．龍の作り物。",
-                                    "★９．龍が転生してお釈迦様になる。"
-                        ]
-            },
-            {
-                        "item": "【龍に化す】",
-                        "stars": [
-                                    "★１．男が龍に化す。",
-                                    "★２．女が龍に化す。",
-                                    "★３．剣が龍に化す。"
-                        ]
-            },
-            {
-                        "item": "【龍王】",
-                        "stars": [
-                                    "★１．龍王が、地上の人間を水界へ招く。",
-                                    "★２．龍王との争い。"
-                        ]
-            },
-            {
-                        "item": "【龍宮】",
-                        "stars": [
-                                    "★１ａ．男が、海の彼方もしくは海の底の龍宮へ行く。",
-                                    "★１ｂ．男が、湖の底の龍宮へ行く。",
-                                    "★１ｃ．男が、池の底の龍宮へ行く。",
-                                    "★１ｄ．男が滝壺の底の龍宮へ行く。",
-                                    "★２．龍宮の住人が人間世界を訪れ、やがてまた帰って行く。",
-                                    "★３．この世を去った人々が龍宮に住む。",
-                                    "★４．龍宮城の東門。",
-                                    "★５．龍宮にある経典。",
-                                    "★６．龍宮は琉球である。",
-                                    "★７ａ．山中の龍宮。",
-                                    "★７ｂ．山の洞中の龍宮。"
-                        ]
-            },
-            {
-                        "item": "【龍退治】",
-                        "stars": [
-                                    "★１．英雄や聖者が、剣や槍などで龍を殺す。",
-                                    "★２．王や聖者が、言葉の力で龍を追い払う、服従させる。",
-                                    "★３．相打ち。英雄も龍も死ぬ。"
-                        ]
-            },
-            {
-                        "item": "【両性具有】",
-                        "stars": [
-                                    "★１．男でも女でもある存在。",
-                                    "★２．男女が融合して、両性具有者になる。",
-                                    "★３．誕生時は女と見なされたが、年頃になって両性具有者と判明する。",
-                                    "★４．青年が手術を受けて、両性具有者になる。",
-                                    "★５．両性具有者と間違えられた男。",
-                                    "★６．人間の身体は、両性具有的構造を持っている。"
-                        ]
-            },
-            {
-                        "item": "【りんご】",
-                        "stars": [
-                                    "★１．西欧の物語に頻出する果物。生命のりんご・黄金のりんご。",
-                                    "★２．命を奪うりんご。",
-                                    "★３．りんごを食べて、壊血病から回復する。",
-                                    "★４．りんごの木から生まれた子。"
-                        ]
-            },
-            {
-                        "item": "【累積】",
-                        "stars": [
-                                    "★１．類似の出来事・状況などが次々に連なり重なる。",
-                                    "★２．吉事と凶事が連なり重なる。",
-                                    "★３．寒さと暑さが連なり重なる。"
-                        ]
-            },
-            {
-                        "item": "【留守】",
-                        "stars": [
-                                    "★１．留守番する娘のところへ、魔物や魔女が来る。",
-                                    "★２．留守番する山羊の子供たちのところへ、狼が来る。",
-                                    "★３．留守番をする子供が、泥棒を撃退する。",
-                                    "★４．夫の留守を守る妻。",
-                                    "★５．留守にさせる策略。"
-                        ]
-            },
-            {
-                        "item": "【霊界通信】",
-                        "stars": [
-                                    "★１．霊界の死者が、現世の人間の問いに答える。",
-                                    "★２．霊界の死者がノック音を用いて、現世の人間と交信する。",
-                                    "★３．霊界と交信できる機械。",
-                                    "★４．霊界から和歌を詠み送る。",
-                                    "★５．霊界通信の誤り。",
-                                    "★６．長期間に渡る霊界通信。",
-                                    "★７．霊は、言葉での意思疎通が不可能な場合には、象徴を用いる。",
-                                    "★８．交差通信（クロス・コレスポンデンス）。"
-                        ]
-            },
-            {
-                        "item": "【冷凍睡眠】",
-                        "stars": [
-                                    "★１．冷凍睡眠で未来社会へ行く。",
-                                    "★２．冷凍睡眠する人と、しない人の年齢の差。",
-                                    "★３．冷凍睡眠と時間旅行の組み合わせ。",
-                                    "★４．長期間の宇宙旅行には、乗員の冷凍睡眠が必須である。",
-                                    "★５．墓の中に長年月いた後に蘇生するのは、冷凍睡眠と同じようなものである。",
-                                    "★６．ミイラになるのも、冷凍睡眠と同じようなものである。"
-                        ]
-            },
-            {
-                        "item": "【歴史】",
-                        "stars": [
-                                    "★１．過去の歴史記録を改竄する。",
-                                    "★２．不都合な出来事を隠し、事実とは異なる記録を残す。",
-                                    "★３．歴史を語る老人。",
-                                    "★４．歴史と神話の分離。"
-                        ]
-            },
-            {
-                        "item": "【轢死】",
-                        "stars": [
-                                    "★１．鉄道自殺。",
-                                    "★２．鉄道自殺する人と間違えられる。",
-                                    "★３．轢死事故。",
-                                    "★４．予示された轢死事故。",
-                                    "★５．轢死事故を見た人が、後に鉄道自殺する。",
-                                    "★６．人を殺し、その死体を列車に轢（ひ）かせる。"
-                        ]
-            },
-            {
-                        "item": "【連想】",
-                        "stars": [
-                                    "★１．犯罪と連想。",
-                                    "★２．妻を思い浮かべる。",
-                                    "★３ａ．半月からスイカを思う。",
-                                    "★３ｂ．風呂桶から棺桶を思う。",
-                                    "★４．旧知の人の名前を思い出す。",
-                                    "★５．連想の連鎖。",
-                                    "★６．連鎖のあてはずれ。"
-                        ]
-            },
-            {
-                        "item": "【老翁】",
-                        "stars": [
-                                    "★１．不思議な老人と出会い、貴重な情報などを授けられる。",
-                                    "★２．老人が青年の肉体を得る。",
-                                    "★３．老人の回想。",
-                                    "★４．老人の一人芝居。",
-                                    "★５．老年になってからもうけた子供。"
-                        ]
-            },
-            {
-                        "item": "【老翁と若い女】",
-                        "stars": [
-                                    "★１．老翁が若い女に思いをよせる。",
-                                    "★２．老翁の霊と若い娘の霊。",
-                                    "★３．老翁が息子で、若い女が母。",
-                                    "★４．この世に生き続けて老人になった夫と、いったん死んで生まれ変わったため若い妻。"
-                        ]
-            },
-            {
-                        "item": "【ろうそく】",
-                        "stars": [
-                                    "★１．生と死のろうそく。",
-                                    "★２．ろうそくが燃え尽きると、命も尽きる。",
-                                    "★３．ろうそくがともっているうちに出頭すれば恩赦、消えた後は死刑。",
-                                    "★４．ろうそくの蝋（ろう）を、身体にたらす。",
-                                    "★５．ろうそくの焔の色で、火事が予知できる。",
-                                    "★６．初めて見るろうそく。"
-                        ]
-            },
-            {
-                        "item": "【老婆と若い男】",
-                        "stars": [
-                                    "★１．老婆が若い男に思いをよせる。",
-                                    "★２．老婆の霊と青年の霊。",
-                                    "★３．老婆が若い女に変身する。",
-                                    "★４．老婆が若い女に見えてくる。",
-                                    "★５ａ．老婆と思ったら、実は若い女。",
-                                    "★５ｂ．若い女と思ったら、実は老婆。",
-                                    "★６．若い女も、年月がたてば老婆になる。"
-                        ]
-            },
-            {
-                        "item": "【録音】",
-                        "stars": [
-                                    "★１．テープレコーダーに意外な声が録音されている。",
-                                    "★２．偶然、男女の別れ話の声が録音されたと思ったら、前もって仕組まれたことだった。",
-                                    "★３ａ．録音技術がまだ珍しかった一九二〇年代には、前もって録音された声を再生し、殺害された人物が生きているかのように思わせるトリックが有効であった。",
-                                    "★３ｂ．『アクロイド』（一九二六年）や『カナリヤ』（一九二七年）よりも早く、一九二一年にドイルは録音、再生トリックを使っている。",
-                                    "★４ａ．声が凍って、竹の中に録音される。",
-                                    "★４ｂ．音が凍って、角笛の中に録音される。",
-                                    "★５．清朝・乾隆帝時代の録音機。"
-                        ]
-            },
-            {
-                        "item": "【ろくろ首】",
-                        "stars": [
-                                    "★１．ろくろ首の女が結婚して、夫を驚かす。",
-                                    "★２．少女のろくろ首。",
-                                    "★３．ろくろ首の変形で、女が眠っている間に首が身体から離れて飛んで行く、というものがある。",
-                                    "★４ａ．首が外へ飛んで行っている間に身体を動かすなどのことをすると、首はもとの身体に戻れない。",
-                                    "★４ｂ．身体を動かさなければ、首はもとの身体へ無事に戻ることができる。",
-                                    "★５．女が蛇になり、木になり、ろくろ首になる。"
-                        ]
-            },
-            {
-                        "item": "【ロシアン・ルーレット】",
-                        "stars": [
-                                    "★１．ロシアン・ルーレットによる運試し。",
-                                    "★２．ロシアン・ルーレットによる決闘。",
-                                    "★３．ロシアン・ルーレットによる賭け。",
-                                    "★４．ロシアン・ルーレットの変形。",
-                                    "★５．弾丸なしのロシアン・ルーレット。",
-                                    "★６．ロシアン・ルーレットの弾丸が出なかった時の、歓喜と安息。"
-                        ]
-            },
-            {
-                        "item": "【ろば】",
-                        "stars": [
-                                    "★１．人間がろばに変身する。",
-                                    "★２ａ．人間をろばにするキャベツ、ろばを人間に戻すキャベツ。",
-                                    "★２ｂ．人間をろばにする焼餅、ろばを人間に戻してくれる老人。",
-                                    "★３ａ．人間がろばに転生する。",
-                                    "★３ｂ．ろばが人間に転生する。",
-                                    "★４．人間がろばを産む。",
-                                    "★５．ろばがしゃべる。",
-                                    "★６ａ．ろばと交わる男。",
-                                    "★６ｂ．ろばと交わる女。",
-                                    "★７．ろばに乗る人。"
-                        ]
-            },
-            {
-                        "item": "【ロボット】",
-                        "stars": [
-                                    "★１．人間と共存するロボット。人間の味方をするロボット。",
-                                    "★２．日本軍の兵器・兵士として造られたロボット。",
-                                    "★３．人間に敵対するロボット。",
-                                    "★４ａ．ロボット三原則。〔第一条〕ロボットは人間に危害を加えてはならない。〔第二条〕前条に反しない限り、ロボットは人間の命令に従わねばならない。〔第三条〕前二条に反しない限り、ロボットは自らを守らねばならない。",
-                                    "★４ｂ．ロボット三原則〔第二条〕と〔第三条〕の板ばさみ。",
-                                    "★４ｃ．逆転したロボット三原則。〔第一条〕ロボットは人間に危害を加えなくてはならない。〔第二条〕ロボットは人間の命令に従ってはならない。〔第三条〕一～二条に反する惧（おそ）れのある場合は、ロボットは自らを破壊しなければならない。",
-                                    "★５．人間がロボットに恋する。",
-                                    "★６．人間のロボット化。",
-                                    "★７．サイボーグ。人間の身体を手術して、人工の機器を付与する。"
-                        ]
-            },
-            {
-                        "item": "【輪】",
-                        "stars": [
-                                    "★１．土星の環（わ）。",
-                                    "★２ａ．茅（ち）の輪を腰につける。",
-                                    "★２ｂ．大きな茅（ち）の輪をくぐる。",
-                                    "★３．巨大な環をくぐって、宇宙の彼方の惑星に到る。",
-                                    "★４．輪の中に立つ子供。"
-                        ]
-            },
-            {
-                        "item": "【和解】",
-                        "stars": [
-                                    "★１．仲のこじれた二人が、一方の病気を契機に和解する。",
-                                    "★２．不和であった二人が、双方の子供の死を契機に和解する。",
-                                    "★３．父と息子の和解。",
-                                    "★４．父と娘の和解。",
-                                    "★５．兄と弟の和解。"
-                        ]
-            },
-            {
-                        "item": "【若返り】",
-                        "stars": [
-                                    "★１ａ．草、花、果実、薬などを、飲んだり食べたりして若返る。",
-                                    "★１ｂ．桃を食べたり水を飲んだりして、老夫婦が若返る。",
-                                    "★２．水の中に入って若返る。",
-                                    "★３．月の神は、若返りの水を持っている。",
-                                    "★４．魔法や神通力などによって若返る。",
-                                    "★５．老いてはまた若返ることを繰り返す。",
-                                    "★６．身近にいる人を若返らせる不思議な存在。",
-                                    "★７．若返ったと思ったら、病気だった。",
-                                    "★８．老人が若者から若さをもらうが、反省して再び老人にもどる。",
-                                    "★９．若返り無用論。"
-                        ]
-            },
-            {
-                        "item": "【惑星】",
-                        "stars": [
-                                    "★１ａ．木星が太陽になる。",
-                                    "★１ｂ．木星の太陽化中止および爆破。",
-                                    "★１ｃ．歳星（＝木星）の精。",
-                                    "★２ａ．火星が災いをもたらす。",
-                                    "★２ｂ．火星が人間の姿をして地上に現れる。",
-                                    "★２ｃ．戦う青年が火星になる。",
-                                    "★３ａ．英雄の心臓が金星になる。",
-                                    "★３ｂ．金星は、「明けの明星」「宵の明星」という二つの星、と見なされることがある。",
-                                    "★３ｃ．宵の明星が懐に入る夢を見て身ごもった。",
-                                    "★４．惑星が破壊され、小惑星となる。",
-                                    "★５．小惑星が地球に衝突する。",
-                                    "★６．惑星や恒星の性交。"
-                        ]
-            },
-            {
-                        "item": "【わざくらべ】",
-                        "stars": [
-                                    "★１ａ．名手どうしが、わざを競う。",
-                                    "★１ｂ．名手と女神が、わざを競う。",
-                                    "★１ｃ．予言者どうしが、わざを競う。",
-                                    "★２．幻術などを競う。",
-                                    "★３．変身くらべ。二者が互いにさまざまなものに変身しつつ闘う。",
-                                    "★４．人間と狐の化けくらべ。",
-                                    "★５．けちくらべ。"
-                        ]
-            },
-            {
-                        "item": "【鷲】",
-                        "stars": [
-                                    "★１．鷲が子供をさらう。",
-                                    "★２．鷲にさらわれた子供が、後に親と再会する。",
-                                    "★３．鷲にさらわれた人の帰還。",
-                                    "★４．鷲の恩返し。",
-                                    "★５．自分の羽のついた矢で射られる鷲。",
-                                    "★６．人間が鷲に転生する。"
-                        ]
-            },
-            {
-                        "item": "【わに】",
-                        "stars": [
-                                    "★１．わにが人間の身体を食う。",
-                                    "★２．わにが小鹿にだまされる。",
-                                    "★３．日本の神話にあらわれる「わに」＝鮫（さめ）、とする説が有力である。",
-                                    "★４．わにと女。",
-                                    "★５．わにの恋。",
-                                    "★６．わにが女を喰い殺す。"
-                        ]
-            },
-            {
-                        "item": "【笑い】",
-                        "stars": [
-                                    "★１．「笑」という文字の起源。",
-                                    "★２．古代ギリシア世界に、初めてもたらされた笑い。",
-                                    "★３．微笑。",
-                                    "★４．少女の謎の笑い。",
-                                    "★５．笑いを禁圧する。",
-                                    "★６ａ．笑い薬。",
-                                    "★６ｂ．笑いガス。",
-                                    "★７．笑い死に。",
-                                    "★８．作り笑い。",
-                                    "★９．家族の死に際しての、日本人の不可解な笑い。"
-                        ]
-            },
-            {
-                        "item": "【笑いの力】",
-                        "stars": [
-                                    "★１．笑いの力で、神を招き魔を払う。",
-                                    "★２．笑って金を招き寄せる。",
-                                    "★３．鬼や魔物を笑わせることによって、その力を失わせる・追い払う。"
-                        ]
-            },
-            {
-                        "item": "【笑わぬ女】",
-                        "stars": [
-                                    "★１．笑わぬ女が、こっけいなものを見たり、自分の気に入るものを見たりして、笑う。",
-                                    "★２．笑わぬ女が、女性器を見て笑う。",
-                                    "★３．気鬱症の娘が、男性器を見て笑う。"
-                        ]
-            },
-            {
-                        "item": "【藁人形】",
-                        "stars": [
-                                    "★１．呪いの藁人形。",
-                                    "★２．呪いを転じ変える藁人形。",
-                                    "★３．藁人形に釘を打って人を呪うのとは逆の形で、藁人形を安全な所におけば、人も危難を逃れることができる、という物語。",
-                                    "★４．人間に見せかけた藁人形。",
-                                    "★５．藁人形のかかし。"
-                        ]
-            }
-]    
+        """内蔵の圧縮データを展開して読み込む（バックグラウンドスレッドで実行）
+
+        内蔵データが無い場合や、形式のバージョンが古く読み込めない場合は
+        story_corpus の共通データを使う（必要ならそこで作り直される）。
+        """
+        try:
+            path = resource_path(CORPUS_RESOURCE)
+            corpus = None
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    data = gzip.decompress(f.read())
+                try:
+                    corpus = CompiledCorpus(data)
+                except ValueError:
+                    corpus = None
+            self.story_elements = corpus if corpus is not None else load_corpus()
+            self.selected_stars = StarBitset(self.story_elements.n_stars)
+        except Exception as e:
+            self.load_error = str(e)
+        finally:
+            self.elements_ready.set()
+    
     def create_widgets(self):
         """UI要素を作成"""
         # メインフレーム
@@ -12785,9 +125,32 @@ class StoryPromptBuilder:
         extract_btn = ttk.Button(main_frame, text="物語要素を抽出", command=self.extract_elements)
         extract_btn.grid(row=2, column=0, columnspan=2, pady=10)
         
+        # 検索セクション
+        search_frame = ttk.LabelFrame(main_frame, text="物語要素を検索", padding="10")
+        search_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        
+        # 検索語（入力するたびに検索する）
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        search_entry.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
+        search_entry.bind("<KeyRelease>", self.search_elements)
+        
+        # 検索結果リスト（ダブルクリックで追加）
+        self.search_listbox = tk.Listbox(search_frame, height=5)
+        self.search_listbox.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 10))
+        self.search_listbox.bind("<Double-Button-1>", self.add_search_result)
+        
+        search_scrollbar = ttk.Scrollbar(search_frame, orient=tk.VERTICAL, command=self.search_listbox.yview)
+        search_scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        self.search_listbox.config(yscrollcommand=search_scrollbar.set)
+        
+        # 追加ボタン
+        add_btn = ttk.Button(search_frame, text="選択した要素を追加", command=self.add_search_result)
+        add_btn.grid(row=2, column=0, pady=(10, 0))
+        
         # 選択された要素セクション
         elements_frame = ttk.LabelFrame(main_frame, text="選択された物語要素", padding="10")
-        elements_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        elements_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         
         # 要素リスト
         self.elements_listbox = tk.Listbox(elements_frame, height=8)
@@ -12804,11 +167,11 @@ class StoryPromptBuilder:
         
         # プロンプト生成ボタン
         generate_btn = ttk.Button(main_frame, text="プロンプトを生成", command=self.generate_prompt)
-        generate_btn.grid(row=4, column=0, columnspan=2, pady=10)
+        generate_btn.grid(row=5, column=0, columnspan=2, pady=10)
         
         # プロンプト表示エリア
         prompt_frame = ttk.LabelFrame(main_frame, text="生成されたプロンプト", padding="10")
-        prompt_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        prompt_frame.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         
         self.prompt_text = scrolledtext.ScrolledText(prompt_frame, height=12, wrap=tk.WORD)
         self.prompt_text.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -12817,37 +180,32 @@ class StoryPromptBuilder:
         copy_btn = ttk.Button(prompt_frame, text="クリップボードにコピー", command=self.copy_to_clipboard)
         copy_btn.grid(row=1, column=0, pady=(10, 0))
         
+        # レシピコード（同じプロンプトを再生成するための短いコード）
+        recipe_frame = ttk.Frame(prompt_frame)
+        recipe_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        ttk.Label(recipe_frame, text="レシピコード:").grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
+        self.recipe_var = tk.StringVar()
+        recipe_entry = ttk.Entry(recipe_frame, textvariable=self.recipe_var)
+        recipe_entry.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        restore_btn = ttk.Button(recipe_frame, text="コードから復元", command=self.restore_recipe)
+        restore_btn.grid(row=0, column=2, padx=(10, 0))
+        recipe_frame.columnconfigure(1, weight=1)
+        
         # グリッドの重み設定
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(0, weight=1)
-        main_frame.rowconfigure(3, weight=1)
-        main_frame.rowconfigure(5, weight=1)
+        main_frame.rowconfigure(4, weight=1)
+        main_frame.rowconfigure(6, weight=1)
+        search_frame.columnconfigure(0, weight=1)
         elements_frame.columnconfigure(0, weight=1)
         elements_frame.rowconfigure(0, weight=1)
         prompt_frame.columnconfigure(0, weight=1)
         prompt_frame.rowconfigure(0, weight=1)
     
-    def generate_katakana_name(self):
+    def generate_katakana_name(self, seed=None):
         """カタカナ2文字の名前を生成"""
-        # 1文字目：拗音、撥音、長音以外
-        first_chars = [
-            'ア', 'イ', 'ウ', 'エ', 'オ',
-            'カ', 'キ', 'ク', 'ケ', 'コ', 'ガ', 'ギ', 'グ', 'ゲ', 'ゴ',
-            'サ', 'シ', 'ス', 'セ', 'ソ', 'ザ', 'ジ', 'ズ', 'ゼ', 'ゾ',
-            'タ', 'チ', 'ツ', 'テ', 'ト', 'ダ', 'ヂ', 'ヅ', 'デ', 'ド',
-            'ナ', 'ニ', 'ヌ', 'ネ', 'ノ',
-            'ハ', 'ヒ', 'フ', 'ヘ', 'ホ', 'バ', 'ビ', 'ブ', 'ベ', 'ボ', 'パ', 'ピ', 'プ', 'ペ', 'ポ',
-            'マ', 'ミ', 'ム', 'メ', 'モ',
-            'ヤ', 'ユ', 'ヨ',
-            'ラ', 'リ', 'ル', 'レ', 'ロ',
-            'ワ', 'ヲ'
-        ]
-        
-        # 2文字目：全てのカタカナ（長音も含む）
-        second_chars = first_chars + ['ャ', 'ュ', 'ョ', 'ン', 'ー']
-        
-        return random.choice(first_chars) + random.choice(second_chars)
+        return generate_katakana_name(seed)
     
     def update_character_fields(self):
         """登場人物の入力フィールドを更新"""
@@ -12866,48 +224,83 @@ class StoryPromptBuilder:
             entry.grid(row=i//3, column=(i%3)*2+1, sticky=tk.W, padx=(0, 20), pady=2)
             self.char_entries.append(var)
     
-    def extract_elements(self):
-        """物語要素を抽出"""
+    def wait_for_elements(self):
+        """物語要素データの読み込みを待ち、使えれば True（読み込めなかった場合はエラーを表示して False）"""
+        if not self.elements_ready.is_set():
+            # 起動直後で展開が終わっていない場合のみ待つ
+            self.root.config(cursor="watch")
+            self.root.update_idletasks()
+            self.elements_ready.wait()
+            self.root.config(cursor="")
+        
         if not self.story_elements:
-            messagebox.showerror("エラー", "story_elements.jsonが読み込まれていません。")
+            message = "物語要素データが読み込まれていません。"
+            if self.load_error:
+                message += f"\n{self.load_error}"
+            messagebox.showerror("エラー", message)
+            return False
+        return True
+    
+    def extract_elements(self, seed=None):
+        """物語要素を抽出（seed は story_corpus.make_rng と同じ）"""
+        if not self.wait_for_elements():
             return
         
         count = self.elements_var.get()
-        self.selected_elements.clear()
-        used_stars = set()
         
-        for _ in range(count):
-            # ランダムにitemを選択
-            item_data = random.choice(self.story_elements)
-            item_name = item_data["item"]
-            
-            # 使用済みでないstarを選択
-            available_stars = [star for star in item_data["stars"] if star not in used_stars]
-            
-            if available_stars:
-                selected_star = random.choice(available_stars)
-                used_stars.add(selected_star)
-                self.selected_elements.append((item_name, selected_star))
+        # 全★から重複なしで抽出（ほぼ重複する★（同じクラスタの★）は1個まで）
+        self.selected_star_ids = sample_stars(self.story_elements.n_stars, count, seed=seed,
+                                              clusters=self.story_elements.star_clusters)
+        self.selected_stars = StarBitset(self.story_elements.n_stars, self.selected_star_ids)
         
         self.update_elements_listbox()
     
     def update_elements_listbox(self):
         """要素リストボックスを更新"""
         self.elements_listbox.delete(0, tk.END)
-        for i, (item, star) in enumerate(self.selected_elements):
+        for i, star_index in enumerate(self.selected_star_ids):
+            item, star = self.story_elements.element(star_index)
             self.elements_listbox.insert(tk.END, f"{i+1}. {item} {star}")
     
+    def search_elements(self, event=None):
+        """検索語に一致する物語要素を検索結果リストに表示"""
+        # 起動直後で展開が終わっていない場合は、入力を妨げないよう何もしない
+        if not self.elements_ready.is_set() or not self.story_elements:
+            return
+        
+        query = self.search_var.get().strip()
+        self.search_results = search_stars(self.story_elements, query, limit=50) if query else []
+        
+        self.search_listbox.delete(0, tk.END)
+        for star_index in self.search_results:
+            item, star = self.story_elements.element(star_index)
+            self.search_listbox.insert(tk.END, f"{item} {star}")
+    
+    def add_search_result(self, event=None):
+        """検索結果で選択した要素を、選択された物語要素に追加"""
+        selection = self.search_listbox.curselection()
+        if not selection or not self.wait_for_elements():
+            return
+        
+        star_index = self.search_results[selection[0]]
+        if star_index not in self.selected_stars:
+            self.selected_star_ids.append(star_index)
+            self.selected_stars.add(star_index)
+            self.update_elements_listbox()
+    
     def delete_selected_element(self):
         """選択された要素を削除"""
         selection = self.elements_listbox.curselection()
         if selection:
             index = selection[0]
-            del self.selected_elements[index]
+            self.selected_stars.discard(self.selected_star_ids.pop(index))
             self.update_elements_listbox()
     
     def generate_prompt(self):
         """プロンプトを生成"""
-        if not self.selected_elements:
+        if not self.wait_for_elements():
+            return
+        if not self.selected_star_ids:
             messagebox.showwarning("警告", "物語要素が選択されていません。")
             return
         
@@ -12918,21 +311,45 @@ class StoryPromptBuilder:
             return
         
         # プロンプトを構築
-        prompt = "# 物語創作指示\n\n"
-        prompt += "## 基本設定\n"
-        prompt += f"- 文字数: 約{self.word_count_var.get()}文字\n"
-        prompt += f"- 登場人物: {', '.join(characters)}\n\n"
+        elements = [self.story_elements.element(j) for j in self.selected_star_ids]
+        prompt = build_desktop_prompt(elements, self.word_count_var.get(), characters)
+        
+        # プロンプト表示エリアに設定
+        self.prompt_text.delete(1.0, tk.END)
+        self.prompt_text.insert(1.0, prompt)
+        
+        # レシピコード（登場人物名が長すぎるなどで格納できない場合は空欄）
+        try:
+            recipe_code = encode_recipe(self.story_elements, "desktop", self.selected_star_ids,
+                                        self.word_count_var.get(), characters=characters)
+        except ValueError:
+            recipe_code = ""
+        self.recipe_var.set(recipe_code)
+    
+    def restore_recipe(self):
+        """レシピコードから物語要素・文字数・登場人物を復元してプロンプトを再生成"""
+        code = self.recipe_var.get().strip()
+        if not code or not self.wait_for_elements():
+            return
+        try:
+            recipe = decode_recipe(code)
+            if recipe["template"] != "desktop":
+                raise ValueError("このレシピコードはデスクトップ版のものではありません")
+            prompt = build_recipe_prompt(self.story_elements, recipe)
+        except ValueError as e:
+            messagebox.showerror("エラー", str(e))
+            return
         
-        prompt += "## 使用する物語要素\n"
-        for i, (item, star) in enumerate(self.selected_elements, 1):
-            prompt += f"{i}. {item} {star}\n"
+        self.selected_star_ids = list(recipe["star_ids"])
+        self.selected_stars = StarBitset(self.story_elements.n_stars, self.selected_star_ids)
+        self.update_elements_listbox()
         
-        prompt += "\n## 指示\n"
-        prompt += "上記の物語要素をすべて含む物語を創作してください。\n"
-        prompt += "各要素は自然に物語に組み込み、指定した文字数で完結する物語にしてください。\n"
-        prompt += "登場人物は指定された名前を使用してください。"
+        self.word_count_var.set(recipe["word_count"])
+        self.char_count_var.set(len(recipe["characters"]))
+        self.update_character_fields()
+        for var, name in zip(self.char_entries, recipe["characters"]):
+            var.set(name)
         
-        # プロンプト表示エリアに設定
         self.prompt_text.delete(1.0, tk.END)
         self.prompt_text.insert(1.0, prompt)
     
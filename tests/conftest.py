@@ -0,0 +1,26 @@
+# conftest.py
+# テスト共通の設定
+#
+# ショートショート版の作品群データベースと生成結果のキャッシュは、モジュールの読み込み時に
+# 環境変数から保存先を決める。テストがユーザーの shortshort/stories.db や .cache を
+# 書き換えないよう、どのモジュールも読み込まれる前に一時ディレクトリへ向けておく。
+
+import os
+import shutil
+import sys
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SHORTSHORT_DIR = os.path.join(REPO_DIR, "shortshort")
+
+TEMP_DIR = tempfile.mkdtemp(prefix="story-prompt-builder-tests-")
+os.environ["SHORTSHORT_DB_PATH"] = os.path.join(TEMP_DIR, "stories.db")
+os.environ["SHORTSHORT_CACHE_DIR"] = os.path.join(TEMP_DIR, "responses")
+
+for path in (REPO_DIR, SHORTSHORT_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(TEMP_DIR, ignore_errors=True)
@@ -0,0 +1,170 @@
+# test_bandit.py
+# 評価による★の重み付き抽出（shortshort/bandit.py）のテスト
+
+from collections import Counter
+
+import pytest
+
+from bandit import RatingBandit
+from story_corpus.compiled import CompiledCorpus, compile_corpus
+from story_store import rating_deltas
+
+# ★0～2 は同じ項目の似た★
+STORY_ELEMENTS = [
+    {"item": "【猫】", "stars": ["★１．猫が人の言葉を話す。", "★２．猫が人の言葉を話して笑う。", "★３．猫が人の言葉を話して歌う。"]},
+    {"item": "【月】", "stars": ["★１．月へ行く。", "★２．月が落ちてくる。"]},
+    {"item": "【扉】", "stars": ["★１．開かない扉。", "★２．どこへでも行ける扉。"]},
+    {"item": "【雪】", "stars": ["★１．夏に雪が降る。"]},
+    {"item": "【鏡】", "stars": ["★１．鏡の中の自分が話しかける。"]},
+]
+CATS = {0, 1, 2}
+N_STARS = 9
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    corpus = CompiledCorpus(compile_corpus(STORY_ELEMENTS))
+    yield corpus
+    corpus.close()
+
+
+def test_weights_start_uniform(corpus):
+    bandit = RatingBandit(corpus)
+    # 事前分布 Beta(1, 1) の平均 0.5 × 項目の平均 0.5
+    assert [bandit.weight(j) for j in range(N_STARS)] == [0.25] * N_STARS
+
+
+def test_posterior_update(corpus):
+    bandit = RatingBandit(corpus)
+    bandit.update([3], *rating_deltas(0, 5))
+    # ★: Beta(2, 1)、項目: Beta(2, 1)
+    assert bandit.weight(3) == pytest.approx(2 / 3 * 2 / 3)
+    # 同じ項目の別の★は項目の平均だけ上がる
+    assert bandit.weight(4) == pytest.approx(1 / 2 * 2 / 3)
+    assert bandit.weight(5) == 0.25
+
+    bandit.update([3, 5], *rating_deltas(0, 1))
+    assert bandit.weight(3) == pytest.approx(2 / 4 * 2 / 4)
+    assert bandit.weight(5) == pytest.approx(1 / 3 * 1 / 3)
+
+
+def test_rating_change_is_reversible(corpus):
+    bandit = RatingBandit(corpus)
+    bandit.update([0, 3], *rating_deltas(0, 4))
+    bandit.update([0, 3], *rating_deltas(4, 2))
+    bandit.update([0, 3], *rating_deltas(2, 0))
+    assert [bandit.weight(j) for j in range(N_STARS)] == pytest.approx([0.25] * N_STARS)
+    assert bandit._tree.total == pytest.approx(0.25 * N_STARS)
+
+
+def test_counters_match_incremental_updates(corpus):
+    # 保存済みの累計から作った場合と、評価を1件ずつ反映した場合が同じ
+    updated = RatingBandit(corpus)
+    updated.update([0, 6], 1.0, 0.0)
+    updated.update([6, 7], 0.25, 0.75)
+    loaded = RatingBandit(corpus, counters={0: (1.0, 0.0), 6: (1.25, 0.75), 7: (0.25, 0.75), 99: (5.0, 0.0)})
+    assert [loaded.weight(j) for j in range(N_STARS)] == pytest.approx([updated.weight(j) for j in range(N_STARS)])
+
+
+def test_update_ignores_unknown_stars(corpus):
+    bandit = RatingBandit(corpus)
+    bandit.update([-1, N_STARS, 1000], 1.0, 0.0)
+    assert [bandit.weight(j) for j in range(N_STARS)] == [0.25] * N_STARS
+
+
+@pytest.mark.parametrize("exploration", [-0.1, 1.5])
+def test_rejects_invalid_exploration(corpus, exploration):
+    with pytest.raises(ValueError):
+        RatingBandit(corpus, exploration=exploration)
+
+
+def first_pick_shares(draw, trials=6000):
+    counts = Counter(draw(seed)[0] for seed in range(trials))
+    return [counts[j] / trials for j in range(N_STARS)]
+
+
+def test_sampling_follows_weights(corpus):
+    bandit = RatingBandit(corpus, exploration=0.0)
+    bandit.update([5], 30.0, 0.0)
+    bandit.update([7], 0.0, 30.0)
+    weights = [bandit.weight(j) for j in range(N_STARS)]
+    shares = first_pick_shares(lambda seed: bandit.sample(1, seed=seed))
+    for share, weight in zip(shares, weights):
+        assert share == pytest.approx(weight / sum(weights), abs=0.025)
+
+
+def test_exploration_one_is_uniform(corpus):
+    bandit = RatingBandit(corpus)
+    bandit.update([5], 30.0, 0.0)
+    shares = first_pick_shares(lambda seed: bandit.sample(1, exploration=1.0, seed=seed))
+    assert shares == pytest.approx([1 / N_STARS] * N_STARS, abs=0.025)
+
+
+def test_sample_excludes_and_restores_weights(corpus):
+    bandit = RatingBandit(corpus, exploration=0.0)
+    bandit.update([0, 1], 10.0, 0.0)
+    weights = [bandit.weight(j) for j in range(N_STARS)]
+    for seed in range(50):
+        picks = bandit.sample(4, exclude=[0, 8], seed=seed)
+        assert len(set(picks)) == 4
+        assert not {0, 8} & set(picks)
+    assert [bandit.weight(j) for j in range(N_STARS)] == weights
+
+
+def test_sample_batch(corpus):
+    bandit = RatingBandit(corpus, exploration=0.2)
+    bandit.update([3], 5.0, 0.0)
+    rows = bandit.sample_batch(20, 4, seed=7)
+    assert rows == bandit.sample_batch(20, 4, seed=7)
+    assert all(len(set(row)) == 4 for row in rows)
+    clustered = bandit.sample_batch(20, 4, seed=7, clusters=corpus.star_clusters)
+    assert all(len({corpus.star_cluster(j) for j in row}) == len(row) for row in clustered)
+
+
+@pytest.fixture(scope="module")
+def cat_bandit(corpus):
+    """猫の★（似た★3個）の評価が高い bandit"""
+    pytest.importorskip("numpy")
+    bandit = RatingBandit(corpus, exploration=0.0)
+    bandit.update(sorted(CATS), 20.0, 0.0)
+    return bandit
+
+
+def cat_shares(corpus, bandit, diversity, exploration, trials=400):
+    """(1個目が猫の★の割合, 2個目も猫の★の割合)"""
+    first = second = 0
+    for seed in range(trials):
+        picks = bandit.sample_diverse(corpus.star_vectors, 2, diversity, exploration=exploration, seed=seed)
+        first += picks[0] in CATS
+        second += picks[0] in CATS and picks[1] in CATS
+    return first / trials, second / trials
+
+
+def test_diversity_zero_follows_the_bandit(corpus, cat_bandit):
+    # 一様なら猫の★は 1/3、2個とも猫の★は 1/12
+    first, second = cat_shares(corpus, cat_bandit, 0.0, 0.0)
+    assert first > 0.55
+    assert second > 0.2
+
+
+def test_diversity_slider_avoids_similar_high_weight_stars(corpus, cat_bandit):
+    # 評価の高い★を選んだ後は、似た★を避ける（重みより多様性が優先される）
+    first, second = cat_shares(corpus, cat_bandit, 0.9, 0.0)
+    assert first > 0.55
+    assert second < 0.05
+
+
+def test_exploration_with_diversity_ignores_weights(corpus, cat_bandit):
+    first, _ = cat_shares(corpus, cat_bandit, 0.5, 1.0)
+    assert first == pytest.approx(len(CATS) / N_STARS, abs=0.08)
+
+
+def test_sample_diverse_respects_exclusions_and_keeps_weights(corpus, cat_bandit):
+    weights = [cat_bandit.weight(j) for j in range(N_STARS)]
+    for seed in range(30):
+        picks = cat_bandit.sample_diverse(corpus.star_vectors, 3, 0.5, exclude=[0], seed=seed,
+                                          clusters=corpus.star_clusters)
+        assert 0 not in picks
+        assert len({corpus.star_cluster(j) for j in picks}) == 3
+        assert corpus.star_cluster(0) not in {corpus.star_cluster(j) for j in picks}
+    assert [cat_bandit.weight(j) for j in range(N_STARS)] == weights
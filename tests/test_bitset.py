@@ -0,0 +1,94 @@
+# test_bitset.py
+# ★番号の集合（story_corpus/bitset.py）のテスト
+
+import random
+
+import pytest
+
+from story_corpus import StarBitset, sample_stars
+
+
+@pytest.mark.parametrize("n_stars", [0, 1, 7, 8, 9, 64, 7054])
+def test_size(n_stars):
+    stars = StarBitset(n_stars)
+    assert len(stars._bits) == (n_stars + 7) // 8
+    assert len(stars) == 0
+    assert list(stars) == []
+
+
+def test_add_contains_and_len():
+    stars = StarBitset(20, [3, 8, 3])
+    stars.add(19)
+    stars.add(8)
+    assert len(stars) == 3
+    assert [j in stars for j in (3, 8, 19)] == [True, True, True]
+    assert [j in stars for j in (0, 7, 9, 18)] == [False] * 4
+    # 範囲外は含まれない（例外にしない）
+    assert -1 not in stars
+    assert 20 not in stars
+
+
+@pytest.mark.parametrize("star_id", [-1, 20, 1000])
+def test_add_rejects_out_of_range(star_id):
+    stars = StarBitset(20)
+    with pytest.raises(ValueError, match="範囲外"):
+        stars.add(star_id)
+    assert len(stars) == 0
+
+
+def test_discard_and_clear():
+    stars = StarBitset(20, [0, 7, 8, 15])
+    stars.discard(7)
+    stars.discard(7)
+    stars.discard(9)
+    stars.discard(-5)
+    assert list(stars) == [0, 8, 15]
+    assert len(stars) == 3
+    stars.clear()
+    assert len(stars) == 0
+    assert list(stars) == []
+    stars.add(15)
+    assert list(stars) == [15]
+
+
+def test_iterates_in_ascending_order():
+    rng = random.Random(0)
+    star_ids = rng.sample(range(7054), 300)
+    stars = StarBitset(7054, star_ids)
+    assert list(stars) == sorted(star_ids)
+    assert len(stars) == 300
+
+
+def test_last_bit_of_partial_byte():
+    stars = StarBitset(13, [12, 0])
+    assert list(stars) == [0, 12]
+    stars.discard(12)
+    assert list(stars) == [0]
+
+
+def test_behaves_like_a_set():
+    rng = random.Random(1)
+    stars = StarBitset(100)
+    expected = set()
+    for _ in range(2000):
+        star_id = rng.randrange(100)
+        if rng.random() < 0.6:
+            stars.add(star_id)
+            expected.add(star_id)
+        else:
+            stars.discard(star_id)
+            expected.discard(star_id)
+        assert len(stars) == len(expected)
+    assert list(stars) == sorted(expected)
+
+
+def test_repr():
+    assert repr(StarBitset(10, [4, 1])) == "StarBitset(10, [1, 4])"
+
+
+def test_used_stars_as_sampler_exclusions():
+    # 使用済みの★として sample_stars の exclude にそのまま渡せる（list と同じ結果）
+    used = [2, 5, 11, 40]
+    stars = StarBitset(50, used)
+    for seed in range(20):
+        assert sample_stars(50, 10, stars, seed=seed) == sample_stars(50, 10, used, seed=seed)
@@ -0,0 +1,125 @@
+# test_compiled.py
+# 物語要素バイナリ（story_corpus/compiled.py）の読み込みと作り直しのテスト
+
+import json
+import mmap
+import os
+
+import pytest
+
+from story_corpus import compiled
+from story_corpus.compiled import (
+    FORMAT_VERSION,
+    CompiledCorpus,
+    compile_corpus,
+    load_compiled,
+    open_compiled,
+    write_compiled,
+)
+
+STORY_ELEMENTS = [
+    {"item": "【猫】", "stars": ["★１．猫が話す。", "★２ａ．猫が人間に化ける。"]},
+    {"item": "【月】", "stars": ["★１．月へ行く。"]},
+]
+
+
+def with_version(data, version):
+    """ヘッダーの形式バージョンだけを書き換えたバイナリ"""
+    return data[:8] + version.to_bytes(4, "little") + data[12:]
+
+
+def with_section(data, name, value):
+    """名前が name のセクションの中身を value（同じ長さ）で置き換えたバイナリ"""
+    data = bytearray(data)
+    n_sections = compiled._HEADER.unpack_from(data, 0)[4]
+    for i in range(n_sections):
+        section_name, offset, length = compiled._SECTION.unpack_from(data, compiled._HEADER.size + compiled._SECTION.size * i)
+        if section_name.rstrip(b"\x00") == name:
+            assert len(value) == length
+            data[offset:offset + length] = value
+            return bytes(data)
+    raise KeyError(name)
+
+
+@pytest.fixture
+def corpus_files(tmp_path):
+    json_path = tmp_path / "story_elements.json"
+    json_path.write_text(json.dumps(STORY_ELEMENTS, ensure_ascii=False), encoding="utf-8")
+    return json_path, tmp_path / "story_elements.bin"
+
+
+@pytest.fixture
+def opened_mmaps(monkeypatch):
+    """open_compiled が作った mmap をすべて記録する"""
+    created = []
+    original = mmap.mmap
+
+    def recording_mmap(*args, **kwargs):
+        mapped = original(*args, **kwargs)
+        created.append(mapped)
+        return mapped
+
+    monkeypatch.setattr(compiled.mmap, "mmap", recording_mmap)
+    return created
+
+
+def test_round_trip(corpus_files):
+    _, compiled_path = corpus_files
+    write_compiled(STORY_ELEMENTS, compiled_path)
+    corpus = open_compiled(compiled_path)
+    try:
+        assert corpus.to_list() == STORY_ELEMENTS
+        assert corpus.find_star("猫", 2, "a") == 1
+    finally:
+        corpus.close()
+
+
+@pytest.mark.parametrize("make_stale", [
+    lambda data: with_version(data, FORMAT_VERSION - 1),
+    lambda data: with_section(data, b"themes", bytes(len(compiled.THEMES_HASH))),
+    lambda data: with_section(data, b"clhash", bytes(len(compiled.CLUSTERS_HASH))),
+])
+def test_open_compiled_closes_mmap_on_stale_file(corpus_files, opened_mmaps, make_stale):
+    _, compiled_path = corpus_files
+    compiled_path.write_bytes(make_stale(compile_corpus(STORY_ELEMENTS)))
+    with pytest.raises(ValueError):
+        open_compiled(compiled_path)
+    assert len(opened_mmaps) == 1
+    assert opened_mmaps[0].closed
+
+
+def test_failed_in_memory_corpus_releases_views():
+    data = bytearray(with_version(compile_corpus(STORY_ELEMENTS), FORMAT_VERSION + 1))
+    with pytest.raises(ValueError):
+        CompiledCorpus(data)
+    # ビューが残っていると bytearray の大きさを変えられない
+    data.extend(b"\x00")
+
+
+def test_load_compiled_rewrites_stale_file(corpus_files, opened_mmaps):
+    json_path, compiled_path = corpus_files
+    compiled_path.write_bytes(with_version(compile_corpus(STORY_ELEMENTS), FORMAT_VERSION - 1))
+    # バイナリの方が新しくても、形式が古ければ作り直す
+    os.utime(compiled_path, (os.path.getmtime(json_path) + 10,) * 2)
+
+    corpus = load_compiled(json_path, compiled_path)
+    try:
+        assert corpus.to_list() == STORY_ELEMENTS
+        # 作り直したファイルを mmap で使っている（メモリ上のコンパイル結果ではない）
+        assert corpus._mmap is not None
+        assert compiled_path.read_bytes() == compile_corpus(STORY_ELEMENTS)
+        assert [m.closed for m in opened_mmaps] == [True, False]
+    finally:
+        corpus.close()
+    assert not list(compiled_path.parent.glob("*.tmp*"))
+
+
+def test_load_compiled_recompiles_when_json_is_newer(corpus_files):
+    json_path, compiled_path = corpus_files
+    write_compiled([{"item": "【古】", "stars": ["★１．古いデータ。"]}], compiled_path)
+    os.utime(json_path, (os.path.getmtime(compiled_path) + 10,) * 2)
+    corpus = load_compiled(json_path, compiled_path)
+    try:
+        assert corpus.to_list() == STORY_ELEMENTS
+    finally:
+        corpus.close()
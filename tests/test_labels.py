@@ -0,0 +1,109 @@
+# test_labels.py
+# ★テキスト先頭の番号（story_corpus/labels.py）の解析とラベル符号のテスト
+
+import pytest
+
+from story_corpus.compiled import CompiledCorpus, compile_corpus
+from story_corpus.labels import (
+    RAW_LABEL,
+    decode_label,
+    encode_label,
+    format_label,
+    parse_star_reference,
+    split_star,
+    strip_label,
+)
+
+
+@pytest.mark.parametrize("number, letter, code", [
+    (1, "", 0x100),
+    (6, "a", 0x601),
+    (12, "b", 0xC02),
+    (3, "z", 0x31A),
+    ((1 << 23) - 1, "z", 0x7FFFFF1A),
+])
+def test_encode_and_decode(number, letter, code):
+    assert encode_label(number, letter) == code
+    assert decode_label(code) == (number, letter)
+    assert decode_label(code | RAW_LABEL) == (number, letter)
+    # 符号は u32 に収まる
+    assert 0 <= code | RAW_LABEL < 1 << 32
+
+
+def test_no_label():
+    assert decode_label(0) is None
+    assert split_star("猫が話す。") == (0, "猫が話す。")
+    assert strip_label("猫が話す。") == "猫が話す。"
+
+
+@pytest.mark.parametrize("star, code, body", [
+    ("★１．猫が話す。", 0x100, "猫が話す。"),
+    ("★６ａ．猫が化ける。", 0x601, "猫が化ける。"),
+    ("★６ａ．", 0x601, ""),
+    ("★１２ｂ．月へ行く。", 0xC02, "月へ行く。"),
+    ("★１０ｚ．扉。", 0xA1A, "扉。"),
+])
+def test_fullwidth_labels(star, code, body):
+    assert split_star(star) == (code, body)
+    assert format_label(code) + body == star
+    assert strip_label(star) == body
+
+
+@pytest.mark.parametrize("star, number, letter", [
+    # 半角の数字・枝番・ピリオド
+    ("★6a.猫が化ける。", 6, "a"),
+    ("★１.猫が話す。", 1, ""),
+    ("★6．猫が話す。", 6, ""),
+    # 先頭に0がある数字
+    ("★０６ａ．猫が化ける。", 6, "a"),
+])
+def test_labels_that_do_not_round_trip_keep_the_text(star, number, letter):
+    code, body = split_star(star)
+    assert code & RAW_LABEL
+    assert body == star
+    assert decode_label(code) == (number, letter)
+
+
+@pytest.mark.parametrize("star", [
+    "★Ａ．大文字の枝番。",
+    "★６Ａ．大文字の枝番。",
+    "★６ａ猫（ピリオドがない）。",
+    "★．数字がない。",
+    "☆１．別の記号。",
+    " ★１．先頭に空白。",
+])
+def test_not_a_label(star):
+    assert split_star(star) == (0, star)
+    assert strip_label(star) == star
+
+
+def test_compiled_corpus_restores_labels():
+    story_elements = [
+        {"item": "【猫】", "stars": ["★１．猫が話す。", "★６ａ．猫が化ける。", "★6b.半角の番号。", "番号なし。"]},
+    ]
+    corpus = CompiledCorpus(compile_corpus(story_elements))
+    try:
+        assert corpus.to_list() == story_elements
+        assert corpus.find_star("猫", 6, "a") == 1
+        assert corpus.find_star("猫", 6, "b") == 2
+        assert corpus.find_star("猫", 6, "c") is None
+        assert corpus.find_star_reference("【猫】★６ａ．") == 1
+    finally:
+        corpus.close()
+
+
+@pytest.mark.parametrize("text, key", [
+    ("【猫】★２．", ("猫", 2, "")),
+    ("【猫】★６ａ．", ("猫", 6, "a")),
+    ("猫 ★6b", ("猫", 6, "b")),
+    ("猫★6B.", ("猫", 6, "b")),
+    ("  【ネコ科の動物】 ★ １２ ｃ ． ", ("ネコ科の動物", 12, "c")),
+    ("ｶﾀｶﾅ★1", ("カタカナ", 1, "")),
+])
+def test_parse_star_reference(text, key):
+    assert parse_star_reference(text) == key
+
+
+@pytest.mark.parametrize("text", ["猫", "★２．", "猫 ★", "猫 ★ab", "猫が話す。", "【猫】★２．猫が話す。"])
+def test_not_a_reference(text):
+    assert parse_star_reference(text) is None
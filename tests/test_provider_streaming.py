@@ -0,0 +1,225 @@
+# test_provider_streaming.py
+# ストリーミング受信（providers.py の iter_sse_events・Provider.stream）のテスト
+#
+# ローカルに Server-Sent Events を返すスタブサーバーを立て、送るバイト列を
+# チャンク単位で指定する（行・UTF-8の文字の途中で分けたり、途中で接続を切ったりできる）。
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+import providers
+from providers import ProviderError, iter_response_lines, iter_sse_events
+
+
+class ScriptedHandler(BaseHTTPRequestHandler):
+    """パスの先頭（/<名前>/...）で scripts に登録した応答を返すスタブ
+
+    scripts[名前] = (チャンクの並び, 終わり方)
+      "complete" … チャンク転送で最後まで送る
+      "drop"     … チャンク転送の途中（終端のチャンクの前）で接続を切る
+      "close"    … Content-Length もチャンク転送も使わずに送り、接続を閉じて終える
+    """
+
+    protocol_version = "HTTP/1.1"
+    scripts = {}
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        chunks, ending = self.scripts[self.path.split("/")[1]]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        if ending == "close":
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        else:
+            self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in chunks:
+            data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            if ending == "close":
+                self.wfile.write(data)
+            else:
+                self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+        if ending == "complete":
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ScriptedHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_sessions():
+    yield
+    ScriptedHandler.scripts.clear()
+    providers.close_sessions()
+
+
+def stream_from(server, api_type, chunks, ending="complete"):
+    """chunks を返すスタブに対して stream() を呼び、受け取った断片のリストを返す"""
+    name = f"{api_type}-{len(ScriptedHandler.scripts)}"
+    ScriptedHandler.scripts[name] = (chunks, ending)
+    provider = type(providers.PROVIDERS[api_type])(endpoint=f"{server}/{name}")
+    received = []
+    try:
+        for text in provider.stream("dummy", "プロンプト", timeout=5):
+            received.append(text)
+    except ProviderError as e:
+        e.received = received
+        raise
+    return received
+
+
+def chat_event(text):
+    payload = {"choices": [{"index": 0, "delta": {"content": text}}]}
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+def claude_event(text):
+    payload = {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": text}}
+    return f"event: content_block_delta\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+CLAUDE_START = 'event: message_start\ndata: {"type": "message_start"}\n\n'
+CLAUDE_STOP = 'event: message_stop\ndata: {"type": "message_stop"}\n\n'
+
+
+class FakeResponse:
+    """iter_content だけを持つレスポンス（iter_sse_events の単体テスト用）"""
+
+    def __init__(self, *chunks):
+        self.chunks = [c.encode("utf-8") if isinstance(c, str) else c for c in chunks]
+
+    def iter_content(self, chunk_size=None):
+        return iter(self.chunks)
+
+
+def test_iter_sse_events_joins_multiline_data_and_skips_comments():
+    text = ": keep-alive\n\nevent: note\ndata: first\ndata:second\n\ndata: last"
+    assert list(iter_sse_events(FakeResponse(text))) == [("note", "first\nsecond"), (None, "last")]
+
+
+@pytest.mark.parametrize("chunks", [
+    ["data: a\r", "\ndata: b\r", "\n\r", "\n"],
+    ["data: a\r", "", "\ndata: b\r\n", "\r", "\n"],
+    ["data: a\r\ndata: b\r\n\r\n"],
+    ["data: a\rdata: b\r\r"],
+    ["data: a\ndata: b\n\n"],
+])
+def test_crlf_split_across_chunks_is_one_line_break(chunks):
+    assert list(iter_sse_events(FakeResponse(*chunks))) == [(None, "a\nb")]
+
+
+def test_iter_response_lines_keeps_utf8_split_across_chunks():
+    encoded = "物語\r\n要素".encode("utf-8")
+    chunks = [encoded[:2], encoded[2:7], encoded[7:9], encoded[9:]]
+    assert list(iter_response_lines(FakeResponse(*chunks))) == ["物語".encode("utf-8"), "要素".encode("utf-8")]
+
+
+def test_data_line_split_across_chunks(server):
+    encoded = (chat_event("扉の前で") + chat_event("つぶやいた😀") + "data: [DONE]\n\n").encode("utf-8")
+    # "data:" の途中・JSON の途中・UTF-8の文字の途中で区切る
+    cut_points = [3, 20, encoded.index("前".encode("utf-8")) + 1, encoded.index("😀".encode("utf-8")) + 2]
+    chunks = [encoded[start:end] for start, end in zip([0] + cut_points, cut_points + [len(encoded)])]
+    assert stream_from(server, "openai", chunks) == ["扉の前で", "つぶやいた😀"]
+
+
+def test_multiline_event(server):
+    payload = json.dumps({"choices": [{"delta": {"content": "二行の\nイベント"}}]}, ensure_ascii=False, indent=1)
+    event = "".join(f"data: {line}\n" for line in payload.splitlines()) + "\n"
+    assert stream_from(server, "grok", [event, "data: [DONE]\n\n"]) == ["二行の\nイベント"]
+
+
+def test_done_ends_stream(server):
+    # [DONE] の後に届いたものは解析しない
+    chunks = [chat_event("本文"), "data: [DONE]\n\n", "data: {not json\n\n"]
+    assert stream_from(server, "openai", chunks) == ["本文"]
+
+
+def test_comment_and_keep_alive_lines(server):
+    chunks = [CLAUDE_START, ": ping\n\n", claude_event("『合言葉』"), ":\n", "event: ping\ndata: {\"type\": \"ping\"}\n\n",
+              claude_event("開け"), CLAUDE_STOP]
+    assert stream_from(server, "claude", chunks) == ["『合言葉』", "開け"]
+
+
+def test_gemini_crlf_events_end_with_finish_reason(server):
+    first = {"candidates": [{"content": {"parts": [{"text": "最初"}], "role": "model"}}]}
+    last = {"candidates": [{"content": {"parts": [{"text": "最後"}], "role": "model"}, "finishReason": "STOP"}]}
+    chunks = [f"data: {json.dumps(first, ensure_ascii=False)}\r\n\r\n", f"data: {json.dumps(last, ensure_ascii=False)}\r\n\r\n"]
+    assert stream_from(server, "gemini", chunks) == ["最初", "最後"]
+
+
+def test_crlf_split_across_chunks(server):
+    # 複数行のデータの途中で CR と LF が別のチャンクに分かれても、イベントは途中で区切られない
+    payload = json.dumps({"choices": [{"delta": {"content": "改行を\nまたぐ"}}]}, ensure_ascii=False, indent=1)
+    text = "".join(f"data: {line}\r\n" for line in payload.splitlines()) + "\r\n" + "data: [DONE]\r\n\r\n"
+    chunks = text.split("\n")
+    chunks = [chunk if i == 0 else "\n" + chunk for i, chunk in enumerate(chunks)]
+    assert all(chunk.endswith("\r") for chunk in chunks[:-1])
+    assert stream_from(server, "openai", chunks) == ["改行を\nまたぐ"]
+
+
+def test_events_after_end_event(server):
+    # 終わりのイベントの後に ping などが届いても、最後まで受信できたものとして扱う
+    chunks = [CLAUDE_START, claude_event("本文"), CLAUDE_STOP, 'event: ping\ndata: {"type": "ping"}\n\n']
+    assert stream_from(server, "claude", chunks, ending="close") == ["本文"]
+
+
+def test_error_event_mid_stream(server):
+    error = {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}}
+    chunks = [CLAUDE_START, claude_event("途中まで"), f"event: error\ndata: {json.dumps(error)}\n\n",
+              claude_event("届かない"), CLAUDE_STOP]
+    with pytest.raises(ProviderError, match="Overloaded") as excinfo:
+        stream_from(server, "claude", chunks)
+    assert excinfo.value.received == ["途中まで"]
+    assert excinfo.value.retryable
+
+
+def test_error_object_mid_stream_is_not_retryable(server):
+    chunks = [chat_event("途中まで"), 'data: {"error": {"message": "invalid request"}}\n\n', "data: [DONE]\n\n"]
+    with pytest.raises(ProviderError, match="invalid request") as excinfo:
+        stream_from(server, "openai", chunks)
+    assert excinfo.value.received == ["途中まで"]
+    assert not excinfo.value.retryable
+
+
+def test_unparsable_event(server):
+    with pytest.raises(ProviderError, match="応答を解析できません") as excinfo:
+        stream_from(server, "openai", [chat_event("本文"), "data: {not json\n\n"])
+    assert excinfo.value.received == ["本文"]
+
+
+def test_connection_dropped_mid_chunked_stream(server):
+    chunks = [CLAUDE_START, claude_event("途中まで"), claude_event("で切れる")]
+    with pytest.raises(ProviderError) as excinfo:
+        stream_from(server, "claude", chunks, ending="drop")
+    assert excinfo.value.received == ["途中まで", "で切れる"]
+    assert excinfo.value.retryable
+
+
+@pytest.mark.parametrize("api_type, chunks", [
+    ("claude", [CLAUDE_START, claude_event("途中まで")]),
+    ("openai", [chat_event("途中まで")]),
+    ("gemini", ['data: {"candidates": [{"content": {"parts": [{"text": "途中まで"}]}}]}\r\n\r\n']),
+])
+def test_connection_closed_before_end_event(server, api_type, chunks):
+    # 接続は正常に閉じても、終わりのイベントが届いていなければ途中で切れたものとして扱う
+    with pytest.raises(ProviderError, match="途中で接続が切れました") as excinfo:
+        stream_from(server, api_type, chunks, ending="close")
+    assert excinfo.value.received == ["途中まで"]
+    assert excinfo.value.retryable
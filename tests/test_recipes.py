@@ -0,0 +1,148 @@
+# test_recipes.py
+# レシピコード（story_corpus/recipes.py）と各アプリの「レシピコードから復元」のテスト
+
+import base64
+import os
+
+import pytest
+
+from conftest import REPO_DIR
+from story_corpus import (
+    build_desktop_prompt,
+    build_recipe_prompt,
+    build_shortshort_prompt,
+    build_web_prompt,
+    decode_recipe,
+    encode_recipe,
+    load_corpus,
+)
+from story_corpus.prompts import PROMPT_TEXTS
+
+STAR_IDS = [5, 77, 1024, 6999, 0]
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return load_corpus()
+
+
+def elements(corpus, star_ids=STAR_IDS):
+    return [corpus.element(j) for j in star_ids]
+
+
+def test_shortshort_round_trip(corpus):
+    code = encode_recipe(corpus, "shortshort", STAR_IDS, 1500)
+    assert decode_recipe(code) == {
+        "template": "shortshort", "corpus_hash": corpus.content_hash[:8], "word_count": 1500, "star_ids": STAR_IDS,
+    }
+    assert build_recipe_prompt(corpus, code) == build_shortshort_prompt(elements(corpus), 1500)
+    # ★5個で約30文字
+    assert len(code) <= 32
+
+
+def test_web_round_trip(corpus):
+    code = encode_recipe(corpus, "web", STAR_IDS[:2], 800, lang="en", genre="genre_sf", ending="ending_bitter")
+    recipe = decode_recipe(code)
+    assert (recipe["lang"], recipe["genre"], recipe["ending"]) == ("en", "genre_sf", "ending_bitter")
+    texts = PROMPT_TEXTS["en"]
+    expected = build_web_prompt(elements(corpus, STAR_IDS[:2]), 800, texts["genre_sf"], texts["ending_bitter"], "en")
+    assert build_recipe_prompt(corpus, recipe) == expected
+
+
+@pytest.mark.parametrize("characters", [["タロ", "ハナ"], ["アリス", "Bob", "ケン"], []])
+def test_desktop_round_trip(corpus, characters):
+    code = encode_recipe(corpus, "desktop", STAR_IDS[:3], 1000, characters=characters)
+    assert decode_recipe(code)["characters"] == characters
+    assert build_recipe_prompt(corpus, code) == build_desktop_prompt(elements(corpus, STAR_IDS[:3]), 1000, characters)
+
+
+def test_code_is_case_and_separator_insensitive(corpus):
+    code = encode_recipe(corpus, "shortshort", STAR_IDS, 1200)
+    spaced = " ".join(code[i:i + 4] for i in range(0, len(code), 4))
+    assert decode_recipe(code.lower()) == decode_recipe(spaced) == decode_recipe("-".join(code)) == decode_recipe(code)
+
+
+def test_empty_star_list(corpus):
+    code = encode_recipe(corpus, "shortshort", [], 1200)
+    assert decode_recipe(code)["star_ids"] == []
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(template="poem", star_ids=[1], word_count=800),
+    dict(template="shortshort", star_ids=[1], word_count=1 << 16),
+    dict(template="shortshort", star_ids=[1], word_count=-1),
+    dict(template="shortshort", star_ids=list(range(256)), word_count=800),
+    dict(template="desktop", star_ids=[1], word_count=800, characters=["タロ"] * 16),
+    dict(template="desktop", star_ids=[1], word_count=800, characters=["長" * 100]),
+])
+def test_encode_rejects_values_that_do_not_fit(corpus, kwargs):
+    with pytest.raises(ValueError):
+        encode_recipe(corpus, **kwargs)
+
+
+def _flip_character(code, index):
+    replacement = "A" if code[index] != "A" else "B"
+    return code[:index] + replacement + code[index + 1:]
+
+
+def test_every_single_character_typo_is_rejected(corpus):
+    code = encode_recipe(corpus, "web", STAR_IDS, 800, genre="genre_mystery")
+    for index in range(len(code)):
+        with pytest.raises(ValueError):
+            decode_recipe(_flip_character(code, index))
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda code: code[:10],
+    lambda code: "",
+    lambda code: code[:-2] + "01",
+    lambda code: code + "@",
+])
+def test_corrupt_codes_are_rejected(corpus, corrupt):
+    with pytest.raises(ValueError):
+        decode_recipe(corrupt(encode_recipe(corpus, "shortshort", STAR_IDS, 1200)))
+
+
+def test_unknown_version_is_rejected():
+    data = bytes([0xF0]) + bytes(20)
+    with pytest.raises(ValueError, match="版"):
+        decode_recipe(base64.b32encode(data).decode("ascii"))
+
+
+class OtherCorpus:
+    """内容ハッシュと★数だけが違う物語要素データ"""
+
+    def __init__(self, corpus, content_hash=None, n_stars=None):
+        self.content_hash = content_hash or corpus.content_hash
+        self.n_stars = corpus.n_stars if n_stars is None else n_stars
+        self.element = corpus.element
+
+
+def test_other_corpus_is_rejected(corpus):
+    code = encode_recipe(OtherCorpus(corpus, content_hash="0" * 64), "shortshort", STAR_IDS, 1200)
+    with pytest.raises(ValueError, match="物語要素データが異なる"):
+        build_recipe_prompt(corpus, code)
+
+
+def test_star_id_out_of_range_is_rejected(corpus):
+    code = encode_recipe(OtherCorpus(corpus, n_stars=1 << 20), "shortshort", [corpus.n_stars], 1200)
+    with pytest.raises(ValueError, match="範囲外"):
+        build_recipe_prompt(corpus, code)
+
+
+@pytest.mark.parametrize("app, template, word_count", [
+    ("shortshort/app.py", "shortshort", 65535),
+    ("shortshort/app.py", "shortshort", 100),
+    ("web/app.py", "web", 65535),
+    ("web/app.py", "web", 0),
+])
+def test_app_rejects_word_count_outside_input_range(corpus, app, template, word_count):
+    AppTest = pytest.importorskip("streamlit.testing.v1").AppTest
+    at = AppTest.from_file(os.path.join(REPO_DIR, app), default_timeout=60)
+    at.run()
+    before = at.session_state.word_count_input
+    at.text_input(key="recipe_input").input(encode_recipe(corpus, template, STAR_IDS[:2], word_count)).run()
+    [button for button in at.button if button.label in ("復元", "Restore")][0].click().run()
+    assert not at.exception
+    assert any(str(word_count) in error.value for error in at.error)
+    assert at.session_state.word_count_input == before
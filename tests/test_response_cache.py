@@ -0,0 +1,199 @@
+# test_response_cache.py
+# 生成結果のキャッシュ（shortshort/response_cache.py）のテスト
+
+import json
+import os
+
+import pytest
+
+import response_cache
+from response_cache import ResponseCache, cache_key
+
+PARAMS = {"temperature": 0.9, "max_tokens": 3000}
+
+
+class Clock:
+    """response_cache の time.time を置き換える時計"""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(response_cache.time, "time", clock.time)
+    return clock
+
+
+def make_cache(tmp_path, **kwargs):
+    kwargs.setdefault("mode", "on")
+    return ResponseCache(str(tmp_path / "responses"), **kwargs)
+
+
+def entry_size(tmp_path, story="物語"):
+    """story を1件保存したときのファイルサイズ"""
+    cache = make_cache(tmp_path / "size")
+    cache.put("k", story)
+    return cache._entries["k"]
+
+
+def test_key_is_stable():
+    # 同じ条件なら、実行ごと・パラメーターの順序によらず同じキー
+    key = cache_key("claude", "claude-model", PARAMS, "プロンプト")
+    assert key == cache_key("claude", "claude-model", dict(reversed(list(PARAMS.items()))), "プロンプト")
+    # キーの作り方を変えると保存済みの結果が使えなくなるので、値を固定しておく
+    assert key == "1055fc6aa70b810d15a2780d2c6c88704acf21709f5018b8c62ccb50ce0aba4a"
+
+
+@pytest.mark.parametrize("change", [
+    dict(api_type="openai"),
+    dict(model="claude-other"),
+    dict(params={"temperature": 0.7, "max_tokens": 3000}),
+    dict(params={"temperature": 0.9, "max_tokens": 2000}),
+    dict(params={"temperature": 0.9, "max_tokens": 3000, "top_p": 0.5}),
+    dict(params={"temperature": None, "max_tokens": 3000}),
+    dict(prompt="プロンプト "),
+])
+def test_key_changes_with_every_parameter(change):
+    arguments = dict(api_type="claude", model="claude-model", params=PARAMS, prompt="プロンプト")
+    assert cache_key(**arguments) != cache_key(**{**arguments, **change})
+
+
+def test_key_follows_provider_generation_params():
+    pytest.importorskip("requests")
+    from providers import ClaudeProvider
+
+    provider = ClaudeProvider()
+    key = cache_key("claude", provider.model, provider.generation_params(), "p")
+    assert key == cache_key("claude", provider.model, ClaudeProvider().generation_params(), "p")
+    provider.temperature = 0.5
+    assert cache_key("claude", provider.model, provider.generation_params(), "p") != key
+
+
+def test_put_and_get(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    cache.put("a", "物語A", model="m")
+    assert cache.get("a") == "物語A"
+    assert cache.get("b") is None
+    assert len(cache) == 1
+    with open(cache._path("a"), encoding="utf-8") as f:
+        assert json.load(f) == {"story": "物語A", "created": clock.now, "model": "m"}
+
+
+def test_ttl_expiry(tmp_path, clock):
+    cache = make_cache(tmp_path, ttl=60)
+    cache.put("a", "物語A")
+    clock.now += 60
+    assert cache.get("a") == "物語A"
+    clock.now += 1
+    assert cache.get("a") is None
+    # 期限切れのものはファイルごと削除する
+    assert len(cache) == 0
+    assert not os.path.exists(cache._path("a"))
+
+
+def test_ttl_zero_never_expires(tmp_path, clock):
+    cache = make_cache(tmp_path, ttl=0)
+    cache.put("a", "物語A")
+    clock.now += 10 ** 9
+    assert cache.get("a") == "物語A"
+
+
+def test_replay_ignores_ttl_and_does_not_write(tmp_path, clock):
+    make_cache(tmp_path, ttl=60).put("a", "物語A")
+    clock.now += 3600
+    replay = make_cache(tmp_path, ttl=60, mode="replay")
+    assert replay.get("a") == "物語A"
+    replay.put("b", "物語B")
+    assert replay.get("b") is None
+
+
+def test_lru_eviction(tmp_path, clock):
+    size = entry_size(tmp_path)
+    cache = make_cache(tmp_path, max_bytes=size * 3)
+    for key in "abc":
+        cache.put(key, "物語")
+    # a を使うと、最も長く使われていないのは b になる
+    assert cache.get("a") == "物語"
+    cache.put("d", "物語")
+    assert list(cache._entries) == ["c", "a", "d"]
+    assert not os.path.exists(cache._path("b"))
+    assert cache._total_bytes == size * 3
+    cache.put("e", "物語")
+    assert list(cache._entries) == ["a", "d", "e"]
+
+
+def test_overwrite_keeps_total_size(tmp_path, clock):
+    size = entry_size(tmp_path)
+    cache = make_cache(tmp_path, max_bytes=size * 2)
+    cache.put("a", "物語")
+    cache.put("b", "物語")
+    cache.put("a", "物語")
+    # 上書きは1件として数え、a が最新になる
+    assert list(cache._entries) == ["b", "a"]
+    assert cache._total_bytes == size * 2
+
+
+def test_entry_larger_than_limit_is_not_stored(tmp_path, clock):
+    cache = make_cache(tmp_path, max_bytes=100)
+    cache.put("a", "長" * 200)
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+def test_lru_order_survives_restart(tmp_path, clock):
+    size = entry_size(tmp_path)
+    cache = make_cache(tmp_path, max_bytes=size * 3)
+    for i, key in enumerate("abc"):
+        cache.put(key, "物語")
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    # 使用時刻（mtime）の順に索引を作り直す
+    os.utime(cache._path("a"), (2000, 2000))
+    restarted = make_cache(tmp_path, max_bytes=size * 3)
+    assert list(restarted._entries) == ["b", "c", "a"]
+    restarted.put("d", "物語")
+    assert list(restarted._entries) == ["c", "a", "d"]
+
+
+def test_get_updates_mtime(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    cache.put("a", "物語")
+    os.utime(cache._path("a"), (1000, 1000))
+    cache.get("a")
+    assert os.path.getmtime(cache._path("a")) > 1000
+
+
+def test_corrupt_file_is_forgotten(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    cache.put("a", "物語")
+    with open(cache._path("a"), "w", encoding="utf-8") as f:
+        f.write("{壊れた")
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache._total_bytes == 0
+
+
+def test_off_mode(tmp_path):
+    cache = make_cache(tmp_path, mode="off")
+    cache.put("a", "物語")
+    assert cache.get("a") is None
+    assert not (tmp_path / "responses").exists()
+
+
+def test_unknown_mode(tmp_path):
+    with pytest.raises(ValueError):
+        make_cache(tmp_path, mode="readonly")
+
+
+def test_clear(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    cache.put("a", "物語")
+    cache.put("b", "物語")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache._total_bytes == 0
+    assert os.listdir(tmp_path / "responses") == []
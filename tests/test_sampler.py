@@ -0,0 +1,102 @@
+# test_sampler.py
+# ★の抽出（story_corpus/sampler.py）のテスト
+
+import pytest
+
+from story_corpus import StarBitset, sample_genre_elements, sample_genre_stars, sample_stars
+
+# ★2個ずつのクラスタ（0と1、2と3、…）
+N_STARS = 40
+PAIR_CLUSTERS = [j // 2 for j in range(N_STARS)]
+
+
+@pytest.mark.parametrize("n_stars, count", [(1, 1), (10, 3), (10, 10), (7054, 5), (7054, 100)])
+def test_sample_stars_are_distinct_and_in_range(n_stars, count):
+    for seed in range(200):
+        picks = sample_stars(n_stars, count, seed=seed)
+        assert len(picks) == count
+        assert len(set(picks)) == count
+        assert all(0 <= j < n_stars for j in picks)
+
+
+@pytest.mark.parametrize("count", [0, -3])
+def test_sample_stars_empty_count(count):
+    assert sample_stars(100, count, seed=1) == []
+
+
+@pytest.mark.parametrize("clusters", [None, PAIR_CLUSTERS])
+def test_sample_stars_respects_used_stars(clusters):
+    # アプリの使用済み★（StarBitset）をそのまま exclude に渡す
+    used_stars = StarBitset(N_STARS, [0, 5, 6, 17, 38, 39])
+    for seed in range(200):
+        picks = sample_stars(N_STARS, 8, used_stars, seed=seed, clusters=clusters)
+        assert len(picks) == 8
+        assert not any(j in used_stars for j in picks)
+        if clusters is not None:
+            # 使用済みの★と同じクラスタの★も選ばない
+            used_clusters = {PAIR_CLUSTERS[j] for j in used_stars}
+            assert not used_clusters & {PAIR_CLUSTERS[j] for j in picks}
+
+
+def test_sample_stars_ignores_exclusions_out_of_range():
+    for seed in range(20):
+        assert sorted(sample_stars(10, 10, exclude=[-1, 10, 99], seed=seed)) == list(range(10))
+
+
+def test_sample_stars_nearly_exhausted_pool():
+    # 残り3個の★から5個を求めると、残りの3個だけを返す
+    used_stars = StarBitset(N_STARS, [j for j in range(N_STARS) if j not in (3, 20, 39)])
+    for seed in range(50):
+        picks = sample_stars(N_STARS, 5, used_stars, seed=seed)
+        assert sorted(picks) == [3, 20, 39]
+    # すべて使用済みなら空
+    for j in (3, 20, 39):
+        used_stars.add(j)
+    assert sample_stars(N_STARS, 5, used_stars, seed=0) == []
+
+
+def test_sample_stars_nearly_exhausted_clusters():
+    # 使われていないクラスタが2つだけなら、★は2個まで（各クラスタから1個）
+    used_stars = StarBitset(N_STARS, [j for j in range(N_STARS) if PAIR_CLUSTERS[j] not in (4, 11)])
+    results = set()
+    for seed in range(100):
+        picks = sample_stars(N_STARS, 5, used_stars, seed=seed, clusters=PAIR_CLUSTERS)
+        assert len(picks) == 2
+        assert sorted(PAIR_CLUSTERS[j] for j in picks) == [4, 11]
+        results.add(tuple(sorted(picks)))
+    # どちらのクラスタでも両方の★が選ばれうる
+    assert results == {(8, 22), (8, 23), (9, 22), (9, 23)}
+
+
+def test_sample_stars_is_uniform():
+    # 各★が選ばれる回数がほぼ同じ（期待値 2000 回、±5σ 以内）
+    counts = [0] * 20
+    for seed in range(8000):
+        for j in sample_stars(20, 5, exclude=[7], seed=seed):
+            counts[j] += 1
+    assert counts[7] == 0
+    expected = 8000 * 5 / 19
+    assert all(abs(counts[j] - expected) < 5 * (expected * (1 - 5 / 19)) ** 0.5 for j in range(20) if j != 7)
+
+
+class PairCorpus:
+    """★番号をそのまま要素にした物語要素データ（ジャンルの★は偶数番と1番）"""
+
+    n_stars = N_STARS
+    star_clusters = PAIR_CLUSTERS
+
+    def genre_star_ids(self, genre_key):
+        return [1] + list(range(0, N_STARS, 2))
+
+    def element(self, star_index):
+        return ("【項目】", star_index)
+
+
+def test_sample_genre_elements_passes_clusters():
+    corpus = PairCorpus()
+    for seed in range(50):
+        elements = sample_genre_elements(corpus, "genre_sf", 10, bias=0.7, seed=seed, clusters=corpus.star_clusters)
+        star_ids = [star for _, star in elements]
+        assert star_ids == sample_genre_stars(N_STARS, corpus.genre_star_ids("genre_sf"), 10, 0.7, seed=seed,
+                                              clusters=PAIR_CLUSTERS)
+        assert len({PAIR_CLUSTERS[j] for j in star_ids}) == 10
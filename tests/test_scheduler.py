@@ -0,0 +1,223 @@
+# test_scheduler.py
+# 送信スケジューラー（shortshort/scheduler.py）と Retry-After の解析（providers.py）のテスト
+#
+# time.monotonic と time.sleep を仮の時計に置き換え、実際には待たずに待ち時間を記録する。
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+pytest.importorskip("requests")
+import providers
+import scheduler
+from providers import ProviderError, _parse_retry_after
+from scheduler import BACKOFF_CAP, RequestScheduler
+
+
+class FakeClock:
+    """time.monotonic / time.sleep の代わり（sleep すると時刻が進む）"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(scheduler.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(scheduler.time, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.fixture
+def max_jitter(monkeypatch):
+    # ジッターを上限側に固定する
+    monkeypatch.setattr(scheduler.random, "uniform", lambda low, high: high)
+
+
+class FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+def http_date(seconds_from_now):
+    return format_datetime(datetime.now(timezone.utc) + timedelta(seconds=seconds_from_now), usegmt=True)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("120", 120.0),
+    ("1.5", 1.5),
+    ("0", 0.0),
+    ("-5", 0.0),
+    ("soon", None),
+    ("", None),
+])
+def test_parse_retry_after_seconds(value, expected):
+    assert _parse_retry_after(FakeResponse({"Retry-After": value})) == expected
+
+
+def test_parse_retry_after_missing():
+    assert _parse_retry_after(FakeResponse({})) is None
+
+
+def test_parse_retry_after_http_date():
+    assert _parse_retry_after(FakeResponse({"Retry-After": http_date(90)})) == pytest.approx(90, abs=2)
+    # 過去の日時は待たない
+    assert _parse_retry_after(FakeResponse({"Retry-After": http_date(-90)})) == 0.0
+
+
+@pytest.mark.parametrize("status_code, retryable", [(429, True), (500, True), (503, True), (400, False), (401, False)])
+def test_retryable_status(status_code, retryable):
+    assert ProviderError("エラー", status_code=status_code).retryable is retryable
+
+
+def test_backoff_grows_and_is_capped(max_jitter):
+    sched = RequestScheduler()
+    assert [sched.backoff(attempt) for attempt in range(1, 7)] == [2.0, 4.0, 8.0, 16.0, BACKOFF_CAP, BACKOFF_CAP]
+
+
+def test_backoff_uses_full_jitter():
+    sched = RequestScheduler()
+    for attempt in range(1, 8):
+        upper = min(BACKOFF_CAP, 2.0 ** attempt)
+        assert all(0 <= sched.backoff(attempt) <= upper for _ in range(200))
+
+
+class FailingRequest:
+    """errors を順に送出し、尽きたら "本文" を返す request"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.timeouts = []
+
+    def __call__(self, timeout):
+        self.timeouts.append(timeout)
+        if self.errors:
+            raise self.errors.pop(0)
+        return "本文"
+
+
+def test_timeouts_are_clipped_to_deadline(clock):
+    request = FailingRequest()
+    assert RequestScheduler().run(request, deadline=clock.now + 3) == "本文"
+    assert request.timeouts == [(min(providers.CONNECT_TIMEOUT, 3), min(providers.READ_TIMEOUT, 3))]
+    request = FailingRequest()
+    RequestScheduler().run(request, deadline=clock.now + 1000)
+    assert request.timeouts == [(providers.CONNECT_TIMEOUT, providers.READ_TIMEOUT)]
+
+
+def test_retries_with_backoff(clock, max_jitter):
+    request = FailingRequest(ProviderError("混雑", status_code=503), ProviderError("タイムアウト", retryable=True))
+    waits = []
+    on_wait = lambda seconds, reason: waits.append((seconds, reason))
+    assert RequestScheduler().run(request, deadline=clock.now + 100, on_wait=on_wait) == "本文"
+    assert clock.sleeps == [2.0, 4.0]
+    assert waits == [(2.0, "混雑"), (4.0, "タイムアウト")]
+    # 再試行ごとに残り時間でタイムアウトを決め直す
+    assert request.timeouts[2] == (min(providers.CONNECT_TIMEOUT, 94), min(providers.READ_TIMEOUT, 94))
+
+
+def test_non_retryable_error_is_not_retried(clock):
+    request = FailingRequest(ProviderError("認証エラー", status_code=401))
+    with pytest.raises(ProviderError, match="認証エラー"):
+        RequestScheduler().run(request, deadline=clock.now + 100)
+    assert len(request.timeouts) == 1
+    assert clock.sleeps == []
+
+
+def test_gives_up_after_max_attempts(clock, max_jitter):
+    request = FailingRequest(*[ProviderError(f"混雑{i}", status_code=503) for i in range(5)])
+    with pytest.raises(ProviderError, match="混雑2"):
+        RequestScheduler(max_attempts=3).run(request, deadline=clock.now + 1000)
+    assert len(request.timeouts) == 3
+
+
+def test_retry_after_pauses_the_whole_scheduler(clock):
+    sched = RequestScheduler()
+    request = FailingRequest(ProviderError("上限", status_code=429, retry_after=7.0))
+    waits = []
+    on_wait = lambda seconds, reason: waits.append((seconds, reason))
+    assert sched.run(request, deadline=clock.now + 100, on_wait=on_wait) == "本文"
+    # Retry-After の間は送信枠の予約で待つ
+    assert clock.sleeps == [7.0]
+    assert waits == [(7.0, "上限"), (7.0, "送信上限")]
+
+    # 他の呼び出しも同じ期限まで待つ
+    sched.pause(5.0)
+    sched.run(FailingRequest(), deadline=clock.now + 100)
+    assert clock.sleeps == [7.0, 5.0]
+
+
+def test_retry_after_past_deadline_fails_without_waiting(clock):
+    error = ProviderError("上限", status_code=429, retry_after=60.0)
+    with pytest.raises(ProviderError) as excinfo:
+        RequestScheduler().run(FailingRequest(error), deadline=clock.now + 30)
+    assert excinfo.value is error
+    assert clock.sleeps == []
+
+
+def test_backoff_past_deadline_fails_without_waiting(clock, max_jitter):
+    error = ProviderError("混雑", status_code=503)
+    with pytest.raises(ProviderError) as excinfo:
+        RequestScheduler().run(FailingRequest(error), deadline=clock.now + 1.5)
+    assert excinfo.value is error
+    assert clock.sleeps == []
+
+
+def test_rate_limit_wait_and_deadline(clock):
+    # 1秒に1回（バケットは1回分）
+    sched = RequestScheduler(rpm=60, burst_seconds=1.0)
+    sched.run(FailingRequest(), deadline=clock.now + 10)
+    sched.run(FailingRequest(), deadline=clock.now + 10)
+    assert clock.sleeps == [pytest.approx(1.0)]
+    # 送信枠が空くのが期限より後なら、待たずに失敗（再試行してよい）
+    with pytest.raises(ProviderError, match="送信上限") as excinfo:
+        sched.run(FailingRequest(), deadline=clock.now + 0.5)
+    assert excinfo.value.retryable
+    assert len(clock.sleeps) == 1
+
+
+def test_token_budget(clock):
+    # 1分あたり 600 トークン、バケットは10秒分（100トークン）
+    sched = RequestScheduler(tpm=600, burst_seconds=10.0)
+    sched.run(FailingRequest(), tokens=100, deadline=clock.now + 100)
+    sched.run(FailingRequest(), tokens=50, deadline=clock.now + 100)
+    assert clock.sleeps == [pytest.approx(5.0)]
+
+
+def test_streaming_request_stops_at_deadline(clock, monkeypatch):
+    # 読み込みタイムアウトにかからない間隔で届き続けても、期限で打ち切る
+    monkeypatch.setattr(providers.time, "monotonic", clock.monotonic)
+
+    class TricklingResponse:
+        def iter_content(self, chunk_size=None):
+            for _ in range(100):
+                clock.now += 1.0
+                yield 'data: {"choices": [{"delta": {"content": "あ"}}]}\n\n'.encode("utf-8")
+
+        def close(self):
+            pass
+
+    provider = providers.OpenAIProvider()
+    monkeypatch.setattr(provider, "_post", lambda *args: TricklingResponse())
+    received = []
+    deadline = clock.now + 10.5
+
+    def request(timeout):
+        for text in provider.stream("dummy", "プロンプト", timeout=timeout, deadline=deadline):
+            received.append(text)
+        return "".join(received)
+
+    with pytest.raises(ProviderError, match="期限内に生成が完了しませんでした") as excinfo:
+        RequestScheduler().run(request, deadline=deadline)
+    assert not excinfo.value.retryable
+    assert received == ["あ"] * 10
@@ -0,0 +1,109 @@
+# test_search.py
+# 全文検索（story_corpus/search.py）と、検索用の正規化・2-gramのテスト
+
+import pytest
+
+from story_corpus import clusters, diversity, search_stars
+from story_corpus.compiled import CompiledCorpus, compile_corpus
+from story_corpus.search import item_search_text, normalize_text, star_search_text, word_bigrams
+
+STORY_ELEMENTS = [
+    {"item": "【猫】", "stars": ["★１．猫が話す。", "★２ａ．猫が人間に化ける。", "★２ｂ．化け猫の恩返し。"]},
+    {"item": "【ネコ科の動物】", "stars": ["★１．トラが町に出る。", "★２．ライオンの王様。"]},
+    {"item": "【月】", "stars": ["★１．月へ行く。", "★２．ウサギが月で餅をつく。"]},
+    {"item": "【扉】", "stars": ["★１．開かない扉。", "★２．どこへでも行ける扉（ドア）。"]},
+]
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    corpus = CompiledCorpus(compile_corpus(STORY_ELEMENTS))
+    yield corpus
+    corpus.close()
+
+
+def brute_force(query):
+    """空白で区切った語をすべて項目名か★テキストに含む★番号（順不同）"""
+    terms = [term.strip("【】") or term for term in normalize_text(query).split()]
+    found = set()
+    star_index = 0
+    for item_data in STORY_ELEMENTS:
+        item_text = item_search_text(item_data["item"])
+        for star in item_data["stars"]:
+            star_text = star_search_text(star)
+            if terms and all(term in item_text or term in star_text for term in terms):
+                found.add(star_index)
+            star_index += 1
+    return found
+
+
+def test_word_bigrams():
+    assert word_bigrams(star_search_text("★２ａ．猫が、話す！")) == ["猫が", "が話", "話す"]
+    assert word_bigrams("あ") == ["あ"]
+    assert word_bigrams("「」") == [""]
+
+
+def test_clusters_and_diversity_share_the_bigrams():
+    # ほぼ重複する★の判定と似た★を避ける抽出が、同じ2-gramを使う
+    assert clusters.word_bigrams is word_bigrams
+    assert diversity.word_bigrams is word_bigrams
+    assert clusters.star_shingles("★１．猫が話す。") == set(word_bigrams(star_search_text("★１．猫が話す。")))
+
+
+@pytest.mark.parametrize("query", ["猫", "月", "扉", "す", "。", "化"])
+def test_one_character_query(corpus, query):
+    # 1文字の語は、その文字で始まる2-gram（テキスト末尾の文字も含む）の投稿リストから探す
+    found = search_stars(corpus, query, limit=None)
+    assert found and set(found) == brute_force(query)
+
+
+def test_one_character_query_matches_last_character(corpus):
+    # 「扉」は項目名の最後の文字（後ろに文字がない）
+    assert set(search_stars(corpus, "扉", limit=None)) == {7, 8}
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("ねこ", {3, 4}),
+    ("ネコ", {3, 4}),
+    ("ﾈｺ", {3, 4}),
+    ("うさぎ", {6}),
+    ("ウサギ", {6}),
+    ("どあ", {8}),
+    ("が", {0, 1, 3, 6}),
+])
+def test_kana_only_query(corpus, query, expected):
+    # カタカナ・ひらがな・半角カナを区別しない
+    assert set(search_stars(corpus, query, limit=None)) == expected == brute_force(query)
+
+
+@pytest.mark.parametrize("query", [
+    "犬",
+    "猫犬",
+    "月猫",
+    "ねこが",
+    "猫 月",
+    "トラ ライオン",
+    "",
+    "   ",
+    "【】",
+])
+def test_no_hit_query(corpus, query):
+    assert search_stars(corpus, query) == []
+
+
+def test_terms_are_combined_with_and(corpus):
+    assert set(search_stars(corpus, "猫 化", limit=None)) == {1, 2} == brute_force("猫 化")
+    assert set(search_stars(corpus, "月 もち", limit=None)) == set()
+
+
+def test_item_hits_rank_first(corpus):
+    # 項目名に一致する★が先、★テキストで一致する★は前の方で一致するものが先
+    assert search_stars(corpus, "猫", limit=None) == [0, 1, 2]
+    assert search_stars(corpus, "行", limit=None) == [5, 8]
+    assert search_stars(corpus, "猫", limit=2) == [0, 1]
+    assert search_stars(corpus, "猫", limit=0) == []
+
+
+def test_star_reference(corpus):
+    assert search_stars(corpus, "【猫】★２ｂ．") == [2]
+    assert search_stars(corpus, "扉 ★2") == [8]
@@ -0,0 +1,110 @@
+# test_seed_stability.py
+# 同じシードなら同じ結果になることの確認（抽出関数ごとの固定値）
+#
+# シードから結果への対応は SAMPLER_VERSION が同じ間は変えない（sampler.py の冒頭を参照）。
+# ここの値が変わる変更をする場合は SAMPLER_VERSION を上げ、値を更新する。
+# 物語要素データが変わっても値が変わらないよう、★数や重みは固定の小さな入力を使う。
+
+import random
+
+import pytest
+
+from story_corpus import (
+    SAMPLER_VERSION,
+    generate_katakana_name,
+    make_rng,
+    sample_genre_stars,
+    sample_star_batch,
+    sample_stars,
+)
+from story_corpus.weighted import AliasTable, FenwickTree, sample_alias_stars, sample_weighted_stars
+
+# ★2個ずつのクラスタ（0と1、2と3、…）
+PAIR_CLUSTERS = [j // 2 for j in range(20)]
+WEIGHTS = [1, 2, 3, 4, 0, 5, 1, 1, 2, 3]
+
+
+def test_sampler_version():
+    assert SAMPLER_VERSION == 1
+
+
+@pytest.mark.parametrize("kwargs, expected", [
+    (dict(n_stars=1000, count=5, seed=0), [844, 758, 421, 261, 513]),
+    (dict(n_stars=1000, count=5, seed=12345), [416, 11, 825, 300, 370]),
+    (dict(n_stars=20, count=5, exclude=[1, 2, 3], seed=7), [8, 6, 14, 7, 13]),
+    (dict(n_stars=20, count=5, seed=3, clusters=PAIR_CLUSTERS), [4, 11, 8, 13, 14]),
+])
+def test_sample_stars(kwargs, expected):
+    assert sample_stars(**kwargs) == expected
+
+
+def test_sample_genre_stars():
+    assert sample_genre_stars(100, list(range(0, 100, 10)), 4, bias=0.7, seed=5) == [70, 94, 92, 50]
+
+
+def test_generate_katakana_name():
+    assert [generate_katakana_name(seed) for seed in (0, 1, 2)] == ["モミ", "コラ", "レュ"]
+    rng = random.Random(2024)
+    assert [generate_katakana_name(rng) for _ in range(3)] == ["ヅポ", "ジレ", "テペ"]
+
+
+def test_weighted_samplers():
+    assert sample_alias_stars(AliasTable(WEIGHTS), 4, seed=11) == [5, 3, 9, 1]
+    assert sample_weighted_stars(FenwickTree(WEIGHTS), 4, exploration=0.3, seed=11) == [5, 3, 7, 9]
+
+
+def test_random_instance_continues_one_stream():
+    rng = random.Random(99)
+    first = sample_stars(1000, 3, seed=rng)
+    second = sample_stars(1000, 3, seed=rng)
+    rng = random.Random(99)
+    assert sample_stars(1000, 6, seed=rng)[:3] == first
+    assert first != second
+
+
+@pytest.mark.parametrize("seed", [1.5, "1", b"1", object()])
+def test_make_rng_rejects_other_types(seed):
+    with pytest.raises(TypeError):
+        make_rng(seed)
+
+
+def test_sample_star_batch():
+    pytest.importorskip("numpy")
+    assert sample_star_batch(1000, 3, 4, seed=42).tolist() == [
+        [773, 696, 760, 449], [438, 94, 786, 370], [858, 975, 127, 925]]
+    assert sample_star_batch(20, 3, 4, seed=42, clusters=PAIR_CLUSTERS).tolist() == [
+        [12, 8, 10, 17], [8, 1, 16, 7], [16, 4, 1, 12]]
+    assert sample_star_batch(1000, 2, 3, seed=random.Random(9)).tolist() == [[861, 331, 68], [324, 177, 645]]
+
+
+def test_sample_diverse_stars():
+    pytest.importorskip("numpy")
+    from story_corpus import sample_diverse_stars
+    from story_corpus.diversity import StarVectors, build_star_vectors
+
+    data = [
+        {"item": "【猫】", "stars": ["★１．猫が話す。", "★２．猫が人間に化ける。", "★３．猫の恩返し。"]},
+        {"item": "【犬】", "stars": ["★１．犬が話す。", "★２．忠犬が主人を待つ。"]},
+        {"item": "【月】", "stars": ["★１．月へ行く。", "★２．月が落ちてくる。", "★３．月の兎。"]},
+    ]
+    vectors = StarVectors(8, *build_star_vectors(data))
+    assert sample_diverse_stars(vectors, 4, 0.5, seed=3) == [3, 7, 6, 2]
+    assert sample_diverse_stars(vectors, 4, 0.0, seed=3) == [3, 7, 6, 4]
+    assert sample_diverse_stars(vectors, 3, 0.8, seed=3, weights=[1, 0, 2, 1, 1, 3, 1, 1], exploration=0.2) == [2, 5, 4]
+
+
+@pytest.mark.parametrize("dtype", ["int64", "int32", "uint32"])
+def test_numpy_integer_seeds(dtype):
+    # numpy の整数型のシードは同じ値の int と同じ結果になる
+    np = pytest.importorskip("numpy")
+    seed = np.dtype(dtype).type(12345)
+    assert make_rng(seed).random() == random.Random(12345).random()
+    assert sample_stars(1000, 5, seed=seed) == [416, 11, 825, 300, 370]
+    assert generate_katakana_name(seed) == generate_katakana_name(12345)
+    assert (sample_star_batch(1000, 2, 3, seed=seed) == sample_star_batch(1000, 2, 3, seed=12345)).all()
+
+
+def test_seeds_from_generator_integers():
+    np = pytest.importorskip("numpy")
+    seeds = np.random.default_rng(0).integers(0, 1 << 31, size=3)
+    assert [sample_stars(1000, 2, seed=s) for s in seeds] == [sample_stars(1000, 2, seed=int(s)) for s in seeds]
@@ -0,0 +1,67 @@
+# test_session_memory.py
+# Streamlit アプリのセッションを増やしてもメモリ使用量がほぼ一定であることの確認
+#
+# streamlit.testing の AppTest でセッションを1つずつ作り、各セッションの状態（session_state）を
+# 保持したままプロセスの RSS を測る。物語要素データがプロセス内で共有されていれば、
+# 増加量はセッション状態と Streamlit 自身の分（1セッションあたり百数十KB）だけで済む。
+# セッションごとに物語要素データを持つと、1セッションあたり数MB増えるので上限を超える。
+
+import gc
+import os
+import sys
+
+import pytest
+
+from conftest import REPO_DIR, TEMP_DIR
+
+AppTest = pytest.importorskip("streamlit.testing.v1").AppTest
+
+SESSIONS = 200
+# 最初の数セッションの後から SESSIONS セッション分の RSS の増加量の上限
+MAX_GROWTH = 64 * 1024 * 1024
+WARMUP_SESSIONS = 3
+
+
+def current_rss():
+    """プロセスの現在の RSS（バイト）。測れない環境では None"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+@pytest.mark.parametrize("app", ["web/app.py", "shortshort/app.py"])
+def test_memory_stays_flat_over_sessions(app):
+    if current_rss() is None:
+        pytest.skip("RSS を測れない環境です（/proc が必要）")
+    real_db = os.path.join(REPO_DIR, "shortshort", "stories.db")
+    real_db_stat = os.stat(real_db) if os.path.exists(real_db) else None
+
+    sessions = []
+
+    def open_session():
+        at = AppTest.from_file(os.path.join(REPO_DIR, app), default_timeout=60)
+        at.run()
+        assert not at.exception, at.exception[0].message
+        # 実際のサーバーと同じく、セッションごとに残るのはセッション状態だけにする
+        sessions.append(at.session_state)
+
+    for _ in range(WARMUP_SESSIONS):
+        open_session()
+    gc.collect()
+    first = current_rss()
+
+    for _ in range(SESSIONS):
+        open_session()
+    gc.collect()
+    growth = current_rss() - first
+
+    assert len(sessions) == WARMUP_SESSIONS + SESSIONS
+    assert growth < MAX_GROWTH, f"{SESSIONS}セッションで {growth / 1024 / 1024:.1f} MiB 増えました"
+
+    # 作品群のデータベースは一時ディレクトリに作られ、ユーザーのものは変わらない
+    if "story_store" in sys.modules:
+        assert sys.modules["story_store"].DB_PATH.startswith(TEMP_DIR)
+    if real_db_stat is not None:
+        assert os.stat(real_db).st_mtime_ns == real_db_stat.st_mtime_ns
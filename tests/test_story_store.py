@@ -0,0 +1,196 @@
+# test_story_store.py
+# 作品群のSQLiteストア（shortshort/story_store.py）のテスト
+
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from batch import run_batch
+from story_store import StoryStore, rating_deltas
+
+ELEMENTS = [("【猫】", "★１．猫が話す。"), ("【月】", "★２．月が落ちる。")]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "stories.db")
+
+
+@pytest.fixture
+def store(db_path):
+    store = StoryStore(db_path, pool_size=4)
+    yield store
+    store.close()
+
+
+def story_data(n, rating=0, star_ids=(3, 9), corpus_hash="c" * 64):
+    return {
+        "timestamp": f"12:00:{n:02d}",
+        "user_rating": rating,
+        "word_count": 1000 + n,
+        "elements": ELEMENTS,
+        "star_ids": list(star_ids) if star_ids is not None else None,
+        "corpus_hash": corpus_hash,
+        "prompt": f"プロンプト{n}",
+        "story": f"作品{n}",
+    }
+
+
+def test_round_trip_survives_reopen(db_path):
+    store = StoryStore(db_path)
+    key = store.create_group()
+    group_id = store.group_id(key)
+    added = store.add_story(group_id, story_data(1, rating=4))
+    store.close()
+
+    reopened = StoryStore(db_path)
+    try:
+        assert reopened.group_id(key) == group_id
+        [story] = reopened.list_stories(group_id)
+        assert story == {
+            "id": added["id"], "timestamp": "12:00:01", "user_rating": 4, "word_count": 1001,
+            "elements": ELEMENTS, "star_ids": [3, 9], "corpus_hash": "c" * 64,
+            "prompt": "プロンプト1", "story": "作品1",
+        }
+    finally:
+        reopened.close()
+
+
+def test_unknown_group(store):
+    assert store.group_id("no-such-key") is None
+    assert store.group_version(12345) is None
+
+
+def test_groups_are_separate(store):
+    first = store.group_id(store.create_group())
+    second = store.group_id(store.create_group())
+    store.add_story(first, story_data(1))
+    assert store.count(first) == 1
+    assert store.count(second) == 0
+    store.clear_group(first)
+    assert store.count(first) == 0
+
+
+def test_orders_and_limit(store):
+    group_id = store.group_id(store.create_group())
+    for n, rating in enumerate([3, 5, 0, 5, 1]):
+        store.add_story(group_id, story_data(n, rating=rating))
+    by_rating = [s["story"] for s in store.list_stories(group_id, order="rating")]
+    # 同じ評価の中では生成順
+    assert by_rating == ["作品1", "作品3", "作品0", "作品4", "作品2"]
+    assert [s["story"] for s in store.list_stories(group_id, order="created")] == [f"作品{n}" for n in range(5)]
+    assert [s["story"] for s in store.list_stories(group_id, limit=2)] == ["作品1", "作品3"]
+    assert [s["story"] for s in store.iter_stories(group_id, batch_size=2)] == by_rating
+
+
+def test_version_increases_on_every_change(store):
+    group_id = store.group_id(store.create_group())
+    assert store.group_version(group_id) == 0
+    story_id = store.add_story(group_id, story_data(1))["id"]
+    assert store.group_version(group_id) == 1
+    store.set_rating(story_id, 3)
+    assert store.group_version(group_id) == 2
+    # 評価が変わらない場合は変更しない
+    assert store.set_rating(story_id, 3) is None
+    assert store.group_version(group_id) == 2
+    store.clear_group(group_id)
+    assert store.group_version(group_id) == 3
+
+
+@pytest.mark.parametrize("old, new, expected", [
+    (0, 5, (1.0, 0.0)),
+    (0, 1, (0.0, 1.0)),
+    (0, 3, (0.5, 0.5)),
+    (5, 1, (-1.0, 1.0)),
+    (4, 0, (-0.75, -0.25)),
+    (2, 2, (0.0, 0.0)),
+])
+def test_rating_deltas(old, new, expected):
+    assert rating_deltas(old, new) == expected
+
+
+def test_star_ratings_accumulate_and_persist(db_path, store):
+    group_id = store.group_id(store.create_group())
+    first = store.add_story(group_id, story_data(1, star_ids=[3, 9]))["id"]
+    second = store.add_story(group_id, story_data(2, star_ids=[9, 12]))["id"]
+    assert store.set_rating(first, 5) == ("c" * 64, [3, 9], 1.0, 0.0)
+    store.set_rating(second, 1)
+    store.set_rating(first, 3)
+    assert store.star_ratings("c" * 64) == {3: (0.5, 0.5), 9: (0.5, 1.5), 12: (0.0, 1.0)}
+    assert store.star_ratings("d" * 64) == {}
+
+    reopened = StoryStore(db_path)
+    try:
+        assert reopened.star_ratings("c" * 64) == {3: (0.5, 0.5), 9: (0.5, 1.5), 12: (0.0, 1.0)}
+    finally:
+        reopened.close()
+
+
+def test_rating_without_star_ids(store):
+    group_id = store.group_id(store.create_group())
+    story_id = store.add_story(group_id, story_data(1, star_ids=None))["id"]
+    assert store.set_rating(story_id, 5) is None
+    assert store.list_stories(group_id)[0]["user_rating"] == 5
+    assert store.star_ratings("c" * 64) == {}
+
+
+def test_failed_transaction_rolls_back(store):
+    group_id = store.group_id(store.create_group())
+    with pytest.raises(RuntimeError):
+        with store.transaction() as conn:
+            conn.execute("DELETE FROM stories WHERE group_id = ?", (group_id,))
+            conn.execute("UPDATE story_groups SET version = 99 WHERE id = ?", (group_id,))
+            raise RuntimeError
+    assert store.group_version(group_id) == 0
+
+
+def test_adds_version_column_to_old_database(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE story_groups (id INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE, created REAL NOT NULL)")
+    conn.execute("INSERT INTO story_groups (key, created) VALUES ('old', 0)")
+    conn.commit()
+    conn.close()
+    store = StoryStore(db_path)
+    try:
+        assert store.group_version(store.group_id("old")) == 0
+    finally:
+        store.close()
+
+
+def test_concurrent_batch_saves(store):
+    # 一括生成のワーカースレッドから同時に保存する（接続プールより多いスレッド数）
+    group_id = store.group_id(store.create_group())
+    jobs = [{"prompt": f"プロンプト{n}", "elements": ELEMENTS, "star_ids": [n], "corpus_hash": "c" * 64}
+            for n in range(120)]
+    results = list(run_batch(lambda prompt: prompt.replace("プロンプト", "作品"), jobs, max_workers=12,
+                             save=lambda data: store.add_story(group_id, data)))
+    assert all(error is None for _, _, error in results)
+    ids = [data["id"] for _, data, _ in results]
+    assert len(set(ids)) == 120
+    assert store.count(group_id) == 120
+    assert store.group_version(group_id) == 120
+    stories = store.list_stories(group_id, order="created")
+    assert sorted(s["story"] for s in stories) == sorted(f"作品{n}" for n in range(120))
+    for story in stories:
+        assert story["star_ids"] == [int(story["story"][2:])]
+    # 接続はプールの大きさまでしか作らない
+    assert store._created <= 4
+
+
+def test_concurrent_ratings_update_the_same_stars(store):
+    group_id = store.group_id(store.create_group())
+    story_ids = [store.add_story(group_id, story_data(n, star_ids=[1, 2]))["id"] for n in range(40)]
+    barrier = threading.Barrier(8)
+
+    def rate(story_id):
+        if story_id < story_ids[8]:
+            barrier.wait()
+        store.set_rating(story_id, 5)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(rate, story_ids))
+    # 更新が失われない（40作品 × 成功1）
+    assert store.star_ratings("c" * 64) == {1: (40.0, 0.0), 2: (40.0, 0.0)}
+    assert store.group_version(group_id) == 80
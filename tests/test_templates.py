@@ -0,0 +1,41 @@
+# test_templates.py
+# プロンプト用テンプレート（story_corpus/templates.py）のテスト
+
+import pytest
+
+from story_corpus import PromptTemplate
+from story_corpus.templates import element_lines
+
+
+def test_render_matches_str_format():
+    text = "文字数: {count:,}\n{genre!r}の物語\n{elements}終わり"
+    values = {"count": 12000, "genre": "SF", "elements": "1. 【猫】 ★１．\n"}
+    assert PromptTemplate(text).render(**values) == text.format(**values)
+
+
+def test_slot_names_that_are_python_keywords():
+    assert PromptTemplate("a {class} b {def}").render(**{"class": "C", "def": "D"}) == "a C b D"
+
+
+def test_bind_merges_fixed_fragments():
+    template = PromptTemplate("[{genre}] {word_count}文字 ({genre})").bind(genre="SF")
+    assert template.fragments == ("[SF] ", None, "文字 (SF)")
+    assert template.field_names == {"word_count"}
+    assert template.render(word_count=800) == "[SF] 800文字 (SF)"
+
+
+def test_missing_value():
+    with pytest.raises(KeyError):
+        PromptTemplate("{elements}").render()
+
+
+@pytest.mark.parametrize("text", ["{0}", "{a.b}", "{a[0]}", "{a:{width}}"])
+def test_unsupported_fields(text):
+    with pytest.raises(ValueError):
+        PromptTemplate(text)
+
+
+def test_element_lines():
+    elements = [("【猫】", "★１．猫が話す。"), ("【扉】", "★２ａ．開かない扉。")]
+    assert element_lines(elements) == "1. 【猫】 ★１．猫が話す。\n2. 【扉】 ★２ａ．開かない扉。\n"
+    assert element_lines([]) == ""
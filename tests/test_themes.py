@@ -0,0 +1,106 @@
+# test_themes.py
+# ジャンルごとの★の分類（story_corpus/themes.py）と、ジャンルを優先した抽出のテスト
+
+import pytest
+
+from story_corpus import GENRE_KEYS, sample_genre_stars
+from story_corpus.compiled import CompiledCorpus, compile_corpus
+from story_corpus.themes import GENRE_LEXICONS, tag_genres
+
+STORY_ELEMENTS = [
+    # 項目名に語彙を含むと、その項目の★はすべてそのジャンル
+    {"item": "【幽霊】", "stars": ["★１．夜道に立つ。", "★２．手紙を書く。"]},
+    # 全角・半角やカタカナ・ひらがなを区別しない
+    {"item": "【機】", "stars": ["★１．ﾛﾎﾞｯﾄが歩く。", "★２．ろぼっとが話す。", "★３．箱が開く。"]},
+    # 1つの★が複数のジャンルに入る
+    {"item": "【城】", "stars": ["★１．探偵が魔法を見破る。"]},
+    # どのジャンルにも入らない
+    {"item": "【石】", "stars": ["★１．石が転がる。", "★２．石を拾う。"]},
+]
+
+
+def genre_of(star_index):
+    return {key for key, ids in zip(GENRE_KEYS, tag_genres(STORY_ELEMENTS)) if star_index in ids}
+
+
+def test_lexicons_cover_every_genre():
+    assert set(GENRE_LEXICONS) == set(GENRE_KEYS)
+
+
+def test_item_name_tags_every_star():
+    assert genre_of(0) == genre_of(1) == {"genre_horror"}
+
+
+def test_matching_ignores_width_and_kana():
+    assert "genre_sf" in genre_of(2)
+    assert "genre_sf" in genre_of(3)
+    assert genre_of(4) == set()
+
+
+def test_star_in_several_genres():
+    assert genre_of(5) == {"genre_fantasy", "genre_mystery"}
+
+
+def test_untagged_stars():
+    assert genre_of(6) == genre_of(7) == set()
+
+
+def test_ids_are_sorted():
+    data = [{"item": "【旅】", "stars": [f"★{i}．歩く。" for i in range(1, 6)]}] + STORY_ELEMENTS
+    for ids in tag_genres(data):
+        assert ids == sorted(set(ids))
+
+
+def test_compiled_genre_star_ids_match_tagging():
+    corpus = CompiledCorpus(compile_corpus(STORY_ELEMENTS))
+    try:
+        for key, ids in zip(GENRE_KEYS, tag_genres(STORY_ELEMENTS)):
+            assert list(corpus.genre_star_ids(key)) == ids
+    finally:
+        corpus.close()
+
+
+N_STARS = 200
+GENRE_IDS = list(range(0, N_STARS, 10))
+
+
+def test_strict_genre_sampling():
+    # bias=1 ならジャンルの★だけ
+    for seed in range(100):
+        picks = sample_genre_stars(N_STARS, GENRE_IDS, 8, bias=1.0, seed=seed)
+        assert len(set(picks)) == 8
+        assert set(picks) <= set(GENRE_IDS)
+
+
+def test_short_genre_is_filled_from_all_stars():
+    # ジャンルの★が足りない分は全★から補う（重複なし）
+    genre_ids = [3, 50, 77]
+    for seed in range(100):
+        picks = sample_genre_stars(N_STARS, genre_ids, 6, bias=1.0, seed=seed)
+        assert len(set(picks)) == 6
+        assert set(genre_ids) <= set(picks)
+        assert all(0 <= j < N_STARS for j in picks)
+
+
+def test_genre_sampling_respects_exclusions():
+    exclude = GENRE_IDS[:15]
+    for seed in range(100):
+        picks = sample_genre_stars(N_STARS, GENRE_IDS, 8, bias=1.0, exclude=exclude, seed=seed)
+        assert len(set(picks)) == 8
+        assert not set(picks) & set(exclude)
+        # 残りのジャンルの★5個は必ず入る
+        assert set(GENRE_IDS[15:]) <= set(picks)
+
+
+def test_empty_genre_and_exhausted_pool():
+    assert sorted(sample_genre_stars(5, [], 10, bias=1.0, seed=1)) == [0, 1, 2, 3, 4]
+    assert sample_genre_stars(5, [1, 2], 3, bias=1.0, exclude=range(5), seed=1) == []
+
+
+@pytest.mark.parametrize("bias", [0.0, 0.3, 0.7])
+def test_bias_sets_the_share_of_genre_stars(bias):
+    # ジャンルの★の割合の期待値は bias + (1 - bias) × ジャンルの★の割合（全★からもジャンルの★が出る）
+    trials = 4000
+    hits = sum(sample_genre_stars(N_STARS, GENRE_IDS, 1, bias, seed=seed)[0] in GENRE_IDS for seed in range(trials))
+    expected = bias + (1 - bias) * len(GENRE_IDS) / N_STARS
+    assert abs(hits / trials - expected) < 5 * (expected * (1 - expected) / trials) ** 0.5
@@ -0,0 +1,215 @@
+# test_weighted.py
+# 重み付きの★の抽出（story_corpus/weighted.py）のテスト
+
+import random
+from collections import Counter
+
+import pytest
+
+from story_corpus.compiled import CompiledCorpus, compile_corpus
+from story_corpus.weighted import (
+    DISTRIBUTIONS,
+    AliasTable,
+    FenwickTree,
+    distribution_table,
+    sample_alias_stars,
+    sample_distribution_elements,
+    sample_weighted_stars,
+    star_weights,
+)
+
+# 項目ごとの★数は 1, 2, 3（★は6個）
+STORY_ELEMENTS = [
+    {"item": "【猫】", "stars": ["★１．猫が話す。"]},
+    {"item": "【月】", "stars": ["★１．月へ行く。", "★２．月が落ちる。"]},
+    {"item": "【扉】", "stars": ["★１．開かない扉。", "★２．扉が話す。", "★３．扉が消える。"]},
+]
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    corpus = CompiledCorpus(compile_corpus(STORY_ELEMENTS))
+    yield corpus
+    corpus.close()
+
+
+def frequencies(draw, n, trials=60000, seed=1):
+    rng = random.Random(seed)
+    counts = Counter(draw(rng) for _ in range(trials))
+    return [counts[i] / trials for i in range(n)]
+
+
+def assert_proportional(freqs, weights, trials=60000):
+    total = sum(weights)
+    for freq, weight in zip(freqs, weights):
+        p = weight / total
+        if p == 0:
+            assert freq == 0
+        else:
+            assert abs(freq - p) <= 5 * (p * (1 - p) / trials) ** 0.5
+
+
+@pytest.mark.parametrize("weights", [
+    [1, 2, 3, 4],
+    [5, 0, 0, 1, 0, 2],
+    [0, 0, 7],
+    [0.001, 1000],
+])
+def test_alias_table_distribution(weights):
+    table = AliasTable(weights)
+    assert table.total == pytest.approx(sum(weights))
+    assert_proportional(frequencies(table.draw, len(weights)), weights)
+
+
+def test_alias_table_all_equal_weights():
+    table = AliasTable([2.5] * 7)
+    # すべて自分を選ぶ表になる
+    assert table._prob == [1.0] * 7
+    assert_proportional(frequencies(table.draw, 7), [1] * 7)
+
+
+@pytest.mark.parametrize("weights", [[], [1, -1], [0, 0, 0]])
+def test_alias_table_rejects_invalid_weights(weights):
+    with pytest.raises(ValueError):
+        AliasTable(weights)
+
+
+def test_alias_table_set_without_rebuild():
+    weights = [1.0] * 100
+    table = AliasTable(weights)
+    prob = table._prob
+    table.set(3, 0)
+    table.set(10, 20)
+    table.set(10, 5)
+    table.set(50, 1)
+    # 変更が少ない間は表を作り直さない
+    assert table._prob is prob
+    assert table._changed == {3: 0.0, 10: 5.0}
+    weights[3], weights[10] = 0.0, 5.0
+    assert table.weights == weights
+    assert table.total == pytest.approx(sum(weights))
+    assert_proportional(frequencies(table.draw, 100), weights)
+
+
+def test_alias_table_set_rebuilds_after_many_changes():
+    table = AliasTable([1.0] * 100)
+    prob = table._prob
+    for i in range(30):
+        table.set(i, 0)
+    assert table._prob is not prob
+    assert len(table._changed) < 30
+    assert_proportional(frequencies(table.draw, 100), table.weights)
+
+
+def test_alias_table_set_rejects_negative_weight():
+    with pytest.raises(ValueError):
+        AliasTable([1, 2]).set(0, -1)
+
+
+def test_sample_alias_stars_skips_zero_weights():
+    table = AliasTable([0, 1, 0, 1, 1, 0])
+    for seed in range(50):
+        picks = sample_alias_stars(table, 5, seed=seed)
+        # 重みが0の★は選ばれず、足りない分はある分だけ
+        assert sorted(picks) == [1, 3, 4]
+
+
+def test_sample_alias_stars_with_skewed_weights():
+    # 重みが1つに偏っていても引き直しが続くだけで終わり、重複しない
+    table = AliasTable([1e9] + [1.0] * 9)
+    for seed in range(20):
+        picks = sample_alias_stars(table, 10, exclude=[2], seed=seed)
+        assert sorted(picks) == [0, 1, 3, 4, 5, 6, 7, 8, 9]
+
+
+def test_sample_alias_stars_with_clusters():
+    table = AliasTable([1.0] * 8)
+    clusters = [0, 0, 1, 1, 2, 2, 3, 3]
+    for seed in range(50):
+        picks = sample_alias_stars(table, 8, exclude=[0], seed=seed, clusters=clusters)
+        assert sorted(clusters[j] for j in picks) == [1, 2, 3]
+
+
+def test_star_weights_modes(corpus):
+    assert DISTRIBUTIONS == ("stars", "items", "custom")
+    assert star_weights(corpus, "stars") == [1.0] * 6
+    assert star_weights(corpus, "items") == pytest.approx([1, 1 / 2, 1 / 2, 1 / 3, 1 / 3, 1 / 3])
+    assert star_weights(corpus, "custom", [0, 1, 2, 3, 4, 5]) == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    assert star_weights(corpus, "custom", {"2": 4, 5: 1}) == [0.0, 0.0, 4.0, 0.0, 0.0, 1.0]
+
+
+@pytest.mark.parametrize("distribution, weights", [
+    ("custom", None),
+    ("custom", [1, 2]),
+    ("poisson", None),
+])
+def test_star_weights_rejects_bad_arguments(corpus, distribution, weights):
+    with pytest.raises(ValueError):
+        star_weights(corpus, distribution, weights)
+
+
+def test_items_distribution_is_uniform_per_item(corpus):
+    # 項目ごとに一様（どの項目も 1/3）
+    table = distribution_table(corpus, "items")
+    freqs = frequencies(table.draw, corpus.n_stars)
+    item_freqs = [freqs[0], freqs[1] + freqs[2], freqs[3] + freqs[4] + freqs[5]]
+    assert_proportional(item_freqs, [1, 1, 1])
+
+
+def test_distribution_table_is_shared(corpus):
+    assert distribution_table(corpus, "stars") is distribution_table(corpus, "stars")
+    with pytest.raises(ValueError):
+        distribution_table(corpus, "custom")
+
+
+def test_sample_distribution_elements(corpus):
+    elements = sample_distribution_elements(corpus, 10, "items", exclude=[0], seed=3)
+    assert len(elements) == 5
+    assert ("【猫】", "★１．猫が話す。") not in elements
+    assert len(set(elements)) == 5
+
+
+@pytest.mark.parametrize("weights", [[1, 2, 3, 4, 5], [0, 3, 0, 0, 1, 0, 0, 2], [1.0] * 13, [0.0] * 4])
+def test_fenwick_tree_find_matches_prefix_sums(weights):
+    tree = FenwickTree(weights)
+    assert tree.total == pytest.approx(sum(weights))
+    prefix = 0.0
+    for i, weight in enumerate(weights):
+        if weight > 0:
+            assert tree.find(prefix) == i
+            assert tree.find(prefix + weight / 2) == i
+        prefix += weight
+
+
+def test_fenwick_tree_updates():
+    tree = FenwickTree([1.0] * 10)
+    tree.set(4, 0.0)
+    tree.add(7, 9.0)
+    assert tree.total == pytest.approx(18.0)
+    weights = [1.0] * 10
+    weights[4], weights[7] = 0.0, 10.0
+    assert_proportional(frequencies(lambda rng: tree.find(rng.random() * tree.total), 10), weights)
+
+
+def test_sample_weighted_stars_restores_weights():
+    weights = [3.0, 0.0, 1.0, 2.0, 0.0, 5.0]
+    tree = FenwickTree(weights)
+    for seed in range(30):
+        picks = sample_weighted_stars(tree, 3, exclude=[5], seed=seed)
+        assert len(set(picks)) == 3
+        # 探索なしなら重みが0の★と除外の★は選ばれない
+        assert set(picks) == {0, 2, 3}
+    assert tree.weights == weights
+    assert tree.total == pytest.approx(sum(weights))
+
+
+def test_sample_weighted_stars_falls_back_to_uniform_when_weights_run_out():
+    tree = FenwickTree([0.0, 1.0, 0.0, 0.0])
+    for seed in range(20):
+        assert sorted(sample_weighted_stars(tree, 4, seed=seed)) == [0, 1, 2, 3]
+
+
+def test_sample_weighted_stars_all_equal_weights_is_uniform():
+    tree = FenwickTree([1.0] * 5)
+    counts = Counter(sample_weighted_stars(tree, 1, seed=seed)[0] for seed in range(20000))
+    assert_proportional([counts[i] / 20000 for i in range(5)], [1] * 5, trials=20000)
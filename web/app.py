@@ -1,9 +1,30 @@
 import streamlit as st
-import random
-import json
-import os
+import sys
 from pathlib import Path
 
+# リポジトリ直下の共通モジュール（story_corpus）を読み込めるようにする
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from story_corpus import (
+    ENDING_KEYS,
+    GENRE_KEYS,
+    PROMPT_TEXTS,
+    SOURCE_PATH,
+    CompiledCorpus,
+    StarBitset,
+    build_recipe_prompt,
+    build_web_prompt,
+    compile_corpus,
+    decode_recipe,
+    elements_from_ids,
+    encode_recipe,
+    load_corpus,
+    sample_diverse_stars,
+    sample_genre_stars,
+    sample_star_batch,
+    sample_stars,
+    search_stars,
+)
+
 # ページ設定
 st.set_page_config(
     page_title="物語生成プロンプトビルダー | Story Prompt Builder",
@@ -11,6 +32,10 @@ st.set_page_config(
     layout="wide"
 )
 
+# 文字数の入力範囲（レシピコードから復元する文字数もこの範囲に限る）
+MIN_WORD_COUNT = 100
+MAX_WORD_COUNT = 5000
+
 # 多言語テキスト定義
 TEXTS = {
     "ja": {
@@ -19,36 +44,25 @@ TEXTS = {
         "data_loaded": "✅ 物語要素データ: {count}個の要素読み込み完了",
         "data_not_loaded": "⚠️ 物語要素データが読み込まれていません",
         "file_not_found": "⚠️ story_elements.json ファイルが見つかりません。",
-        "file_location_info": "以下のいずれかの場所に story_elements.json を配置してください：",
+        "file_location_info": "以下の場所に story_elements.json を配置してください：",
         "sample_data_warning": "⚠️ サンプルデータ（{items}項目、{stars}個の★要素）を使用しています。",
         
         # サイドバー
         "basic_settings": "⚙️ 基本設定",
         "language": "🌐 言語 / Language",
         "element_count": "物語要素の数",
+        "diversity": "似た要素を避ける度合い",
+        "diversity_help": "高いほど、内容の似た物語要素（同じモチーフの要素など）が一緒に選ばれにくくなります。0%: 似ているかどうかに関係なく抽出します。",
         "word_count": "文字数",
         "genre_style": "🎨 ジャンル・スタイル",
         "genre_select": "物語のスタイルを選択",
+        "genre_bias": "ジャンルに合わせる度合い",
+        "genre_bias_help": "100%: 選んだジャンルに関係する要素だけを抽出します。0%: ジャンルに関係なく抽出します。",
         "ending_style": "🎯 終わり方",
         "ending_select": "終わり方のスタイルを選択",
         
-        # ジャンル
-        "genre_folk": "民話",
-        "genre_sf": "SF",
-        "genre_mystery": "ミステリー",
-        "genre_fantasy": "ファンタジー",
-        "genre_horror": "ホラー",
-        "genre_comedy": "コメディ",
-        "genre_romance": "ロマンス",
-        "genre_adventure": "アドベンチャー",
-        
-        # 終わり方
-        "ending_natural_unexpected": "自然でかつ多少意外性のある終わり方",
-        "ending_surprising": "読者の予想を裏切る意外な終わり方",
-        "ending_natural": "設定の整合性を重視した自然な終わり方",
-        "ending_happy": "ハッピーエンド",
-        "ending_bitter": "ビターエンド",
-        "ending_open": "オープンエンド（読者の想像に委ねる）",
+        # ジャンル・終わり方・プロンプトテンプレート（story_corpus.prompts と共通）
+        **PROMPT_TEXTS["ja"],
         
         # メインエリア
         "story_elements": "📋 物語要素",
@@ -58,6 +72,17 @@ TEXTS = {
         "extraction_failed": "❌ 要素の抽出に失敗しました",
         "selected_elements": "### 選択された要素:",
         "delete_tooltip": "この要素を削除",
+        "search_elements": "🔍 物語要素を検索",
+        "search_placeholder": "例: 時間 旅行",
+        "search_no_results": "一致する物語要素がありません",
+        "add_tooltip": "この要素を追加",
+        
+        "restore_recipe": "🔗 レシピコードから復元",
+        "recipe_placeholder": "例: CQTMFPM4BSAAS57LFKGIEYGA",
+        "restore_button": "復元",
+        "recipe_restored": "✅ レシピコードからプロンプトを復元しました",
+        "recipe_wrong_template": "このレシピコードはWeb版のものではありません",
+        "recipe_word_count_out_of_range": "レシピコードの文字数（{count}）が{min}～{max}の範囲外です",
         
         "generated_prompt": "📝 生成されたプロンプト",
         "generate_prompt": "✨ プロンプトを生成",
@@ -75,16 +100,7 @@ TEXTS = {
         "element_count_used": "**物語要素数**",
         "dataset_size": "**使用データセット**",
         "download_prompt": "📥 プロンプトをダウンロード",
-        
-        # プロンプトテンプレート
-        "prompt_header": "# 物語創作指示\n\n",
-        "prompt_basic_settings": "## 基本設定\n",
-        "prompt_word_count": "- 文字数: 約{count}文字\n",
-        "prompt_genre": "- ジャンル・スタイル: {genre}\n",
-        "prompt_ending": "- 終わり方: {ending}\n\n",
-        "prompt_elements_header": "## 使用する物語要素\n",
-        "prompt_instructions_header": "\n## 指示\n",
-        "prompt_instructions": "上記の物語要素をすべて含む{genre}の物語を創作してください。\n各要素は自然に物語に組み込み、指定した文字数で完結する物語にしてください。\n物語の結末は「{ending}」になるよう心がけてください。",
+        "recipe_code": "**レシピコード**（このコードから同じプロンプトを再生成できます）",
         
         # フッター
         "footer_title": "物語生成プロンプトビルダー",
@@ -104,36 +120,25 @@ TEXTS = {
         "data_loaded": "✅ Story elements data: {count} elements loaded successfully",
         "data_not_loaded": "⚠️ Story elements data not loaded",
         "file_not_found": "⚠️ story_elements.json file not found.",
-        "file_location_info": "Please place story_elements.json in one of the following locations:",
+        "file_location_info": "Please place story_elements.json in the following location:",
         "sample_data_warning": "⚠️ Using sample data ({items} items, {stars} ★ elements).",
         
         # サイドバー
         "basic_settings": "⚙️ Basic Settings",
         "language": "🌐 言語 / Language",
         "element_count": "Number of Story Elements",
+        "diversity": "Avoid similar elements",
+        "diversity_help": "Higher values make elements with similar content (such as the same motif) less likely to be picked together. 0%: ignore similarity.",
         "word_count": "Word Count",
         "genre_style": "🎨 Genre / Style",
         "genre_select": "Select story style",
+        "genre_bias": "Match elements to genre",
+        "genre_bias_help": "100%: extract only elements related to the selected genre. 0%: ignore the genre.",
         "ending_style": "🎯 Ending Style",
         "ending_select": "Select ending style",
         
-        # ジャンル
-        "genre_folk": "Folk Tale",
-        "genre_sf": "Science Fiction",
-        "genre_mystery": "Mystery",
-        "genre_fantasy": "Fantasy",
-        "genre_horror": "Horror",
-        "genre_comedy": "Comedy",
-        "genre_romance": "Romance",
-        "genre_adventure": "Adventure",
-        
-        # 終わり方
-        "ending_natural_unexpected": "Natural ending with some unexpected elements",
-        "ending_surprising": "Unexpected ending that defies reader expectations",
-        "ending_natural": "Natural ending that respects story consistency",
-        "ending_happy": "Happy Ending",
-        "ending_bitter": "Bitter Ending",
-        "ending_open": "Open Ending (left to reader's imagination)",
+        # ジャンル・終わり方・プロンプトテンプレート（story_corpus.prompts と共通）
+        **PROMPT_TEXTS["en"],
         
         # メインエリア
         "story_elements": "📋 Story Elements",
@@ -143,6 +148,17 @@ TEXTS = {
         "extraction_failed": "❌ Failed to extract elements",
         "selected_elements": "### Selected Elements:",
         "delete_tooltip": "Delete this element",
+        "search_elements": "🔍 Search story elements",
+        "search_placeholder": "e.g. 時間 旅行",
+        "search_no_results": "No matching story elements",
+        "add_tooltip": "Add this element",
+        
+        "restore_recipe": "🔗 Restore from recipe code",
+        "recipe_placeholder": "e.g. CQTMFPM4BSAAS57LFKGIEYGA",
+        "restore_button": "Restore",
+        "recipe_restored": "✅ Prompt restored from the recipe code",
+        "recipe_wrong_template": "This recipe code is not for the web version",
+        "recipe_word_count_out_of_range": "The word count in the recipe code ({count}) is outside {min}-{max}",
         
         "generated_prompt": "📝 Generated Prompt",
         "generate_prompt": "✨ Generate Prompt",
@@ -160,16 +176,7 @@ TEXTS = {
         "element_count_used": "**Story Elements Used**",
         "dataset_size": "**Dataset Size**",
         "download_prompt": "📥 Download Prompt",
-        
-        # プロンプトテンプレート
-        "prompt_header": "# Story Creation Instructions\n\n",
-        "prompt_basic_settings": "## Basic Settings\n",
-        "prompt_word_count": "- Word count: approximately {count} words\n",
-        "prompt_genre": "- Genre/Style: {genre}\n",
-        "prompt_ending": "- Ending style: {ending}\n\n",
-        "prompt_elements_header": "## Story Elements to Use\n",
-        "prompt_instructions_header": "\n## Instructions\n",
-        "prompt_instructions": "Create a {genre} story that includes all the above story elements.\nIntegrate each element naturally into the story and complete it within the specified word count.\nThe story's conclusion should follow \"{ending}\".",
+        "recipe_code": "**Recipe code** (regenerates this exact prompt)",
         
         # フッター
         "footer_title": "Story Prompt Builder",
@@ -191,41 +198,23 @@ class StoryPromptBuilderWeb:
         self.load_story_elements()
     
     def load_story_elements(self):
-        """story_elements.jsonファイルを読み込む"""
-        # 複数の可能なファイルパスを試す
-        possible_paths = [
-            'story_elements.json',                    # 現在のディレクトリ
-            'web/story_elements.json',                # webフォルダ内
-            os.path.join(os.path.dirname(__file__), 'story_elements.json'),  # app.pyと同じディレクトリ
-            Path(__file__).parent / 'story_elements.json',  # Pathlib使用
-        ]
-        
+        """共通の物語要素データ（story_corpus）を読み込む"""
         file_loaded = False
         
-        for file_path in possible_paths:
-            try:
-                if os.path.exists(file_path):
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        self.story_elements = json.load(f)
-                    
-                    # ★の総数を計算
-                    self.total_stars = sum(len(item["stars"]) for item in self.story_elements)
-                    
-                    # 読み込み成功メッセージ
-                    item_count = len(self.story_elements)
-                    if self.total_stars >= 7000:
-                        print(f"物語要素データ読み込み成功: {self.total_stars}個の要素 ({item_count}項目) (パス: {file_path})")
-                    else:
-                        print(f"物語要素データ読み込み成功: {self.total_stars}個の要素 ({item_count}項目) (パス: {file_path})")
-                    file_loaded = True
-                    break
-            except Exception as e:
-                print(f"パス {file_path} での読み込み失敗: {e}")
-                continue
+        try:
+            self.story_elements = load_corpus()
+            self.total_stars = self.story_elements.total_stars
+            
+            # 読み込み成功メッセージ
+            item_count = len(self.story_elements)
+            print(f"物語要素データ読み込み成功: {self.total_stars}個の要素 ({item_count}項目) (パス: {SOURCE_PATH})")
+            file_loaded = True
+        except Exception as e:
+            print(f"パス {SOURCE_PATH} での読み込み失敗: {e}")
         
         if not file_loaded:
             # 緊急用サンプルデータ（より充実させる）
-            self.story_elements = [
+            self.story_elements = CompiledCorpus(compile_corpus([
                 {
                     "item": "【相打ち】",
                     "stars": [
@@ -280,57 +269,78 @@ class StoryPromptBuilderWeb:
                         "★９．家族の死に際しての、日本人の不可解な笑い。"
                     ]
                 }
-            ]
-            # サンプルデータの★総数を計算
-            self.total_stars = sum(len(item["stars"]) for item in self.story_elements)
+            ]))
+            # サンプルデータの★総数
+            self.total_stars = self.story_elements.total_stars
     
-    def extract_elements(self, count):
-        """物語要素を抽出"""
+    def extract_star_ids(self, count, seed=None, genre_key=None, genre_bias=0.0, diversity=0.0):
+        """物語要素を★番号で抽出（seed は story_corpus.make_rng と同じ）
+        
+        genre_key を指定すると、そのジャンルの★を genre_bias（0～1）の度合いで優先する。
+        diversity（0～1）を指定すると、内容の似た★を避けて抽出する（MMR）。
+        ほぼ重複する★（同じクラスタの★）は1個までにする。
+        """
         if not self.story_elements:
             return []
-            
-        selected_elements = []
-        used_stars = set()
-        
-        # 利用可能な要素が少ない場合の対応
-        max_attempts = min(count, self.total_stars)  # 実際の★の総数を使用
-        attempts = 0
-        
-        while len(selected_elements) < count and attempts < max_attempts:
-            attempts += 1
-            
-            # ランダムにitemを選択
-            item_data = random.choice(self.story_elements)
-            item_name = item_data["item"]
-            
-            # 使用済みでないstarを選択
-            available_stars = [star for star in item_data["stars"] if star not in used_stars]
-            
-            if available_stars:
-                selected_star = random.choice(available_stars)
-                used_stars.add(selected_star)
-                selected_elements.append((item_name, selected_star))
         
-        return selected_elements
+        corpus = self.story_elements
+        if diversity > 0:
+            preferred = corpus.genre_star_ids(genre_key) if genre_key is not None else ()
+            return sample_diverse_stars(corpus.star_vectors, count, diversity, seed=seed, preferred=preferred,
+                                        bias=genre_bias, clusters=corpus.star_clusters)
+        if genre_key is not None and genre_bias > 0:
+            return sample_genre_stars(corpus.n_stars, corpus.genre_star_ids(genre_key), count, genre_bias,
+                                      seed=seed, clusters=corpus.star_clusters)
+        
+        # 全★から重複なしで抽出
+        return sample_stars(corpus.n_stars, count, seed=seed, clusters=corpus.star_clusters)
+    
+    def extract_elements_batch(self, n_sets, count, seed=None):
+        """物語要素を n_sets 組まとめて抽出（★番号の行列を返す。ほぼ重複する★は1組に1個まで）"""
+        return sample_star_batch(self.story_elements.n_stars, n_sets, count, seed,
+                                 clusters=self.story_elements.star_clusters)
+    
+    def elements_from_ids(self, star_ids):
+        """★番号の並びを (項目名, ★テキスト) のリストに変換"""
+        return elements_from_ids(self.story_elements, star_ids)
+    
+    def new_star_set(self, star_ids=()):
+        """選択済みの★番号の集合（StarBitset）を作る"""
+        return StarBitset(self.story_elements.n_stars, star_ids)
+    
+    def search_elements(self, query, limit=10):
+        """物語要素を検索（[(★番号, (項目名, ★テキスト)), ...] を関連の高い順に返す）"""
+        if not self.story_elements:
+            return []
+        return [(j, self.story_elements.element(j)) for j in search_stars(self.story_elements, query, limit)]
     
     def generate_prompt(self, selected_elements, word_count, story_style, ending_style, lang):
         """プロンプトを生成"""
-        t = TEXTS[lang]
-        
-        prompt = t["prompt_header"]
-        prompt += t["prompt_basic_settings"]
-        prompt += t["prompt_word_count"].format(count=word_count)
-        prompt += t["prompt_genre"].format(genre=story_style)
-        prompt += t["prompt_ending"].format(ending=ending_style)
-        
-        prompt += t["prompt_elements_header"]
-        for i, (item, star) in enumerate(selected_elements, 1):
-            prompt += f"{i}. {item} {star}\n"
-        
-        prompt += t["prompt_instructions_header"]
-        prompt += t["prompt_instructions"].format(genre=story_style, ending=ending_style)
-        
-        return prompt
+        return build_web_prompt(selected_elements, word_count, story_style, ending_style, lang)
+    
+    def recipe_code(self, star_ids, word_count, genre_key, ending_key, lang):
+        """★番号と設定からレシピコードを作る"""
+        return encode_recipe(self.story_elements, "web", star_ids, word_count,
+                             lang=lang, genre=genre_key, ending=ending_key)
+    
+    def restore_recipe(self, code, lang="ja"):
+        """レシピコードから (レシピ, プロンプト) を復元（コードが正しくない場合は ValueError）"""
+        recipe = decode_recipe(code)
+        if recipe["template"] != "web":
+            raise ValueError(get_text("recipe_wrong_template", lang))
+        if not MIN_WORD_COUNT <= recipe["word_count"] <= MAX_WORD_COUNT:
+            raise ValueError(get_text("recipe_word_count_out_of_range", lang, count=recipe["word_count"],
+                                      min=MIN_WORD_COUNT, max=MAX_WORD_COUNT))
+        return recipe, build_recipe_prompt(self.story_elements, recipe)
+
+@st.cache_resource(show_spinner=False)
+def get_story_prompt_builder():
+    """物語要素データはサーバープロセスごとに1回だけ読み込み、全セッションで共有する
+
+    返すインスタンスは読み取り専用として扱い、ユーザーごとの選択状態は
+    st.session_state に保持する。
+    """
+    return StoryPromptBuilderWeb()
 
 def get_text(key, lang="ja", **kwargs):
     """言語に応じたテキストを取得"""
@@ -342,15 +352,39 @@ def get_text(key, lang="ja", **kwargs):
             return text
     return text
 
+def restore_recipe(app):
+    """レシピコードから選択中の★と設定を復元（ボタンの on_click で、各ウィジェットより前に実行する）"""
+    code = st.session_state.get("recipe_input", "").strip()
+    if not code:
+        return
+    try:
+        recipe, prompt = app.restore_recipe(code, st.session_state.language)
+    except ValueError as e:
+        st.session_state.recipe_error = f"❌ {e}"
+        return
+    
+    lang = recipe["lang"]
+    if lang != st.session_state.language:
+        # 言語の選択ボックスは st.session_state.language から作り直す
+        st.session_state.language = lang
+        del st.session_state.lang_selector
+    st.session_state.word_count_input = recipe["word_count"]
+    st.session_state.genre_selector = get_text(recipe["genre"], lang)
+    st.session_state.ending_selector = get_text(recipe["ending"], lang)
+    st.session_state.selected_star_ids = list(recipe["star_ids"])
+    st.session_state.selected_stars = app.new_star_set(recipe["star_ids"])
+    st.session_state.generated_prompt = prompt
+    st.session_state.recipe_code = code.upper()
+    st.session_state.recipe_restored = True
+
 def main():
     try:
         # 言語設定の初期化
         if 'language' not in st.session_state:
             st.session_state.language = 'ja'
         
-        # アプリケーションインスタンス
-        if 'app' not in st.session_state:
-            st.session_state.app = StoryPromptBuilderWeb()
+        # アプリケーションインスタンス（物語要素データは全セッションで共有）
+        app = get_story_prompt_builder()
         
         lang = st.session_state.language
         
@@ -358,31 +392,26 @@ def main():
         st.title(get_text("title", lang))
         
         # ★の数に応じて表示を変更
-        if st.session_state.app.total_stars >= 7000:
-            st.markdown(f"{st.session_state.app.total_stars}" + get_text("description", lang))
+        if app.total_stars >= 7000:
+            st.markdown(f"{app.total_stars}" + get_text("description", lang))
         else:
-            st.markdown(f"{st.session_state.app.total_stars}" + get_text("description", lang))
+            st.markdown(f"{app.total_stars}" + get_text("description", lang))
         
         # JSONファイル読み込み状況を表示
-        if st.session_state.app.story_elements:
+        if app.story_elements:
             # ★の数に応じて表示を変更
-            if st.session_state.app.total_stars >= 7000:
-                display_text = f"{st.session_state.app.total_stars}"
+            if app.total_stars >= 7000:
+                display_text = f"{app.total_stars}"
             else:
-                display_text = f"{st.session_state.app.total_stars}"
+                display_text = f"{app.total_stars}"
             st.success(get_text("data_loaded", lang, count=display_text))
         else:
             st.error(get_text("file_not_found", lang))
             st.info(get_text("file_location_info", lang))
-            st.code("\n".join([
-                'story_elements.json',
-                'web/story_elements.json',
-                os.path.join(os.path.dirname(__file__), 'story_elements.json'),
-                str(Path(__file__).parent / 'story_elements.json')
-            ]))
+            st.code(SOURCE_PATH)
             st.warning(get_text("sample_data_warning", lang, 
-                              items=len(st.session_state.app.story_elements), 
-                              stars=st.session_state.app.total_stars))
+                              items=len(app.story_elements), 
+                              stars=app.total_stars))
         
         # サイドバーで基本設定
         with st.sidebar:
@@ -403,33 +432,50 @@ def main():
                 st.session_state.language = language_options[selected_lang]
                 st.rerun()
             
+            # レシピコードから復元
+            with st.expander(get_text("restore_recipe", lang)):
+                st.text_input(get_text("restore_recipe", lang), key="recipe_input",
+                              placeholder=get_text("recipe_placeholder", lang),
+                              label_visibility="collapsed")
+                st.button(get_text("restore_button", lang), use_container_width=True,
+                          on_click=restore_recipe, args=(app,))
+                if "recipe_error" in st.session_state:
+                    st.error(st.session_state.pop("recipe_error"))
+                if st.session_state.pop("recipe_restored", False):
+                    st.success(get_text("recipe_restored", lang))
+            
             st.markdown("---")
             
             st.header(get_text("basic_settings", lang))
             
             # 物語要素数
             elements_count = st.slider(get_text("element_count", lang), 1, 5, 2)
+            diversity = st.slider(get_text("diversity", lang), 0, 100, 0, step=10, format="%d%%",
+                                  help=get_text("diversity_help", lang)) / 100
             
             # 文字数
-            word_count = st.number_input(get_text("word_count", lang), value=800, min_value=100, max_value=5000, step=100)
+            # 既定値は session_state に置く（レシピコードからの復元で書き換えるため）
+            st.session_state.setdefault("word_count_input", 800)
+            word_count = st.number_input(get_text("word_count", lang), min_value=MIN_WORD_COUNT,
+                                         max_value=MAX_WORD_COUNT, step=100, key="word_count_input")
             
             st.markdown("---")
             
             # スタイル選択
             st.header(get_text("genre_style", lang))
-            story_styles_keys = ["genre_folk", "genre_sf", "genre_mystery", "genre_fantasy", 
-                               "genre_horror", "genre_comedy", "genre_romance", "genre_adventure"]
-            story_styles = [get_text(key, lang) for key in story_styles_keys]
-            story_style = st.selectbox(get_text("genre_select", lang), story_styles)
+            story_styles = [get_text(key, lang) for key in GENRE_KEYS]
+            story_style = st.selectbox(get_text("genre_select", lang), story_styles, key="genre_selector")
+            genre_key = GENRE_KEYS[story_styles.index(story_style)]
+            genre_bias = st.slider(get_text("genre_bias", lang), 0, 100, 70, step=10, format="%d%%",
+                                   help=get_text("genre_bias_help", lang)) / 100
             
             st.markdown("---")
             
             # 終わり方選択
             st.header(get_text("ending_style", lang))
-            ending_styles_keys = ["ending_natural_unexpected", "ending_surprising", "ending_natural", 
-                                "ending_happy", "ending_bitter", "ending_open"]
-            ending_styles = [get_text(key, lang) for key in ending_styles_keys]
-            ending_style = st.selectbox(get_text("ending_select", lang), ending_styles)
+            ending_styles = [get_text(key, lang) for key in ENDING_KEYS]
+            ending_style = st.selectbox(get_text("ending_select", lang), ending_styles, key="ending_selector")
+            ending_key = ENDING_KEYS[ending_styles.index(ending_style)]
         
         # メインエリア
         col1, col2 = st.columns([1, 1])
@@ -440,19 +486,44 @@ def main():
             # 抽出ボタン
             if st.button(get_text("extract_elements", lang), type="primary", use_container_width=True):
                 with st.spinner(get_text("extracting", lang)):
-                    st.session_state.selected_elements = st.session_state.app.extract_elements(elements_count)
-                    if st.session_state.selected_elements:
-                        st.success(get_text("elements_extracted", lang, count=len(st.session_state.selected_elements)))
+                    # 選択状態は★番号で持ち、テキストは表示するときに取り出す
+                    st.session_state.selected_star_ids = app.extract_star_ids(
+                        elements_count, genre_key=genre_key, genre_bias=genre_bias, diversity=diversity
+                    )
+                    st.session_state.selected_stars = app.new_star_set(st.session_state.selected_star_ids)
+                    if st.session_state.selected_star_ids:
+                        st.success(get_text("elements_extracted", lang, count=len(st.session_state.selected_star_ids)))
                     else:
                         st.error(get_text("extraction_failed", lang))
             
+            # 検索して要素を追加
+            search_query = st.text_input(get_text("search_elements", lang),
+                                         placeholder=get_text("search_placeholder", lang))
+            if search_query.strip():
+                search_results = app.search_elements(search_query)
+                if not search_results:
+                    st.caption(get_text("search_no_results", lang))
+                for star_index, element in search_results:
+                    col_result, col_add = st.columns([5, 1])
+                    with col_result:
+                        st.markdown(f"{element[0]} {element[1]}")
+                    with col_add:
+                        if st.button("➕", key=f"add_{star_index}", help=get_text("add_tooltip", lang)):
+                            if 'selected_star_ids' not in st.session_state:
+                                st.session_state.selected_star_ids = []
+                                st.session_state.selected_stars = app.new_star_set()
+                            if star_index not in st.session_state.selected_stars:
+                                st.session_state.selected_star_ids.append(star_index)
+                                st.session_state.selected_stars.add(star_index)
+                            st.rerun()
+            
             # 選択された要素を表示
-            if 'selected_elements' in st.session_state and st.session_state.selected_elements:
+            if 'selected_star_ids' in st.session_state and st.session_state.selected_star_ids:
                 st.markdown(get_text("selected_elements", lang))
                 
                 # 要素の表示と削除機能
                 elements_to_remove = []
-                for i, (item, star) in enumerate(st.session_state.selected_elements):
+                for i, (item, star) in enumerate(app.elements_from_ids(st.session_state.selected_star_ids)):
                     with st.container():
                         col_element, col_delete = st.columns([5, 1])
                         
@@ -468,15 +539,15 @@ def main():
                 
                 # 削除処理（逆順で削除してインデックスの問題を回避）
                 for i in reversed(elements_to_remove):
-                    st.session_state.selected_elements.pop(i)
+                    st.session_state.selected_stars.discard(st.session_state.selected_star_ids.pop(i))
                     st.rerun()
         
         with col2:
             st.header(get_text("generated_prompt", lang))
             
             # プロンプト生成ボタン
-            generate_disabled = not ('selected_elements' in st.session_state and 
-                                   st.session_state.selected_elements)
+            generate_disabled = not ('selected_star_ids' in st.session_state and 
+                                   st.session_state.selected_star_ids)
             
             if st.button(get_text("generate_prompt", lang),
                         type="primary", 
@@ -487,19 +558,25 @@ def main():
                     st.error(get_text("extract_first", lang))
                 else:
                     with st.spinner(get_text("generating", lang)):
-                        st.session_state.generated_prompt = st.session_state.app.generate_prompt(
-                            st.session_state.selected_elements, 
+                        st.session_state.generated_prompt = app.generate_prompt(
+                            app.elements_from_ids(st.session_state.selected_star_ids), 
                             word_count,
                             story_style,
                             ending_style,
                             lang
                         )
+                        st.session_state.recipe_code = app.recipe_code(
+                            st.session_state.selected_star_ids, word_count, genre_key, ending_key, lang
+                        )
                     st.success(get_text("prompt_generated", lang))
             
             # 生成されたプロンプトを表示
             if 'generated_prompt' in st.session_state:
                 st.markdown(get_text("prompt_title", lang))
                 st.code(st.session_state.generated_prompt, language='markdown')
+                if st.session_state.get("recipe_code"):
+                    st.markdown(get_text("recipe_code", lang))
+                    st.code(st.session_state.recipe_code, language=None)
                 
                 # 設定情報の表示
                 st.markdown(get_text("settings_summary", lang))
@@ -512,12 +589,12 @@ def main():
                 # 統計情報
                 with st.expander(get_text("detailed_info", lang)):
                     st.write(f"{get_text('word_count_setting', lang)}: {word_count:,}" + ("文字" if lang == "ja" else " words"))
-                    st.write(f"{get_text('element_count_used', lang)}: {len(st.session_state.selected_elements)}" + ("個" if lang == "ja" else ""))
+                    st.write(f"{get_text('element_count_used', lang)}: {len(st.session_state.selected_star_ids)}" + ("個" if lang == "ja" else ""))
                     # データセットサイズの表示も★の数に変更
-                    if st.session_state.app.total_stars >= 7000:
-                        dataset_display = f"{st.session_state.app.total_stars}" + ("個の★要素" if lang == "ja" else " ★ elements")
+                    if app.total_stars >= 7000:
+                        dataset_display = f"{app.total_stars}" + ("個の★要素" if lang == "ja" else " ★ elements")
                     else:
-                        dataset_display = f"{st.session_state.app.total_stars}" + ("個の★要素" if lang == "ja" else " ★ elements")
+                        dataset_display = f"{app.total_stars}" + ("個の★要素" if lang == "ja" else " ★ elements")
                     st.write(f"{get_text('dataset_size', lang)}: {dataset_display}")
                 
                 # ダウンロードボタン